@@ -7,9 +7,11 @@ This package contains the decomposed StandaloneDeveloperAgent components:
 - models: Data models for developer workflows
 - tdd_phases: Red/Green/Refactor phase execution
 - rag_integration: RAG queries for examples and feedback
+- card_context_cache: Per-card RAG query cache shared across developers
 - llm_client_wrapper: LLM interaction and streaming
 - file_manager: File I/O operations
 - test_runner: Test execution integration
+- warm_test_session: Incremental test runs on a warm pytest worker
 - report_generator: Solution report generation
 - developer: Main orchestrator class (composition-based)
 """
@@ -29,8 +31,10 @@ from agents.developer.models import (
 # Export specialized components (optional - for advanced usage)
 from agents.developer.file_manager import FileManager
 from agents.developer.test_runner_wrapper import DeveloperTestRunner
+from agents.developer.warm_test_session import WarmTestSession
 from agents.developer.report_generator import ReportGenerator
 from agents.developer.rag_integration import RAGIntegration
+from agents.developer.card_context_cache import CardContextCache, RAGQuery, get_card_context_cache
 from agents.developer.llm_client_wrapper import LLMClientWrapper
 from agents.developer.tdd_phases import TDDPhases
 
@@ -48,8 +52,12 @@ __all__ = [
     # Components (for advanced usage)
     "FileManager",
     "DeveloperTestRunner",
+    "WarmTestSession",
     "ReportGenerator",
     "RAGIntegration",
+    "CardContextCache",
+    "RAGQuery",
+    "get_card_context_cache",
     "LLMClientWrapper",
     "TDDPhases",
 ]
@@ -0,0 +1,190 @@
+"""
+Module: agents/developer/card_context_cache.py
+
+WHY: Every developer working a card (and every retry of that card) ran the
+     same RAG lookups - review feedback, refactoring patterns, examples -
+     back to back, so identical ChromaDB queries repeated per developer.
+RESPONSIBILITY: Fetch a card's developer RAG context once, in parallel, and
+                share the results until new artifacts are stored for the card.
+PATTERNS: Cache-Aside, Single-Flight (concurrent misses share one query),
+          Singleton (process-wide cache shared by all developers).
+
+Invalidation: RAGAgent.card_generation(card_id) advances whenever an
+artifact for the card is stored; a changed generation drops the card's
+cached results. RAG agents without card_generation() are cached for the
+lifetime of the process.
+"""
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+@dataclass(frozen=True)
+class RAGQuery:
+    """One query_similar() call, hashable so results can be shared"""
+    query_text: str
+    artifact_types: Tuple[str, ...]
+    top_k: int
+
+    def run(self, rag_agent) -> List[Dict]:
+        return rag_agent.query_similar(
+            query_text=self.query_text,
+            artifact_types=list(self.artifact_types),
+            top_k=self.top_k
+        )
+
+
+@dataclass
+class _CardEntry:
+    generation: int
+    results: Dict[RAGQuery, Future] = field(default_factory=dict)
+
+
+class CardContextCache:
+    """
+    Per-card cache of developer RAG query results
+
+    Usage:
+        cache = get_card_context_cache()
+        cache.prefetch(rag_agent, card_id, [feedback_query, examples_query])
+        results = cache.query(rag_agent, card_id, feedback_query)  # hit
+    """
+
+    def __init__(self, max_cards: int = 64, max_workers: int = 4):
+        """
+        Args:
+            max_cards: Cards kept before the least recently used is evicted
+            max_workers: Parallel queries per prefetch
+        """
+        self.max_cards = max_cards
+        self.max_workers = max_workers
+        self._entries: "OrderedDict[Tuple[int, str], _CardEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'refreshes': 0}
+
+    def query(self, rag_agent, card_id: str, query: RAGQuery) -> List[Dict]:
+        """
+        Results for a query on a card, querying RAG only on a miss
+
+        Concurrent callers missing on the same query wait for one RAG call.
+        A failed query is not cached.
+
+        Raises:
+            Whatever rag_agent.query_similar raises
+        """
+        future, owner = self._claim(rag_agent, card_id, query)
+        if owner:
+            self._resolve(rag_agent, card_id, query, future)
+        return future.result()
+
+    def prefetch(self, rag_agent, card_id: str, queries: Sequence[RAGQuery]) -> int:
+        """
+        Run all uncached queries for a card in parallel
+
+        Failures are left uncached so the caller's own query reports them.
+
+        Returns:
+            Number of queries sent to RAG
+        """
+        claimed = []
+        for query in dict.fromkeys(queries):
+            future, owner = self._claim(rag_agent, card_id, query)
+            if owner:
+                claimed.append((query, future))
+        if not claimed:
+            return 0
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(claimed))) as pool:
+            for query, future in claimed:
+                pool.submit(self._resolve, rag_agent, card_id, query, future)
+        return len(claimed)
+
+    def invalidate(self, card_id: Optional[str] = None) -> None:
+        """Drop cached results for one card (or all cards)"""
+        with self._lock:
+            for key in [key for key in self._entries if card_id is None or key[1] == card_id]:
+                del self._entries[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and cached card count"""
+        with self._lock:
+            return {**self.stats, 'cards': len(self._entries)}
+
+    def _claim(self, rag_agent, card_id: str, query: RAGQuery) -> Tuple[Future, bool]:
+        """Return (future, True if the caller must run the query)"""
+        generation = _card_generation(rag_agent, card_id)
+        key = (id(rag_agent), card_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.generation != generation:
+                self.stats['refreshes'] += 1
+                entry = None
+            if entry is None:
+                entry = _CardEntry(generation)
+                self._entries[key] = entry
+                self._evict()
+            self._entries.move_to_end(key)
+
+            future = entry.results.get(query)
+            if future is not None:
+                self.stats['hits'] += 1
+                return future, False
+            self.stats['misses'] += 1
+            future = Future()
+            entry.results[query] = future
+            return future, True
+
+    def _resolve(self, rag_agent, card_id: str, query: RAGQuery, future: Future) -> None:
+        try:
+            future.set_result(query.run(rag_agent) or [])
+        except Exception as e:
+            self._forget(rag_agent, card_id, query, future)
+            future.set_exception(e)
+
+    def _forget(self, rag_agent, card_id: str, query: RAGQuery, future: Future) -> None:
+        with self._lock:
+            entry = self._entries.get((id(rag_agent), card_id))
+            if entry is not None and entry.results.get(query) is future:
+                del entry.results[query]
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_cards:
+            self._entries.popitem(last=False)
+
+
+def _card_generation(rag_agent, card_id: str) -> int:
+    """Card generation from the RAG agent (0 if it does not track one)"""
+    generation = getattr(rag_agent, 'card_generation', None)
+    if not callable(generation):
+        return 0
+    try:
+        return generation(card_id)
+    except Exception:
+        return 0
+
+
+_CACHE: Optional[CardContextCache] = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_card_context_cache() -> CardContextCache:
+    """
+    Process-wide card context cache
+
+    WHY: Developers are separate objects; sharing requires one cache.
+    """
+    global _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            _CACHE = CardContextCache()
+        return _CACHE
+
+
+__all__ = [
+    "RAGQuery",
+    "CardContextCache",
+    "get_card_context_cache"
+]
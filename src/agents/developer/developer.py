@@ -163,14 +163,19 @@ class Developer(DebugMixin):
         """
         Execute TDD workflow: RED → GREEN → REFACTOR
 
-        Delegates to TDDPhases orchestrator
+        Delegates to TDDPhases orchestrator. Red/green runs reuse a warm
+        test worker for output_dir, released once the workflow ends.
         """
-        red_results = self.tdd_phases.execute_red_phase(task_title,
-            task_description, adr_content, output_dir, context)
-        green_results = self.tdd_phases.execute_green_phase(task_title,
-            task_description, adr_content, output_dir, context, red_results)
-        refactor_results = self.tdd_phases.execute_refactor_phase(task_title,
-            output_dir, context, green_results)
+        try:
+            red_results = self.tdd_phases.execute_red_phase(task_title,
+                task_description, adr_content, output_dir, context)
+            green_results = self.tdd_phases.execute_green_phase(task_title,
+                task_description, adr_content, output_dir, context,
+                red_results)
+            refactor_results = self.tdd_phases.execute_refactor_phase(
+                task_title, output_dir, context, green_results)
+        finally:
+            self.test_runner.close(output_dir)
         return {'red': {'test_files': red_results.files, 'test_results':
             red_results.test_results}, 'green': {'implementation_files':
             green_results.files, 'test_results': green_results.test_results
@@ -187,8 +192,10 @@ class Developer(DebugMixin):
         self._log_info(
             '🎯 QUALITY-DRIVEN workflow: Generating comprehensive implementation...'
             )
-        rag_examples = self.rag_integration.query_rag_for_examples(self.rag,
-            task_title, task_description) if hasattr(self, 'rag') else ''
+        rag_agent = context.get('rag_agent')
+        rag_examples = self.rag_integration.query_rag_for_examples(rag_agent,
+            task_title, task_description, card_id=context.get('card_id')
+            ) if rag_agent else ''
         prompt = self._build_quality_prompt(task_title, task_description,
             adr_content, context, rag_examples)
         response = self.llm_wrapper.call_llm(prompt)
@@ -226,6 +233,9 @@ class Developer(DebugMixin):
         self._log_info(f'🚀 {self.developer_name} starting workflow...')
         output_dir.mkdir(parents=True, exist_ok=True)
         kg_context = self._query_kg_context(task_title, task_description)
+        language = self._detect_language_from_task(task_description)
+        self.rag_integration.prefetch_card_context(rag_agent, card_id,
+            task_title, task_description, language)
         code_review_feedback = None
         if rag_agent and card_id:
             code_review_feedback = (self.rag_integration.
@@ -239,14 +249,14 @@ class Developer(DebugMixin):
             example_slides = self.file_manager.load_example_slides(adr_content)
         refactoring_instructions = None
         if rag_agent:
-            language = self._detect_language_from_task(task_description)
             refactoring_instructions = (self.rag_integration.
-                query_refactoring_instructions(rag_agent, task_title, language)
-                )
+                query_refactoring_instructions(rag_agent, task_title,
+                language, card_id=card_id))
         return {'kg_context': kg_context, 'code_review_feedback':
             code_review_feedback, 'developer_prompt': developer_prompt,
             'example_slides': example_slides, 'refactoring_instructions':
-            refactoring_instructions}
+            refactoring_instructions, 'rag_agent': rag_agent, 'card_id':
+            card_id}
 
     def _select_workflow_strategy(self, task_title, task_description,
         parsed_requirements):
@@ -11,6 +11,8 @@ This module handles:
 - Querying RAG for notebook/code examples
 - Retrieving developer prompts from RAG (DEPTH framework)
 - Formatting RAG results for LLM prompts
+- Prefetching a card's queries in parallel into the shared CardContextCache,
+  so developers and retries on the same card reuse one set of results
 
 EXTRACTED FROM: standalone_developer_agent.py (lines 1050-1586)
 """
@@ -18,6 +20,7 @@ EXTRACTED FROM: standalone_developer_agent.py (lines 1050-1586)
 from typing import Optional, List, Dict
 from artemis_stage_interface import LoggerInterface
 from artemis_exceptions import RAGQueryError, create_wrapped_exception
+from agents.developer.card_context_cache import CardContextCache, RAGQuery, get_card_context_cache
 
 
 class RAGIntegration:
@@ -33,7 +36,8 @@ class RAGIntegration:
         developer_name: str,
         developer_type: str,
         logger: Optional[LoggerInterface] = None,
-        prompt_manager=None
+        prompt_manager=None,
+        context_cache: Optional[CardContextCache] = None
     ):
         """
         Initialize RAG integration
@@ -43,11 +47,50 @@ class RAGIntegration:
             developer_type: Type of developer (e.g., "conservative")
             logger: Optional logger
             prompt_manager: Optional PromptManager for DEPTH prompts
+            context_cache: Per-card query cache (default: shared process-wide)
         """
         self.developer_name = developer_name
         self.developer_type = developer_type
         self.logger = logger
         self.prompt_manager = prompt_manager
+        self.context_cache = context_cache or get_card_context_cache()
+
+    def prefetch_card_context(
+        self,
+        rag_agent,
+        card_id: str,
+        task_title: str,
+        task_description: str,
+        language: str = "python"
+    ) -> None:
+        """
+        Fetch all of a card's developer RAG queries in parallel
+
+        WHY: Later query_* calls for this card (from any developer or retry)
+             are then answered from the cache.
+
+        Args:
+            rag_agent: RAG Agent instance
+            card_id: Card ID
+            task_title: Task title
+            task_description: Task description
+            language: Programming language for refactoring patterns
+        """
+        # Guard: nothing to share without a RAG agent and card
+        if not rag_agent or not card_id:
+            return
+
+        queries = [
+            self._code_review_query(card_id),
+            self._refactoring_query(language),
+            self._examples_query(self._detect_task_type(task_title, task_description), task_title)
+        ]
+        sent = self.context_cache.prefetch(rag_agent, card_id, queries)
+        stats = self.context_cache.get_stats()
+        self._log_info(
+            f"📦 Card context for {card_id}: {sent} RAG queries prefetched "
+            f"(cache hits: {stats['hits']}, misses: {stats['misses']})"
+        )
 
     def query_code_review_feedback(self, rag_agent, card_id: str) -> Optional[str]:
         """
@@ -69,12 +112,7 @@ class RAGIntegration:
             self._log_info(f"🔍 Querying RAG for code review feedback (card: {card_id})...")
 
             # Query RAG for code review artifacts
-            query_text = f"code review feedback for {card_id}"
-            results = rag_agent.query_similar(
-                query_text=query_text,
-                artifact_type="code_review",
-                top_k=3  # Get up to 3 most recent feedback items
-            )
+            results = self._run_query(rag_agent, card_id, self._code_review_query(card_id))
 
             # Guard: no results
             if not results or len(results) == 0:
@@ -94,7 +132,8 @@ class RAGIntegration:
         self,
         rag_agent,
         task_title: str = "",
-        language: str = "python"
+        language: str = "python",
+        card_id: Optional[str] = None
     ) -> Optional[str]:
         """
         Query RAG for refactoring instructions and best practices
@@ -106,6 +145,7 @@ class RAGIntegration:
             rag_agent: RAG Agent instance
             task_title: Task title for context (optional)
             language: Programming language (python, java, javascript, etc.)
+            card_id: Card ID to share results through the card cache (optional)
 
         Returns:
             Formatted refactoring instructions or None
@@ -118,12 +158,7 @@ class RAGIntegration:
             self._log_info(f"🔍 Querying RAG for refactoring instructions ({language})...")
 
             # Query RAG for refactoring artifacts
-            query_text = f"refactoring best practices {language} code quality patterns"
-            results = rag_agent.query_similar(
-                query_text=query_text,
-                artifact_type="architecture_decision",
-                top_k=5  # Get top 5 most relevant refactoring patterns
-            )
+            results = self._run_query(rag_agent, card_id, self._refactoring_query(language))
 
             # Guard: no results
             if not results or len(results) == 0:
@@ -147,7 +182,8 @@ class RAGIntegration:
         self,
         rag_agent,
         task_title: str,
-        task_description: str
+        task_description: str,
+        card_id: Optional[str] = None
     ) -> str:
         """
         Query RAG for relevant examples based on task characteristics.
@@ -158,6 +194,7 @@ class RAGIntegration:
             rag_agent: RAG Agent instance
             task_title: Title of the task
             task_description: Task description
+            card_id: Card ID to share results through the card cache (optional)
 
         Returns:
             Formatted examples string to include in prompt
@@ -174,7 +211,7 @@ class RAGIntegration:
             task_type = self._detect_task_type(task_title, task_description)
             self._log_debug(f"Detected task_type: {task_type}")
 
-            result = self._query_by_task_type(rag_agent, task_type, task_title)
+            result = self._query_by_task_type(rag_agent, task_type, task_title, card_id)
             self._log_debug(f"RAG query returned {len(result)} characters")
 
             return result
@@ -267,26 +304,21 @@ class RAGIntegration:
 
         return "notebook" if is_notebook else "code"
 
-    def _query_by_task_type(self, rag_agent, task_type: str, task_title: str) -> str:
+    def _query_by_task_type(self, rag_agent, task_type: str, task_title: str, card_id: Optional[str] = None) -> str:
         """Query RAG based on task type - Strategy Pattern."""
         query_strategies = {
-            "notebook": lambda: self._query_notebook_examples(rag_agent, task_title),
-            "code": lambda: self._query_code_examples(rag_agent, task_title)
+            "notebook": lambda: self._query_notebook_examples(rag_agent, task_title, card_id),
+            "code": lambda: self._query_code_examples(rag_agent, task_title, card_id)
         }
 
-        strategy = query_strategies.get(task_type, lambda: self._query_code_examples(rag_agent, task_title))
+        strategy = query_strategies.get(task_type, lambda: self._query_code_examples(rag_agent, task_title, card_id))
         return strategy()
 
-    def _query_notebook_examples(self, rag_agent, task_title: str) -> str:
+    def _query_notebook_examples(self, rag_agent, task_title: str, card_id: Optional[str] = None) -> str:
         """Query RAG for notebook examples - Template Method Pattern."""
         self._log_info("🔍 Querying RAG for notebook examples...")
 
-        results = self._execute_rag_query(
-            rag_agent,
-            query_text=f"high-quality jupyter notebook example {task_title}",
-            artifact_types=["notebook_example"],
-            top_k=2
-        )
+        results = self._execute_rag_query(rag_agent, self._examples_query("notebook", task_title), card_id)
 
         # Guard: no results
         if not results:
@@ -296,14 +328,9 @@ class RAGIntegration:
         self._log_info(f"✅ Found {len(results)} notebook examples from RAG")
         return self._format_notebook_examples(results)
 
-    def _query_code_examples(self, rag_agent, task_title: str) -> str:
+    def _query_code_examples(self, rag_agent, task_title: str, card_id: Optional[str] = None) -> str:
         """Query RAG for code examples - Template Method Pattern."""
-        results = self._execute_rag_query(
-            rag_agent,
-            query_text=task_title,
-            artifact_types=["code_example", "developer_solution"],
-            top_k=3
-        )
+        results = self._execute_rag_query(rag_agent, self._examples_query("code", task_title), card_id)
 
         # Guard: no results
         if not results:
@@ -311,28 +338,38 @@ class RAGIntegration:
 
         return self._format_code_examples(results)
 
-    def _execute_rag_query(
-        self,
-        rag_agent,
-        query_text: str,
-        artifact_types: list,
-        top_k: int
-    ) -> list:
+    def _execute_rag_query(self, rag_agent, query: RAGQuery, card_id: Optional[str] = None) -> list:
         """Execute RAG query with error handling."""
         try:
-            return rag_agent.query_similar(
-                query_text=query_text,
-                artifact_types=artifact_types,
-                top_k=top_k
-            )
+            return self._run_query(rag_agent, card_id, query)
         except Exception as e:
             raise create_wrapped_exception(
                 e,
                 RAGQueryError,
                 "RAG query execution failed",
-                {"query": query_text[:50], "artifact_types": artifact_types}
+                {"query": query.query_text[:50], "artifact_types": list(query.artifact_types)}
             ) from e
 
+    def _run_query(self, rag_agent, card_id: Optional[str], query: RAGQuery) -> List[Dict]:
+        """Run query through the card cache when a card is known."""
+        if not card_id:
+            return query.run(rag_agent)
+        return self.context_cache.query(rag_agent, card_id, query)
+
+    def _code_review_query(self, card_id: str) -> RAGQuery:
+        """Up to 3 most recent code review feedback items for the card."""
+        return RAGQuery(f"code review feedback for {card_id}", ("code_review",), 3)
+
+    def _refactoring_query(self, language: str) -> RAGQuery:
+        """Top 5 most relevant refactoring patterns for the language."""
+        return RAGQuery(f"refactoring best practices {language} code quality patterns", ("architecture_decision",), 5)
+
+    def _examples_query(self, task_type: str, task_title: str) -> RAGQuery:
+        """Example query for the task type - notebook or code."""
+        if task_type == "notebook":
+            return RAGQuery(f"high-quality jupyter notebook example {task_title}", ("notebook_example",), 2)
+        return RAGQuery(task_title, ("code_example", "developer_solution"), 3)
+
     def _format_code_review_feedback(self, results: List[Dict]) -> str:
         """Format code review feedback from RAG results"""
         feedback_lines = ["# PREVIOUS CODE REVIEW FEEDBACK\n"]
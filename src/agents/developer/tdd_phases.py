@@ -89,7 +89,7 @@ class TDDPhases:
         self.file_manager.write_test_files(test_files, output_dir)
 
         # Run tests - they should FAIL (red phase)
-        test_results = self.test_runner.run_tests(output_dir)
+        test_results = self.test_runner.run_tests_incremental(output_dir)
 
         self._log_red_phase_results(test_results)
 
@@ -173,6 +173,7 @@ class TDDPhases:
         self.file_manager.write_implementation_only(refactored_files, output_dir)
 
         # Run tests again - they should STILL PASS
+        # Final verification always uses a full cold run
         test_results = self.test_runner.run_tests(output_dir)
 
         self._log_refactor_phase_results(test_results)
@@ -212,7 +213,7 @@ class TDDPhases:
         self.file_manager.write_implementation_only(implementation_files, output_dir)
 
         # Run tests - they should PASS now
-        test_results = self.test_runner.run_tests(output_dir)
+        test_results = self.test_runner.run_tests_incremental(output_dir)
 
         self._log_green_phase_results(test_results)
 
@@ -260,7 +261,7 @@ class TDDPhases:
         self.file_manager.write_implementation_only(retry_result.final_files, output_dir)
 
         # Run final tests
-        test_results = self.test_runner.run_tests(output_dir)
+        test_results = self.test_runner.run_tests_incremental(output_dir)
 
         self._log_green_phase_results(test_results)
         self._log_retry_statistics(retry_result)
@@ -394,7 +395,7 @@ class TDDPhases:
     def _validate_implementation(self, impl_files: List[Dict], output_dir: Path) -> bool:
         """Validate implementation by running tests"""
         self.file_manager.write_implementation_only(impl_files, output_dir)
-        test_results = self.test_runner.run_tests(output_dir)
+        test_results = self.test_runner.run_tests_incremental(output_dir)
         return test_results.get('failed', 0) == 0
 
     def _log_red_phase_results(self, test_results: Dict):
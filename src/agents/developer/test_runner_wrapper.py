@@ -10,6 +10,7 @@ This module handles:
 - Auto-detecting test frameworks (pytest, unittest, gtest, junit)
 - Returning structured test results
 - Error handling and fallback
+- Incremental warm runs (affected tests only) during the TDD loop
 
 EXTRACTED FROM: standalone_developer_agent.py (lines 2622-2685)
 """
@@ -17,6 +18,10 @@ EXTRACTED FROM: standalone_developer_agent.py (lines 2622-2685)
 from pathlib import Path
 from typing import Dict, Optional
 from artemis_stage_interface import LoggerInterface
+from agents.developer.warm_test_session import WarmTestSession
+
+# Frameworks whose tests the warm pytest worker can run
+WARM_FRAMEWORKS = {"pytest", "unittest"}
 
 
 class DeveloperTestRunner:
@@ -35,6 +40,7 @@ class DeveloperTestRunner:
             logger: Optional logger for test execution logging
         """
         self.logger = logger
+        self._sessions: Dict[Path, WarmTestSession] = {}
 
     def run_tests(self, output_dir: Path, framework: str = None) -> Dict:
         """
@@ -103,6 +109,80 @@ class DeveloperTestRunner:
                 "framework": "unknown"
             }
 
+    def run_tests_incremental(self, output_dir: Path, framework: str = None) -> Dict:
+        """
+        Run only tests affected by changes since the previous run.
+
+        WHY: Red/green/retry iterations touch a few files; a warm pytest
+             worker per output directory reruns previously failing tests
+             first, skips unchanged passing tests and carries over their
+             results. Falls back to a cold run_tests() for frameworks the
+             worker cannot run or when the worker fails.
+
+        Args:
+            output_dir: Directory containing tests
+            framework: Test framework (auto-detected if None)
+
+        Returns:
+            Dict with test results (mode 'warm' or 'cold')
+        """
+        test_path = output_dir / "tests"
+
+        # Guard: no tests directory
+        if not test_path.exists():
+            return self.run_tests(output_dir, framework)
+
+        if self._detect_framework(test_path, framework) not in WARM_FRAMEWORKS:
+            return self._cold_run(output_dir, framework)
+
+        session = self._sessions.get(output_dir)
+        if session is None:
+            session = self._sessions[output_dir] = WarmTestSession(output_dir)
+
+        try:
+            result = session.run()
+        except Exception as e:
+            if self.logger:
+                self.logger.log(f"⚠️  Warm test worker failed ({e}), running full suite", "WARNING")
+            self.close(output_dir)
+            return self._cold_run(output_dir, framework)
+
+        if self.logger:
+            self.logger.log(
+                f"🧪 Ran {len(result['files_run'])} affected test files "
+                f"({len(result['files_skipped'])} unchanged skipped): "
+                f"{result['passed']} passed, {result['failed']} failed",
+                "INFO"
+            )
+        return result
+
+    def close(self, output_dir: Optional[Path] = None) -> None:
+        """
+        Stop warm test workers
+
+        Args:
+            output_dir: Only stop this directory's worker (all if None)
+        """
+        targets = [output_dir] if output_dir is not None else list(self._sessions)
+        for target in targets:
+            session = self._sessions.pop(target, None)
+            if session:
+                session.close()
+
+    def _cold_run(self, output_dir: Path, framework: Optional[str]) -> Dict:
+        return {**self.run_tests(output_dir, framework), "mode": "cold"}
+
+    def _detect_framework(self, test_path: Path, framework: Optional[str]) -> Optional[str]:
+        # Guard: framework given explicitly
+        if framework:
+            return framework
+
+        try:
+            from stages.testing import FrameworkDetector
+            return FrameworkDetector().detect_framework(test_path)
+        except Exception:
+            return None
+
     def _empty_result(self) -> Dict:
         """
         Return empty test result (when no tests exist)
@@ -0,0 +1,308 @@
+"""
+Module: agents/developer/warm_test_session.py
+
+WHY: The TDD loop reran the full test suite in a fresh pytest process after
+     every red/green/retry step, although most steps touch a few files and
+     only previously failing tests can change their verdict.
+RESPONSIBILITY: Keep one warm pytest worker per output directory, run only
+                tests affected by changed files (previously failing tests
+                first) and carry over the results of unaffected tests.
+PATTERNS: Proxy (session fronts the worker process), Guard Clauses.
+
+A test file is selected when:
+- it is new, or failed/errored on its previous run
+- it changed, or a project module it imports (transitively) changed
+- any conftest.py or pytest configuration file changed (selects all)
+
+Changes to non-Python data files are not tracked; the developer's final
+verification therefore always uses a full cold run.
+"""
+
+import ast
+import hashlib
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+WORKER_SCRIPT = Path(__file__).with_name("warm_test_worker.py")
+WORKER_START_TIMEOUT = 30
+EXCLUDED_DIRS = {"__pycache__", "venv", ".venv", "node_modules", "build", "dist"}
+CONFIG_FILES = {"conftest.py", "pytest.ini", "pyproject.toml", "setup.cfg", "tox.ini"}
+FAILING_OUTCOMES = {"failed", "error"}
+# pytest exit code when collection errors interrupt the session
+EXIT_INTERRUPTED = 2
+
+
+def _worker_failure(message: str, output_dir: Path, timed_out: bool = False, original: Optional[Exception] = None) -> Exception:
+    """TestTimeoutError/TestExecutionError for a failed worker"""
+    # Imported lazily: the stages package imports the developer agent
+    from stages.testing.exceptions import TestExecutionError, TestTimeoutError
+
+    error_class = TestTimeoutError if timed_out else TestExecutionError
+    return error_class(message, {"output_dir": str(output_dir)}, original)
+
+
+def _is_test_file(rel_path: str) -> bool:
+    name = rel_path.rsplit("/", 1)[-1]
+    return rel_path.startswith("tests/") and name.endswith(".py") and (name.startswith("test_") or name.endswith("_test.py"))
+
+
+class WarmTestSession:
+    """
+    Incremental pytest runs against one output directory
+
+    Usage:
+        session = WarmTestSession(output_dir)
+        results = session.run()   # first run: all tests
+        results = session.run()   # later runs: affected tests only
+        session.close()
+
+    Raises TestExecutionError/TestTimeoutError when the worker fails; the
+    session is closed and the caller should fall back to a cold run.
+    """
+
+    def __init__(self, output_dir: Path, timeout: int = 120, python: str = sys.executable):
+        """
+        Args:
+            output_dir: Developer output directory (tests live in output_dir/tests)
+            timeout: Seconds allowed for one run
+            python: Interpreter for the worker process
+        """
+        self.root = Path(output_dir).resolve()
+        self.timeout = timeout
+        self.python = python
+        self._process: Optional[subprocess.Popen] = None
+        self._responses: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._hashes: Dict[str, str] = {}
+        self._imports: Dict[str, tuple] = {}
+        self._file_outcomes: Dict[str, Dict[str, str]] = {}
+
+    # ========== Public API ==========
+
+    def run(self) -> Dict:
+        """
+        Run affected tests and merge them with carried-over results
+
+        Returns:
+            DeveloperTestRunner-style result dict, plus mode='warm',
+            files_run and files_skipped (unchanged, results carried over)
+        """
+        started = time.time()
+        snapshot = self._snapshot()
+        test_files = sorted(path for path in snapshot if _is_test_file(path))
+        for removed in set(self._file_outcomes) - set(test_files):
+            del self._file_outcomes[removed]
+
+        selected = self._select(test_files, snapshot)
+        output = ""
+        if selected:
+            response = self._request({"args": [*selected, f"--rootdir={self.root}", "--tb=short"]})
+            self._record(selected, response)
+            output = response.get("output", "")
+        self._hashes = snapshot
+
+        skipped_files = [path for path in test_files if path not in selected]
+        return self._result(selected, skipped_files, output, time.time() - started)
+
+    def close(self) -> None:
+        """Stop the worker (the session restarts it on the next run)"""
+        process, self._process = self._process, None
+        if process is None or process.poll() is not None:
+            return
+        try:
+            process.stdin.write(json.dumps({"command": "exit"}) + "\n")
+            process.stdin.flush()
+            process.wait(timeout=5)
+        except (OSError, ValueError, subprocess.TimeoutExpired):
+            process.kill()
+
+    # ========== Selection ==========
+
+    def _select(self, test_files: List[str], snapshot: Dict[str, str]) -> List[str]:
+        """Affected test files, previously failing files first"""
+        changed = {path for path in set(snapshot) | set(self._hashes) if snapshot.get(path) != self._hashes.get(path)}
+        if any(path.rsplit("/", 1)[-1] in CONFIG_FILES for path in changed):
+            affected = list(test_files)
+        else:
+            affected = [
+                path for path in test_files
+                if path not in self._file_outcomes or self._is_failing(path) or self._dependencies(path, snapshot) & changed
+            ]
+        return sorted(affected, key=lambda path: (not self._is_failing(path), path))
+
+    def _is_failing(self, test_file: str) -> bool:
+        return any(outcome in FAILING_OUTCOMES for outcome in self._file_outcomes.get(test_file, {}).values())
+
+    def _dependencies(self, test_file: str, snapshot: Dict[str, str]) -> Set[str]:
+        """The test file plus every project module it imports, transitively"""
+        seen = {test_file}
+        pending = [test_file]
+        while pending:
+            for module in self._local_imports(pending.pop(), snapshot):
+                if module not in seen:
+                    seen.add(module)
+                    pending.append(module)
+        return seen
+
+    def _local_imports(self, rel_path: str, snapshot: Dict[str, str]) -> Set[str]:
+        """Project files imported by one file (parsed once per content hash)"""
+        digest = snapshot.get(rel_path)
+        cached = self._imports.get(rel_path)
+        if cached and cached[0] == digest:
+            return cached[1]
+        try:
+            tree = ast.parse((self.root / rel_path).read_text(encoding="utf-8"))
+        except (OSError, SyntaxError, ValueError):
+            tree = ast.Module(body=[], type_ignores=[])
+        imports = {
+            path for module in self._imported_modules(tree, rel_path)
+            for path in self._resolve(module, rel_path, snapshot)
+        }
+        self._imports[rel_path] = (digest, imports)
+        return imports
+
+    def _imported_modules(self, tree: ast.AST, rel_path: str) -> Iterable[str]:
+        package = rel_path.split("/")[:-1]
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                yield from (alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom):
+                base = node.module or ""
+                if node.level:
+                    parts = package[:len(package) - node.level + 1] if node.level <= len(package) + 1 else []
+                    base = ".".join([*parts, *filter(None, [node.module])])
+                yield base
+                yield from (f"{base}.{alias.name}" if base else alias.name for alias in node.names)
+
+    def _resolve(self, module: str, rel_path: str, snapshot: Dict[str, str]) -> Set[str]:
+        """Project files a dotted module name can refer to"""
+        module_path = module.replace(".", "/")
+        search_dirs = {"", "src/", rel_path.rsplit("/", 1)[0] + "/" if "/" in rel_path else ""}
+        candidates = (
+            f"{base}{module_path}{suffix}"
+            for base in search_dirs for suffix in (".py", "/__init__.py")
+        )
+        return {candidate for candidate in candidates if candidate in snapshot}
+
+    def _snapshot(self) -> Dict[str, str]:
+        """Content hash of every Python and pytest config file, by relative path"""
+        snapshot = {}
+        for directory, dirs, files in os.walk(self.root):
+            dirs[:] = [name for name in dirs if name not in EXCLUDED_DIRS and not name.startswith(".")]
+            for name in files:
+                if not (name.endswith(".py") or name in CONFIG_FILES):
+                    continue
+                path = Path(directory) / name
+                try:
+                    snapshot[path.relative_to(self.root).as_posix()] = hashlib.sha256(path.read_bytes()).hexdigest()
+                except OSError:
+                    continue
+        return snapshot
+
+    # ========== Results ==========
+
+    def _record(self, selected: List[str], response: Dict) -> None:
+        """Store per-file outcomes of a run"""
+        by_file: Dict[str, Dict[str, str]] = {path: {} for path in selected}
+        for nodeid, outcome in response.get("outcomes", {}).items():
+            path = nodeid.split("::", 1)[0]
+            if path in by_file:
+                by_file[path][nodeid] = outcome
+        for path, outcomes in by_file.items():
+            if outcomes or response.get("exit_code") != EXIT_INTERRUPTED:
+                self._file_outcomes[path] = outcomes
+            else:
+                # Not run because collection failed elsewhere: run it next time
+                self._file_outcomes.pop(path, None)
+
+    def _result(self, files_run: List[str], files_skipped: List[str], output: str, duration: float) -> Dict:
+        counts = {"passed": 0, "failed": 0, "skipped": 0, "error": 0}
+        for outcomes in self._file_outcomes.values():
+            for outcome in outcomes.values():
+                counts[outcome] += 1
+        total = sum(counts.values())
+        return {
+            "passed": counts["passed"],
+            "failed": counts["failed"],
+            "skipped": counts["skipped"],
+            "errors": counts["error"],
+            "total": total,
+            "pass_rate": round(counts["passed"] / total * 100, 2) if total else 0.0,
+            "exit_code": 1 if counts["failed"] or counts["error"] else 0,
+            "output": output,
+            "framework": "pytest",
+            "duration": duration,
+            "mode": "warm",
+            "files_run": files_run,
+            "files_skipped": files_skipped
+        }
+
+    # ========== Worker Process ==========
+
+    def _request(self, payload: Dict) -> Dict:
+        """Send one run to the worker and wait for its reply"""
+        self._ensure_worker()
+        try:
+            self._process.stdin.write(json.dumps(payload) + "\n")
+            self._process.stdin.flush()
+        except (OSError, ValueError) as e:
+            self._abort()
+            raise _worker_failure("Warm test worker is not accepting runs", self.root, original=e)
+
+        response = self._read(self.timeout)
+        if response.get("exit_code", -1) < 0:
+            self._abort()
+            raise _worker_failure(response.get("output", "Warm test worker failed"), self.root)
+        return response
+
+    def _ensure_worker(self) -> None:
+        if self._process is not None and self._process.poll() is None:
+            return
+        env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+        self._process = subprocess.Popen(
+            [self.python, str(WORKER_SCRIPT)],
+            cwd=str(self.root),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            env=env
+        )
+        self._responses = queue.Queue()
+        threading.Thread(target=self._pump, args=(self._process.stdout, self._responses), daemon=True).start()
+        self._read(WORKER_START_TIMEOUT)
+
+    @staticmethod
+    def _pump(stream, responses: "queue.Queue[Optional[str]]") -> None:
+        for line in stream:
+            responses.put(line)
+        responses.put(None)
+
+    def _read(self, timeout: float) -> Dict:
+        """Next reply from the worker; kills it on timeout or exit"""
+        try:
+            line = self._responses.get(timeout=timeout)
+        except queue.Empty:
+            self._abort()
+            raise _worker_failure(f"Warm test worker did not answer within {timeout}s", self.root, timed_out=True)
+        if line is None:
+            self._abort()
+            raise _worker_failure("Warm test worker exited", self.root)
+        return json.loads(line)
+
+    def _abort(self) -> None:
+        process, self._process = self._process, None
+        if process is not None and process.poll() is None:
+            process.kill()
+            process.wait()
+
+
+__all__ = [
+    "WarmTestSession"
+]
@@ -0,0 +1,104 @@
+"""
+Module: agents/developer/warm_test_worker.py
+
+WHY: Every TDD test run started a fresh pytest process that re-imported
+     pytest, its plugins and every third-party dependency of the generated
+     project. This worker stays alive for one output directory and runs
+     pytest in-process, so only the project's own modules are re-imported.
+RESPONSIBILITY: Serve pytest runs over a line-based JSON protocol and
+                report per-test outcomes.
+PATTERNS: Worker process, Command pattern (one JSON request per run).
+
+Protocol (one JSON object per line):
+    stdin:  {"args": ["tests/test_a.py", ...]}     or {"command": "exit"}
+    stdout: {"exit_code": 0, "outcomes": {nodeid: outcome}, "output": "..."}
+
+Run as a script with the output directory as working directory. Uses only
+the standard library and pytest so it never imports Artemis modules into
+the project's test process.
+"""
+
+import contextlib
+import importlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+# Outcome precedence when a test reports several phases (setup/call/teardown)
+OUTCOME_RANK = {"passed": 0, "skipped": 1, "failed": 2, "error": 3}
+
+
+class OutcomeCollector:
+    """pytest plugin recording one outcome per test node"""
+
+    def __init__(self):
+        self.outcomes = {}
+
+    def pytest_runtest_logreport(self, report):
+        outcome = report.outcome
+        if report.when != "call" and outcome == "failed":
+            outcome = "error"
+        current = self.outcomes.get(report.nodeid)
+        if current is None or OUTCOME_RANK[outcome] > OUTCOME_RANK[current]:
+            self.outcomes[report.nodeid] = outcome
+
+    def pytest_collectreport(self, report):
+        if report.failed:
+            self.outcomes[report.nodeid or "<collection>"] = "error"
+
+
+def purge_project_modules(root: Path) -> None:
+    """Forget modules loaded from the project so edited files are re-imported"""
+    for name, module in list(sys.modules.items()):
+        module_file = getattr(module, "__file__", None)
+        if module_file and Path(module_file).resolve().is_relative_to(root):
+            del sys.modules[name]
+    importlib.invalidate_caches()
+
+
+def run(args, root: Path) -> dict:
+    import pytest
+
+    purge_project_modules(root)
+    collector = OutcomeCollector()
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        exit_code = pytest.main([*args, "-p", "no:cacheprovider", "--color=no", "-q"], plugins=[collector])
+    return {"exit_code": int(exit_code), "outcomes": collector.outcomes, "output": output.getvalue()}
+
+
+def main() -> None:
+    root = Path.cwd().resolve()
+    # Project modules must win over anything next to this script
+    sys.path[0] = str(root)
+    # Never load or write bytecode that could be stale within one mtime tick
+    sys.dont_write_bytecode = True
+    sys.pycache_prefix = tempfile.mkdtemp(prefix="artemis_warm_pyc_")
+
+    import pytest  # noqa: F401 - warm the import once
+
+    protocol = sys.stdout
+    sys.stdout = sys.stderr
+    protocol.write(json.dumps({"ready": True}) + "\n")
+    protocol.flush()
+
+    for line in sys.stdin:
+        request = json.loads(line)
+        if request.get("command") == "exit":
+            break
+        try:
+            response = run(request.get("args", []), root)
+        except Exception as e:
+            response = {"exit_code": -1, "outcomes": {}, "output": f"warm worker error: {e}"}
+        protocol.write(json.dumps(response) + "\n")
+        protocol.flush()
+    shutil.rmtree(sys.pycache_prefix, ignore_errors=True)
+    os._exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -27,6 +27,7 @@ from .models import (
 from .voting_session import VotingSession
 from .consensus_builder import ConsensusBuilder
 from .estimator import Estimator
+from .estimate_history import EstimateHistory, HistoricalMatch
 from .poker_core import PlanningPoker, estimate_features_batch
 
 __all__ = [
@@ -41,6 +42,8 @@ __all__ = [
     'VotingSession',
     'ConsensusBuilder',
     'Estimator',
+    'EstimateHistory',
+    'HistoricalMatch',
     'PlanningPoker',
 
     # Utility functions
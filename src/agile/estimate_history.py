@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Planning Poker Estimate History
+
+WHY: Epics repeat features ("user login", "CSV export") that earlier sprint
+plans already estimated. Re-running every voting round for them costs
+agents x rounds LLM calls to reproduce a number we already have.
+
+RESPONSIBILITY:
+- Look up past feature estimates from RAG sprint_plan artifacts
+- Score text similarity between a new feature and past features
+- Classify matches as reusable (skip voting) or as a voting seed
+
+PATTERNS:
+- Repository Pattern: RAG access hidden behind find_match()
+- Value Objects: HistoricalMatch carries the matched estimate
+- Guard Clauses: Missing RAG or malformed metadata yield no match
+"""
+
+import re
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from .models import EstimationConfig
+
+
+@dataclass
+class HistoricalMatch:
+    """
+    Past feature estimate similar to the feature being estimated
+
+    WHY: Carries everything needed to reuse or anchor an estimate
+    """
+    feature_title: str
+    story_points: int
+    confidence: float
+    similarity: float
+    source_card_id: Optional[str] = None
+
+    def is_reusable(self) -> bool:
+        """Similar and confident enough to skip voting entirely"""
+        return (
+            self.similarity >= EstimationConfig.HISTORY_REUSE_SIMILARITY and
+            self.confidence >= EstimationConfig.HISTORY_REUSE_CONFIDENCE
+        )
+
+
+def normalize_feature_text(title: str, description: str) -> str:
+    """Lowercase title + description with punctuation/whitespace collapsed"""
+    text = f"{title or ''} {description or ''}".lower()
+    return re.sub(r'[^a-z0-9]+', ' ', text).strip()
+
+
+class EstimateHistory:
+    """
+    Finds past Planning Poker estimates for similar features
+
+    WHY: RAG search ranks whole sprint plans; the per-feature estimates live
+    in the plan metadata, so features are compared locally after retrieval.
+    """
+
+    def __init__(self, rag: Any, top_k: int = EstimationConfig.HISTORY_QUERY_TOP_K):
+        """
+        Initialize estimate history
+
+        Args:
+            rag: RAG agent with query_similar() (None disables lookups)
+            top_k: Sprint plans to retrieve per lookup
+        """
+        self.rag = rag
+        self.top_k = top_k
+
+    def find_match(self, feature: Dict[str, Any]) -> Optional[HistoricalMatch]:
+        """
+        Find the most similar past feature estimate
+
+        Args:
+            feature: Feature dict with title and description
+
+        Returns:
+            Best HistoricalMatch at or above the seed threshold, or None
+        """
+        # Guard clause: no RAG configured
+        if not self.rag:
+            return None
+
+        title = feature.get("title", "")
+        description = feature.get("description", "")
+        target = normalize_feature_text(title, description)
+
+        # Guard clause: nothing to compare
+        if not target:
+            return None
+
+        best: Optional[HistoricalMatch] = None
+        for card_id, past in self._past_features(f"{title}\n{description}"):
+            match = self._score(target, card_id, past)
+            if match and (best is None or match.similarity > best.similarity):
+                best = match
+        return best
+
+    def _past_features(self, query: str) -> Iterator[Tuple[Optional[str], Dict[str, Any]]]:
+        """Yield (card_id, feature dict) from retrieved sprint plans"""
+        try:
+            plans = self.rag.query_similar(
+                query_text=query,
+                artifact_types=["sprint_plan"],
+                top_k=self.top_k
+            )
+        except Exception:
+            # History is an optimization - a failing RAG means full voting
+            return
+
+        for plan in plans or []:
+            metadata = plan.get("metadata") or {}
+            sprints = metadata.get("sprints")
+            if not isinstance(sprints, list):
+                continue
+            for sprint in sprints:
+                for past in (sprint.get("features") or []) if isinstance(sprint, dict) else []:
+                    if isinstance(past, dict):
+                        yield metadata.get("card_id"), past
+
+    def _score(
+        self,
+        target: str,
+        card_id: Optional[str],
+        past: Dict[str, Any]
+    ) -> Optional[HistoricalMatch]:
+        """Build a match if the past feature is similar enough to seed voting"""
+        try:
+            story_points = int(past["story_points"])
+            confidence = float(past.get("confidence", 0.0))
+        except (KeyError, TypeError, ValueError):
+            return None
+
+        candidate = normalize_feature_text(past.get("title", ""), past.get("description", ""))
+        matcher = SequenceMatcher(None, target, candidate)
+        threshold = EstimationConfig.HISTORY_SEED_SIMILARITY
+
+        # quick_ratio is an upper bound - skip the full ratio when it can't pass
+        if matcher.quick_ratio() < threshold:
+            return None
+        similarity = matcher.ratio()
+        if similarity < threshold:
+            return None
+
+        return HistoricalMatch(
+            feature_title=past.get("title", ""),
+            story_points=story_points,
+            confidence=confidence,
+            similarity=similarity,
+            source_card_id=card_id
+        )
+
@@ -38,6 +38,12 @@ class EstimationConfig:
     MEDIUM_RISK_CONFIDENCE_THRESHOLD = 0.7  # Confidence below this = medium risk
     DEFAULT_CONFIDENCE = 0.5  # Default confidence on error
     ERROR_VOTE_POINTS = 5  # Default story points when estimation fails
+    MAX_PARALLEL_FEATURES = 4  # Features estimated concurrently in batch mode
+    MAX_CONCURRENT_LLM_CALLS = 6  # Global cap on in-flight agent votes
+    HISTORY_QUERY_TOP_K = 5  # Past sprint plans retrieved per feature
+    HISTORY_SEED_SIMILARITY = 0.75  # Similar past feature anchors the vote
+    HISTORY_REUSE_SIMILARITY = 0.92  # Near-identical past feature...
+    HISTORY_REUSE_CONFIDENCE = 0.8  # ...estimated this confidently skips voting
 
 
 class FibonacciScale(Enum):
@@ -98,3 +104,5 @@ class FeatureEstimate:
     confidence: float
     risk_level: str  # "low", "medium", "high"
     estimated_hours: float  # Based on team velocity
+    source: str = "poker"  # "poker", "seeded" (anchored on history) or "history" (reused)
+    reference_title: Optional[str] = None  # Past feature used as anchor/reuse source
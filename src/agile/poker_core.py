@@ -10,30 +10,38 @@ RESPONSIBILITY:
 - Manage voting sessions and consensus checking
 - Calculate final estimates with confidence and risk
 - Broadcast estimation events to observers
-- Provide batch estimation for multiple features
+- Provide concurrent batch estimation for multiple features
+- Reuse or anchor on near-identical past estimates from RAG
 
 PATTERNS:
 - Facade Pattern: Simplified interface for complex estimation process
 - Observer Pattern: Event broadcasting for progress tracking
 - Strategy Pattern: Pluggable consensus and estimation strategies
 - Guard Clauses: Early validation and error handling
+- Concurrent Execution: Features estimated in parallel under a global LLM cap
 """
 
-from typing import List, Optional, Dict, TYPE_CHECKING
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, List, Optional, Dict, TYPE_CHECKING
 
 from artemis_stage_interface import LoggerInterface
 from llm_client import LLMClient
+from llm.llm_factory import LLMClientFactory
 from pipeline_observer import PipelineEvent, EventType, PipelineObservable
 
 from .models import (
     EstimationVote,
     EstimationRound,
     FeatureEstimate,
-    FibonacciScale
+    FibonacciScale,
+    EstimationConfig
 )
 from .voting_session import VotingSession
 from .consensus_builder import ConsensusBuilder
 from .estimator import Estimator
+from .estimate_history import EstimateHistory, HistoricalMatch
 
 # Conditional imports for type checking
 if TYPE_CHECKING:
@@ -61,7 +69,10 @@ class PlanningPoker:
         team_velocity: float = 20.0,
         max_rounds: int = 3,
         observable: Optional[PipelineObservable] = None,
-        ai_service: Optional['AIQueryService'] = None
+        ai_service: Optional['AIQueryService'] = None,
+        rag: Optional[Any] = None,
+        max_parallel_features: int = EstimationConfig.MAX_PARALLEL_FEATURES,
+        max_concurrent_llm_calls: int = EstimationConfig.MAX_CONCURRENT_LLM_CALLS
     ):
         """
         Initialize Planning Poker
@@ -74,6 +85,9 @@ class PlanningPoker:
             max_rounds: Maximum voting rounds before forcing consensus
             observable: Optional PipelineObservable for event broadcasting
             ai_service: Optional AIQueryService for KG-First optimization
+            rag: Optional RAG agent; past sprint_plan estimates seed or replace voting
+            max_parallel_features: Features estimated concurrently in batch mode
+            max_concurrent_llm_calls: Global cap on in-flight agent votes
         """
         # Guard clause: validate agents
         if not agents:
@@ -86,11 +100,17 @@ class PlanningPoker:
         self.max_rounds = max_rounds
         self.observable = observable
         self.ai_service = ai_service
+        self.max_parallel_features = max(1, max_parallel_features)
+        self.llm_semaphore = threading.BoundedSemaphore(max(1, max_concurrent_llm_calls))
+        self.last_batch_stats: Dict[str, Any] = {}
 
         # Initialize components
-        self.voting_session = VotingSession(agents, llm_client, logger, observable)
+        # Votes are short JSON answers: try a cheaper model first, escalate on low confidence
+        vote_client = LLMClientFactory.create_cascade("estimation_vote", client=llm_client)
+        self.voting_session = VotingSession(agents, vote_client, logger, observable, self.llm_semaphore)
         self.consensus_builder = ConsensusBuilder()
         self.estimator = Estimator(team_velocity)
+        self.history = EstimateHistory(rag)
 
         # Fibonacci values for voting
         self.fibonacci_values = [v.value for v in FibonacciScale]
@@ -106,7 +126,8 @@ class PlanningPoker:
         self,
         feature_title: str,
         feature_description: str,
-        acceptance_criteria: List[str]
+        acceptance_criteria: List[str],
+        reference: Optional[HistoricalMatch] = None
     ) -> FeatureEstimate:
         """
         Run Planning Poker to estimate a feature
@@ -123,6 +144,7 @@ class PlanningPoker:
             feature_title: Feature name
             feature_description: Detailed description
             acceptance_criteria: List of acceptance criteria
+            reference: Similar past estimate shown to agents as an anchor
 
         Returns:
             FeatureEstimate with consensus story points
@@ -150,7 +172,8 @@ class PlanningPoker:
                 feature_description,
                 acceptance_criteria,
                 round_num,
-                previous_votes=rounds[-1].votes if rounds else None
+                previous_votes=rounds[-1].votes if rounds else None,
+                reference=reference
             )
 
             # Check for consensus
@@ -215,7 +238,9 @@ class PlanningPoker:
             final_estimate=final_estimate,
             confidence=confidence,
             risk_level=risk_level,
-            estimated_hours=estimated_hours
+            estimated_hours=estimated_hours,
+            source="seeded" if reference else "poker",
+            reference_title=reference.feature_title if reference else None
         )
 
     def estimate_features_batch(
@@ -225,41 +250,144 @@ class PlanningPoker:
         """
         Estimate multiple features using Planning Poker
 
-        WHY: Provides convenient batch estimation interface
+        WHY: Sequential estimation of a large epic takes agents x rounds LLM
+        calls per feature, one feature after another. Features are estimated
+        concurrently (all votes share one LLM concurrency cap), and features
+        nearly identical to a confident past estimate skip voting.
 
         Args:
             features: List of feature dicts with title, description, acceptance_criteria
 
         Returns:
-            List of FeatureEstimate objects
+            List of FeatureEstimate objects in input order (batch statistics in
+            self.last_batch_stats)
         """
         # Guard clause: no features
         if not features:
             self.logger.log("No features to estimate", "WARNING")
             return []
 
-        estimates = []
+        started = time.perf_counter()
+        matches = [self.history.find_match(feature) for feature in features]
+        estimates: List[Optional[FeatureEstimate]] = [None] * len(features)
+        workers = min(self.max_parallel_features, len(features))
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="planning-poker") as executor:
+            future_to_index = {}
+            for index, (feature, match) in enumerate(zip(features, matches)):
+                if match and match.is_reusable():
+                    estimates[index] = self._estimate_from_history(feature, match)
+                    continue
+                future = executor.submit(self._estimate_batch_feature, index + 1, len(features), feature, match)
+                future_to_index[future] = index
+
+            for future in as_completed(future_to_index):
+                estimates[future_to_index[future]] = future.result()
+
+        self.last_batch_stats = self._build_batch_stats(estimates, time.perf_counter() - started)
+        self.logger.log(
+            f"🃏 Batch estimated {len(features)} features in {self.last_batch_stats['elapsed_seconds']:.1f}s "
+            f"({self.last_batch_stats['reused_from_history']} reused, "
+            f"{self.last_batch_stats['seeded_from_history']} seeded from history, "
+            f"{self.last_batch_stats['llm_votes_saved']} LLM votes saved)",
+            "INFO"
+        )
+        return estimates
 
-        for i, feature in enumerate(features, 1):
-            self.logger.log(f"\n{'='*60}", "INFO")
-            self.logger.log(f"Feature {i}/{len(features)}", "INFO")
-            self.logger.log(f"{'='*60}", "INFO")
+    def _estimate_batch_feature(
+        self,
+        position: int,
+        total: int,
+        feature: Dict,
+        reference: Optional[HistoricalMatch]
+    ) -> FeatureEstimate:
+        """
+        Estimate one feature of a batch (runs on a worker thread)
 
-            estimate = self.estimate_feature(
-                feature_title=feature.get("title", "Unknown Feature"),
-                feature_description=feature.get("description", ""),
-                acceptance_criteria=feature.get("acceptance_criteria", [])
-            )
+        Args:
+            position: 1-based position in the batch
+            total: Batch size
+            feature: Feature dict
+            reference: Similar past estimate to anchor on
+        """
+        self.logger.log(f"Feature {position}/{total}: {feature.get('title', 'Unknown Feature')}", "INFO")
+
+        estimate = self.estimate_feature(
+            feature_title=feature.get("title", "Unknown Feature"),
+            feature_description=feature.get("description", ""),
+            acceptance_criteria=feature.get("acceptance_criteria", []),
+            reference=reference
+        )
 
-            estimates.append(estimate)
+        self.logger.log(
+            f"✅ Estimated '{estimate.feature_title}': {estimate.final_estimate} points "
+            f"(confidence: {estimate.confidence:.0%}, risk: {estimate.risk_level})",
+            "SUCCESS"
+        )
+        return estimate
 
-            self.logger.log(
-                f"✅ Estimated: {estimate.final_estimate} points "
-                f"(confidence: {estimate.confidence:.0%}, risk: {estimate.risk_level})",
-                "SUCCESS"
-            )
+    def _estimate_from_history(self, feature: Dict, match: HistoricalMatch) -> FeatureEstimate:
+        """
+        Reuse a near-identical past estimate without voting
 
-        return estimates
+        WHY: The agents would reproduce a number the team already agreed on
+        with high confidence.
+
+        Args:
+            feature: Feature dict
+            match: Reusable historical match
+
+        Returns:
+            FeatureEstimate with no voting rounds and source "history"
+        """
+        feature_title = feature.get("title", "Unknown Feature")
+        risk_level = self.estimator.assess_risk(match.story_points, match.confidence)
+        estimated_hours = self.estimator.calculate_estimated_hours(match.story_points)
+
+        self.logger.log(
+            f"♻️  Reused estimate for '{feature_title}': {match.story_points} points "
+            f"(matches '{match.feature_title}', similarity {match.similarity:.0%})",
+            "INFO"
+        )
+        self._notify_event(EventType.STAGE_COMPLETED, {
+            "feature_title": feature_title,
+            "final_estimate": match.story_points,
+            "confidence": match.confidence,
+            "risk_level": risk_level,
+            "estimated_hours": estimated_hours,
+            "rounds_needed": 0,
+            "reused_from": match.feature_title
+        })
+
+        return FeatureEstimate(
+            feature_title=feature_title,
+            feature_description=feature.get("description", ""),
+            rounds=[],
+            final_estimate=match.story_points,
+            confidence=match.confidence,
+            risk_level=risk_level,
+            estimated_hours=estimated_hours,
+            source="history",
+            reference_title=match.feature_title
+        )
+
+    def _build_batch_stats(self, estimates: List[FeatureEstimate], elapsed_seconds: float) -> Dict[str, Any]:
+        """
+        Summarize a batch run
+
+        llm_votes_saved is a lower bound: each reused feature would have
+        needed at least one full voting round.
+        """
+        reused = [e for e in estimates if e.source == "history"]
+        return {
+            "features": len(estimates),
+            "voted": len(estimates) - len(reused),
+            "reused_from_history": len(reused),
+            "seeded_from_history": sum(1 for e in estimates if e.source == "seeded"),
+            "llm_votes": sum(len(r.votes) for e in estimates for r in e.rounds),
+            "llm_votes_saved": len(reused) * len(self.agents),
+            "elapsed_seconds": elapsed_seconds
+        }
 
     def _notify_event(self, event_type: EventType, data: Dict) -> None:
         """
@@ -19,7 +19,8 @@ PATTERNS:
 """
 
 import json
-from typing import List, Optional, Dict, Any
+import threading
+from typing import List, Optional, Dict, Any, TYPE_CHECKING
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from artemis_stage_interface import LoggerInterface
@@ -28,6 +29,9 @@ from pipeline_observer import EventType, PipelineObservable
 
 from .models import EstimationVote, EstimationConfig, FibonacciScale
 
+if TYPE_CHECKING:
+    from .estimate_history import HistoricalMatch
+
 
 class VotingSession:
     """
@@ -41,7 +45,8 @@ class VotingSession:
         agents: List[str],
         llm_client: LLMClient,
         logger: LoggerInterface,
-        observable: Optional[PipelineObservable] = None
+        observable: Optional[PipelineObservable] = None,
+        llm_semaphore: Optional[threading.BoundedSemaphore] = None
     ):
         """
         Initialize voting session
@@ -51,11 +56,14 @@ class VotingSession:
             llm_client: LLM client for generating votes
             logger: Logger interface
             observable: Optional PipelineObservable for event broadcasting
+            llm_semaphore: Optional shared cap on in-flight LLM calls (batch mode
+                           runs several sessions at once)
         """
         self.agents = agents
         self.llm_client = llm_client
         self.logger = logger
         self.observable = observable
+        self.llm_semaphore = llm_semaphore
 
     def collect_votes(
         self,
@@ -63,7 +71,8 @@ class VotingSession:
         feature_description: str,
         acceptance_criteria: List[str],
         round_num: int,
-        previous_votes: Optional[List[EstimationVote]] = None
+        previous_votes: Optional[List[EstimationVote]] = None,
+        reference: Optional['HistoricalMatch'] = None
     ) -> List[EstimationVote]:
         """
         Collect estimation votes from all agents in parallel
@@ -76,6 +85,7 @@ class VotingSession:
             acceptance_criteria: List of acceptance criteria
             round_num: Current round number
             previous_votes: Votes from previous round (for context)
+            reference: Similar past estimate to anchor on (for context)
 
         Returns:
             List of EstimationVote objects sorted by agent name
@@ -98,7 +108,8 @@ class VotingSession:
                     feature_description,
                     acceptance_criteria,
                     round_num,
-                    previous_votes
+                    previous_votes,
+                    reference
                 ): agent_name
                 for agent_name in self.agents
             }
@@ -130,7 +141,8 @@ class VotingSession:
         feature_description: str,
         acceptance_criteria: List[str],
         round_num: int,
-        previous_votes: Optional[List[EstimationVote]] = None
+        previous_votes: Optional[List[EstimationVote]] = None,
+        reference: Optional['HistoricalMatch'] = None
     ) -> EstimationVote:
         """
         Get a single agent's vote using LLM
@@ -144,6 +156,7 @@ class VotingSession:
             acceptance_criteria: List of acceptance criteria
             round_num: Current round number
             previous_votes: Votes from previous round
+            reference: Similar past estimate to anchor on
 
         Returns:
             EstimationVote from the agent
@@ -154,7 +167,8 @@ class VotingSession:
             feature_description,
             acceptance_criteria,
             round_num,
-            previous_votes
+            previous_votes,
+            reference
         )
 
         try:
@@ -166,10 +180,7 @@ class VotingSession:
                 LLMMessage(role="user", content=prompt)
             ]
 
-            llm_response = self.llm_client.complete(
-                messages=messages,
-                response_format={"type": "json_object"}
-            )
+            llm_response = self._complete(messages)
 
             data = json.loads(llm_response.content)
             return self._parse_vote_response(agent_name, data)
@@ -178,6 +189,19 @@ class VotingSession:
             self.logger.log(f"Error getting vote from {agent_name}: {e}", "ERROR")
             return self._create_default_vote(agent_name, error=str(e))
 
+    def _complete(self, messages: List[LLMMessage]) -> Any:
+        """
+        Call the LLM, holding the shared semaphore if one is configured
+
+        WHY: Batch mode runs several voting sessions at once; the semaphore
+        keeps total in-flight calls under the provider's rate limits.
+        """
+        if not self.llm_semaphore:
+            return self.llm_client.complete(messages=messages, response_format={"type": "json_object"})
+
+        with self.llm_semaphore:
+            return self.llm_client.complete(messages=messages, response_format={"type": "json_object"})
+
     def _build_voting_prompt(
         self,
         agent_name: str,
@@ -185,7 +209,8 @@ class VotingSession:
         feature_description: str,
         acceptance_criteria: List[str],
         round_num: int,
-        previous_votes: Optional[List[EstimationVote]]
+        previous_votes: Optional[List[EstimationVote]],
+        reference: Optional['HistoricalMatch'] = None
     ) -> str:
         """
         Build voting prompt for agent
@@ -199,6 +224,7 @@ class VotingSession:
             acceptance_criteria: List of acceptance criteria
             round_num: Current round number
             previous_votes: Votes from previous round
+            reference: Similar past estimate to anchor on
 
         Returns:
             Formatted prompt string
@@ -215,6 +241,14 @@ class VotingSession:
                 f"Please consider these votes and adjust if needed."
             )
 
+        if reference:
+            previous_context += (
+                f"\n\nHistorical reference: the similar past feature '{reference.feature_title}' "
+                f"was estimated at {reference.story_points} points "
+                f"(confidence: {reference.confidence:.0%}). "
+                f"Use it as an anchor and adjust for any differences."
+            )
+
         return f"""You are {agent_name} participating in Planning Poker estimation.
 
 Feature: {feature_title}
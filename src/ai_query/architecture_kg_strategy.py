@@ -38,12 +38,7 @@ class ArchitectureKGStrategy(KGQueryStrategy):
 
             similar_adrs = []
             for keyword in keywords[:3]:  # Top 3 keywords
-                adrs = kg.query("""
-                    MATCH (adr:ADR)-[:ADDRESSES]->(req:Requirement)
-                    WHERE req.title CONTAINS $keyword OR req.type = $req_type
-                    RETURN DISTINCT adr.adr_id, adr.title
-                    LIMIT 3
-                """, {"keyword": keyword, "req_type": req_type})
+                adrs = kg.find_adrs_for_requirements(keyword, req_type, limit=3)
                 if adrs:
                     similar_adrs.extend(adrs)
 
@@ -51,8 +46,8 @@ class ArchitectureKGStrategy(KGQueryStrategy):
 
             patterns = [
                 {
-                    'adr_id': adr.get('adr.adr_id'),
-                    'title': adr.get('adr.title')
+                    'adr_id': adr.get('adr_id'),
+                    'title': adr.get('title')
                 }
                 for adr in similar_adrs
             ]
@@ -36,13 +36,7 @@ class CodeGenerationKGStrategy(KGQueryStrategy):
 
             similar_files = []
             for keyword in keywords[:3]:
-                files = kg.query("""
-                    MATCH (task:Task)-[:MODIFIED]->(file:File)
-                    WHERE toLower(task.title) CONTAINS $keyword
-                    AND file.file_type = 'python'
-                    RETURN DISTINCT file.path, file.file_type, task.title
-                    LIMIT 3
-                """, {"keyword": keyword})
+                files = kg.find_implementations(keyword, file_type='python', limit=3)
                 if files:
                     similar_files.extend(files)
 
@@ -50,9 +44,9 @@ class CodeGenerationKGStrategy(KGQueryStrategy):
 
             patterns = [
                 {
-                    'file_path': f.get('file.path'),
-                    'file_type': f.get('file.file_type'),
-                    'task_title': f.get('task.title')
+                    'file_path': f.get('file_path'),
+                    'file_type': f.get('file_type'),
+                    'task_title': f.get('task_title')
                 }
                 for f in similar_files
             ]
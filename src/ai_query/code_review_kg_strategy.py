@@ -36,13 +36,7 @@ class CodeReviewKGStrategy(KGQueryStrategy):
 
             similar_reviews = []
             for file_type in file_types:
-                reviews = kg.query("""
-                    MATCH (review:CodeReview)-[:REVIEWED]->(file:File)
-                    WHERE file.file_type = $file_type
-                    AND review.critical_issues > 0
-                    RETURN review.review_id, review.critical_issues, review.high_issues
-                    LIMIT 5
-                """, {"file_type": file_type})
+                reviews = kg.find_reviews_with_critical_issues(file_type, limit=5)
                 if reviews:
                     similar_reviews.extend(reviews)
 
@@ -50,9 +44,9 @@ class CodeReviewKGStrategy(KGQueryStrategy):
 
             patterns = [
                 {
-                    'review_id': rev.get('review.review_id'),
-                    'critical_issues': rev.get('review.critical_issues'),
-                    'high_issues': rev.get('review.high_issues')
+                    'review_id': rev.get('review_id'),
+                    'critical_issues': rev.get('critical_issues'),
+                    'high_issues': rev.get('high_issues')
                 }
                 for rev in similar_reviews
             ]
@@ -37,14 +37,7 @@ class ErrorRecoveryKGStrategy(KGQueryStrategy):
             stage_name = query_params.get('stage_name', '')
 
             # Query for similar errors
-            similar_errors = kg.query("""
-                MATCH (error:Error)-[:OCCURRED_IN]->(stage:Stage)
-                WHERE error.error_type CONTAINS $error_type
-                AND stage.name = $stage_name
-                RETURN error.error_type, error.solution, error.success_rate
-                ORDER BY error.success_rate DESC
-                LIMIT 5
-            """, {"error_type": error_type, "stage_name": stage_name})
+            similar_errors = kg.find_error_solutions(error_type, stage_name, limit=5)
 
             elapsed_ms = (time.time() - start) * 1000
 
@@ -61,9 +54,9 @@ class ErrorRecoveryKGStrategy(KGQueryStrategy):
 
             patterns = [
                 {
-                    'error_type': e.get('error.error_type'),
-                    'solution': e.get('error.solution'),
-                    'success_rate': e.get('error.success_rate')
+                    'error_type': e.get('error_type'),
+                    'solution': e.get('solution'),
+                    'success_rate': e.get('success_rate')
                 }
                 for e in similar_errors
             ]
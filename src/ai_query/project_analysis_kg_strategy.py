@@ -33,14 +33,7 @@ class ProjectAnalysisKGStrategy(KGQueryStrategy):
             start = time.time()
 
             # Query for similar projects and their common issues
-            similar_analyses = kg.query("""
-                MATCH (analysis:ProjectAnalysis)-[:IDENTIFIED]->(issue:Issue)
-                WHERE issue.severity IN ['CRITICAL', 'HIGH']
-                RETURN analysis.project_name, issue.category, issue.severity,
-                       issue.description
-                ORDER BY issue.severity DESC
-                LIMIT 10
-            """)
+            similar_analyses = kg.get_severe_project_issues(limit=10)
 
             elapsed_ms = (time.time() - start) * 1000
 
@@ -57,10 +50,10 @@ class ProjectAnalysisKGStrategy(KGQueryStrategy):
 
             patterns = [
                 {
-                    'project_name': a.get('analysis.project_name'),
-                    'category': a.get('issue.category'),
-                    'severity': a.get('issue.severity'),
-                    'description': a.get('issue.description')
+                    'project_name': a.get('project_name'),
+                    'category': a.get('category'),
+                    'severity': a.get('severity'),
+                    'description': a.get('description')
                 }
                 for a in similar_analyses
             ]
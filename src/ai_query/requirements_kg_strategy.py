@@ -32,13 +32,7 @@ class RequirementsKGStrategy(KGQueryStrategy):
         try:
             start = time.time()
 
-            similar_requirements = kg.query("""
-                MATCH (req:Requirement)
-                WHERE req.status = 'active'
-                RETURN req.req_id, req.title, req.type, req.priority
-                ORDER BY req.priority DESC
-                LIMIT 20
-            """)
+            similar_requirements = kg.get_active_requirements(limit=20)
 
             elapsed_ms = (time.time() - start) * 1000
 
@@ -55,10 +49,10 @@ class RequirementsKGStrategy(KGQueryStrategy):
 
             patterns = [
                 {
-                    'req_id': req.get('req.req_id'),
-                    'title': req.get('req.title'),
-                    'type': req.get('req.type'),
-                    'priority': req.get('req.priority', 'medium')
+                    'req_id': req.get('req_id'),
+                    'title': req.get('title'),
+                    'type': req.get('type'),
+                    'priority': req.get('priority', 'medium')
                 }
                 for req in similar_requirements
             ]
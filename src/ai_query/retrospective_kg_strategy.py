@@ -37,19 +37,7 @@ class RetrospectiveKGStrategy(KGQueryStrategy):
             team_name = query_params.get('team_name', 'default')
 
             # Query for past retrospective insights and action items
-            retrospective_data = kg.query("""
-                MATCH (retro:Retrospective)-[:FOR_SPRINT]->(sprint:Sprint)
-                WHERE sprint.team_name = $team_name
-                AND sprint.sprint_number < $sprint_number
-                RETURN retro.retro_id,
-                       retro.what_went_well,
-                       retro.what_needs_improvement,
-                       retro.action_items,
-                       sprint.sprint_number,
-                       sprint.velocity
-                ORDER BY sprint.sprint_number DESC
-                LIMIT 3
-            """, {"team_name": team_name, "sprint_number": sprint_number})
+            retrospective_data = kg.get_retrospectives(team_name, sprint_number, limit=3)
 
             elapsed_ms = (time.time() - start) * 1000
 
@@ -66,12 +54,12 @@ class RetrospectiveKGStrategy(KGQueryStrategy):
 
             patterns = [
                 {
-                    'retro_id': r.get('retro.retro_id'),
-                    'what_went_well': r.get('retro.what_went_well'),
-                    'what_needs_improvement': r.get('retro.what_needs_improvement'),
-                    'action_items': r.get('retro.action_items'),
-                    'sprint_number': r.get('sprint.sprint_number'),
-                    'velocity': r.get('sprint.velocity')
+                    'retro_id': r.get('retro_id'),
+                    'what_went_well': r.get('what_went_well'),
+                    'what_needs_improvement': r.get('what_needs_improvement'),
+                    'action_items': r.get('action_items'),
+                    'sprint_number': r.get('sprint_number'),
+                    'velocity': r.get('velocity')
                 }
                 for r in retrospective_data
             ]
@@ -37,16 +37,7 @@ class SprintPlanningKGStrategy(KGQueryStrategy):
             team_name = query_params.get('team_name', 'default')
 
             # Query for historical sprint data (velocity, completed stories)
-            sprint_history = kg.query("""
-                MATCH (sprint:Sprint)-[:COMPLETED]->(task:Task)
-                WHERE sprint.team_name = $team_name
-                AND sprint.sprint_number < $sprint_number
-                RETURN sprint.sprint_number, sprint.velocity,
-                       COUNT(task) as tasks_completed,
-                       AVG(task.story_points) as avg_story_points
-                ORDER BY sprint.sprint_number DESC
-                LIMIT 5
-            """, {"team_name": team_name, "sprint_number": sprint_number})
+            sprint_history = kg.get_sprint_history(team_name, sprint_number, limit=5)
 
             elapsed_ms = (time.time() - start) * 1000
 
@@ -63,8 +54,8 @@ class SprintPlanningKGStrategy(KGQueryStrategy):
 
             patterns = [
                 {
-                    'sprint_number': s.get('sprint.sprint_number'),
-                    'velocity': s.get('sprint.velocity'),
+                    'sprint_number': s.get('sprint_number'),
+                    'velocity': s.get('velocity'),
                     'tasks_completed': s.get('tasks_completed'),
                     'avg_story_points': s.get('avg_story_points')
                 }
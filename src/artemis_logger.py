@@ -14,6 +14,8 @@ Architecture:
     - Error aggregation in artemis_errors.log for monitoring
     - Automatic fallback to /tmp if permission denied
     - Thread-safe logger creation and configuration
+    - Non-blocking: callers enqueue records on a bounded queue; one background
+      writer drains it in batches (one flush per batch, not per record)
 
 Design Decisions:
     - Centralized logging prevents log sprawl across the system
@@ -21,14 +23,367 @@ Design Decisions:
     - Separate error log allows easy monitoring of critical issues
     - Console output provides immediate feedback during development
     - Environment variable configuration allows deployment flexibility
+    - Parallel stage workers must not serialize on handler locks or stall on
+      disk writes and rotation, so file/console I/O happens off-thread
+    - Bursty DEBUG records are rate-limited per logger; ERROR+ records are
+      never dropped (they wait for queue space instead)
+    - Queued records are flushed at exit and on uncaught exceptions
+
+Environment variables (queue pipeline):
+    ARTEMIS_LOG_ASYNC: "false" writes synchronously on the calling thread
+    ARTEMIS_LOG_QUEUE_SIZE: Max queued records (default 10000)
+    ARTEMIS_LOG_DEBUG_RATE: DEBUG records/second per logger (default 100, 0 = unlimited)
+    ARTEMIS_LOG_FORMAT: "json" writes one JSON object per line to log files
 """
 import os
 import sys
+import json
+import time
+import queue
+import atexit
 import logging
 import logging.handlers
+import threading
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
+
+LOG_BATCH_SIZE = 256
+SUPPRESSION_REPORT_INTERVAL_SECONDS = 1.0
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per record for log shippers and structured search.
+
+    Enabled with ARTEMIS_LOG_FORMAT=json (LOG_FORMAT_JSON in artemis_constants).
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            'timestamp': datetime.fromtimestamp(record.created).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'thread': record.threadName,
+            'process': record.process
+        }
+        if record.exc_info:
+            payload['exception'] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str)
+
+
+class BatchedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Rotating file handler flushed once per batch by the log writer.
+
+    Why needed: StreamHandler flushes after every record; during chatty LLM
+    phases that is one write syscall per line. Rotation and close still flush.
+    """
+
+    def flush(self):
+        """Deferred - the writer calls flush_batch() after each batch"""
+
+    def flush_batch(self):
+        super().flush()
+
+
+class DebugRateLimiter:
+    """
+    Token bucket per logger name for DEBUG records.
+
+    Why needed: A few chatty loops can produce thousands of DEBUG lines per
+    second and crowd real events out of the queue. Only DEBUG is limited.
+    """
+
+    def __init__(self, rate_per_second: float, burst: Optional[float] = None):
+        self.rate = rate_per_second
+        self.burst = burst if burst is not None else max(1.0, rate_per_second)
+        self._buckets: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def allow(self, name: str, now: Optional[float] = None) -> bool:
+        if self.rate <= 0:
+            return True
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            tokens, last = self._buckets.get(name, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - last) * self.rate)
+            allowed = tokens >= 1
+            self._buckets[name] = [tokens - 1 if allowed else tokens, now]
+            return allowed
+
+
+class _FlushRequest:
+    """Queue marker: set once every record queued before it is written"""
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+_STOP = object()
+
+
+class LogPipeline:
+    """
+    Bounded queue plus one background writer shared by all ArtemisLoggers.
+
+    Why it exists: Moves formatting, disk writes, fsync and rotation off the
+    calling threads. Callers only pay for an enqueue.
+
+    Responsibilities:
+    - Route queued records to the handlers of the logger that produced them
+    - Write in batches and flush each touched handler once per batch
+    - Rate-limit DEBUG per logger; drop sub-ERROR records when the queue is
+      full; block for ERROR+ so errors are never lost
+    - Report suppressed/dropped counts as WARNING records
+    - Drain on flush()/shutdown() (registered with atexit)
+
+    Thread-safety: Thread-safe. Reset in forked children (fresh queue/thread).
+    """
+
+    def __init__(self, maxsize: int = 10000, debug_rate: float = 100.0):
+        self.maxsize = maxsize
+        self.rate_limiter = DebugRateLimiter(debug_rate)
+        self.routes: Dict[str, List[logging.Handler]] = {}
+        self.suppressed: Dict[str, int] = {}
+        self.dropped: Dict[str, int] = {}
+        self._reset_runtime()
+
+    def _reset_runtime(self) -> None:
+        self.queue: queue.Queue = queue.Queue(self.maxsize)
+        self._lock = threading.Lock()
+        self._dispatch_lock = threading.RLock()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+        self._last_report = 0.0
+
+    def route(self, logger_name: str, handlers: List[logging.Handler]) -> None:
+        """Set the handlers for a logger, closing the ones they replace"""
+        with self._dispatch_lock:
+            previous = self.routes.get(logger_name, [])
+            self.routes[logger_name] = handlers
+        for handler in previous:
+            handler.close()
+
+    def submit(self, record: logging.LogRecord, route: str) -> None:
+        """
+        Enqueue a record (called on the logging thread)
+
+        Args:
+            record: Record to write
+            route: Name of the ArtemisLogger whose handlers write it (differs
+                from record.name for records propagated from child loggers)
+        """
+        if record.levelno <= logging.DEBUG and not self.rate_limiter.allow(route):
+            self._count(self.suppressed, route)
+            return
+
+        # Render now: args may reference objects that change before the writer runs
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+
+        item = (route, record)
+        # Records logged by handlers on the writer itself must not wait on its own queue
+        if self._stopped or threading.current_thread() is self._thread:
+            self._write([item])
+            return
+
+        self._ensure_worker()
+        if record.levelno >= logging.ERROR:
+            self.queue.put(item)
+            return
+        try:
+            self.queue.put_nowait(item)
+        except queue.Full:
+            self._count(self.dropped, route)
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Wait until every record queued so far is written
+
+        Returns:
+            True if drained within the timeout
+        """
+        if self._thread is None or not self._thread.is_alive():
+            self._drain()
+            return True
+        request = _FlushRequest()
+        self.queue.put(request)
+        return request.done.wait(timeout)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Stop the writer after writing everything queued; later records are written synchronously"""
+        if self._stopped:
+            return
+        self._stopped = True
+        if self._thread is not None and self._thread.is_alive():
+            self.queue.put(_STOP)
+            self._thread.join(timeout)
+        self._drain()
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            'queued': self.queue.qsize(),
+            'suppressed': dict(self.suppressed),
+            'dropped': dict(self.dropped)
+        }
+
+    def after_fork_in_child(self) -> None:
+        """The writer thread does not survive fork(); start over in the child"""
+        self._reset_runtime()
+
+    def _ensure_worker(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name='artemis-log-writer', daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < LOG_BATCH_SIZE:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = _STOP in batch
+            self._write([item for item in batch if item is not _STOP])
+            if stop:
+                return
+
+    def _drain(self) -> None:
+        batch = []
+        while True:
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                batch.append(item)
+        self._write(batch)
+
+    def _write(self, batch: list) -> None:
+        with self._dispatch_lock:
+            touched: Dict[int, logging.Handler] = {}
+            for item in batch:
+                if isinstance(item, _FlushRequest):
+                    self._flush_handlers(touched)
+                    item.done.set()
+                    continue
+                self._dispatch(*item, touched)
+            self._report_losses(touched)
+            self._flush_handlers(touched)
+
+    def _dispatch(self, route: str, record: logging.LogRecord, touched: Dict[int, logging.Handler]) -> None:
+        for handler in self.routes.get(route, ()):
+            if record.levelno < handler.level:
+                continue
+            handler.handle(record)
+            touched[id(handler)] = handler
+
+    def _flush_handlers(self, touched: Dict[int, logging.Handler]) -> None:
+        for handler in touched.values():
+            flush = getattr(handler, 'flush_batch', handler.flush)
+            try:
+                flush()
+            except Exception:
+                handler.handleError(None)
+        touched.clear()
+
+    def _report_losses(self, touched: Dict[int, logging.Handler]) -> None:
+        now = time.monotonic()
+        if now - self._last_report < SUPPRESSION_REPORT_INTERVAL_SECONDS:
+            return
+        self._last_report = now
+        for counts, reason in ((self.suppressed, 'DEBUG records rate-limited'), (self.dropped, 'records dropped (log queue full)')):
+            with self._lock:
+                pending = dict(counts)
+                counts.clear()
+            for route, count in pending.items():
+                record = logging.LogRecord(route, logging.WARNING, __file__, 0, f'{count} {reason}', None, None)
+                self._dispatch(route, record, touched)
+
+    def _count(self, counts: Dict[str, int], name: str) -> None:
+        with self._lock:
+            counts[name] = counts.get(name, 0) + 1
+
+
+class QueueingHandler(logging.Handler):
+    """Hands records to the LogPipeline instead of writing them"""
+
+    def __init__(self, pipeline: LogPipeline, route: str):
+        super().__init__()
+        self.pipeline = pipeline
+        self.route = route
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.pipeline.submit(record, self.route)
+        except Exception:
+            self.handleError(record)
+
+
+_pipeline: Optional[LogPipeline] = None
+_pipeline_lock = threading.Lock()
+
+
+def get_log_pipeline() -> LogPipeline:
+    """
+    Shared log pipeline (created on first use).
+
+    Side effects:
+        Registers atexit shutdown, an excepthook flush and a fork handler once.
+    """
+    global _pipeline
+    if _pipeline is not None:
+        return _pipeline
+    with _pipeline_lock:
+        if _pipeline is None:
+            _pipeline = LogPipeline(
+                maxsize=int(os.getenv('ARTEMIS_LOG_QUEUE_SIZE', '10000')),
+                debug_rate=float(os.getenv('ARTEMIS_LOG_DEBUG_RATE', '100'))
+            )
+            atexit.register(shutdown_logging)
+            _install_crash_flush()
+            if hasattr(os, 'register_at_fork'):
+                os.register_at_fork(after_in_child=_pipeline.after_fork_in_child)
+    return _pipeline
+
+
+def _install_crash_flush() -> None:
+    """Write queued records before the interpreter reports an uncaught exception"""
+    previous_hook = sys.excepthook
+
+    def flush_then_report(exc_type, exc_value, exc_traceback):
+        flush_logs()
+        previous_hook(exc_type, exc_value, exc_traceback)
+
+    sys.excepthook = flush_then_report
+
+
+def flush_logs(timeout: float = 5.0) -> bool:
+    """
+    Block until all queued log records are written.
+
+    Returns:
+        True if the queue drained within the timeout
+    """
+    if _pipeline is None:
+        return True
+    return _pipeline.flush(timeout)
+
+
+def shutdown_logging(timeout: float = 5.0) -> None:
+    """Drain the queue and stop the background writer (registered with atexit)"""
+    if _pipeline is None:
+        return
+    _pipeline.shutdown(timeout)
+
 
 class ArtemisLogger:
     """
@@ -83,6 +438,7 @@ class ArtemisLogger:
             ARTEMIS_LOG_LEVEL: Override default log level
             ARTEMIS_LOG_MAX_SIZE_MB: Override max log file size in MB
             ARTEMIS_LOG_BACKUP_COUNT: Override backup file count
+            ARTEMIS_LOG_ASYNC / ARTEMIS_LOG_FORMAT: See module docstring
 
         Raises:
             None - Fallback mechanisms prevent initialization failures
@@ -107,6 +463,8 @@ class ArtemisLogger:
             backup_count = int(env_backup)
         self.max_bytes = max_bytes
         self.backup_count = backup_count
+        self.async_enabled = os.getenv('ARTEMIS_LOG_ASYNC', 'true').lower() == 'true'
+        self.json_output = os.getenv('ARTEMIS_LOG_FORMAT', '').lower() == 'json'
         self.logger = self._setup_logger()
 
     def _setup_logger(self) -> logging.Logger:
@@ -126,6 +484,8 @@ class ArtemisLogger:
             - Creates RotatingFileHandler for error log
             - Creates StreamHandler for console output
             - Removes any existing handlers to prevent duplicates
+            - In async mode, routes the three handlers through the shared
+              LogPipeline and attaches only a QueueingHandler to the logger
 
         Design decisions:
             - Three handlers provide flexibility: component log, error log, console
@@ -143,22 +503,31 @@ class ArtemisLogger:
         logger = logging.getLogger(f'artemis.{self.component}')
         logger.setLevel(self.log_level)
         logger.handlers = []
-        detailed_formatter = logging.Formatter(fmt='%(asctime)s [%(levelname)s] [%(name)s] %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+        if self.json_output:
+            detailed_formatter = JsonFormatter()
+        else:
+            detailed_formatter = logging.Formatter(fmt='%(asctime)s [%(levelname)s] [%(name)s] %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+        file_handler_class = BatchedRotatingFileHandler if self.async_enabled else logging.handlers.RotatingFileHandler
         main_log_file = self.log_dir / f'artemis_{self.component}.log'
-        main_handler = logging.handlers.RotatingFileHandler(main_log_file, maxBytes=self.max_bytes, backupCount=self.backup_count)
+        main_handler = file_handler_class(main_log_file, maxBytes=self.max_bytes, backupCount=self.backup_count)
         main_handler.setLevel(self.log_level)
         main_handler.setFormatter(detailed_formatter)
-        logger.addHandler(main_handler)
         error_log_file = self.log_dir / 'artemis_errors.log'
-        error_handler = logging.handlers.RotatingFileHandler(error_log_file, maxBytes=self.max_bytes, backupCount=self.backup_count)
+        error_handler = file_handler_class(error_log_file, maxBytes=self.max_bytes, backupCount=self.backup_count)
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(detailed_formatter)
-        logger.addHandler(error_handler)
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(self.log_level)
         console_formatter = logging.Formatter(fmt='[%(levelname)s] %(message)s')
         console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
+        handlers = [main_handler, error_handler, console_handler]
+        if not self.async_enabled:
+            for handler in handlers:
+                logger.addHandler(handler)
+            return logger
+        pipeline = get_log_pipeline()
+        pipeline.route(logger.name, handlers)
+        logger.addHandler(QueueingHandler(pipeline, logger.name))
         return logger
 
     def debug(self, message: str):
@@ -258,6 +627,17 @@ class ArtemisLogger:
             return
         self.info(message)
 
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Wait until this process's queued records are on disk.
+
+        Why needed: Tests and tools that read log files right after logging.
+
+        Returns:
+            True if the queue drained within the timeout
+        """
+        return flush_logs(timeout)
+
     def get_log_path(self) -> Path:
         """
         Get the path to the main log file.
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+Artemis Artifact Retention - standalone maintenance command
+
+WHY: Enforce artifact size and age budgets outside of a pipeline run
+     (cron, CI cleanup, before a large batch).
+RESPONSIBILITY: Command-line entry point for utilities.retention
+
+Usage:
+    python artemis_retention.py --dry-run
+    python artemis_retention.py --class checkpoints --class state
+    python artemis_retention.py --active-card card-123 --json
+"""
+
+import sys
+
+from utilities.retention import main
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,7 +4,7 @@ logger = get_logger('intent_detector')
 import json
 import re
 from typing import Dict, Any
-from llm_client import LLMMessage, LLMClient
+from llm_client import LLMMessage, LLMClient, LLMClientFactory
 from chat.models import ChatContext
 
 class IntentDetector:
@@ -24,7 +24,8 @@ class IntentDetector:
             llm_client: LLM client for classification
             verbose: Enable verbose logging
         """
-        self.llm_client = llm_client
+        # Intent labels rarely need the strongest model: cascade from a cheaper one
+        self.llm_client = LLMClientFactory.create_cascade('classification', client=llm_client)
         self.verbose = verbose
 
     def detect_intent(self, message: str, context: ChatContext) -> Dict[str, Any]:
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Module: compliance_engine
+
+WHY: WCAG and GDPR evaluation each walked the implementation directory, read
+     every file and ran one regex pass per rule - label and aria-labelledby
+     checks even re-searched the whole file once per element. On a large
+     frontend the UI/UX stage spent minutes re-scanning the same text.
+RESPONSIBILITY: Read each UI/code file once, tokenize markup once into an
+                index, run all WCAG and GDPR rules against it, cache results
+                by content hash and spread files over a process pool
+PATTERNS: Single-pass event scanner (html.parser), Shared index,
+          Memoization (content-hash cache), Guard Clauses
+
+Architecture:
+    - MarkupIndex: Elements and id/label indexes gathered in one parse
+    - ParsedFile: Path, content and (for markup files) its MarkupIndex
+    - ComplianceEngine: Directory walk, cache lookup, parallel evaluation
+    - ComplianceReport: WCAG and GDPR issues for one directory
+
+Usage:
+    report = ComplianceEngine().evaluate_directory(implementation_dir)
+    wcag = WCAGEvaluator().evaluate_directory(implementation_dir, report=report)
+    gdpr = GDPREvaluator().evaluate_directory(implementation_dir, report=report)
+"""
+
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+WCAG_SUFFIXES = frozenset({".html", ".jsx", ".tsx", ".vue"})
+GDPR_SUFFIXES = frozenset({".js", ".jsx", ".ts", ".tsx", ".py", ".html"})
+RULE_SET_SUFFIXES = {"wcag": WCAG_SUFFIXES, "gdpr": GDPR_SUFFIXES}
+
+DEFAULT_PARALLEL_THRESHOLD = 16
+MAX_CACHED_FILES = 4096
+HEADING_TAG = re.compile(r"^h([1-6])$")
+
+Attrs = Dict[str, Optional[str]]
+
+
+# ============================================================================
+# Single-pass markup scanning
+# ============================================================================
+
+@dataclass
+class MarkupIndex:
+    """Elements and lookups collected in one pass over a markup file"""
+    images: List[Tuple[Attrs, str]] = field(default_factory=list)
+    inputs: List[Tuple[Attrs, str]] = field(default_factory=list)
+    empty_buttons: List[Tuple[Attrs, str]] = field(default_factory=list)
+    headings: List[int] = field(default_factory=list)
+    text_links: List[Tuple[str, str]] = field(default_factory=list)
+    html_tags: List[Tuple[Attrs, str]] = field(default_factory=list)
+    labelledby_refs: List[str] = field(default_factory=list)
+    ids: Set[str] = field(default_factory=set)
+    label_targets: Set[str] = field(default_factory=set)
+
+
+class _MarkupScanner(HTMLParser):
+    """
+    Feeds html.parser events into a MarkupIndex.
+
+    WHY: One tokenizer pass replaces a regex pass per rule; id and label
+         sets turn per-element lookups into O(1) membership tests.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.index = MarkupIndex()
+        self._button: Optional[Dict[str, Any]] = None
+        self._link: Optional[Dict[str, Any]] = None
+
+        # Dispatch table: tag -> element handler
+        self._start_handlers = {
+            "img": lambda attrs, raw: self.index.images.append((attrs, raw)),
+            "input": lambda attrs, raw: self.index.inputs.append((attrs, raw)),
+            "html": lambda attrs, raw: self.index.html_tags.append((attrs, raw)),
+            "button": self._open_button,
+            "a": self._open_link,
+        }
+
+    def handle_starttag(self, tag: str, attr_list: List[Tuple[str, Optional[str]]]) -> None:
+        attrs = dict(attr_list)
+        raw = self.get_starttag_text() or f"<{tag}>"
+
+        # Any child element means the button/link is not a plain-text one
+        for open_element in (self._button, self._link):
+            if open_element is not None:
+                open_element["has_children"] = True
+
+        self._index_references(tag, attrs)
+
+        heading = HEADING_TAG.match(tag)
+        if heading:
+            self.index.headings.append(int(heading.group(1)))
+
+        handler = self._start_handlers.get(tag)
+        if handler:
+            handler(attrs, raw)
+
+    def _index_references(self, tag: str, attrs: Attrs) -> None:
+        if attrs.get("id"):
+            self.index.ids.add(attrs["id"])
+        if attrs.get("aria-labelledby"):
+            self.index.labelledby_refs.append(attrs["aria-labelledby"])
+        if tag != "label":
+            return
+        # JSX spells the attribute htmlFor
+        target = attrs.get("for") or attrs.get("htmlfor")
+        if target:
+            self.index.label_targets.add(target)
+
+    def _open_button(self, attrs: Attrs, raw: str) -> None:
+        self._button = {"attrs": attrs, "raw": raw, "text": [], "has_children": False}
+
+    def _open_link(self, attrs: Attrs, raw: str) -> None:
+        self._link = {"raw": raw, "text": [], "has_children": False}
+
+    def handle_data(self, data: str) -> None:
+        for open_element in (self._button, self._link):
+            if open_element is not None:
+                open_element["text"].append(data)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "button" and self._button is not None:
+            self._close_button()
+        if tag == "a" and self._link is not None:
+            self._close_link()
+
+    def _close_button(self) -> None:
+        button, self._button = self._button, None
+        text = "".join(button["text"])
+        if not button["has_children"] and not text.strip():
+            self.index.empty_buttons.append((button["attrs"], f"{button['raw']}{text}</button>"))
+
+    def _close_link(self) -> None:
+        link, self._link = self._link, None
+        text = "".join(link["text"])
+        if not link["has_children"] and text:
+            self.index.text_links.append((text, f"{link['raw']}{text}</a>"))
+
+
+def scan_markup(content: str) -> MarkupIndex:
+    """
+    Tokenize markup once and index what the accessibility rules need.
+
+    Args:
+        content: HTML/JSX/TSX/Vue source
+
+    Returns:
+        MarkupIndex (partial if the markup is too malformed to finish parsing)
+    """
+    scanner = _MarkupScanner()
+    try:
+        scanner.feed(content)
+        scanner.close()
+    except Exception:
+        pass  # Keep whatever was indexed before the parser gave up
+    return scanner.index
+
+
+@dataclass
+class ParsedFile:
+    """One file as the rules see it: read once, markup tokenized once"""
+    path: str
+    suffix: str
+    content: str
+    markup: Optional[MarkupIndex] = None
+
+    @classmethod
+    def from_content(cls, path: str, content: str) -> "ParsedFile":
+        suffix = Path(path).suffix
+        markup = scan_markup(content) if suffix in WCAG_SUFFIXES else None
+        return cls(path=path, suffix=suffix, content=content, markup=markup)
+
+
+# ============================================================================
+# Evaluation
+# ============================================================================
+
+@dataclass
+class FileResult:
+    """Rule findings for one file"""
+    wcag_issues: List[Any] = field(default_factory=list)
+    gdpr_issues: List[Any] = field(default_factory=list)
+
+
+@dataclass
+class ComplianceReport:
+    """WCAG and GDPR findings for one directory"""
+    wcag_issues: List[Any] = field(default_factory=list)
+    gdpr_issues: List[Any] = field(default_factory=list)
+    wcag_files: int = 0
+    gdpr_files: int = 0
+    cache_hits: int = 0
+    files_evaluated: int = 0
+
+
+def evaluate_source(path: str, content: str) -> FileResult:
+    """
+    Run every applicable rule set over one file.
+
+    WHY: Module-level so process pool workers can run it; both rule sets
+         share the single parse.
+    """
+    from gdpr_evaluator import GDPREvaluator
+    from wcag_evaluator import WCAGEvaluator
+
+    parsed = ParsedFile.from_content(path, content)
+    result = FileResult()
+    if parsed.suffix in WCAG_SUFFIXES:
+        result.wcag_issues = WCAGEvaluator().check_file(parsed)
+    if parsed.suffix in GDPR_SUFFIXES:
+        result.gdpr_issues = GDPREvaluator().check_file(parsed)
+    return result
+
+
+_RESULT_CACHE: "OrderedDict[Tuple[str, str, bool], FileResult]" = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+
+
+def _cache_key(path: str, content: str) -> Tuple[str, str, bool]:
+    """
+    Content hash plus the path facts rules depend on.
+
+    WHY: Issues never mention the file path, except that GDPR treats
+         backend/API files differently - so that flag is part of the key.
+    """
+    from gdpr_evaluator import GDPREvaluator
+
+    digest = hashlib.sha256(content.encode("utf-8", "surrogatepass")).hexdigest()
+    return digest, Path(path).suffix, GDPREvaluator.is_backend_path(path)
+
+
+def clear_cache() -> None:
+    """Drop all cached file results"""
+    with _CACHE_LOCK:
+        _RESULT_CACHE.clear()
+
+
+class ComplianceEngine:
+    """
+    Evaluates a directory against all WCAG and GDPR rules in one pass.
+
+    Files are read once; unchanged files (same content hash) reuse earlier
+    results; directories with many changed files fan out to a process pool.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, parallel_threshold: int = DEFAULT_PARALLEL_THRESHOLD):
+        """
+        Args:
+            max_workers: Process pool size (default ARTEMIS_UIUX_WORKERS or CPU count)
+            parallel_threshold: Changed files needed before using the pool
+        """
+        self.max_workers = max_workers or int(os.getenv("ARTEMIS_UIUX_WORKERS", os.cpu_count() or 1))
+        self.parallel_threshold = parallel_threshold
+
+    def evaluate_directory(self, implementation_dir: str, rule_sets: Iterable[str] = ("wcag", "gdpr")) -> ComplianceReport:
+        """
+        Evaluate every UI/code file under a directory.
+
+        Args:
+            implementation_dir: Directory to scan
+            rule_sets: "wcag" and/or "gdpr" - which files to include (a file
+                       eligible for both is always evaluated for both)
+
+        Returns:
+            ComplianceReport (empty if the directory does not exist)
+        """
+        report = ComplianceReport()
+        impl_path = Path(implementation_dir)
+
+        # Guard clause: nothing to scan
+        if not impl_path.exists():
+            return report
+
+        suffixes = frozenset().union(*(RULE_SET_SUFFIXES[name] for name in rule_sets))
+        sources = self._read_sources(impl_path, suffixes)
+        report.wcag_files = sum(1 for path, _ in sources if Path(path).suffix in WCAG_SUFFIXES)
+        report.gdpr_files = sum(1 for path, _ in sources if Path(path).suffix in GDPR_SUFFIXES)
+
+        results, misses = self._lookup_cached(sources)
+        report.cache_hits = len(sources) - len(misses)
+        report.files_evaluated = len(misses)
+        for (path, content), result in zip(misses, self._evaluate_sources(misses)):
+            self._store_cached(path, content, result)
+            results[path] = result
+
+        for path, _ in sources:
+            report.wcag_issues.extend(results[path].wcag_issues)
+            report.gdpr_issues.extend(results[path].gdpr_issues)
+        return report
+
+    def _read_sources(self, impl_path: Path, suffixes: frozenset) -> List[Tuple[str, str]]:
+        """Read each matching file once (one directory walk, stable order)"""
+        sources = []
+        for file_path in sorted(impl_path.rglob("*")):
+            if file_path.suffix not in suffixes or not file_path.is_file():
+                continue
+            try:
+                sources.append((str(file_path), file_path.read_text(encoding="utf-8")))
+            except Exception:
+                continue  # Skip files that can't be read
+        return sources
+
+    def _lookup_cached(self, sources: List[Tuple[str, str]]) -> Tuple[Dict[str, FileResult], List[Tuple[str, str]]]:
+        results: Dict[str, FileResult] = {}
+        misses = []
+        with _CACHE_LOCK:
+            for path, content in sources:
+                key = _cache_key(path, content)
+                if key in _RESULT_CACHE:
+                    _RESULT_CACHE.move_to_end(key)
+                    results[path] = _RESULT_CACHE[key]
+                    continue
+                misses.append((path, content))
+        return results, misses
+
+    def _store_cached(self, path: str, content: str, result: FileResult) -> None:
+        with _CACHE_LOCK:
+            _RESULT_CACHE[_cache_key(path, content)] = result
+            while len(_RESULT_CACHE) > MAX_CACHED_FILES:
+                _RESULT_CACHE.popitem(last=False)
+
+    def _evaluate_sources(self, sources: List[Tuple[str, str]]) -> List[FileResult]:
+        # Guard clause: pool start-up costs more than it saves on a few files
+        if len(sources) < self.parallel_threshold or self.max_workers <= 1:
+            return [evaluate_source(path, content) for path, content in sources]
+
+        paths, contents = zip(*sources)
+        chunksize = max(1, len(sources) // (self.max_workers * 4))
+        try:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                return list(pool.map(evaluate_source, paths, contents, chunksize=chunksize))
+        except (OSError, RuntimeError):
+            # No process support (e.g. restricted sandbox) - evaluate in-process
+            return [evaluate_source(path, content) for path, content in sources]
@@ -16,9 +16,23 @@ DEFAULT_DEVELOPER_A_DIR = DEFAULT_DATA_DIR / 'developer_output' / 'developer-a'
 DEFAULT_DEVELOPER_B_DIR = DEFAULT_DATA_DIR / 'developer_output' / 'developer-b'
 DEFAULT_RAG_DB_PATH = DEFAULT_DATA_DIR / 'rag_db'
 DEFAULT_CHECKPOINT_DIR = DEFAULT_DATA_DIR / 'checkpoints'
+TEST_DURATIONS_PATH = Path(os.environ.get('ARTEMIS_TEST_DURATIONS_PATH', DEFAULT_DATA_DIR / 'test_durations.json'))
+RETENTION_ARCHIVE_DIR = Path(os.environ.get('ARTEMIS_RETENTION_ARCHIVE_DIR', DEFAULT_DATA_DIR / 'archive'))
+RETENTION_MIN_AGE_SECONDS = int(os.environ.get('ARTEMIS_RETENTION_MIN_AGE_SECONDS', '3600'))
+RETENTION_INLINE_ENABLED = os.environ.get('ARTEMIS_RETENTION_INLINE', 'true').lower() == 'true'
+EXECUTION_STATS_DB_PATH = Path(os.environ.get('ARTEMIS_EXECUTION_STATS_DB', DEFAULT_DATA_DIR / 'execution_stats.db'))
+EXECUTION_STATS_MIN_SAMPLES = int(os.environ.get('ARTEMIS_EXECUTION_STATS_MIN_SAMPLES', '5'))
+DOCUMENT_CACHE_DIR = Path(os.environ.get('ARTEMIS_DOCUMENT_CACHE_DIR', DEFAULT_DATA_DIR / 'document_cache'))
+DOCUMENT_CACHE_ENABLED = os.environ.get('ARTEMIS_DOCUMENT_CACHE', 'true').lower() == 'true'
+DOCUMENT_PARSE_WORKERS = int(os.environ.get('ARTEMIS_DOCUMENT_PARSE_WORKERS', str(min(4, os.cpu_count() or 1))))
+DOCUMENT_PARSE_MEMORY_MB = int(os.environ.get('ARTEMIS_DOCUMENT_PARSE_MEMORY_MB', '1024'))
+DOCUMENT_PARALLEL_MIN_PAGES = int(os.environ.get('ARTEMIS_DOCUMENT_PARALLEL_MIN_PAGES', '32'))
 DEFAULT_RETRY_INTERVAL_SECONDS = 5
 MAX_RETRY_ATTEMPTS = 3
 RETRY_BACKOFF_FACTOR = 2
+RETRY_MAX_DELAY_SECONDS = 30.0
+RETRY_BUDGET_CAPACITY = int(os.environ.get('ARTEMIS_RETRY_BUDGET_CAPACITY', '10'))
+RETRY_BUDGET_REFILL_PER_SECOND = float(os.environ.get('ARTEMIS_RETRY_BUDGET_REFILL_PER_SECOND', '0.5'))
 LLM_REQUEST_TIMEOUT_SECONDS = 300
 LLM_STREAM_TIMEOUT_SECONDS = 600
 DEVELOPER_AGENT_TIMEOUT_SECONDS = 3600
@@ -32,6 +46,7 @@ DEFAULT_LLM_PROVIDER = 'openai'
 DEFAULT_LLM_MODEL = 'gpt-5'
 DEFAULT_LLM_TEMPERATURE = 0.7
 DEFAULT_LLM_MAX_TOKENS = 4000
+LLM_CASCADE_ENABLED = os.environ.get('ARTEMIS_LLM_CASCADE', 'true').lower() == 'true'
 DEFAULT_COST_LIMIT_USD = 100.0
 COST_WARNING_THRESHOLD_USD = 75.0
 DEFAULT_REQUESTS_PER_MINUTE = 10
@@ -46,6 +61,7 @@ STAGE_INTEGRATION = 'integration'
 STAGE_TESTING = 'testing'
 DEFAULT_PIPELINE_STAGES = [STAGE_PROJECT_ANALYSIS, STAGE_ARCHITECTURE, STAGE_DEPENDENCIES, STAGE_DEVELOPMENT, STAGE_CODE_REVIEW, STAGE_VALIDATION, STAGE_INTEGRATION, STAGE_TESTING]
 MAX_PARALLEL_DEVELOPERS = 2
+TEST_CPU_BUDGET = int(os.environ.get('ARTEMIS_TEST_CPU_BUDGET', str(os.cpu_count() or 1)))
 DEFAULT_ENABLE_SUPERVISION = True
 DEFAULT_ENABLE_CHECKPOINTS = True
 CODE_REVIEW_PASSING_SCORE = 70
@@ -239,4 +255,4 @@ if __name__ == '__main__':
         
         logger.log(f'❌ Configuration error: {e}', 'INFO')
         exit(1)
-__all__ = ['REPO_ROOT', 'AGENTS_DIR', 'AGILE_DIR', 'KANBAN_BOARD_PATH', 'DEVELOPER_A_PROMPT_PATH', 'DEVELOPER_B_PROMPT_PATH', 'PYTEST_PATH', 'DEFAULT_DATA_DIR', 'DEFAULT_OUTPUT_DIR', 'DEFAULT_DEVELOPER_A_DIR', 'DEFAULT_DEVELOPER_B_DIR', 'DEFAULT_RAG_DB_PATH', 'DEFAULT_CHECKPOINT_DIR', 'DEFAULT_RETRY_INTERVAL_SECONDS', 'MAX_RETRY_ATTEMPTS', 'RETRY_BACKOFF_FACTOR', 'LLM_REQUEST_TIMEOUT_SECONDS', 'LLM_STREAM_TIMEOUT_SECONDS', 'DEVELOPER_AGENT_TIMEOUT_SECONDS', 'CODE_REVIEW_TIMEOUT_SECONDS', 'STAGE_TIMEOUT_SECONDS', 'FULL_PIPELINE_TIMEOUT_SECONDS', 'MAX_LLM_PROMPT_LENGTH', 'MAX_LLM_RESPONSE_LENGTH', 'MAX_CONTEXT_TOKENS', 'DEFAULT_LLM_PROVIDER', 'DEFAULT_LLM_MODEL', 'DEFAULT_LLM_TEMPERATURE', 'DEFAULT_LLM_MAX_TOKENS', 'DEFAULT_COST_LIMIT_USD', 'COST_WARNING_THRESHOLD_USD', 'DEFAULT_REQUESTS_PER_MINUTE', 'DEFAULT_REQUESTS_PER_HOUR', 'STAGE_PROJECT_ANALYSIS', 'STAGE_ARCHITECTURE', 'STAGE_DEPENDENCIES', 'STAGE_DEVELOPMENT', 'STAGE_CODE_REVIEW', 'STAGE_VALIDATION', 'STAGE_INTEGRATION', 'STAGE_TESTING', 'DEFAULT_PIPELINE_STAGES', 'MAX_PARALLEL_DEVELOPERS', 'DEFAULT_ENABLE_SUPERVISION', 'DEFAULT_ENABLE_CHECKPOINTS', 'CODE_REVIEW_PASSING_SCORE', 'CODE_REVIEW_WARNING_SCORE', 'MAX_CODE_REVIEW_RETRIES', 'REVIEW_CATEGORY_SECURITY', 'REVIEW_CATEGORY_QUALITY', 'REVIEW_CATEGORY_PERFORMANCE', 'REVIEW_CATEGORY_MAINTAINABILITY', 'KANBAN_COLUMN_BACKLOG', 'KANBAN_COLUMN_IN_PROGRESS', 'KANBAN_COLUMN_REVIEW', 'KANBAN_COLUMN_DONE', 'KANBAN_WIP_LIMIT_IN_PROGRESS', 'KANBAN_WIP_LIMIT_REVIEW', 'PRIORITY_HIGH', 'PRIORITY_MEDIUM', 'PRIORITY_LOW', 'DEFAULT_RAG_COLLECTION_NAME', 'RAG_SIMILARITY_TOP_K', 'RAG_SIMILARITY_THRESHOLD', 'ARTIFACT_TYPE_PROJECT_ANALYSIS', 'ARTIFACT_TYPE_ARCHITECTURE', 'ARTIFACT_TYPE_CODE', 'ARTIFACT_TYPE_TEST', 'ARTIFACT_TYPE_REVIEW', 'ARTIFACT_TYPE_ADR', 'SUPERVISOR_CONFIDENCE_THRESHOLD', 'SUPERVISOR_MAX_INTERVENTIONS', 'STATE_IDLE', 'STATE_PLANNING', 'STATE_EXECUTING', 'STATE_REVIEWING', 'STATE_FAILED', 'STATE_COMPLETED', 'PYTHON_FILE_PATTERN', 'JAVASCRIPT_FILE_PATTERN', 'TYPESCRIPT_FILE_PATTERN', 'TEST_FILE_PATTERN', 'EXCLUDE_PATTERNS', 'LOG_LEVEL_DEBUG', 'LOG_LEVEL_INFO', 'LOG_LEVEL_WARNING', 'LOG_LEVEL_ERROR', 'DEFAULT_LOG_LEVEL', 'LOG_FORMAT_SIMPLE', 'LOG_FORMAT_DETAILED', 'LOG_FORMAT_JSON', 'DEFAULT_MEMGRAPH_HOST', 'DEFAULT_MEMGRAPH_PORT', 'DEFAULT_MEMGRAPH_LAB_PORT', 'DEFAULT_REDIS_HOST', 'DEFAULT_REDIS_PORT', 'DEFAULT_REDIS_DB', 'MIN_STORY_POINTS', 'MAX_STORY_POINTS', 'MAX_CYCLOMATIC_COMPLEXITY', 'MAX_FUNCTION_LENGTH_LINES', 'MAX_FILE_LENGTH_LINES', 'MAX_METHOD_PARAMETERS', 'MIN_TEST_COVERAGE_PERCENT', 'MIN_TESTS_PER_FEATURE', 'get_developer_prompt_path', 'get_developer_output_dir', 'ensure_directory_exists', 'validate_config']
\ No newline at end of file
+__all__ = ['REPO_ROOT', 'AGENTS_DIR', 'AGILE_DIR', 'KANBAN_BOARD_PATH', 'DEVELOPER_A_PROMPT_PATH', 'DEVELOPER_B_PROMPT_PATH', 'PYTEST_PATH', 'DEFAULT_DATA_DIR', 'DEFAULT_OUTPUT_DIR', 'DEFAULT_DEVELOPER_A_DIR', 'DEFAULT_DEVELOPER_B_DIR', 'DEFAULT_RAG_DB_PATH', 'DEFAULT_CHECKPOINT_DIR', 'TEST_DURATIONS_PATH', 'RETENTION_ARCHIVE_DIR', 'RETENTION_MIN_AGE_SECONDS', 'RETENTION_INLINE_ENABLED', 'EXECUTION_STATS_DB_PATH', 'EXECUTION_STATS_MIN_SAMPLES', 'DOCUMENT_CACHE_DIR', 'DOCUMENT_CACHE_ENABLED', 'DOCUMENT_PARSE_WORKERS', 'DOCUMENT_PARSE_MEMORY_MB', 'DOCUMENT_PARALLEL_MIN_PAGES', 'DEFAULT_RETRY_INTERVAL_SECONDS', 'MAX_RETRY_ATTEMPTS', 'RETRY_BACKOFF_FACTOR', 'RETRY_MAX_DELAY_SECONDS', 'RETRY_BUDGET_CAPACITY', 'RETRY_BUDGET_REFILL_PER_SECOND', 'LLM_REQUEST_TIMEOUT_SECONDS', 'LLM_STREAM_TIMEOUT_SECONDS', 'DEVELOPER_AGENT_TIMEOUT_SECONDS', 'CODE_REVIEW_TIMEOUT_SECONDS', 'STAGE_TIMEOUT_SECONDS', 'FULL_PIPELINE_TIMEOUT_SECONDS', 'MAX_LLM_PROMPT_LENGTH', 'MAX_LLM_RESPONSE_LENGTH', 'MAX_CONTEXT_TOKENS', 'DEFAULT_LLM_PROVIDER', 'DEFAULT_LLM_MODEL', 'DEFAULT_LLM_TEMPERATURE', 'DEFAULT_LLM_MAX_TOKENS', 'LLM_CASCADE_ENABLED', 'DEFAULT_COST_LIMIT_USD', 'COST_WARNING_THRESHOLD_USD', 'DEFAULT_REQUESTS_PER_MINUTE', 'DEFAULT_REQUESTS_PER_HOUR', 'STAGE_PROJECT_ANALYSIS', 'STAGE_ARCHITECTURE', 'STAGE_DEPENDENCIES', 'STAGE_DEVELOPMENT', 'STAGE_CODE_REVIEW', 'STAGE_VALIDATION', 'STAGE_INTEGRATION', 'STAGE_TESTING', 'DEFAULT_PIPELINE_STAGES', 'MAX_PARALLEL_DEVELOPERS', 'TEST_CPU_BUDGET', 'DEFAULT_ENABLE_SUPERVISION', 'DEFAULT_ENABLE_CHECKPOINTS', 'CODE_REVIEW_PASSING_SCORE', 'CODE_REVIEW_WARNING_SCORE', 'MAX_CODE_REVIEW_RETRIES', 'REVIEW_CATEGORY_SECURITY', 'REVIEW_CATEGORY_QUALITY', 'REVIEW_CATEGORY_PERFORMANCE', 'REVIEW_CATEGORY_MAINTAINABILITY', 'KANBAN_COLUMN_BACKLOG', 'KANBAN_COLUMN_IN_PROGRESS', 'KANBAN_COLUMN_REVIEW', 'KANBAN_COLUMN_DONE', 'KANBAN_WIP_LIMIT_IN_PROGRESS', 'KANBAN_WIP_LIMIT_REVIEW', 'PRIORITY_HIGH', 'PRIORITY_MEDIUM', 'PRIORITY_LOW', 'DEFAULT_RAG_COLLECTION_NAME', 'RAG_SIMILARITY_TOP_K', 'RAG_SIMILARITY_THRESHOLD', 'ARTIFACT_TYPE_PROJECT_ANALYSIS', 'ARTIFACT_TYPE_ARCHITECTURE', 'ARTIFACT_TYPE_CODE', 'ARTIFACT_TYPE_TEST', 'ARTIFACT_TYPE_REVIEW', 'ARTIFACT_TYPE_ADR', 'SUPERVISOR_CONFIDENCE_THRESHOLD', 'SUPERVISOR_MAX_INTERVENTIONS', 'STATE_IDLE', 'STATE_PLANNING', 'STATE_EXECUTING', 'STATE_REVIEWING', 'STATE_FAILED', 'STATE_COMPLETED', 'PYTHON_FILE_PATTERN', 'JAVASCRIPT_FILE_PATTERN', 'TYPESCRIPT_FILE_PATTERN', 'TEST_FILE_PATTERN', 'EXCLUDE_PATTERNS', 'LOG_LEVEL_DEBUG', 'LOG_LEVEL_INFO', 'LOG_LEVEL_WARNING', 'LOG_LEVEL_ERROR', 'DEFAULT_LOG_LEVEL', 'LOG_FORMAT_SIMPLE', 'LOG_FORMAT_DETAILED', 'LOG_FORMAT_JSON', 'DEFAULT_MEMGRAPH_HOST', 'DEFAULT_MEMGRAPH_PORT', 'DEFAULT_MEMGRAPH_LAB_PORT', 'DEFAULT_REDIS_HOST', 'DEFAULT_REDIS_PORT', 'DEFAULT_REDIS_DB', 'MIN_STORY_POINTS', 'MAX_STORY_POINTS', 'MAX_CYCLOMATIC_COMPLEXITY', 'MAX_FUNCTION_LENGTH_LINES', 'MAX_FILE_LENGTH_LINES', 'MAX_METHOD_PARAMETERS', 'MIN_TEST_COVERAGE_PERCENT', 'MIN_TESTS_PER_FEATURE', 'get_developer_prompt_path', 'get_developer_output_dir', 'ensure_directory_exists', 'validate_config']
\ No newline at end of file
@@ -119,6 +119,12 @@ from core.exceptions.filesystem import (
     FileReadError,
 )
 
+# Git exceptions
+from core.exceptions.git import (
+    GitOperationError,
+    RepositoryNotFoundError,
+)
+
 # Analysis exceptions (ADR, Dependencies)
 from core.exceptions.analysis import (
     ProjectAnalysisException,
@@ -207,6 +213,10 @@ __all__ = [
     "FileWriteError",
     "FileReadError",
 
+    # Git
+    "GitOperationError",
+    "RepositoryNotFoundError",
+
     # Analysis
     "ProjectAnalysisException",
     "ADRGenerationError",
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Module: core/exceptions/git.py
+
+WHY: Git operations (init, clone, branch, commit, push, output sync) fail for
+     reasons unrelated to the pipeline stage that triggered them - missing
+     repositories, rejected pushes, merge conflicts. The git agent raises
+     these instead of generic pipeline errors.
+
+RESPONSIBILITY: Define git-specific exception types. Single Responsibility -
+                version control errors only.
+
+PATTERNS: Exception Hierarchy Pattern
+          - Hierarchy: GitOperationError base with repository-specific subtypes
+
+Integration: Used by git_agent_pkg (repository, branch, commit and remote
+             operations).
+"""
+
+from core.exceptions.base import ArtemisException
+
+
+class GitOperationError(ArtemisException):
+    """
+    A git command or git agent operation failed.
+
+    WHY: Lets callers catch every git failure (e.g. skip pushing and keep
+         the local commit) without catching unrelated errors.
+
+    Example context:
+        {"command": "push -u origin main", "stderr": "rejected"}
+    """
+    pass
+
+
+class RepositoryNotFoundError(GitOperationError):
+    """
+    Configured repository does not exist and may not be created.
+
+    WHY: Distinguishes configuration problems (wrong path, create_if_missing
+         disabled) from failing git commands.
+    """
+    pass
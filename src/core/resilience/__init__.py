@@ -14,12 +14,16 @@ Architecture:
         recovery_handler.py - Success/failure recording
         circuit_breaker_core.py - Main circuit breaker facade
         registry.py - Global circuit breaker registry
+        state_store.py - Shared breaker state (memory, SQLite, Redis)
+        adaptive_concurrency.py - AIMD limit on in-flight calls
 
 Key Concepts:
     - Three-state circuit: CLOSED → OPEN → HALF_OPEN → CLOSED
     - Failure counting and threshold detection
     - Timeout-based auto-recovery
     - Thread-safe state management
+    - Optional cross-process state (ARTEMIS_CIRCUIT_STORE=sqlite|redis)
+    - Adaptive (AIMD) concurrency limiting on latency spikes and 429s
     - Decorator and context manager support
 
 Usage:
@@ -46,12 +50,24 @@ Backward Compatibility:
 from core.resilience.models import (
     CircuitState,
     CircuitBreakerConfig,
-    CircuitBreakerOpenError
+    CircuitBreakerOpenError,
+    ConcurrencyLimitExceeded
 )
 from core.resilience.state_machine import StateMachine
 from core.resilience.failure_detector import FailureDetector
 from core.resilience.recovery_handler import RecoveryHandler
 from core.resilience.circuit_breaker_core import CircuitBreaker
+from core.resilience.state_store import (
+    CircuitStateStore,
+    InMemoryStateStore,
+    SQLiteStateStore,
+    RedisStateStore,
+    create_state_store_from_env
+)
+from core.resilience.adaptive_concurrency import (
+    AdaptiveConcurrencyLimiter,
+    is_throttle_error
+)
 
 # Registry and convenience functions
 from core.resilience.registry import (
@@ -68,11 +84,21 @@ __all__ = [
     "CircuitState",
     "CircuitBreakerConfig",
     "CircuitBreakerOpenError",
+    "ConcurrencyLimitExceeded",
     # Components
     "StateMachine",
     "FailureDetector",
     "RecoveryHandler",
     "CircuitBreaker",
+    # Shared state
+    "CircuitStateStore",
+    "InMemoryStateStore",
+    "SQLiteStateStore",
+    "RedisStateStore",
+    "create_state_store_from_env",
+    # Adaptive concurrency
+    "AdaptiveConcurrencyLimiter",
+    "is_throttle_error",
     # Registry
     "CircuitBreakerRegistry",
     "get_circuit_breaker",
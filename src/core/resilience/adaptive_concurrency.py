@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Module: core.resilience.adaptive_concurrency
+
+WHY: A circuit breaker only reacts once a provider is failing outright.
+     Before that, providers degrade: latency climbs and 429s appear, and a
+     fixed number of parallel LLM calls keeps pushing them over the edge.
+RESPONSIBILITY: Cap in-flight calls with a limit that shrinks on latency
+                spikes or throttling and grows back while calls are healthy
+PATTERNS: AIMD (additive increase, multiplicative decrease - as in TCP
+          congestion control), Context Manager, Decorator, Guard Clauses
+
+Architecture:
+    - AdaptiveConcurrencyLimiter: Condition-variable gate over in-flight calls
+    - Latency baseline: EWMA of healthy call latency; a call slower than
+      baseline * latency_tolerance (or an explicit target) counts as a spike
+    - is_throttle_error: Recognizes 429 / rate limit exceptions
+
+Design Decisions:
+    - Additive increase of increase_step / limit per healthy call, so the
+      limit grows by about increase_step per "window" of limit calls
+    - At most one decrease per cooldown, so a burst of slow completions
+      from the same congested moment halves the limit once, not N times
+    - The limit is per process; combine with a shared CircuitBreaker store
+      for cross-process outage detection
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from core.resilience.models import ConcurrencyLimitExceeded
+
+T = TypeVar('T')
+
+THROTTLE_STATUS_CODES = frozenset({429, 529})
+THROTTLE_MARKERS = ("429", "rate limit", "ratelimit", "too many requests", "overloaded")
+
+
+def is_throttle_error(error: BaseException) -> bool:
+    """
+    Check whether an exception means the provider is throttling us.
+
+    WHY: OpenAI/Anthropic SDKs, httpx and our own RateLimitExceeded all signal
+         throttling differently (status_code attribute, class name, message).
+    """
+    status = getattr(error, "status_code", None) or getattr(getattr(error, "response", None), "status_code", None)
+    if status in THROTTLE_STATUS_CODES:
+        return True
+
+    text = f"{type(error).__name__} {error}".lower()
+    return any(marker in text for marker in THROTTLE_MARKERS)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD limit on concurrent calls to one dependency (e.g. an LLM provider).
+
+    Usage:
+        limiter = AdaptiveConcurrencyLimiter("openai", initial_limit=8)
+
+        with limiter.slot():
+            response = client.complete(...)
+
+        # or
+        response = limiter.call(client.complete, messages)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        increase_step: float = 1.0,
+        decrease_factor: float = 0.5,
+        latency_target_seconds: Optional[float] = None,
+        latency_tolerance: float = 2.0,
+        warmup_samples: int = 5,
+        cooldown_seconds: float = 1.0,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize limiter.
+
+        Args:
+            name: Protected dependency name
+            initial_limit: Starting concurrency limit
+            min_limit: Floor for the limit
+            max_limit: Ceiling for the limit
+            increase_step: Limit growth per full window of healthy calls
+            decrease_factor: Multiplier applied on a spike or throttle
+            latency_target_seconds: Fixed spike threshold (None = adaptive baseline)
+            latency_tolerance: Spike when latency > baseline * tolerance
+            warmup_samples: Healthy calls before the adaptive baseline is trusted
+            cooldown_seconds: Minimum time between two decreases
+            logger: Logger instance
+        """
+        self.name = name
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.latency_target_seconds = latency_target_seconds
+        self.latency_tolerance = latency_tolerance
+        self.warmup_samples = warmup_samples
+        self.cooldown_seconds = cooldown_seconds
+        self.logger = logger or logging.getLogger(f"AdaptiveConcurrency.{name}")
+
+        self._limit = float(max(min_limit, min(initial_limit, max_limit)))
+        self._in_flight = 0
+        self._condition = threading.Condition()
+        self._baseline_latency: Optional[float] = None
+        self._samples = 0
+        self._last_decrease = 0.0
+        self.stats = {"calls": 0, "throttled": 0, "latency_spikes": 0, "decreases": 0, "rejected": 0}
+
+    @property
+    def limit(self) -> int:
+        """Current whole-number concurrency limit"""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    # ========================================================================
+    # Admission
+    # ========================================================================
+
+    def acquire(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait for a free slot.
+
+        Raises:
+            ConcurrencyLimitExceeded: If no slot frees up within timeout
+        """
+        with self._condition:
+            admitted = self._condition.wait_for(lambda: self._in_flight < self.limit, timeout)
+            if not admitted:
+                self.stats["rejected"] += 1
+                raise ConcurrencyLimitExceeded(
+                    f"Concurrency limit for '{self.name}' reached "
+                    f"({self._in_flight}/{self.limit} in flight)",
+                    context={"limiter": self.name, "limit": self.limit, "in_flight": self._in_flight}
+                )
+            self._in_flight += 1
+
+    def release(self, latency_seconds: float, error: Optional[BaseException] = None) -> None:
+        """
+        Free a slot and adapt the limit to how the call went.
+
+        Args:
+            latency_seconds: Call duration
+            error: Exception raised by the call, if any
+        """
+        with self._condition:
+            self._in_flight -= 1
+            self.stats["calls"] += 1
+            self._adapt(latency_seconds, error)
+            self._condition.notify_all()
+
+    @contextmanager
+    def slot(self, timeout: Optional[float] = None):
+        """Hold a slot for the duration of a block and record its outcome"""
+        self.acquire(timeout)
+        started = time.monotonic()
+        try:
+            yield self
+        except BaseException as e:
+            self.release(time.monotonic() - started, e)
+            raise
+        self.release(time.monotonic() - started)
+
+    def call(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """Execute func in a slot"""
+        with self.slot():
+            return func(*args, **kwargs)
+
+    def protect(self, func: Callable[..., T]) -> Callable[..., T]:
+        """Decorator form of call()"""
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> T:
+            return self.call(func, *args, **kwargs)
+        return wrapper
+
+    # ========================================================================
+    # AIMD
+    # ========================================================================
+
+    def _adapt(self, latency_seconds: float, error: Optional[BaseException]) -> None:
+        """Apply AIMD to one completed call (caller holds the condition lock)"""
+        # Guard clause: throttled - back off
+        if error is not None and is_throttle_error(error):
+            self.stats["throttled"] += 1
+            self._decrease("throttled")
+            return
+
+        # Guard clause: other errors say nothing about capacity (the breaker handles them)
+        if error is not None:
+            return
+
+        # Guard clause: latency spike - back off (and keep it out of the baseline)
+        if self._is_latency_spike(latency_seconds):
+            self.stats["latency_spikes"] += 1
+            self._decrease(f"latency {latency_seconds:.2f}s")
+            return
+
+        self._update_baseline(latency_seconds)
+        self._limit = min(float(self.max_limit), self._limit + self.increase_step / max(self._limit, 1.0))
+
+    def _is_latency_spike(self, latency_seconds: float) -> bool:
+        if self.latency_target_seconds is not None:
+            return latency_seconds > self.latency_target_seconds
+        if self._baseline_latency is None or self._samples < self.warmup_samples:
+            return False
+        return latency_seconds > self._baseline_latency * self.latency_tolerance
+
+    def _update_baseline(self, latency_seconds: float) -> None:
+        self._samples += 1
+        if self._baseline_latency is None:
+            self._baseline_latency = latency_seconds
+            return
+        self._baseline_latency = 0.9 * self._baseline_latency + 0.1 * latency_seconds
+
+    def _decrease(self, reason: str) -> None:
+        now = time.monotonic()
+
+        # Guard clause: already backed off for this congestion episode
+        if now - self._last_decrease < self.cooldown_seconds:
+            return
+
+        previous = self.limit
+        self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+        self._last_decrease = now
+        self.stats["decreases"] += 1
+        self.logger.warning(f"Adaptive concurrency {self.name}: {reason}, limit {previous} -> {self.limit}")
+
+    def get_status(self) -> Dict[str, Any]:
+        """Limiter status for monitoring"""
+        with self._condition:
+            return {
+                "name": self.name,
+                "limit": self.limit,
+                "in_flight": self._in_flight,
+                "baseline_latency_seconds": self._baseline_latency,
+                **self.stats
+            }
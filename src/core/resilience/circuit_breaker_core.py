@@ -11,6 +11,8 @@ Architecture:
     - Decorator pattern for function protection
     - Context manager for block protection
     - Thread-safe via internal lock
+    - Optional shared state store (cross-process breaker state)
+    - Optional adaptive concurrency limiter around protected calls
 
 Design Decisions:
     - Composition over inheritance (uses state machine, detector, handler)
@@ -21,13 +23,16 @@ Design Decisions:
 
 from typing import Callable, Any, Optional, TypeVar
 from functools import wraps
-from threading import Lock
+from threading import Lock, local
 import logging
+import time
 
+from core.resilience.adaptive_concurrency import AdaptiveConcurrencyLimiter
 from core.resilience.models import CircuitBreakerConfig, CircuitBreakerOpenError
 from core.resilience.state_machine import StateMachine
 from core.resilience.failure_detector import FailureDetector
 from core.resilience.recovery_handler import RecoveryHandler
+from core.resilience.state_store import CircuitStateStore
 
 
 T = TypeVar('T')
@@ -59,13 +64,22 @@ class CircuitBreaker:
     Context manager usage:
         with breaker:
             result = expensive_api_call()
+
+    Shared across processes, with adaptive concurrency:
+        breaker = CircuitBreaker(
+            "openai",
+            state_store=SQLiteStateStore(),
+            concurrency_limiter=AdaptiveConcurrencyLimiter("openai")
+        )
     """
 
     def __init__(
         self,
         name: str,
         config: Optional[CircuitBreakerConfig] = None,
-        logger: Optional[logging.Logger] = None
+        logger: Optional[logging.Logger] = None,
+        state_store: Optional[CircuitStateStore] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None
     ):
         """
         Initialize circuit breaker.
@@ -74,13 +88,18 @@ class CircuitBreaker:
             name: Name of the protected component
             config: Circuit breaker configuration
             logger: Logger instance
+            state_store: Shared state store (None keeps state in this process)
+            concurrency_limiter: Caps in-flight calls adaptively (None = unlimited)
         """
         self.name = name
         self.config = config or CircuitBreakerConfig()
         self.logger = logger or logging.getLogger(f"CircuitBreaker.{name}")
+        self.state_store = state_store
+        self.concurrency_limiter = concurrency_limiter
 
         # Thread safety
         self._lock = Lock()
+        self._context_starts = local()
 
         # Initialize components
         self.state_machine = StateMachine(
@@ -89,7 +108,8 @@ class CircuitBreaker:
             success_threshold=self.config.success_threshold,
             timeout_seconds=self.config.timeout_seconds,
             lock=self._lock,
-            logger=self.logger
+            logger=self.logger,
+            store=state_store
         )
 
         self.failure_detector = FailureDetector(
@@ -143,7 +163,15 @@ class CircuitBreaker:
         # Check if request allowed (raises if not)
         self.failure_detector.check_before_request()
 
-        # Execute function with success/failure handling
+        # Guard clause: no concurrency limiter
+        if self.concurrency_limiter is None:
+            return self._execute(func, *args, **kwargs)
+
+        with self.concurrency_limiter.slot():
+            return self._execute(func, *args, **kwargs)
+
+    def _execute(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """Run func and record the outcome"""
         try:
             result = func(*args, **kwargs)
             self.recovery_handler.handle_success()
@@ -166,10 +194,15 @@ class CircuitBreaker:
         status = self.state_machine.get_status()
         recovery_status = self.recovery_handler.get_recovery_status()
 
+        # Guard clause: no concurrency limiter
+        if self.concurrency_limiter is None:
+            return {"name": self.name, **status, **recovery_status}
+
         return {
             "name": self.name,
             **status,
-            **recovery_status
+            **recovery_status,
+            "concurrency": self.concurrency_limiter.get_status()
         }
 
     # ========================================================================
@@ -183,6 +216,9 @@ class CircuitBreaker:
         WHY: Reuses failure detector for DRY principle
         """
         self.failure_detector.check_before_request()
+        if self.concurrency_limiter is not None:
+            self.concurrency_limiter.acquire()
+            self._context_stack().append(time.monotonic())
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -199,6 +235,10 @@ class CircuitBreaker:
         Returns:
             False (don't suppress exceptions)
         """
+        if self.concurrency_limiter is not None:
+            started = self._context_stack().pop()
+            self.concurrency_limiter.release(time.monotonic() - started, exc_val)
+
         # Guard clause: handle success case
         if exc_type is None:
             self.recovery_handler.handle_success()
@@ -208,21 +248,30 @@ class CircuitBreaker:
         self.recovery_handler.handle_failure(exc_val)
         return False
 
+    def _context_stack(self) -> list:
+        """Per-thread start times of open `with breaker:` blocks"""
+        stack = getattr(self._context_starts, "stack", None)
+        if stack is None:
+            stack = self._context_starts.stack = []
+        return stack
+
     # ========================================================================
     # Property Access for Backward Compatibility
     # ========================================================================
 
+    # Read through get_status() so shared state from other processes is seen
+
     @property
     def state(self) -> str:
         """Get current state (backward compatibility)."""
-        return self.state_machine.state
+        return self.state_machine.get_status()["state"]
 
     @property
     def failure_count(self) -> int:
         """Get failure count (backward compatibility)."""
-        return self.state_machine.failure_count
+        return self.state_machine.get_status()["failure_count"]
 
     @property
     def success_count(self) -> int:
         """Get success count (backward compatibility)."""
-        return self.state_machine.success_count
+        return self.state_machine.get_status()["success_count"]
@@ -10,6 +10,7 @@ Architecture:
     - CircuitState: Enum-like constants for circuit breaker states
     - CircuitBreakerConfig: Immutable configuration object
     - CircuitBreakerOpenError: Custom exception for open circuit
+    - ConcurrencyLimitExceeded: Custom exception for a saturated concurrency limiter
 
 Design Decisions:
     - dataclass for config (immutable, type-safe)
@@ -26,6 +27,11 @@ class CircuitBreakerOpenError(PipelineStageError):
     pass
 
 
+class ConcurrencyLimitExceeded(PipelineStageError):
+    """Raised when no adaptive concurrency slot frees up within the timeout"""
+    pass
+
+
 class CircuitState:
     """
     Circuit breaker states.
@@ -17,6 +17,8 @@ Design Decisions:
     - Thread-safe via Lock
     - Factory pattern for circuit breaker creation
     - Bulk operations (reset_all, get_all_statuses)
+    - Breakers share the registry's state store (ARTEMIS_CIRCUIT_STORE by
+      default), so breakers of the same name agree across processes
 """
 
 from typing import Optional, Dict, List
@@ -25,6 +27,7 @@ import logging
 
 from core.resilience.models import CircuitBreakerConfig
 from core.resilience.circuit_breaker_core import CircuitBreaker
+from core.resilience.state_store import CircuitStateStore, create_state_store_from_env
 
 
 class CircuitBreakerRegistry:
@@ -43,11 +46,27 @@ class CircuitBreakerRegistry:
         statuses = registry.get_all_statuses()
     """
 
-    def __init__(self):
-        """Initialize empty registry."""
+    def __init__(self, state_store: Optional[CircuitStateStore] = None):
+        """
+        Initialize empty registry.
+
+        Args:
+            state_store: Store shared by created breakers (default: selected
+                         by ARTEMIS_CIRCUIT_STORE on first use; unset = local)
+        """
         self.breakers: Dict[str, CircuitBreaker] = {}
         self.logger = logging.getLogger("CircuitBreakerRegistry")
         self._lock = Lock()
+        self._state_store = state_store
+        self._state_store_resolved = state_store is not None
+
+    @property
+    def state_store(self) -> Optional[CircuitStateStore]:
+        """Store for new breakers (resolved from the environment once, lazily)"""
+        if not self._state_store_resolved:
+            self._state_store = create_state_store_from_env()
+            self._state_store_resolved = True
+        return self._state_store
 
     def get_or_create(
         self,
@@ -72,7 +91,7 @@ class CircuitBreakerRegistry:
                 return self.breakers[name]
 
             # Create new breaker
-            self.breakers[name] = CircuitBreaker(name, config)
+            self.breakers[name] = CircuitBreaker(name, config, state_store=self.state_store)
             self.logger.info(f"Created circuit breaker: {name}")
             return self.breakers[name]
 
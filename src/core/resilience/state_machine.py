@@ -10,6 +10,9 @@ Architecture:
     - StateMachine: Core state transition logic
     - State tracking: failure_count, success_count, timestamps
     - Thread-safe via external lock (injected)
+    - Optional shared state store: each operation loads the shared record,
+      applies the transition and writes it back atomically, so breakers of
+      the same name in other processes see the same state
 
 Design Decisions:
     - State Pattern for clean state transition logic
@@ -19,11 +22,14 @@ Design Decisions:
 """
 
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Callable, Optional, TypeVar
 from threading import Lock
 import logging
 
 from core.resilience.models import CircuitState
+from core.resilience.state_store import CircuitStateStore, Record
+
+T = TypeVar('T')
 
 
 class StateMachine:
@@ -46,7 +52,8 @@ class StateMachine:
         success_threshold: int,
         timeout_seconds: int,
         lock: Lock,
-        logger: logging.Logger
+        logger: logging.Logger,
+        store: Optional[CircuitStateStore] = None
     ):
         """
         Initialize state machine.
@@ -58,6 +65,7 @@ class StateMachine:
             timeout_seconds: Wait time before half-open
             lock: Thread safety lock
             logger: Logger instance
+            store: Shared state store (None keeps state in this process)
         """
         self.name = name
         self.failure_threshold = failure_threshold
@@ -65,6 +73,7 @@ class StateMachine:
         self.timeout_seconds = timeout_seconds
         self.lock = lock
         self.logger = logger
+        self.store = store
 
         # State tracking
         self.state = CircuitState.CLOSED
@@ -82,18 +91,20 @@ class StateMachine:
         Returns:
             True if request allowed, False otherwise
         """
-        with self.lock:
-            # Guard clause: not open, allow request
-            if self.state != CircuitState.OPEN:
-                return True
+        return self._atomic(self._allow_request)
+
+    def _allow_request(self) -> bool:
+        # Guard clause: not open, allow request
+        if self.state != CircuitState.OPEN:
+            return True
 
-            # Guard clause: can attempt reset, transition to half-open
-            if self._should_attempt_reset():
-                self._transition_to_half_open()
-                return True
+        # Guard clause: can attempt reset, transition to half-open
+        if self._should_attempt_reset():
+            self._transition_to_half_open()
+            return True
 
-            # Circuit is open and not ready
-            return False
+        # Circuit is open and not ready
+        return False
 
     def record_success(self):
         """
@@ -101,26 +112,28 @@ class StateMachine:
 
         WHY: Guard clauses eliminate nested ifs
         """
-        with self.lock:
-            # Guard clause: handle CLOSED state
-            if self.state == CircuitState.CLOSED:
-                self.failure_count = 0
-                return
-
-            # Guard clause: not in HALF_OPEN, nothing to do
-            if self.state != CircuitState.HALF_OPEN:
-                return
-
-            # Handle HALF_OPEN state
-            self.success_count += 1
-            self.logger.info(
-                f"Circuit breaker {self.name} successful attempt "
-                f"({self.success_count}/{self.success_threshold})"
-            )
-
-            # Check if enough successes to close
-            if self.success_count >= self.success_threshold:
-                self._transition_to_closed()
+        self._atomic(self._record_success)
+
+    def _record_success(self) -> None:
+        # Guard clause: handle CLOSED state
+        if self.state == CircuitState.CLOSED:
+            self.failure_count = 0
+            return
+
+        # Guard clause: not in HALF_OPEN, nothing to do
+        if self.state != CircuitState.HALF_OPEN:
+            return
+
+        # Handle HALF_OPEN state
+        self.success_count += 1
+        self.logger.info(
+            f"Circuit breaker {self.name} successful attempt "
+            f"({self.success_count}/{self.success_threshold})"
+        )
+
+        # Check if enough successes to close
+        if self.success_count >= self.success_threshold:
+            self._transition_to_closed()
 
     def record_failure(self):
         """
@@ -128,33 +141,37 @@ class StateMachine:
 
         WHY: Guard clauses with early returns
         """
-        with self.lock:
-            self.failure_count += 1
-            self.last_failure_time = datetime.now()
+        self._atomic(self._record_failure)
 
-            self.logger.warning(
-                f"Circuit breaker {self.name} failure "
-                f"({self.failure_count}/{self.failure_threshold})"
-            )
+    def _record_failure(self) -> None:
+        self.failure_count += 1
+        self.last_failure_time = datetime.now()
 
-            # Guard clause: if half-open, reopen immediately
-            if self.state == CircuitState.HALF_OPEN:
-                self._transition_to_open_from_half_open()
-                return
+        self.logger.warning(
+            f"Circuit breaker {self.name} failure "
+            f"({self.failure_count}/{self.failure_threshold})"
+        )
 
-            # Open circuit if threshold exceeded
-            if self.failure_count >= self.failure_threshold:
-                self._transition_to_open()
+        # Guard clause: if half-open, reopen immediately
+        if self.state == CircuitState.HALF_OPEN:
+            self._transition_to_open_from_half_open()
+            return
+
+        # Open circuit if threshold exceeded
+        if self.failure_count >= self.failure_threshold:
+            self._transition_to_open()
 
     def reset(self):
         """Manually reset state machine to closed state."""
-        with self.lock:
-            self.logger.info(f"Circuit breaker {self.name} manually reset")
-            self.state = CircuitState.CLOSED
-            self.failure_count = 0
-            self.success_count = 0
-            self.last_failure_time = None
-            self.last_state_change = datetime.now()
+        self._atomic(self._reset)
+
+    def _reset(self) -> None:
+        self.logger.info(f"Circuit breaker {self.name} manually reset")
+        self.state = CircuitState.CLOSED
+        self.failure_count = 0
+        self.success_count = 0
+        self.last_failure_time = None
+        self.last_state_change = datetime.now()
 
     def get_time_until_retry(self) -> float:
         """
@@ -166,29 +183,101 @@ class StateMachine:
             Seconds until retry (0.0 if ready now)
         """
         with self.lock:
-            # Guard clause: no failure time
-            if not self.last_failure_time:
-                return 0.0
-
-            # Calculate remaining time
-            elapsed = datetime.now() - self.last_failure_time
-            timeout = timedelta(seconds=self.timeout_seconds)
-            remaining = timeout - elapsed
-
-            return max(0.0, remaining.total_seconds())
+            self._refresh()
+            return self._time_until_retry()
 
     def get_status(self) -> dict:
         """Get current state machine status."""
         with self.lock:
+            self._refresh()
             return {
                 "state": self.state,
                 "failure_count": self.failure_count,
                 "success_count": self.success_count,
                 "last_failure_time": self.last_failure_time.isoformat() if self.last_failure_time else None,
                 "last_state_change": self.last_state_change.isoformat() if self.last_state_change else None,
-                "time_until_retry": self.get_time_until_retry() if self.state == CircuitState.OPEN else 0.0
+                "time_until_retry": self._time_until_retry() if self.state == CircuitState.OPEN else 0.0,
+                "shared": self.store is not None
             }
 
+    def _time_until_retry(self) -> float:
+        """Seconds until retry (caller holds the lock)"""
+        # Guard clause: no failure time
+        if not self.last_failure_time:
+            return 0.0
+
+        # Calculate remaining time
+        elapsed = datetime.now() - self.last_failure_time
+        timeout = timedelta(seconds=self.timeout_seconds)
+        remaining = timeout - elapsed
+
+        return max(0.0, remaining.total_seconds())
+
+    # ========================================================================
+    # Shared State
+    # ========================================================================
+
+    def _atomic(self, operation: Callable[[], T]) -> T:
+        """
+        Run a state operation under the lock, against the shared record if any.
+
+        WHY: With a store, the latest shared state is loaded first and the
+             result written back in the same store transaction, so another
+             process opening the circuit is seen by this one. If the store is
+             unreachable the operation falls back to local state rather than
+             failing the protected call.
+        """
+        with self.lock:
+            # Guard clause: process-local state
+            if self.store is None:
+                return operation()
+
+            applied = []
+
+            def apply(record: Record) -> T:
+                self._load_record(record)
+                result = operation()
+                record.update(self._to_record())
+                applied.append(result)
+                return result
+
+            try:
+                return self.store.update(self.name, apply)
+            except Exception as e:
+                self.logger.warning(f"Circuit breaker {self.name} state store unavailable: {e}")
+                # Guard clause: already applied locally before the write failed
+                if applied:
+                    return applied[-1]
+                return operation()
+
+    def _refresh(self) -> None:
+        """Load the latest shared record for read-only queries (caller holds the lock)"""
+        if self.store is None:
+            return
+        try:
+            self._load_record(self.store.load(self.name))
+        except Exception as e:
+            self.logger.warning(f"Circuit breaker {self.name} state store unavailable: {e}")
+
+    def _load_record(self, record: Record) -> None:
+        # Guard clause: nothing shared yet - keep local state
+        if not record:
+            return
+        self.state = record.get("state", CircuitState.CLOSED)
+        self.failure_count = record.get("failure_count", 0)
+        self.success_count = record.get("success_count", 0)
+        self.last_failure_time = _from_timestamp(record.get("last_failure_time"))
+        self.last_state_change = _from_timestamp(record.get("last_state_change"))
+
+    def _to_record(self) -> Record:
+        return {
+            "state": self.state,
+            "failure_count": self.failure_count,
+            "success_count": self.success_count,
+            "last_failure_time": _to_timestamp(self.last_failure_time),
+            "last_state_change": _to_timestamp(self.last_state_change),
+        }
+
     # ========================================================================
     # Private State Transition Methods
     # ========================================================================
@@ -237,3 +326,11 @@ class StateMachine:
         self.state = CircuitState.OPEN
         self.last_state_change = datetime.now()
         self.success_count = 0
+
+
+def _to_timestamp(value: Optional[datetime]) -> Optional[float]:
+    return value.timestamp() if value else None
+
+
+def _from_timestamp(value: Optional[float]) -> Optional[datetime]:
+    return datetime.fromtimestamp(value) if value is not None else None
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Module: core.resilience.state_store
+
+WHY: Circuit breaker state lived in process memory, so every worker process
+     had to rediscover a provider outage on its own (N x failure_threshold
+     failed calls instead of failure_threshold).
+RESPONSIBILITY: Share breaker records (state, counters, timestamps) between
+                processes with atomic read-modify-write updates
+PATTERNS: Strategy Pattern (pluggable backends), Repository Pattern,
+          Dispatch Table (backend selection from environment)
+
+Architecture:
+    - CircuitStateStore: Interface - load(name) and update(name, mutate)
+    - InMemoryStateStore: Per-process, shared by the breakers of one process
+    - SQLiteStateStore: Host-local sharing via one SQLite file (BEGIN IMMEDIATE)
+    - RedisStateStore: Cluster-wide sharing (WATCH/MULTI optimistic transaction)
+
+Design Decisions:
+    - Records are plain JSON-serializable dicts with epoch-second timestamps,
+      so any process (and any backend) can read them
+    - update() takes a mutate callback rather than exposing locks, so the
+      Redis backend can retry the callback when another writer races it
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+T = TypeVar('T')
+
+Record = Dict[str, Any]
+
+DEFAULT_SQLITE_PATH = "../../../.artemis_data/circuit_breakers.db"
+DEFAULT_REDIS_PREFIX = "artemis:circuit"
+DEFAULT_RECORD_TTL_SECONDS = 24 * 60 * 60
+
+
+class CircuitStateStore(ABC):
+    """
+    Storage for circuit breaker records keyed by breaker name.
+
+    WHY: Lets breakers in different processes agree on OPEN/CLOSED state
+    """
+
+    @abstractmethod
+    def load(self, name: str) -> Record:
+        """Return the stored record for name ({} if none)"""
+
+    @abstractmethod
+    def update(self, name: str, mutate: Callable[[Record], T]) -> T:
+        """
+        Atomically read, mutate and write back a record.
+
+        Args:
+            name: Breaker name
+            mutate: Called with the current record (a dict it may modify in
+                    place); may be called more than once if a writer races us
+
+        Returns:
+            The value returned by mutate
+        """
+
+    def delete(self, name: str) -> None:
+        """Remove a record (manual reset of shared state)"""
+        self.update(name, lambda record: record.clear())
+
+
+class InMemoryStateStore(CircuitStateStore):
+    """Process-local store (state is not shared between processes)"""
+
+    def __init__(self):
+        self._records: Dict[str, Record] = {}
+        self._lock = threading.RLock()
+
+    def load(self, name: str) -> Record:
+        with self._lock:
+            return dict(self._records.get(name, {}))
+
+    def update(self, name: str, mutate: Callable[[Record], T]) -> T:
+        with self._lock:
+            record = dict(self._records.get(name, {}))
+            result = mutate(record)
+            self._records[name] = record
+            return result
+
+
+class SQLiteStateStore(CircuitStateStore):
+    """
+    Shares breaker records between processes on one host via SQLite.
+
+    WHY: Local stand-in for Redis - no server needed, and BEGIN IMMEDIATE
+         serializes concurrent read-modify-write updates across processes.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, timeout_seconds: float = 10.0):
+        """
+        Args:
+            db_path: SQLite file (default: ARTEMIS_CIRCUIT_STORE_PATH or .artemis_data)
+            timeout_seconds: How long to wait for another process's write lock
+        """
+        db_path = db_path or os.getenv("ARTEMIS_CIRCUIT_STORE_PATH", DEFAULT_SQLITE_PATH)
+        if db_path != ":memory:" and not os.path.isabs(db_path):
+            db_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), db_path)
+        if db_path != ":memory:":
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+
+        self.db_path = db_path
+        self.timeout_seconds = timeout_seconds
+        self._local = threading.local()
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS circuit_state ("
+                " name TEXT PRIMARY KEY,"
+                " record TEXT NOT NULL,"
+                " updated_at REAL NOT NULL DEFAULT (julianday('now')))"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        """One connection per thread (sqlite3 connections are not thread-safe)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=self.timeout_seconds, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def load(self, name: str) -> Record:
+        row = self._connection().execute(
+            "SELECT record FROM circuit_state WHERE name = ?", (name,)
+        ).fetchone()
+        return json.loads(row[0]) if row else {}
+
+    def update(self, name: str, mutate: Callable[[Record], T]) -> T:
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT record FROM circuit_state WHERE name = ?", (name,)).fetchone()
+            record = json.loads(row[0]) if row else {}
+            result = mutate(record)
+            conn.execute(
+                "INSERT INTO circuit_state (name, record) VALUES (?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET record = excluded.record, updated_at = julianday('now')",
+                (name, json.dumps(record))
+            )
+            conn.execute("COMMIT")
+            return result
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+
+class RedisStateStore(CircuitStateStore):
+    """
+    Shares breaker records across hosts via Redis.
+
+    WHY: Multi-host deployments need one view of provider health.
+    """
+
+    def __init__(
+        self,
+        redis_client: Any,
+        key_prefix: str = DEFAULT_REDIS_PREFIX,
+        ttl_seconds: int = DEFAULT_RECORD_TTL_SECONDS
+    ):
+        """
+        Args:
+            redis_client: RedisClient (or anything exposing .client as a redis.Redis)
+            key_prefix: Key namespace
+            ttl_seconds: Expiry for idle records
+        """
+        self.redis = redis_client
+        self.key_prefix = key_prefix
+        self.ttl_seconds = ttl_seconds
+
+    def _key(self, name: str) -> str:
+        return f"{self.key_prefix}:{name}"
+
+    def load(self, name: str) -> Record:
+        raw = self.redis.client.get(self._key(name))
+        return json.loads(raw) if raw else {}
+
+    def update(self, name: str, mutate: Callable[[Record], T]) -> T:
+        key = self._key(name)
+        outcome: Dict[str, T] = {}
+
+        def transaction(pipe) -> None:
+            raw = pipe.get(key)
+            record = json.loads(raw) if raw else {}
+            outcome["result"] = mutate(record)
+            pipe.multi()
+            pipe.set(key, json.dumps(record), ex=self.ttl_seconds)
+
+        # redis-py re-runs the transaction if another client touched the key
+        self.redis.client.transaction(transaction, key)
+        return outcome["result"]
+
+
+def _create_redis_store() -> Optional[CircuitStateStore]:
+    from redis_client import get_redis_client
+    client = get_redis_client(raise_on_error=False)
+    return RedisStateStore(client) if client else None
+
+
+# Dispatch table: ARTEMIS_CIRCUIT_STORE value -> store factory
+_STORE_FACTORIES: Dict[str, Callable[[], Optional[CircuitStateStore]]] = {
+    "memory": InMemoryStateStore,
+    "sqlite": SQLiteStateStore,
+    "redis": _create_redis_store,
+}
+
+
+def create_state_store_from_env() -> Optional[CircuitStateStore]:
+    """
+    Build the shared store selected by ARTEMIS_CIRCUIT_STORE.
+
+    Returns:
+        Store for "redis", "sqlite" or "memory"; None (per-breaker local
+        state) when unset or unknown, or when Redis is unreachable
+    """
+    backend = os.getenv("ARTEMIS_CIRCUIT_STORE", "").strip().lower()
+
+    # Guard clause: local state unless a store is requested
+    if backend not in _STORE_FACTORIES:
+        return None
+
+    return _STORE_FACTORIES[backend]()
@@ -48,13 +48,9 @@ class ModelPricing:
             Cost in USD
         """
         model_lower = model.lower()
-        pricing = None
-        for model_key, model_pricing in cls.PRICING.items():
-            if model_key in model_lower:
-                pricing = model_pricing
-                break
-        if pricing is None:
-            pricing = cls.PRICING['default']
+        # Most specific key wins ('gpt-4o-mini' must not be priced as 'gpt-4o')
+        matches = [model_key for model_key in cls.PRICING if model_key in model_lower]
+        pricing = cls.PRICING[max(matches, key=len)] if matches else cls.PRICING['default']
         input_cost = tokens_input / 1000000 * pricing['input']
         output_cost = tokens_output / 1000000 * pricing['output']
         return input_cost + output_cost
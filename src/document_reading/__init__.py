@@ -21,6 +21,7 @@ from document_reading.models import DocumentType, ParsedDocument, NotebookSummar
 from document_reading.format_detector import FormatDetector
 from document_reading.content_extractor import ContentExtractor
 from document_reading.reader_factory import ParserFactory
+from document_reading.extraction_cache import ExtractionCache
 
 # Parsers (optional - usually accessed through factory)
 from document_reading.parsers import (
@@ -46,6 +47,7 @@ __all__ = [
     # Utilities
     'FormatDetector',
     'ParserFactory',
+    'ExtractionCache',
 
     # Parsers (for advanced use)
     'PDFParser',
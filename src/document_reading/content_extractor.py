@@ -1,30 +1,38 @@
 from artemis_logger import get_logger
 logger = get_logger('content_extractor')
-'\nWHY: Unified document content extraction orchestrator.\nRESPONSIBILITY: Coordinate format detection, parser selection, and content extraction.\nPATTERNS: Facade pattern - simple interface over complex subsystem, Guard clauses.\n'
+'\nWHY: Unified document content extraction orchestrator.\nRESPONSIBILITY: Coordinate format detection, parser selection, and content extraction,\n                reusing cached text for unchanged documents.\nPATTERNS: Facade pattern - simple interface over complex subsystem, Guard clauses.\n'
 from pathlib import Path
 from typing import Optional
 from document_reading.models import DocumentType, ParsedDocument
 from document_reading.format_detector import FormatDetector
 from document_reading.reader_factory import ParserFactory
+from document_reading.extraction_cache import ExtractionCache
+from artemis_constants import DOCUMENT_CACHE_ENABLED
 from artemis_exceptions import UnsupportedDocumentFormatError, DocumentReadError, wrap_exception
 
+# Formats whose parsing is slow enough to be worth caching
+CACHED_DOCUMENT_TYPES = frozenset({DocumentType.PDF, DocumentType.WORD, DocumentType.EXCEL, DocumentType.ODT, DocumentType.ODS})
+
 class ContentExtractor:
     """
     WHY: High-level interface for extracting content from any supported document.
     RESPONSIBILITY: Orchestrate format detection, parser creation, and content extraction.
     """
 
-    def __init__(self, verbose: bool=False):
+    def __init__(self, verbose: bool=False, cache: Optional[ExtractionCache]=None, use_cache: bool=DOCUMENT_CACHE_ENABLED):
         """
         WHY: Initialize extractor with dependencies.
         RESPONSIBILITY: Create factory for parser instantiation.
 
         Args:
             verbose: Enable verbose logging
+            cache: Extracted-text cache (default: ExtractionCache() when use_cache)
+            use_cache: Reuse text extracted from identical file contents
         """
         self.verbose = verbose
         self.factory = ParserFactory(verbose=verbose)
         self.format_detector = FormatDetector()
+        self.cache = cache or (ExtractionCache() if use_cache else None)
 
     def extract(self, file_path: str) -> ParsedDocument:
         """
@@ -56,7 +64,7 @@ class ContentExtractor:
             parser = self.factory.create_parser(document_type)
             if hasattr(parser, 'is_available') and (not parser.is_available()):
                 raise DocumentReadError(f'Parser for {document_type.value} not available (missing dependencies)', context={'file_path': file_path, 'document_type': str(document_type)})
-            content = parser.parse(file_path)
+            content = self._parse_cached(parser, file_path, document_type)
             return ParsedDocument(content=content, document_type=document_type, file_path=str(path.absolute()), metadata={'extension': extension, 'file_name': path.name, 'file_size': path.stat().st_size})
         except FileNotFoundError:
             raise
@@ -67,6 +75,31 @@ class ContentExtractor:
         except Exception as e:
             raise wrap_exception(e, DocumentReadError, f'Error extracting content from: {file_path}', context={'file_path': file_path})
 
+    def _parse_cached(self, parser, file_path: str, document_type: DocumentType) -> str:
+        """
+        WHY: Re-runs should not re-parse documents that have not changed.
+        RESPONSIBILITY: Return cached text for identical file contents, otherwise parse and cache.
+
+        Args:
+            parser: Parser for the document type
+            file_path: Path to document file
+            document_type: Detected document type
+
+        Returns:
+            Extracted text content
+        """
+        if self.cache is None or document_type not in CACHED_DOCUMENT_TYPES:
+            return parser.parse(file_path)
+        parser_id = getattr(parser, 'library', None) or type(parser).__name__
+        key = self.cache.key(file_path, document_type.value, parser_id)
+        content = self.cache.get(key)
+        if content is not None:
+            self.log(f'Using cached text for {Path(file_path).name}')
+            return content
+        content = parser.parse(file_path)
+        self.cache.put(key, content)
+        return content
+
     def extract_text(self, file_path: str) -> str:
         """
         WHY: Convenience method to extract just the text content.
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+WHY: Pipeline re-runs re-parsed the same PDFs and spreadsheets every time,
+     even though the extracted text only changes when the file does.
+RESPONSIBILITY: Store extracted text keyed by file content hash and parser,
+                so unchanged documents skip parsing entirely.
+PATTERNS: Content-addressed cache, Atomic write (temp file + rename).
+
+Size and age are bounded by the 'document_cache' retention class
+(utilities/retention.py); hits refresh an entry's mtime so retention
+evicts the least recently used text first.
+
+The key covers the file bytes (not its path or mtime), the document type
+and the parser library, so a copy of a document hits the cache and a
+different PDF library re-extracts.
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from artemis_constants import DOCUMENT_CACHE_DIR
+from artemis_logger import get_logger
+
+logger = get_logger('extraction_cache')
+
+# Bump when parser output changes so stale text is not served
+CACHE_VERSION = 1
+
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def file_digest(file_path: str) -> str:
+    """SHA-256 of the file contents, read in blocks"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """
+    WHY: Skip parsing of documents whose text was already extracted.
+    RESPONSIBILITY: Map (content hash, document type, parser) to extracted text on disk.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """
+        Args:
+            cache_dir: Cache directory (default: DOCUMENT_CACHE_DIR)
+        """
+        self.cache_dir = Path(cache_dir or DOCUMENT_CACHE_DIR)
+
+    def key(self, file_path: str, document_type: str, parser_id: str) -> str:
+        """Cache key for a document as parsed by a given parser"""
+        return hashlib.sha256(
+            f'{CACHE_VERSION}:{document_type}:{parser_id}:{file_digest(file_path)}'.encode()
+        ).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Cached text, or None on a miss"""
+        path = self._path(key)
+        try:
+            text = path.read_text(encoding='utf-8')
+        except FileNotFoundError:
+            return None
+        except (OSError, UnicodeDecodeError) as e:
+            logger.log(f'Ignoring unreadable cache entry {path.name}: {e}', 'WARNING')
+            return None
+        self._touch(path)
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        """Store text; failures only cost a re-parse next time"""
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.log(f'Could not cache extracted text: {e}', 'WARNING')
+
+    def _touch(self, path: Path) -> None:
+        """Mark an entry as recently used for retention"""
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f'{key}.txt'
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+WHY: Large PDFs were parsed page after page in one process, holding every
+     page's extracted text until the end.
+RESPONSIBILITY: Split a document into contiguous page ranges, parse them in
+                worker processes sized to a memory budget, and yield the
+                results in document order.
+PATTERNS: Worker function pattern for ProcessPoolExecutor, Guard clauses,
+          Generator pipeline (callers consume ranges as they finish).
+
+Workers receive (file_path, start, stop) and open the file themselves, so
+only page text crosses the process boundary, never the parsed document.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
+from pathlib import Path
+from pickle import PicklingError
+from typing import Callable, Iterator, List, Tuple
+
+from artemis_constants import DOCUMENT_PARSE_MEMORY_MB, DOCUMENT_PARSE_WORKERS
+from artemis_logger import get_logger
+
+logger = get_logger('parallel_parsing')
+
+# Pages handed to a worker per task - large enough to amortise opening the file
+PAGES_PER_CHUNK = 8
+
+# Resident size of an idle worker (interpreter + parser library)
+WORKER_BASE_MEMORY_MB = 64
+
+# Parser working set relative to the file size (decompressed streams, layout objects)
+WORKER_MEMORY_PER_FILE_MB = 4
+
+PageRange = Tuple[int, int]
+
+
+def page_ranges(total: int, chunk_size: int = PAGES_PER_CHUNK) -> List[PageRange]:
+    """Contiguous [start, stop) ranges covering total pages"""
+    return [(start, min(start + chunk_size, total)) for start in range(0, total, chunk_size)]
+
+
+def workers_for(
+    file_path: str,
+    chunks: int,
+    max_workers: int = DOCUMENT_PARSE_WORKERS,
+    memory_cap_mb: int = DOCUMENT_PARSE_MEMORY_MB
+) -> int:
+    """
+    Worker count that keeps all workers within the memory budget
+
+    Every worker opens its own copy of the document, so the estimate grows
+    with file size; a budget that fits one worker means parse in-process.
+
+    Args:
+        file_path: Document to parse
+        chunks: Number of page ranges to distribute
+        max_workers: Configured worker ceiling
+        memory_cap_mb: Memory budget for all workers together
+
+    Returns:
+        Number of worker processes (1 = parse in the calling process)
+    """
+    size_mb = Path(file_path).stat().st_size / (1024 * 1024)
+    per_worker_mb = WORKER_BASE_MEMORY_MB + size_mb * WORKER_MEMORY_PER_FILE_MB
+    return max(1, min(max_workers, chunks, int(memory_cap_mb // per_worker_mb)))
+
+
+def parse_ranges(
+    worker: Callable[[str, int, int], List],
+    file_path: str,
+    total: int,
+    workers: int,
+    chunk_size: int = PAGES_PER_CHUNK
+) -> Iterator[List]:
+    """
+    Parse page ranges, in parallel when workers > 1, yielding in page order
+
+    Args:
+        worker: Module-level function (file_path, start, stop) -> per-page results
+        file_path: Document to parse
+        total: Page count
+        workers: Worker processes (from workers_for)
+        chunk_size: Pages per range
+
+    Yields:
+        Per-page results of each range, first range first
+    """
+    ranges = page_ranges(total, chunk_size)
+    done = 0
+
+    # Guard clause: nothing to gain from a pool
+    if workers > 1 and len(ranges) > 1:
+        starts, stops = zip(*ranges)
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for result in pool.map(worker, repeat(file_path), starts, stops):
+                    done += 1
+                    yield result
+        except (OSError, BrokenProcessPool, PicklingError) as e:
+            # No process support (e.g. restricted sandbox) - finish in-process
+            logger.log(f'Parallel parsing unavailable ({e}); parsing {Path(file_path).name} in-process', 'WARNING')
+
+    for start, stop in ranges[done:]:
+        yield worker(file_path, start, stop)
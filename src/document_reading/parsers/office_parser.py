@@ -1,7 +1,7 @@
 from artemis_logger import get_logger
 logger = get_logger('office_parser')
 '\nWHY: Microsoft Office and LibreOffice document parsing.\nRESPONSIBILITY: Extract text from Word, Excel, ODT, and ODS files.\nPATTERNS: Strategy pattern for different office formats, Guard clauses for library checks.\n'
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from artemis_exceptions import DocumentReadError
 
 class WordParser:
@@ -53,6 +53,22 @@ class WordParser:
         Returns:
             Extracted text content
 
+        Raises:
+            DocumentReadError: If library not available or parsing fails
+        """
+        return '\n'.join(self.iter_chunks(file_path))
+
+    def iter_chunks(self, file_path: str) -> Iterator[str]:
+        """
+        WHY: Stream text so callers need not hold a second copy of the document.
+        RESPONSIBILITY: Yield non-empty paragraphs, then table rows, in document order.
+
+        Args:
+            file_path: Path to Word document
+
+        Yields:
+            One paragraph or table row per item
+
         Raises:
             DocumentReadError: If library not available or parsing fails
         """
@@ -61,16 +77,14 @@ class WordParser:
         import docx
         try:
             doc = docx.Document(file_path)
-            text_content: List[str] = []
             for paragraph in doc.paragraphs:
                 if paragraph.text.strip():
-                    text_content.append(paragraph.text)
+                    yield paragraph.text
             for table in doc.tables:
                 for row in table.rows:
                     row_text = ' | '.join([cell.text for cell in row.cells])
                     if row_text.strip():
-                        text_content.append(row_text)
-            return '\n'.join(text_content)
+                        yield row_text
         except Exception as e:
             raise DocumentReadError(f'Error parsing Word document: {str(e)}', context={'file_path': file_path}, original_exception=e)
 
@@ -123,6 +137,23 @@ class ExcelParser:
         Returns:
             Extracted text content with sheet separators
 
+        Raises:
+            DocumentReadError: If library not available or parsing fails
+        """
+        return '\n'.join(self.iter_chunks(file_path))
+
+    def iter_chunks(self, file_path: str) -> Iterator[str]:
+        """
+        WHY: Large workbooks do not fit comfortably in memory as a full object model.
+        RESPONSIBILITY: Open the workbook read-only and yield each sheet header
+                        and row as it is read from the file.
+
+        Args:
+            file_path: Path to Excel file
+
+        Yields:
+            Sheet separator lines and one line per non-empty row
+
         Raises:
             DocumentReadError: If library not available or parsing fails
         """
@@ -130,16 +161,20 @@ class ExcelParser:
             raise DocumentReadError('Excel support not available. Install: pip install openpyxl', context={'file_path': file_path})
         import openpyxl
         try:
-            workbook = openpyxl.load_workbook(file_path, data_only=True)
-            text_content: List[str] = []
-            for sheet_name in workbook.sheetnames:
-                sheet = workbook[sheet_name]
-                text_content.append(f'\n=== Sheet: {sheet_name} ===\n')
-                for row in sheet.iter_rows(values_only=True):
-                    row_values = [str(cell) for cell in row if cell is not None]
-                    if row_values:
-                        text_content.append(' | '.join(row_values))
-            return '\n'.join(text_content)
+            workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+            try:
+                for sheet_name in workbook.sheetnames:
+                    sheet = workbook[sheet_name]
+                    # Read-only sheets trust the stored <dimension>, which some
+                    # writers omit or get wrong; rescan so no rows are dropped
+                    sheet.reset_dimensions()
+                    yield f'\n=== Sheet: {sheet_name} ===\n'
+                    for row in sheet.iter_rows(values_only=True):
+                        row_values = [str(cell) for cell in row if cell is not None]
+                        if row_values:
+                            yield ' | '.join(row_values)
+            finally:
+                workbook.close()
         except Exception as e:
             raise DocumentReadError(f'Error parsing Excel file: {str(e)}', context={'file_path': file_path}, original_exception=e)
 
@@ -193,6 +228,22 @@ class ODTParser:
         Returns:
             Extracted text content
 
+        Raises:
+            DocumentReadError: If library not available or parsing fails
+        """
+        return '\n'.join(self.iter_chunks(file_path))
+
+    def iter_chunks(self, file_path: str) -> Iterator[str]:
+        """
+        WHY: Stream text so callers need not hold a second copy of the document.
+        RESPONSIBILITY: Yield non-empty paragraphs in document order.
+
+        Args:
+            file_path: Path to ODT file
+
+        Yields:
+            One paragraph per item
+
         Raises:
             DocumentReadError: If library not available or parsing fails
         """
@@ -202,12 +253,10 @@ class ODTParser:
         from odf.opendocument import load
         try:
             doc = load(file_path)
-            text_content: List[str] = []
             for element in doc.getElementsByType(text.P):
                 paragraph_text = teletype.extractText(element)
                 if paragraph_text.strip():
-                    text_content.append(paragraph_text)
-            return '\n'.join(text_content)
+                    yield paragraph_text
         except Exception as e:
             raise DocumentReadError(f'Error parsing ODT file: {str(e)}', context={'file_path': file_path}, original_exception=e)
 
@@ -262,6 +311,22 @@ class ODSParser:
         Returns:
             Extracted text content with sheet separators
 
+        Raises:
+            DocumentReadError: If library not available or parsing fails
+        """
+        return '\n'.join(self.iter_chunks(file_path))
+
+    def iter_chunks(self, file_path: str) -> Iterator[str]:
+        """
+        WHY: Stream sheets row by row instead of collecting the whole workbook text.
+        RESPONSIBILITY: Yield each sheet header and non-empty row in order.
+
+        Args:
+            file_path: Path to ODS file
+
+        Yields:
+            Sheet separator lines and one line per non-empty row
+
         Raises:
             DocumentReadError: If library not available or parsing fails
         """
@@ -272,10 +337,9 @@ class ODSParser:
         from odf import teletype
         try:
             doc = load(file_path)
-            text_content: List[str] = []
             for table in doc.spreadsheet.getElementsByType(Table):
                 table_name = table.getAttribute('name')
-                text_content.append(f'\n=== Sheet: {table_name} ===\n')
+                yield f'\n=== Sheet: {table_name} ===\n'
                 for row in table.getElementsByType(TableRow):
                     row_values: List[str] = []
                     for cell in row.getElementsByType(TableCell):
@@ -283,7 +347,6 @@ class ODSParser:
                         if cell_text:
                             row_values.append(cell_text)
                     if row_values:
-                        text_content.append(' | '.join(row_values))
-            return '\n'.join(text_content)
+                        yield ' | '.join(row_values)
         except Exception as e:
             raise DocumentReadError(f'Error parsing ODS file: {str(e)}', context={'file_path': file_path}, original_exception=e)
\ No newline at end of file
@@ -1,8 +1,10 @@
 from artemis_logger import get_logger
 logger = get_logger('pdf_parser')
-'\nWHY: PDF document parsing using PyPDF2 or pdfplumber libraries.\nRESPONSIBILITY: Extract text content from PDF files with library auto-detection.\nPATTERNS: Strategy pattern for multiple PDF library support, Guard clauses for validation.\n'
-from typing import List, Optional
+'\nWHY: PDF document parsing using PyPDF2 or pdfplumber libraries.\nRESPONSIBILITY: Extract text content from PDF files with library auto-detection,\n                streaming pages and parsing large documents in page-range workers.\nPATTERNS: Strategy pattern for multiple PDF library support, Guard clauses for validation.\n'
+from typing import Callable, Dict, Iterator, List, Optional
+from artemis_constants import DOCUMENT_PARALLEL_MIN_PAGES
 from artemis_exceptions import DocumentReadError
+from document_reading.parallel_parsing import page_ranges, parse_ranges, workers_for
 
 class PDFParser:
     """
@@ -67,50 +69,87 @@ class PDFParser:
         Raises:
             DocumentReadError: If library not available or parsing fails
         """
-        if not self.is_available():
-            raise DocumentReadError('PDF support not available. Install: pip install PyPDF2 or pdfplumber', context={'file_path': file_path})
-        if self.library == 'PyPDF2':
-            return self._parse_with_pypdf2(file_path)
-        elif self.library == 'pdfplumber':
-            return self._parse_with_pdfplumber(file_path)
-        raise DocumentReadError(f'Unknown PDF library: {self.library}', context={'file_path': file_path, 'library': self.library})
+        return '\n'.join(self.iter_pages(file_path))
 
-    def _parse_with_pypdf2(self, file_path: str) -> str:
+    def iter_pages(self, file_path: str) -> Iterator[str]:
         """
-        WHY: Parse PDF using PyPDF2 library.
-        RESPONSIBILITY: Extract text from all pages using PyPDF2.
+        WHY: Stream page text instead of building the whole document first.
+        RESPONSIBILITY: Yield page text in order, parsing page ranges in worker
+                        processes when the document is large enough to benefit.
 
         Args:
             file_path: Path to PDF file
 
-        Returns:
-            Combined text from all pages
-        """
-        import PyPDF2
-        text_content: List[str] = []
-        with open(file_path, 'rb') as f:
-            pdf_reader = PyPDF2.PdfReader(f)
-            for page_num in range(len(pdf_reader.pages)):
-                page = pdf_reader.pages[page_num]
-                text_content.append(page.extract_text())
-        return '\n'.join(text_content)
-
-    def _parse_with_pdfplumber(self, file_path: str) -> str:
+        Yields:
+            Text of each page (pdfplumber skips pages without text, as before)
+
+        Raises:
+            DocumentReadError: If library not available or parsing fails
         """
-        WHY: Parse PDF using pdfplumber library.
-        RESPONSIBILITY: Extract text from all pages using pdfplumber.
+        if not self.is_available():
+            raise DocumentReadError('PDF support not available. Install: pip install PyPDF2 or pdfplumber', context={'file_path': file_path})
+        extract_pages = PAGE_EXTRACTORS.get(self.library)
+        if extract_pages is None:
+            raise DocumentReadError(f'Unknown PDF library: {self.library}', context={'file_path': file_path, 'library': self.library})
+        total = PAGE_COUNTERS[self.library](file_path)
+        workers = 1
+        if total >= DOCUMENT_PARALLEL_MIN_PAGES:
+            workers = workers_for(file_path, len(page_ranges(total)))
+        if self.verbose:
+            logger.log(f'[PDFParser] {total} pages, {workers} worker(s)', 'INFO')
+        for texts in parse_ranges(extract_pages, file_path, total, workers):
+            yield from texts
 
-        Args:
-            file_path: Path to PDF file
 
-        Returns:
-            Combined text from all pages
-        """
-        import pdfplumber
-        text_content: List[str] = []
-        with pdfplumber.open(file_path) as pdf:
-            for page in pdf.pages:
-                text = page.extract_text()
-                if text:
-                    text_content.append(text)
-        return '\n'.join(text_content)
\ No newline at end of file
+def _pypdf2_page_count(file_path: str) -> int:
+    import PyPDF2
+    with open(file_path, 'rb') as f:
+        return len(PyPDF2.PdfReader(f).pages)
+
+
+def _pdfplumber_page_count(file_path: str) -> int:
+    import pdfplumber
+    with pdfplumber.open(file_path) as pdf:
+        return len(pdf.pages)
+
+
+def _pypdf2_pages(file_path: str, start: int, stop: int) -> List[str]:
+    """
+    WHY: Parse one page range using PyPDF2 (runs in worker processes).
+    RESPONSIBILITY: Extract text from pages [start, stop).
+    """
+    import PyPDF2
+    with open(file_path, 'rb') as f:
+        pdf_reader = PyPDF2.PdfReader(f)
+        return [pdf_reader.pages[page_num].extract_text() for page_num in range(start, stop)]
+
+
+def _pdfplumber_pages(file_path: str, start: int, stop: int) -> List[str]:
+    """
+    WHY: Parse one page range using pdfplumber (runs in worker processes).
+    RESPONSIBILITY: Extract non-empty text from pages [start, stop), releasing
+                    each page's layout objects once its text is read.
+    """
+    import pdfplumber
+    text_content: List[str] = []
+    with pdfplumber.open(file_path) as pdf:
+        for page in pdf.pages[start:stop]:
+            text = page.extract_text()
+            if text:
+                text_content.append(text)
+            close_page = getattr(page, 'close', None)
+            if close_page:
+                close_page()
+    return text_content
+
+
+# Dispatch tables keyed by detected library (module-level so workers can unpickle them)
+PAGE_COUNTERS: Dict[str, Callable[[str], int]] = {
+    'PyPDF2': _pypdf2_page_count,
+    'pdfplumber': _pdfplumber_page_count,
+}
+
+PAGE_EXTRACTORS: Dict[str, Callable[[str, int, int], List[str]]] = {
+    'PyPDF2': _pypdf2_pages,
+    'pdfplumber': _pdfplumber_pages,
+}
@@ -12,9 +12,13 @@ PATTERNS:
     - Strategy: Different optimization strategies based on intensity
     - Guard Clauses: Early returns for low-intensity/no-AI scenarios
     - Mixin Integration: Inherits DRY AI query methods
+
+Worker counts come from measured stage history (execution stats store) when
+enough runs of similar cards exist, and from the complexity tables otherwise.
 """
 
-from typing import Dict, Any, List
+import math
+from typing import Dict, Any, List, Optional
 from artemis_exceptions import PipelineException, wrap_exception
 from advanced_features_ai_mixin import AdvancedFeaturesAIMixin
 from dynamic_pipeline.pipeline_stage import PipelineStage
@@ -55,17 +59,21 @@ class AIOptimizer(AdvancedFeaturesAIMixin):
     Attributes:
         context: Pipeline context with router metadata
         ai_service: Optional AI service for adaptive calls
+        stats_store: Optional ExecutionStatsStore with measured stage history
     """
 
-    def __init__(self, context: PipelineContext):
+    def __init__(self, context: PipelineContext, stats_store=None):
         """
         Initialize AI optimizer.
 
         Args:
             context: Pipeline context with router metadata
+            stats_store: Execution stats store (default: context
+                'execution_stats_store', then the process-wide store)
         """
         self.context = context
         self.ai_service = context.ai_service
+        self.stats_store = stats_store or context.get('execution_stats_store')
 
     @wrap_exception(PipelineException, "AI-enhanced stage optimization failed")
     def optimize_stage_execution(
@@ -174,8 +182,9 @@ class AIOptimizer(AdvancedFeaturesAIMixin):
                    f"Router guidance: {self.context.router_guidance[:200]}..."
         )
 
-        # Use dispatch table for worker count
-        ai_suggested_workers = COMPLEXITY_TO_WORKERS.get(
+        # Measured history first, dispatch table on cold start
+        history_workers = self._history_recommended_workers(stages)
+        ai_suggested_workers = history_workers or COMPLEXITY_TO_WORKERS.get(
             complexity_level,
             self.context.suggested_workers
         )
@@ -193,6 +202,7 @@ class AIOptimizer(AdvancedFeaturesAIMixin):
             'execution_order': execution_order,
             'parallel_groups': parallel_groups,
             'max_workers': ai_suggested_workers,
+            'worker_source': 'history' if history_workers else 'complexity_table',
             'skip_optional': [
                 s.name for s in stages
                 if s.name in self.context.optional_stages
@@ -385,10 +395,12 @@ class AIOptimizer(AdvancedFeaturesAIMixin):
         safety_score = COMPLEXITY_TO_SAFETY.get(complexity_level, 0.75)
 
         # Adjust workers based on complexity
-        recommended_workers = self._compute_recommended_workers(complexity_level)
+        history_workers = self._history_recommended_workers(stages)
+        recommended_workers = history_workers or self._compute_recommended_workers(complexity_level)
 
         return {
             'recommended_workers': recommended_workers,
+            'worker_source': 'history' if history_workers else 'complexity_table',
             'can_parallelize': can_parallelize,
             'must_serialize': must_serialize,
             'safety_score': safety_score,
@@ -423,3 +435,47 @@ class AIOptimizer(AdvancedFeaturesAIMixin):
 
         adjustment = adjustments.get(complexity_level, -1)
         return max(2, self.context.suggested_workers + adjustment)
+
+    def _history_recommended_workers(self, stages: List[PipelineStage]) -> Optional[int]:
+        """
+        Compute worker count from measured stage durations.
+
+        WHY: Beyond sum(p50) / max(p90) workers, wall time is bounded by the
+             slowest stage, so extra workers only add contention. Needs
+             predictions for at least two stages; otherwise returns None and
+             callers fall back to the complexity tables.
+
+        Args:
+            stages: Stages to run
+
+        Returns:
+            Recommended worker count, or None on cold start
+        """
+        store = self._get_stats_store()
+        if store is None:
+            return None
+
+        from persistence.execution_stats import stage_key
+        wanted = {stage_key(s.name) for s in stages}
+        recorded = [name for name in store.known_stages() if stage_key(name) in wanted]
+        predictions = store.predict_card(
+            self.context.get('task_type'), self.context.get('complexity'), recorded
+        )
+        warm = [p for p in predictions.values() if not p.cold_start and p.duration_p90]
+        if len(warm) < 2:
+            return None
+
+        total = sum(p.duration_p50 for p in warm)
+        longest = max(p.duration_p90 for p in warm)
+        return max(1, min(len(stages), math.ceil(total / longest)))
+
+    def _get_stats_store(self):
+        """Execution stats store, or None when it cannot be opened"""
+        if self.stats_store is not None:
+            return self.stats_store
+        try:
+            from persistence.execution_stats import get_execution_stats_store
+            self.stats_store = get_execution_stats_store()
+        except Exception:
+            return None
+        return self.stats_store
@@ -11,10 +11,16 @@ PATTERNS:
     - Configuration Object: Encapsulates retry settings
     - Exponential Backoff: Prevents thundering herd and gives issues time to resolve
     - Guard Clauses: Early returns for retry decision logic
+
+Delays are applied by the shared utilities.retry_engine (decorrelated jitter,
+per-dependency retry budgets, deadlines); this object only configures it.
 """
 
 from dataclasses import dataclass, field
-from typing import Set
+from typing import Optional, Set
+
+from artemis_constants import RETRY_MAX_DELAY_SECONDS
+from utilities.retry_engine import BackoffPolicy
 
 
 @dataclass
@@ -29,9 +35,10 @@ class RetryPolicy:
 
     Retry strategy:
     - Retries only specified exception types
-    - Exponential backoff between attempts
+    - Jittered exponential backoff between attempts, capped at max_delay
     - Maximum retry limit
     - Per-stage override capability
+    - Retry budget shared per dependency (defaults to the stage name)
     """
     max_retries: int = 3
     retryable_exceptions: Set[type] = field(default_factory=lambda: {
@@ -41,8 +48,10 @@ class RetryPolicy:
     })
     backoff_multiplier: float = 2.0
     initial_delay: float = 1.0
+    max_delay: float = RETRY_MAX_DELAY_SECONDS
+    dependency: Optional[str] = None
 
-    def should_retry(self, exception: Exception, attempt: int) -> bool:
+    def should_retry(self, exception: Optional[Exception], attempt: int) -> bool:
         """
         Determine if exception should trigger retry.
 
@@ -50,7 +59,8 @@ class RetryPolicy:
         type and attempt count.
 
         Args:
-            exception: Exception that occurred
+            exception: Exception that occurred, or None when the stage
+                       returned an unsuccessful result without one
             attempt: Current attempt number (0-indexed)
 
         Returns:
@@ -60,15 +70,20 @@ class RetryPolicy:
         if attempt >= self.max_retries:
             return False
 
+        # Unsuccessful result without an exception: retry within the limit
+        if exception is None:
+            return True
+
         # Check if exception type is retryable
         return any(isinstance(exception, exc_type) for exc_type in self.retryable_exceptions)
 
     def get_delay(self, attempt: int) -> float:
         """
-        Calculate delay before next retry (exponential backoff).
+        Calculate delay before next retry (exponential backoff, no jitter).
 
         Why needed: Exponential backoff prevents thundering herd and
-        gives transient issues time to resolve.
+        gives transient issues time to resolve. The executor applies the
+        jittered schedule from backoff(); this is the nominal schedule.
 
         Args:
             attempt: Attempt number (0-indexed)
@@ -77,3 +92,16 @@ class RetryPolicy:
             Delay in seconds before next retry
         """
         return self.initial_delay * (self.backoff_multiplier ** attempt)
+
+    def backoff(self) -> BackoffPolicy:
+        """
+        Jittered backoff schedule for the shared retry engine.
+
+        Returns:
+            BackoffPolicy whose upper bound grows by backoff_multiplier
+        """
+        return BackoffPolicy(
+            base_delay=self.initial_delay,
+            max_delay=self.max_delay,
+            multiplier=self.backoff_multiplier
+        )
@@ -14,7 +14,6 @@ PATTERNS:
     - Guard Clauses: Early returns for skip and retry conditions
 """
 
-import time
 from datetime import datetime
 from typing import Dict, Any, Optional
 
@@ -24,6 +23,7 @@ from pipeline_observer import PipelineObservable, PipelineEvent, EventType
 from dynamic_pipeline.pipeline_stage import PipelineStage
 from dynamic_pipeline.stage_result import StageResult
 from dynamic_pipeline.retry_policy import RetryPolicy
+from utilities.retry_engine import RetryEngine, get_deadline, get_retry_engine
 
 
 class StageExecutor:
@@ -46,8 +46,9 @@ class StageExecutor:
     Execution flow:
     1. Check if should execute (conditional)
     2. Execute stage
-    3. On failure, check retry policy
-    4. Retry with backoff if allowed
+    3. On failure (exception or unsuccessful result), check retry policy
+    4. Retry with jittered backoff if policy, retry budget and the
+       context deadline (context["deadline"]) allow
     5. Emit events for all outcomes
     """
 
@@ -55,11 +56,13 @@ class StageExecutor:
         self,
         observable: PipelineObservable,
         retry_policy: Optional[RetryPolicy] = None,
-        logger: Optional[PipelineLogger] = None
+        logger: Optional[PipelineLogger] = None,
+        retry_engine: Optional[RetryEngine] = None
     ):
         self.observable = observable
         self.retry_policy = retry_policy or RetryPolicy()
         self.logger = logger or PipelineLogger(verbose=True)
+        self.retry_engine = retry_engine or get_retry_engine()
 
     @wrap_exception(PipelineException, "Failed to execute stage")
     def execute_stage(
@@ -130,33 +133,32 @@ class StageExecutor:
         Execute stage with retry logic.
 
         Why helper method: Extracts retry loop from main execute method,
-        avoiding nested loops and improving testability.
+        avoiding nested loops and improving testability. The loop itself is
+        the shared retry engine, so stages draw from the same per-dependency
+        retry budget as supervisor recovery workflows.
         """
-        attempt = 0
-        last_exception = None
-
-        # Retry loop - extracted to avoid nesting in main method
-        while attempt <= self.retry_policy.max_retries:
-            try:
-                # Attempt execution
-                result = self._attempt_execution(stage, context, card_id, attempt)
-
-                # Success - return result
-                return result
-
-            except Exception as e:
-                last_exception = e
+        outcome = self.retry_engine.run(
+            lambda attempt: self._attempt_execution(stage, context, card_id, attempt),
+            dependency=self.retry_policy.dependency or stage.name,
+            max_attempts=self.retry_policy.max_retries + 1,
+            backoff=self.retry_policy.backoff(),
+            is_success=lambda result: result.success,
+            retry_on=self.retry_policy.should_retry,
+            deadline=get_deadline(context),
+            on_retry=lambda attempt, delay, error: self._handle_retry(stage, card_id, attempt, delay, error)
+        )
 
-                # Check if should retry
-                if not self.retry_policy.should_retry(e, attempt):
-                    break
+        # Guard clause: success
+        if outcome.succeeded:
+            return outcome.value
 
-                # Handle retry with backoff
-                self._handle_retry(stage, card_id, attempt, e)
-                attempt += 1
+        # Retries exhausted, not retryable, out of budget or out of time - fail
+        error = outcome.error or (outcome.value.error if outcome.value else None)
+        return self._handle_failure(stage, card_id, error, outcome.retries)
 
-        # All retries exhausted - fail
-        return self._handle_failure(stage, card_id, last_exception, attempt)
+    def get_retry_metrics(self) -> Dict[str, Dict[str, float]]:
+        """Retry counters per dependency from the shared retry engine"""
+        return self.retry_engine.get_metrics()
 
     def _attempt_execution(
         self,
@@ -207,15 +209,14 @@ class StageExecutor:
         stage: PipelineStage,
         card_id: str,
         attempt: int,
-        error: Exception
+        delay: float,
+        error: Optional[Exception]
     ) -> None:
         """
-        Handle retry preparation (logging, events, backoff).
+        Handle retry preparation (logging, events). The retry engine sleeps.
 
         Why helper method: Extracts retry handling logic, avoids nesting.
         """
-        delay = self.retry_policy.get_delay(attempt)
-
         self.logger.log(
             f"Stage {stage.name} failed (attempt {attempt + 1}), "
             f"retrying in {delay:.1f}s: {error}",
@@ -234,9 +235,6 @@ class StageExecutor:
             }
         ))
 
-        # Backoff delay
-        time.sleep(delay)
-
     def _handle_failure(
         self,
         stage: PipelineStage,
@@ -4,6 +4,8 @@ GDPR Compliance Evaluator
 
 Evaluates web implementations for GDPR (General Data Protection Regulation) compliance.
 Uses static analysis and pattern matching to detect privacy and data protection issues.
+Directory scans go through compliance_engine.ComplianceEngine, which reads each
+file once and shares it (and its markup index) with the WCAG evaluator.
 
 For production use, integrate with:
 - OneTrust
@@ -18,6 +20,11 @@ from typing import Dict, List, Optional
 from pathlib import Path
 from dataclasses import dataclass, asdict
 
+from compliance_engine import ComplianceEngine, ComplianceReport, ParsedFile
+
+PERSONAL_DATA_INPUT_TYPES = ('email', 'tel')
+PERSONAL_DATA_INPUT_NAMES = ('email', 'phone', 'ssn', 'address')
+
 
 @dataclass
 class GDPRIssue:
@@ -41,12 +48,14 @@ class GDPREvaluator:
     def __init__(self):
         self.issues: List[GDPRIssue] = []
 
-    def evaluate_directory(self, implementation_dir: str) -> Dict:
+    def evaluate_directory(self, implementation_dir: str, report: Optional[ComplianceReport] = None) -> Dict:
         """
         Evaluate implementation directory for GDPR compliance
 
         Args:
             implementation_dir: Path to implementation directory
+            report: Precomputed ComplianceReport (e.g. shared with the WCAG
+                    evaluator); computed here if not given
 
         Returns:
             Dict with evaluation results
@@ -57,41 +66,38 @@ class GDPREvaluator:
         if not impl_path.exists():
             return self._create_result(skipped=True, reason="Directory not found")
 
-        # Find all relevant files
-        code_files = list(impl_path.rglob("*.js")) + \
-                    list(impl_path.rglob("*.jsx")) + \
-                    list(impl_path.rglob("*.ts")) + \
-                    list(impl_path.rglob("*.tsx")) + \
-                    list(impl_path.rglob("*.py")) + \
-                    list(impl_path.rglob("*.html"))
+        report = report or ComplianceEngine().evaluate_directory(implementation_dir, rule_sets=("gdpr",))
 
-        if not code_files:
+        if not report.gdpr_files:
             return self._create_result(skipped=True, reason="No code files found")
 
-        # Evaluate each file
-        for file_path in code_files:
-            self._evaluate_file(file_path)
-
+        self.issues = list(report.gdpr_issues)
         return self._create_result()
 
-    def _evaluate_file(self, file_path: Path):
-        """Evaluate a single file for GDPR compliance"""
-        try:
-            content = file_path.read_text(encoding='utf-8')
-        except Exception:
-            return  # Skip files that can't be read
-
-        # Run all GDPR checks
-        self._check_cookie_consent(content, str(file_path))
-        self._check_data_collection(content, str(file_path))
-        self._check_data_minimization(content, str(file_path))
-        self._check_right_to_erasure(content, str(file_path))
-        self._check_data_portability(content, str(file_path))
-        self._check_privacy_by_design(content, str(file_path))
-        self._check_third_party_tracking(content, str(file_path))
-        self._check_personal_data_storage(content, str(file_path))
-
-    def _check_cookie_consent(self, content: str, file_path: str):
+    def check_file(self, parsed: ParsedFile) -> List[GDPRIssue]:
+        """
+        Run all GDPR checks on one parsed file
+
+        Args:
+            parsed: File content (with markup index for HTML/JSX/TSX)
+
+        Returns:
+            Issues found in this file (also appended to self.issues)
+        """
+        first_new = len(self.issues)
+
+        self._check_cookie_consent(parsed)
+        self._check_data_collection(parsed)
+        self._check_data_minimization(parsed)
+        self._check_right_to_erasure(parsed)
+        self._check_data_portability(parsed)
+        self._check_privacy_by_design(parsed)
+        self._check_third_party_tracking(parsed)
+        self._check_personal_data_storage(parsed)
+
+        return self.issues[first_new:]
+
+    def _check_cookie_consent(self, parsed: ParsedFile):
         """
         GDPR Article 7 - Conditions for consent
         Check for cookie consent implementation
@@ -104,7 +110,7 @@ class GDPREvaluator:
             r'Cookies\.set'
         ]
 
-        has_cookie_usage = any(re.search(pattern, content) for pattern in cookie_patterns)
+        has_cookie_usage = any(re.search(pattern, parsed.content) for pattern in cookie_patterns)
 
         # Look for consent mechanisms
         consent_patterns = [
@@ -114,7 +120,7 @@ class GDPREvaluator:
             r'GDPR.*consent'
         ]
 
-        has_consent_mechanism = any(re.search(pattern, content, re.IGNORECASE) for pattern in consent_patterns)
+        has_consent_mechanism = any(re.search(pattern, parsed.content, re.IGNORECASE) for pattern in consent_patterns)
 
         if has_cookie_usage and not has_consent_mechanism:
             self.issues.append(GDPRIssue(
@@ -126,22 +132,12 @@ class GDPREvaluator:
                 gdpr_principle="Lawful basis for processing"
             ))
 
-    def _check_data_collection(self, content: str, file_path: str):
+    def _check_data_collection(self, parsed: ParsedFile):
         """
         GDPR Article 13 - Information to be provided when data is collected
         Check for privacy policy links and data collection notices
         """
-        # Look for forms collecting personal data
-        form_fields = [
-            r'<input[^>]*type=["\']email',
-            r'<input[^>]*name=["\']email',
-            r'<input[^>]*type=["\']tel',
-            r'<input[^>]*name=["\']phone',
-            r'<input[^>]*name=["\']ssn',
-            r'<input[^>]*name=["\']address'
-        ]
-
-        has_personal_data_form = any(re.search(pattern, content, re.IGNORECASE) for pattern in form_fields)
+        has_personal_data_form = self._has_personal_data_form(parsed)
 
         # Look for privacy notice
         privacy_patterns = [
@@ -150,7 +146,7 @@ class GDPREvaluator:
             r'terms.*service'
         ]
 
-        has_privacy_notice = any(re.search(pattern, content, re.IGNORECASE) for pattern in privacy_patterns)
+        has_privacy_notice = any(re.search(pattern, parsed.content, re.IGNORECASE) for pattern in privacy_patterns)
 
         if has_personal_data_form and not has_privacy_notice:
             self.issues.append(GDPRIssue(
@@ -162,7 +158,27 @@ class GDPREvaluator:
                 gdpr_principle="Transparency and information"
             ))
 
-    def _check_data_minimization(self, content: str, file_path: str):
+    def _has_personal_data_form(self, parsed: ParsedFile) -> bool:
+        """Check for inputs collecting personal data (markup index when parsed)"""
+        # Guard clause: non-markup code (JS/TS/Python) - search the source text
+        if parsed.markup is None:
+            form_fields = [
+                r'<input[^>]*type=["\']email',
+                r'<input[^>]*name=["\']email',
+                r'<input[^>]*type=["\']tel',
+                r'<input[^>]*name=["\']phone',
+                r'<input[^>]*name=["\']ssn',
+                r'<input[^>]*name=["\']address'
+            ]
+            return any(re.search(pattern, parsed.content, re.IGNORECASE) for pattern in form_fields)
+
+        return any(
+            (attrs.get('type') or '').lower().startswith(PERSONAL_DATA_INPUT_TYPES)
+            or (attrs.get('name') or '').lower().startswith(PERSONAL_DATA_INPUT_NAMES)
+            for attrs, _ in parsed.markup.inputs
+        )
+
+    def _check_data_minimization(self, parsed: ParsedFile):
         """
         GDPR Article 5(1)(c) - Data minimization
         Check for excessive data collection
@@ -178,7 +194,7 @@ class GDPREvaluator:
         ]
 
         for pattern, data_type in sensitive_fields:
-            if re.search(pattern, content, re.IGNORECASE):
+            if re.search(pattern, parsed.content, re.IGNORECASE):
                 self.issues.append(GDPRIssue(
                     article="Article 5(1)(c)",
                     severity="high",
@@ -188,7 +204,7 @@ class GDPREvaluator:
                     gdpr_principle="Data minimization"
                 ))
 
-    def _check_right_to_erasure(self, content: str, file_path: str):
+    def _check_right_to_erasure(self, parsed: ParsedFile):
         """
         GDPR Article 17 - Right to erasure ('right to be forgotten')
         Check for data deletion functionality
@@ -200,7 +216,7 @@ class GDPREvaluator:
             r'INSERT\s+INTO\s+(users?|accounts?|profiles?)'
         ]
 
-        has_user_data_storage = any(re.search(pattern, content, re.IGNORECASE) for pattern in user_data_patterns)
+        has_user_data_storage = any(re.search(pattern, parsed.content, re.IGNORECASE) for pattern in user_data_patterns)
         if not has_user_data_storage:
             return
 
@@ -212,12 +228,12 @@ class GDPREvaluator:
             r'right.*to.*erasure'
         ]
 
-        has_deletion_feature = any(re.search(pattern, content, re.IGNORECASE) for pattern in deletion_patterns)
+        has_deletion_feature = any(re.search(pattern, parsed.content, re.IGNORECASE) for pattern in deletion_patterns)
         if has_deletion_feature:
             return
 
         # Only warn if this looks like a backend/API file
-        if not self._is_backend_file(file_path):
+        if not self.is_backend_path(parsed.path):
             return
 
         self.issues.append(GDPRIssue(
@@ -229,13 +245,13 @@ class GDPREvaluator:
             gdpr_principle="Right to erasure"
         ))
 
-    def _check_data_portability(self, content: str, file_path: str):
+    def _check_data_portability(self, parsed: ParsedFile):
         """
         GDPR Article 20 - Right to data portability
         Check for data export functionality
         """
         # Look for user data storage
-        has_user_data = bool(re.search(r'(users?|accounts?|profiles?)', content, re.IGNORECASE))
+        has_user_data = bool(re.search(r'(users?|accounts?|profiles?)', parsed.content, re.IGNORECASE))
         if not has_user_data:
             return
 
@@ -247,12 +263,12 @@ class GDPREvaluator:
             r'\.csv|\.json.*export'
         ]
 
-        has_export_feature = any(re.search(pattern, content, re.IGNORECASE) for pattern in export_patterns)
+        has_export_feature = any(re.search(pattern, parsed.content, re.IGNORECASE) for pattern in export_patterns)
         if has_export_feature:
             return
 
         # Only check in backend/API files
-        if not self._is_backend_file(file_path):
+        if not self.is_backend_path(parsed.path):
             return
 
         self.issues.append(GDPRIssue(
@@ -264,7 +280,7 @@ class GDPREvaluator:
             gdpr_principle="Right to data portability"
         ))
 
-    def _check_privacy_by_design(self, content: str, file_path: str):
+    def _check_privacy_by_design(self, parsed: ParsedFile):
         """
         GDPR Article 25 - Data protection by design and by default
         Check for privacy-first patterns
@@ -278,7 +294,7 @@ class GDPREvaluator:
         ]
 
         for pattern, secret_type in secret_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
+            if re.search(pattern, parsed.content, re.IGNORECASE):
                 self.issues.append(GDPRIssue(
                     article="Article 25",
                     severity="critical",
@@ -288,7 +304,7 @@ class GDPREvaluator:
                     gdpr_principle="Data protection by design"
                 ))
 
-    def _check_third_party_tracking(self, content: str, file_path: str):
+    def _check_third_party_tracking(self, parsed: ParsedFile):
         """
         GDPR Article 7 - Conditions for consent
         Check for third-party tracking without consent
@@ -303,12 +319,12 @@ class GDPREvaluator:
         ]
 
         for pattern, service in tracking_services:
-            if not re.search(pattern, content, re.IGNORECASE):
+            if not re.search(pattern, parsed.content, re.IGNORECASE):
                 continue
 
             # Check if there's consent handling
             consent_check = r'(consent|gdpr|cookie.*accept)'
-            if re.search(consent_check, content, re.IGNORECASE):
+            if re.search(consent_check, parsed.content, re.IGNORECASE):
                 continue
 
             self.issues.append(GDPRIssue(
@@ -320,7 +336,7 @@ class GDPREvaluator:
                 gdpr_principle="Lawful basis for processing"
             ))
 
-    def _check_personal_data_storage(self, content: str, file_path: str):
+    def _check_personal_data_storage(self, parsed: ParsedFile):
         """
         GDPR Article 32 - Security of processing
         Check for secure personal data storage
@@ -334,7 +350,7 @@ class GDPREvaluator:
         ]
 
         for pattern, description in insecure_storage_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
+            if re.search(pattern, parsed.content, re.IGNORECASE):
                 self.issues.append(GDPRIssue(
                     article="Article 32",
                     severity="critical",
@@ -408,6 +424,7 @@ class GDPREvaluator:
         """Check if any issue matches the given category"""
         return any(issue.category == category for issue in self.issues)
 
-    def _is_backend_file(self, file_path: str) -> bool:
+    @staticmethod
+    def is_backend_path(file_path: str) -> bool:
         """Check if file is a backend/API file"""
         return '.py' in file_path or 'api' in file_path.lower() or 'server' in file_path.lower()
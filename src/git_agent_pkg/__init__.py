@@ -14,6 +14,7 @@ from .models import (
     BranchStrategy,
     CommitConvention,
     GitOperation,
+    SyncSummary,
     GIT_REMOTE_ORIGIN,
     GIT_STATUS_SUCCESS,
     GIT_STATUS_FAILED,
@@ -42,6 +43,7 @@ from .repo_operations import RepositoryOperations
 from .branch_operations import BranchOperations
 from .commit_operations import CommitOperations
 from .remote_operations import RemoteOperations
+from .output_sync import OutputSync
 from .operations_logger import OperationsLogger
 
 __all__ = [
@@ -53,6 +55,7 @@ __all__ = [
     'BranchStrategy',
     'CommitConvention',
     'GitOperation',
+    'SyncSummary',
     'GIT_REMOTE_ORIGIN',
     'GIT_STATUS_SUCCESS',
     'GIT_STATUS_FAILED',
@@ -77,5 +80,6 @@ __all__ = [
     'BranchOperations',
     'CommitOperations',
     'RemoteOperations',
+    'OutputSync',
     'OperationsLogger',
 ]
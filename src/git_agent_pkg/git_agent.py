@@ -12,6 +12,7 @@ from typing import Dict, List, Optional, Any
 from artemis_logger import ArtemisLogger
 
 from .config import RepositoryConfig
+from .models import SyncSummary
 from .repo_operations import RepositoryOperations
 from .branch_operations import BranchOperations
 from .commit_operations import CommitOperations
@@ -228,6 +229,13 @@ class GitAgent:
             commit_callback=self.commit_changes
         )
 
+    def get_last_sync_summary(self) -> Optional[SyncSummary]:
+        """
+        WHY: Report what the last save_output_to_repo changed
+        RESPONSIBILITY: Delegate to remote operations
+        """
+        return self._get_remote_ops().last_sync_summary
+
     # ========================================================================
     # OPERATIONS LOGGING
     # ========================================================================
@@ -6,8 +6,8 @@ PATTERNS: Enum pattern, dataclass pattern, constants grouping
 """
 
 from enum import Enum
-from dataclasses import dataclass
-from typing import Dict, Optional
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
 
 
 # ============================================================================
@@ -54,3 +54,31 @@ class GitOperation:
     status: str
     details: Dict
     error: Optional[str] = None
+
+
+@dataclass
+class SyncSummary:
+    """
+    WHY: Report what an output sync changed in the repository
+    RESPONSIBILITY: Store added, changed and removed paths (relative to repo root)
+    """
+    added: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    unchanged: int = 0
+    kept_modified: List[str] = field(default_factory=list)
+    bytes_copied: int = 0
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+    def to_dict(self) -> Dict:
+        return {
+            'added': len(self.added),
+            'changed': len(self.changed),
+            'removed': len(self.removed),
+            'unchanged': self.unchanged,
+            'kept_modified': len(self.kept_modified),
+            'bytes_copied': self.bytes_copied
+        }
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+WHY: Copying the whole output tree on every save rewrote unchanged files,
+     causing I/O and mtime churn that git then had to re-stat
+RESPONSIBILITY: Sync an output directory into a repository incrementally
+PATTERNS: Single Responsibility Principle, guard clauses
+
+- Only new or content-changed files are copied (SHA-256 comparison)
+- Files deleted from the output since the previous sync are removed
+- Every copy is atomic (temp file + rename), so a crash never leaves a
+  half-written file in the repository
+
+A manifest of synced files (kept inside .git so it is never committed)
+records content hashes and stat signatures: files whose size and mtime
+did not change since the last sync are not re-hashed.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+from .models import SyncSummary
+
+MANIFEST_NAME = 'artemis_output_manifest.json'
+HASH_CHUNK_SIZE = 1 << 20
+
+
+def file_sha256(path: Path) -> str:
+    """
+    WHY: Content comparison independent of mtimes
+    RESPONSIBILITY: Hash a file in chunks
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as handle:
+        for chunk in iter(lambda: handle.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def atomic_copy(source: Path, dest: Path) -> None:
+    """
+    WHY: A crash mid-copy must not leave a truncated file behind
+    RESPONSIBILITY: Copy to a temp file in the destination directory, then rename
+    """
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(prefix=f'.{dest.name}.', suffix='.artemis-tmp', dir=dest.parent)
+    try:
+        with os.fdopen(fd, 'wb') as out, open(source, 'rb') as src:
+            shutil.copyfileobj(src, out, HASH_CHUNK_SIZE)
+            out.flush()
+            os.fsync(out.fileno())
+        shutil.copystat(source, temp_name)
+        os.replace(temp_name, dest)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+
+
+def _signature(stat_result: os.stat_result) -> Tuple[int, int]:
+    return stat_result.st_size, stat_result.st_mtime_ns
+
+
+class OutputSync:
+    """
+    WHY: Keep the repository copy of an output directory up to date cheaply
+    RESPONSIBILITY: Compare, copy, remove and remember synced files
+    PATTERNS: Single Responsibility Principle, guard clauses
+    """
+
+    def __init__(self, repo_path: Path, manifest_path: Optional[Path] = None):
+        """
+        WHY: Inject paths for testability
+        RESPONSIBILITY: Resolve manifest location (inside .git when possible)
+        """
+        self.repo_path = Path(repo_path)
+        git_dir = self.repo_path / '.git'
+        self.manifest_path = manifest_path or (git_dir / MANIFEST_NAME if git_dir.is_dir() else self.repo_path / f'.{MANIFEST_NAME}')
+
+    def sync(self, source_path: Path) -> SyncSummary:
+        """
+        WHY: Mirror output changes into the repository
+        RESPONSIBILITY: Copy new/changed files, remove deleted ones, save manifest
+
+        Files deleted from the output are only removed from the repository
+        if they still hold the content last synced; files edited in the
+        repository since are kept and reported as kept_modified.
+
+        Args:
+            source_path: Output directory
+
+        Returns:
+            SyncSummary of the changes made
+        """
+        manifest = self._load_manifest()
+        source_key = str(Path(source_path).resolve())
+        previous: Dict[str, Dict] = manifest.get(source_key, {})
+        current: Dict[str, Dict] = {}
+        summary = SyncSummary()
+
+        for rel_path, source_file in self._iter_source_files(Path(source_path)):
+            current[rel_path] = self._sync_file(rel_path, source_file, previous.get(rel_path), summary)
+
+        for rel_path in sorted(set(previous) - set(current)):
+            self._remove_file(rel_path, previous[rel_path], summary)
+
+        manifest[source_key] = current
+        self._save_manifest(manifest)
+        return summary
+
+    def _sync_file(self, rel_path: str, source_file: Path, entry: Optional[Dict], summary: SyncSummary) -> Dict:
+        """Copy one file if needed; return its new manifest entry"""
+        source_signature = _signature(source_file.stat())
+        known = entry and tuple(entry['source']) == source_signature
+        sha256 = entry['sha256'] if known else file_sha256(source_file)
+
+        dest = self.repo_path / rel_path
+        dest_stat = self._stat(dest)
+
+        if dest_stat is not None and self._dest_matches(dest, dest_stat, entry, sha256, source_signature[0]):
+            summary.unchanged += 1
+            return {'sha256': sha256, 'source': list(source_signature), 'dest': list(_signature(dest_stat))}
+
+        atomic_copy(source_file, dest)
+        (summary.changed if dest_stat is not None else summary.added).append(rel_path)
+        summary.bytes_copied += source_signature[0]
+        return {'sha256': sha256, 'source': list(source_signature), 'dest': list(_signature(dest.stat()))}
+
+    def _dest_matches(self, dest: Path, dest_stat: os.stat_result, entry: Optional[Dict], sha256: str, size: int) -> bool:
+        """Whether the repository file already holds the source content"""
+        # Fast path: untouched since the previous sync wrote it
+        if entry and entry['sha256'] == sha256 and tuple(entry['dest']) == _signature(dest_stat):
+            return True
+        if not dest_stat.st_size == size or not dest.is_file():
+            return False
+        return file_sha256(dest) == sha256
+
+    def _remove_file(self, rel_path: str, entry: Dict, summary: SyncSummary) -> None:
+        """Remove a file deleted from the output, unless edited in the repository"""
+        dest = self.repo_path / rel_path
+        dest_stat = self._stat(dest)
+
+        # Guard: already gone
+        if dest_stat is None:
+            return
+
+        unchanged = tuple(entry['dest']) == _signature(dest_stat) or file_sha256(dest) == entry['sha256']
+        if not unchanged:
+            summary.kept_modified.append(rel_path)
+            return
+
+        dest.unlink()
+        summary.removed.append(rel_path)
+        self._prune_empty_dirs(dest.parent)
+
+    def _prune_empty_dirs(self, directory: Path) -> None:
+        while directory != self.repo_path and self.repo_path in directory.parents:
+            try:
+                directory.rmdir()
+            except OSError:
+                return
+            directory = directory.parent
+
+    def _iter_source_files(self, source_path: Path) -> Iterator[Tuple[str, Path]]:
+        """(repo-relative posix path, file) for every output file, skipping .git"""
+        for directory, dirs, files in os.walk(source_path):
+            dirs[:] = sorted(name for name in dirs if name != '.git')
+            for name in sorted(files):
+                path = Path(directory) / name
+                if path.is_file():
+                    yield path.relative_to(source_path).as_posix(), path
+
+    @staticmethod
+    def _stat(path: Path) -> Optional[os.stat_result]:
+        try:
+            return path.stat()
+        except OSError:
+            return None
+
+    def _load_manifest(self) -> Dict[str, Dict]:
+        try:
+            return json.loads(self.manifest_path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self, manifest: Dict[str, Dict]) -> None:
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(prefix='.manifest.', dir=self.manifest_path.parent)
+        with os.fdopen(fd, 'w') as handle:
+            json.dump(manifest, handle)
+        os.replace(temp_name, self.manifest_path)
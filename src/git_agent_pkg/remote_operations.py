@@ -5,7 +5,6 @@ RESPONSIBILITY: Push, pull, fetch, and sync with remote repositories
 PATTERNS: Single Responsibility Principle, guard clauses
 """
 
-import shutil
 from pathlib import Path
 from typing import Optional, Any, Callable
 
@@ -14,7 +13,8 @@ from artemis_exceptions import GitOperationError
 from pipeline_observer import EventType
 
 from .config import RepositoryConfig
-from .models import GIT_REMOTE_ORIGIN, GIT_STATUS_SUCCESS, GIT_STATUS_FAILED
+from .models import GIT_REMOTE_ORIGIN, GIT_STATUS_SUCCESS, GIT_STATUS_FAILED, SyncSummary
+from .output_sync import OutputSync
 
 
 class RemoteOperations:
@@ -41,6 +41,7 @@ class RemoteOperations:
         self.operation_logger = operation_logger
         self.run_git_command = git_command_runner
         self.notify_event = event_notifier
+        self.last_sync_summary: Optional[SyncSummary] = None
 
     def push_changes(
         self,
@@ -191,8 +192,11 @@ class RemoteOperations:
     ) -> bool:
         """
         WHY: Copy Artemis output files to repository
-        RESPONSIBILITY: Transfer files and create commit
+        RESPONSIBILITY: Sync changed files and create commit
         PATTERNS: Guard clauses, callback pattern
+
+        The commit is skipped when the sync changed nothing. The sync
+        summary is kept in last_sync_summary.
         """
         try:
             # Switch to target branch if specified
@@ -208,8 +212,13 @@ class RemoteOperations:
                 self.logger.warning(f"Source directory does not exist: {source_dir}")
                 return False
 
-            # Copy files (excluding .git)
-            self._copy_files_to_repo(source_path, repo_path)
+            # Sync changed files (excluding .git)
+            summary = self._copy_files_to_repo(source_path, repo_path)
+
+            # Guard: Nothing to commit
+            if not summary.has_changes:
+                self.logger.info("Output unchanged, nothing to commit")
+                return True
 
             # Commit changes using callback
             if commit_callback:
@@ -249,20 +258,22 @@ class RemoteOperations:
         self,
         source_path: Path,
         repo_path: Path
-    ) -> None:
+    ) -> SyncSummary:
         """
-        WHY: Copy files while excluding git metadata
-        RESPONSIBILITY: Transfer files from source to repository
-        PATTERNS: Guard clauses for file filtering
+        WHY: Copy only what changed while excluding git metadata
+        RESPONSIBILITY: Incrementally sync files from source to repository
+        PATTERNS: Delegation to OutputSync
         """
-        for item in source_path.iterdir():
-            # Guard: Skip .git directory
-            if item.name == '.git':
-                continue
-
-            dest = repo_path / item.name
-
-            if item.is_file():
-                shutil.copy2(item, dest)
-            else:
-                shutil.copytree(item, dest, dirs_exist_ok=True)
+        summary = OutputSync(repo_path).sync(source_path)
+        self.last_sync_summary = summary
+
+        self.operation_logger('sync_output', GIT_STATUS_SUCCESS, summary.to_dict())
+        self.logger.info(
+            f"Synced output: {len(summary.added)} added, {len(summary.changed)} changed, "
+            f"{len(summary.removed)} removed, {summary.unchanged} unchanged"
+        )
+        if summary.kept_modified:
+            self.logger.warning(
+                f"Kept {len(summary.kept_modified)} files deleted from output but modified in repo"
+            )
+        return summary
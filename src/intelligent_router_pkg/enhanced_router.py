@@ -37,6 +37,18 @@ from intelligent_router_pkg.context_creator import ContextCreator
 from intelligent_router_pkg.prompt_generator import PromptGenerator
 from intelligent_router_pkg.decision_logger import DecisionLogger
 
+# Similar-task counts used until the execution stats store has enough history
+COLD_START_TASK_HISTORY = {
+    ('bugfix', 'simple'): 20,
+    ('bugfix', 'medium'): 10,
+    ('feature', 'simple'): 15,
+    ('feature', 'medium'): 8,
+    ('feature', 'complex'): 3,
+    ('refactor', 'medium'): 5,
+    ('refactor', 'complex'): 2,
+    ('documentation', 'simple'): 25,
+}
+
 
 class IntelligentRouterEnhanced(IntelligentRouter):
     """
@@ -64,7 +76,8 @@ class IntelligentRouterEnhanced(IntelligentRouter):
         ai_service=None,
         logger=None,
         config=None,
-        advanced_config: Optional[AdvancedPipelineConfig] = None
+        advanced_config: Optional[AdvancedPipelineConfig] = None,
+        stats_store=None
     ):
         """
         Initialize enhanced router.
@@ -74,9 +87,12 @@ class IntelligentRouterEnhanced(IntelligentRouter):
             logger: Logger for output
             config: Base configuration for routing rules
             advanced_config: Configuration for advanced pipeline features
+            stats_store: ExecutionStatsStore with measured stage history
+                (default: process-wide store)
         """
         # Initialize base router
         super().__init__(ai_service, logger, config)
+        self._stats_store = stats_store
 
         # Advanced feature configuration
         self.advanced_config = advanced_config or AdvancedPipelineConfig()
@@ -199,6 +215,9 @@ class IntelligentRouterEnhanced(IntelligentRouter):
             card, base_decision.requirements,
             feature_recommendation.dynamic_intensity
         )
+        self._apply_execution_history(
+            dynamic_pipeline_context, base_decision.requirements, base_decision.stages_to_run
+        )
 
         two_pass_context = self.context_creator.create_two_pass_context(
             card, base_decision.requirements, uncertainty_analysis,
@@ -234,23 +253,59 @@ class IntelligentRouterEnhanced(IntelligentRouter):
         complexity: str
     ) -> int:
         """
-        Estimate number of similar past tasks.
+        Number of similar past tasks.
 
-        WHY: In full implementation, would query Thermodynamic Computing's
-        Bayesian priors. For now, use heuristics based on common task types.
-
-        This is a placeholder - real implementation would query historical data.
+        WHY: Feeds the Bayesian prior strength of the uncertainty analysis.
+        Counts cards actually recorded in the execution stats store; until
+        the store holds min_samples cards, falls back to heuristic counts
+        per common task type.
         """
-        # Heuristic estimates (replace with actual historical query)
-        common_tasks = {
-            ('bugfix', 'simple'): 20,
-            ('bugfix', 'medium'): 10,
-            ('feature', 'simple'): 15,
-            ('feature', 'medium'): 8,
-            ('feature', 'complex'): 3,
-            ('refactor', 'medium'): 5,
-            ('refactor', 'complex'): 2,
-            ('documentation', 'simple'): 25,
-        }
+        store = self._get_stats_store()
+        if store is None or store.card_count() < store.min_samples:
+            return COLD_START_TASK_HISTORY.get((task_type, complexity), 0)
 
-        return common_tasks.get((task_type, complexity), 0)
+        return store.card_count(task_type, complexity)
+
+    def _apply_execution_history(self, context: Dict, requirements, stages_to_run) -> None:
+        """
+        Replace story-point duration guesses with measured stage history.
+
+        WHY: estimated_duration_hours was story_points * 2 regardless of how
+        long such cards really took. When every selected stage has enough
+        history, the estimate is the sum of per-stage p50 durations and a
+        p50/p90 cost is attached. If any stage is cold, summing only the warm
+        ones would underestimate the card, so the heuristic is kept
+        (duration_source='heuristic') and only per-stage predictions are added.
+        """
+        context['duration_source'] = 'heuristic'
+        context['stage_predictions'] = {}
+        from persistence.execution_stats import stage_key
+        store = self._get_stats_store()
+        wanted = {stage_key(stage) for stage in stages_to_run or []}
+        if store is None or not wanted:
+            return
+
+        stages = [stage for stage in store.known_stages() if stage_key(stage) in wanted]
+        predictions = store.predict_card(requirements.task_type, requirements.complexity, stages)
+        warm = [prediction for prediction in predictions.values() if not prediction.cold_start]
+        context['stage_predictions'] = {name: prediction.to_dict() for name, prediction in predictions.items()}
+        if {stage_key(prediction.stage) for prediction in warm} != wanted:
+            return
+
+        context['estimated_duration_hours'] = sum(p.duration_p50 for p in warm) / 3600
+        context['estimated_duration_p90_hours'] = sum(p.duration_p90 for p in warm) / 3600
+        context['estimated_cost_usd'] = sum(p.cost_p50 for p in warm)
+        context['estimated_cost_p90_usd'] = sum(p.cost_p90 for p in warm)
+        context['duration_source'] = 'history'
+
+    def _get_stats_store(self):
+        """Execution stats store, or None when it cannot be opened"""
+        if self._stats_store is not None:
+            return self._stats_store
+        try:
+            from persistence.execution_stats import get_execution_stats_store
+            self._stats_store = get_execution_stats_store()
+        except Exception as e:
+            if self.logger:
+                self.logger.log(f"Execution stats unavailable, using heuristics: {e}", "WARNING")
+        return self._stats_store
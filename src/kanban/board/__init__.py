@@ -17,6 +17,7 @@ PATTERNS:
 Module Structure:
 - models.py: Data structure access and queries
 - persistence.py: JSON load/save operations
+- board_store.py: Card index, change batching, locked atomic saves
 - card_operations.py: Card CRUD and workflow
 - sprint_manager.py: Sprint lifecycle management
 - metrics_calculator.py: Performance metrics
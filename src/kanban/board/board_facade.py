@@ -1,11 +1,11 @@
 from artemis_logger import get_logger
 logger = get_logger('board_facade')
-'\nModule: kanban/board/board_facade.py\n\nWHY: Main orchestrator providing unified API for all board operations\n     Coordinates between specialized modules\n\nRESPONSIBILITY:\n- Unified API for all board operations\n- Coordinate between persistence, operations, and metrics\n- Maintain board state in memory\n- Delegate to specialized modules\n\nPATTERNS:\n- Facade Pattern: Simplifies complex subsystem interactions\n- Delegation: Forwards operations to specialized modules\n'
+'\nModule: kanban/board/board_facade.py\n\nWHY: Main orchestrator providing unified API for all board operations\n     Coordinates between specialized modules\n\nRESPONSIBILITY:\n- Unified API for all board operations\n- Coordinate between persistence, operations, and metrics\n- Maintain indexed board state in memory (BoardStore)\n- Batch saves of related changes\n- Delegate to specialized modules\n\nPATTERNS:\n- Facade Pattern: Simplifies complex subsystem interactions\n- Delegation: Forwards operations to specialized modules\n'
 from typing import Dict, List, Optional, Any
 from artemis_constants import KANBAN_BOARD_PATH
 from debug_mixin import DebugMixin
 from kanban.card_builder import CardBuilder
-from kanban.board.persistence import BoardPersistence
+from kanban.board.board_store import BoardStore
 from kanban.board.models import BoardModels
 from kanban.board.card_operations import CardOperations
 from kanban.board.sprint_manager import SprintManager
@@ -50,15 +50,50 @@ class KanbanBoard(DebugMixin):
         """
         DebugMixin.__init__(self, component_name='kanban')
         self.board_path = board_path
-        self.board = BoardPersistence.load_board(board_path)
+        self.store = BoardStore(board_path)
+
+    @property
+    def board(self) -> Dict:
+        """
+        Current board dictionary.
+
+        WHY: The store replaces its board when merging another writer's save
+        """
+        return self.store.board
 
     def _save_board(self) -> None:
         """
-        Save board to JSON file.
+        Save pending changes to the JSON file.
+
+        WHY: Persists board state after operations (deferred inside batch())
+        """
+        self.store.save()
+
+    def batch(self):
+        """
+        Group several operations into one locked, atomic board write.
 
-        WHY: Persists board state after operations
+        Usage:
+            with board.batch():
+                board.move_card(card_id, "development")
+                board.update_test_status(card_id, {"unit_tests_written": True})
+        """
+        return self.store.batch()
+
+    def _refresh_metrics_after_move(self, card: Dict, from_column: Optional[str], to_column: str) -> None:
+        """
+        Maintain metrics incrementally after a card moved.
+
+        WHY: A new completion is folded into running totals in O(1); a card
+             leaving (or re-entering) done needs a full recalculation
         """
-        BoardPersistence.save_board(self.board, self.board_path)
+        if from_column == 'done':
+            MetricsCalculator.update_metrics(self.board)
+        elif to_column == 'done':
+            MetricsCalculator.record_card_completed(self.board, card)
+        else:
+            return
+        self.store.mark_board_changed('current_sprint')
 
     def new_card(self, task_id: str, title: str) -> CardBuilder:
         """
@@ -97,8 +132,9 @@ class KanbanBoard(DebugMixin):
             Added card dictionary
         """
         self.debug_log('Adding card to backlog', card_id=card.get('card_id', 'unknown'), task_id=card.get('task_id', 'unknown'))
-        result = CardOperations.add_card(self.board, card)
-        self._save_board()
+        with self.store.batch():
+            result = CardOperations.add_card(self.board, card, self.store.index)
+            self.store.mark_card_changed(card.get('card_id') or card.get('task_id'))
         self.debug_log('Card added successfully', card_id=card.get('card_id', 'unknown'))
         return result
 
@@ -107,7 +143,7 @@ class KanbanBoard(DebugMixin):
         Move a card between columns with WIP enforcement.
 
         WHY: Core workflow operation for card transitions
-        PERFORMANCE: O(n) for card search, O(1) for move
+        PERFORMANCE: O(1) card lookup, O(1) metrics update
 
         Args:
             card_id: Card identifier to move (task_id or card_id)
@@ -119,15 +155,16 @@ class KanbanBoard(DebugMixin):
             True if move succeeded, False if card or column not found
         """
         self.debug_log('Moving card', card_id=card_id, from_column='searching', to_column=to_column, agent=agent)
-        success = CardOperations.move_card(self.board, card_id, to_column, agent, comment)
-        if not success:
-            
-            logger.log(f'❌ Card {card_id} move failed', 'INFO')
-            self.debug_log('Card move failed', card_id=card_id)
-            return False
-        if to_column == 'done':
-            MetricsCalculator.update_metrics(self.board)
-        self._save_board()
+        with self.store.batch():
+            card, from_column = self.store.find_card(card_id)
+            success = CardOperations.move_card(self.board, card_id, to_column, agent, comment, self.store.index)
+            if not success:
+                
+                logger.log(f'❌ Card {card_id} move failed', 'INFO')
+                self.debug_log('Card move failed', card_id=card_id)
+                return False
+            self.store.mark_card_changed(card_id)
+            self._refresh_metrics_after_move(card, from_column, to_column)
         
         logger.log(f'✅ Moved card {card_id} to {to_column}', 'INFO')
         return True
@@ -145,12 +182,13 @@ class KanbanBoard(DebugMixin):
         Returns:
             True if successful
         """
-        success = CardOperations.update_card(self.board, card_id, updates)
-        if not success:
-            
-            logger.log(f'❌ Card {card_id} not found', 'INFO')
-            return False
-        self._save_board()
+        with self.store.batch():
+            success = CardOperations.update_card(self.board, card_id, updates, self.store.index)
+            if not success:
+                
+                logger.log(f'❌ Card {card_id} not found', 'INFO')
+                return False
+            self.store.mark_card_changed(card_id)
         
         logger.log(f'✅ Updated card {card_id}', 'INFO')
         return True
@@ -169,12 +207,15 @@ class KanbanBoard(DebugMixin):
         Returns:
             True if successful
         """
-        success = CardOperations.block_card(self.board, card_id, reason, agent)
-        if not success:
-            
-            logger.log(f'❌ Card {card_id} not found', 'INFO')
-            return False
-        self._save_board()
+        with self.store.batch():
+            card, from_column = self.store.find_card(card_id)
+            success = CardOperations.block_card(self.board, card_id, reason, agent, self.store.index)
+            if not success:
+                
+                logger.log(f'❌ Card {card_id} not found', 'INFO')
+                return False
+            self.store.mark_card_changed(card_id)
+            self._refresh_metrics_after_move(card, from_column, 'blocked')
         
         logger.log(f'🚫 Blocked card {card_id}: {reason}', 'INFO')
         return True
@@ -194,12 +235,15 @@ class KanbanBoard(DebugMixin):
         Returns:
             True if successful
         """
-        success = CardOperations.unblock_card(self.board, card_id, move_to_column, agent, resolution)
-        if not success:
-            
-            logger.log(f'❌ Card {card_id} not in blocked column', 'INFO')
-            return False
-        self._save_board()
+        with self.store.batch():
+            card, from_column = self.store.find_card(card_id)
+            success = CardOperations.unblock_card(self.board, card_id, move_to_column, agent, resolution, self.store.index)
+            if not success:
+                
+                logger.log(f'❌ Card {card_id} not in blocked column', 'INFO')
+                return False
+            self.store.mark_card_changed(card_id)
+            self._refresh_metrics_after_move(card, from_column, move_to_column)
         
         logger.log(f'✅ Unblocked card {card_id}', 'INFO')
         return True
@@ -217,12 +261,13 @@ class KanbanBoard(DebugMixin):
         Returns:
             True if successful
         """
-        success = CardOperations.update_test_status(self.board, card_id, test_status)
-        if not success:
-            
-            logger.log(f'❌ Card {card_id} not found', 'INFO')
-            return False
-        self._save_board()
+        with self.store.batch():
+            success = CardOperations.update_test_status(self.board, card_id, test_status, self.store.index)
+            if not success:
+                
+                logger.log(f'❌ Card {card_id} not found', 'INFO')
+                return False
+            self.store.mark_card_changed(card_id)
         
         logger.log(f'✅ Updated test status for card {card_id}', 'INFO')
         return True
@@ -241,12 +286,13 @@ class KanbanBoard(DebugMixin):
         Returns:
             True if successful
         """
-        success = CardOperations.verify_acceptance_criterion(self.board, card_id, criterion_index, verified_by)
-        if not success:
-            
-            logger.log(f'❌ Verification failed for card {card_id}', 'INFO')
-            return False
-        self._save_board()
+        with self.store.batch():
+            success = CardOperations.verify_acceptance_criterion(self.board, card_id, criterion_index, verified_by, self.store.index)
+            if not success:
+                
+                logger.log(f'❌ Verification failed for card {card_id}', 'INFO')
+                return False
+            self.store.mark_card_changed(card_id)
         
         logger.log(f'✅ Verified acceptance criterion for card {card_id}', 'INFO')
         return True
@@ -268,8 +314,9 @@ class KanbanBoard(DebugMixin):
             Created sprint dict
         """
         self.debug_log('Creating sprint', sprint_number=sprint_number, start_date=start_date, end_date=end_date, points=committed_story_points)
-        sprint = SprintManager.create_sprint(self.board, sprint_number, start_date, end_date, committed_story_points, features)
-        self._save_board()
+        with self.store.batch():
+            sprint = SprintManager.create_sprint(self.board, sprint_number, start_date, end_date, committed_story_points, features)
+            self.store.mark_board_changed('sprints')
         self.debug_log('Sprint created', sprint_id=sprint['sprint_id'])
         return sprint
 
@@ -285,8 +332,9 @@ class KanbanBoard(DebugMixin):
         Returns:
             Started sprint dict
         """
-        sprint = SprintManager.start_sprint(self.board, sprint_number)
-        self._save_board()
+        with self.store.batch():
+            sprint = SprintManager.start_sprint(self.board, sprint_number)
+            self._mark_sprints_changed()
         return sprint
 
     def complete_sprint(self, sprint_number: int, completed_story_points: int, retrospective_notes: Optional[str]=None) -> Dict:
@@ -303,10 +351,16 @@ class KanbanBoard(DebugMixin):
         Returns:
             Completed sprint dict
         """
-        sprint = SprintManager.complete_sprint(self.board, sprint_number, completed_story_points, retrospective_notes)
-        self._save_board()
+        with self.store.batch():
+            sprint = SprintManager.complete_sprint(self.board, sprint_number, completed_story_points, retrospective_notes)
+            self._mark_sprints_changed()
         return sprint
 
+    def _mark_sprints_changed(self) -> None:
+        """Record sprint list and current sprint as changed."""
+        self.store.mark_board_changed('sprints')
+        self.store.mark_board_changed('current_sprint')
+
     def get_sprint(self, sprint_number: int) -> Optional[Dict]:
         """Get sprint by number."""
         return SprintManager.get_sprint(self.board, sprint_number)
@@ -321,13 +375,15 @@ class KanbanBoard(DebugMixin):
 
     def update_sprint_metadata(self, sprint_number: int, metadata: Dict[str, Any]) -> None:
         """Update sprint metadata."""
-        SprintManager.update_sprint_metadata(self.board, sprint_number, metadata)
-        self._save_board()
+        with self.store.batch():
+            SprintManager.update_sprint_metadata(self.board, sprint_number, metadata)
+            self._mark_sprints_changed()
 
     def assign_card_to_sprint(self, card_id: str, sprint_number: int) -> None:
         """Assign a card to a sprint."""
-        SprintManager.assign_card_to_sprint(self.board, card_id, sprint_number)
-        self._save_board()
+        with self.store.batch():
+            SprintManager.assign_card_to_sprint(self.board, card_id, sprint_number, self.store.index)
+            self.store.mark_card_changed(card_id)
 
     def get_sprint_backlog(self, sprint_number: int) -> List[Dict]:
         """Get all cards assigned to a sprint."""
@@ -362,8 +418,8 @@ class KanbanBoard(DebugMixin):
         BoardVisualizer.print_board(self.board)
 
     def _find_card(self, card_id: str) -> tuple:
-        """Find a card by ID (backward compatibility)."""
-        return BoardModels.find_card(self.board, card_id)
+        """Find a card by ID via the card index (backward compatibility)."""
+        return self.store.find_card(card_id)
 
     def _get_column(self, column_id: str) -> Optional[Dict]:
         """Get column by ID (backward compatibility)."""
@@ -371,4 +427,5 @@ class KanbanBoard(DebugMixin):
 
     def _update_metrics(self) -> None:
         """Recalculate board metrics (backward compatibility)."""
-        MetricsCalculator.update_metrics(self.board)
\ No newline at end of file
+        MetricsCalculator.update_metrics(self.board)
+        self.store.mark_board_changed('current_sprint')
\ No newline at end of file
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Module: kanban/board/board_store.py
+
+WHY: Every card operation rewrote the whole board file, found cards with a
+     linear scan over all columns, and parallel pipelines sharing one board
+     file silently overwrote each other's updates (last full-board write won).
+
+RESPONSIBILITY:
+- Card index (card_id/task_id -> card, column) maintained across moves
+- Change journal of cards and board-level keys touched since the last save
+- Change batching: nested batch() blocks defer saves to one write
+- Concurrency-safe saves: exclusive file lock, merge of our journal onto
+  the latest on-disk board if another writer got there first, atomic rename
+
+PATTERNS:
+- Repository Pattern: Board state access and persistence behind one object
+- Unit of Work Pattern: Journal of changes committed in one save
+- Guard Clauses: Early returns for no-op saves
+"""
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterator, Optional, Set, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+from artemis_exceptions import FileReadError, wrap_exception
+from kanban.board.metrics_calculator import MetricsCalculator
+from kanban.board.models import BoardModels
+from kanban.board.persistence import BoardPersistence
+
+def _iter_columns(board: Dict) -> Iterator[Tuple[str, Dict]]:
+    """Yield (column_id, column) for dict- and list-format boards"""
+    columns = board.get('columns', {})
+    if isinstance(columns, dict):
+        yield from columns.items()
+        return
+    for column in columns:
+        yield column.get('column_id'), column
+
+
+class CardIndex:
+    """
+    Card lookup index keyed by card_id and task_id.
+
+    WHY: BoardModels.find_card scans every card of every column; the index
+         answers lookups in O(1) and is updated in place on add/move.
+    """
+
+    def __init__(self, board: Dict):
+        self._entries: Dict[str, Tuple[Dict, str]] = {}
+        for column_id, column in _iter_columns(board):
+            for card in column.get('cards', []):
+                self.add(card, column_id)
+
+    def add(self, card: Dict, column_id: str) -> None:
+        """Index a card under both of its identifiers"""
+        for key in (card.get('card_id'), card.get('task_id')):
+            if key:
+                self._entries[key] = (card, column_id)
+
+    def move(self, card: Dict, column_id: str) -> None:
+        """Record that a card now lives in another column"""
+        self.add(card, column_id)
+
+    def find(self, card_id: str) -> Tuple[Optional[Dict], Optional[str]]:
+        """Return (card, column_id) or (None, None)"""
+        return self._entries.get(card_id, (None, None))
+
+    def __len__(self) -> int:
+        return len({id(card) for card, _ in self._entries.values()})
+
+
+class BoardStore:
+    """
+    Indexed, journaled, lock-protected board state.
+
+    WHY: Lets KanbanBoard find cards in O(1), save once per batch of changes,
+         and lets several processes update different cards of the same board
+         file without clobbering each other.
+
+    Saves are read-modify-write under an exclusive lock on a sidecar
+    ``<board>.lock`` file. When the board file is unchanged since we last
+    loaded or wrote it, our in-memory board is written as-is. Otherwise the
+    latest board is re-read and only the cards and board keys we changed are
+    applied on top (per-card last writer wins).
+    """
+
+    def __init__(self, board_path: str):
+        """
+        Load board and build the card index.
+
+        Args:
+            board_path: Path to kanban_board.json file
+        """
+        self.board_path = board_path
+        self.lock_path = f"{board_path}.lock"
+        self._thread_lock = threading.RLock()
+        self._batch_depth = 0
+        self._dirty_cards: Set[str] = set()
+        self._dirty_keys: Set[str] = set()
+        self._pending = False
+        self.writes = 0
+        self._load()
+
+    # ------------------------------------------------------------------ state
+
+    def _load(self) -> None:
+        self.board = BoardPersistence.load_board(self.board_path)
+        self.index = CardIndex(self.board)
+        self._disk_signature = self._signature()
+        self._wip_baseline = self._wip_violations(self.board)
+
+    @staticmethod
+    def _wip_violations(board: Dict) -> int:
+        return board['metrics'].get('wip_violations_count', 0)
+
+    def _signature(self) -> Optional[Tuple[int, int, int]]:
+        """Identify the file version (atomic renames also change the inode)"""
+        try:
+            stat = os.stat(self.board_path)
+        except OSError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def find_card(self, card_id: str) -> Tuple[Optional[Dict], Optional[str]]:
+        """O(1) card lookup returning (card, column_id)"""
+        return self.index.find(card_id)
+
+    # ------------------------------------------------------------------ journal
+
+    def mark_card_changed(self, card_id: str) -> None:
+        """Record that a card (by card_id or task_id) was added or modified"""
+        card, _ = self.index.find(card_id)
+        self._dirty_cards.add(card.get('card_id', card_id) if card else card_id)
+        self._pending = True
+
+    def mark_board_changed(self, key: str) -> None:
+        """Record that a board-level key (e.g. 'sprints') was modified"""
+        self._dirty_keys.add(key)
+        self._pending = True
+
+    @contextmanager
+    def batch(self):
+        """
+        Defer saves until the outermost batch exits.
+
+        Usage:
+            with board.batch():
+                board.move_card(...)
+                board.update_test_status(...)
+        """
+        with self._thread_lock:
+            self._batch_depth += 1
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self.save()
+
+    # ------------------------------------------------------------------ persistence
+
+    def save(self) -> bool:
+        """
+        Persist pending changes (no-op inside a batch or with nothing pending).
+
+        Returns:
+            True if the board file was written
+
+        Raises:
+            FileReadError: If the board cannot be written
+        """
+        with self._thread_lock:
+            # Guard clauses: deferred or nothing to write
+            if self._batch_depth > 0 or not self._pending:
+                return False
+
+            with self._file_lock():
+                if self._signature() != self._disk_signature:
+                    self._merge_onto_disk_board()
+                self._write()
+
+            self._dirty_cards.clear()
+            self._dirty_keys.clear()
+            self._pending = False
+            return True
+
+    @contextmanager
+    def _file_lock(self):
+        # Guard clause: no advisory locking available
+        if fcntl is None:
+            yield
+            return
+
+        with open(self.lock_path, 'a') as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _merge_onto_disk_board(self) -> None:
+        """Apply our journal on top of the board another writer saved"""
+        ours, our_index = self.board, self.index
+        latest = BoardPersistence.load_board(self.board_path)
+        latest_index = CardIndex(latest)
+
+        for card_id in self._dirty_cards:
+            stale_card, stale_column = latest_index.find(card_id)
+            if stale_card is not None:
+                column = BoardModels.get_column(latest, stale_column)
+                column['cards'] = [c for c in column['cards'] if c is not stale_card]
+
+            card, column_id = our_index.find(card_id)
+            target = BoardModels.get_column(latest, column_id) if card else None
+            if target is not None:
+                target['cards'].append(card)
+
+        for key in self._dirty_keys:
+            if key in ours:
+                latest[key] = ours[key]
+
+        # WIP violations are counters: add ours to theirs instead of overwriting
+        metrics = latest['metrics']
+        metrics['wip_violations_count'] = (
+            self._wip_violations(latest) + self._wip_violations(ours) - self._wip_baseline
+        )
+        blocked = BoardModels.get_column(latest, 'blocked')
+        if blocked is not None:
+            metrics['blocked_items_count'] = len(blocked['cards'])
+        MetricsCalculator.update_metrics(latest)
+
+        self.board = latest
+        self.index = CardIndex(latest)
+
+    def _write(self) -> None:
+        """Atomically replace the board file (temp file + rename)"""
+        self.board['last_updated'] = datetime.utcnow().isoformat() + 'Z'
+        temp_path = f"{self.board_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, 'w') as f:
+                json.dump(self.board, f, indent=2)
+            os.replace(temp_path, self.board_path)
+        except Exception as e:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise wrap_exception(
+                e,
+                FileReadError,
+                "Failed to save Kanban board",
+                context={"board_path": self.board_path}
+            )
+
+        self.writes += 1
+        self._disk_signature = self._signature()
+        self._wip_baseline = self._wip_violations(self.board)
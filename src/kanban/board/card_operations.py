@@ -34,7 +34,7 @@ class CardOperations:
     """
 
     @staticmethod
-    def add_card(board: Dict, card: Dict) -> Dict:
+    def add_card(board: Dict, card: Dict, index: Optional[Any] = None) -> Dict:
         """
         Add a pre-built card to the backlog.
 
@@ -44,6 +44,7 @@ class CardOperations:
         Args:
             board: Board dictionary
             card: Card dictionary (from CardBuilder.build())
+            index: Optional CardIndex to keep in sync
 
         Returns:
             Added card dictionary
@@ -59,6 +60,8 @@ class CardOperations:
             )
 
         backlog['cards'].append(card)
+        if index is not None:
+            index.add(card, "backlog")
         return card
 
     @staticmethod
@@ -67,13 +70,14 @@ class CardOperations:
         card_id: str,
         to_column: str,
         agent: str = "system",
-        comment: str = ""
+        comment: str = "",
+        index: Optional[Any] = None
     ) -> bool:
         """
         Move a card between columns with WIP enforcement.
 
         WHY: Core workflow operation for card transitions
-        PERFORMANCE: O(n) for card search, O(1) for move
+        PERFORMANCE: O(1) card lookup with an index, O(column) removal
 
         Args:
             board: Board dictionary
@@ -81,11 +85,12 @@ class CardOperations:
             to_column: Destination column ID
             agent: Name of agent performing move
             comment: Optional comment
+            index: Optional CardIndex to keep in sync
 
         Returns:
             True if move succeeded, False otherwise
         """
-        card, from_column = BoardModels.find_card(board, card_id)
+        card, from_column = BoardModels.find_card(board, card_id, index)
 
         # Guard clause: card not found
         if not card:
@@ -107,7 +112,7 @@ class CardOperations:
         if from_col:
             from_col['cards'] = [
                 c for c in from_col['cards']
-                if c['card_id'] != card_id
+                if c is not card
             ]
 
         # Update card metadata
@@ -126,6 +131,8 @@ class CardOperations:
 
         # Add to new column
         to_col['cards'].append(card)
+        if index is not None:
+            index.move(card, to_column)
 
         # Mark completion if moved to done
         if to_column == "done":
@@ -153,23 +160,25 @@ class CardOperations:
     def update_card(
         board: Dict,
         card_id: str,
-        updates: Dict[str, Any]
+        updates: Dict[str, Any],
+        index: Optional[Any] = None
     ) -> bool:
         """
         Update card fields.
 
         WHY: Allows partial card updates
-        PERFORMANCE: O(n) for card search
+        PERFORMANCE: O(1) with an index, O(n) card search without
 
         Args:
             board: Board dictionary
             card_id: Card to update
             updates: Dictionary of field updates
+            index: Optional CardIndex for O(1) lookup
 
         Returns:
             True if successful
         """
-        card, _ = BoardModels.find_card(board, card_id)
+        card, _ = BoardModels.find_card(board, card_id, index)
 
         # Guard clause: card not found
         if not card:
@@ -187,7 +196,8 @@ class CardOperations:
         board: Dict,
         card_id: str,
         reason: str,
-        agent: str = "system"
+        agent: str = "system",
+        index: Optional[Any] = None
     ) -> bool:
         """
         Mark a card as blocked and move to Blocked column.
@@ -200,11 +210,12 @@ class CardOperations:
             card_id: Card to block
             reason: Reason for blocking
             agent: Agent reporting the block
+            index: Optional CardIndex to keep in sync
 
         Returns:
             True if successful
         """
-        card, _ = BoardModels.find_card(board, card_id)
+        card, _ = BoardModels.find_card(board, card_id, index)
 
         # Guard clause: card not found
         if not card:
@@ -219,7 +230,8 @@ class CardOperations:
             card_id,
             "blocked",
             agent,
-            f"BLOCKED: {reason}"
+            f"BLOCKED: {reason}",
+            index
         )
 
         # Update metrics
@@ -235,7 +247,8 @@ class CardOperations:
         card_id: str,
         move_to_column: str,
         agent: str = "system",
-        resolution: str = ""
+        resolution: str = "",
+        index: Optional[Any] = None
     ) -> bool:
         """
         Unblock a card and move to specified column.
@@ -249,11 +262,12 @@ class CardOperations:
             move_to_column: Where to move the card
             agent: Agent unblocking
             resolution: How the block was resolved
+            index: Optional CardIndex to keep in sync
 
         Returns:
             True if successful
         """
-        card, column = BoardModels.find_card(board, card_id)
+        card, column = BoardModels.find_card(board, card_id, index)
 
         # Guard clause: not in blocked column
         if not card or column != "blocked":
@@ -268,7 +282,8 @@ class CardOperations:
             card_id,
             move_to_column,
             agent,
-            f"UNBLOCKED: {resolution}"
+            f"UNBLOCKED: {resolution}",
+            index
         )
 
         # Update metrics
@@ -282,23 +297,25 @@ class CardOperations:
     def update_test_status(
         board: Dict,
         card_id: str,
-        test_status: Dict[str, Any]
+        test_status: Dict[str, Any],
+        index: Optional[Any] = None
     ) -> bool:
         """
         Update test status for a card.
 
         WHY: Tracks testing progress
-        PERFORMANCE: O(n) for card search
+        PERFORMANCE: O(1) with an index, O(n) card search without
 
         Args:
             board: Board dictionary
             card_id: Card to update
             test_status: Dictionary with test status fields
+            index: Optional CardIndex for O(1) lookup
 
         Returns:
             True if successful
         """
-        card, _ = BoardModels.find_card(board, card_id)
+        card, _ = BoardModels.find_card(board, card_id, index)
 
         # Guard clause: card not found
         if not card:
@@ -312,24 +329,26 @@ class CardOperations:
         board: Dict,
         card_id: str,
         criterion_index: int,
-        verified_by: str
+        verified_by: str,
+        index: Optional[Any] = None
     ) -> bool:
         """
         Mark an acceptance criterion as verified.
 
         WHY: Tracks acceptance criteria completion
-        PERFORMANCE: O(n) for card search
+        PERFORMANCE: O(1) with an index, O(n) card search without
 
         Args:
             board: Board dictionary
             card_id: Card ID
             criterion_index: Index of criterion to verify
             verified_by: Agent verifying
+            index: Optional CardIndex for O(1) lookup
 
         Returns:
             True if successful
         """
-        card, _ = BoardModels.find_card(board, card_id)
+        card, _ = BoardModels.find_card(board, card_id, index)
 
         # Guard clause: card not found
         if not card:
@@ -7,6 +7,7 @@ WHY: Separates metrics calculation logic from board operations
 
 RESPONSIBILITY:
 - Cycle time calculations (avg, min, max)
+- Incremental metric maintenance as cards complete
 - Throughput tracking
 - Velocity calculations
 - WIP and blocked item counts
@@ -30,12 +31,57 @@ class MetricsCalculator:
     PATTERNS: Pure functions for calculations
     """
 
+    @staticmethod
+    def record_card_completed(board: Dict, card: Dict) -> None:
+        """
+        Fold one newly completed card into the board metrics.
+
+        WHY: Recomputing from every done card on each completion grows with
+             board history; running totals make completion O(1)
+        PERFORMANCE: O(1), falls back to a full recalculation when the board
+                     predates the running totals
+
+        Args:
+            board: Board dictionary to update
+            card: Card that was just moved to done
+        """
+        metrics = board['metrics']
+
+        # Guard clause: running totals missing (older board file)
+        if 'cycle_time_samples' not in metrics:
+            MetricsCalculator.update_metrics(board)
+            return
+
+        if 'cycle_time_hours' in card:
+            cycle_time = card['cycle_time_hours']
+            first_sample = metrics['cycle_time_samples'] == 0
+            metrics['cycle_time_samples'] += 1
+            metrics['cycle_time_total_hours'] += cycle_time
+            metrics['cycle_time_avg_hours'] = round(
+                metrics['cycle_time_total_hours'] / metrics['cycle_time_samples'], 2
+            )
+            metrics['cycle_time_min_hours'] = round(
+                cycle_time if first_sample else min(metrics['cycle_time_min_hours'], cycle_time), 2
+            )
+            metrics['cycle_time_max_hours'] = round(
+                cycle_time if first_sample else max(metrics['cycle_time_max_hours'], cycle_time), 2
+            )
+
+        metrics['cards_completed'] += 1
+        metrics['throughput_current_sprint'] += 1
+        metrics['velocity_current_sprint'] += card.get('story_points', 0)
+
+        # Update current sprint if exists
+        if board.get('current_sprint'):
+            board['current_sprint']['completed_story_points'] = metrics['velocity_current_sprint']
+
     @staticmethod
     def update_metrics(board: Dict) -> None:
         """
         Recalculate all board metrics.
 
-        WHY: Updates metrics after card completion
+        WHY: Rebuilds metrics (and the running totals used by
+             record_card_completed) from the done column
         PERFORMANCE: O(n) where n is number of done cards
 
         Args:
@@ -48,6 +94,8 @@ class MetricsCalculator:
             return
 
         done_cards = done_column['cards']
+        board['metrics']['cycle_time_samples'] = 0
+        board['metrics']['cycle_time_total_hours'] = 0
 
         # Guard clause: no done cards
         if not done_cards:
@@ -77,6 +125,8 @@ class MetricsCalculator:
         if not cycle_times:
             return
 
+        board['metrics']['cycle_time_samples'] = len(cycle_times)
+        board['metrics']['cycle_time_total_hours'] = sum(cycle_times)
         board['metrics']['cycle_time_avg_hours'] = round(
             sum(cycle_times) / len(cycle_times), 2
         )
@@ -29,20 +29,30 @@ class BoardModels:
     """
 
     @staticmethod
-    def find_card(board: Dict, card_id: str) -> Tuple[Optional[Dict], Optional[str]]:
+    def find_card(
+        board: Dict,
+        card_id: str,
+        index: Optional[Any] = None
+    ) -> Tuple[Optional[Dict], Optional[str]]:
         """
         Find a card by ID, return (card, column_id).
 
         WHY: Centralized card lookup supporting multiple ID formats
-        PERFORMANCE: Uses generator expression for early termination
+        PERFORMANCE: O(1) with a CardIndex, otherwise a generator scan
+                     with early termination
 
         Args:
             board: Board dictionary
             card_id: Card identifier (task_id or card_id)
+            index: Optional CardIndex kept in sync with the board
 
         Returns:
             Tuple of (card_dict, column_id) or (None, None)
         """
+        # Guard clause: indexed lookup
+        if index is not None:
+            return index.find(card_id)
+
         columns = board.get('columns', {})
 
         # Guard clause: check column format
@@ -97,7 +97,8 @@ class BoardPersistence:
         Save board to JSON file with timestamp.
 
         WHY: Persists board state with audit trail
-        PERFORMANCE: Single file write operation
+        PERFORMANCE: Single file write operation (temp file + atomic rename,
+                     so readers never see a half-written board)
 
         Args:
             board: Board dictionary to save
@@ -108,9 +109,11 @@ class BoardPersistence:
         """
         board['last_updated'] = datetime.utcnow().isoformat() + 'Z'
 
+        temp_path = f"{board_path}.{os.getpid()}.tmp"
         try:
-            with open(board_path, 'w') as f:
+            with open(temp_path, 'w') as f:
                 json.dump(board, f, indent=2)
+            os.replace(temp_path, board_path)
         except Exception as e:
             raise wrap_exception(
                 e,
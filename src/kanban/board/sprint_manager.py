@@ -277,24 +277,26 @@ class SprintManager:
     def assign_card_to_sprint(
         board: Dict,
         card_id: str,
-        sprint_number: int
+        sprint_number: int,
+        index: Optional[Any] = None
     ) -> None:
         """
         Assign a card to a sprint.
 
         WHY: Sprint backlog management
-        PERFORMANCE: O(n) for card and sprint search
+        PERFORMANCE: O(n) for sprint search, O(1) card lookup with an index
 
         Args:
             board: Board dictionary
             card_id: Card ID to assign
             sprint_number: Sprint number to assign to
+            index: Optional CardIndex for O(1) lookup
 
         Raises:
             KanbanCardNotFoundError: If card not found
             KanbanBoardError: If sprint not found
         """
-        card, _ = BoardModels.find_card(board, card_id)
+        card, _ = BoardModels.find_card(board, card_id, index)
 
         # Guard clause: card not found
         if not card:
@@ -2,8 +2,8 @@ from artemis_logger import get_logger
 logger = get_logger('knowledge_graph')
 '\nBACKWARD COMPATIBILITY WRAPPER\n\nWHY: Maintain existing imports while code transitions to new package\nRESPONSIBILITY: Re-export all public APIs from knowledge_graph_pkg\nPATTERNS: Facade pattern - transparent delegation to new package\n\nThis file maintains backward compatibility with existing code.\nAll functionality has been moved to knowledge_graph_pkg/.\n\nOriginal file was 968 lines. Now refactored into modular package:\n- models.py (101 lines) - Data models\n- graph_operations.py (421 lines) - Node creation operations\n- query_operations.py (185 lines) - Query operations\n- relationship_operations.py (174 lines) - Relationship operations\n- storage_operations.py (89 lines) - Storage/persistence operations\n- query_builder.py (226 lines) - Query builders\n- knowledge_graph.py (270 lines) - Main orchestrator\n- __init__.py (54 lines) - Package exports\n\nTotal: ~1,520 lines (with documentation and proper separation)\nReduction: 968 lines -> package structure with clear responsibilities\n\nUsage (backward compatible):\n    from knowledge_graph import KnowledgeGraph, CodeFile, ADR\n    graph = KnowledgeGraph()\n    graph.add_file("auth.py", language="python")\n\nNew usage (recommended):\n    from knowledge_graph_pkg import KnowledgeGraph, CodeFile, ADR\n    graph = KnowledgeGraph()\n    graph.add_file("auth.py", language="python")\n'
 from knowledge_graph_pkg import *
-from knowledge_graph_pkg import KnowledgeGraph, MEMGRAPH_AVAILABLE, CodeFile, CodeClass, CodeFunction, ADR, Requirement, Task, CodeReview, GraphOperations, QueryOperations, RelationshipOperations, StorageOperations, QueryBuilder, CypherQueryTemplates
-__all__ = ['KnowledgeGraph', 'MEMGRAPH_AVAILABLE', 'CodeFile', 'CodeClass', 'CodeFunction', 'ADR', 'Requirement', 'Task', 'CodeReview', 'GraphOperations', 'QueryOperations', 'RelationshipOperations', 'StorageOperations', 'QueryBuilder', 'CypherQueryTemplates']
+from knowledge_graph_pkg import KnowledgeGraph, MEMGRAPH_AVAILABLE, resolve_backend, LocalGraphStore, CodeFile, CodeClass, CodeFunction, ADR, Requirement, Task, CodeReview, GraphOperations, QueryOperations, RelationshipOperations, StorageOperations, QueryBuilder, CypherQueryTemplates
+__all__ = ['KnowledgeGraph', 'MEMGRAPH_AVAILABLE', 'resolve_backend', 'LocalGraphStore', 'CodeFile', 'CodeClass', 'CodeFunction', 'ADR', 'Requirement', 'Task', 'CodeReview', 'GraphOperations', 'QueryOperations', 'RelationshipOperations', 'StorageOperations', 'QueryBuilder', 'CypherQueryTemplates']
 if __name__ == '__main__':
     graph = KnowledgeGraph(host='localhost', port=7687)
     
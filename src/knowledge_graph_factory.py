@@ -4,6 +4,7 @@ logger = get_logger('knowledge_graph_factory')
 import os
 from typing import Optional
 from knowledge_graph import KnowledgeGraph, MEMGRAPH_AVAILABLE
+from knowledge_graph_pkg import BACKEND_AUTO, BACKEND_LOCAL, BACKEND_MEMGRAPH
 
 class KnowledgeGraphFactory:
     """
@@ -19,8 +20,10 @@ class KnowledgeGraphFactory:
     Why Singleton: Knowledge Graph represents shared system state (code relationships)
     Why Factory: Encapsulates complex initialization logic and error handling
 
-    Graceful degradation: If Memgraph unavailable, returns None and logs warning
-    rather than crashing, allowing Artemis to continue without KG features.
+    Graceful degradation: If Memgraph is unavailable, falls back to the embedded
+    local graph (SQLite + in-memory adjacency) so KG-first context still works.
+    Set ARTEMIS_KG_BACKEND=memgraph to require Memgraph (returns None when it is
+    unreachable) or ARTEMIS_KG_BACKEND=local to skip Memgraph entirely.
     """
     _instance: Optional[KnowledgeGraph] = None
     _initialization_attempted: bool = False
@@ -43,20 +46,29 @@ class KnowledgeGraphFactory:
         if cls._initialization_attempted and (not cls._initialization_successful):
             return None
         cls._initialization_attempted = True
+        requested = os.getenv('ARTEMIS_KG_BACKEND', BACKEND_AUTO).lower()
+        if requested == BACKEND_LOCAL:
+            return cls._create_local_instance()
         if not MEMGRAPH_AVAILABLE:
             
-            logger.log('⚠️  Knowledge Graph unavailable: gqlalchemy not installed', 'INFO')
-            
-            logger.log('   Install with: pip install gqlalchemy', 'INFO')
-            
-            logger.log('   Agents will continue without knowledge graph integration', 'INFO')
-            return None
+            logger.log('⚠️  Memgraph unavailable: gqlalchemy not installed', 'INFO')
+            if requested == BACKEND_MEMGRAPH:
+                
+                logger.log('   Install with: pip install gqlalchemy', 'INFO')
+                
+                logger.log('   Agents will continue without knowledge graph integration', 'INFO')
+                return None
+            return cls._create_local_instance()
         if host is None:
             host = os.getenv('MEMGRAPH_HOST', 'localhost')
         if port is None:
             port = int(os.getenv('MEMGRAPH_PORT', '7687'))
         try:
-            cls._instance = KnowledgeGraph(host=host, port=port)
+            graph = KnowledgeGraph(host=host, port=port, backend=BACKEND_MEMGRAPH)
+            # KnowledgeGraph swallows connection errors and stays disconnected
+            if not graph._connected:
+                raise ConnectionError('Memgraph server not reachable')
+            cls._instance = graph
             cls._initialization_successful = True
             
             logger.log(f'✅ Knowledge Graph connected: {host}:{port}', 'INFO')
@@ -66,6 +78,8 @@ class KnowledgeGraphFactory:
             logger.log(f'⚠️  Knowledge Graph connection failed: {e}', 'INFO')
             
             logger.log(f'   Host: {host}, Port: {port}', 'INFO')
+            if requested != BACKEND_MEMGRAPH:
+                return cls._create_local_instance()
             
             logger.log('   Agents will continue without knowledge graph integration', 'INFO')
             
@@ -75,6 +89,31 @@ class KnowledgeGraphFactory:
             cls._initialization_successful = False
             return None
 
+    @classmethod
+    def _create_local_instance(cls) -> Optional[KnowledgeGraph]:
+        """
+        Create the embedded local Knowledge Graph
+
+        Why: Keeps KG-first token savings available on laptops and CI where no
+        Memgraph server is running. Storage path comes from ARTEMIS_KG_DB.
+
+        Returns:
+            KnowledgeGraph backed by LocalGraphStore, or None if it cannot be opened
+        """
+        try:
+            cls._instance = KnowledgeGraph(backend=BACKEND_LOCAL)
+            cls._initialization_successful = True
+            
+            logger.log(f'✅ Knowledge Graph using embedded local backend: {cls._instance.db.db_path}', 'INFO')
+            return cls._instance
+        except Exception as e:
+            
+            logger.log(f'⚠️  Local Knowledge Graph unavailable: {e}', 'INFO')
+            
+            logger.log('   Agents will continue without knowledge graph integration', 'INFO')
+            cls._initialization_successful = False
+            return None
+
     @classmethod
     def reset(cls) -> None:
         """Reset singleton instance (useful for testing)"""
@@ -10,10 +10,20 @@ This package provides graph-based code analysis including:
 - Architectural validation
 - Decision lineage
 - Multi-hop queries
+
+Storage is pluggable: Memgraph when available, otherwise an embedded
+SQLite graph (LocalGraphStore) with in-memory adjacency.
 """
 
 # Main orchestrator
-from .knowledge_graph import KnowledgeGraph, MEMGRAPH_AVAILABLE
+from .knowledge_graph import (
+    KnowledgeGraph,
+    MEMGRAPH_AVAILABLE,
+    BACKEND_MEMGRAPH,
+    BACKEND_LOCAL,
+    BACKEND_AUTO,
+    resolve_backend,
+)
 
 # Data models
 from .models import (
@@ -32,6 +42,15 @@ from .query_operations import QueryOperations
 from .relationship_operations import RelationshipOperations
 from .storage_operations import StorageOperations
 
+# Embedded backend (used when Memgraph is absent)
+from .local_graph_store import LocalGraphStore
+from .local_operations import (
+    LocalGraphOperations,
+    LocalQueryOperations,
+    LocalRelationshipOperations,
+    LocalStorageOperations,
+)
+
 # Query builders (for advanced usage)
 from .query_builder import QueryBuilder, CypherQueryTemplates
 
@@ -40,6 +59,10 @@ __all__ = [
     # Main class
     "KnowledgeGraph",
     "MEMGRAPH_AVAILABLE",
+    "BACKEND_MEMGRAPH",
+    "BACKEND_LOCAL",
+    "BACKEND_AUTO",
+    "resolve_backend",
 
     # Data models
     "CodeFile",
@@ -56,6 +79,13 @@ __all__ = [
     "RelationshipOperations",
     "StorageOperations",
 
+    # Embedded backend
+    "LocalGraphStore",
+    "LocalGraphOperations",
+    "LocalQueryOperations",
+    "LocalRelationshipOperations",
+    "LocalStorageOperations",
+
     # Query builders
     "QueryBuilder",
     "CypherQueryTemplates",
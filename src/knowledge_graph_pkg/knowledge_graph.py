@@ -1,6 +1,7 @@
 from artemis_logger import get_logger
 logger = get_logger('knowledge_graph')
 '\nWHY: Main orchestrator for knowledge graph operations\nRESPONSIBILITY: Coordinate all graph operations through delegation\nPATTERNS: Facade pattern - provide simple interface to complex subsystems\n\nThis is the main entry point for knowledge graph functionality.\nIt delegates to specialized operation classes.\n'
+import os
 from typing import Dict, List, Optional, Any
 try:
     from gqlalchemy import Memgraph
@@ -14,6 +15,30 @@ from .query_operations import QueryOperations
 from .relationship_operations import RelationshipOperations
 from .storage_operations import StorageOperations
 from .query_builder import QueryBuilder, CypherQueryTemplates
+from .local_graph_store import LocalGraphStore
+from .local_operations import LocalGraphOperations, LocalQueryOperations, LocalRelationshipOperations, LocalStorageOperations
+BACKEND_MEMGRAPH = 'memgraph'
+BACKEND_LOCAL = 'local'
+BACKEND_AUTO = 'auto'
+
+def resolve_backend(backend: Optional[str]=None) -> str:
+    """
+    Resolve which storage backend a KnowledgeGraph should use
+
+    WHY: Let laptops and CI get KG features without a Memgraph server
+
+    Args:
+        backend: 'memgraph', 'local' or 'auto' (default: ARTEMIS_KG_BACKEND or 'auto')
+
+    Returns:
+        'memgraph' or 'local' ('auto' picks memgraph only when gqlalchemy is installed)
+    """
+    backend = (backend or os.getenv('ARTEMIS_KG_BACKEND', BACKEND_AUTO)).lower()
+    if backend not in (BACKEND_MEMGRAPH, BACKEND_LOCAL, BACKEND_AUTO):
+        raise ValueError(f"Unknown knowledge graph backend '{backend}' (expected memgraph, local or auto)")
+    if backend != BACKEND_AUTO:
+        return backend
+    return BACKEND_MEMGRAPH if MEMGRAPH_AVAILABLE else BACKEND_LOCAL
 
 class KnowledgeGraph:
     """
@@ -29,23 +54,29 @@ class KnowledgeGraph:
     - Multi-hop queries
     """
 
-    def __init__(self, host: str='localhost', port: int=7687):
+    def __init__(self, host: str='localhost', port: int=7687, backend: Optional[str]=None, db_path: Optional[str]=None):
         """
-        Initialize connection to Memgraph
+        Initialize connection to Memgraph or open the embedded local graph
 
         WHY: Centralize connection management and setup
 
         Args:
             host: Memgraph host
             port: Memgraph port (default: 7687)
+            backend: 'memgraph', 'local' or 'auto' (see resolve_backend)
+            db_path: SQLite file for the local backend (":memory:" for tests)
 
         Raises:
-            ImportError: If gqlalchemy not installed
+            ImportError: If the memgraph backend is requested but gqlalchemy is not installed
         """
+        self.backend = resolve_backend(backend)
+        self._connected = False
+        if self.backend == BACKEND_LOCAL:
+            self._init_local(db_path)
+            return
         if not MEMGRAPH_AVAILABLE:
             raise ImportError('gqlalchemy not installed. Run: pip install gqlalchemy')
         self.db = Memgraph(host=host, port=port)
-        self._connected = False
         try:
             self._storage_ops = StorageOperations(self.db)
             self._storage_ops.create_indexes()
@@ -56,6 +87,19 @@ class KnowledgeGraph:
         except Exception:
             pass
 
+    def _init_local(self, db_path: Optional[str]) -> None:
+        """
+        Wire the operation classes to the embedded SQLite graph
+
+        WHY: Same facade surface, no external service required
+        """
+        self.db = LocalGraphStore(db_path)
+        self._storage_ops = LocalStorageOperations(self.db)
+        self._graph_ops = LocalGraphOperations(self.db)
+        self._query_ops = LocalQueryOperations(self.db)
+        self._rel_ops = LocalRelationshipOperations(self.db)
+        self._connected = True
+
     def query(self, cypher_query: str, params: Optional[Dict]=None) -> List[Dict]:
         """
         Execute a Cypher query and return results
@@ -67,9 +111,11 @@ class KnowledgeGraph:
             params: Optional query parameters
 
         Returns:
-            Query results from execute_and_fetch, or empty list if not connected
+            Query results from execute_and_fetch, or empty list if not connected.
+            The local backend has no Cypher engine and always returns an empty list;
+            use the typed query methods (e.g. find_adrs_for_requirements) instead.
         """
-        if not self._connected:
+        if not self._connected or self.backend == BACKEND_LOCAL:
             return []
         try:
             results = list(self.db.execute_and_fetch(cypher_query, params or {}))
@@ -138,6 +184,14 @@ class KnowledgeGraph:
         """Link task to file. See RelationshipOperations.link_task_to_file for details."""
         self._rel_ops.link_task_to_file(card_id, file_path)
 
+    def link_adr_influence(self, adr_id: str, influenced_by: str) -> None:
+        """Link ADR to an earlier ADR. See RelationshipOperations.link_adr_influence for details."""
+        self._rel_ops.link_adr_influence(adr_id, influenced_by)
+
+    def add_test_coverage(self, test_name: str, function_name: str, file_path: str) -> None:
+        """Record test coverage. See RelationshipOperations.add_test_coverage for details."""
+        self._rel_ops.add_test_coverage(test_name, function_name, file_path)
+
     def get_file(self, path: str) -> Optional[Dict]:
         """Get file details. See QueryOperations.get_file for details."""
         return self._query_ops.get_file(path)
@@ -170,6 +224,52 @@ class KnowledgeGraph:
         """Get graph statistics. See QueryOperations.get_graph_stats for details."""
         return self._query_ops.get_graph_stats()
 
+    def _lookup(self, method: str, *args: Any) -> List[Dict]:
+        """
+        Run a pattern lookup with query()'s contract
+
+        WHY: ai_query strategies use the graph as optional context, so an
+             unavailable graph or a failed read yields no patterns
+        """
+        if not self._connected:
+            return []
+        try:
+            return getattr(self._query_ops, method)(*args)
+        except Exception:
+            return []
+
+    def find_adrs_for_requirements(self, keyword: str, req_type: str, limit: int=3) -> List[Dict]:
+        """Find ADRs for matching requirements. See QueryOperations.find_adrs_for_requirements for details."""
+        return self._lookup('find_adrs_for_requirements', keyword, req_type, limit)
+
+    def find_implementations(self, keyword: str, file_type: str='python', limit: int=3) -> List[Dict]:
+        """Find files of similar tasks. See QueryOperations.find_implementations for details."""
+        return self._lookup('find_implementations', keyword, file_type, limit)
+
+    def find_reviews_with_critical_issues(self, file_type: str, limit: int=5) -> List[Dict]:
+        """Find reviews with critical issues. See QueryOperations.find_reviews_with_critical_issues for details."""
+        return self._lookup('find_reviews_with_critical_issues', file_type, limit)
+
+    def get_severe_project_issues(self, limit: int=10) -> List[Dict]:
+        """Get severe project analysis issues. See QueryOperations.get_severe_project_issues for details."""
+        return self._lookup('get_severe_project_issues', limit)
+
+    def get_active_requirements(self, limit: int=20) -> List[Dict]:
+        """Get active requirements. See QueryOperations.get_active_requirements for details."""
+        return self._lookup('get_active_requirements', limit)
+
+    def get_sprint_history(self, team_name: str, before_sprint: int, limit: int=5) -> List[Dict]:
+        """Get earlier sprint velocity. See QueryOperations.get_sprint_history for details."""
+        return self._lookup('get_sprint_history', team_name, before_sprint, limit)
+
+    def get_retrospectives(self, team_name: str, before_sprint: int, limit: int=3) -> List[Dict]:
+        """Get earlier retrospectives. See QueryOperations.get_retrospectives for details."""
+        return self._lookup('get_retrospectives', team_name, before_sprint, limit)
+
+    def find_error_solutions(self, error_type: str, stage_name: str, limit: int=5) -> List[Dict]:
+        """Find solutions for similar errors. See QueryOperations.find_error_solutions for details."""
+        return self._lookup('find_error_solutions', error_type, stage_name, limit)
+
     def clear_all(self) -> None:
         """Clear entire graph. See StorageOperations.clear_all for details."""
         self._storage_ops.clear_all()
@@ -177,4 +277,4 @@ class KnowledgeGraph:
     def export_to_json(self, output_path: str) -> None:
         """Export to JSON. See StorageOperations.export_to_json for details."""
         self._storage_ops.export_to_json(output_path)
-__all__ = ['KnowledgeGraph', 'MEMGRAPH_AVAILABLE']
\ No newline at end of file
+__all__ = ['KnowledgeGraph', 'MEMGRAPH_AVAILABLE', 'resolve_backend', 'BACKEND_MEMGRAPH', 'BACKEND_LOCAL', 'BACKEND_AUTO']
\ No newline at end of file
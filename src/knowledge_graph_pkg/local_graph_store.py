@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+WHY: Provide an embedded graph store so the knowledge graph works without Memgraph
+RESPONSIBILITY: Persist nodes and edges in SQLite and serve reads from in-memory adjacency
+PATTERNS: Repository pattern for storage, write-through cache for reads
+
+Nodes are keyed by (label, key) where key is the natural identifier of the
+entity (file path, ADR id, "file_path::name" for classes and functions).
+Edges are keyed by (source, relationship, target). Every write goes to SQLite
+and to the in-memory maps, so traversals never touch disk.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+NodeRef = Tuple[str, str]
+
+DEFAULT_LOCAL_GRAPH_DB = "../../.artemis_data/knowledge_graph.db"
+
+
+class LocalGraphStore:
+    """
+    WHY: Embedded replacement for the Memgraph connection used by the operation classes
+    RESPONSIBILITY: Node/edge CRUD with SQLite durability and O(1) adjacency lookups
+    PATTERNS: Write-through cache - SQLite is the source of truth, dicts serve reads
+
+    Thread-safe: all mutations and reads are guarded by a re-entrant lock so
+    the store can be shared by the KnowledgeGraphFactory singleton.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Open (or create) the local graph database
+
+        Args:
+            db_path: SQLite file path, ":memory:" for a throwaway graph.
+                     Defaults to ARTEMIS_KG_DB or .artemis_data/knowledge_graph.db
+        """
+        db_path = db_path or os.getenv("ARTEMIS_KG_DB", DEFAULT_LOCAL_GRAPH_DB)
+
+        if db_path != ":memory:" and not os.path.isabs(db_path):
+            script_dir = os.path.dirname(os.path.abspath(__file__))
+            db_path = os.path.join(script_dir, db_path)
+
+        if db_path != ":memory:":
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+
+        self.db_path = db_path
+        self._lock = threading.RLock()
+        self._batch_depth = 0
+
+        self.connection = sqlite3.connect(db_path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+
+        self._nodes: Dict[NodeRef, Dict[str, Any]] = {}
+        self._labels: Dict[str, Set[str]] = {}
+        self._out: Dict[NodeRef, Dict[str, Set[NodeRef]]] = {}
+        self._in: Dict[NodeRef, Dict[str, Set[NodeRef]]] = {}
+        self._edge_count = 0
+
+        self._create_tables()
+        self._load_cache()
+
+    def _create_tables(self) -> None:
+        """Create node/edge tables and adjacency indexes if missing"""
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS nodes (
+                label TEXT NOT NULL,
+                key TEXT NOT NULL,
+                props TEXT NOT NULL,  -- JSON object
+                PRIMARY KEY (label, key)
+            );
+
+            CREATE TABLE IF NOT EXISTS edges (
+                src_label TEXT NOT NULL,
+                src_key TEXT NOT NULL,
+                rel TEXT NOT NULL,
+                dst_label TEXT NOT NULL,
+                dst_key TEXT NOT NULL,
+                props TEXT NOT NULL,  -- JSON object
+                PRIMARY KEY (src_label, src_key, rel, dst_label, dst_key)
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_edges_out ON edges(src_label, src_key, rel);
+            CREATE INDEX IF NOT EXISTS idx_edges_in ON edges(dst_label, dst_key, rel);
+        """)
+        self.connection.commit()
+
+    def _load_cache(self) -> None:
+        """Populate in-memory maps from SQLite (one scan per table at startup)"""
+        for label, key, props in self.connection.execute("SELECT label, key, props FROM nodes"):
+            self._cache_node((label, key), json.loads(props))
+
+        rows = self.connection.execute(
+            "SELECT src_label, src_key, rel, dst_label, dst_key FROM edges"
+        )
+        for src_label, src_key, rel, dst_label, dst_key in rows:
+            self._cache_edge((src_label, src_key), rel, (dst_label, dst_key))
+
+    def _cache_node(self, ref: NodeRef, props: Dict[str, Any]) -> None:
+        self._nodes[ref] = props
+        self._labels.setdefault(ref[0], set()).add(ref[1])
+
+    def _cache_edge(self, src: NodeRef, rel: str, dst: NodeRef) -> bool:
+        targets = self._out.setdefault(src, {}).setdefault(rel, set())
+        if dst in targets:
+            return False
+        targets.add(dst)
+        self._in.setdefault(dst, {}).setdefault(rel, set()).add(src)
+        self._edge_count += 1
+        return True
+
+    def _commit(self) -> None:
+        if self._batch_depth == 0:
+            self.connection.commit()
+
+    @contextmanager
+    def batch(self) -> Iterator["LocalGraphStore"]:
+        """
+        Group several writes into one SQLite transaction
+
+        WHY: Bulk ingestion (e.g. a whole project analysis) should pay one
+             commit instead of one per node/edge.
+        """
+        with self._lock:
+            self._batch_depth += 1
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+                self._commit()
+
+    # ------------------------------------------------------------------ nodes
+
+    def upsert_node(self, label: str, key: str, props: Dict[str, Any]) -> None:
+        """MERGE semantics: create the node or update the given properties"""
+        with self._lock:
+            ref = (label, key)
+            merged = dict(self._nodes.get(ref, {}))
+            merged.update(props)
+            self.connection.execute(
+                "INSERT OR REPLACE INTO nodes (label, key, props) VALUES (?, ?, ?)",
+                (label, key, json.dumps(merged, default=str))
+            )
+            self._commit()
+            self._cache_node(ref, merged)
+
+    def get_node(self, label: str, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of node properties or None"""
+        with self._lock:
+            props = self._nodes.get((label, key))
+            return dict(props) if props is not None else None
+
+    def has_node(self, label: str, key: str) -> bool:
+        return (label, key) in self._nodes
+
+    def iter_nodes(self, label: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """Snapshot of (key, props) for every node with the given label"""
+        with self._lock:
+            return [(key, dict(self._nodes[(label, key)])) for key in self._labels.get(label, ())]
+
+    def count_nodes(self, label: str) -> int:
+        return len(self._labels.get(label, ()))
+
+    def delete_node(self, label: str, key: str) -> None:
+        """DETACH DELETE semantics: remove the node and every incident edge"""
+        with self._lock:
+            ref = (label, key)
+            if ref not in self._nodes:
+                return
+
+            for rel, targets in self._out.pop(ref, {}).items():
+                for dst in targets:
+                    self._in[dst][rel].discard(ref)
+                    self._edge_count -= 1
+            for rel, sources in self._in.pop(ref, {}).items():
+                for src in sources:
+                    self._out[src][rel].discard(ref)
+                    self._edge_count -= 1
+
+            del self._nodes[ref]
+            self._labels[label].discard(key)
+
+            self.connection.execute("DELETE FROM nodes WHERE label = ? AND key = ?", ref)
+            self.connection.execute(
+                "DELETE FROM edges WHERE (src_label = ? AND src_key = ?) OR (dst_label = ? AND dst_key = ?)",
+                (label, key, label, key)
+            )
+            self._commit()
+
+    # ------------------------------------------------------------------ edges
+
+    def add_edge(
+        self,
+        src: NodeRef,
+        rel: str,
+        dst: NodeRef,
+        props: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """
+        MERGE an edge between two existing nodes
+
+        Returns:
+            False if either endpoint is missing (mirrors a failed Cypher MATCH)
+        """
+        with self._lock:
+            if src not in self._nodes or dst not in self._nodes:
+                return False
+
+            self.connection.execute(
+                "INSERT OR REPLACE INTO edges (src_label, src_key, rel, dst_label, dst_key, props) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (src[0], src[1], rel, dst[0], dst[1], json.dumps(props or {}, default=str))
+            )
+            self._commit()
+            self._cache_edge(src, rel, dst)
+            return True
+
+    def out_neighbors(self, ref: NodeRef, rels: Iterable[str]) -> Set[NodeRef]:
+        """Targets reachable from ref through any of the given relationship types"""
+        with self._lock:
+            by_rel = self._out.get(ref, {})
+            return {dst for rel in rels for dst in by_rel.get(rel, ())}
+
+    def in_neighbors(self, ref: NodeRef, rels: Iterable[str]) -> Set[NodeRef]:
+        """Sources pointing at ref through any of the given relationship types"""
+        with self._lock:
+            by_rel = self._in.get(ref, {})
+            return {src for rel in rels for src in by_rel.get(rel, ())}
+
+    def count_edges(self) -> int:
+        return self._edge_count
+
+    # ------------------------------------------------------------------ bulk
+
+    def clear(self) -> None:
+        """Remove every node and edge"""
+        with self._lock:
+            self.connection.execute("DELETE FROM edges")
+            self.connection.execute("DELETE FROM nodes")
+            self._commit()
+            self._nodes.clear()
+            self._labels.clear()
+            self._out.clear()
+            self._in.clear()
+            self._edge_count = 0
+
+    def dump(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Full graph as plain dicts (used by JSON export)"""
+        with self._lock:
+            nodes = [
+                {"label": label, "key": key, "properties": json.loads(props)}
+                for label, key, props in self.connection.execute(
+                    "SELECT label, key, props FROM nodes ORDER BY label, key"
+                )
+            ]
+            edges = [
+                {
+                    "type": rel,
+                    "from": {"label": src_label, "key": src_key},
+                    "to": {"label": dst_label, "key": dst_key},
+                    "properties": json.loads(props),
+                }
+                for src_label, src_key, rel, dst_label, dst_key, props in self.connection.execute(
+                    "SELECT src_label, src_key, rel, dst_label, dst_key, props FROM edges"
+                )
+            ]
+            return {"nodes": nodes, "edges": edges}
+
+    def close(self) -> None:
+        with self._lock:
+            self.connection.commit()
+            self.connection.close()
+
+
+__all__ = ["LocalGraphStore", "DEFAULT_LOCAL_GRAPH_DB"]
@@ -0,0 +1,582 @@
+#!/usr/bin/env python3
+"""
+WHY: Implement the knowledge graph operation surface on top of LocalGraphStore
+RESPONSIBILITY: Node creation, relationships, queries and storage without Cypher
+PATTERNS: Strategy pattern - drop-in replacements for the Memgraph operation classes
+
+Each class mirrors the method signatures and return shapes of its Memgraph
+counterpart (GraphOperations, RelationshipOperations, QueryOperations,
+StorageOperations) so KnowledgeGraph can delegate to either backend.
+Traversals run over the store's in-memory adjacency maps.
+"""
+
+import json
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .local_graph_store import LocalGraphStore, NodeRef
+
+DEPENDENCY_RELATIONSHIPS = ("IMPORTS", "CALLS", "DEPENDS_ON")
+
+
+def _descending(rows: List[Dict], field: str) -> List[Dict]:
+    """ORDER BY field DESC with missing values last (stable for ties)"""
+    present = [row for row in rows if row.get(field) is not None]
+    missing = [row for row in rows if row.get(field) is None]
+    return sorted(present, key=lambda row: row[field], reverse=True) + missing
+
+
+def _member_key(file_path: str, name: str) -> str:
+    """Classes and functions are unique per (file_path, name), like the Cypher MERGE keys"""
+    return f"{file_path}::{name}"
+
+
+class LocalGraphOperations:
+    """
+    WHY: Node creation for the embedded backend
+    RESPONSIBILITY: Same contract as GraphOperations
+    PATTERNS: Delegation pattern - receives LocalGraphStore
+    """
+
+    def __init__(self, store: LocalGraphStore):
+        self.store = store
+
+    def add_file(self, path: str, language: str, lines: int = 0, module: Optional[str] = None) -> str:
+        """Add or update a code file node"""
+        self.store.upsert_node("File", path, {
+            "path": path,
+            "language": language,
+            "lines": lines,
+            "last_modified": datetime.now().isoformat(),
+            "module": module,
+        })
+        return path
+
+    def add_class(
+        self,
+        name: str,
+        file_path: str,
+        public: bool = True,
+        abstract: bool = False,
+        lines: int = 0
+    ) -> str:
+        """Add a class contained in an existing file"""
+        if not self.store.has_node("File", file_path):
+            return name
+
+        key = _member_key(file_path, name)
+        with self.store.batch():
+            self.store.upsert_node("Class", key, {
+                "name": name,
+                "file_path": file_path,
+                "public": public,
+                "abstract": abstract,
+                "lines": lines,
+            })
+            self.store.add_edge(("File", file_path), "CONTAINS", ("Class", key))
+        return name
+
+    def add_function(
+        self,
+        name: str,
+        file_path: str,
+        class_name: Optional[str] = None,
+        params: Optional[List[str]] = None,
+        returns: Optional[str] = None,
+        public: bool = True,
+        complexity: int = 1
+    ) -> str:
+        """Add a function (and link it to its class when it is a method)"""
+        if not self.store.has_node("File", file_path):
+            return name
+
+        key = _member_key(file_path, name)
+        with self.store.batch():
+            self.store.upsert_node("Function", key, {
+                "name": name,
+                "file_path": file_path,
+                "params": params or [],
+                "returns": returns,
+                "public": public,
+                "complexity": complexity,
+                "class_name": class_name,
+            })
+            self.store.add_edge(("File", file_path), "CONTAINS", ("Function", key))
+
+            if class_name:
+                self.store.add_edge(
+                    ("Class", _member_key(file_path, class_name)), "HAS_METHOD", ("Function", key)
+                )
+        return name
+
+    def add_adr(
+        self,
+        adr_id: str,
+        title: str,
+        status: str,
+        rationale: Optional[str] = None,
+        impacts: Optional[List[str]] = None
+    ) -> str:
+        """Add an ADR and link it to the files it impacts"""
+        with self.store.batch():
+            self.store.upsert_node("ADR", adr_id, {
+                "adr_id": adr_id,
+                "title": title,
+                "date": datetime.now().isoformat(),
+                "status": status,
+                "rationale": rationale,
+            })
+            for file_path in impacts or []:
+                self.store.add_edge(("ADR", adr_id), "IMPACTS", ("File", file_path))
+        return adr_id
+
+    def add_requirement(
+        self,
+        req_id: str,
+        title: str,
+        type: str,
+        priority: str,
+        status: str = "active"
+    ) -> str:
+        """Add a requirement node"""
+        self.store.upsert_node("Requirement", req_id, {
+            "req_id": req_id,
+            "title": title,
+            "type": type,
+            "priority": priority,
+            "status": status,
+            "created": datetime.now().isoformat(),
+        })
+        return req_id
+
+    def add_task(
+        self,
+        card_id: str,
+        title: str,
+        priority: str,
+        status: str,
+        assigned_agents: Optional[List[str]] = None
+    ) -> str:
+        """Add a task/card node"""
+        self.store.upsert_node("Task", card_id, {
+            "card_id": card_id,
+            "title": title,
+            "priority": priority,
+            "status": status,
+            "assigned_agents": assigned_agents or [],
+            "created": datetime.now().isoformat(),
+        })
+        return card_id
+
+    def add_code_review(
+        self,
+        review_id: str,
+        card_id: str,
+        status: str,
+        score: int,
+        critical_issues: int = 0,
+        high_issues: int = 0
+    ) -> str:
+        """Add a code review and link it to its task"""
+        with self.store.batch():
+            self.store.upsert_node("CodeReview", review_id, {
+                "review_id": review_id,
+                "card_id": card_id,
+                "status": status,
+                "score": score,
+                "critical_issues": critical_issues,
+                "high_issues": high_issues,
+                "created": datetime.now().isoformat(),
+            })
+            self.store.add_edge(("Task", card_id), "HAS_REVIEW", ("CodeReview", review_id))
+        return review_id
+
+    def update_file_metrics(self, file_path: str, lines: int, complexity: Optional[int] = None) -> bool:
+        """Update metrics of an existing file"""
+        if not self.store.has_node("File", file_path):
+            return False
+
+        props: Dict[str, Any] = {"lines": lines, "last_modified": datetime.now().isoformat()}
+        if complexity is not None:
+            props["complexity"] = complexity
+
+        self.store.upsert_node("File", file_path, props)
+        return True
+
+    def delete_file(self, file_path: str) -> bool:
+        """Delete a file and all its relationships"""
+        self.store.delete_node("File", file_path)
+        return True
+
+
+class LocalRelationshipOperations:
+    """
+    WHY: Edge creation for the embedded backend
+    RESPONSIBILITY: Same contract as RelationshipOperations
+    PATTERNS: Delegation pattern - receives LocalGraphStore
+    """
+
+    def __init__(self, store: LocalGraphStore):
+        self.store = store
+
+    def _created(self) -> Dict[str, str]:
+        return {"created": datetime.now().isoformat()}
+
+    def add_dependency(self, from_file: str, to_file: str, relationship: str = "IMPORTS") -> None:
+        self.store.add_edge(("File", from_file), relationship, ("File", to_file), self._created())
+
+    def add_function_call(self, caller: str, callee: str, caller_file: str, callee_file: str) -> None:
+        self.store.add_edge(
+            ("Function", _member_key(caller_file, caller)),
+            "CALLS",
+            ("Function", _member_key(callee_file, callee)),
+            self._created()
+        )
+
+    def link_requirement_to_adr(self, req_id: str, adr_id: str) -> None:
+        linked = self.store.add_edge(("ADR", adr_id), "ADDRESSES", ("Requirement", req_id))
+        if linked:
+            self.store.upsert_node("ADR", adr_id, {"last_updated": datetime.now().isoformat()})
+
+    def link_requirement_to_task(self, req_id: str, card_id: str) -> None:
+        self.store.add_edge(("Task", card_id), "IMPLEMENTS", ("Requirement", req_id))
+
+    def link_adr_to_file(self, adr_id: str, file_path: str, relationship: str = "IMPLEMENTED_BY") -> None:
+        self.store.add_edge(("ADR", adr_id), relationship, ("File", file_path), self._created())
+
+    def link_task_to_file(self, card_id: str, file_path: str) -> None:
+        self.store.add_edge(("Task", card_id), "MODIFIED", ("File", file_path))
+
+    def link_adr_influence(self, adr_id: str, influenced_by: str) -> None:
+        self.store.add_edge(("ADR", adr_id), "INFLUENCED_BY", ("ADR", influenced_by), self._created())
+
+    def add_test_coverage(self, test_name: str, function_name: str, file_path: str) -> None:
+        with self.store.batch():
+            self.store.upsert_node("Test", test_name, {"name": test_name})
+            self.store.add_edge(
+                ("Test", test_name), "COVERS", ("Function", _member_key(file_path, function_name))
+            )
+
+
+class LocalQueryOperations:
+    """
+    WHY: Read-only queries for the embedded backend
+    RESPONSIBILITY: Same contract and result shapes as QueryOperations
+    PATTERNS: Delegation pattern - receives LocalGraphStore; BFS/DFS over adjacency maps
+    """
+
+    def __init__(self, store: LocalGraphStore):
+        self.store = store
+
+    def get_file(self, path: str) -> Optional[Dict]:
+        node = self.store.get_node("File", path)
+        if node is None:
+            return None
+
+        return {
+            "path": node.get("path"),
+            "language": node.get("language"),
+            "lines": node.get("lines"),
+            "module": node.get("module"),
+            "last_modified": node.get("last_modified"),
+        }
+
+    def get_impact_analysis(self, file_path: str, depth: int = 3) -> List[Dict]:
+        """
+        Breadth-first walk over reverse dependency edges
+
+        Each dependent is reported once, at its shortest distance.
+        """
+        origin = ("File", file_path)
+        if not self.store.has_node(*origin):
+            return []
+
+        distances: Dict[NodeRef, int] = {origin: 0}
+        frontier = deque([origin])
+        results = []
+
+        while frontier:
+            ref = frontier.popleft()
+            distance = distances[ref]
+            if distance >= depth:
+                continue
+
+            for dependent in sorted(self.store.in_neighbors(ref, DEPENDENCY_RELATIONSHIPS)):
+                if dependent in distances or dependent[0] != "File":
+                    continue
+
+                distances[dependent] = distance + 1
+                frontier.append(dependent)
+                node = self.store.get_node(*dependent) or {}
+                results.append({
+                    "dependent_path": dependent[1],
+                    "language": node.get("language"),
+                    "module": node.get("module"),
+                    "distance": distance + 1,
+                })
+
+        return results
+
+    def get_circular_dependencies(self) -> List[Dict]:
+        """
+        Enumerate simple IMPORTS cycles (length > 1)
+
+        Each cycle is reported once, rotated to start at its smallest path.
+        """
+        files = sorted(key for key, _ in self.store.iter_nodes("File"))
+        cycles: List[Tuple[str, ...]] = []
+
+        for start in files:
+            stack = [(start, [start])]
+            while stack:
+                current, path = stack.pop()
+                for neighbor_ref in self.store.out_neighbors(("File", current), ("IMPORTS",)):
+                    neighbor = neighbor_ref[1]
+                    if neighbor == start and len(path) > 1:
+                        cycles.append(tuple(path))
+                    elif neighbor > start and neighbor not in path:
+                        stack.append((neighbor, path + [neighbor]))
+
+        cycles.sort(key=lambda cycle: (len(cycle), cycle))
+        return [
+            {"cycle": list(cycle) + [cycle[0]], "cycle_length": len(cycle)}
+            for cycle in cycles
+        ]
+
+    def get_untested_functions(self) -> List[Dict]:
+        untested = [
+            {
+                "function_name": props.get("name"),
+                "file_path": props.get("file_path"),
+                "complexity": props.get("complexity"),
+            }
+            for key, props in self.store.iter_nodes("Function")
+            if props.get("public") is True
+            and not self.store.in_neighbors(("Function", key), ("COVERS",))
+        ]
+        untested.sort(key=lambda fn: fn["complexity"] or 0, reverse=True)
+        return untested
+
+    def get_decision_lineage(self, adr_id: str) -> List[Dict]:
+        """Chain of ADRs that were influenced (directly or transitively) by adr_id"""
+        origin = ("ADR", adr_id)
+        if not self.store.has_node(*origin):
+            return []
+
+        seen = {origin}
+        chain = [origin]
+        frontier = deque([origin])
+        while frontier:
+            ref = frontier.popleft()
+            for related in sorted(self.store.in_neighbors(ref, ("INFLUENCED_BY",))):
+                if related in seen:
+                    continue
+                seen.add(related)
+                chain.append(related)
+                frontier.append(related)
+
+        if len(chain) == 1:
+            return []
+
+        lineage = []
+        for ref in chain:
+            node = self.store.get_node(*ref) or {}
+            lineage.append({
+                "adr_id": node.get("adr_id"),
+                "title": node.get("title"),
+                "status": node.get("status"),
+            })
+        return lineage
+
+    def get_architectural_violations(self, forbidden_patterns: List[tuple]) -> List[Dict]:
+        if not forbidden_patterns:
+            return []
+
+        violations = []
+        files = self.store.iter_nodes("File")
+
+        for from_module, to_module in forbidden_patterns:
+            for path, props in files:
+                if props.get("module") != from_module:
+                    continue
+
+                for imported in sorted(self.store.out_neighbors(("File", path), ("IMPORTS",))):
+                    imported_node = self.store.get_node(*imported) or {}
+                    if imported_node.get("module") != to_module:
+                        continue
+
+                    violations.append({
+                        "violator": path,
+                        "forbidden_import": imported[1],
+                        "from_module": from_module,
+                        "to_module": to_module,
+                    })
+
+        return violations
+
+    def get_file_dependencies(self, file_path: str) -> Dict[str, List[str]]:
+        ref = ("File", file_path)
+        return {
+            "imports": sorted(key for _, key in self.store.out_neighbors(ref, ("IMPORTS",))),
+            "imported_by": sorted(key for _, key in self.store.in_neighbors(ref, ("IMPORTS",))),
+        }
+
+    def get_graph_stats(self) -> Dict[str, int]:
+        return {
+            "files": self.store.count_nodes("File"),
+            "classes": self.store.count_nodes("Class"),
+            "functions": self.store.count_nodes("Function"),
+            "relationships": self.store.count_edges(),
+        }
+
+
+    def _nodes(self, refs) -> List[Tuple[str, Dict[str, Any]]]:
+        return [(key, self.store.get_node(label, key) or {}) for label, key in sorted(refs)]
+
+    def find_adrs_for_requirements(self, keyword: str, req_type: str, limit: int = 3) -> List[Dict]:
+        adrs: Dict[str, Dict] = {}
+        for key, req in sorted(self.store.iter_nodes("Requirement")):
+            if keyword not in (req.get("title") or "") and req.get("type") != req_type:
+                continue
+            for adr_key, adr in self._nodes(self.store.in_neighbors(("Requirement", key), ("ADDRESSES",))):
+                adrs.setdefault(adr_key, {"adr_id": adr.get("adr_id"), "title": adr.get("title")})
+        return list(adrs.values())[:limit]
+
+    def find_implementations(self, keyword: str, file_type: str = "python", limit: int = 3) -> List[Dict]:
+        results = []
+        for key, task in sorted(self.store.iter_nodes("Task")):
+            if keyword not in (task.get("title") or "").lower():
+                continue
+            for path, file_node in self._nodes(self.store.out_neighbors(("Task", key), ("MODIFIED",))):
+                row = {"file_path": path, "file_type": file_node.get("language"), "task_title": task.get("title")}
+                if row["file_type"] == file_type and row not in results:
+                    results.append(row)
+        return results[:limit]
+
+    def find_reviews_with_critical_issues(self, file_type: str, limit: int = 5) -> List[Dict]:
+        reviews: Dict[str, Dict] = {}
+        for path, file_node in sorted(self.store.iter_nodes("File")):
+            if file_node.get("language") != file_type:
+                continue
+            for task in sorted(self.store.in_neighbors(("File", path), ("MODIFIED",))):
+                for review_key, review in self._nodes(self.store.out_neighbors(task, ("HAS_REVIEW",))):
+                    if (review.get("critical_issues") or 0) > 0:
+                        reviews.setdefault(review_key, {
+                            "review_id": review.get("review_id"),
+                            "critical_issues": review.get("critical_issues"),
+                            "high_issues": review.get("high_issues"),
+                        })
+        return list(reviews.values())[:limit]
+
+    def get_severe_project_issues(self, limit: int = 10) -> List[Dict]:
+        issues = []
+        for key, analysis in sorted(self.store.iter_nodes("ProjectAnalysis")):
+            for _, issue in self._nodes(self.store.out_neighbors(("ProjectAnalysis", key), ("IDENTIFIED",))):
+                if issue.get("severity") in ("CRITICAL", "HIGH"):
+                    issues.append({
+                        "project_name": analysis.get("project_name"),
+                        "category": issue.get("category"),
+                        "severity": issue.get("severity"),
+                        "description": issue.get("description"),
+                    })
+        return _descending(issues, "severity")[:limit]
+
+    def get_active_requirements(self, limit: int = 20) -> List[Dict]:
+        requirements = [
+            {
+                "req_id": req.get("req_id"),
+                "title": req.get("title"),
+                "type": req.get("type"),
+                "priority": req.get("priority"),
+            }
+            for _, req in sorted(self.store.iter_nodes("Requirement"))
+            if req.get("status") == "active"
+        ]
+        return _descending(requirements, "priority")[:limit]
+
+    def _team_sprints(self, team_name: str, before_sprint: int) -> List[Tuple[str, Dict[str, Any]]]:
+        return [
+            (key, sprint) for key, sprint in sorted(self.store.iter_nodes("Sprint"))
+            if sprint.get("team_name") == team_name
+            and sprint.get("sprint_number") is not None
+            and sprint["sprint_number"] < before_sprint
+        ]
+
+    def get_sprint_history(self, team_name: str, before_sprint: int, limit: int = 5) -> List[Dict]:
+        history = []
+        for key, sprint in self._team_sprints(team_name, before_sprint):
+            tasks = self._nodes(self.store.out_neighbors(("Sprint", key), ("COMPLETED",)))
+            if not tasks:
+                continue
+            points = [task["story_points"] for _, task in tasks if task.get("story_points") is not None]
+            history.append({
+                "sprint_number": sprint["sprint_number"],
+                "velocity": sprint.get("velocity"),
+                "tasks_completed": len(tasks),
+                "avg_story_points": sum(points) / len(points) if points else None,
+            })
+        return _descending(history, "sprint_number")[:limit]
+
+    def get_retrospectives(self, team_name: str, before_sprint: int, limit: int = 3) -> List[Dict]:
+        retrospectives = []
+        for key, sprint in self._team_sprints(team_name, before_sprint):
+            for _, retro in self._nodes(self.store.in_neighbors(("Sprint", key), ("FOR_SPRINT",))):
+                retrospectives.append({
+                    "retro_id": retro.get("retro_id"),
+                    "what_went_well": retro.get("what_went_well"),
+                    "what_needs_improvement": retro.get("what_needs_improvement"),
+                    "action_items": retro.get("action_items"),
+                    "sprint_number": sprint["sprint_number"],
+                    "velocity": sprint.get("velocity"),
+                })
+        return _descending(retrospectives, "sprint_number")[:limit]
+
+    def find_error_solutions(self, error_type: str, stage_name: str, limit: int = 5) -> List[Dict]:
+        solutions = []
+        for key, error in sorted(self.store.iter_nodes("Error")):
+            if error_type not in (error.get("error_type") or ""):
+                continue
+            stages = self._nodes(self.store.out_neighbors(("Error", key), ("OCCURRED_IN",)))
+            solutions.extend(
+                {
+                    "error_type": error.get("error_type"),
+                    "solution": error.get("solution"),
+                    "success_rate": error.get("success_rate"),
+                }
+                for _, stage in stages if stage.get("name") == stage_name
+            )
+        return _descending(solutions, "success_rate")[:limit]
+
+class LocalStorageOperations:
+    """
+    WHY: Storage operations for the embedded backend
+    RESPONSIBILITY: Same contract as StorageOperations
+    PATTERNS: Delegation pattern - receives LocalGraphStore
+    """
+
+    def __init__(self, store: LocalGraphStore):
+        self.store = store
+
+    def clear_all(self) -> None:
+        self.store.clear()
+
+    def export_to_json(self, output_path: str) -> None:
+        output_file = Path(output_path)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(output_path, 'w') as f:
+            json.dump(self.store.dump(), f, indent=2, default=str)
+
+    def create_indexes(self) -> None:
+        """Adjacency indexes are created with the schema - nothing to do"""
+        return None
+
+
+__all__ = [
+    "LocalGraphOperations",
+    "LocalRelationshipOperations",
+    "LocalQueryOperations",
+    "LocalStorageOperations",
+]
@@ -243,4 +243,207 @@ class QueryOperations:
         return stats
 
 
+    def find_adrs_for_requirements(self, keyword: str, req_type: str, limit: int = 3) -> List[Dict]:
+        """
+        Find ADRs addressing requirements that match a keyword or type
+
+        WHY: Architecture queries reuse earlier decisions instead of asking the LLM
+
+        Args:
+            keyword: Substring of the requirement title
+            req_type: Requirement type that also matches
+            limit: Maximum ADRs returned
+
+        Returns:
+            List of {adr_id, title}
+        """
+        query = """
+        MATCH (adr:ADR)-[:ADDRESSES]->(req:Requirement)
+        WHERE req.title CONTAINS $keyword OR req.type = $req_type
+        RETURN DISTINCT adr.adr_id as adr_id, adr.title as title
+        LIMIT $limit
+        """
+
+        return list(self.db.execute_and_fetch(
+            query, {"keyword": keyword, "req_type": req_type, "limit": limit}
+        ))
+
+    def find_implementations(self, keyword: str, file_type: str = "python", limit: int = 3) -> List[Dict]:
+        """
+        Find files modified by tasks whose title mentions a keyword
+
+        WHY: Code generation starts from similar, already implemented files
+
+        Args:
+            keyword: Lower-case substring of the task title
+            file_type: File language recorded by add_file
+            limit: Maximum files returned
+
+        Returns:
+            List of {file_path, file_type, task_title}
+        """
+        query = """
+        MATCH (task:Task)-[:MODIFIED]->(file:File)
+        WHERE toLower(task.title) CONTAINS $keyword
+        AND file.language = $file_type
+        RETURN DISTINCT file.path as file_path, file.language as file_type, task.title as task_title
+        LIMIT $limit
+        """
+
+        return list(self.db.execute_and_fetch(
+            query, {"keyword": keyword, "file_type": file_type, "limit": limit}
+        ))
+
+    def find_reviews_with_critical_issues(self, file_type: str, limit: int = 5) -> List[Dict]:
+        """
+        Find code reviews with critical issues on files of a given type
+
+        WHY: Focus a new review on issues that were found before
+
+        Args:
+            file_type: File language recorded by add_file
+            limit: Maximum reviews returned
+
+        Returns:
+            List of {review_id, critical_issues, high_issues}
+        """
+        query = """
+        MATCH (file:File)<-[:MODIFIED]-(task:Task)-[:HAS_REVIEW]->(review:CodeReview)
+        WHERE file.language = $file_type
+        AND review.critical_issues > 0
+        RETURN DISTINCT review.review_id as review_id,
+               review.critical_issues as critical_issues,
+               review.high_issues as high_issues
+        LIMIT $limit
+        """
+
+        return list(self.db.execute_and_fetch(query, {"file_type": file_type, "limit": limit}))
+
+    def get_severe_project_issues(self, limit: int = 10) -> List[Dict]:
+        """
+        Get critical and high severity issues from earlier project analyses
+
+        Args:
+            limit: Maximum issues returned
+
+        Returns:
+            List of {project_name, category, severity, description}
+        """
+        query = """
+        MATCH (analysis:ProjectAnalysis)-[:IDENTIFIED]->(issue:Issue)
+        WHERE issue.severity IN ['CRITICAL', 'HIGH']
+        RETURN analysis.project_name as project_name, issue.category as category,
+               issue.severity as severity, issue.description as description
+        ORDER BY issue.severity DESC
+        LIMIT $limit
+        """
+
+        return list(self.db.execute_and_fetch(query, {"limit": limit}))
+
+    def get_active_requirements(self, limit: int = 20) -> List[Dict]:
+        """
+        Get active requirements
+
+        WHY: Requirements parsing reuses patterns from earlier projects
+
+        Args:
+            limit: Maximum requirements returned
+
+        Returns:
+            List of {req_id, title, type, priority}
+        """
+        query = """
+        MATCH (req:Requirement)
+        WHERE req.status = 'active'
+        RETURN req.req_id as req_id, req.title as title, req.type as type, req.priority as priority
+        ORDER BY req.priority DESC
+        LIMIT $limit
+        """
+
+        return list(self.db.execute_and_fetch(query, {"limit": limit}))
+
+    def get_sprint_history(self, team_name: str, before_sprint: int, limit: int = 5) -> List[Dict]:
+        """
+        Get velocity and completed work of a team's earlier sprints
+
+        Args:
+            team_name: Team whose sprints are returned
+            before_sprint: Only sprints numbered below this
+            limit: Maximum sprints returned
+
+        Returns:
+            List of {sprint_number, velocity, tasks_completed, avg_story_points}, latest first
+        """
+        query = """
+        MATCH (sprint:Sprint)-[:COMPLETED]->(task:Task)
+        WHERE sprint.team_name = $team_name
+        AND sprint.sprint_number < $before_sprint
+        RETURN sprint.sprint_number as sprint_number, sprint.velocity as velocity,
+               COUNT(task) as tasks_completed,
+               AVG(task.story_points) as avg_story_points
+        ORDER BY sprint.sprint_number DESC
+        LIMIT $limit
+        """
+
+        return list(self.db.execute_and_fetch(
+            query, {"team_name": team_name, "before_sprint": before_sprint, "limit": limit}
+        ))
+
+    def get_retrospectives(self, team_name: str, before_sprint: int, limit: int = 3) -> List[Dict]:
+        """
+        Get retrospectives of a team's earlier sprints
+
+        Args:
+            team_name: Team whose retrospectives are returned
+            before_sprint: Only sprints numbered below this
+            limit: Maximum retrospectives returned
+
+        Returns:
+            List of {retro_id, what_went_well, what_needs_improvement, action_items,
+            sprint_number, velocity}, latest sprint first
+        """
+        query = """
+        MATCH (retro:Retrospective)-[:FOR_SPRINT]->(sprint:Sprint)
+        WHERE sprint.team_name = $team_name
+        AND sprint.sprint_number < $before_sprint
+        RETURN retro.retro_id as retro_id,
+               retro.what_went_well as what_went_well,
+               retro.what_needs_improvement as what_needs_improvement,
+               retro.action_items as action_items,
+               sprint.sprint_number as sprint_number,
+               sprint.velocity as velocity
+        ORDER BY sprint.sprint_number DESC
+        LIMIT $limit
+        """
+
+        return list(self.db.execute_and_fetch(
+            query, {"team_name": team_name, "before_sprint": before_sprint, "limit": limit}
+        ))
+
+    def find_error_solutions(self, error_type: str, stage_name: str, limit: int = 5) -> List[Dict]:
+        """
+        Find recorded solutions for similar errors in a stage
+
+        Args:
+            error_type: Substring of the recorded error type
+            stage_name: Stage the error occurred in
+            limit: Maximum solutions returned
+
+        Returns:
+            List of {error_type, solution, success_rate}, most successful first
+        """
+        query = """
+        MATCH (error:Error)-[:OCCURRED_IN]->(stage:Stage)
+        WHERE error.error_type CONTAINS $error_type
+        AND stage.name = $stage_name
+        RETURN error.error_type as error_type, error.solution as solution,
+               error.success_rate as success_rate
+        ORDER BY error.success_rate DESC
+        LIMIT $limit
+        """
+
+        return list(self.db.execute_and_fetch(
+            query, {"error_type": error_type, "stage_name": stage_name, "limit": limit}
+        ))
+
 __all__ = ["QueryOperations"]
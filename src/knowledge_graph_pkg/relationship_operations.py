@@ -189,5 +189,57 @@ class RelationshipOperations:
 
         self.db.execute(query, {"card_id": card_id, "file_path": file_path})
 
+    def link_adr_influence(self, adr_id: str, influenced_by: str) -> None:
+        """
+        Record that one ADR was influenced by an earlier one
+
+        WHY: Feeds decision lineage queries
+
+        Args:
+            adr_id: ADR that was influenced
+            influenced_by: Earlier ADR it builds on
+        """
+        query = """
+        MATCH (adr:ADR {adr_id: $adr_id})
+        MATCH (earlier:ADR {adr_id: $influenced_by})
+        MERGE (adr)-[r:INFLUENCED_BY]->(earlier)
+        SET r.created = $created
+        """
+
+        self.db.execute(
+            query,
+            {
+                "adr_id": adr_id,
+                "influenced_by": influenced_by,
+                "created": datetime.now().isoformat()
+            }
+        )
+
+    def add_test_coverage(self, test_name: str, function_name: str, file_path: str) -> None:
+        """
+        Record that a test covers a function
+
+        WHY: Feeds untested function queries
+
+        Args:
+            test_name: Test identifier
+            function_name: Covered function name
+            file_path: File containing the function
+        """
+        query = """
+        MATCH (fn:Function {name: $function_name, file_path: $file_path})
+        MERGE (t:Test {name: $test_name})
+        MERGE (t)-[:COVERS]->(fn)
+        """
+
+        self.db.execute(
+            query,
+            {
+                "test_name": test_name,
+                "function_name": function_name,
+                "file_path": file_path
+            }
+        )
+
 
 __all__ = ["RelationshipOperations"]
@@ -12,7 +12,9 @@ Package Structure:
     openai_client.py     - OpenAI API implementation
     anthropic_client.py  - Anthropic API implementation
     llm_factory.py       - Client factory for provider selection
+    model_cascade.py     - Cheap-model-first cascade with per-call-site stats
     stream_processor.py  - Token callback processing for streaming
+    usage_metrics.py     - Token accounting and per-call metrics hooks
 
 Benefits:
     - Single Responsibility: Each module has one clear purpose
@@ -35,8 +37,24 @@ from llm.anthropic_client import AnthropicClient
 
 from llm.llm_factory import LLMClientFactory
 
+from llm.model_cascade import (
+    CascadeLLMClient,
+    CascadePolicy,
+    CascadeTier,
+    get_cascade_stats
+)
+
 from llm.stream_processor import StreamProcessor
 
+from llm.usage_metrics import (
+    LLMCallMetrics,
+    StreamUsageMeter,
+    register_metrics_hook,
+    unregister_metrics_hook,
+    cost_tracker_hook,
+    redis_metrics_hook
+)
+
 __all__ = [
     # Models
     "LLMProvider",
@@ -49,6 +67,18 @@ __all__ = [
     "AnthropicClient",
     # Factory
     "LLMClientFactory",
+    # Cascade
+    "CascadeLLMClient",
+    "CascadePolicy",
+    "CascadeTier",
+    "get_cascade_stats",
     # Utilities
     "StreamProcessor",
+    # Metrics
+    "LLMCallMetrics",
+    "StreamUsageMeter",
+    "register_metrics_hook",
+    "unregister_metrics_hook",
+    "cost_tracker_hook",
+    "redis_metrics_hook",
 ]
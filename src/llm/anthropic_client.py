@@ -10,11 +10,13 @@ Single Responsibility: Handle Anthropic API communication only
 """
 
 import os
-from typing import List, Optional, Dict, Callable, Tuple
+import time
+from typing import Any, List, Optional, Dict, Callable, Tuple
 
 from llm.llm_interface import LLMClientInterface
 from llm.llm_models import LLMMessage, LLMResponse
 from llm.stream_processor import StreamProcessor
+from llm.usage_metrics import StreamUsageMeter, emit_call_metrics, emit_response_metrics
 from artemis_exceptions import ConfigurationError
 
 
@@ -99,10 +101,13 @@ class AnthropicClient(LLMClientInterface):
         # JSON mode is achieved through prompt engineering for Claude
 
         # Call Anthropic API
+        started = time.perf_counter()
         response = self.client.messages.create(**kwargs)
 
-        # Extract and return standardized response
-        return self._build_response(response)
+        # Extract standardized response and report usage
+        llm_response = self._build_response(response)
+        emit_response_metrics(llm_response, (time.perf_counter() - started) * 1000)
+        return llm_response
 
     def complete_stream(
         self,
@@ -131,7 +136,9 @@ class AnthropicClient(LLMClientInterface):
             response_format: Not supported by Anthropic (ignored)
 
         Returns:
-            LLMResponse with full content (accumulated from stream)
+            LLMResponse with full content (accumulated from stream); usage
+            from the stream's message_start/message_delta events, estimated
+            locally for any part not reported (e.g. stopped early)
         """
         # Anthropic requires system message to be separate
         system_message, anthropic_messages = self._extract_system_message(messages)
@@ -142,27 +149,23 @@ class AnthropicClient(LLMClientInterface):
 
         # Build API call kwargs
         kwargs = self._build_api_kwargs(model, anthropic_messages, temperature, max_tokens, system_message)
-        kwargs["stream"] = True  # Enable streaming
 
-        # Call Anthropic API with streaming
+        # Call Anthropic API with streaming (messages.stream() implies stream=True)
+        meter = StreamUsageMeter("anthropic", model, messages)
         stream = self.client.messages.stream(**kwargs)
 
         # Accumulate streamed content
-        full_content, stopped_early = self._process_anthropic_stream(stream, on_token_callback)
+        full_content, stopped_early = self._process_anthropic_stream(stream, on_token_callback, meter)
 
-        # Build usage info (estimate if stopped early)
-        usage = {
-            "prompt_tokens": 0,  # Not available in streaming
-            "completion_tokens": len(full_content.split()),  # Estimate
-            "total_tokens": len(full_content.split())
-        }
+        metrics = meter.finish(full_content, stopped_early)
+        emit_call_metrics(metrics)
 
         return LLMResponse(
             content=full_content,
             model=model,
             provider="anthropic",
-            usage=usage,
-            raw_response={"stopped_early": stopped_early}
+            usage=metrics.usage_dict(),
+            raw_response={"stopped_early": stopped_early, "stream_metrics": metrics.to_dict()}
         )
 
     def get_available_models(self) -> List[str]:
@@ -281,17 +284,20 @@ class AnthropicClient(LLMClientInterface):
     def _process_anthropic_stream(
         self,
         stream,
-        on_token_callback: Optional[Callable[[str], bool]]
+        on_token_callback: Optional[Callable[[str], bool]],
+        meter: StreamUsageMeter
     ) -> Tuple[str, bool]:
         """
         Process Anthropic stream and accumulate tokens.
 
-        WHY: Extracted from complete_stream() to avoid nested ifs.
+        WHY: Extracted from complete_stream() to avoid nested ifs. Iterates
+             raw events (not text_stream) so usage events reach the meter.
         PATTERNS: Early return pattern when callback stops generation.
 
         Args:
             stream: Anthropic stream object
             on_token_callback: Optional callback for each token
+            meter: Usage meter for this call
 
         Returns:
             Tuple of (full_content, stopped_early)
@@ -300,7 +306,12 @@ class AnthropicClient(LLMClientInterface):
         stopped_early = False
 
         with stream as message_stream:
-            for text in message_stream.text_stream:
+            for event in message_stream:
+                text = self._handle_stream_event(event, meter)
+                if not text:
+                    continue
+
+                meter.on_text(text)
                 full_content += text
 
                 # Process callback if provided
@@ -310,3 +321,26 @@ class AnthropicClient(LLMClientInterface):
                     break
 
         return full_content, stopped_early
+
+    def _handle_stream_event(self, event: Any, meter: StreamUsageMeter) -> Optional[str]:
+        """
+        Route one stream event: record usage, return text deltas
+
+        WHY: message_start carries input tokens, message_delta the running
+             output token count, content_block_delta the text.
+        PATTERNS: Dispatch table on event type.
+
+        Args:
+            event: Anthropic stream event
+            meter: Usage meter for this call
+
+        Returns:
+            Text delta, or None for non-text events
+        """
+        handlers: Dict[str, Callable[[Any], Optional[str]]] = {
+            "message_start": lambda e: meter.set_usage(prompt_tokens=e.message.usage.input_tokens),
+            "message_delta": lambda e: meter.set_usage(completion_tokens=e.usage.output_tokens),
+            "content_block_delta": lambda e: getattr(e.delta, "text", None),
+        }
+        handler = handlers.get(getattr(event, "type", None))
+        return handler(event) if handler else None
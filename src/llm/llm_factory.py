@@ -17,7 +17,9 @@ from llm.llm_interface import LLMClientInterface
 from llm.llm_models import LLMProvider
 from llm.openai_client import OpenAIClient
 from llm.anthropic_client import AnthropicClient
+from llm.model_cascade import CascadeLLMClient, build_cascade_policy
 from artemis_exceptions import ConfigurationError
+from artemis_constants import LLM_CASCADE_ENABLED
 
 
 class LLMClientFactory:
@@ -145,3 +147,50 @@ class LLMClientFactory:
             )
 
         return LLMClientFactory.create(provider_enum, api_key)
+
+    @staticmethod
+    def create_cascade(
+        call_site: str,
+        client: Optional[LLMClientInterface] = None,
+        provider: Optional[LLMProvider] = None,
+        api_key: Optional[str] = None
+    ) -> LLMClientInterface:
+        """
+        Create a cost-aware cascade client for a cheap, high-volume call site
+
+        WHY: Classification, estimation votes and critiques rarely need the
+        strongest model; the cascade tries a cheaper one first and escalates
+        only when its answer fails the call site's acceptance check.
+
+        Args:
+            call_site: Policy name ("classification", "estimation_vote", "critique")
+            client: Existing provider client to run every tier on
+            provider: Provider when no client is given (default: from env)
+            api_key: Optional API key when creating a client
+
+        Returns:
+            CascadeLLMClient, or the plain client when cascading is disabled
+            (ARTEMIS_LLM_CASCADE=false), the call site has no policy, or the
+            client's provider is unknown (e.g. test doubles)
+        """
+        if client is None:
+            client = LLMClientFactory.create(provider, api_key) if provider else LLMClientFactory.create_from_env()
+
+        if not LLM_CASCADE_ENABLED:
+            return client
+
+        provider = provider or LLMClientFactory._provider_of(client)
+        if provider is None:
+            return client
+
+        policy = build_cascade_policy(call_site, provider.value, client)
+        return CascadeLLMClient(policy) if policy else client
+
+    @staticmethod
+    def _provider_of(client: LLMClientInterface) -> Optional[LLMProvider]:
+        """Provider whose client class built this client (None for other implementations)"""
+        return next(
+            (provider for provider, client_class in LLMClientFactory._PROVIDER_STRATEGIES.items()
+             if type(client) is client_class),
+            None
+        )
@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+Model Cascade - Try a cheap model first, escalate only when needed
+
+WHY: Classification, estimation votes and short critiques are high-volume
+     calls that a small model usually answers well, yet they were sent to
+     the same expensive model as code generation.
+RESPONSIBILITY: Run a call site's tiers cheapest-first, accept the first
+                answer that passes the call site's acceptance check, and
+                report escalation rates and savings per call site.
+PATTERNS: Chain of Responsibility (tiers), Strategy (acceptance checks),
+          Decorator (CascadeLLMClient is an LLMClientInterface).
+
+Escalation happens when a tier raises or its answer fails the acceptance
+check (a False result, or a confidence below the policy's min_confidence).
+The last tier's answer is returned even if it is not accepted - it is the
+best answer available.
+
+Savings are measured against calling the strongest tier directly with the
+same token usage as the returned answer.
+
+Usage:
+    client = LLMClientFactory.create_cascade("estimation_vote", client=openai_client)
+    response = client.complete(messages, response_format={"type": "json_object"})
+    print(get_cascade_stats().format())
+"""
+
+import json
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from artemis_logger import get_logger
+from llm.llm_interface import LLMClientInterface
+from llm.llm_models import LLMMessage, LLMResponse
+
+logger = get_logger('model_cascade')
+
+AcceptanceCheck = Callable[[LLMResponse], Union[bool, float]]
+
+
+# ============================================================================
+# Acceptance checks
+# ============================================================================
+
+def accept_non_empty(response: LLMResponse) -> bool:
+    """Accept any non-blank answer"""
+    return bool(response.content and response.content.strip())
+
+
+def accept_choice(choices: Sequence[str]) -> AcceptanceCheck:
+    """
+    Accept answers that are exactly one of the allowed labels (classification)
+
+    Args:
+        choices: Allowed labels (case-insensitive)
+    """
+    allowed = {choice.lower() for choice in choices}
+
+    def check(response: LLMResponse) -> bool:
+        return response.content.strip().strip('."\'').lower() in allowed
+
+    return check
+
+
+def accept_json(
+    required_keys: Sequence[str] = (),
+    confidence_key: Optional[str] = None,
+    embedded: bool = False
+) -> AcceptanceCheck:
+    """
+    Accept JSON objects carrying the required keys
+
+    Args:
+        required_keys: Keys that must be present
+        confidence_key: Key holding the model's self-reported confidence
+            (0.0-1.0); when given it is returned as the acceptance confidence
+        embedded: Accept an object surrounded by other text (code fences,
+            prose), for callers that extract the first {...} block themselves
+
+    Returns:
+        Check returning False/0.0 for invalid answers
+    """
+    def check(response: LLMResponse) -> Union[bool, float]:
+        content = response.content or ''
+        if embedded:
+            match = re.search(r'\{.*\}', content, re.DOTALL)
+            content = match.group(0) if match else ''
+        try:
+            data = json.loads(content)
+        except (TypeError, ValueError):
+            return False
+        if not isinstance(data, dict) or any(key not in data for key in required_keys):
+            return False
+        if confidence_key is None:
+            return True
+        try:
+            return float(data.get(confidence_key, 0.0))
+        except (TypeError, ValueError):
+            return False
+
+    return check
+
+
+# ============================================================================
+# Policies
+# ============================================================================
+
+@dataclass
+class CascadeTier:
+    """One model in a cascade (client + model name)"""
+    client: LLMClientInterface
+    model: str
+
+
+@dataclass
+class CascadePolicy:
+    """
+    Cascade configuration for one call site
+
+    Attributes:
+        call_site: Name used for reporting (e.g. "estimation_vote")
+        tiers: Models to try, cheapest first
+        accept: Acceptance check applied to every tier but the last
+        min_confidence: Threshold for checks returning a confidence
+    """
+    call_site: str
+    tiers: List[CascadeTier]
+    accept: AcceptanceCheck = accept_non_empty
+    min_confidence: float = 0.7
+
+
+# Models per provider, cheapest first
+CASCADE_MODEL_TIERS: Dict[str, List[str]] = {
+    'openai': ['gpt-4o-mini', 'gpt-4o'],
+    'anthropic': ['claude-3-haiku-20240307', 'claude-sonnet-4-5-20250929'],
+}
+
+# Acceptance check and confidence threshold per cheap, high-volume call site
+CALL_SITE_ACCEPTANCE: Dict[str, tuple] = {
+    'classification': (accept_json(('type',), confidence_key='confidence', embedded=True), 0.7),
+    'estimation_vote': (accept_json(('story_points', 'reasoning'), confidence_key='confidence'), 0.6),
+    'critique': (accept_non_empty, 0.7),
+}
+
+
+def cascade_models(call_site: str, provider: str) -> List[str]:
+    """
+    Model order for a call site
+
+    Environment Variables:
+        ARTEMIS_CASCADE_<CALL_SITE>_MODELS: Comma-separated models, cheapest
+            first (e.g. ARTEMIS_CASCADE_ESTIMATION_VOTE_MODELS=gpt-4o-mini,gpt-4o)
+    """
+    override = os.getenv(f"ARTEMIS_CASCADE_{call_site.upper()}_MODELS")
+    if override:
+        return [model.strip() for model in override.split(',') if model.strip()]
+    return list(CASCADE_MODEL_TIERS.get(provider, []))
+
+
+def build_cascade_policy(call_site: str, provider: str, client: LLMClientInterface) -> Optional[CascadePolicy]:
+    """
+    Policy for a known call site using one provider client for every tier
+
+    Returns:
+        CascadePolicy, or None when the call site has no cascade or fewer
+        than two models are configured
+    """
+    acceptance = CALL_SITE_ACCEPTANCE.get(call_site)
+    models = cascade_models(call_site, provider)
+    if acceptance is None or len(models) < 2:
+        return None
+
+    accept, min_confidence = acceptance
+    return CascadePolicy(
+        call_site=call_site,
+        tiers=[CascadeTier(client=client, model=model) for model in models],
+        accept=accept,
+        min_confidence=min_confidence
+    )
+
+
+# ============================================================================
+# Statistics
+# ============================================================================
+
+@dataclass
+class CallSiteStats:
+    """Escalation and cost counters for one call site"""
+    calls: int = 0
+    escalations: int = 0
+    tier_errors: int = 0
+    unaccepted: int = 0
+    answered_by: Dict[str, int] = field(default_factory=dict)
+    cost_usd: float = 0.0
+    baseline_cost_usd: float = 0.0
+
+    @property
+    def escalation_rate(self) -> float:
+        """Share of calls that needed more than the first tier"""
+        return self.escalations / self.calls if self.calls else 0.0
+
+    @property
+    def savings_usd(self) -> float:
+        """Cost avoided versus always calling the strongest tier (negative if escalations cost more)"""
+        return self.baseline_cost_usd - self.cost_usd
+
+    def to_dict(self) -> Dict:
+        return {
+            'calls': self.calls,
+            'escalations': self.escalations,
+            'escalation_rate': round(self.escalation_rate, 4),
+            'tier_errors': self.tier_errors,
+            'unaccepted': self.unaccepted,
+            'answered_by': dict(self.answered_by),
+            'cost_usd': round(self.cost_usd, 6),
+            'baseline_cost_usd': round(self.baseline_cost_usd, 6),
+            'savings_usd': round(self.savings_usd, 6),
+        }
+
+
+class CascadeStats:
+    """
+    Thread-safe per-call-site cascade statistics
+
+    WHY: Cascades only pay off when escalations are rare; the rate and the
+         net savings per call site show which policies to tune.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sites: Dict[str, CallSiteStats] = {}
+
+    def record(
+        self,
+        call_site: str,
+        answered_by: str,
+        attempts: int,
+        tier_errors: int,
+        accepted: bool,
+        cost_usd: float,
+        baseline_cost_usd: float
+    ) -> None:
+        """Record one cascaded call"""
+        with self._lock:
+            stats = self._sites.setdefault(call_site, CallSiteStats())
+            stats.calls += 1
+            stats.escalations += 1 if attempts > 1 else 0
+            stats.tier_errors += tier_errors
+            stats.unaccepted += 0 if accepted else 1
+            stats.answered_by[answered_by] = stats.answered_by.get(answered_by, 0) + 1
+            stats.cost_usd += cost_usd
+            stats.baseline_cost_usd += baseline_cost_usd
+
+    def report(self) -> Dict[str, Dict]:
+        """Statistics per call site"""
+        with self._lock:
+            return {site: stats.to_dict() for site, stats in self._sites.items()}
+
+    def format(self) -> str:
+        """Human-readable summary, one line per call site"""
+        lines = ["Model cascade:"]
+        for site, stats in sorted(self.report().items()):
+            lines.append(
+                f"  {site}: {stats['calls']} calls, {stats['escalation_rate']:.0%} escalated, "
+                f"saved ${stats['savings_usd']:.4f} of ${stats['baseline_cost_usd']:.4f}"
+            )
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._sites.clear()
+
+
+_CASCADE_STATS = CascadeStats()
+
+
+def get_cascade_stats() -> CascadeStats:
+    """Process-wide cascade statistics"""
+    return _CASCADE_STATS
+
+
+def _call_cost(model: str, usage: Dict[str, int]) -> float:
+    from cost_tracker import ModelPricing
+    return ModelPricing.get_cost(model, usage.get('prompt_tokens', 0), usage.get('completion_tokens', 0))
+
+
+# ============================================================================
+# Client
+# ============================================================================
+
+class CascadeLLMClient(LLMClientInterface):
+    """
+    LLM client that escalates through a call site's tiers
+
+    WHY: Drop-in replacement for a single-model client at cheap call sites.
+    RESPONSIBILITY: Try tiers in order, apply the acceptance check, record stats.
+    PATTERNS: Decorator, Chain of Responsibility.
+
+    An explicit model argument pins the call to that model on the strongest
+    tier's client (no cascade).
+    """
+
+    def __init__(self, policy: CascadePolicy, stats: Optional[CascadeStats] = None):
+        """
+        Args:
+            policy: Call-site cascade policy (at least one tier)
+            stats: Statistics sink (default: process-wide)
+        """
+        if not policy.tiers:
+            raise ValueError(f"Cascade policy '{policy.call_site}' has no tiers")
+        self.policy = policy
+        self.stats = stats or get_cascade_stats()
+
+    def complete(
+        self,
+        messages: List[LLMMessage],
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4000,
+        response_format: Optional[Dict] = None
+    ) -> LLMResponse:
+        """Complete with the cheapest tier whose answer is accepted"""
+        if model is not None:
+            return self.policy.tiers[-1].client.complete(messages, model, temperature, max_tokens, response_format)
+
+        response, _ = self._cascade(lambda tier, is_last: tier.client.complete(
+            messages, tier.model, temperature, max_tokens, response_format
+        ))
+        return response
+
+    def complete_stream(
+        self,
+        messages: List[LLMMessage],
+        on_token_callback: Optional[Callable[[str], bool]] = None,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4000,
+        response_format: Optional[Dict] = None
+    ) -> LLMResponse:
+        """
+        Streaming variant
+
+        Cheaper tiers run buffered so a rejected answer never reaches the
+        callback; an accepted one is replayed to it. The last tier streams.
+        """
+        if model is not None:
+            return self.policy.tiers[-1].client.complete_stream(
+                messages, on_token_callback, model, temperature, max_tokens, response_format
+            )
+
+        def attempt(tier: CascadeTier, is_last: bool) -> LLMResponse:
+            if is_last:
+                return tier.client.complete_stream(
+                    messages, on_token_callback, tier.model, temperature, max_tokens, response_format
+                )
+            return tier.client.complete(messages, tier.model, temperature, max_tokens, response_format)
+
+        response, streamed = self._cascade(attempt)
+        if on_token_callback and not streamed:
+            on_token_callback(response.content)
+        return response
+
+    def get_available_models(self) -> List[str]:
+        return [tier.model for tier in self.policy.tiers]
+
+    def _cascade(self, attempt: Callable[[CascadeTier, bool], LLMResponse]) -> Tuple[LLMResponse, bool]:
+        """
+        Run tiers in order
+
+        Returns:
+            (response, answered by the last tier)
+        """
+        tiers = self.policy.tiers
+        strongest = tiers[-1].model
+        cost = 0.0
+        errors = 0
+        for index, tier in enumerate(tiers):
+            is_last = index == len(tiers) - 1
+            try:
+                response = attempt(tier, is_last)
+            except Exception as e:
+                if is_last:
+                    raise
+                errors += 1
+                logger.warning(f"Cascade {self.policy.call_site}: {tier.model} failed ({e}), escalating")
+                continue
+
+            cost += _call_cost(tier.model, response.usage or {})
+            accepted = self._accepts(response)
+            if accepted or is_last:
+                self.stats.record(
+                    call_site=self.policy.call_site,
+                    answered_by=tier.model,
+                    attempts=index + 1,
+                    tier_errors=errors,
+                    accepted=accepted,
+                    cost_usd=cost,
+                    baseline_cost_usd=_call_cost(strongest, response.usage or {})
+                )
+                return response, is_last
+
+            logger.debug(f"Cascade {self.policy.call_site}: {tier.model} answer rejected, escalating")
+
+    def _accepts(self, response: LLMResponse) -> bool:
+        try:
+            verdict = self.policy.accept(response)
+        except Exception as e:
+            logger.warning(f"Cascade {self.policy.call_site}: acceptance check failed: {e}")
+            return False
+        if isinstance(verdict, bool):
+            return verdict
+        return float(verdict) >= self.policy.min_confidence
@@ -10,11 +10,13 @@ Single Responsibility: Handle OpenAI API communication only
 """
 
 import os
+import time
 from typing import List, Optional, Dict, Callable, Tuple
 
 from llm.llm_interface import LLMClientInterface
 from llm.llm_models import LLMMessage, LLMResponse
 from llm.stream_processor import StreamProcessor
+from llm.usage_metrics import StreamUsageMeter, emit_call_metrics, emit_response_metrics
 from artemis_exceptions import ConfigurationError
 
 
@@ -103,10 +105,13 @@ class OpenAIClient(LLMClientInterface):
             api_kwargs["response_format"] = response_format
 
         # Call OpenAI API
+        started = time.perf_counter()
         response = self.client.chat.completions.create(**api_kwargs)
 
-        # Extract and return standardized response
-        return self._build_response(response)
+        # Extract standardized response and report usage
+        llm_response = self._build_response(response)
+        emit_response_metrics(llm_response, (time.perf_counter() - started) * 1000)
+        return llm_response
 
     def generate_text(
         self,
@@ -189,7 +194,9 @@ class OpenAIClient(LLMClientInterface):
             response_format: Optional format spec
 
         Returns:
-            LLMResponse with full content (accumulated from stream)
+            LLMResponse with full content (accumulated from stream); usage
+            from the final usage chunk, estimated locally if the stream was
+            stopped before it arrived
         """
         # Convert our LLMMessage format to OpenAI format
         openai_messages = [
@@ -204,29 +211,27 @@ class OpenAIClient(LLMClientInterface):
         # Build API call kwargs
         api_kwargs = self._build_api_kwargs(model, openai_messages, temperature, max_tokens)
         api_kwargs["stream"] = True  # Enable streaming
+        api_kwargs["stream_options"] = {"include_usage": True}  # Final chunk reports usage
 
         if response_format:
             api_kwargs["response_format"] = response_format
 
         # Call OpenAI API with streaming
+        meter = StreamUsageMeter("openai", model, messages)
         stream = self.client.chat.completions.create(**api_kwargs)
 
         # Accumulate streamed content
-        full_content, stopped_early = self._process_openai_stream(stream, on_token_callback)
+        full_content, stopped_early = self._process_openai_stream(stream, on_token_callback, meter)
 
-        # Build usage info (estimate if stopped early)
-        usage = {
-            "prompt_tokens": 0,  # Not available in streaming
-            "completion_tokens": len(full_content.split()),  # Estimate
-            "total_tokens": len(full_content.split())
-        }
+        metrics = meter.finish(full_content, stopped_early)
+        emit_call_metrics(metrics)
 
         return LLMResponse(
             content=full_content,
             model=model,
             provider="openai",
-            usage=usage,
-            raw_response={"stopped_early": stopped_early}
+            usage=metrics.usage_dict(),
+            raw_response={"stopped_early": stopped_early, "stream_metrics": metrics.to_dict()}
         )
 
     def get_available_models(self) -> List[str]:
@@ -323,7 +328,8 @@ class OpenAIClient(LLMClientInterface):
     def _process_openai_stream(
         self,
         stream,
-        on_token_callback: Optional[Callable[[str], bool]]
+        on_token_callback: Optional[Callable[[str], bool]],
+        meter: StreamUsageMeter
     ) -> Tuple[str, bool]:
         """
         Process OpenAI stream and accumulate tokens.
@@ -334,6 +340,7 @@ class OpenAIClient(LLMClientInterface):
         Args:
             stream: OpenAI stream object
             on_token_callback: Optional callback for each token
+            meter: Usage meter for this call
 
         Returns:
             Tuple of (full_content, stopped_early)
@@ -342,11 +349,17 @@ class OpenAIClient(LLMClientInterface):
         stopped_early = False
 
         for chunk in stream:
+            # The usage chunk (include_usage) has no choices
+            usage = getattr(chunk, "usage", None)
+            if usage:
+                meter.set_usage(prompt_tokens=usage.prompt_tokens, completion_tokens=usage.completion_tokens)
+
             # Skip chunks without content (early return pattern)
-            if not chunk.choices[0].delta.content:
+            if not chunk.choices or not chunk.choices[0].delta.content:
                 continue
 
             token = chunk.choices[0].delta.content
+            meter.on_text(token)
             full_content += token
 
             # Process callback if provided (avoid nested ifs)
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Usage Metrics - Token accounting and call metrics for LLM clients
+
+WHY: Streaming calls reported zero prompt tokens and a word count as the
+     completion count, so they were invisible to cost tracking, budgets and
+     throughput metrics - yet streaming is the path code generation uses.
+RESPONSIBILITY: Measure streamed calls (provider usage events, local
+                tokenizer fallback, time-to-first-token, tokens/sec) and
+                deliver per-call metrics to registered hooks.
+PATTERNS: Observer pattern (metrics hooks), Null-object fallback (estimator).
+
+Both OpenAIClient and AnthropicClient emit one LLMCallMetrics per call, for
+streamed and non-streamed completions alike. Register sinks with
+register_metrics_hook(); cost_tracker_hook() and redis_metrics_hook()
+adapt the existing CostTracker and RedisMetrics.
+"""
+
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from artemis_logger import get_logger
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+logger = get_logger('usage_metrics')
+
+CHARS_PER_TOKEN = 4  # Heuristic when no tokenizer is installed
+MESSAGE_OVERHEAD_TOKENS = 4  # Role/formatting tokens per chat message
+DEFAULT_ENCODING = "cl100k_base"
+DEFAULT_COST_STAGE = "llm"  # CostTracker stage for calls made outside a pipeline stage
+
+
+@dataclass
+class LLMCallMetrics:
+    """
+    Metrics for one LLM call
+
+    WHY: One record shape for every sink (cost, budgets, dashboards).
+
+    Attributes:
+        usage_source: "provider" (reported by API), "estimated" (local
+                      tokenizer) or "mixed" (e.g. stream stopped before the
+                      provider reported output tokens)
+        time_to_first_token_ms: Streaming only
+        tokens_per_second: Completion tokens / generation time (streaming only)
+    """
+    provider: str
+    model: str
+    prompt_tokens: int
+    completion_tokens: int
+    usage_source: str
+    streamed: bool
+    duration_ms: float
+    time_to_first_token_ms: Optional[float] = None
+    tokens_per_second: Optional[float] = None
+    stopped_early: bool = False
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    def usage_dict(self) -> Dict[str, int]:
+        """Usage in LLMResponse.usage format"""
+        return {
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": self.total_tokens
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "total_tokens": self.total_tokens}
+
+
+# ============================================================================
+# Token estimation
+# ============================================================================
+
+_ENCODINGS: Dict[str, Any] = {}
+_ENCODINGS_LOCK = threading.Lock()
+
+
+def _get_encoding(model: Optional[str]) -> Any:
+    """tiktoken encoding for model (cached); None if tiktoken is unavailable"""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    key = model or DEFAULT_ENCODING
+    with _ENCODINGS_LOCK:
+        if key not in _ENCODINGS:
+            try:
+                _ENCODINGS[key] = tiktoken.encoding_for_model(model) if model else tiktoken.get_encoding(DEFAULT_ENCODING)
+            except KeyError:
+                # Unknown (e.g. Anthropic) model - cl100k is a close enough estimate
+                _ENCODINGS[key] = tiktoken.get_encoding(DEFAULT_ENCODING)
+        return _ENCODINGS[key]
+
+
+def estimate_tokens(text: str, model: Optional[str] = None) -> int:
+    """
+    Estimate token count for text
+
+    Uses tiktoken when installed, otherwise ~4 characters per token.
+
+    Args:
+        text: Text to count
+        model: Model name (selects the tokenizer)
+
+    Returns:
+        Estimated token count
+    """
+    if not text:
+        return 0
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return max(1, round(len(text) / CHARS_PER_TOKEN))
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def estimate_message_tokens(messages: List[Any], model: Optional[str] = None) -> int:
+    """Estimate prompt tokens for a list of LLMMessage-like objects"""
+    return sum(estimate_tokens(message.content, model) + MESSAGE_OVERHEAD_TOKENS for message in messages)
+
+
+# ============================================================================
+# Streaming meter
+# ============================================================================
+
+class StreamUsageMeter:
+    """
+    Measures one streamed completion
+
+    WHY: Shared by both clients so streamed usage is computed one way.
+
+    Usage:
+        meter = StreamUsageMeter("anthropic", model, messages)
+        for text in stream:
+            meter.on_text(text)
+        meter.set_usage(prompt_tokens=..., completion_tokens=...)  # if reported
+        metrics = meter.finish(full_content, stopped_early)
+    """
+
+    def __init__(self, provider: str, model: str, messages: List[Any]):
+        self.provider = provider
+        self.model = model
+        self.messages = messages
+        self.started = time.perf_counter()
+        self.first_token_at: Optional[float] = None
+        self.provider_prompt_tokens: Optional[int] = None
+        self.provider_completion_tokens: Optional[int] = None
+
+    def on_text(self, text: str) -> None:
+        """Record arrival of a content chunk"""
+        if self.first_token_at is None and text:
+            self.first_token_at = time.perf_counter()
+
+    def set_usage(self, prompt_tokens: Optional[int] = None, completion_tokens: Optional[int] = None) -> None:
+        """Record usage reported by the provider (either part may arrive separately)"""
+        if prompt_tokens is not None:
+            self.provider_prompt_tokens = prompt_tokens
+        if completion_tokens is not None:
+            self.provider_completion_tokens = completion_tokens
+
+    def finish(self, content: str, stopped_early: bool = False) -> LLMCallMetrics:
+        """
+        Build metrics for the finished (or stopped) stream
+
+        Args:
+            content: Accumulated completion text
+            stopped_early: Whether the token callback stopped generation
+
+        Returns:
+            LLMCallMetrics (provider usage where reported, estimates otherwise)
+        """
+        finished = time.perf_counter()
+        prompt_tokens, prompt_source = self._resolve(self.provider_prompt_tokens, lambda: estimate_message_tokens(self.messages, self.model))
+        completion_tokens, completion_source = self._resolve(self.provider_completion_tokens, lambda: estimate_tokens(content, self.model))
+
+        ttft_ms = None
+        tokens_per_second = None
+        if self.first_token_at is not None:
+            ttft_ms = (self.first_token_at - self.started) * 1000
+            generation_seconds = finished - self.first_token_at
+            if generation_seconds > 0:
+                tokens_per_second = completion_tokens / generation_seconds
+
+        return LLMCallMetrics(
+            provider=self.provider,
+            model=self.model,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            usage_source=prompt_source if prompt_source == completion_source else "mixed",
+            streamed=True,
+            duration_ms=(finished - self.started) * 1000,
+            time_to_first_token_ms=ttft_ms,
+            tokens_per_second=tokens_per_second,
+            stopped_early=stopped_early
+        )
+
+    @staticmethod
+    def _resolve(reported: Optional[int], estimate: Callable[[], int]) -> Tuple[int, str]:
+        if reported is not None:
+            return reported, "provider"
+        return estimate(), "estimated"
+
+
+# ============================================================================
+# Metrics hooks
+# ============================================================================
+
+MetricsHook = Callable[[LLMCallMetrics], None]
+_HOOKS: List[Tuple[MetricsHook, bool]] = []
+_HOOKS_LOCK = threading.Lock()
+
+
+def register_metrics_hook(hook: MetricsHook, raise_errors: bool = False) -> MetricsHook:
+    """
+    Register a sink for per-call metrics
+
+    Args:
+        hook: Called with LLMCallMetrics after every completion
+        raise_errors: Propagate hook exceptions to the caller (use for budget
+                      enforcement); otherwise they are logged and ignored
+
+    Returns:
+        The hook (for unregister_metrics_hook)
+    """
+    with _HOOKS_LOCK:
+        _HOOKS.append((hook, raise_errors))
+    return hook
+
+
+def unregister_metrics_hook(hook: MetricsHook) -> None:
+    """Remove a previously registered hook"""
+    with _HOOKS_LOCK:
+        _HOOKS[:] = [(registered, raise_errors) for registered, raise_errors in _HOOKS if registered is not hook]
+
+
+def emit_call_metrics(metrics: LLMCallMetrics) -> None:
+    """
+    Deliver metrics to every registered hook
+
+    Raises:
+        Whatever a hook registered with raise_errors=True raises
+    """
+    with _HOOKS_LOCK:
+        hooks = list(_HOOKS)
+    for hook, raise_errors in hooks:
+        try:
+            hook(metrics)
+        except Exception as e:
+            if raise_errors:
+                raise
+            logger.log(f"LLM metrics hook failed: {e}", "WARNING")
+
+
+def emit_response_metrics(response: Any, duration_ms: float) -> None:
+    """Emit metrics for a non-streamed LLMResponse (usage reported by the provider)"""
+    emit_call_metrics(LLMCallMetrics(
+        provider=response.provider,
+        model=response.model,
+        prompt_tokens=response.usage.get("prompt_tokens", 0),
+        completion_tokens=response.usage.get("completion_tokens", 0),
+        usage_source="provider",
+        streamed=False,
+        duration_ms=duration_ms
+    ))
+
+
+def cost_tracker_hook(
+    tracker: Any,
+    stage: Union[str, Callable[[], Optional[str]]] = DEFAULT_COST_STAGE,
+    card_id: str = "unknown",
+    purpose: str = "general"
+) -> MetricsHook:
+    """
+    Adapt CostTracker.track_call as a metrics hook
+
+    Register with raise_errors=True so BudgetExceededError reaches the caller.
+    stage may be a callable returning the stage running at call time; calls
+    made outside any stage are charged to DEFAULT_COST_STAGE.
+    """
+    def hook(metrics: LLMCallMetrics) -> None:
+        tracker.track_call(
+            model=metrics.model,
+            provider=metrics.provider,
+            tokens_input=metrics.prompt_tokens,
+            tokens_output=metrics.completion_tokens,
+            stage=(stage() if callable(stage) else stage) or DEFAULT_COST_STAGE,
+            card_id=card_id,
+            purpose=purpose
+        )
+    return hook
+
+
+def redis_metrics_hook(redis_metrics: Any) -> MetricsHook:
+    """Adapt RedisMetrics (request counters and streaming throughput) as a metrics hook"""
+    from cost_tracker import ModelPricing
+
+    def hook(metrics: LLMCallMetrics) -> None:
+        redis_metrics.track_llm_request(
+            provider=metrics.provider,
+            model=metrics.model,
+            prompt_tokens=metrics.prompt_tokens,
+            completion_tokens=metrics.completion_tokens,
+            cost=ModelPricing.get_cost(metrics.model, metrics.prompt_tokens, metrics.completion_tokens)
+        )
+        if metrics.streamed:
+            redis_metrics.track_llm_stream(
+                provider=metrics.provider,
+                model=metrics.model,
+                time_to_first_token_ms=metrics.time_to_first_token_ms,
+                tokens_per_second=metrics.tokens_per_second,
+                completion_tokens=metrics.completion_tokens
+            )
+    return hook
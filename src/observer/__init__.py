@@ -54,6 +54,7 @@ from .metrics_observer import MetricsObserver
 from .state_tracking_observer import StateTrackingObserver
 from .notification_observer import NotificationObserver
 from .supervisor_command_observer import SupervisorCommandObserver
+from .execution_stats_observer import ExecutionStatsObserver
 
 # Factories and builders
 from .observer_factory import ObserverFactory
@@ -72,6 +73,7 @@ __all__ = [
     "StateTrackingObserver",
     "NotificationObserver",
     "SupervisorCommandObserver",
+    "ExecutionStatsObserver",
     # Factories and builders
     "ObserverFactory",
     "EventBuilder",
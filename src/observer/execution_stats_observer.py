@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Module: observer/execution_stats_observer.py
+
+WHY: The router and the dynamic pipeline optimizer need measured history of
+     how long stages take and what they cost for cards like the one at hand.
+     Pipeline events already describe every stage run; this observer turns
+     them into persistent execution records.
+
+RESPONSIBILITY:
+    - Capture task features (task type, complexity) when a pipeline starts
+    - Measure stage durations and count retries from stage events
+    - Attribute LLM token usage and cost to the stages running at call time
+    - Write one StageExecutionRecord per finished stage to the stats store
+
+PATTERNS:
+    - Observer pattern implementation
+    - Strategy pattern for event-specific handling (dispatch table)
+
+DESIGN DECISIONS:
+    - Tokens arrive through the LLM metrics hook, not pipeline events, so a
+      call made while several stages run is split evenly between them
+    - The hook is registered only while a pipeline is running and released
+      when it finishes, so idle observers (one per orchestrator) neither
+      leak nor absorb LLM usage from other cards' pipelines
+    - Stages still open when the pipeline ends are recorded as failures
+    - Store errors are logged and swallowed; stats must never break a run
+"""
+
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from artemis_logger import get_logger
+from cost_tracker import ModelPricing
+from .observer_interface import PipelineObserver
+from .event_model import PipelineEvent
+from .event_types import EventType
+
+logger = get_logger('execution_stats_observer')
+
+
+@dataclass
+class _StageRun:
+    """Accumulated measurements of one in-flight stage"""
+    started_at: datetime
+    retries: int = 0
+    tokens: int = 0
+    cost: float = 0.0
+
+
+class ExecutionStatsObserver(PipelineObserver):
+    """
+    Observer that records per-stage execution statistics.
+
+    Records per stage:
+    - Duration
+    - Token usage and cost
+    - Retry count
+    - Outcome (success / failure)
+    """
+
+    def __init__(self, store=None, register_llm_hook: bool = True):
+        """
+        Args:
+            store: ExecutionStatsStore (default: process-wide store)
+            register_llm_hook: Attribute LLM usage to running stages
+        """
+        if store is None:
+            from persistence.execution_stats import get_execution_stats_store
+            store = get_execution_stats_store()
+        self.store = store
+        self._lock = threading.Lock()
+        self._features: Dict[str, Tuple[str, str]] = {}
+        self._runs: Dict[Tuple[Optional[str], str], _StageRun] = {}
+        self._hook: Optional[Callable] = None
+        self._attribute_llm_usage = register_llm_hook
+        self._handlers = {
+            EventType.PIPELINE_STARTED: self._on_pipeline_started,
+            EventType.STAGE_STARTED: self._on_stage_started,
+            EventType.STAGE_RETRYING: self._on_stage_retrying,
+            EventType.STAGE_COMPLETED: self._on_stage_completed,
+            EventType.STAGE_FAILED: self._on_stage_failed,
+            EventType.PIPELINE_COMPLETED: self._on_pipeline_finished,
+            EventType.PIPELINE_FAILED: self._on_pipeline_finished,
+        }
+
+    def on_event(self, event: PipelineEvent) -> None:
+        """Dispatch event to its handler"""
+        handler = self._handlers.get(event.event_type)
+        if handler is None:
+            return
+        with self._lock:
+            handler(event)
+
+    def _on_pipeline_started(self, event: PipelineEvent) -> None:
+        plan = event.data.get('workflow_plan') or {}
+        task_type = plan.get('task_type') or event.data.get('task_type') or 'unknown'
+        complexity = plan.get('complexity') or event.data.get('complexity') or 'unknown'
+        self._features[event.card_id] = (task_type, complexity)
+        if self._attribute_llm_usage:
+            self._register_llm_hook()
+
+    def _on_stage_started(self, event: PipelineEvent) -> None:
+        if not event.stage_name:
+            return
+        key = (event.card_id, event.stage_name)
+        if key in self._runs:
+            # Restarted stage (retry loop re-notifies start): keep accumulating
+            return
+        self._runs[key] = _StageRun(started_at=event.timestamp)
+
+    def _on_stage_retrying(self, event: PipelineEvent) -> None:
+        run = self._runs.get((event.card_id, event.stage_name))
+        if run is None:
+            return
+        run.retries += 1
+
+    def _on_stage_completed(self, event: PipelineEvent) -> None:
+        self._finish(event, 'success')
+
+    def _on_stage_failed(self, event: PipelineEvent) -> None:
+        self._finish(event, 'failure')
+
+    def _on_pipeline_finished(self, event: PipelineEvent) -> None:
+        open_stages = [stage for card_id, stage in self._runs if card_id == event.card_id]
+        for stage in open_stages:
+            self._finish(PipelineEvent(
+                event_type=EventType.STAGE_FAILED,
+                card_id=event.card_id,
+                stage_name=stage,
+                timestamp=event.timestamp
+            ), 'failure')
+        self._features.pop(event.card_id, None)
+        if not self._features and not self._runs:
+            self._release_llm_hook()
+
+    def _finish(self, event: PipelineEvent, outcome: str) -> None:
+        run = self._runs.pop((event.card_id, event.stage_name), None)
+        if run is None:
+            return
+
+        from persistence.execution_stats import StageExecutionRecord
+
+        task_type, complexity = self._features.get(event.card_id, ('unknown', 'unknown'))
+        stage_result = event.data.get('stage_result')
+        reported_retries = stage_result.get('retry_count', 0) if isinstance(stage_result, dict) else 0
+        record = StageExecutionRecord(
+            card_id=event.card_id or 'unknown',
+            stage=event.stage_name,
+            task_type=task_type,
+            complexity=complexity,
+            duration_seconds=max(0.0, (event.timestamp - run.started_at).total_seconds()),
+            tokens=run.tokens,
+            cost=run.cost,
+            retries=max(run.retries, reported_retries or 0),
+            outcome=outcome,
+            recorded_at=event.timestamp.timestamp()
+        )
+        try:
+            self.store.record(record)
+        except Exception as e:
+            logger.warning(f"Could not record execution stats for {event.stage_name}: {e}")
+
+    # ------------------------------------------------------------------
+    # LLM usage attribution
+    # ------------------------------------------------------------------
+
+    def _register_llm_hook(self) -> None:
+        if self._hook is not None:
+            return
+        from llm.usage_metrics import register_metrics_hook
+        self._hook = register_metrics_hook(self.record_llm_call)
+
+    def _release_llm_hook(self) -> None:
+        if self._hook is None:
+            return
+        from llm.usage_metrics import unregister_metrics_hook
+        unregister_metrics_hook(self._hook)
+        self._hook = None
+
+    def record_llm_call(self, metrics: Any) -> None:
+        """
+        Attribute one LLM call's tokens and cost to the running stages
+
+        Args:
+            metrics: LLMCallMetrics from llm.usage_metrics
+        """
+        with self._lock:
+            if not self._runs:
+                return
+            cost = ModelPricing.get_cost(metrics.model, metrics.prompt_tokens, metrics.completion_tokens)
+            share = len(self._runs)
+            for run in self._runs.values():
+                run.tokens += metrics.total_tokens // share
+                run.cost += cost / share
+
+    def close(self) -> None:
+        """Stop receiving LLM usage"""
+        with self._lock:
+            self._release_llm_hook()
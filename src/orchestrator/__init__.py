@@ -18,72 +18,75 @@ This package contains:
 - workflow_planner.py: Task analysis and workflow plan generation
 - supervisor_integration.py: Supervisor registration and recovery strategies
 - helpers.py: Platform, notification, retrospective, code review helpers
+- lazy_imports.py: Lazy registries for stages and heavy subsystems
 
 REFACTORING: Extracted from artemis_orchestrator.py (1,738 lines → modular package)
 """
 
-# Core orchestrator class
-from orchestrator.orchestrator_core import ArtemisOrchestrator
-
-# Stage creation
-from orchestrator.stage_creation import create_default_stages
-
-# Pipeline execution
-from orchestrator.pipeline_execution import run_full_pipeline
-from orchestrator.batch_processing import run_all_pending_tasks
-
-# Stage filtering and metrics
-from orchestrator.stage_filtering import (
-    filter_stages_by_plan,
-    filter_stages_by_router,
-    get_pipeline_metrics,
-    get_pipeline_state
-)
-
-# Review feedback
-from orchestrator.review_feedback import (
-    load_review_report,
-    extract_code_review_feedback,
-    format_issue_list,
-    store_retry_feedback_in_rag
-)
-
-# CLI display
-from orchestrator.cli_display import (
-    display_workflow_status,
-    list_active_workflows
-)
-
-# Config validation
-from orchestrator.config_validation import (
-    validate_config_or_exit,
-    display_validation_errors,
-    get_config_path
-)
-
-# Entry points
-from orchestrator.entry_points import (
-    main_hydra,
-    main_legacy
-)
-
-# Workflow planning (existing)
-from orchestrator.workflow_planner import WorkflowPlanner
-
-# Supervisor integration (existing)
-from orchestrator.supervisor_integration import register_stages_with_supervisor
-
-# Helper utilities (existing)
-from orchestrator.helpers import (
-    store_and_validate_platform_info,
-    notify_pipeline_start,
-    notify_pipeline_completion,
-    notify_pipeline_failure,
-    collect_sprint_metrics,
-    run_retrospective,
-    load_review_report as helpers_load_review_report,
-    extract_code_review_feedback as helpers_extract_code_review_feedback
-)
+from orchestrator.lazy_imports import LazyRegistry
+
+# Public names are imported on first access (PEP 562) so that importing one
+# lightweight submodule (e.g. orchestrator.cli_display) does not load every
+# stage, the RAG store and the supervisor.
+_EXPORTS = LazyRegistry({
+    # Core orchestrator class
+    "ArtemisOrchestrator": "orchestrator.orchestrator_core:ArtemisOrchestrator",
+
+    # Stage creation
+    "create_default_stages": "orchestrator.stage_creation:create_default_stages",
+
+    # Pipeline execution
+    "run_full_pipeline": "orchestrator.pipeline_execution:run_full_pipeline",
+    "run_all_pending_tasks": "orchestrator.batch_processing:run_all_pending_tasks",
+
+    # Stage filtering and metrics
+    "filter_stages_by_plan": "orchestrator.stage_filtering:filter_stages_by_plan",
+    "filter_stages_by_router": "orchestrator.stage_filtering:filter_stages_by_router",
+    "get_pipeline_metrics": "orchestrator.stage_filtering:get_pipeline_metrics",
+    "get_pipeline_state": "orchestrator.stage_filtering:get_pipeline_state",
+
+    # Review feedback
+    "load_review_report": "orchestrator.review_feedback:load_review_report",
+    "extract_code_review_feedback": "orchestrator.review_feedback:extract_code_review_feedback",
+    "format_issue_list": "orchestrator.review_feedback:format_issue_list",
+    "store_retry_feedback_in_rag": "orchestrator.review_feedback:store_retry_feedback_in_rag",
+
+    # CLI display
+    "display_workflow_status": "orchestrator.cli_display:display_workflow_status",
+    "list_active_workflows": "orchestrator.cli_display:list_active_workflows",
+
+    # Config validation
+    "validate_config_or_exit": "orchestrator.config_validation:validate_config_or_exit",
+    "display_validation_errors": "orchestrator.config_validation:display_validation_errors",
+    "get_config_path": "orchestrator.config_validation:get_config_path",
+
+    # Entry points
+    "main_hydra": "orchestrator.entry_points:main_hydra",
+    "main_legacy": "orchestrator.entry_points:main_legacy",
+
+    # Workflow planning (existing)
+    "WorkflowPlanner": "orchestrator.workflow_planner:WorkflowPlanner",
+
+    # Supervisor integration (existing)
+    "register_stages_with_supervisor": "orchestrator.supervisor_integration:register_stages_with_supervisor",
+
+    # Helper utilities (existing)
+    "store_and_validate_platform_info": "orchestrator.helpers:store_and_validate_platform_info",
+    "notify_pipeline_start": "orchestrator.helpers:notify_pipeline_start",
+    "notify_pipeline_completion": "orchestrator.helpers:notify_pipeline_completion",
+    "notify_pipeline_failure": "orchestrator.helpers:notify_pipeline_failure",
+    "collect_sprint_metrics": "orchestrator.helpers:collect_sprint_metrics",
+    "run_retrospective": "orchestrator.helpers:run_retrospective",
+    "helpers_load_review_report": "orchestrator.helpers:load_review_report",
+    "helpers_extract_code_review_feedback": "orchestrator.helpers:extract_code_review_feedback",
+})
+
+__getattr__ = _EXPORTS.module_getattr(__name__)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS.names()))
+
 
 __all__ = [
     # Core class
@@ -19,6 +19,7 @@ RESPONSIBILITY:
 - Handle task failures gracefully
 - Generate consolidated batch report
 - Track batch progress and statistics
+- Enforce artifact retention budgets between tasks
 
 PATTERNS:
 - Iterator Pattern: Processes tasks sequentially
@@ -34,6 +35,8 @@ from typing import List, Dict, Any
 from pathlib import Path
 from datetime import datetime
 
+from artemis_constants import RETENTION_INLINE_ENABLED
+
 
 def run_all_pending_tasks(orchestrator: Any, max_tasks: int = None) -> List[Dict]:
     """
@@ -136,6 +139,9 @@ def run_all_pending_tasks(orchestrator: Any, max_tasks: int = None) -> List[Dict
             # Restore original card_id
             orchestrator.card_id = original_card_id
 
+        # Keep .artemis_data within budget before the next card starts
+        enforce_retention_between_cards(orchestrator)
+
         # Brief pause between tasks
         orchestrator.logger.log("", "INFO")
 
@@ -169,3 +175,39 @@ def run_all_pending_tasks(orchestrator: Any, max_tasks: int = None) -> List[Dict
     orchestrator.logger.log("=" * 60, "INFO")
 
     return all_reports
+
+
+def enforce_retention_between_cards(orchestrator: Any) -> None:
+    """
+    Apply artifact retention budgets between two cards
+
+    WHY:
+    Long batch runs accumulate checkpoints, state snapshots and temp output
+    for every card. Enforcing budgets between cards keeps disk usage bounded
+    without a separate maintenance job. Cards still running (per their
+    workflow status files) are never touched.
+
+    Retention problems are logged and never fail the batch.
+
+    Args:
+        orchestrator: ArtemisOrchestrator instance
+    """
+    # Guard: inline retention disabled (ARTEMIS_RETENTION_INLINE=false)
+    if not RETENTION_INLINE_ENABLED:
+        return
+
+    try:
+        from utilities.retention import enforce_retention
+        report = enforce_retention()
+    except Exception as e:
+        orchestrator.logger.log(f"⚠️  Artifact retention failed: {e}", "WARNING")
+        return
+
+    # Guard: nothing evicted
+    if not report.evicted_count:
+        return
+
+    orchestrator.logger.log(
+        f"🧹 Retention freed {report.freed_bytes / (1024 * 1024):.1f} MB ({report.evicted_count} artifacts)",
+        "INFO"
+    )
@@ -28,27 +28,35 @@ PATTERNS:
 
 EXTRACTED FROM: artemis_orchestrator.py lines 1397-1738
 """
+from __future__ import annotations
+
 import sys
 import argparse
 from pathlib import Path
 from datetime import datetime
-import hydra
-from omegaconf import DictConfig
-from artemis_services import PipelineLogger
-from kanban_manager import KanbanBoard
-from messenger_factory import MessengerFactory
-from rag_agent import RAGAgent
-from config_agent import get_config
+from typing import TYPE_CHECKING
 from artemis_exceptions import PipelineStageError, create_wrapped_exception
-from debug_service import DebugService
 from orchestrator.orchestrator_core import ArtemisOrchestrator
 from orchestrator.cli_display import display_workflow_status, list_active_workflows
 from orchestrator.config_validation import validate_config_or_exit, get_config_path
-from orchestrator.card_creation import create_card_from_requirements, attach_requirements_to_card
-from orchestrator.adaptive_integration import select_adaptive_strategy
+from orchestrator.lazy_imports import SUBSYSTEMS
+
+if TYPE_CHECKING:
+    from omegaconf import DictConfig
+
+
+def main_hydra() -> None:
+    """
+    Hydra entry point (Hydra is imported and applied on call)
+
+    WHY: Decorating at import time made every importer of this module pay for
+         Hydra; status and list commands never need it.
+    """
+    import hydra
+    hydra.main(version_base=None, config_path=get_config_path(), config_name='config')(_run_hydra_pipeline)()
+
 
-@hydra.main(version_base=None, config_path=get_config_path(), config_name='config')
-def main_hydra(cfg: DictConfig) -> None:
+def _run_hydra_pipeline(cfg: DictConfig) -> None:
     """
     Hydra-powered entry point with type-safe configuration
 
@@ -107,12 +115,12 @@ def main_hydra(cfg: DictConfig) -> None:
         logger.log(f"Supervision: {('Enabled' if cfg.pipeline.enable_supervision else 'Disabled')}", 'INFO')
         
         logger.log('=' * 70 + '\n', 'INFO')
-    board = KanbanBoard()
-    logger = PipelineLogger(verbose=cfg.logging.verbose)
+    board = SUBSYSTEMS.resolve('KanbanBoard')()
+    logger = SUBSYSTEMS.resolve('PipelineLogger')(verbose=cfg.logging.verbose)
     debug_config = cfg.get('debug', None) if hasattr(cfg, 'debug') else None
-    DebugService.initialize(config=debug_config, logger=logger, cli_debug=None)
-    messenger = MessengerFactory.create_from_env(agent_name='artemis-orchestrator')
-    rag = RAGAgent(db_path=cfg.storage.rag_db_path, verbose=cfg.logging.verbose)
+    SUBSYSTEMS.resolve('DebugService').initialize(config=debug_config, logger=logger, cli_debug=None)
+    messenger = SUBSYSTEMS.resolve('MessengerFactory').create_from_env(agent_name='artemis-orchestrator')
+    rag = SUBSYSTEMS.resolve('RAGAgent')(db_path=cfg.storage.rag_db_path, verbose=cfg.logging.verbose)
     from git_agent import GitAgent
     git_agent = GitAgent(verbose=cfg.logging.verbose)
     repo_config = git_agent.configure_repository(name=cfg.repository.name, local_path=cfg.repository.local_path, remote_url=cfg.repository.get('remote_url', None), branch_strategy=cfg.repository.branch_strategy, default_branch=cfg.repository.default_branch, auto_push=cfg.repository.auto_push, create_if_missing=cfg.repository.create_if_missing)
@@ -201,7 +209,7 @@ def main_legacy():
             sys.exit(1)
         display_workflow_status(args.card_id, json_output=args.json)
         return
-    config = get_config(verbose=True)
+    config = SUBSYSTEMS.resolve('get_config')(verbose=True)
     if args.config_report:
         config.print_configuration_report()
         return
@@ -211,14 +219,16 @@ def main_legacy():
         parser.print_help()
         sys.exit(1)
     validate_config_or_exit(config, args.skip_validation)
-    board = KanbanBoard()
-    logger = PipelineLogger(verbose=True)
+    board = SUBSYSTEMS.resolve('KanbanBoard')()
+    logger = SUBSYSTEMS.resolve('PipelineLogger')(verbose=True)
     cli_debug_value = args.debug_profile or args.debug
-    DebugService.initialize(config=None, logger=logger, cli_debug=cli_debug_value)
-    messenger = MessengerFactory.create_from_env(agent_name='artemis-orchestrator')
+    SUBSYSTEMS.resolve('DebugService').initialize(config=None, logger=logger, cli_debug=cli_debug_value)
+    messenger = SUBSYSTEMS.resolve('MessengerFactory').create_from_env(agent_name='artemis-orchestrator')
     rag_db_path = config.get('ARTEMIS_RAG_DB_PATH', 'db')
-    rag = RAGAgent(db_path=rag_db_path, verbose=True)
+    rag = SUBSYSTEMS.resolve('RAGAgent')(db_path=rag_db_path, verbose=True)
     messenger.register_agent(capabilities=['coordinate_pipeline', 'manage_workflow'], status='active')
+    from orchestrator.card_creation import create_card_from_requirements, attach_requirements_to_card
+    from orchestrator.adaptive_integration import select_adaptive_strategy
     try:
         # Track parsed requirements and card for adaptive pipeline selection
         parsed_requirements = None
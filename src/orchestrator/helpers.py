@@ -8,19 +8,23 @@ PATTERNS: Guard Clauses, Early Returns.
 EXTRACTED FROM: artemis_orchestrator.py (platform, notification, retrospective, code review helpers)
 """
 
+from __future__ import annotations
+
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
-from platform_detector import PlatformDetector, PlatformInfo, ResourceAllocation
-from rag_agent import RAGAgent
 from artemis_stage_interface import LoggerInterface
-from pipeline_observer import PipelineObservable, EventBuilder
 from messenger_interface import MessengerInterface
-from retrospective_agent import RetrospectiveAgent
-from llm_client import LLMClient
 from artemis_exceptions import RAGStorageError, FileReadError, create_wrapped_exception
+from orchestrator.lazy_imports import SUBSYSTEMS
+
+if TYPE_CHECKING:
+    from platform_detector import PlatformInfo, ResourceAllocation
+    from rag_agent import RAGAgent
+    from pipeline_observer import PipelineObservable
+    from llm_client import LLMClient
 
 
 def _validate_platform_hash(
@@ -117,7 +121,7 @@ def notify_pipeline_start(
 ) -> None:
     """Notify agents and observers that pipeline has started"""
     if enable_observers and observable:
-        event = EventBuilder.pipeline_started(
+        event = SUBSYSTEMS.resolve('EventBuilder').pipeline_started(
             card_id,
             card_title=card.get('title'),
             workflow_plan=workflow_plan,
@@ -156,7 +160,7 @@ def notify_pipeline_completion(
 ) -> None:
     """Notify agents and observers that pipeline completed"""
     if enable_observers and observable:
-        event = EventBuilder.pipeline_completed(
+        event = SUBSYSTEMS.resolve('EventBuilder').pipeline_completed(
             card_id,
             card_title=card.get('title'),
             stages_executed=len(stage_results),
@@ -195,7 +199,7 @@ def notify_pipeline_failure(
 ) -> None:
     """Notify agents and observers that pipeline failed"""
     if enable_observers and observable:
-        event = EventBuilder.pipeline_failed(
+        event = SUBSYSTEMS.resolve('EventBuilder').pipeline_failed(
             card_id,
             error=error,
             card_title=card.get('title'),
@@ -273,7 +277,8 @@ def run_retrospective(
     """Run sprint retrospective to learn from pipeline execution"""
     sprint_data = collect_sprint_metrics(card, stage_results, context)
 
-    retrospective = RetrospectiveAgent(
+    # Retrospective pulls in every stage (and ChromaDB) - load it only when run
+    retrospective = SUBSYSTEMS.resolve('RetrospectiveAgent')(
         llm_client=llm_client,
         rag=rag,
         logger=logger,
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Lazy Imports - Deferred loading of pipeline stages and heavy subsystems
+
+WHAT:
+Registries mapping names to "module:attribute" targets that are imported on
+first use, plus a PEP 562 module ``__getattr__`` factory so packages can keep
+their public names without importing them up front.
+
+WHY:
+Importing the orchestrator used to pull in ChromaDB (via RAGAgent), every
+pipeline stage, the supervisor, the AI planner and platform detection -
+several seconds before any CLI command could even print ``--help`` or a
+workflow status. Loading those only when a pipeline actually builds them
+keeps status/list/help commands fast.
+
+RESPONSIBILITY:
+- Map public names to their defining module and attribute
+- Import and cache a target on first resolve (thread-safe)
+- Expose registered names as lazy module attributes (PEP 562)
+
+PATTERNS:
+- Registry Pattern: Name -> import target table
+- Lazy Initialization / Virtual Proxy: Import on first access
+- Guard Clause Pattern: Early return for cached targets
+"""
+
+import importlib
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+class LazyRegistry:
+    """
+    Name -> "module:attribute" table resolved on first access.
+
+    Usage:
+        registry = LazyRegistry({"RAGAgent": "rag_agent:RAGAgent"})
+        RAGAgent = registry.resolve("RAGAgent")   # imports rag_agent now
+    """
+
+    def __init__(self, entries: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            entries: Mapping of public name to "module:attribute"
+                     ("module" alone resolves to the module itself)
+        """
+        self._targets: Dict[str, str] = dict(entries or {})
+        self._resolved: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+
+    def register(self, name: str, target: str) -> None:
+        """Add or replace a target (drops any cached value)"""
+        with self._lock:
+            self._targets[name] = target
+            self._resolved.pop(name, None)
+
+    def resolve(self, name: str) -> Any:
+        """
+        Import (once) and return a registered target.
+
+        Raises:
+            KeyError: If name is not registered
+            ImportError / AttributeError: If the target cannot be loaded
+        """
+        # Guard clause: already loaded
+        if name in self._resolved:
+            return self._resolved[name]
+
+        with self._lock:
+            if name in self._resolved:
+                return self._resolved[name]
+
+            module_name, _, attribute = self._targets[name].partition(":")
+            value = importlib.import_module(module_name)
+            if attribute:
+                value = getattr(value, attribute)
+            self._resolved[name] = value
+            return value
+
+    def is_loaded(self, name: str) -> bool:
+        """True once name has been resolved"""
+        return name in self._resolved
+
+    def loaded_names(self) -> List[str]:
+        """Names resolved so far (useful for startup diagnostics)"""
+        return sorted(self._resolved)
+
+    def names(self) -> List[str]:
+        return sorted(self._targets)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._targets
+
+    def module_getattr(self, module_name: str, names: Optional[Iterable[str]] = None) -> Callable[[str], Any]:
+        """
+        Build a PEP 562 ``__getattr__`` exposing registered names lazily.
+
+        Args:
+            module_name: __name__ of the module installing the hook
+            names: Restrict to these names (default: every registered name)
+
+        Returns:
+            Function suitable for assignment to a module's ``__getattr__``
+        """
+        exported = frozenset(names) if names is not None else None
+
+        def __getattr__(name: str) -> Any:
+            if name not in self or (exported is not None and name not in exported):
+                raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+            return self.resolve(name)
+
+        return __getattr__
+
+
+# Heavy subsystems the orchestrator needs only once a pipeline is built
+SUBSYSTEMS = LazyRegistry({
+    "RAGAgent": "rag_agent:RAGAgent",
+    "KanbanBoard": "kanban_manager:KanbanBoard",
+    "ConfigurationAgent": "config_agent:ConfigurationAgent",
+    "get_config": "config_agent:get_config",
+    "SupervisorAgent": "supervisor_agent:SupervisorAgent",
+    "PlatformDetector": "platform_detector:PlatformDetector",
+    "PlatformInfo": "platform_detector:PlatformInfo",
+    "ResourceAllocation": "platform_detector:ResourceAllocation",
+    "get_platform_summary": "platform_detector:get_platform_summary",
+    "OrchestrationPlannerFactory": "ai_orchestration_planner:OrchestrationPlannerFactory",
+    "PipelineObservable": "pipeline_observer:PipelineObservable",
+    "ObserverFactory": "pipeline_observer:ObserverFactory",
+    "ExecutionStatsObserver": "pipeline_observer:ExecutionStatsObserver",
+    "StateTrackingObserver": "pipeline_observer:StateTrackingObserver",
+    "get_redis_metrics": "redis_metrics:get_metrics_instance",
+    "EventBuilder": "pipeline_observer:EventBuilder",
+    "PipelineStrategy": "pipeline_strategies:PipelineStrategy",
+    "StandardPipelineStrategy": "pipeline_strategies:StandardPipelineStrategy",
+    "PipelineLogger": "artemis_services:PipelineLogger",
+    "TestRunner": "artemis_services:TestRunner",
+    "RetrospectiveAgent": "retrospective_agent:RetrospectiveAgent",
+    "LLMClient": "llm_client:LLMClient",
+    "MessengerFactory": "messenger_factory:MessengerFactory",
+    "DebugService": "debug_service:DebugService",
+})
+
+# Pipeline stages, imported when create_default_stages() builds them
+STAGES = LazyRegistry({
+    "ProjectAnalysisStage": "artemis_stages:ProjectAnalysisStage",
+    "ArchitectureStage": "artemis_stages:ArchitectureStage",
+    "DependencyValidationStage": "artemis_stages:DependencyValidationStage",
+    "DevelopmentStage": "artemis_stages:DevelopmentStage",
+    "ValidationStage": "artemis_stages:ValidationStage",
+    "IntegrationStage": "artemis_stages:IntegrationStage",
+    "TestingStage": "artemis_stages:TestingStage",
+    "ResearchStage": "artemis_stages:ResearchStage",
+    "CodeReviewStage": "code_review_stage:CodeReviewStage",
+    "ArbitrationStage": "arbitration_stage:ArbitrationStage",
+    "SprintPlanningStage": "sprint_planning_stage:SprintPlanningStage",
+    "ProjectReviewStage": "project_review_stage:ProjectReviewStage",
+    "UIUXStage": "uiux_stage:UIUXStage",
+    "RequirementsParsingStage": "requirements_stage:RequirementsParsingStage",
+    "SSDGenerationStage": "ssd_generation_stage:SSDGenerationStage",
+})
+
+
+__all__ = ["LazyRegistry", "SUBSYSTEMS", "STAGES"]
@@ -27,24 +27,30 @@ PATTERNS:
 
 EXTRACTED FROM: artemis_orchestrator.py lines 120-404
 """
-from typing import Dict, List, Optional, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Any
 from pathlib import Path
-from omegaconf import DictConfig
 from artemis_stage_interface import PipelineStage, LoggerInterface
-from artemis_services import PipelineLogger, TestRunner
 from artemis_exceptions import PipelineConfigurationError
-from kanban_manager import KanbanBoard
 from messenger_interface import MessengerInterface
-from rag_agent import RAGAgent
-from config_agent import ConfigurationAgent, get_config
-from supervisor_agent import SupervisorAgent
-from pipeline_strategies import PipelineStrategy, StandardPipelineStrategy
-from platform_detector import PlatformDetector, PlatformInfo, ResourceAllocation, get_platform_summary
-from ai_orchestration_planner import OrchestrationPlannerFactory
-from pipeline_observer import PipelineObservable, ObserverFactory
-from orchestrator.supervisor_integration import register_stages_with_supervisor
+from orchestrator.lazy_imports import SUBSYSTEMS
 from orchestrator.helpers import store_and_validate_platform_info
 
+if TYPE_CHECKING:
+    from omegaconf import DictConfig
+    from artemis_services import TestRunner
+    from kanban_manager import KanbanBoard
+    from rag_agent import RAGAgent
+    from config_agent import ConfigurationAgent
+    from supervisor_agent import SupervisorAgent
+    from pipeline_strategies import PipelineStrategy
+
+# Heavy subsystems (RAG/ChromaDB, supervisor, planner, platform detection) are
+# resolved through SUBSYSTEMS when an orchestrator is constructed, not at import.
+# Module attributes such as orchestrator_core.RAGAgent still resolve lazily.
+__getattr__ = SUBSYSTEMS.module_getattr(__name__)
+
 class ArtemisOrchestrator:
     """
     Artemis Orchestrator - SOLID Refactored
@@ -174,12 +180,16 @@ class ArtemisOrchestrator:
         self.git_agent = git_agent
         self.adaptive_config = adaptive_config
         self.enable_observers = enable_observers
-        self.observable = PipelineObservable(verbose=True) if enable_observers else None
+        self.observable = SUBSYSTEMS.resolve('PipelineObservable')(verbose=True) if enable_observers else None
+        self.execution_stats_observer = None
+        self._llm_usage_hooks: List[Any] = []
+        self._llm_stage_observer = None
         if self.enable_observers:
-            for observer in ObserverFactory.create_default_observers(verbose=True):
+            for observer in SUBSYSTEMS.resolve('ObserverFactory').create_default_observers(verbose=True):
                 self.observable.attach(observer)
+            self._attach_execution_stats_observer()
         # Pass adaptive_config to strategy if available
-        self.strategy = strategy or StandardPipelineStrategy(
+        self.strategy = strategy or SUBSYSTEMS.resolve('StandardPipelineStrategy')(
             verbose=True,
             observable=self.observable if enable_observers else None,
             adaptive_config=adaptive_config
@@ -189,17 +199,17 @@ class ArtemisOrchestrator:
             self.config = None
             verbose = hydra_config.logging.verbose
         else:
-            self.config = config or get_config(verbose=True)
+            self.config = config or SUBSYSTEMS.resolve('get_config')(verbose=True)
             self.hydra_config = None
             verbose = True
         self.verbose = verbose
-        self.logger = logger or PipelineLogger(verbose=verbose)
-        self.test_runner = test_runner or TestRunner()
+        self.logger = logger or SUBSYSTEMS.resolve('PipelineLogger')(verbose=verbose)
+        self.test_runner = test_runner or SUBSYSTEMS.resolve('TestRunner')()
         if hydra_config is not None:
             self.enable_supervision = hydra_config.pipeline.enable_supervision
         else:
             self.enable_supervision = enable_supervision
-        self.supervisor = supervisor or (SupervisorAgent(logger=self.logger, messenger=self.messenger, card_id=self.card_id, rag=self.rag, verbose=verbose, enable_cost_tracking=True, enable_config_validation=True, enable_sandboxing=True, daily_budget=10.0, monthly_budget=200.0) if self.enable_supervision else None)
+        self.supervisor = supervisor or (SUBSYSTEMS.resolve('SupervisorAgent')(logger=self.logger, messenger=self.messenger, card_id=self.card_id, rag=self.rag, verbose=verbose, enable_cost_tracking=True, enable_config_validation=True, enable_sandboxing=True, daily_budget=10.0, monthly_budget=200.0) if self.enable_supervision else None)
         if self.supervisor:
             try:
                 from llm_client import LLMClientFactory
@@ -228,15 +238,15 @@ class ArtemisOrchestrator:
                 [self.logger.log(f'  Missing: {key}', 'ERROR') for key in validation.missing_keys]
                 [self.logger.log(f'  Invalid: {key}', 'ERROR') for key in validation.invalid_keys]
                 raise PipelineConfigurationError(f'Invalid Artemis configuration', context={'missing_keys': validation.missing_keys, 'invalid_keys': validation.invalid_keys})
-        self.platform_detector = PlatformDetector(logger=self.logger)
+        self.platform_detector = SUBSYSTEMS.resolve('PlatformDetector')(logger=self.logger)
         self.platform_info = self.platform_detector.detect_platform()
         self.resource_allocation = self.platform_detector.calculate_resource_allocation(self.platform_info)
         self._store_and_validate_platform_info()
         if self.verbose:
-            summary = get_platform_summary(self.platform_info, self.resource_allocation)
+            summary = SUBSYSTEMS.resolve('get_platform_summary')(self.platform_info, self.resource_allocation)
 
             self.logger.log(summary, 'INFO')
-        self.orchestration_planner = OrchestrationPlannerFactory.create_planner(llm_client=self.llm_client, logger=self.logger, prefer_ai=True)
+        self.orchestration_planner = SUBSYSTEMS.resolve('OrchestrationPlannerFactory').create_planner(llm_client=self.llm_client, logger=self.logger, prefer_ai=True)
         self.logger.log('✅ Orchestration planner initialized', 'INFO')
         if self.adaptive_config:
             self._apply_adaptive_config()
@@ -248,8 +258,85 @@ class ArtemisOrchestrator:
         if self.enable_supervision and self.supervisor:
             self._register_stages_with_supervisor()
 
+    def _attach_execution_stats_observer(self) -> None:
+        """
+        Record per-stage history for the router and the dynamic pipeline optimizer
+
+        WHY: Kept out of ObserverFactory's default set because it persists to
+        disk; an unavailable stats database must not stop the pipeline.
+        """
+        try:
+            self.execution_stats_observer = SUBSYSTEMS.resolve('ExecutionStatsObserver')()
+            self.observable.attach(self.execution_stats_observer)
+        except Exception as e:
+            from artemis_logger import get_logger
+            get_logger('orchestrator').warning(f'Execution stats disabled: {e}')
+
+    def release_execution_stats_observer(self) -> None:
+        """
+        Stop the execution stats observer from receiving LLM usage
+
+        WHY: The observer releases its LLM metrics hook when the pipeline
+        finishes; a pipeline aborted by an exception never sends that event.
+        """
+        if self.execution_stats_observer is not None:
+            self.execution_stats_observer.close()
+
+    def attach_llm_usage_hooks(self) -> None:
+        """
+        Feed every LLM call of this pipeline run into cost tracking and metrics
+
+        WHY: Both LLM clients report usage (streamed calls included) through
+        llm.usage_metrics hooks; without registered sinks the supervisor's
+        CostTracker budgets and the RedisMetrics dashboards never see it.
+        The cost hook raises BudgetExceededError to the calling stage.
+        """
+        from llm.usage_metrics import cost_tracker_hook, redis_metrics_hook, register_metrics_hook
+        cost_tracker = getattr(self.supervisor, 'cost_tracker', None) if self.supervisor else None
+        if cost_tracker is not None:
+            hook = cost_tracker_hook(cost_tracker, stage=self._track_llm_stage(), card_id=self.card_id)
+            self._llm_usage_hooks.append(register_metrics_hook(hook, raise_errors=True))
+        try:
+            redis_metrics = SUBSYSTEMS.resolve('get_redis_metrics')()
+        except Exception as e:
+            self.logger.log(f'⚠️  Redis metrics unavailable: {e}', 'WARNING')
+            return
+        if redis_metrics.enabled:
+            self._llm_usage_hooks.append(register_metrics_hook(redis_metrics_hook(redis_metrics)))
+
+    def release_llm_usage_hooks(self) -> None:
+        """
+        Stop routing LLM usage to this orchestrator's sinks
+
+        WHY: Hooks are process-wide; a finished (or aborted) pipeline must not
+        keep charging later cards' calls to its cost tracker and metrics.
+        """
+        from llm.usage_metrics import unregister_metrics_hook
+        for hook in self._llm_usage_hooks:
+            unregister_metrics_hook(hook)
+        self._llm_usage_hooks = []
+        if self._llm_stage_observer is not None:
+            self.observable.detach(self._llm_stage_observer)
+            self._llm_stage_observer = None
+
+    def _track_llm_stage(self) -> Callable[[], Optional[str]]:
+        """
+        Stage to charge an LLM call to: the one running when the call is made
+
+        WHY: Per-stage cost reports need the stage, which only the pipeline
+        events know. Calls outside a stage (or without observers) return None
+        and are charged to the hook's default bucket.
+        """
+        if self.observable is None:
+            return lambda: None
+        observer = SUBSYSTEMS.resolve('StateTrackingObserver')()
+        self.observable.attach(observer)
+        self._llm_stage_observer = observer
+        return lambda: observer.current_stage
+
     def _register_stages_with_supervisor(self) -> None:
         """Register all stages with supervisor agent for monitoring (delegated to orchestrator.supervisor_integration)"""
+        from orchestrator.supervisor_integration import register_stages_with_supervisor
         register_stages_with_supervisor(self.supervisor)
 
     def _store_and_validate_platform_info(self) -> None:
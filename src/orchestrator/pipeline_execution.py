@@ -33,7 +33,7 @@ EXTRACTED FROM: artemis_orchestrator.py lines 620-839
 """
 
 import json
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 
 from artemis_stage_interface import PipelineStage
@@ -102,6 +102,16 @@ def run_full_pipeline(orchestrator: Any, max_retries: int = None) -> Dict:
     RAISES:
         Exception: Re-raised from strategy.execute() if pipeline fails catastrophically
     """
+    # LLM usage of this run goes to its cost tracker and metrics - and only this run
+    orchestrator.attach_llm_usage_hooks()
+    try:
+        return _run_pipeline(orchestrator, max_retries)
+    finally:
+        orchestrator.release_llm_usage_hooks()
+
+
+def _run_pipeline(orchestrator: Any, max_retries: Optional[int]) -> Dict:
+    """Pipeline body of run_full_pipeline (see its docstring)"""
     if max_retries is None:
         max_retries = MAX_RETRY_ATTEMPTS - 1  # Default: 2 retries
 
@@ -210,7 +220,12 @@ def run_full_pipeline(orchestrator: Any, max_retries: int = None) -> Dict:
     # Add orchestrator to context so strategy can access checkpoint_manager
     context['orchestrator'] = orchestrator
 
-    execution_result = orchestrator.strategy.execute(stages_to_run, context)
+    try:
+        execution_result = orchestrator.strategy.execute(stages_to_run, context)
+    except Exception:
+        # Completion events are skipped; stop attributing LLM usage to this card
+        orchestrator.release_execution_stats_observer()
+        raise
 
     # Extract results
     stage_results = execution_result.get("results", {})
@@ -258,6 +273,13 @@ def run_full_pipeline(orchestrator: Any, max_retries: int = None) -> Dict:
         if cleaned > 0:
             orchestrator.logger.log(f"🧹 Cleaned up {cleaned} zombie processes", "INFO")
 
+    # Model cascade escalation rates and savings per call site (process totals)
+    from llm.model_cascade import get_cascade_stats
+    cascade_stats = get_cascade_stats()
+    cascade_report = cascade_stats.report()
+    if cascade_report:
+        orchestrator.logger.log(cascade_stats.format(), "INFO")
+
     # Build final report
     supervisor_stats = orchestrator.supervisor.get_statistics() if orchestrator.enable_supervision and orchestrator.supervisor else None
 
@@ -287,6 +309,7 @@ def run_full_pipeline(orchestrator: Any, max_retries: int = None) -> Dict:
         "status": pipeline_status,
         "execution_result": execution_result,
         "supervisor_statistics": supervisor_stats,
+        "model_cascade": cascade_report,
         "retrospective": retrospective_report
     }
 
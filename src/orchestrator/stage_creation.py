@@ -27,40 +27,31 @@ PATTERNS:
 EXTRACTED FROM: artemis_orchestrator.py lines 405-618
 """
 
-from typing import List, Any
+import importlib
+from typing import List, Any, Optional
 
 from artemis_stage_interface import PipelineStage
-from artemis_stages import (
-    ProjectAnalysisStage,
-    ArchitectureStage,
-    DependencyValidationStage,
-    DevelopmentStage,
-    ValidationStage,
-    IntegrationStage,
-    TestingStage,
-    ResearchStage
-)
-from code_review_stage import CodeReviewStage
-from arbitration_stage import ArbitrationStage
-from sprint_planning_stage import SprintPlanningStage
-from project_review_stage import ProjectReviewStage
-from uiux_stage import UIUXStage
-from requirements_stage import RequirementsParsingStage
-from ssd_generation_stage import SSDGenerationStage
-
-# Import AIQueryService for centralized KG→RAG→LLM pipeline
-try:
-    from ai_query_service import create_ai_query_service, AIQueryService
-    AI_QUERY_SERVICE_AVAILABLE = True
-except ImportError:
-    AI_QUERY_SERVICE_AVAILABLE = False
-
-# Import IntelligentRouter for AI-powered stage selection
-try:
-    from intelligent_router import IntelligentRouter
-    INTELLIGENT_ROUTER_AVAILABLE = True
-except ImportError:
-    INTELLIGENT_ROUTER_AVAILABLE = False
+from orchestrator.lazy_imports import STAGES
+
+# Stage classes remain importable from this module, resolved on first access
+__getattr__ = STAGES.module_getattr(__name__)
+
+
+def _load_optional(module_name: str, attribute: str) -> Optional[Any]:
+    """
+    Import an optional collaborator on demand.
+
+    WHY: AIQueryService and IntelligentRouter are optional; importing them only
+         when stages are built keeps orchestrator import cheap.
+
+    Returns:
+        The attribute, or None if the module is unavailable
+    """
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        return None
+    return getattr(module, attribute, None)
 
 
 def create_default_stages(orchestrator: Any) -> List[PipelineStage]:
@@ -112,9 +103,29 @@ def create_default_stages(orchestrator: Any) -> List[PipelineStage]:
     """
     stages = []
 
+    # Stage modules load here, when a pipeline is actually built
+    ProjectAnalysisStage = STAGES.resolve("ProjectAnalysisStage")
+    ArchitectureStage = STAGES.resolve("ArchitectureStage")
+    DependencyValidationStage = STAGES.resolve("DependencyValidationStage")
+    DevelopmentStage = STAGES.resolve("DevelopmentStage")
+    ValidationStage = STAGES.resolve("ValidationStage")
+    IntegrationStage = STAGES.resolve("IntegrationStage")
+    TestingStage = STAGES.resolve("TestingStage")
+    ResearchStage = STAGES.resolve("ResearchStage")
+    CodeReviewStage = STAGES.resolve("CodeReviewStage")
+    ArbitrationStage = STAGES.resolve("ArbitrationStage")
+    SprintPlanningStage = STAGES.resolve("SprintPlanningStage")
+    ProjectReviewStage = STAGES.resolve("ProjectReviewStage")
+    UIUXStage = STAGES.resolve("UIUXStage")
+    RequirementsParsingStage = STAGES.resolve("RequirementsParsingStage")
+    SSDGenerationStage = STAGES.resolve("SSDGenerationStage")
+
+    create_ai_query_service = _load_optional("ai_query_service", "create_ai_query_service")
+    IntelligentRouter = _load_optional("intelligent_router", "IntelligentRouter")
+
     # Initialize centralized AI Query Service (KG→RAG→LLM pipeline)
     ai_service = None
-    if AI_QUERY_SERVICE_AVAILABLE and orchestrator.llm_client:
+    if create_ai_query_service and orchestrator.llm_client:
         try:
             orchestrator.logger.log("Initializing centralized AI Query Service...", "INFO")
             ai_service = create_ai_query_service(
@@ -132,7 +143,7 @@ def create_default_stages(orchestrator: Any) -> List[PipelineStage]:
 
     # Initialize Intelligent Router for AI-powered stage selection
     orchestrator.intelligent_router = None
-    if INTELLIGENT_ROUTER_AVAILABLE:
+    if IntelligentRouter:
         try:
             orchestrator.logger.log("Initializing Intelligent Router for dynamic stage selection...", "INFO")
             orchestrator.intelligent_router = IntelligentRouter(
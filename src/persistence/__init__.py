@@ -23,6 +23,7 @@ Package Structure:
 - query_interface: High-level query operations
 - checkpoint_manager: Checkpoint creation and validation
 - state_restoration: Pipeline recovery operations
+- execution_stats: Per-stage execution history and percentile predictions
 
 Original file: 766 lines
 Modularized: 9 focused modules
@@ -48,6 +49,12 @@ from .factory import PersistenceStoreFactory
 from .query_interface import PersistenceQueryInterface
 from .checkpoint_manager import CheckpointManager
 from .state_restoration import StateRestorationManager
+from .execution_stats import (
+    ExecutionStatsStore,
+    StageExecutionRecord,
+    StagePrediction,
+    get_execution_stats_store
+)
 
 # Serialization utilities (internal use)
 from .serialization import (
@@ -78,6 +85,11 @@ __all__ = [
     'CheckpointManager',
     'StateRestorationManager',
 
+    'ExecutionStatsStore',
+    'StageExecutionRecord',
+    'StagePrediction',
+    'get_execution_stats_store',
+
     # Serialization (for advanced users)
     'serialize_pipeline_state',
     'deserialize_pipeline_state',
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Execution Statistics Store
+
+WHY: Routing and parallelism decisions were made from hard-coded guesses
+     (a fixed table of "similar past tasks", worker counts per complexity
+     label) even though every pipeline run measures what actually happened.
+
+RESPONSIBILITY: Record duration, token usage, cost, retry count and outcome
+                for every stage of every card, keyed by task features, and
+                predict percentile durations and costs for new cards.
+
+PATTERNS:
+- Repository Pattern: SQLite-backed store hides queries from callers
+- Back-off Strategy: exact features -> same complexity -> any card
+- Singleton: get_execution_stats_store() shares one connection per process
+
+Predictions need at least `min_samples` records at some feature level;
+otherwise they are marked cold_start and callers keep their heuristics.
+"""
+
+import math
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from artemis_constants import EXECUTION_STATS_DB_PATH, EXECUTION_STATS_MIN_SAMPLES
+
+OUTCOME_SUCCESS = 'success'
+OUTCOME_FAILURE = 'failure'
+
+LEVEL_EXACT = 'exact'
+LEVEL_COMPLEXITY = 'complexity'
+LEVEL_STAGE = 'stage'
+LEVEL_COLD_START = 'cold_start'
+
+UNKNOWN_FEATURE = 'unknown'
+
+# Only the most recent runs per query feed predictions
+MAX_SAMPLES = 500
+
+# Complexity labels used by the AI planner mapped onto the router's scale
+COMPLEXITY_ALIASES = {
+    'moderate': 'medium',
+    'very_complex': 'complex',
+}
+
+
+def normalize_complexity(complexity: Optional[str]) -> str:
+    """Map complexity labels from all producers onto simple/medium/complex"""
+    label = (complexity or UNKNOWN_FEATURE).lower()
+    return COMPLEXITY_ALIASES.get(label, label)
+
+
+def stage_key(stage: str) -> str:
+    """
+    Comparable stage identity across naming styles
+
+    Observers record stage class names ('CodeReviewStage') while the router
+    selects stages by id ('code_review'); both map to 'codereview'.
+    """
+    key = ''.join(char for char in stage.lower() if char.isalnum())
+    return key[:-len('stage')] if key.endswith('stage') and key != 'stage' else key
+
+
+def percentile(values: Sequence[float], pct: float) -> Optional[float]:
+    """
+    Linear-interpolated percentile (same definition as numpy's default)
+
+    Args:
+        values: Samples (any order)
+        pct: Percentile in [0, 100]
+
+    Returns:
+        Percentile value, or None without samples
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower, upper = math.floor(rank), math.ceil(rank)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+@dataclass
+class StageExecutionRecord:
+    """One finished stage run"""
+    card_id: str
+    stage: str
+    task_type: str
+    complexity: str
+    duration_seconds: float
+    tokens: int = 0
+    cost: float = 0.0
+    retries: int = 0
+    outcome: str = OUTCOME_SUCCESS
+    recorded_at: Optional[float] = None
+
+
+@dataclass
+class StagePrediction:
+    """
+    Predicted behaviour of a stage for a new card
+
+    level tells which feature match the prediction is based on; cold_start
+    predictions carry no values and callers should use their fallbacks.
+    """
+    stage: str
+    level: str
+    samples: int
+    duration_p50: Optional[float] = None
+    duration_p90: Optional[float] = None
+    cost_p50: Optional[float] = None
+    cost_p90: Optional[float] = None
+    tokens_p50: Optional[float] = None
+    mean_retries: Optional[float] = None
+    success_rate: Optional[float] = None
+
+    @property
+    def cold_start(self) -> bool:
+        return self.level == LEVEL_COLD_START
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+class ExecutionStatsStore:
+    """
+    SQLite store of per-stage execution statistics
+
+    WHY: One local, dependency-free source of measured history for the
+         router and the dynamic pipeline optimizer.
+    RESPONSIBILITY: Persist stage records, answer history and percentile queries
+    PATTERNS: Repository Pattern, Back-off Strategy
+
+    Example:
+        >>> store = ExecutionStatsStore(Path('/tmp/stats.db'))
+        >>> store.record(StageExecutionRecord('card-1', 'DevelopmentStage', 'feature', 'medium', 310.0))
+        >>> store.predict_stage('DevelopmentStage', 'feature', 'medium').cold_start
+        True
+    """
+
+    def __init__(self, db_path: Optional[Path] = None, min_samples: int = EXECUTION_STATS_MIN_SAMPLES):
+        """
+        Args:
+            db_path: SQLite database file (default: EXECUTION_STATS_DB_PATH)
+            min_samples: Records needed before a feature level is trusted
+        """
+        self.db_path = Path(db_path or EXECUTION_STATS_DB_PATH)
+        self.min_samples = min_samples
+        self._lock = threading.Lock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._create_tables()
+
+    def _create_tables(self) -> None:
+        with self._lock, self.connection:
+            self.connection.execute("""
+                CREATE TABLE IF NOT EXISTS stage_executions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    card_id TEXT NOT NULL,
+                    stage TEXT NOT NULL,
+                    task_type TEXT NOT NULL,
+                    complexity TEXT NOT NULL,
+                    duration_seconds REAL NOT NULL,
+                    tokens INTEGER NOT NULL,
+                    cost REAL NOT NULL,
+                    retries INTEGER NOT NULL,
+                    outcome TEXT NOT NULL,
+                    recorded_at REAL NOT NULL
+                )
+            """)
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_stage_features "
+                "ON stage_executions (stage, complexity, task_type, recorded_at)"
+            )
+
+    def record(self, record: StageExecutionRecord) -> None:
+        """Persist one finished stage run"""
+        with self._lock, self.connection:
+            self.connection.execute(
+                "INSERT INTO stage_executions (card_id, stage, task_type, complexity, duration_seconds, "
+                "tokens, cost, retries, outcome, recorded_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (record.card_id, record.stage, (record.task_type or UNKNOWN_FEATURE).lower(),
+                 normalize_complexity(record.complexity), record.duration_seconds, record.tokens,
+                 record.cost, record.retries, record.outcome, record.recorded_at or time.time())
+            )
+
+    def card_count(self, task_type: Optional[str] = None, complexity: Optional[str] = None) -> int:
+        """
+        Number of distinct cards with recorded stages
+
+        Args:
+            task_type: Only count cards of this type
+            complexity: Only count cards of this complexity
+        """
+        where, params = self._feature_filter(task_type, complexity)
+        query = f"SELECT COUNT(DISTINCT card_id) FROM stage_executions {where}"
+        with self._lock:
+            return self.connection.execute(query, params).fetchone()[0]
+
+    def known_stages(self) -> List[str]:
+        """Stage names with at least one record"""
+        with self._lock:
+            rows = self.connection.execute("SELECT DISTINCT stage FROM stage_executions ORDER BY stage").fetchall()
+        return [row[0] for row in rows]
+
+    def predict_stage(self, stage: str, task_type: Optional[str], complexity: Optional[str]) -> StagePrediction:
+        """
+        Percentile prediction for one stage of a new card
+
+        Falls back from the exact task features to the same complexity and
+        then to all cards, using the first level with enough samples.
+        """
+        levels = [
+            (LEVEL_EXACT, task_type, complexity),
+            (LEVEL_COMPLEXITY, None, complexity),
+            (LEVEL_STAGE, None, None),
+        ]
+        samples = 0
+        for level, level_type, level_complexity in levels:
+            rows = self._samples(stage, level_type, level_complexity)
+            samples = max(samples, len(rows))
+            if len(rows) >= self.min_samples:
+                return self._prediction(stage, level, rows)
+        return StagePrediction(stage=stage, level=LEVEL_COLD_START, samples=samples)
+
+    def predict_card(
+        self,
+        task_type: Optional[str],
+        complexity: Optional[str],
+        stages: Optional[Iterable[str]] = None
+    ) -> Dict[str, StagePrediction]:
+        """
+        Predictions for every stage of a new card
+
+        Args:
+            task_type: Card task type
+            complexity: Card complexity
+            stages: Stage names (default: every stage with history)
+        """
+        names = list(stages) if stages is not None else self.known_stages()
+        return {name: self.predict_stage(name, task_type, complexity) for name in names}
+
+    def _samples(self, stage: str, task_type: Optional[str], complexity: Optional[str]) -> List[Tuple]:
+        where, params = self._feature_filter(task_type, complexity, stage=stage)
+        query = (f"SELECT duration_seconds, cost, tokens, retries, outcome FROM stage_executions {where} "
+                 f"ORDER BY recorded_at DESC LIMIT {MAX_SAMPLES}")
+        with self._lock:
+            return self.connection.execute(query, params).fetchall()
+
+    @staticmethod
+    def _feature_filter(task_type: Optional[str], complexity: Optional[str], stage: Optional[str] = None):
+        clauses, params = [], []
+        for column, value in (('stage', stage), ('task_type', task_type and task_type.lower()),
+                              ('complexity', complexity and normalize_complexity(complexity))):
+            if value is None:
+                continue
+            clauses.append(f"{column} = ?")
+            params.append(value)
+        return ("WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    @staticmethod
+    def _prediction(stage: str, level: str, rows: List[Tuple]) -> StagePrediction:
+        durations = [row[0] for row in rows]
+        costs = [row[1] for row in rows]
+        return StagePrediction(
+            stage=stage,
+            level=level,
+            samples=len(rows),
+            duration_p50=percentile(durations, 50),
+            duration_p90=percentile(durations, 90),
+            cost_p50=percentile(costs, 50),
+            cost_p90=percentile(costs, 90),
+            tokens_p50=percentile([row[2] for row in rows], 50),
+            mean_retries=sum(row[3] for row in rows) / len(rows),
+            success_rate=sum(1 for row in rows if row[4] == OUTCOME_SUCCESS) / len(rows),
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self.connection.close()
+
+
+_STORE: Optional[ExecutionStatsStore] = None
+_STORE_LOCK = threading.Lock()
+
+
+def get_execution_stats_store() -> ExecutionStatsStore:
+    """
+    Process-wide execution statistics store
+
+    WHY: The recording observer, the router and the optimizer share one
+         connection (and one lock) per process.
+    """
+    global _STORE
+    with _STORE_LOCK:
+        if _STORE is None:
+            _STORE = ExecutionStatsStore()
+        return _STORE
@@ -56,6 +56,7 @@ from observer import (
     StateTrackingObserver,
     NotificationObserver,
     SupervisorCommandObserver,
+    ExecutionStatsObserver,
     # Factories and builders
     ObserverFactory,
     EventBuilder,
@@ -74,6 +75,7 @@ __all__ = [
     "StateTrackingObserver",
     "NotificationObserver",
     "SupervisorCommandObserver",
+    "ExecutionStatsObserver",
     # Factories and builders
     "ObserverFactory",
     "EventBuilder",
@@ -1,12 +1,13 @@
 from artemis_logger import get_logger
 logger = get_logger('__init__')
-'\nWHY: Export public API for prompt_management package.\nRESPONSIBILITY: Define package interface and backward compatibility.\nPATTERNS: Facade pattern, explicit exports.\n\nPrompt Management System for Artemis\n====================================\n\nThis package provides a modular system for managing prompt templates\nwith DEPTH framework support and advanced reasoning strategies.\n\nModules:\n- models: Core data structures (PromptTemplate, PromptContext, etc.)\n- template_loader: Load templates from RAG storage\n- variable_substitutor: Template variable substitution\n- formatter: Format prompts with DEPTH framework\n- prompt_builder: Builder pattern for prompt construction\n- prompt_repository: Repository pattern for template persistence\n\nUsage:\n    from prompt_management import (\n        PromptManager,\n        PromptTemplate,\n        PromptContext,\n        ReasoningStrategyType\n    )\n\n    # Create manager\n    manager = PromptManager(rag_agent, verbose=True)\n\n    # Store template\n    manager.store_prompt(\n        name="my_prompt",\n        category="developer_agent",\n        perspectives=["Expert A", "Expert B"],\n        success_metrics=["Metric 1", "Metric 2"],\n        # ... other parameters\n    )\n\n    # Retrieve and render\n    prompt = manager.get_prompt("my_prompt")\n    rendered = manager.render_prompt(prompt, {"var": "value"})\n'
+'\nWHY: Export public API for prompt_management package.\nRESPONSIBILITY: Define package interface and backward compatibility.\nPATTERNS: Facade pattern, explicit exports.\n\nPrompt Management System for Artemis\n====================================\n\nThis package provides a modular system for managing prompt templates\nwith DEPTH framework support and advanced reasoning strategies.\n\nModules:\n- models: Core data structures (PromptTemplate, PromptContext, etc.)\n- template_loader: Load templates from RAG storage\n- variable_substitutor: Template variable substitution\n- formatter: Format prompts with DEPTH framework\n- prompt_builder: Builder pattern for prompt construction\n- prompt_repository: Repository pattern for template persistence\n- template_registry: In-process (name, version) template index\n\nUsage:\n    from prompt_management import (\n        PromptManager,\n        PromptTemplate,\n        PromptContext,\n        ReasoningStrategyType\n    )\n\n    # Create manager\n    manager = PromptManager(rag_agent, verbose=True)\n\n    # Store template\n    manager.store_prompt(\n        name="my_prompt",\n        category="developer_agent",\n        perspectives=["Expert A", "Expert B"],\n        success_metrics=["Metric 1", "Metric 2"],\n        # ... other parameters\n    )\n\n    # Retrieve and render\n    prompt = manager.get_prompt("my_prompt")\n    rendered = manager.render_prompt(prompt, {"var": "value"})\n'
 from .models import PromptTemplate, PromptContext, RenderedPrompt, ReasoningStrategyType
 from .template_loader import TemplateLoader
 from .variable_substitutor import VariableSubstitutor
 from .formatter import PromptFormatter
 from .prompt_builder import PromptBuilder, PromptBuilderFactory
 from .prompt_repository import PromptRepository
+from .template_registry import TemplateRegistry, get_template_registry
 from typing import Dict, List, Optional, Any
 
 class PromptManager:
@@ -31,8 +32,9 @@ class PromptManager:
             verbose: Enable verbose logging
         """
         self.verbose = verbose
-        self._repository = PromptRepository(rag_agent, verbose=verbose)
-        self._loader = TemplateLoader(rag_agent, verbose=verbose)
+        self._registry = get_template_registry()
+        self._repository = PromptRepository(rag_agent, verbose=verbose, registry=self._registry)
+        self._loader = TemplateLoader(rag_agent, verbose=verbose, registry=self._registry)
         self._builder_factory = PromptBuilderFactory(verbose=verbose)
         self._substitutor = VariableSubstitutor(strict=False, verbose=verbose)
         self._formatter = PromptFormatter(verbose=verbose)
@@ -136,4 +138,4 @@ class PromptManager:
             success: Whether usage was successful
         """
         self._repository.update_performance(prompt_id, success)
-__all__ = ['PromptManager', 'PromptTemplate', 'PromptContext', 'RenderedPrompt', 'ReasoningStrategyType', 'TemplateLoader', 'VariableSubstitutor', 'PromptFormatter', 'PromptBuilder', 'PromptBuilderFactory', 'PromptRepository']
\ No newline at end of file
+__all__ = ['PromptManager', 'PromptTemplate', 'PromptContext', 'RenderedPrompt', 'ReasoningStrategyType', 'TemplateLoader', 'VariableSubstitutor', 'PromptFormatter', 'PromptBuilder', 'PromptBuilderFactory', 'PromptRepository', 'TemplateRegistry', 'get_template_registry']
\ No newline at end of file
@@ -1,11 +1,12 @@
 from artemis_logger import get_logger
 logger = get_logger('prompt_repository')
-'\nWHY: Manage storage and retrieval of prompt templates.\nRESPONSIBILITY: Provide repository pattern for prompt persistence.\nPATTERNS: Repository pattern, guard clauses, CQRS (command-query separation).\n\nThis module implements the repository pattern for prompt template\nstorage, providing a clean abstraction over RAG storage.\n'
+'\nWHY: Manage storage and retrieval of prompt templates.\nRESPONSIBILITY: Provide repository pattern for prompt persistence.\nPATTERNS: Repository pattern, guard clauses, CQRS (command-query separation).\n\nThis module implements the repository pattern for prompt template\nstorage, providing a clean abstraction over RAG storage. Exact-name lookups\nare served from the in-process TemplateRegistry; RAG semantic search is used\nfor discovery queries and registry misses.\n'
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 import json
 import hashlib
 from .models import PromptTemplate, ReasoningStrategyType
+from .template_registry import TemplateRegistry, get_template_registry, template_from_dict, template_to_dict
 from debug_mixin import DebugMixin
 
 class PromptRepository(DebugMixin):
@@ -16,20 +17,23 @@ class PromptRepository(DebugMixin):
     """
     PROMPT_CATEGORIES = ['developer_agent', 'supervisor_agent', 'project_analysis_stage', 'architecture_stage', 'code_review_stage', 'testing_stage', 'learning_engine', 'arbitration', 'recovery_workflow']
 
-    def __init__(self, rag_agent, verbose: bool=False):
+    def __init__(self, rag_agent, verbose: bool=False, registry: Optional[TemplateRegistry]=None):
         """
         WHY: Initialize repository with RAG agent.
-        RESPONSIBILITY: Set up storage backend.
+        RESPONSIBILITY: Set up storage backend and warm the template registry.
         PATTERNS: Dependency injection.
 
         Args:
             rag_agent: RAG agent for storage
             verbose: Enable verbose logging
+            registry: Template registry (default: process-wide registry)
         """
         DebugMixin.__init__(self, component_name='prompt_repo')
         self.rag = rag_agent
         self.verbose = verbose
         self._ensure_prompt_artifact_type()
+        self.registry = registry or get_template_registry()
+        self.registry.warm(rag_agent)
 
     def save(self, name: str, category: str, perspectives: List[str], success_metrics: List[str], context_layers: Dict[str, Any], task_breakdown: List[str], self_critique: str, system_message: str, user_template: str, tags: Optional[List[str]]=None, version: str='1.0', reasoning_strategy: ReasoningStrategyType=ReasoningStrategyType.NONE, reasoning_config: Optional[Dict[str, Any]]=None) -> str:
         """
@@ -65,6 +69,7 @@ class PromptRepository(DebugMixin):
         content = self._build_searchable_content(prompt)
         metadata = {'category': category, 'version': version, 'tags': json.dumps(tags or []), 'performance_score': 0.0, 'prompt_data': json.dumps(prompt_dict)}
         self.rag.store_artifact(artifact_type='prompt_template', card_id='system', task_title=name, content=content, metadata=metadata)
+        self.registry.put(prompt)
         if self.verbose:
             
             logger.log(f'[PromptRepository] Saved prompt: {name} (v{version})', 'INFO')
@@ -83,24 +88,37 @@ class PromptRepository(DebugMixin):
         Returns:
             PromptTemplate or None
         """
-        filters = {'task_title': name}
-        if version:
-            filters['version'] = version
-        results = self.rag.query_similar(query_text=name, artifact_types=['prompt_template'], top_k=1, filters=filters)
-        if not results:
+        template = self.registry.get(name, version)
+        if template is None:
+            template = self._query_by_name(name, version)
+        if template is None:
             self.debug_log('Template not found', name=name)
             if self.verbose:
                 
                 logger.log(f'[PromptRepository] Template not found: {name}', 'INFO')
             return None
-        prompt_data = self._extract_prompt_data(results[0])
-        template = self._dict_to_template(prompt_data)
         self._increment_usage(template.prompt_id)
         if self.verbose:
             
             logger.log(f'[PromptRepository] Retrieved: {name} (v{template.version})', 'INFO')
         return template
 
+    def _query_by_name(self, name: str, version: Optional[str]) -> Optional[PromptTemplate]:
+        """
+        WHY: Templates stored by another process are not in this registry yet.
+        RESPONSIBILITY: Fall back to a filtered RAG query and register the result.
+        PATTERNS: Read-through cache.
+        """
+        filters = {'task_title': name}
+        if version:
+            filters['version'] = version
+        results = self.rag.query_similar(query_text=name, artifact_types=['prompt_template'], top_k=1, filters=filters)
+        if not results:
+            return None
+        template = self._dict_to_template(self._extract_prompt_data(results[0]))
+        self.registry.put(template)
+        return template
+
     def find_by_category(self, category: str, top_k: int=5) -> List[PromptTemplate]:
         """
         WHY: Retrieve templates by category.
@@ -176,6 +194,7 @@ class PromptRepository(DebugMixin):
             prompt_id: Template ID
             success: Whether usage was successful
         """
+        self.registry.record_outcome(prompt_id, success)
         if self.verbose:
             outcome = 'Success' if success else 'Failure'
             
@@ -205,16 +224,11 @@ class PromptRepository(DebugMixin):
 
     def _template_to_dict(self, template: PromptTemplate) -> Dict:
         """Convert template to dictionary"""
-        return {'prompt_id': template.prompt_id, 'name': template.name, 'category': template.category, 'version': template.version, 'perspectives': template.perspectives, 'success_metrics': template.success_metrics, 'context_layers': template.context_layers, 'task_breakdown': template.task_breakdown, 'self_critique': template.self_critique, 'system_message': template.system_message, 'user_template': template.user_template, 'tags': template.tags, 'created_at': template.created_at, 'updated_at': template.updated_at, 'performance_score': template.performance_score, 'usage_count': template.usage_count, 'success_rate': template.success_rate, 'reasoning_strategy': template.reasoning_strategy.value, 'reasoning_config': template.reasoning_config}
+        return template_to_dict(template)
 
     def _dict_to_template(self, data: Dict) -> PromptTemplate:
         """Convert dictionary to template"""
-        strategy_value = data.get('reasoning_strategy', 'none')
-        if isinstance(strategy_value, str):
-            strategy = ReasoningStrategyType(strategy_value)
-        else:
-            strategy = strategy_value
-        return PromptTemplate(prompt_id=data['prompt_id'], name=data['name'], category=data['category'], version=data['version'], perspectives=data['perspectives'], success_metrics=data['success_metrics'], context_layers=data['context_layers'], task_breakdown=data['task_breakdown'], self_critique=data['self_critique'], system_message=data['system_message'], user_template=data['user_template'], tags=data['tags'], created_at=data['created_at'], updated_at=data['updated_at'], performance_score=data['performance_score'], usage_count=data['usage_count'], success_rate=data['success_rate'], reasoning_strategy=strategy, reasoning_config=data.get('reasoning_config'))
+        return template_from_dict(data)
 
     def _extract_prompt_data(self, result: Dict) -> Dict:
         """Extract prompt data from RAG result"""
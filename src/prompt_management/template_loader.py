@@ -4,6 +4,7 @@ logger = get_logger('template_loader')
 from typing import Dict, List, Optional, Any
 import json
 from .models import PromptTemplate, ReasoningStrategyType
+from .template_registry import TemplateRegistry, get_template_registry, template_from_dict
 
 class TemplateLoader:
     """
@@ -12,7 +13,7 @@ class TemplateLoader:
     PATTERNS: Repository pattern, dependency injection.
     """
 
-    def __init__(self, rag_agent, verbose: bool=False):
+    def __init__(self, rag_agent, verbose: bool=False, registry: Optional[TemplateRegistry]=None):
         """
         WHY: Initialize with RAG agent dependency.
         RESPONSIBILITY: Set up loader with required dependencies.
@@ -21,15 +22,17 @@ class TemplateLoader:
         Args:
             rag_agent: RAG agent for storage access
             verbose: Enable verbose logging
+            registry: Template registry (default: process-wide registry)
         """
         self.rag = rag_agent
         self.verbose = verbose
+        self.registry = registry or get_template_registry()
 
     def load_by_name(self, name: str, version: Optional[str]=None) -> Optional[PromptTemplate]:
         """
-        WHY: Load a template by name from RAG storage.
-        RESPONSIBILITY: Query RAG and deserialize template.
-        PATTERNS: Guard clause for not found, early returns.
+        WHY: Load a template by name (registry first, RAG on miss).
+        RESPONSIBILITY: Resolve exact key, fall back to RAG and register result.
+        PATTERNS: Guard clause for not found, early returns, read-through cache.
 
         Args:
             name: Template name
@@ -38,6 +41,9 @@ class TemplateLoader:
         Returns:
             PromptTemplate or None if not found
         """
+        template = self.registry.get(name, version)
+        if template is not None:
+            return template
         filters = {'task_title': name}
         if version:
             filters['version'] = version
@@ -48,7 +54,9 @@ class TemplateLoader:
                 logger.log(f'[TemplateLoader] Template not found: {name}', 'INFO')
             return None
         prompt_data = self._extract_prompt_data(results[0])
-        return self._dict_to_template(prompt_data)
+        template = self._dict_to_template(prompt_data)
+        self.registry.put(template)
+        return template
 
     def load_by_category(self, category: str, top_k: int=5) -> List[PromptTemplate]:
         """
@@ -129,9 +137,4 @@ class TemplateLoader:
         Returns:
             PromptTemplate instance
         """
-        reasoning_strategy_value = data.get('reasoning_strategy', ReasoningStrategyType.NONE.value)
-        if isinstance(reasoning_strategy_value, str):
-            reasoning_strategy = ReasoningStrategyType(reasoning_strategy_value)
-        else:
-            reasoning_strategy = reasoning_strategy_value
-        return PromptTemplate(prompt_id=data['prompt_id'], name=data['name'], category=data['category'], version=data['version'], perspectives=data['perspectives'], success_metrics=data['success_metrics'], context_layers=data['context_layers'], task_breakdown=data['task_breakdown'], self_critique=data['self_critique'], system_message=data['system_message'], user_template=data['user_template'], tags=data['tags'], created_at=data['created_at'], updated_at=data['updated_at'], performance_score=data['performance_score'], usage_count=data['usage_count'], success_rate=data['success_rate'], reasoning_strategy=reasoning_strategy, reasoning_config=data.get('reasoning_config'))
\ No newline at end of file
+        return template_from_dict(data)
\ No newline at end of file
@@ -0,0 +1,249 @@
+from artemis_logger import get_logger
+logger = get_logger('template_registry')
+'\nWHY: Resolve known prompt templates without embedding and vector search.\nRESPONSIBILITY: Keep an in-process (name, version) index of templates,\n                warmed from a local file cache and RAG, with write-through.\nPATTERNS: Registry pattern, write-through cache, guard clauses.\n\nSemantic search remains for discovery (category, tags, performance);\nlookups by exact name go through this registry first.\n'
+import json
+import os
+import threading
+from dataclasses import replace
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from .models import PromptTemplate, ReasoningStrategyType
+from .variable_substitutor import compile_template
+DEFAULT_CACHE_PATH = '../../.artemis_data/prompt_cache/templates.json'
+WARM_TOP_K = 500
+
+def template_to_dict(template: PromptTemplate) -> Dict[str, Any]:
+    """Convert template to a JSON-serializable dictionary"""
+    return {'prompt_id': template.prompt_id, 'name': template.name, 'category': template.category, 'version': template.version, 'perspectives': template.perspectives, 'success_metrics': template.success_metrics, 'context_layers': template.context_layers, 'task_breakdown': template.task_breakdown, 'self_critique': template.self_critique, 'system_message': template.system_message, 'user_template': template.user_template, 'tags': template.tags, 'created_at': template.created_at, 'updated_at': template.updated_at, 'performance_score': template.performance_score, 'usage_count': template.usage_count, 'success_rate': template.success_rate, 'reasoning_strategy': template.reasoning_strategy.value, 'reasoning_config': template.reasoning_config}
+
+def template_from_dict(data: Dict[str, Any]) -> PromptTemplate:
+    """Convert dictionary to template"""
+    strategy_value = data.get('reasoning_strategy', ReasoningStrategyType.NONE.value)
+    strategy = ReasoningStrategyType(strategy_value) if isinstance(strategy_value, str) else strategy_value
+    return PromptTemplate(prompt_id=data['prompt_id'], name=data['name'], category=data['category'], version=data['version'], perspectives=data['perspectives'], success_metrics=data['success_metrics'], context_layers=data['context_layers'], task_breakdown=data['task_breakdown'], self_critique=data['self_critique'], system_message=data['system_message'], user_template=data['user_template'], tags=data['tags'], created_at=data['created_at'], updated_at=data['updated_at'], performance_score=data['performance_score'], usage_count=data['usage_count'], success_rate=data['success_rate'], reasoning_strategy=strategy, reasoning_config=data.get('reasoning_config'))
+
+def _version_key(version: str) -> Tuple:
+    """Sort key so '1.10' > '1.9'; non-numeric parts compare as text"""
+    return tuple((0, int(part), '') if part.isdigit() else (1, 0, part) for part in str(version).split('.'))
+
+class TemplateRegistry:
+    """
+    WHY: Every stage fetches well-known templates by name; paying an embedding
+         and vector search for an exact-key lookup is pure latency.
+    RESPONSIBILITY: Index templates by (name, version) and prompt_id, track
+                    the latest version per name, persist to a file cache.
+    PATTERNS: Registry pattern, write-through cache.
+
+    Usage:
+        registry = get_template_registry()
+        registry.warm(rag_agent)
+        template = registry.get('developer_conservative_implementation')
+    """
+
+    def __init__(self, cache_path: Optional[str]=None, verbose: bool=False):
+        """
+        WHY: Initialize empty registry bound to a file cache.
+        RESPONSIBILITY: Set up indexes and cache location.
+        PATTERNS: Configuration injection.
+
+        Args:
+            cache_path: JSON file cache (default: ARTEMIS_PROMPT_CACHE_PATH);
+                        empty string disables the file cache
+            verbose: Enable verbose logging
+        """
+        if cache_path is None:
+            cache_path = os.getenv('ARTEMIS_PROMPT_CACHE_PATH', DEFAULT_CACHE_PATH)
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.verbose = verbose
+        self._lock = threading.RLock()
+        self._by_key: Dict[Tuple[str, str], PromptTemplate] = {}
+        self._by_id: Dict[str, Tuple[str, str]] = {}
+        self._latest: Dict[str, PromptTemplate] = {}
+        self._warmed_sources: set = set()
+        self.stats = {'hits': 0, 'misses': 0, 'writes': 0}
+
+    def get(self, name: str, version: Optional[str]=None) -> Optional[PromptTemplate]:
+        """
+        WHY: Exact-key lookup without touching RAG.
+        RESPONSIBILITY: Return the requested or latest version.
+        PATTERNS: Guard clause for unknown name.
+
+        Args:
+            name: Template name
+            version: Specific version or None for latest
+
+        Returns:
+            PromptTemplate or None
+        """
+        with self._lock:
+            template = self._by_key.get((name, version)) if version else self._latest.get(name)
+            self.stats['hits' if template else 'misses'] += 1
+            return template
+
+    def get_by_id(self, prompt_id: str) -> Optional[PromptTemplate]:
+        """Look up a template by prompt ID"""
+        with self._lock:
+            key = self._by_id.get(prompt_id)
+            return self._by_key.get(key) if key else None
+
+    def put(self, template: PromptTemplate, persist: bool=True) -> None:
+        """
+        WHY: Register a template (write-through from store/update paths).
+        RESPONSIBILITY: Index template, precompile its user template, persist.
+        PATTERNS: Write-through cache.
+
+        Args:
+            template: Template to register
+            persist: Write the file cache
+        """
+        compile_template(template.user_template)
+        with self._lock:
+            self._index(template)
+            self.stats['writes'] += 1
+            if persist:
+                self._save_cache()
+
+    def record_outcome(self, prompt_id: str, success: bool) -> Optional[PromptTemplate]:
+        """
+        WHY: Keep usage and success metrics current for performance queries.
+        RESPONSIBILITY: Update running success rate and persist.
+        PATTERNS: Guard clause for unknown prompt, write-through.
+
+        Args:
+            prompt_id: Template ID
+            success: Whether usage was successful
+
+        Returns:
+            Updated template or None if unknown
+        """
+        with self._lock:
+            template = self.get_by_id(prompt_id)
+            if template is None:
+                return None
+            usage_count = template.usage_count + 1
+            success_rate = (template.success_rate * template.usage_count + (1.0 if success else 0.0)) / usage_count
+            updated = replace(template, usage_count=usage_count, success_rate=success_rate, performance_score=success_rate, updated_at=datetime.utcnow().isoformat() + 'Z')
+            self.put(updated)
+            return updated
+
+    def warm(self, rag_agent: Any=None) -> int:
+        """
+        WHY: Load templates once per process instead of once per lookup.
+        RESPONSIBILITY: Load the file cache, then all prompt templates in RAG.
+        PATTERNS: Idempotent warm-up per source.
+
+        Args:
+            rag_agent: RAG agent with query_similar() (optional)
+
+        Returns:
+            Number of templates added or refreshed
+        """
+        loaded = 0
+        with self._lock:
+            if 'file' not in self._warmed_sources:
+                self._warmed_sources.add('file')
+                loaded += self._load_cache()
+            if rag_agent is not None and id(rag_agent) not in self._warmed_sources:
+                self._warmed_sources.add(id(rag_agent))
+                loaded += self._load_rag(rag_agent)
+                if loaded:
+                    self._save_cache()
+        if self.verbose and loaded:
+
+            logger.log(f'[TemplateRegistry] Warmed {loaded} templates ({len(self._by_key)} registered)', 'INFO')
+        return loaded
+
+    def names(self) -> List[str]:
+        """Registered template names"""
+        with self._lock:
+            return sorted({name for name, _ in self._by_key})
+
+    def clear(self) -> None:
+        """Forget all templates (file cache is left untouched)"""
+        with self._lock:
+            self._by_key.clear()
+            self._by_id.clear()
+            self._latest.clear()
+            self._warmed_sources.clear()
+
+    def _index(self, template: PromptTemplate) -> bool:
+        """Add template unless a fresher copy is already registered"""
+        key = (template.name, template.version)
+        current = self._by_key.get(key)
+        if current is not None and current.updated_at > template.updated_at:
+            return False
+        if current is not None:
+            self._by_id.pop(current.prompt_id, None)
+        self._by_key[key] = template
+        self._by_id[template.prompt_id] = key
+        latest = self._latest.get(template.name)
+        if latest is None or (_version_key(template.version), template.updated_at) >= (_version_key(latest.version), latest.updated_at):
+            self._latest[template.name] = template
+        return True
+
+    def _load_rag(self, rag_agent: Any) -> int:
+        """Index every prompt template RAG returns for one broad query"""
+        try:
+            results = rag_agent.query_similar(query_text='prompt template', artifact_types=['prompt_template'], top_k=WARM_TOP_K)
+        except Exception as e:
+            if self.verbose:
+
+                logger.log(f'[TemplateRegistry] RAG warm-up failed: {e}', 'INFO')
+            return 0
+        loaded = 0
+        for result in results or []:
+            try:
+                prompt_data = result['metadata']['prompt_data']
+                template = template_from_dict(json.loads(prompt_data) if isinstance(prompt_data, str) else prompt_data)
+            except (KeyError, TypeError, ValueError):
+                continue
+            compile_template(template.user_template)
+            loaded += int(self._index(template))
+        return loaded
+
+    def _load_cache(self) -> int:
+        """Index templates from the file cache"""
+        if not self.cache_path or not self.cache_path.exists():
+            return 0
+        try:
+            records = json.loads(self.cache_path.read_text()).get('templates', [])
+        except (OSError, ValueError, AttributeError):
+            return 0
+        loaded = 0
+        for record in records:
+            try:
+                template = template_from_dict(record)
+            except (KeyError, TypeError, ValueError):
+                continue
+            compile_template(template.user_template)
+            loaded += int(self._index(template))
+        return loaded
+
+    def _save_cache(self) -> None:
+        """Atomically rewrite the file cache"""
+        if not self.cache_path:
+            return
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_name(self.cache_path.name + '.tmp')
+            tmp_path.write_text(json.dumps({'templates': [template_to_dict(t) for t in self._by_key.values()]}))
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            if self.verbose:
+
+                logger.log(f'[TemplateRegistry] Could not write cache {self.cache_path}: {e}', 'INFO')
+_REGISTRY: Optional[TemplateRegistry] = None
+_REGISTRY_LOCK = threading.Lock()
+
+def get_template_registry() -> TemplateRegistry:
+    """
+    WHY: PromptManager is constructed per call site; the index must outlive it.
+    RESPONSIBILITY: Return the process-wide registry.
+    PATTERNS: Lazy singleton.
+    """
+    global _REGISTRY
+    with _REGISTRY_LOCK:
+        if _REGISTRY is None:
+            _REGISTRY = TemplateRegistry()
+        return _REGISTRY
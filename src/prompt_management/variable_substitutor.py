@@ -1,7 +1,78 @@
 from artemis_logger import get_logger
 logger = get_logger('variable_substitutor')
-'\nWHY: Handle variable substitution in prompt templates.\nRESPONSIBILITY: Replace template placeholders with actual values.\nPATTERNS: Strategy pattern for substitution methods, guard clauses.\n\nThis module provides robust variable substitution with validation\nand error handling for missing or invalid variables.\n'
-from typing import Dict, List, Any, Optional
+'\nWHY: Handle variable substitution in prompt templates.\nRESPONSIBILITY: Replace template placeholders with actual values.\nPATTERNS: Strategy pattern for substitution methods, guard clauses.\n\nThis module provides robust variable substitution with validation\nand error handling for missing or invalid variables.\n\nTemplates are compiled once into a substitution plan (literal segments and\nplaceholder names) and cached by template text, so rendering is a single\njoin instead of one scan-and-replace pass per variable.\n'
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
+PLACEHOLDER_PATTERN = re.compile('\\{([^{}]+)\\}')
+COMPILED_CACHE_SIZE = 1024
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """
+    WHY: Avoid re-parsing a template on every render.
+    RESPONSIBILITY: Hold the substitution plan for one template string.
+    PATTERNS: Value object, precompiled plan.
+
+    segments has one more entry than names: the rendered text is
+    segments[0] + value(names[0]) + segments[1] + ...
+    """
+    source: str
+    segments: Tuple[str, ...]
+    names: Tuple[str, ...]
+
+    @property
+    def placeholders(self) -> List[str]:
+        """Unique placeholder names in order of first appearance"""
+        return list(dict.fromkeys(self.names))
+
+    def render(self, variables: Dict[str, Any]) -> str:
+        """
+        WHY: Substitute variables in one pass over the plan.
+        RESPONSIBILITY: Join literals and values; unknown placeholders stay as-is.
+        PATTERNS: Guard clause for templates without placeholders.
+
+        Args:
+            variables: Dictionary of variable values
+
+        Returns:
+            Rendered text
+        """
+        if not self.names:
+            return self.source
+        parts = [self.segments[0]]
+        for name, segment in zip(self.names, self.segments[1:]):
+            parts.append(str(variables[name]) if name in variables else '{' + name + '}')
+            parts.append(segment)
+        return ''.join(parts)
+
+    def missing(self, variables: Dict[str, Any]) -> List[str]:
+        """Placeholder names without a value in variables"""
+        return [name for name in self.placeholders if name not in variables]
+
+@lru_cache(maxsize=COMPILED_CACHE_SIZE)
+def compile_template(template: str) -> CompiledTemplate:
+    """
+    WHY: Parse each distinct template once per process.
+    RESPONSIBILITY: Split template text into literal segments and placeholders.
+    PATTERNS: Memoization keyed by template text.
+
+    Args:
+        template: Template string with {placeholders}
+
+    Returns:
+        CompiledTemplate (shared, immutable)
+    """
+    segments = []
+    names = []
+    position = 0
+    for match in PLACEHOLDER_PATTERN.finditer(template):
+        segments.append(template[position:match.start()])
+        names.append(match.group(1))
+        position = match.end()
+    segments.append(template[position:])
+    return CompiledTemplate(source=template, segments=tuple(segments), names=tuple(names))
 
 class VariableSubstitutor:
     """
@@ -41,23 +112,18 @@ class VariableSubstitutor:
         """
         if not template:
             return ''
-        result = template
+        compiled = compile_template(template)
         if not variables:
-            if self.strict and self._has_placeholders(template):
+            if self.strict and compiled.names:
                 raise ValueError('Template has placeholders but no variables provided')
-            return result
-        for key, value in variables.items():
-            placeholder = '{' + key + '}'
-            result = result.replace(placeholder, str(value))
-        if self.strict:
-            remaining = self._find_placeholders(result)
-            if remaining:
-                raise ValueError(f'Missing variables for placeholders: {remaining}')
-        if self.verbose and self._has_placeholders(result):
-            remaining = self._find_placeholders(result)
+            return template
+        remaining = compiled.missing(variables)
+        if self.strict and remaining:
+            raise ValueError(f'Missing variables for placeholders: {remaining}')
+        if self.verbose and remaining:
             
             logger.log(f'[VariableSubstitutor] Warning: Unsubstituted placeholders: {remaining}', 'INFO')
-        return result
+        return compiled.render(variables)
 
     def substitute_multiple(self, templates: Dict[str, str], variables: Dict[str, Any]) -> Dict[str, str]:
         """
@@ -93,7 +159,7 @@ class VariableSubstitutor:
         """
         if not template:
             return []
-        return self._find_placeholders(template)
+        return compile_template(template).placeholders
 
     def validate_variables(self, template: str, variables: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -116,46 +182,3 @@ class VariableSubstitutor:
         missing = required - provided
         extra = provided - required
         return {'valid': len(missing) == 0, 'missing': list(missing), 'extra': list(extra)}
-
-    def _has_placeholders(self, text: str) -> bool:
-        """
-        WHY: Check if text contains any placeholders.
-        RESPONSIBILITY: Quick placeholder detection.
-        PATTERNS: Simple boolean check.
-
-        Args:
-            text: Text to check
-
-        Returns:
-            True if placeholders found
-        """
-        return '{' in text and '}' in text
-
-    def _find_placeholders(self, text: str) -> List[str]:
-        """
-        WHY: Find all placeholder names in text.
-        RESPONSIBILITY: Parse and extract placeholder names.
-        PATTERNS: Guard clause for no placeholders.
-
-        Args:
-            text: Text to parse
-
-        Returns:
-            List of placeholder names
-        """
-        if not self._has_placeholders(text):
-            return []
-        placeholders = []
-        i = 0
-        while i < len(text):
-            start = text.find('{', i)
-            if start == -1:
-                break
-            end = text.find('}', start)
-            if end == -1:
-                break
-            name = text[start + 1:end]
-            if name:
-                placeholders.append(name)
-            i = end + 1
-        return placeholders
\ No newline at end of file
@@ -16,12 +16,14 @@ PATTERNS:
 from rag.models import (
     Artifact,
     SearchResult,
+    BatchIngestionResult,
     ARTIFACT_TYPES,
     create_artifact,
     create_search_result
 )
 from rag.document_processor import (
     generate_artifact_id,
+    generate_batch_artifact_id,
     serialize_metadata_for_chromadb,
     deserialize_metadata,
     prepare_artifact_metadata
@@ -56,6 +58,7 @@ __all__ = [
     # Models
     'Artifact',
     'SearchResult',
+    'BatchIngestionResult',
     'ARTIFACT_TYPES',
 
     # Factory functions
@@ -65,6 +68,7 @@ __all__ = [
 
     # Utilities
     'generate_artifact_id',
+    'generate_batch_artifact_id',
     'serialize_metadata_for_chromadb',
     'deserialize_metadata',
     'prepare_artifact_metadata',
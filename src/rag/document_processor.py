@@ -37,6 +37,29 @@ def generate_artifact_id(artifact_type: str, card_id: str) -> str:
     return f"{artifact_type}-{card_id}-{unique}"
 
 
+def generate_batch_artifact_id(artifact_type: str, card_id: str, index: int, content: str) -> str:
+    """
+    Generate unique artifact ID for one item of a batch.
+
+    generate_artifact_id() only varies per second, so every artifact of a batch
+    for the same card would collide. The batch position and content digest
+    keep IDs distinct.
+
+    Args:
+        artifact_type: Type of artifact
+        card_id: Card identifier
+        index: Position of the artifact within its batch
+        content: Artifact content
+
+    Returns:
+        Unique artifact ID in format: {type}-{card_id}-{hash}
+    """
+    timestamp = datetime.utcnow().strftime('%Y%m%d%H%M%S%f')
+    content_digest = hashlib.md5(content.encode('utf-8', errors='ignore')).hexdigest()
+    unique = hashlib.md5(f"{artifact_type}{card_id}{timestamp}{index}{content_digest}".encode()).hexdigest()[:12]
+    return f"{artifact_type}-{card_id}-{unique}"
+
+
 def serialize_metadata_for_chromadb(metadata: Dict[str, Any]) -> Dict[str, Any]:
     """
     Convert metadata to ChromaDB-compatible format.
@@ -58,6 +58,32 @@ class SearchResult:
         return asdict(self)
 
 
+@dataclass
+class BatchIngestionResult:
+    """
+    Outcome of a batched artifact ingestion.
+
+    artifact_ids is aligned with the input order; entries that could not be
+    stored are None.
+    """
+    artifact_ids: List[Optional[str]]
+    stored: int
+    failed: int
+    write_calls: int
+    elapsed_seconds: float
+
+    @property
+    def artifacts_per_second(self) -> float:
+        """Ingestion throughput (stored artifacts per wall-clock second)."""
+        if self.elapsed_seconds <= 0:
+            return float(self.stored)
+        return self.stored / self.elapsed_seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert result to dictionary (including throughput)."""
+        return {**asdict(self), 'artifacts_per_second': self.artifacts_per_second}
+
+
 # Artifact type constants
 ARTIFACT_TYPES: List[str] = [
     "research_report",
@@ -3,10 +3,12 @@ logger = get_logger('rag_engine')
 '\nWHY: Orchestrate all RAG operations through a unified high-level interface.\n     Provides the main entry point for storing and retrieving artifacts.\n\nRESPONSIBILITY:\n- Coordinate vector store, retriever, and pattern analyzer\n- Provide high-level API for artifact storage and retrieval\n- Manage logging and debugging across components\n- Generate statistics and health metrics\n\nPATTERNS:\n- Facade Pattern: Simplify complex subsystem interactions\n- Dependency Injection: Inject dependencies for testability\n- Template Method Pattern: Define RAG operation flow\n'
 from pathlib import Path
 from typing import Dict, List, Optional, Any
+import threading
+import time
 from datetime import datetime
-from rag.models import ARTIFACT_TYPES, create_artifact
-from rag.document_processor import generate_artifact_id, prepare_artifact_metadata
-from rag.vector_store import VectorStore
+from rag.models import ARTIFACT_TYPES, BatchIngestionResult, create_artifact
+from rag.document_processor import generate_artifact_id, generate_batch_artifact_id, prepare_artifact_metadata
+from rag.vector_store import VectorStore, DEFAULT_BATCH_CHUNK_SIZE
 from rag.retriever import Retriever
 from rag.pattern_analyzer import PatternAnalyzer
 
@@ -34,6 +36,8 @@ class RAGEngine:
         self.vector_store = VectorStore(self.db_path, self.log)
         self.retriever = Retriever(self.vector_store, self.log)
         self.pattern_analyzer = PatternAnalyzer(self.retriever.query_similar, self.log)
+        self._card_generations: Dict[str, int] = {}
+        self._card_generations_lock = threading.Lock()
         self.log('RAG Engine initialized')
         self.log(f'Database path: {self.db_path}')
 
@@ -66,8 +70,75 @@ class RAGEngine:
         artifact = create_artifact(artifact_type=artifact_type, card_id=card_id, task_title=task_title, content=content, artifact_id=artifact_id, metadata=metadata)
         chromadb_metadata = prepare_artifact_metadata(card_id=card_id, task_title=task_title, timestamp=artifact.timestamp, additional_metadata=metadata)
         success = self.vector_store.add_artifact(artifact, chromadb_metadata)
+        if success:
+            self._bump_card_generations([card_id])
         return artifact_id if success else None
 
+    def store_artifacts_batch(self, items: List[Dict[str, Any]], chunk_size: int=DEFAULT_BATCH_CHUNK_SIZE) -> BatchIngestionResult:
+        """
+        Store many artifacts in chunked writes grouped by collection.
+
+        WHY: Storing a research run one artifact at a time costs an embedding
+             call and a persistence round-trip per artifact.
+
+        Args:
+            items: Dicts with store_artifact() keyword arguments
+                   (artifact_type, card_id, task_title, content, metadata)
+            chunk_size: Maximum artifacts per write call
+
+        Returns:
+            BatchIngestionResult with IDs aligned to items (None if not stored)
+        """
+        started = time.perf_counter()
+        artifacts = []
+        metadatas = []
+        positions = []
+        for position, item in enumerate(items):
+            artifact_type = item.get('artifact_type')
+            if artifact_type not in ARTIFACT_TYPES:
+                self.log(f'⚠️  Unknown artifact type: {artifact_type}')
+                continue
+            card_id = item['card_id']
+            content = item['content']
+            metadata = item.get('metadata')
+            artifact_id = generate_batch_artifact_id(artifact_type, card_id, position, content)
+            artifact = create_artifact(artifact_type=artifact_type, card_id=card_id, task_title=item['task_title'], content=content, artifact_id=artifact_id, metadata=metadata)
+            artifacts.append(artifact)
+            metadatas.append(prepare_artifact_metadata(card_id=card_id, task_title=artifact.task_title, timestamp=artifact.timestamp, additional_metadata=metadata))
+            positions.append(position)
+        stored_flags, write_calls = self.vector_store.add_artifacts_batch(artifacts, metadatas, chunk_size=chunk_size)
+        artifact_ids: List[Optional[str]] = [None] * len(items)
+        for position, artifact, stored in zip(positions, artifacts, stored_flags):
+            if stored:
+                artifact_ids[position] = artifact.artifact_id
+        self._bump_card_generations([artifact.card_id for artifact, stored in zip(artifacts, stored_flags) if stored])
+        stored_count = sum(stored_flags)
+        result = BatchIngestionResult(artifact_ids=artifact_ids, stored=stored_count, failed=len(items) - stored_count, write_calls=write_calls, elapsed_seconds=time.perf_counter() - started)
+        self.log(f'Batch ingested {result.stored}/{len(items)} artifacts in {result.write_calls} writes ({result.elapsed_seconds:.2f}s, {result.artifacts_per_second:.1f} artifacts/s)')
+        return result
+
+    def card_generation(self, card_id: str) -> int:
+        """
+        Number of artifacts stored for a card by this engine.
+
+        WHY: Lets per-card caches of query results detect new artifacts
+             without re-querying.
+
+        Args:
+            card_id: Card ID
+
+        Returns:
+            Generation counter (0 if nothing stored yet)
+        """
+        with self._card_generations_lock:
+            return self._card_generations.get(card_id, 0)
+
+    def _bump_card_generations(self, card_ids: List[str]) -> None:
+        """Advance the generation of each card that received an artifact."""
+        with self._card_generations_lock:
+            for card_id in card_ids:
+                self._card_generations[card_id] = self._card_generations.get(card_id, 0) + 1
+
     def query_similar(self, query_text: str, artifact_types: Optional[List[str]]=None, top_k: int=5, filters: Optional[Dict[str, Any]]=None) -> List[Dict[str, Any]]:
         """
         Query for similar artifacts using semantic search.
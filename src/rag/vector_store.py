@@ -2,7 +2,7 @@ from artemis_logger import get_logger
 logger = get_logger('vector_store')
 '\nWHY: Abstract vector storage operations behind a clean interface.\n     Supports both ChromaDB (production) and mock storage (testing/fallback).\n\nRESPONSIBILITY:\n- Manage ChromaDB client lifecycle\n- Initialize and maintain collections per artifact type\n- Provide add/query operations on vector store\n- Handle fallback to mock storage when ChromaDB unavailable\n\nPATTERNS:\n- Repository Pattern: Abstract storage behind interface\n- Strategy Pattern: ChromaDB vs Mock storage strategies\n- Null Object Pattern: Mock storage for graceful degradation\n'
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Tuple
 from dataclasses import asdict
 try:
     import chromadb
@@ -11,6 +11,7 @@ try:
 except ImportError:
     CHROMADB_AVAILABLE = False
 from rag.models import Artifact, ARTIFACT_TYPES
+DEFAULT_BATCH_CHUNK_SIZE = 256
 
 class VectorStore:
     """
@@ -83,6 +84,69 @@ class VectorStore:
         self.log_fn(f'✅ Stored (mock) {artifact.artifact_type}: {artifact.artifact_id}')
         return True
 
+    def add_artifacts_batch(self, artifacts: List[Artifact], chromadb_metadatas: List[Dict[str, Any]], chunk_size: int=DEFAULT_BATCH_CHUNK_SIZE) -> Tuple[List[bool], int]:
+        """
+        Add many artifacts with a few chunked writes per collection.
+
+        WHY: add_artifact() costs one embedding call and one persistence
+             round-trip per artifact. Grouping by collection and upserting in
+             chunks lets ChromaDB embed each chunk in one call.
+
+        Args:
+            artifacts: Artifacts to store
+            chromadb_metadatas: Prepared metadata, aligned with artifacts
+            chunk_size: Maximum artifacts per write call
+
+        Returns:
+            Tuple of (per-artifact success flags aligned with input, write calls made)
+        """
+        stored = [False] * len(artifacts)
+        groups: Dict[str, List[int]] = {}
+        for position, artifact in enumerate(artifacts):
+            if artifact.artifact_type not in ARTIFACT_TYPES:
+                self.log_fn(f'⚠️  Unknown artifact type: {artifact.artifact_type}')
+                continue
+            groups.setdefault(artifact.artifact_type, []).append(position)
+        chunk_size = self._effective_chunk_size(chunk_size)
+        write_calls = 0
+        for artifact_type, positions in groups.items():
+            for start in range(0, len(positions), chunk_size):
+                chunk = positions[start:start + chunk_size]
+                write_calls += 1
+                if self._write_chunk(artifact_type, [artifacts[i] for i in chunk], [chromadb_metadatas[i] for i in chunk]):
+                    for i in chunk:
+                        stored[i] = True
+        return (stored, write_calls)
+
+    def _effective_chunk_size(self, chunk_size: int) -> int:
+        """Clamp chunk size to the ChromaDB client's maximum batch size."""
+        chunk_size = max(1, chunk_size)
+        if not (self.chromadb_available and self.client and hasattr(self.client, 'get_max_batch_size')):
+            return chunk_size
+        try:
+            return min(chunk_size, self.client.get_max_batch_size())
+        except Exception:
+            return chunk_size
+
+    def _write_chunk(self, artifact_type: str, artifacts: List[Artifact], metadatas: List[Dict[str, Any]]) -> bool:
+        """
+        Write one chunk of same-type artifacts.
+
+        Upsert keeps a retried chunk idempotent; a failing chunk is reported
+        without aborting the rest of the batch.
+        """
+        if self.chromadb_available and self.client:
+            try:
+                self.collections[artifact_type].upsert(ids=[a.artifact_id for a in artifacts], documents=[a.content for a in artifacts], metadatas=metadatas)
+            except Exception as e:
+                self.log_fn(f'⚠️  Failed to store {len(artifacts)} {artifact_type} artifacts: {e}')
+                return False
+            self.log_fn(f'✅ Stored {len(artifacts)} {artifact_type} artifacts')
+            return True
+        self.mock_storage.setdefault(artifact_type, []).extend((asdict(a) for a in artifacts))
+        self.log_fn(f'✅ Stored (mock) {len(artifacts)} {artifact_type} artifacts')
+        return True
+
     def query_collection(self, artifact_type: str, query_text: str, top_k: int=5, where: Optional[Dict[str, Any]]=None) -> Optional[Dict[str, Any]]:
         """
         Query a specific collection.
@@ -3,7 +3,8 @@ logger = get_logger('rag_agent')
 '\nWHY: Maintain backward compatibility with existing code using rag_agent.py.\n     Delegates to modular rag package while preserving original interface.\n\nRESPONSIBILITY:\n- Provide drop-in replacement for original RAGAgent class\n- Delegate all operations to rag.RAGEngine\n- Support DebugMixin integration for existing code\n\nPATTERNS:\n- Adapter Pattern: Adapt new RAGEngine to old RAGAgent interface\n- Proxy Pattern: Proxy calls to underlying engine\n- Facade Pattern: Simplify access to refactored package\n'
 from typing import Dict, List, Optional, Any
 from debug_mixin import DebugMixin
-from rag import RAGEngine, ARTIFACT_TYPES, create_rag_agent
+from rag import RAGEngine, ARTIFACT_TYPES, BatchIngestionResult, create_rag_agent
+from rag.vector_store import DEFAULT_BATCH_CHUNK_SIZE
 
 class RAGAgent(DebugMixin):
     """
@@ -51,6 +52,32 @@ class RAGAgent(DebugMixin):
         self.debug_trace('store_artifact', artifact_type=artifact_type, card_id=card_id)
         return self.engine.store_artifact(artifact_type=artifact_type, card_id=card_id, task_title=task_title, content=content, metadata=metadata)
 
+    def store_artifacts_batch(self, items: List[Dict[str, Any]], chunk_size: int=DEFAULT_BATCH_CHUNK_SIZE) -> BatchIngestionResult:
+        """
+        Store many artifacts in chunked writes grouped by collection.
+
+        Args:
+            items: Dicts with store_artifact() keyword arguments
+            chunk_size: Maximum artifacts per write call
+
+        Returns:
+            BatchIngestionResult with IDs aligned to items and throughput
+        """
+        self.debug_trace('store_artifacts_batch', count=len(items))
+        return self.engine.store_artifacts_batch(items, chunk_size=chunk_size)
+
+    def card_generation(self, card_id: str) -> int:
+        """
+        Number of artifacts stored for a card (changes when new ones arrive).
+
+        Args:
+            card_id: Card ID
+
+        Returns:
+            Generation counter
+        """
+        return self.engine.card_generation(card_id)
+
     def query_similar(self, query_text: str, artifact_types: Optional[List[str]]=None, top_k: int=5, filters: Optional[Dict]=None) -> List[Dict]:
         """
         Query for similar artifacts using semantic search.
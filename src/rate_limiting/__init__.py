@@ -9,11 +9,13 @@ Rate limiting package prevents hitting LLM API rate limits.
 
 from rate_limiting.exceptions import RateLimitExceeded
 from rate_limiting.limiter import RedisRateLimiter
+from rate_limiting.models import RateLimitReservation
 from rate_limiting.providers import OpenAIRateLimiter, AnthropicRateLimiter
 
 __all__ = [
     'RateLimitExceeded',
     'RedisRateLimiter',
+    'RateLimitReservation',
     'OpenAIRateLimiter',
     'AnthropicRateLimiter',
 ]
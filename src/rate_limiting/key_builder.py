@@ -45,3 +45,16 @@ class RateLimitKeyBuilder:
             "artemis:ratelimit:openai:gpt-4o:user123"
         """
         return f"{self.key_prefix}:{resource}:{identifier}"
+
+    def build_token_key(self, resource: str, identifier: str) -> str:
+        """
+        Build Redis key for the token usage hash paired with a request key.
+
+        WHY: Token budgets are tracked next to the request window so one
+             script can check and update both atomically.
+
+        Example:
+            >>> builder.build_token_key("openai:gpt-4o", "user123")
+            "artemis:ratelimit:openai:gpt-4o:user123:tokens"
+        """
+        return f"{self.build_key(resource, identifier)}:tokens"
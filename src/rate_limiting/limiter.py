@@ -1,11 +1,16 @@
 from artemis_logger import get_logger
 logger = get_logger('limiter')
-'\nWHY: Implement sliding window rate limiting with Redis\nRESPONSIBILITY: Core rate limit checking and tracking\nPATTERNS: Strategy (sliding window algorithm), Composition (Redis client)\n\nSliding window provides accurate, distributed rate limiting.\n'
+'\nWHY: Implement sliding window rate limiting with Redis\nRESPONSIBILITY: Core rate limit checking and tracking\nPATTERNS: Strategy (sliding window algorithm), Composition (Redis client)\n\nSliding window provides accurate, distributed rate limiting.\nRequest and token budgets are enforced together by one server-side Lua\nscript (rate_limiting/scripts.py), so concurrent workers cannot overshoot.\n'
+import random
 import time
-from typing import Optional
+import uuid
+from typing import Dict, List, Optional
 from redis_client import RedisClient, get_redis_client
 from rate_limiting.exceptions import RateLimitExceeded
 from rate_limiting.key_builder import RateLimitKeyBuilder
+from rate_limiting.models import RateLimitReservation
+from rate_limiting.scripts import ACQUIRE_SCRIPT, SETTLE_SCRIPT
+MAX_RETRY_JITTER_SECONDS = 0.05
 
 class RedisRateLimiter:
     """
@@ -19,7 +24,10 @@ class RedisRateLimiter:
     - Sliding window rate limiting
     - Per-user/per-resource limits
     - Distributed rate limiting across multiple instances
+    - Atomic request + token budgets (one Lua script per check)
+    - Reserve-then-settle token accounting and blocking acquire()
     """
+    _SCRIPTS: Dict[str, str] = {'acquire': ACQUIRE_SCRIPT, 'settle': SETTLE_SCRIPT}
 
     def __init__(self, redis_client: Optional[RedisClient]=None, key_prefix: str='artemis:ratelimit'):
         """
@@ -35,8 +43,9 @@ class RedisRateLimiter:
             self.redis = get_redis_client(raise_on_error=False)
         self.key_builder = RateLimitKeyBuilder(key_prefix)
         self.enabled = self.redis is not None
+        self._registered_scripts: Dict[str, object] = {}
         if not self.enabled:
-            
+
             logger.log('⚠️  Redis not available - Rate limiting disabled', 'INFO')
 
     def check_rate_limit(self, resource: str, limit: int, window_seconds: int, identifier: str='default') -> bool:
@@ -57,26 +66,95 @@ class RedisRateLimiter:
         Raises:
             RateLimitExceeded: If rate limit exceeded
         """
+        reservation = self.reserve(resource, limit, window_seconds, identifier=identifier)
+        if not reservation.allowed:
+            raise self._limit_exceeded(reservation, limit, window_seconds)
+        return True
+
+    def reserve(self, resource: str, limit: int, window_seconds: int, tokens: int=0, token_limit: Optional[int]=None, identifier: str='default') -> RateLimitReservation:
+        """
+        Atomically check and record one request and its estimated tokens.
+
+        WHY: Providers throttle on requests and tokens per minute; checking
+             both in one script means parallel workers cannot overshoot either.
+
+        Args:
+            resource: Resource name (e.g., "openai:gpt-4o")
+            limit: Max requests per window (<= 0 disables the request check)
+            window_seconds: Time window in seconds
+            tokens: Estimated tokens for this request (settle() corrects it later)
+            token_limit: Max tokens per window (None disables the token check)
+            identifier: User/client identifier
+
+        Returns:
+            RateLimitReservation; when not allowed, retry_after_seconds says
+            when enough budget frees up. Never raises (fails open on Redis errors).
+        """
+        tokens = max(0, int(tokens))
         if not self.enabled:
-            return True
+            return RateLimitReservation(allowed=True, resource=resource, identifier=identifier, tokens=tokens)
+        reservation_id = uuid.uuid4().hex
         try:
-            key = self.key_builder.build_key(resource, identifier)
-            current_time = time.time()
-            window_start = current_time - window_seconds
-            self.redis.client.zremrangebyscore(key, 0, window_start)
-            request_count = self.redis.client.zcard(key)
-            if request_count >= limit:
-                retry_after = self._calculate_retry_after(key, window_seconds, current_time)
-                raise RateLimitExceeded(f'Rate limit exceeded for {resource}', context={'resource': resource, 'limit': limit, 'window_seconds': window_seconds, 'current_count': request_count, 'retry_after_seconds': round(retry_after, 2)})
-            self.redis.client.zadd(key, {str(current_time): current_time})
-            self.redis.expire(key, window_seconds + 60)
-            return True
-        except RateLimitExceeded:
-            raise
+            allowed, retry_after_ms, request_count, token_count = self._run_script('acquire', resource, identifier, [window_seconds, limit, token_limit or 0, tokens, reservation_id, int(window_seconds) + 60])
         except Exception as e:
-            
+
             logger.log(f'⚠️  Rate limiter error: {e}', 'INFO')
-            return True
+            return RateLimitReservation(allowed=True, resource=resource, identifier=identifier, tokens=tokens)
+        allowed = bool(int(allowed))
+        return RateLimitReservation(allowed=allowed, resource=resource, identifier=identifier, reservation_id=reservation_id if allowed else None, tokens=tokens, retry_after_seconds=max(0.0, int(retry_after_ms) / 1000), request_count=int(request_count), token_count=int(token_count))
+
+    def settle(self, reservation: RateLimitReservation, actual_tokens: int) -> bool:
+        """
+        Replace a reservation's estimated tokens with the actual usage.
+
+        WHY: Estimates are made before the response exists; settling returns
+             unused budget (or charges the overrun) for the rest of the window.
+
+        Args:
+            reservation: Allowed reservation returned by reserve()/acquire()
+            actual_tokens: Tokens the call actually consumed
+
+        Returns:
+            True if the window was updated
+        """
+        if not self.enabled or not reservation.reservation_id:
+            return False
+        try:
+            self._run_script('settle', reservation.resource, reservation.identifier, [reservation.reservation_id, max(0, int(actual_tokens))])
+        except Exception as e:
+
+            logger.log(f'⚠️  Error settling rate limit reservation: {e}', 'INFO')
+            return False
+        reservation.tokens = max(0, int(actual_tokens))
+        return True
+
+    def acquire(self, resource: str, limit: int, window_seconds: int, tokens: int=0, token_limit: Optional[int]=None, identifier: str='default', timeout: Optional[float]=None) -> RateLimitReservation:
+        """
+        Block until the request (and its tokens) fit the budget.
+
+        WHY: Raising makes every caller write its own retry loop; sleeping for
+             the computed retry-after lets parallel workers queue up politely
+             instead of hammering the provider into 429s.
+
+        Args:
+            resource, limit, window_seconds, tokens, token_limit, identifier: As reserve()
+            timeout: Max seconds to wait (None waits as long as needed)
+
+        Returns:
+            Allowed RateLimitReservation (settle() it with the actual usage)
+
+        Raises:
+            RateLimitExceeded: If the budget cannot free up within timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            reservation = self.reserve(resource, limit, window_seconds, tokens, token_limit, identifier)
+            if reservation.allowed:
+                return reservation
+            wait = reservation.retry_after_seconds + random.uniform(0, MAX_RETRY_JITTER_SECONDS)
+            if deadline is not None and time.monotonic() + wait > deadline:
+                raise self._limit_exceeded(reservation, limit, window_seconds, token_limit)
+            time.sleep(wait)
 
     def get_remaining_requests(self, resource: str, limit: int, window_seconds: int, identifier: str='default') -> int:
         """
@@ -97,13 +175,11 @@ class RedisRateLimiter:
             return limit
         try:
             key = self.key_builder.build_key(resource, identifier)
-            current_time = time.time()
-            window_start = current_time - window_seconds
-            self.redis.client.zremrangebyscore(key, 0, window_start)
-            request_count = self.redis.client.zcard(key)
+            window_start = time.time() - window_seconds
+            request_count = self.redis.client.zcount(key, window_start, '+inf')
             return max(0, limit - request_count)
         except Exception as e:
-            
+
             logger.log(f'⚠️  Error getting remaining requests: {e}', 'INFO')
             return limit
 
@@ -123,29 +199,27 @@ class RedisRateLimiter:
         if not self.enabled:
             return False
         try:
-            key = self.key_builder.build_key(resource, identifier)
-            self.redis.delete(key)
+            self.redis.delete(self.key_builder.build_key(resource, identifier), self.key_builder.build_token_key(resource, identifier))
             return True
         except Exception as e:
-            
+
             logger.log(f'⚠️  Error resetting rate limit: {e}', 'INFO')
             return False
 
-    def _calculate_retry_after(self, key: str, window_seconds: int, current_time: float) -> float:
+    def _run_script(self, name: str, resource: str, identifier: str, args: List) -> List:
         """
-        Calculate retry-after time based on oldest request.
-
-        WHY: Tells client exactly when they can retry.
+        Run a registered Lua script against the request and token keys.
 
-        Args:
-            key: Redis key
-            window_seconds: Window size in seconds
-            current_time: Current timestamp
-
-        Returns:
-            Seconds until retry allowed
+        WHY: redis-py's Script object uses EVALSHA and reloads the script
+             transparently if the server's script cache was flushed.
         """
-        oldest = self.redis.client.zrange(key, 0, 0, withscores=True)
-        if not oldest:
-            return window_seconds
-        return window_seconds - (current_time - oldest[0][1])
\ No newline at end of file
+        script = self._registered_scripts.get(name)
+        if script is None:
+            script = self.redis.client.register_script(self._SCRIPTS[name])
+            self._registered_scripts[name] = script
+        keys = [self.key_builder.build_key(resource, identifier), self.key_builder.build_token_key(resource, identifier)]
+        return script(keys=keys, args=args)
+
+    def _limit_exceeded(self, reservation: RateLimitReservation, limit: int, window_seconds: int, token_limit: Optional[int]=None) -> RateLimitExceeded:
+        """Build the exception for a denied reservation"""
+        return RateLimitExceeded(f'Rate limit exceeded for {reservation.resource}', context={'resource': reservation.resource, 'limit': limit, 'token_limit': token_limit, 'window_seconds': window_seconds, 'current_count': reservation.request_count, 'current_tokens': reservation.token_count, 'retry_after_seconds': round(reservation.retry_after_seconds, 2)})
@@ -1,13 +1,32 @@
 #!/usr/bin/env python3
 """
 WHY: Define rate limit configurations for LLM providers
-RESPONSIBILITY: Centralize provider-specific limits
-PATTERNS: Configuration object, Dispatch table
+RESPONSIBILITY: Centralize provider-specific limits and reservation results
+PATTERNS: Configuration object, Dispatch table, Value object
 
 Provider limits based on official API documentation (2025).
 """
 
-from typing import Dict
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+
+@dataclass
+class RateLimitReservation:
+    """
+    Outcome of an atomic request/token reservation.
+
+    WHY: Callers reserve an estimated token count before an LLM call and
+         settle the actual usage afterwards, so they need the reservation id.
+    """
+    allowed: bool
+    resource: str
+    identifier: str = "default"
+    reservation_id: Optional[str] = None
+    tokens: int = 0
+    retry_after_seconds: float = 0.0
+    request_count: int = 0
+    token_count: int = 0
 
 
 # Dispatch table: OpenAI model limits
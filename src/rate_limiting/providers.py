@@ -7,11 +7,26 @@ PATTERNS: Template Method (base class override), Strategy (provider limits)
 Provider limiters use official API limits (conservative defaults).
 """
 
-from typing import Optional
+from typing import Dict, Optional
 
 from redis_client import RedisClient
 from rate_limiting.limiter import RedisRateLimiter
-from rate_limiting.models import OPENAI_LIMITS, ANTHROPIC_LIMITS
+from rate_limiting.models import OPENAI_LIMITS, ANTHROPIC_LIMITS, RateLimitReservation
+
+
+def _lookup_limits(limits: Dict[str, Dict[str, int]], model: str) -> Dict[str, int]:
+    """
+    Find limits for a model, matching dated model ids by prefix.
+
+    WHY: Clients call with ids like "claude-sonnet-4-5-20250929" while the
+         limit tables are keyed by model family ("claude-sonnet-4-5").
+    """
+    if model in limits:
+        return limits[model]
+    families = [family for family in limits if family != "default" and model.startswith(family)]
+    if not families:
+        return limits["default"]
+    return limits[max(families, key=len)]
 
 
 class OpenAIRateLimiter(RedisRateLimiter):
@@ -60,7 +75,7 @@ class OpenAIRateLimiter(RedisRateLimiter):
             RateLimitExceeded: If rate limit exceeded
         """
         # Dispatch table lookup for limits (no if/elif)
-        limits = self.limits.get(model, self.limits["default"])
+        limits = _lookup_limits(self.limits, model)
 
         return self.check_rate_limit(
             resource=f"openai:{model}",
@@ -69,6 +84,43 @@ class OpenAIRateLimiter(RedisRateLimiter):
             identifier=identifier
         )
 
+    def acquire_openai(
+        self,
+        model: str = "gpt-4o",
+        estimated_tokens: int = 0,
+        identifier: str = "default",
+        timeout: Optional[float] = None
+    ) -> RateLimitReservation:
+        """
+        Wait until an OpenAI call fits both the request and token budgets.
+
+        WHY: Parallel developers sharing one API key queue here instead of
+             all firing at once and getting 429s from OpenAI.
+
+        Args:
+            model: OpenAI model name
+            estimated_tokens: Prompt tokens plus max output tokens (settle later)
+            identifier: User/client identifier
+            timeout: Max seconds to wait (None waits as long as needed)
+
+        Returns:
+            Reservation to settle() with the actual token usage
+
+        Raises:
+            RateLimitExceeded: If the budget cannot free up within timeout
+        """
+        limits = _lookup_limits(self.limits, model)
+
+        return self.acquire(
+            resource=f"openai:{model}",
+            limit=limits["requests_per_minute"],
+            window_seconds=60,
+            tokens=estimated_tokens,
+            token_limit=limits["tokens_per_minute"],
+            identifier=identifier,
+            timeout=timeout
+        )
+
 
 class AnthropicRateLimiter(RedisRateLimiter):
     """
@@ -115,7 +167,7 @@ class AnthropicRateLimiter(RedisRateLimiter):
             RateLimitExceeded: If rate limit exceeded
         """
         # Dispatch table lookup for limits (no if/elif)
-        limits = self.limits.get(model, self.limits["default"])
+        limits = _lookup_limits(self.limits, model)
 
         return self.check_rate_limit(
             resource=f"anthropic:{model}",
@@ -123,3 +175,40 @@ class AnthropicRateLimiter(RedisRateLimiter):
             window_seconds=60,
             identifier=identifier
         )
+
+    def acquire_anthropic(
+        self,
+        model: str = "claude-sonnet-4-5",
+        estimated_tokens: int = 0,
+        identifier: str = "default",
+        timeout: Optional[float] = None
+    ) -> RateLimitReservation:
+        """
+        Wait until an Anthropic call fits both the request and token budgets.
+
+        WHY: Parallel developers sharing one API key queue here instead of
+             all firing at once and getting 429s from Anthropic.
+
+        Args:
+            model: Anthropic model name
+            estimated_tokens: Prompt tokens plus max output tokens (settle later)
+            identifier: User/client identifier
+            timeout: Max seconds to wait (None waits as long as needed)
+
+        Returns:
+            Reservation to settle() with the actual token usage
+
+        Raises:
+            RateLimitExceeded: If the budget cannot free up within timeout
+        """
+        limits = _lookup_limits(self.limits, model)
+
+        return self.acquire(
+            resource=f"anthropic:{model}",
+            limit=limits["requests_per_minute"],
+            window_seconds=60,
+            tokens=estimated_tokens,
+            token_limit=limits["tokens_per_minute"],
+            identifier=identifier,
+            timeout=timeout
+        )
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+WHY: Server-side Lua scripts for atomic rate limiting
+RESPONSIBILITY: Check and record request and token usage in one Redis round-trip
+PATTERNS: Command (scripts executed atomically by Redis)
+
+Redis runs a script without interleaving other commands, so concurrent
+workers can no longer all read "under the limit" and then all add a request.
+
+Data layout per (resource, identifier):
+- KEYS[1] sorted set: reservation id -> timestamp (one member per request)
+- KEYS[2] hash: reservation id -> reserved tokens, plus "__total" (sum of tokens in window)
+
+Timestamps come from the Redis server clock (TIME), so workers on hosts with
+skewed clocks share one window. Requires Redis 5+ (script effects replication).
+"""
+
+# Trim expired reservations, then admit the request if both the request count
+# and the token total stay within their limits.
+#
+# ARGV: window_seconds, request_limit, token_limit, tokens, reservation_id, ttl_seconds
+#       (a limit <= 0 disables that check)
+# Returns: {allowed (1/0), retry_after_ms, request_count, token_count}
+ACQUIRE_SCRIPT = """
+local requests_key = KEYS[1]
+local tokens_key = KEYS[2]
+local window = tonumber(ARGV[1])
+local request_limit = tonumber(ARGV[2])
+local token_limit = tonumber(ARGV[3])
+local tokens = tonumber(ARGV[4])
+local reservation_id = ARGV[5]
+local ttl = tonumber(ARGV[6])
+
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local window_start = now - window
+
+local expired = redis.call('ZRANGEBYSCORE', requests_key, '-inf', window_start)
+if #expired > 0 then
+    local freed = 0
+    for _, member in ipairs(expired) do
+        freed = freed + (tonumber(redis.call('HGET', tokens_key, member)) or 0)
+        redis.call('HDEL', tokens_key, member)
+    end
+    redis.call('ZREMRANGEBYSCORE', requests_key, '-inf', window_start)
+    redis.call('HINCRBY', tokens_key, '__total', -freed)
+end
+
+local request_count = redis.call('ZCARD', requests_key)
+local token_count = tonumber(redis.call('HGET', tokens_key, '__total')) or 0
+
+if request_limit > 0 and request_count >= request_limit then
+    local oldest = redis.call('ZRANGE', requests_key, 0, 0, 'WITHSCORES')
+    local retry_after = window
+    if #oldest > 0 then
+        retry_after = tonumber(oldest[2]) + window - now
+    end
+    return {0, math.ceil(retry_after * 1000), request_count, token_count}
+end
+
+-- An empty window always admits one request, even one larger than the budget,
+-- so an oversized call is throttled rather than blocked forever.
+if token_limit > 0 and request_count > 0 and token_count + tokens > token_limit then
+    local needed = token_count + tokens - token_limit
+    local retry_after = window
+    local entries = redis.call('ZRANGE', requests_key, 0, -1, 'WITHSCORES')
+    for i = 1, #entries, 2 do
+        needed = needed - (tonumber(redis.call('HGET', tokens_key, entries[i])) or 0)
+        if needed <= 0 then
+            retry_after = tonumber(entries[i + 1]) + window - now
+            break
+        end
+    end
+    return {0, math.ceil(retry_after * 1000), request_count, token_count}
+end
+
+redis.call('ZADD', requests_key, now, reservation_id)
+redis.call('HSET', tokens_key, reservation_id, tokens)
+redis.call('HINCRBY', tokens_key, '__total', tokens)
+redis.call('EXPIRE', requests_key, ttl)
+redis.call('EXPIRE', tokens_key, ttl)
+return {1, 0, request_count + 1, token_count + tokens}
+"""
+
+# Replace a reservation's estimated tokens with the actual usage.
+#
+# ARGV: reservation_id, actual_tokens
+# Returns: token delta applied (0 if the reservation already left the window)
+SETTLE_SCRIPT = """
+local tokens_key = KEYS[2]
+local reservation_id = ARGV[1]
+local actual = tonumber(ARGV[2])
+
+local reserved = redis.call('HGET', tokens_key, reservation_id)
+if not reserved then
+    return 0
+end
+
+local delta = actual - tonumber(reserved)
+redis.call('HSET', tokens_key, reservation_id, actual)
+redis.call('HINCRBY', tokens_key, '__total', delta)
+return delta
+"""
@@ -10,7 +10,8 @@ PATTERNS:
 - Guard Clauses: Early validation and returns
 """
 
-from typing import Dict, List, Optional, Any
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Any, Set
 import logging
 
 from reasoning_strategies import (
@@ -208,7 +209,12 @@ class ReasoningExecutor:
         """
         Execute Self-Consistency with multiple samples.
 
-        WHY: Multiple sampling for answer consistency verification.
+        WHY: Multiple sampling for answer consistency verification. Samples
+             are independent, so they run concurrently (up to sc_max_parallel)
+             instead of costing sc_num_samples x the latency of one call.
+             With sc_adaptive_stopping, only as many samples are in flight as
+             could still decide the vote, and sampling stops once one answer
+             holds an unassailable majority.
 
         Args:
             messages: Messages to send
@@ -219,36 +225,66 @@ class ReasoningExecutor:
             max_tokens: Max tokens override
 
         Returns:
-            Result dictionary with samples and consistent answer
+            Result dictionary with samples, consistent answer, confidence
+            breakdown and how many samples adaptive stopping saved
 
-        Pattern: Multiple sampling with consistency aggregation
+        Pattern: Bounded parallel sampling with consistency aggregation
         """
+        num_samples = config.sc_num_samples
+        max_parallel = max(1, min(config.sc_max_parallel, num_samples))
+        request = {
+            "messages": messages,
+            "model": model,
+            "temperature": temperature or config.temperature,
+            "max_tokens": max_tokens or config.max_tokens
+        }
+
         samples = []
         total_tokens = 0
         last_response = None
-
-        # Generate multiple samples
-        for i in range(config.sc_num_samples):
-            response = self.llm_client.complete(
-                messages=messages,
-                model=model,
-                temperature=temperature or config.temperature,
-                max_tokens=max_tokens or config.max_tokens
-            )
-
-            samples.append(response.content)
-            total_tokens += response.usage['total_tokens']
-            last_response = response
-
-            # Parse each sample
-            strategy.parse_response(response.content)
+        launched = 0
+        stopped_early = False
+        pending: Set[Future] = set()
+
+        pool = ThreadPoolExecutor(max_workers=max_parallel, thread_name_prefix="self-consistency")
+        try:
+            while True:
+                budget = self._sample_launch_budget(
+                    strategy, config, launched, len(samples), len(pending), max_parallel
+                )
+                for _ in range(budget):
+                    pending.add(pool.submit(self.llm_client.complete, **request))
+                launched += budget
+
+                # Guard clause: nothing left to wait for
+                if not pending:
+                    break
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    response = future.result()
+                    samples.append(response.content)
+                    total_tokens += response.usage['total_tokens']
+                    last_response = response
+
+                    # Parse each sample
+                    strategy.parse_response(response.content)
+
+                # Guard clause: adaptive stop once the winner is settled
+                if config.sc_adaptive_stopping and strategy.votes_needed_to_decide(num_samples, len(samples)) == 0:
+                    stopped_early = len(samples) < num_samples
+                    break
+        finally:
+            # Drop queued samples; in-flight calls finish in the background
+            pool.shutdown(wait=False, cancel_futures=True)
 
         # Get consistent answer
         consistent_answer = strategy.get_consistent_answer()
+        samples_saved = num_samples - len(samples)
 
         self.logger.info(
-            f"Applied Self-Consistency reasoning with {config.sc_num_samples} samples "
-            f"(total tokens: {total_tokens})"
+            f"Applied Self-Consistency reasoning with {len(samples)}/{num_samples} samples "
+            f"({max_parallel} parallel, {samples_saved} saved, total tokens: {total_tokens})"
         )
 
         return {
@@ -257,9 +293,43 @@ class ReasoningExecutor:
             "reasoning_strategy": "self_consistency",
             "samples": samples,
             "consistent_answer": consistent_answer,
-            "total_tokens": total_tokens
+            "confidence_breakdown": strategy.get_confidence_breakdown(),
+            "total_tokens": total_tokens,
+            "samples_requested": num_samples,
+            "samples_completed": len(samples),
+            "samples_saved": samples_saved,
+            "samples_abandoned": len(pending),
+            "stopped_early": stopped_early
         }
 
+    def _sample_launch_budget(
+        self,
+        strategy: SelfConsistencyStrategy,
+        config: ReasoningConfig,
+        launched: int,
+        completed: int,
+        in_flight: int,
+        max_parallel: int
+    ) -> int:
+        """
+        Decide how many more self-consistency samples to launch now.
+
+        WHY: Without adaptive stopping every sample is wanted, so keep the
+             pool full. With it, launching more samples than the leader still
+             needs to win would spend calls that may turn out unnecessary.
+
+        Returns:
+            Number of samples to submit (0 = just wait for in-flight ones)
+        """
+        capacity = min(config.sc_num_samples - launched, max_parallel - in_flight)
+
+        # Guard clause: fixed sample count - fill every free slot
+        if not config.sc_adaptive_stopping:
+            return max(0, capacity)
+
+        needed = strategy.votes_needed_to_decide(config.sc_num_samples, completed)
+        return max(0, min(capacity, needed - in_flight))
+
     def _build_executor_map(self) -> Dict[ReasoningType, callable]:
         """
         Build dispatch table for executor functions.
@@ -37,6 +37,9 @@ class ReasoningConfig:
         tot_max_depth: Maximum depth for Tree of Thoughts
         lot_axioms: Axioms for Logic of Thoughts
         sc_num_samples: Number of samples for Self-Consistency
+        sc_max_parallel: Max Self-Consistency samples in flight at once
+        sc_adaptive_stopping: Stop sampling once one answer has an
+            unassailable majority (saves the remaining calls)
         temperature: LLM temperature parameter
         max_tokens: Maximum tokens for LLM response
     """
@@ -55,6 +58,8 @@ class ReasoningConfig:
 
     # Self-Consistency specific
     sc_num_samples: int = 5
+    sc_max_parallel: int = 5
+    sc_adaptive_stopping: bool = False
 
     # General
     temperature: float = 0.7
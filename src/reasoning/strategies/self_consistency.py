@@ -267,6 +267,37 @@ class SelfConsistencyStrategy(ReasoningStrategyBase):
 
         return non_empty_lines[-1]
 
+    def votes_needed_to_decide(self, target_samples: int, completed_samples: int) -> int:
+        """
+        Count further votes the current leader needs for an unassailable majority.
+
+        WHY: Lets the executor stop sampling as soon as the remaining samples
+             could no longer change the winner, and launch only as many
+             samples as could actually decide the vote.
+        RESPONSIBILITY: Compare leader against runner-up plus outstanding samples
+        PATTERNS: Guard clause for an already-decided vote
+
+        Args:
+            target_samples: Total samples the run may draw
+            completed_samples: Samples finished so far (including empty or
+                               answerless ones, which cast no vote)
+
+        Returns:
+            0 if the leader can no longer be overtaken, else the number of
+            additional agreeing votes that would settle it
+        """
+        counts = Counter(self._extract_answers()).most_common(2)
+        leader = counts[0][1] if counts else 0
+        runner_up = counts[1][1] if len(counts) > 1 else 0
+        outstanding = max(0, target_samples - completed_samples)
+
+        # Guard clause: leader already beats runner-up even if every outstanding sample disagrees
+        if leader > runner_up + outstanding:
+            return 0
+
+        # k more leader votes win when leader + k > runner_up + (outstanding - k)
+        return (runner_up + outstanding - leader) // 2 + 1
+
     def get_confidence_breakdown(self) -> Dict[str, Any]:
         """
         Get detailed breakdown of answer confidence.
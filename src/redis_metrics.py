@@ -112,6 +112,40 @@ class RedisMetrics:
             logger.log(f'⚠️  Failed to track LLM request: {e}', 'INFO')
             return False
 
+    def track_llm_stream(self, provider: str, model: str, time_to_first_token_ms: Optional[float], tokens_per_second: Optional[float], completion_tokens: int) -> bool:
+        """
+        Track streaming latency and throughput
+
+        Sums are stored so dashboards can derive averages (sum / streams).
+
+        Args:
+            provider: LLM provider (openai, anthropic)
+            model: Model name
+            time_to_first_token_ms: Time to first token (None if no tokens arrived)
+            tokens_per_second: Generation throughput (None if not measurable)
+            completion_tokens: Completion tokens streamed
+
+        Returns:
+            True if tracked successfully
+        """
+        if not self.enabled:
+            return False
+        try:
+            for key in (f'{self.key_prefix}:llm:stream', f'{self.key_prefix}:llm:stream:{provider}', f'{self.key_prefix}:llm:stream:model:{model}'):
+                self.redis.client.hincrby(key, 'streams', 1)
+                self.redis.client.hincrby(key, 'completion_tokens', completion_tokens)
+                if time_to_first_token_ms is not None:
+                    self.redis.client.hincrby(key, 'ttft_samples', 1)
+                    self.redis.client.hincrbyfloat(key, 'ttft_ms_sum', time_to_first_token_ms)
+                if tokens_per_second is not None:
+                    self.redis.client.hincrby(key, 'throughput_samples', 1)
+                    self.redis.client.hincrbyfloat(key, 'tokens_per_second_sum', tokens_per_second)
+            return True
+        except Exception as e:
+
+            logger.log(f'⚠️  Failed to track LLM stream: {e}', 'INFO')
+            return False
+
     def track_code_review(self, developer: str, overall_score: int, critical_issues: int, high_issues: int, status: str) -> bool:
         """
         Track code review results
@@ -9,6 +9,8 @@ PATTERNS: Facade pattern - simple interface to complex subsystem
 Package Structure:
 - parser_agent.py - Main orchestration (RequirementsParserAgent)
 - extraction_engine.py - Multi-step LLM extraction strategies
+- document_chunker.py - Section-aware chunking of long documents
+- extraction_merger.py - Merge, deduplicate and renumber chunk results
 - conversion_utils.py - LLM output to StructuredRequirements conversion
 - prompt_integration.py - PromptManager + RAG single-call extraction
 - ai_service_integration.py - KG→RAG→LLM pipeline integration
@@ -17,6 +19,8 @@ Package Structure:
 
 from requirements_parser.parser_agent import RequirementsParserAgent
 from requirements_parser.extraction_engine import ExtractionEngine
+from requirements_parser.document_chunker import DocumentChunk, chunk_document
+from requirements_parser.extraction_merger import ExtractionMerger
 from requirements_parser.conversion_utils import RequirementsConverter
 from requirements_parser.prompt_integration import PromptManagerIntegration
 from requirements_parser.ai_service_integration import AIServiceIntegration
@@ -28,6 +32,9 @@ __all__ = [
 
     # Internal components (exposed for testing/customization)
     "ExtractionEngine",
+    "DocumentChunk",
+    "chunk_document",
+    "ExtractionMerger",
     "RequirementsConverter",
     "PromptManagerIntegration",
     "AIServiceIntegration",
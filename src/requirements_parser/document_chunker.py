@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Document Chunker
+
+WHY: Every extraction pass embedded the full requirements document, so long
+     specifications were slow, expensive and could overflow the context window.
+RESPONSIBILITY: Split long documents into section-aligned chunks that fit a
+                size budget, without cutting through a section when avoidable
+PATTERNS: Guard clauses, Greedy packing
+
+Splitting order: section headings (markdown, numbered, ALL CAPS), then
+paragraphs, then hard cuts for a single oversized paragraph.
+"""
+
+import os
+import re
+from dataclasses import dataclass
+from typing import List, Optional
+
+DEFAULT_MAX_CHUNK_CHARS = 24000  # ~6k tokens
+
+HEADING_PATTERN = re.compile(
+    r'^(?:#{1,6}\s+\S.*'                      # Markdown: "## Security"
+    r'|\d+(?:\.\d+)*[.)]?\s+[A-Z].{0,80}'     # Numbered: "3.2 Performance"
+    r'|[A-Z][A-Z0-9 &/,\-]{3,80})$'           # ALL CAPS: "FUNCTIONAL REQUIREMENTS"
+)
+
+
+@dataclass
+class DocumentChunk:
+    """One section-aligned part of a requirements document"""
+    index: int  # 1-based
+    total: int
+    text: str
+    heading: Optional[str] = None
+
+    @property
+    def is_partial(self) -> bool:
+        return self.total > 1
+
+    @classmethod
+    def whole(cls, text: str) -> 'DocumentChunk':
+        """The entire document as a single chunk"""
+        return cls(index=1, total=1, text=text)
+
+
+def default_max_chunk_chars() -> int:
+    """Chunk size budget (ARTEMIS_REQUIREMENTS_CHUNK_CHARS or 24000)"""
+    return int(os.getenv('ARTEMIS_REQUIREMENTS_CHUNK_CHARS', DEFAULT_MAX_CHUNK_CHARS))
+
+
+def split_sections(text: str) -> List[str]:
+    """
+    Split text at section headings
+
+    Args:
+        text: Document text
+
+    Returns:
+        Sections in order, each starting with its heading line (the first
+        section may be a preamble without one)
+    """
+    sections: List[List[str]] = [[]]
+    for line in text.splitlines(keepends=True):
+        if HEADING_PATTERN.match(line.strip()) and any(part.strip() for part in sections[-1]):
+            sections.append([])
+        sections[-1].append(line)
+    return [''.join(section) for section in sections if ''.join(section).strip()]
+
+
+def _split_oversized(section: str, max_chars: int) -> List[str]:
+    """Split a section larger than the budget at paragraphs, then hard cuts"""
+    pieces = []
+    for paragraph in re.split(r'(?<=\n\n)', section):
+        if len(paragraph) <= max_chars:
+            pieces.append(paragraph)
+            continue
+        pieces.extend(paragraph[start:start + max_chars] for start in range(0, len(paragraph), max_chars))
+    return _pack(pieces, max_chars)
+
+
+def _pack(pieces: List[str], max_chars: int) -> List[str]:
+    """Greedily join consecutive pieces while they fit the budget"""
+    packed: List[str] = []
+    for piece in pieces:
+        if packed and len(packed[-1]) + len(piece) <= max_chars:
+            packed[-1] += piece
+            continue
+        packed.append(piece)
+    return packed
+
+
+def _first_heading(text: str) -> Optional[str]:
+    for line in text.splitlines():
+        if HEADING_PATTERN.match(line.strip()):
+            return line.strip().lstrip('#').strip()
+    return None
+
+
+def chunk_document(text: str, max_chars: Optional[int] = None) -> List[DocumentChunk]:
+    """
+    Split a document into section-aware chunks
+
+    Args:
+        text: Requirements document text
+        max_chars: Chunk size budget (default: default_max_chunk_chars())
+
+    Returns:
+        Chunks in document order (a single chunk if the text fits)
+    """
+    max_chars = max_chars or default_max_chunk_chars()
+
+    # Guard clause: short documents are extracted in one piece
+    if len(text) <= max_chars:
+        return [DocumentChunk.whole(text)]
+
+    pieces: List[str] = []
+    for section in split_sections(text):
+        pieces.extend([section] if len(section) <= max_chars else _split_oversized(section, max_chars))
+
+    packed = _pack(pieces, max_chars)
+    return [
+        DocumentChunk(index=number, total=len(packed), text=chunk_text, heading=_first_heading(chunk_text))
+        for number, chunk_text in enumerate(packed, 1)
+    ]
@@ -1,12 +1,23 @@
 from artemis_logger import get_logger
 logger = get_logger('extraction_engine')
-'\nRequirements Extraction Engine\n\nWHY: Separate LLM-based extraction logic from main agent class\nRESPONSIBILITY: Execute multi-step LLM extraction for different requirement types\nPATTERNS: Strategy pattern for different extraction types\n'
-from typing import List, Dict, Any, Optional
+'\nRequirements Extraction Engine\n\nWHY: Separate LLM-based extraction logic from main agent class\nRESPONSIBILITY: Execute multi-step LLM extraction for different requirement types\nPATTERNS: Strategy pattern for different extraction types\n\nEvery pass sends the same document prefix (system message) followed by its\npass-specific instructions, so providers with prompt caching reuse the\nprefix. extract_all() runs the passes concurrently over section-aware\nchunks of long documents and merges the results.\n'
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Dict, Any, Optional
 from datetime import datetime
 from requirements_models import FunctionalRequirement, NonFunctionalRequirement, UseCase, DataRequirement, IntegrationRequirement, Stakeholder, Constraint, Assumption, Priority, RequirementType
 from llm_client import LLMClient, LLMMessage
+from requirements_parser.document_chunker import DocumentChunk, chunk_document
+from requirements_parser.extraction_merger import ExtractionMerger
 VALID_PRIORITIES = {p.value for p in Priority}
 VALID_REQ_TYPES = {t.value for t in RequirementType}
+DEFAULT_MAX_WORKERS = 8
+PROMPT_CACHE_MIN_CHARS = 4096
+DOCUMENT_PREFIX = 'You are a requirements analyst. All instructions refer to the requirements document below.\n\nRequirements Document:\n{document}'
+PART_NOTICE = 'This is part {index} of {total} of a longer document{section}. Extract only what appears in this part.\n\n'
+PASS_INSTRUCTIONS = {'overview': 'Extract the following from this requirements document:\n\n1. Executive summary (2-3 sentences)\n2. Business goals (list)\n3. Success criteria (measurable outcomes)\n4. Glossary (key terms and definitions)\n\nReturn JSON with keys: executive_summary, business_goals, success_criteria, glossary\nKeep it concise and factual.', 'functional': 'Extract ALL functional requirements from this document.\n\nFor each functional requirement, provide:\n- id: REQ-F-XXX (sequential numbering)\n- title: Short descriptive title\n- description: What the system must do\n- priority: critical/high/medium/low/nice_to_have\n- user_story: As a [user], I want [goal], so that [benefit] (if applicable)\n- acceptance_criteria: List of testable criteria\n- estimated_effort: small/medium/large/xl\n- tags: Relevant tags for categorization\n\nReturn JSON array of functional requirements. Be thorough and extract ALL requirements.', 'non_functional': 'Extract ALL non-functional requirements from this document.\n\nNon-functional requirements include:\n- Performance (response time, throughput, scalability)\n- Security (authentication, authorization, encryption)\n- Compliance (GDPR, HIPAA, SOC2, etc.)\n- Usability (user experience, accessibility)\n- Reliability (uptime, availability, fault tolerance)\n- Maintainability (code quality, documentation)\n\nFor each non-functional requirement, provide:\n- id: REQ-NF-XXX (sequential numbering)\n- title: Short descriptive title\n- description: The requirement details\n- type: functional/non_functional/performance/security/compliance/usability/accessibility/integration/data/business\n- priority: critical/high/medium/low/nice_to_have\n- metric: How to measure (if applicable)\n- target: Target value (e.g., "< 200ms", "> 99.9% uptime")\n- acceptance_criteria: List of testable criteria\n- tags: Relevant tags\n\nReturn JSON array of non-functional requirements.', 'use_cases': 'Extract use cases from this requirements document.\n\nFor each use case, provide:\n- id: UC-XXX\n- title: Use case name\n- actor: Who performs this use case\n- preconditions: What must be true before\n- main_flow: Step-by-step main scenario\n- alternate_flows: Alternative scenarios (dict)\n- postconditions: System state after\n- related_requirements: Related requirement IDs\n\nReturn JSON array of use cases.', 'data': 'Extract data requirements and data models from this document.\n\nFor each data entity, provide:\n- id: REQ-D-XXX\n- entity_name: Name of the data entity\n- description: What this entity represents\n- attributes: List of attributes with name, type, required\n- relationships: Relationships to other entities\n- volume: Expected data volume\n- retention: Data retention policy\n- compliance: Compliance requirements (GDPR, etc.)\n\nReturn JSON array of data requirements. Only extract if data models are mentioned.', 'integration': 'Extract integration requirements with external systems from this document.\n\nFor each integration, provide:\n- id: REQ-I-XXX\n- system_name: Name of external system\n- description: What the integration does\n- direction: inbound/outbound/bidirectional\n- protocol: REST/GraphQL/gRPC/SOAP/etc\n- data_format: JSON/XML/CSV/etc\n- frequency: real-time/batch/scheduled\n- authentication: OAuth/API key/etc\n- sla: Service level agreement\n\nReturn JSON array of integration requirements. Only extract if integrations are mentioned.', 'stakeholders': 'Identify stakeholders from this requirements document.\n\nFor each stakeholder, provide:\n- name: Name or role\n- role: Job title/role\n- contact: Contact info (if mentioned)\n- concerns: Key concerns/interests\n\nReturn JSON array of stakeholders.', 'constraints': 'Identify constraints from this requirements document.\n\nConstraints include:\n- Technical constraints (technology stack, platforms)\n- Business constraints (budget, timeline)\n- Regulatory constraints (compliance, legal)\n\nFor each constraint, provide:\n- type: technical/business/regulatory/timeline/budget\n- description: The constraint\n- impact: high/medium/low\n- mitigation: How to address (if mentioned)\n\nReturn JSON array of constraints.', 'assumptions': 'Identify assumptions from this requirements document.\n\nFor each assumption, provide:\n- description: The assumption\n- risk_if_false: Risk if assumption is wrong\n- validation_needed: true/false\n\nReturn JSON array of assumptions.'}
+LIST_PASSES = ('functional', 'non_functional', 'use_cases', 'data', 'integration', 'stakeholders', 'constraints', 'assumptions')
+CACHE_PRIMING_PASS = 'functional'
 
 class ExtractionEngine:
     """
@@ -17,16 +28,93 @@ class ExtractionEngine:
     PATTERNS: Strategy pattern (each extract_* method is a strategy)
     """
 
-    def __init__(self, llm: LLMClient, verbose: bool=False):
+    def __init__(self, llm: LLMClient, verbose: bool=False, max_workers: Optional[int]=None, max_chunk_chars: Optional[int]=None, merger: Optional[ExtractionMerger]=None):
         """
         Initialize extraction engine
 
         Args:
             llm: LLM client for making extraction calls
             verbose: Enable verbose logging
+            max_workers: Concurrent LLM calls in extract_all (default ARTEMIS_REQUIREMENTS_WORKERS or 8)
+            max_chunk_chars: Chunk size for long documents (default ARTEMIS_REQUIREMENTS_CHUNK_CHARS or 24000)
+            merger: Merges per-chunk results (default ExtractionMerger())
         """
         self.llm = llm
         self.verbose = verbose
+        self.max_workers = max_workers or int(os.getenv('ARTEMIS_REQUIREMENTS_WORKERS', DEFAULT_MAX_WORKERS))
+        self.max_chunk_chars = max_chunk_chars
+        self.merger = merger or ExtractionMerger()
+        self._builders: Dict[str, Callable[[Dict[str, Any], int], Any]] = {'functional': self._build_functional_requirement, 'non_functional': self._build_non_functional_requirement, 'use_cases': self._build_use_case, 'data': self._build_data_requirement, 'integration': self._build_integration_requirement, 'stakeholders': lambda data, idx: self._build_stakeholder(data), 'constraints': lambda data, idx: self._build_constraint(data), 'assumptions': lambda data, idx: self._build_assumption(data)}
+
+    def extract_all(self, raw_text: str, project_name: str) -> Dict[str, Any]:
+        """
+        Run every extraction pass concurrently and merge chunk results
+
+        WHY: The passes are independent, and long documents no longer need to
+             fit one prompt - each section-aware chunk is extracted in parallel.
+        RESPONSIBILITY: Schedule pass x chunk LLM calls, merge and renumber
+
+        Args:
+            raw_text: Requirements document text
+            project_name: Project name
+
+        Returns:
+            Dict with 'overview' and one list per pass in LIST_PASSES
+        """
+        chunks = chunk_document(raw_text, self.max_chunk_chars)
+        passes = ('overview',) + LIST_PASSES
+        if self.verbose:
+
+            logger.log(f'Extracting {len(passes)} passes over {len(chunks)} chunk(s) with {self.max_workers} workers', 'INFO')
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='requirements-extract') as pool:
+            primed = self._prime_prompt_cache(pool, chunks)
+            futures = {(pass_name, chunk.index): pool.submit(self._extract_part, pass_name, chunk) for pass_name in passes for chunk in chunks if (pass_name, chunk.index) not in primed}
+            futures.update(primed)
+            results = {key: future.result() for key, future in futures.items()}
+        overviews = [results['overview', chunk.index] for chunk in chunks]
+        per_chunk = {pass_name: [results[pass_name, chunk.index] for chunk in chunks] for pass_name in LIST_PASSES}
+        if len(chunks) == 1:
+            return {'overview': overviews[0], **{pass_name: lists[0] for pass_name, lists in per_chunk.items()}}
+        return {'overview': self.merger.merge_overview(overviews), **self.merger.merge_results(per_chunk)}
+
+    def _prime_prompt_cache(self, pool: ThreadPoolExecutor, chunks: List[DocumentChunk]) -> Dict[Any, Any]:
+        """
+        Run one pass per chunk to completion before fanning out the rest
+
+        WHY: Providers cache a prompt prefix only after a request with it has
+             been processed; launching all passes at once would make every one
+             of them pay for the full document. Skipped for chunks too short
+             to be cached.
+        """
+        primed = {(CACHE_PRIMING_PASS, chunk.index): pool.submit(self._extract_part, CACHE_PRIMING_PASS, chunk) for chunk in chunks if len(chunk.text) >= PROMPT_CACHE_MIN_CHARS}
+        for future in primed.values():
+            future.exception()
+        return primed
+
+    def _extract_part(self, pass_name: str, chunk: DocumentChunk) -> Any:
+        """Run one pass over one chunk and build model objects from the JSON"""
+        result = self._run_pass(pass_name, chunk)
+        if pass_name == 'overview':
+            return result if isinstance(result, dict) and result else {'executive_summary': None, 'business_goals': [], 'success_criteria': [], 'glossary': {}}
+        if not result or not isinstance(result, list):
+            return []
+        build = self._builders[pass_name]
+        return [item for item in (build(data, idx) for idx, data in enumerate(result, 1)) if item]
+
+    def _run_pass(self, pass_name: str, chunk: DocumentChunk) -> Any:
+        """
+        Call the LLM for one pass over one chunk
+
+        Messages are [document prefix, pass instructions]: the prefix is
+        byte-identical across passes for the same chunk.
+        """
+        instructions = PASS_INSTRUCTIONS[pass_name]
+        if chunk.is_partial:
+            section = f" (starting at section '{chunk.heading}')" if chunk.heading else ''
+            instructions = PART_NOTICE.format(index=chunk.index, total=chunk.total, section=section) + instructions
+        messages = [LLMMessage(role='system', content=DOCUMENT_PREFIX.format(document=chunk.text)), LLMMessage(role='user', content=instructions)]
+        response = self.llm.generate_text(messages=messages)
+        return self._parse_json_response(response.content)
 
     def extract_overview(self, raw_text: str, project_name: str) -> Dict[str, Any]:
         """
@@ -35,10 +123,7 @@ class ExtractionEngine:
         WHY: First step in multi-step extraction
         RESPONSIBILITY: Get high-level project metadata
         """
-        prompt = f'You are a requirements analyst. Extract the following from this requirements document:\n\n1. Executive summary (2-3 sentences)\n2. Business goals (list)\n3. Success criteria (measurable outcomes)\n4. Glossary (key terms and definitions)\n\nRequirements Document:\n{raw_text}\n\nReturn JSON with keys: executive_summary, business_goals, success_criteria, glossary\nKeep it concise and factual.'
-        response = self.llm.generate_text(messages=[LLMMessage(role='user', content=prompt)])
-        result = self._parse_json_response(response.content)
-        return result or {'executive_summary': None, 'business_goals': [], 'success_criteria': [], 'glossary': {}}
+        return self._extract_part('overview', DocumentChunk.whole(raw_text))
 
     def extract_functional_requirements(self, raw_text: str) -> List[FunctionalRequirement]:
         """
@@ -47,17 +132,7 @@ class ExtractionEngine:
         WHY: Core requirement extraction step
         RESPONSIBILITY: Identify what system must do
         """
-        prompt = f'You are a requirements analyst. Extract ALL functional requirements from this document.\n\nFor each functional requirement, provide:\n- id: REQ-F-XXX (sequential numbering)\n- title: Short descriptive title\n- description: What the system must do\n- priority: critical/high/medium/low/nice_to_have\n- user_story: As a [user], I want [goal], so that [benefit] (if applicable)\n- acceptance_criteria: List of testable criteria\n- estimated_effort: small/medium/large/xl\n- tags: Relevant tags for categorization\n\nRequirements Document:\n{raw_text}\n\nReturn JSON array of functional requirements. Be thorough and extract ALL requirements.'
-        response = self.llm.generate_text(messages=[LLMMessage(role='user', content=prompt)])
-        result = self._parse_json_response(response.content)
-        if not result or not isinstance(result, list):
-            return []
-        functional_reqs = []
-        for idx, req_data in enumerate(result, 1):
-            req = self._build_functional_requirement(req_data, idx)
-            if req:
-                functional_reqs.append(req)
-        return functional_reqs
+        return self._extract_part('functional', DocumentChunk.whole(raw_text))
 
     def extract_non_functional_requirements(self, raw_text: str) -> List[NonFunctionalRequirement]:
         """
@@ -66,17 +141,7 @@ class ExtractionEngine:
         WHY: NFRs are often implicit and need careful extraction
         RESPONSIBILITY: Identify quality attributes and constraints
         """
-        prompt = f'You are a requirements analyst. Extract ALL non-functional requirements from this document.\n\nNon-functional requirements include:\n- Performance (response time, throughput, scalability)\n- Security (authentication, authorization, encryption)\n- Compliance (GDPR, HIPAA, SOC2, etc.)\n- Usability (user experience, accessibility)\n- Reliability (uptime, availability, fault tolerance)\n- Maintainability (code quality, documentation)\n\nFor each non-functional requirement, provide:\n- id: REQ-NF-XXX (sequential numbering)\n- title: Short descriptive title\n- description: The requirement details\n- type: functional/non_functional/performance/security/compliance/usability/accessibility/integration/data/business\n- priority: critical/high/medium/low/nice_to_have\n- metric: How to measure (if applicable)\n- target: Target value (e.g., "< 200ms", "> 99.9% uptime")\n- acceptance_criteria: List of testable criteria\n- tags: Relevant tags\n\nRequirements Document:\n{raw_text}\n\nReturn JSON array of non-functional requirements.'
-        response = self.llm.generate_text(messages=[LLMMessage(role='user', content=prompt)])
-        result = self._parse_json_response(response.content)
-        if not result or not isinstance(result, list):
-            return []
-        non_functional_reqs = []
-        for idx, req_data in enumerate(result, 1):
-            req = self._build_non_functional_requirement(req_data, idx)
-            if req:
-                non_functional_reqs.append(req)
-        return non_functional_reqs
+        return self._extract_part('non_functional', DocumentChunk.whole(raw_text))
 
     def extract_use_cases(self, raw_text: str) -> List[UseCase]:
         """
@@ -85,17 +150,7 @@ class ExtractionEngine:
         WHY: Use cases describe system behavior from user perspective
         RESPONSIBILITY: Capture user interactions and workflows
         """
-        prompt = f'Extract use cases from this requirements document.\n\nFor each use case, provide:\n- id: UC-XXX\n- title: Use case name\n- actor: Who performs this use case\n- preconditions: What must be true before\n- main_flow: Step-by-step main scenario\n- alternate_flows: Alternative scenarios (dict)\n- postconditions: System state after\n- related_requirements: Related requirement IDs\n\nRequirements Document:\n{raw_text}\n\nReturn JSON array of use cases.'
-        response = self.llm.generate_text(messages=[LLMMessage(role='user', content=prompt)])
-        result = self._parse_json_response(response.content)
-        if not result or not isinstance(result, list):
-            return []
-        use_cases = []
-        for idx, uc_data in enumerate(result, 1):
-            uc = self._build_use_case(uc_data, idx)
-            if uc:
-                use_cases.append(uc)
-        return use_cases
+        return self._extract_part('use_cases', DocumentChunk.whole(raw_text))
 
     def extract_data_requirements(self, raw_text: str) -> List[DataRequirement]:
         """
@@ -104,17 +159,7 @@ class ExtractionEngine:
         WHY: Data requirements define information architecture
         RESPONSIBILITY: Identify data entities and their relationships
         """
-        prompt = f'Extract data requirements and data models from this document.\n\nFor each data entity, provide:\n- id: REQ-D-XXX\n- entity_name: Name of the data entity\n- description: What this entity represents\n- attributes: List of attributes with name, type, required\n- relationships: Relationships to other entities\n- volume: Expected data volume\n- retention: Data retention policy\n- compliance: Compliance requirements (GDPR, etc.)\n\nRequirements Document:\n{raw_text}\n\nReturn JSON array of data requirements. Only extract if data models are mentioned.'
-        response = self.llm.generate_text(messages=[LLMMessage(role='user', content=prompt)])
-        result = self._parse_json_response(response.content)
-        if not result or not isinstance(result, list):
-            return []
-        data_reqs = []
-        for idx, data in enumerate(result, 1):
-            req = self._build_data_requirement(data, idx)
-            if req:
-                data_reqs.append(req)
-        return data_reqs
+        return self._extract_part('data', DocumentChunk.whole(raw_text))
 
     def extract_integration_requirements(self, raw_text: str) -> List[IntegrationRequirement]:
         """
@@ -123,17 +168,7 @@ class ExtractionEngine:
         WHY: Integrations are critical architectural decisions
         RESPONSIBILITY: Identify external dependencies and interfaces
         """
-        prompt = f'Extract integration requirements with external systems from this document.\n\nFor each integration, provide:\n- id: REQ-I-XXX\n- system_name: Name of external system\n- description: What the integration does\n- direction: inbound/outbound/bidirectional\n- protocol: REST/GraphQL/gRPC/SOAP/etc\n- data_format: JSON/XML/CSV/etc\n- frequency: real-time/batch/scheduled\n- authentication: OAuth/API key/etc\n- sla: Service level agreement\n\nRequirements Document:\n{raw_text}\n\nReturn JSON array of integration requirements. Only extract if integrations are mentioned.'
-        response = self.llm.generate_text(messages=[LLMMessage(role='user', content=prompt)])
-        result = self._parse_json_response(response.content)
-        if not result or not isinstance(result, list):
-            return []
-        integration_reqs = []
-        for idx, integration in enumerate(result, 1):
-            req = self._build_integration_requirement(integration, idx)
-            if req:
-                integration_reqs.append(req)
-        return integration_reqs
+        return self._extract_part('integration', DocumentChunk.whole(raw_text))
 
     def extract_stakeholders(self, raw_text: str) -> List[Stakeholder]:
         """
@@ -142,17 +177,7 @@ class ExtractionEngine:
         WHY: Stakeholders drive requirements and priorities
         RESPONSIBILITY: Identify who cares about what
         """
-        prompt = f'Identify stakeholders from this requirements document.\n\nFor each stakeholder, provide:\n- name: Name or role\n- role: Job title/role\n- contact: Contact info (if mentioned)\n- concerns: Key concerns/interests\n\nRequirements Document:\n{raw_text}\n\nReturn JSON array of stakeholders.'
-        response = self.llm.generate_text(messages=[LLMMessage(role='user', content=prompt)])
-        result = self._parse_json_response(response.content)
-        if not result or not isinstance(result, list):
-            return []
-        stakeholders = []
-        for s in result:
-            stakeholder = self._build_stakeholder(s)
-            if stakeholder:
-                stakeholders.append(stakeholder)
-        return stakeholders
+        return self._extract_part('stakeholders', DocumentChunk.whole(raw_text))
 
     def extract_constraints(self, raw_text: str) -> List[Constraint]:
         """
@@ -161,17 +186,7 @@ class ExtractionEngine:
         WHY: Constraints limit solution space
         RESPONSIBILITY: Identify boundaries and limitations
         """
-        prompt = f'Identify constraints from this requirements document.\n\nConstraints include:\n- Technical constraints (technology stack, platforms)\n- Business constraints (budget, timeline)\n- Regulatory constraints (compliance, legal)\n\nFor each constraint, provide:\n- type: technical/business/regulatory/timeline/budget\n- description: The constraint\n- impact: high/medium/low\n- mitigation: How to address (if mentioned)\n\nRequirements Document:\n{raw_text}\n\nReturn JSON array of constraints.'
-        response = self.llm.generate_text(messages=[LLMMessage(role='user', content=prompt)])
-        result = self._parse_json_response(response.content)
-        if not result or not isinstance(result, list):
-            return []
-        constraints = []
-        for c in result:
-            constraint = self._build_constraint(c)
-            if constraint:
-                constraints.append(constraint)
-        return constraints
+        return self._extract_part('constraints', DocumentChunk.whole(raw_text))
 
     def extract_assumptions(self, raw_text: str) -> List[Assumption]:
         """
@@ -180,17 +195,7 @@ class ExtractionEngine:
         WHY: Assumptions are hidden risks
         RESPONSIBILITY: Make implicit assumptions explicit
         """
-        prompt = f'Identify assumptions from this requirements document.\n\nFor each assumption, provide:\n- description: The assumption\n- risk_if_false: Risk if assumption is wrong\n- validation_needed: true/false\n\nRequirements Document:\n{raw_text}\n\nReturn JSON array of assumptions.'
-        response = self.llm.generate_text(messages=[LLMMessage(role='user', content=prompt)])
-        result = self._parse_json_response(response.content)
-        if not result or not isinstance(result, list):
-            return []
-        assumptions = []
-        for a in result:
-            assumption = self._build_assumption(a)
-            if assumption:
-                assumptions.append(assumption)
-        return assumptions
+        return self._extract_part('assumptions', DocumentChunk.whole(raw_text))
 
     def _build_functional_requirement(self, req_data: Dict[str, Any], idx: int) -> Optional[FunctionalRequirement]:
         """Build FunctionalRequirement from LLM data"""
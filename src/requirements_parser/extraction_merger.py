@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Extraction Merger
+
+WHY: Chunks of one document are extracted independently, so each chunk
+     numbers its requirements from 001 and sections that overlap (or repeat
+     a requirement in a summary) yield the same item twice.
+RESPONSIBILITY: Merge per-chunk extraction results into one set: drop near
+                duplicates, renumber IDs sequentially and remap references
+PATTERNS: Dispatch tables (dedup fields, ID formats), Guard clauses
+"""
+
+import re
+from difflib import SequenceMatcher
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_SIMILARITY_THRESHOLD = 0.88
+
+# Dispatch table: result kind -> fields that identify an item
+DEDUP_FIELDS: Dict[str, Tuple[str, ...]] = {
+    'functional': ('title', 'description'),
+    'non_functional': ('title', 'description'),
+    'use_cases': ('title', 'actor'),
+    'data': ('entity_name',),
+    'integration': ('system_name',),
+    'stakeholders': ('name', 'role'),
+    'constraints': ('description',),
+    'assumptions': ('description',),
+}
+
+# Dispatch table: result kind -> sequential ID format (kinds without IDs are absent)
+ID_FORMATS: Dict[str, str] = {
+    'functional': 'REQ-F-{:03d}',
+    'non_functional': 'REQ-NF-{:03d}',
+    'data': 'REQ-D-{:03d}',
+    'integration': 'REQ-I-{:03d}',
+    'use_cases': 'UC-{:03d}',
+}
+
+# Fields holding IDs of other requirements
+REFERENCE_FIELDS: Dict[str, str] = {
+    'functional': 'dependencies',
+    'use_cases': 'related_requirements',
+}
+
+
+def normalize_text(text: Any) -> str:
+    """Lowercase and collapse punctuation/whitespace for comparison"""
+    return re.sub(r'[^a-z0-9]+', ' ', str(text or '').lower()).strip()
+
+
+class ExtractionMerger:
+    """
+    Merges extraction results from document chunks
+
+    Usage:
+        merger = ExtractionMerger()
+        merged = merger.merge_results({'functional': [chunk1_reqs, chunk2_reqs], ...})
+        overview = merger.merge_overview([chunk1_overview, chunk2_overview])
+    """
+
+    def __init__(self, similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD):
+        """
+        Args:
+            similarity_threshold: Text similarity (0-1) at which two items are duplicates
+        """
+        self.similarity_threshold = similarity_threshold
+
+    def is_near_duplicate(self, left: str, right: str) -> bool:
+        """Check whether two normalized strings describe the same thing"""
+        if left == right:
+            return True
+        if not left or not right:
+            return False
+        matcher = SequenceMatcher(None, left, right)
+        # quick_ratio is an upper bound - skip the expensive ratio when it can't pass
+        return matcher.quick_ratio() >= self.similarity_threshold and matcher.ratio() >= self.similarity_threshold
+
+    def merge_results(self, per_chunk: Dict[str, List[List[Any]]]) -> Dict[str, List[Any]]:
+        """
+        Merge per-chunk item lists for every result kind
+
+        Args:
+            per_chunk: kind -> one item list per chunk (same chunk order for every kind)
+
+        Returns:
+            kind -> merged, deduplicated, renumbered items
+        """
+        id_maps: Dict[int, Dict[str, str]] = {}
+        origins: Dict[str, List[Tuple[int, Any]]] = {}
+        for kind, chunk_lists in per_chunk.items():
+            origins[kind] = self._merge_kind(kind, chunk_lists, id_maps)
+
+        for kind, field_name in REFERENCE_FIELDS.items():
+            for chunk_index, item in origins.get(kind, []):
+                self._remap_references(item, field_name, id_maps.get(chunk_index, {}))
+
+        return {kind: [item for _, item in kept] for kind, kept in origins.items()}
+
+    def _merge_kind(self, kind: str, chunk_lists: List[List[Any]], id_maps: Dict[int, Dict[str, str]]) -> List[Tuple[int, Any]]:
+        """Deduplicate and renumber one kind; record old -> new IDs per chunk"""
+        fields = DEDUP_FIELDS.get(kind, ())
+        id_format = ID_FORMATS.get(kind)
+        kept: List[Tuple[int, Any]] = []
+        kept_keys: List[str] = []
+
+        for chunk_index, items in enumerate(chunk_lists):
+            chunk_map = id_maps.setdefault(chunk_index, {})
+            for item in items:
+                key = ' '.join(normalize_text(getattr(item, name, '')) for name in fields)
+                duplicate_of = self._find_duplicate(key, kept_keys)
+                old_id = getattr(item, 'id', None)
+
+                if duplicate_of is not None:
+                    if id_format and old_id:
+                        chunk_map[old_id] = kept[duplicate_of][1].id
+                    continue
+
+                if id_format:
+                    item.id = id_format.format(len(kept) + 1)
+                    if old_id:
+                        chunk_map[old_id] = item.id
+                kept.append((chunk_index, item))
+                kept_keys.append(key)
+        return kept
+
+    def _find_duplicate(self, key: str, kept_keys: List[str]) -> Optional[int]:
+        for position, kept_key in enumerate(kept_keys):
+            if self.is_near_duplicate(key, kept_key):
+                return position
+        return None
+
+    def _remap_references(self, item: Any, field_name: str, chunk_map: Dict[str, str]) -> None:
+        """Point references at renumbered IDs (unknown references are kept as-is)"""
+        references = getattr(item, field_name, None)
+        if not references:
+            return
+        remapped = [chunk_map.get(reference, reference) for reference in references]
+        setattr(item, field_name, list(dict.fromkeys(remapped)))
+
+    def merge_overview(self, parts: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Merge per-chunk overviews
+
+        Returns:
+            First non-empty executive summary, deduplicated goal and criteria
+            lists, and the union of glossaries (first definition wins)
+        """
+        merged: Dict[str, Any] = {'executive_summary': None, 'business_goals': [], 'success_criteria': [], 'glossary': {}}
+        for part in parts:
+            merged['executive_summary'] = merged['executive_summary'] or part.get('executive_summary')
+            for list_key in ('business_goals', 'success_criteria'):
+                self._extend_unique(merged[list_key], part.get(list_key) or [])
+            glossary = part.get('glossary')
+            if isinstance(glossary, dict):
+                for term, definition in glossary.items():
+                    merged['glossary'].setdefault(term, definition)
+        return merged
+
+    def _extend_unique(self, target: List[Any], additions: List[Any]) -> None:
+        keys = [normalize_text(existing) for existing in target]
+        for addition in additions:
+            key = normalize_text(addition)
+            if any(self.is_near_duplicate(key, existing) for existing in keys):
+                continue
+            target.append(addition)
+            keys.append(key)
@@ -54,7 +54,7 @@ class KnowledgeGraphIntegration:
         WHY: Separate query logic for testability
         RESPONSIBILITY: Execute KG query
         """
-        similar_requirements = kg.query("\n            MATCH (req:Requirement)\n            WHERE req.status = 'active'\n            RETURN req.req_id, req.title, req.type, req.priority\n            ORDER BY req.priority DESC\n            LIMIT 20\n        ")
+        similar_requirements = kg.get_active_requirements(limit=20)
         return similar_requirements if similar_requirements else None
 
     def _build_kg_context_from_requirements(self, similar_requirements: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -73,11 +73,11 @@ class KnowledgeGraphIntegration:
         type_counts = {}
         common_reqs = []
         for req in similar_requirements:
-            req_type = req.get('req.type', 'unknown')
+            req_type = req.get('type', 'unknown')
             type_counts[req_type] = type_counts.get(req_type, 0) + 1
-            common_reqs.append({'req_id': req.get('req.req_id'), 'title': req.get('req.title'), 'type': req_type, 'priority': req.get('req.priority', 'medium')})
+            common_reqs.append({'req_id': req.get('req_id'), 'title': req.get('title'), 'type': req_type, 'priority': req.get('priority', 'medium')})
         estimated_savings = len(common_reqs) * 50
-        return {'similar_projects_count': len(set((req.get('req.req_id', '').split('-')[0] for req in similar_requirements))), 'common_requirements': common_reqs, 'requirement_types': type_counts, 'estimated_token_savings': estimated_savings}
+        return {'similar_projects_count': len(set((req.get('req_id', '').split('-')[0] for req in similar_requirements))), 'common_requirements': common_reqs, 'requirement_types': type_counts, 'estimated_token_savings': estimated_savings}
 
     def log(self, message: str):
         """Log message if verbose"""
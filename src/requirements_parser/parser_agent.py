@@ -191,19 +191,12 @@ class RequirementsParserAgent(DebugMixin):
         Multi-step LLM extraction (legacy fallback)
 
         WHY: Fallback when PromptManager unavailable
-        RESPONSIBILITY: Execute 7-step extraction process
+        RESPONSIBILITY: Run all extraction passes concurrently (chunked for long documents)
         """
         self.log('📝 Using multi-step extraction (legacy mode)')
-        overview = self.extraction_engine.extract_overview(raw_text, project_name)
-        functional_reqs = self.extraction_engine.extract_functional_requirements(raw_text)
-        non_functional_reqs = self.extraction_engine.extract_non_functional_requirements(raw_text)
-        use_cases = self.extraction_engine.extract_use_cases(raw_text)
-        data_reqs = self.extraction_engine.extract_data_requirements(raw_text)
-        integration_reqs = self.extraction_engine.extract_integration_requirements(raw_text)
-        stakeholders = self.extraction_engine.extract_stakeholders(raw_text)
-        constraints = self.extraction_engine.extract_constraints(raw_text)
-        assumptions = self.extraction_engine.extract_assumptions(raw_text)
-        return StructuredRequirements(project_name=project_name, version='1.0', created_date=datetime.now().strftime('%Y-%m-%d'), executive_summary=overview.get('executive_summary'), business_goals=overview.get('business_goals', []), success_criteria=overview.get('success_criteria', []), stakeholders=stakeholders, constraints=constraints, assumptions=assumptions, functional_requirements=functional_reqs, non_functional_requirements=non_functional_reqs, use_cases=use_cases, data_requirements=data_reqs, integration_requirements=integration_reqs, glossary=overview.get('glossary', {}))
+        extracted = self.extraction_engine.extract_all(raw_text, project_name)
+        overview = extracted['overview']
+        return StructuredRequirements(project_name=project_name, version='1.0', created_date=datetime.now().strftime('%Y-%m-%d'), executive_summary=overview.get('executive_summary'), business_goals=overview.get('business_goals', []), success_criteria=overview.get('success_criteria', []), stakeholders=extracted['stakeholders'], constraints=extracted['constraints'], assumptions=extracted['assumptions'], functional_requirements=extracted['functional'], non_functional_requirements=extracted['non_functional'], use_cases=extracted['use_cases'], data_requirements=extracted['data'], integration_requirements=extracted['integration'], glossary=overview.get('glossary', {}))
 
     def log(self, message: str):
         """Log message if verbose"""
@@ -11,6 +11,7 @@ RESPONSIBILITY: Exports public API for the research package:
 - ResearchStrategy: Abstract base for all strategies
 - Concrete strategy implementations (GitHub, HuggingFace, Local)
 - ResearchStrategyFactory: Factory for creating strategies
+- Pooled, cached HTTP client shared by remote strategies
 - Exception types for error handling
 
 PATTERNS:
@@ -45,6 +46,9 @@ from research.local_strategy import LocalExamplesResearchStrategy
 # Factory
 from research.factory import ResearchStrategyFactory
 
+# HTTP client (pooled, on-disk cached)
+from research.http_client import HTTPResponseCache, PooledHTTPClient, get_http_client
+
 # Repository (for backward compatibility)
 from research.repository import ExampleRepository
 
@@ -65,6 +69,11 @@ __all__ = [
     # Factory
     "ResearchStrategyFactory",
 
+    # HTTP client
+    "HTTPResponseCache",
+    "PooledHTTPClient",
+    "get_http_client",
+
     # Repository
     "ExampleRepository",
 ]
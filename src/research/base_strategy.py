@@ -7,7 +7,8 @@ and enabling the Strategy Pattern for different research sources.
 
 RESPONSIBILITY: Provides abstract base class and common functionality:
 - Abstract search interface that all strategies must implement
-- Common HTTP fetching with timeout and error handling
+- Common HTTP fetching with timeout and error handling (pooled, cached client)
+- Bounded concurrent fan-out for independent fetches
 - Query building utilities
 - Exception handling with proper error context
 
@@ -17,15 +18,25 @@ PATTERNS:
 - Guard Clause Pattern: Early returns for error conditions (max 1 level nesting)
 """
 
+import http.client
 import json
-import urllib.request
-import urllib.error
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, TypeVar
 
 from research_exceptions import ResearchSourceError, ResearchTimeoutError
+from research.http_client import PooledHTTPClient, get_http_client
 from research.models import ResearchExample
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Upper bound on concurrent requests a single strategy issues
+DEFAULT_MAX_FETCH_WORKERS = 8
+
+# Content is truncated to keep RAG documents and prompts small
+MAX_CONTENT_CHARS = 5000
+
 
 class ResearchStrategy(ABC):
     """
@@ -35,14 +46,30 @@ class ResearchStrategy(ABC):
     This base class provides common functionality like HTTP fetching and query building.
     """
 
-    def __init__(self, timeout_seconds: int = 30):
+    def __init__(
+        self,
+        timeout_seconds: int = 30,
+        http_client: Optional[PooledHTTPClient] = None,
+        max_fetch_workers: int = DEFAULT_MAX_FETCH_WORKERS
+    ):
         """
         Initialize research strategy.
 
         Args:
             timeout_seconds: Timeout for HTTP requests in seconds
+            http_client: HTTP client (default: shared pooled + cached client)
+            max_fetch_workers: Max concurrent requests issued by this strategy
         """
         self.timeout_seconds = timeout_seconds
+        self._http_client = http_client
+        self.max_fetch_workers = max(1, max_fetch_workers)
+
+    @property
+    def http_client(self) -> PooledHTTPClient:
+        """HTTP client, resolved lazily so local-only strategies never create one"""
+        if self._http_client is None:
+            self._http_client = get_http_client()
+        return self._http_client
 
     @abstractmethod
     def search(self, query: str, technologies: List[str], max_results: int = 5) -> List[ResearchExample]:
@@ -117,25 +144,68 @@ class ResearchStrategy(ABC):
             )
 
         try:
-            request = urllib.request.Request(url, headers=headers or {})
-            with urllib.request.urlopen(request, timeout=self.timeout_seconds) as response:
-                return json.loads(response.read().decode('utf-8'))
+            response = self.http_client.get(url, headers=headers, timeout_seconds=self.timeout_seconds)
+            return response.json()
 
-        except urllib.error.URLError as e:
+        except TimeoutError as e:
+            raise ResearchTimeoutError(
+                f"fetch {url}",
+                self.timeout_seconds,
+                cause=e
+            )
+        except (OSError, http.client.HTTPException) as e:
             raise ResearchSourceError(
                 self.get_source_name(),
                 f"Failed to fetch {url}",
                 cause=e
             )
-        except json.JSONDecodeError as e:
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
             raise ResearchSourceError(
                 self.get_source_name(),
                 f"Invalid JSON response from {url}",
                 cause=e
             )
-        except TimeoutError as e:
-            raise ResearchTimeoutError(
-                f"fetch {url}",
-                self.timeout_seconds,
-                cause=e
-            )
+
+    def _fetch_text(self, url: str, headers: Optional[Dict[str, str]] = None) -> str:
+        """
+        Fetch a text body (file content, README) through the shared client.
+
+        Args:
+            url: URL to fetch
+            headers: Optional HTTP headers dictionary
+
+        Returns:
+            Body text limited to MAX_CONTENT_CHARS, or empty string on any error
+            (a missing file must not fail the whole search)
+        """
+        # Guard clause: return empty for invalid URL
+        if not url:
+            return ""
+
+        try:
+            response = self.http_client.get(url, headers=headers, timeout_seconds=self.timeout_seconds)
+            return response.text()[:MAX_CONTENT_CHARS]
+        except Exception:
+            return ""
+
+    def _map_concurrently(self, func: Callable[[T], R], items: List[T]) -> List[R]:
+        """
+        Apply func to items on a bounded thread pool, preserving order.
+
+        WHY: Searches per technology and per-result downloads are independent
+             network round-trips; issuing them together hides latency.
+
+        Args:
+            func: Function to apply (exceptions propagate to the caller)
+            items: Inputs
+
+        Returns:
+            Results in the same order as items
+        """
+        # Guard clause: no pool needed for zero or one item
+        if len(items) <= 1:
+            return [func(item) for item in items]
+
+        workers = min(len(items), self.max_fetch_workers)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"research-{self.get_source_name()}") as executor:
+            return list(executor.map(func, items))
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Local Code Index
+
+WHY: Local research used to walk every search path with rglob() on each query,
+truncate to the first 20 files before checking relevance, then substring-match
+contents. That is slow on large trees and misses the best examples. A persistent
+BM25 inverted index answers queries in milliseconds across the whole tree.
+
+RESPONSIBILITY: Maintains an on-disk inverted index over source files:
+- Tokenize identifiers (snake_case / camelCase split into sub-tokens)
+- Invalidate per file by (mtime, size) and update incrementally
+- Rank documents with Okapi BM25
+- Persist to a JSON file keyed by the set of indexed roots
+
+PATTERNS:
+- Repository Pattern: Index persistence hidden behind load/save
+- Guard Clause Pattern: Early returns for invalid input
+- Incremental Update: Only changed files are re-tokenized
+"""
+
+import hashlib
+import json
+import math
+import os
+import re
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_INDEX_DIR = "../../.artemis_data/research_index"
+
+INDEX_FORMAT_VERSION = 1
+
+# Directories that never contain useful examples (hidden directories are skipped too)
+SKIPPED_DIRECTORIES = frozenset({
+    ".git", ".hg", ".svn", "__pycache__", "node_modules", ".venv", "venv",
+    ".mypy_cache", ".pytest_cache", ".tox", "build", "dist", ".artemis_data",
+})
+
+IDENTIFIER_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+CAMEL_BOUNDARY_PATTERN = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+")
+
+# Path tokens (file and directory names) describe intent well - weight them up
+PATH_TOKEN_WEIGHT = 3
+
+MAX_INDEXED_FILE_BYTES = 1_000_000
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase search tokens.
+
+    Each identifier contributes itself plus its snake_case/camelCase parts, so
+    "parseHttpRequest" matches queries for "parse", "http" or "request".
+
+    Args:
+        text: Source text or query
+
+    Returns:
+        List of tokens (with repetition, for term frequencies)
+    """
+    tokens: List[str] = []
+    for identifier in IDENTIFIER_PATTERN.findall(text):
+        lowered = identifier.lower()
+        parts = [
+            part.lower()
+            for chunk in identifier.split("_") if chunk
+            for part in CAMEL_BOUNDARY_PATTERN.findall(chunk)
+        ]
+        tokens.extend(part for part in parts if len(part) > 1)
+        if len(parts) != 1 and len(lowered.strip("_")) > 1:
+            tokens.append(lowered)
+    return tokens
+
+
+class LocalCodeIndex:
+    """
+    Persistent BM25 inverted index over a set of directory roots.
+
+    Documents are stored as per-file term frequencies; postings are rebuilt in
+    memory on load. Refreshing re-stats the tree but only re-reads files whose
+    mtime or size changed, and is throttled by refresh_interval_seconds.
+    """
+
+    def __init__(
+        self,
+        roots: Iterable[str],
+        extensions: Iterable[str],
+        index_dir: Optional[str] = None,
+        refresh_interval_seconds: float = 5.0,
+        k1: float = 1.5,
+        b: float = 0.75
+    ):
+        """
+        Initialize index (loads the persisted state if present).
+
+        Args:
+            roots: Directories to index
+            extensions: File suffixes to index (e.g. [".py", ".js"])
+            index_dir: Where to persist the index (default: ARTEMIS_RESEARCH_INDEX_DIR)
+            refresh_interval_seconds: Minimum time between filesystem rescans
+            k1: BM25 term-frequency saturation
+            b: BM25 length normalization
+        """
+        resolved = sorted({str(Path(root).resolve()) for root in roots})
+        # Nested roots (".", "src") would index the same files twice
+        self.roots = [
+            root for root in resolved
+            if not any(root.startswith(other + os.sep) for other in resolved if other != root)
+        ]
+        self.extensions = frozenset(extensions)
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.k1 = k1
+        self.b = b
+
+        index_dir = index_dir or os.getenv("ARTEMIS_RESEARCH_INDEX_DIR", DEFAULT_INDEX_DIR)
+        if not os.path.isabs(index_dir):
+            index_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), index_dir)
+        roots_digest = hashlib.sha1("\n".join(self.roots).encode("utf-8")).hexdigest()[:16]
+        self.index_path = Path(index_dir) / f"code_index_{roots_digest}.json"
+
+        self._lock = threading.RLock()
+        self._documents: Dict[str, Dict] = {}
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._total_length = 0
+        self._last_refresh = 0.0
+
+        self._load()
+
+    # ------------------------------------------------------------------ persistence
+
+    def _load(self) -> None:
+        """Load persisted documents; a missing or stale file just means a cold index"""
+        if not self.index_path.exists():
+            return
+
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+
+        if data.get("version") != INDEX_FORMAT_VERSION:
+            return
+
+        for path, doc in data.get("documents", {}).items():
+            self._add_document(path, doc)
+
+    def _save(self) -> None:
+        """Atomically persist documents (write temp file, then rename)"""
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"version": INDEX_FORMAT_VERSION, "roots": self.roots, "documents": self._documents}
+        temp_path = self.index_path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        os.replace(temp_path, self.index_path)
+
+    # ------------------------------------------------------------------ maintenance
+
+    def _add_document(self, path: str, doc: Dict) -> None:
+        self._documents[path] = doc
+        self._total_length += doc["length"]
+        for term, count in doc["tf"].items():
+            self._postings.setdefault(term, {})[path] = count
+
+    def _remove_document(self, path: str) -> None:
+        doc = self._documents.pop(path, None)
+        if doc is None:
+            return
+
+        self._total_length -= doc["length"]
+        for term in doc["tf"]:
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(path, None)
+            if not postings:
+                del self._postings[term]
+
+    def _iter_source_files(self) -> Iterable[Tuple[str, os.stat_result]]:
+        """Walk roots, pruning skipped directories, yielding (path, stat)"""
+        for root in self.roots:
+            if not os.path.isdir(root):
+                continue
+
+            for dirpath, dirnames, filenames in os.walk(root):
+                dirnames[:] = [
+                    d for d in dirnames
+                    if d not in SKIPPED_DIRECTORIES and not d.startswith(".")
+                ]
+                for filename in filenames:
+                    if os.path.splitext(filename)[1] not in self.extensions:
+                        continue
+                    path = os.path.join(dirpath, filename)
+                    try:
+                        yield path, os.stat(path)
+                    except OSError:
+                        continue
+
+    def _build_document(self, path: str, stat: os.stat_result) -> Optional[Dict]:
+        if stat.st_size > MAX_INDEXED_FILE_BYTES:
+            return None
+
+        try:
+            content = Path(path).read_text(encoding="utf-8", errors="ignore")
+        except OSError:
+            return None
+
+        counts = Counter(tokenize(content))
+        relative_parts = Path(path).parts[-3:]
+        for token in tokenize(" ".join(Path(part).stem for part in relative_parts)):
+            counts[token] += PATH_TOKEN_WEIGHT
+
+        return {
+            "mtime": stat.st_mtime,
+            "size": stat.st_size,
+            "length": sum(counts.values()),
+            "tf": dict(counts),
+        }
+
+    def refresh(self, force: bool = False) -> Dict[str, int]:
+        """
+        Bring the index up to date with the filesystem.
+
+        Args:
+            force: Ignore the refresh throttle
+
+        Returns:
+            Counts of added, updated and removed documents
+        """
+        with self._lock:
+            now = time.monotonic()
+            if not force and self._last_refresh and now - self._last_refresh < self.refresh_interval_seconds:
+                return {"added": 0, "updated": 0, "removed": 0}
+            self._last_refresh = now
+
+            stats = {"added": 0, "updated": 0, "removed": 0}
+            seen = set()
+
+            for path, stat in self._iter_source_files():
+                seen.add(path)
+                existing = self._documents.get(path)
+                if existing and existing["mtime"] == stat.st_mtime and existing["size"] == stat.st_size:
+                    continue
+
+                doc = self._build_document(path, stat)
+                self._remove_document(path)
+                if doc is None:
+                    continue
+
+                self._add_document(path, doc)
+                stats["updated" if existing else "added"] += 1
+
+            for path in [p for p in self._documents if p not in seen]:
+                self._remove_document(path)
+                stats["removed"] += 1
+
+            if any(stats.values()):
+                self._save()
+
+            return stats
+
+    # ------------------------------------------------------------------ queries
+
+    def search(
+        self,
+        query: str,
+        extensions: Optional[Iterable[str]] = None,
+        top_k: int = 5
+    ) -> List[Tuple[str, float, float]]:
+        """
+        Rank indexed files against a query with BM25.
+
+        Args:
+            query: Free-text query
+            extensions: Restrict results to these suffixes (None = all indexed)
+            top_k: Number of results
+
+        Returns:
+            List of (path, bm25_score, query_term_coverage) sorted by score
+        """
+        query_terms = sorted(set(tokenize(query)))
+        if not query_terms or top_k <= 0:
+            return []
+
+        allowed = frozenset(extensions) if extensions else None
+
+        with self._lock:
+            document_count = len(self._documents)
+            if document_count == 0:
+                return []
+
+            average_length = self._total_length / document_count
+            scores: Dict[str, float] = {}
+            matched_terms: Counter = Counter()
+
+            for term in query_terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+
+                idf = math.log(1 + (document_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for path, tf in postings.items():
+                    if allowed is not None and os.path.splitext(path)[1] not in allowed:
+                        continue
+                    length_norm = 1 - self.b + self.b * self._documents[path]["length"] / average_length
+                    scores[path] = scores.get(path, 0.0) + idf * tf * (self.k1 + 1) / (tf + self.k1 * length_norm)
+                    matched_terms[path] += 1
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:top_k]
+        return [(path, score, matched_terms[path] / len(query_terms)) for path, score in ranked]
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+
+__all__ = ["LocalCodeIndex", "tokenize"]
@@ -7,8 +7,8 @@ examples from public repositories. Leverages GitHub's code search API for findin
 relevant examples based on technologies and queries.
 
 RESPONSIBILITY: Handles all GitHub-specific research operations:
-- Search GitHub code repositories via REST API
-- Fetch raw file contents from repositories
+- Search GitHub code repositories via REST API (one query per technology, concurrently)
+- Fetch raw file contents from repositories concurrently over the shared keep-alive pool
 - Convert GitHub API responses to ResearchExample objects
 - Score and rank results by relevance
 
@@ -19,8 +19,7 @@ PATTERNS:
 """
 
 import urllib.parse
-import urllib.request
-from typing import List
+from typing import List, Optional
 
 from research_exceptions import ResearchSourceError
 from research.base_strategy import ResearchStrategy
@@ -69,11 +68,11 @@ class GitHubResearchStrategy(ResearchStrategy):
         # Calculate results per query
         results_per_query = max(1, max_results // len(queries) + 1)
 
-        # Search each query and collect results (list comprehension - no nested loops)
-        all_results = [
-            self._search_github_code(q, results_per_query)
-            for q in queries
-        ]
+        # Search all queries concurrently (results keep query order)
+        all_results = self._map_concurrently(
+            lambda q: self._search_github_code(q, results_per_query),
+            queries
+        )
 
         # Flatten results (list comprehension - no nested loops)
         examples = [example for results in all_results for example in results]
@@ -110,10 +109,15 @@ class GitHubResearchStrategy(ResearchStrategy):
             # Fetch data using base class method
             data = self._fetch_url(url, headers)
 
-            # Convert to ResearchExample objects (list comprehension)
+            # Download all file bodies concurrently, then build examples
+            items = data.get('items', [])
+            contents = self._map_concurrently(
+                lambda item: self._fetch_file_content(item.get('url', '')),
+                items
+            )
             return [
-                self._create_example_from_item(item)
-                for item in data.get('items', [])
+                self._create_example_from_item(item, content)
+                for item, content in zip(items, contents)
             ]
 
         except ResearchSourceError:
@@ -126,12 +130,13 @@ class GitHubResearchStrategy(ResearchStrategy):
                 cause=e
             )
 
-    def _create_example_from_item(self, item: dict) -> ResearchExample:
+    def _create_example_from_item(self, item: dict, content: Optional[str] = None) -> ResearchExample:
         """
         Create ResearchExample from GitHub API item.
 
         Args:
             item: GitHub API response item dictionary
+            content: Pre-fetched file content (fetched here if None)
 
         Returns:
             ResearchExample object with GitHub data
@@ -139,9 +144,9 @@ class GitHubResearchStrategy(ResearchStrategy):
         # Extract repository name for tags
         repo_name = item.get('repository', {}).get('name', '')
 
-        # Fetch file content
-        file_url = item.get('url', '')
-        content = self._fetch_file_content(file_url)
+        # Fetch file content unless it was fetched in bulk
+        if content is None:
+            content = self._fetch_file_content(item.get('url', ''))
 
         return ResearchExample(
             title=item.get('name', 'Unknown'),
@@ -163,22 +168,9 @@ class GitHubResearchStrategy(ResearchStrategy):
         Returns:
             File content as string (limited to 5000 chars), or empty string on error
         """
-        # Guard clause: return empty for invalid URL
-        if not url:
-            return ""
-
-        try:
-            # Request raw content
-            headers = {
-                "Accept": "application/vnd.github.v3.raw",
-                "User-Agent": "Artemis-Research-Agent"
-            }
-
-            request = urllib.request.Request(url, headers=headers)
-            with urllib.request.urlopen(request, timeout=self.timeout_seconds) as response:
-                # Limit content size to prevent memory issues
-                return response.read().decode('utf-8', errors='ignore')[:5000]
-
-        except Exception:
-            # Return empty string on any error (don't fail the whole search)
-            return ""
+        # Request raw content (cached on disk, revalidated with ETag)
+        headers = {
+            "Accept": "application/vnd.github.v3.raw",
+            "User-Agent": "Artemis-Research-Agent"
+        }
+        return self._fetch_text(url, headers)
@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+Research HTTP Client
+
+WHY: Research strategies fetched every search result and file body one by one with
+urllib, opening a new TCP/TLS connection per request and never caching anything.
+Researching similar cards repeated the same downloads every time.
+
+RESPONSIBILITY: Provides HTTP GET for research strategies with:
+- Keep-alive connection pool shared across threads (per scheme/host/port)
+- On-disk response cache with TTL
+- ETag / Last-Modified revalidation of stale entries (304 reuses cached body)
+
+PATTERNS:
+- Object Pool Pattern: Reusable keep-alive connections
+- Proxy Pattern: Cache sits in front of the network transparently
+- Singleton Pattern: One shared client per process (get_http_client)
+- Guard Clause Pattern: Early returns for cache hits
+"""
+
+import hashlib
+import http.client
+import json
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Deque, Dict, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+DEFAULT_CACHE_DIR = "../../.artemis_data/research_http_cache"
+DEFAULT_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+MAX_REDIRECTS = 5
+
+ConnectionKey = Tuple[str, str, int]
+
+
+class HTTPRequestError(OSError):
+    """Raised when a request returns an error status"""
+
+    def __init__(self, url: str, status: int, reason: str = ""):
+        self.url = url
+        self.status = status
+        super().__init__(f"HTTP {status} {reason} for {url}".strip())
+
+
+@dataclass
+class HTTPResponse:
+    """Fully-read HTTP response"""
+    url: str
+    status: int
+    body: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+    from_cache: bool = False
+
+    def text(self) -> str:
+        return self.body.decode("utf-8", errors="ignore")
+
+    def json(self):
+        return json.loads(self.body.decode("utf-8"))
+
+
+class HTTPResponseCache:
+    """
+    On-disk cache of successful GET responses.
+
+    Each entry is a metadata JSON file plus a body file, named by the SHA-256 of
+    the URL and the Accept header (the same URL can serve JSON or raw content).
+    Writes are atomic (temp file + rename) so concurrent workers never read a
+    half-written entry.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, ttl_seconds: Optional[float] = None):
+        """
+        Args:
+            cache_dir: Cache directory (default: ARTEMIS_RESEARCH_CACHE_DIR)
+            ttl_seconds: Freshness lifetime (default: ARTEMIS_RESEARCH_CACHE_TTL or 24h)
+        """
+        cache_dir = cache_dir or os.getenv("ARTEMIS_RESEARCH_CACHE_DIR", DEFAULT_CACHE_DIR)
+        if not os.path.isabs(cache_dir):
+            cache_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), cache_dir)
+        self.cache_dir = Path(cache_dir)
+
+        if ttl_seconds is None:
+            ttl_seconds = float(os.getenv("ARTEMIS_RESEARCH_CACHE_TTL", DEFAULT_CACHE_TTL_SECONDS))
+        self.ttl_seconds = ttl_seconds
+
+    def _key(self, url: str, accept: str) -> str:
+        return hashlib.sha256(f"{url}\n{accept}".encode("utf-8")).hexdigest()
+
+    def _paths(self, key: str) -> Tuple[Path, Path]:
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.body"
+
+    def get(self, url: str, accept: str = "") -> Optional[Tuple[Dict, bytes]]:
+        """
+        Look up a cached response.
+
+        Returns:
+            (metadata, body) or None; metadata has etag, last_modified, fetched_at
+        """
+        meta_path, body_path = self._paths(self._key(url, accept))
+        try:
+            metadata = json.loads(meta_path.read_text(encoding="utf-8"))
+            return metadata, body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+
+    def is_fresh(self, metadata: Dict) -> bool:
+        return time.time() - metadata.get("fetched_at", 0) < self.ttl_seconds
+
+    def put(self, url: str, accept: str, response: HTTPResponse) -> None:
+        """Store a response (body first, metadata last, so metadata implies a body)"""
+        meta_path, body_path = self._paths(self._key(url, accept))
+        metadata = {
+            "url": url,
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+            "fetched_at": time.time(),
+        }
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._write_atomic(body_path, response.body)
+            self._write_atomic(meta_path, json.dumps(metadata).encode("utf-8"))
+        except OSError:
+            # Caching is best-effort - never fail a fetch because the disk is full
+            pass
+
+    def touch(self, url: str, accept: str) -> None:
+        """Mark an entry fresh again after a 304 revalidation"""
+        cached = self.get(url, accept)
+        if cached is None:
+            return
+
+        metadata, _ = cached
+        metadata["fetched_at"] = time.time()
+        meta_path, _ = self._paths(self._key(url, accept))
+        try:
+            self._write_atomic(meta_path, json.dumps(metadata).encode("utf-8"))
+        except OSError:
+            pass
+
+    def _write_atomic(self, path: Path, data: bytes) -> None:
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        temp_path.write_bytes(data)
+        os.replace(temp_path, path)
+
+
+class PooledHTTPClient:
+    """
+    Thread-safe HTTP GET client with keep-alive connection pooling and caching.
+
+    Connections are checked out per request and returned once the response has
+    been fully read, so concurrent fetches against the same host reuse up to
+    max_connections_per_host sockets instead of opening one per file.
+    """
+
+    def __init__(
+        self,
+        timeout_seconds: float = 30,
+        max_connections_per_host: int = 8,
+        cache: Optional[HTTPResponseCache] = None
+    ):
+        """
+        Args:
+            timeout_seconds: Socket timeout per request
+            max_connections_per_host: Idle connections kept per host
+            cache: Response cache (None disables caching)
+        """
+        self.timeout_seconds = timeout_seconds
+        self.max_connections_per_host = max_connections_per_host
+        self.cache = cache
+
+        self._pool: Dict[ConnectionKey, Deque[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "cache_hits": 0, "revalidated": 0, "connections_opened": 0}
+
+    # ------------------------------------------------------------------ public API
+
+    def get(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        use_cache: bool = True,
+        timeout_seconds: Optional[float] = None
+    ) -> HTTPResponse:
+        """
+        GET a URL, serving from cache when fresh and revalidating when stale.
+
+        Args:
+            url: Absolute http(s) URL
+            headers: Request headers
+            use_cache: Set False to bypass the cache for this request
+            timeout_seconds: Socket timeout for this request (default: client timeout)
+
+        Returns:
+            HTTPResponse with the full body
+
+        Raises:
+            HTTPRequestError: For 4xx/5xx responses
+            OSError / http.client.HTTPException: For transport failures
+        """
+        headers = dict(headers or {})
+        accept = headers.get("Accept", "")
+        cache = self.cache if use_cache else None
+
+        cached = cache.get(url, accept) if cache else None
+        if cached and cache.is_fresh(cached[0]):
+            self._count("cache_hits")
+            return HTTPResponse(url=url, status=200, body=cached[1], from_cache=True)
+
+        if cached:
+            metadata = cached[0]
+            if metadata.get("etag"):
+                headers["If-None-Match"] = metadata["etag"]
+            if metadata.get("last_modified"):
+                headers["If-Modified-Since"] = metadata["last_modified"]
+
+        response = self._request_following_redirects(url, headers, timeout_seconds or self.timeout_seconds)
+
+        if response.status == 304 and cached:
+            self._count("revalidated")
+            cache.touch(url, accept)
+            return HTTPResponse(url=url, status=200, body=cached[1], headers=response.headers, from_cache=True)
+
+        if response.status >= 400:
+            raise HTTPRequestError(url, response.status)
+
+        if cache and response.status == 200:
+            cache.put(url, accept, response)
+
+        return response
+
+    def close(self) -> None:
+        """Close all idle pooled connections"""
+        with self._lock:
+            pools, self._pool = self._pool, {}
+        for connections in pools.values():
+            for connection in connections:
+                connection.close()
+
+    # ------------------------------------------------------------------ internals
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            self.stats[stat] += 1
+
+    def _request_following_redirects(self, url: str, headers: Dict[str, str], timeout: float) -> HTTPResponse:
+        for _ in range(MAX_REDIRECTS + 1):
+            response = self._request(url, headers, timeout)
+            location = response.headers.get("location")
+            if response.status not in REDIRECT_STATUSES or not location:
+                return response
+            url = urljoin(url, location)
+        raise HTTPRequestError(url, 310, "Too many redirects")
+
+    def _request(self, url: str, headers: Dict[str, str], timeout: float) -> HTTPResponse:
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"Unsupported URL: {url}")
+
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        key: ConnectionKey = (parts.scheme, parts.hostname, port)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+
+        self._count("requests")
+        connection, reused = self._checkout(key)
+        try:
+            return self._send(connection, key, url, path, headers, timeout)
+        except (http.client.HTTPException, ConnectionError):
+            connection.close()
+            if not reused:
+                raise
+            # Server closed an idle keep-alive socket - retry once on a fresh one
+            connection = self._open(key)
+            try:
+                return self._send(connection, key, url, path, headers, timeout)
+            except Exception:
+                connection.close()
+                raise
+        except Exception:
+            connection.close()
+            raise
+
+    def _send(
+        self,
+        connection: http.client.HTTPConnection,
+        key: ConnectionKey,
+        url: str,
+        path: str,
+        headers: Dict[str, str],
+        timeout: float
+    ) -> HTTPResponse:
+        connection.timeout = timeout
+        if connection.sock is not None:
+            connection.sock.settimeout(timeout)
+
+        connection.request("GET", path, headers=headers)
+        raw = connection.getresponse()
+        body = raw.read()
+        response_headers = {name.lower(): value for name, value in raw.getheaders()}
+
+        if raw.will_close:
+            connection.close()
+        else:
+            self._checkin(key, connection)
+
+        return HTTPResponse(url=url, status=raw.status, body=body, headers=response_headers)
+
+    def _checkout(self, key: ConnectionKey) -> Tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._pool.get(key)
+            if idle:
+                return idle.pop(), True
+        return self._open(key), False
+
+    def _checkin(self, key: ConnectionKey, connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._pool.setdefault(key, deque())
+            if len(idle) < self.max_connections_per_host:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def _open(self, key: ConnectionKey) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        self._count("connections_opened")
+        connection_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return connection_class(host, port, timeout=self.timeout_seconds)
+
+
+_shared_client: Optional[PooledHTTPClient] = None
+_shared_client_lock = threading.Lock()
+
+
+def get_http_client() -> PooledHTTPClient:
+    """
+    Get the process-wide research HTTP client.
+
+    WHY: Sharing one client shares its keep-alive pool and cache across all
+         strategies and research runs.
+    """
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = PooledHTTPClient(cache=HTTPResponseCache())
+        return _shared_client
+
+
+__all__ = [
+    "HTTPRequestError",
+    "HTTPResponse",
+    "HTTPResponseCache",
+    "PooledHTTPClient",
+    "get_http_client",
+]
@@ -7,8 +7,8 @@ of machine learning models, datasets, and related code examples. Focuses on AI/M
 use cases and pre-trained models.
 
 RESPONSIBILITY: Handles all HuggingFace-specific research operations:
-- Search HuggingFace Hub models via REST API
-- Fetch model README files for documentation
+- Search HuggingFace Hub models via REST API (one query per technology, concurrently)
+- Fetch model README files concurrently over the shared keep-alive pool
 - Convert HuggingFace API responses to ResearchExample objects
 - Score results by popularity (downloads)
 
@@ -19,8 +19,7 @@ PATTERNS:
 """
 
 import urllib.parse
-import urllib.request
-from typing import List
+from typing import List, Optional
 
 from research_exceptions import ResearchSourceError
 from research.base_strategy import ResearchStrategy
@@ -69,11 +68,11 @@ class HuggingFaceResearchStrategy(ResearchStrategy):
         # Calculate results per query
         results_per_query = max(1, max_results // len(queries) + 1)
 
-        # Search each query (list comprehension - no nested loops)
-        all_results = [
-            self._search_huggingface(q, results_per_query)
-            for q in queries
-        ]
+        # Search all queries concurrently (results keep query order)
+        all_results = self._map_concurrently(
+            lambda q: self._search_huggingface(q, results_per_query),
+            queries
+        )
 
         # Flatten results (list comprehension)
         examples = [example for results in all_results for example in results]
@@ -104,10 +103,15 @@ class HuggingFaceResearchStrategy(ResearchStrategy):
             # Fetch data using base class method
             data = self._fetch_url(url)
 
-            # Convert to ResearchExample objects (list comprehension)
+            # Download all READMEs concurrently, then build examples
+            models = data[:limit]
+            readmes = self._map_concurrently(
+                lambda model: self._fetch_readme(model.get('modelId', '')),
+                models
+            )
             return [
-                self._create_example_from_model(model)
-                for model in data[:limit]
+                self._create_example_from_model(model, readme)
+                for model, readme in zip(models, readmes)
             ]
 
         except ResearchSourceError:
@@ -120,20 +124,22 @@ class HuggingFaceResearchStrategy(ResearchStrategy):
                 cause=e
             )
 
-    def _create_example_from_model(self, model: dict) -> ResearchExample:
+    def _create_example_from_model(self, model: dict, readme_content: Optional[str] = None) -> ResearchExample:
         """
         Create ResearchExample from HuggingFace model data.
 
         Args:
             model: HuggingFace API response model dictionary
+            readme_content: Pre-fetched README (fetched here if None)
 
         Returns:
             ResearchExample object with HuggingFace data
         """
         model_id = model.get('modelId', '')
 
-        # Fetch README content
-        readme_content = self._fetch_readme(model_id)
+        # Fetch README content unless it was fetched in bulk
+        if readme_content is None:
+            readme_content = self._fetch_readme(model_id)
 
         # Calculate relevance score from downloads (normalize to 0-1 range)
         downloads = model.get('downloads', 0)
@@ -163,15 +169,6 @@ class HuggingFaceResearchStrategy(ResearchStrategy):
         if not model_id:
             return ""
 
-        try:
-            # Construct URL to raw README
-            url = f"https://huggingface.co/{model_id}/raw/main/README.md"
-
-            request = urllib.request.Request(url)
-            with urllib.request.urlopen(request, timeout=self.timeout_seconds) as response:
-                # Limit content size to prevent memory issues
-                return response.read().decode('utf-8', errors='ignore')[:5000]
-
-        except Exception:
-            # Return empty string on any error (don't fail the whole search)
-            return ""
+        # Construct URL to raw README (cached on disk, revalidated with ETag)
+        url = f"https://huggingface.co/{model_id}/raw/main/README.md"
+        return self._fetch_text(url)
@@ -7,7 +7,7 @@ examples from project files. Useful for finding existing patterns and examples w
 the current codebase without making external API calls.
 
 RESPONSIBILITY: Handles all local filesystem research operations:
-- Search local directories for matching files
+- Search local directories through a persistent BM25 index (research.code_index)
 - Filter files by extension based on technology
 - Calculate relevance scores based on query matches
 - Convert file contents to ResearchExample objects
@@ -17,34 +17,101 @@ PATTERNS:
 - Guard Clause Pattern: Early returns for validation (max 1 level nesting)
 - Dispatch Table Pattern: Technology to extension mapping via dictionary
 - LRU Cache: Cache extension mapping for performance
+- Registry Pattern: One shared index per set of search paths
 """
 
+import threading
 from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from research.base_strategy import ResearchStrategy
+from research.code_index import LocalCodeIndex
 from research.models import ResearchExample
 
 
+# Dispatch table: technology -> extensions mapping
+EXTENSION_MAP: Dict[str, List[str]] = {
+    "python": [".py", ".ipynb"],
+    "javascript": [".js", ".jsx", ".ts", ".tsx"],
+    "java": [".java"],
+    "rust": [".rs"],
+    "go": [".go"],
+    "ruby": [".rb"],
+    "php": [".php"],
+    "c++": [".cpp", ".hpp", ".cc", ".h"],
+    "c": [".c", ".h"],
+}
+
+DEFAULT_EXTENSIONS = [".py", ".js", ".java"]
+
+# Every extension we may ever be asked for - the index covers all of them once
+INDEXED_EXTENSIONS = frozenset(
+    ext for extensions in EXTENSION_MAP.values() for ext in extensions
+)
+
+# Indexes shared by all strategy instances, keyed by (search paths, extra extensions)
+_INDEX_REGISTRY: Dict[Tuple[Tuple[str, ...], frozenset], LocalCodeIndex] = {}
+_INDEX_REGISTRY_LOCK = threading.Lock()
+
+
+def get_code_index(
+    search_paths: List[str],
+    extensions: Optional[List[str]] = None,
+    index_dir: Optional[str] = None
+) -> LocalCodeIndex:
+    """
+    Get the shared index for a set of search paths.
+
+    Strategies are created per research run; sharing the index keeps postings
+    warm in memory so only changed files are re-read between runs.
+
+    Args:
+        search_paths: Directories to index
+        extensions: Extra extensions beyond INDEXED_EXTENSIONS
+        index_dir: Override for the on-disk index location
+
+    Returns:
+        LocalCodeIndex instance
+    """
+    roots = tuple(sorted(str(Path(path).resolve()) for path in search_paths))
+    indexed = INDEXED_EXTENSIONS | frozenset(extensions or [])
+    key = (roots, indexed)
+
+    with _INDEX_REGISTRY_LOCK:
+        index = _INDEX_REGISTRY.get(key)
+        if index is None:
+            index = LocalCodeIndex(roots, indexed, index_dir=index_dir)
+            _INDEX_REGISTRY[key] = index
+        return index
+
+
 class LocalExamplesResearchStrategy(ResearchStrategy):
     """
     Research strategy for local filesystem.
 
     Searches local directories for code examples matching the query and technologies.
-    Uses file extensions to filter by language and content matching for relevance.
+    Uses file extensions to filter by language and a BM25 inverted index for ranking,
+    so the true top-k across the whole tree is returned.
     """
 
-    def __init__(self, search_paths: Optional[List[str]] = None, timeout_seconds: int = 30):
+    def __init__(
+        self,
+        search_paths: Optional[List[str]] = None,
+        timeout_seconds: int = 30,
+        index_dir: Optional[str] = None
+    ):
         """
         Initialize with search paths.
 
         Args:
             search_paths: Directories to search (default: current, src, examples)
             timeout_seconds: Timeout (not used for local search, but included for consistency)
+            index_dir: Where to persist the code index (default: ARTEMIS_RESEARCH_INDEX_DIR)
         """
         super().__init__(timeout_seconds)
         self.search_paths = search_paths or [".", "src", "examples"]
+        self.index_dir = index_dir
 
     def get_source_name(self) -> str:
         """
@@ -60,12 +127,12 @@ class LocalExamplesResearchStrategy(ResearchStrategy):
         Search local filesystem for code examples.
 
         Args:
-            query: Search query to match against filenames and paths
+            query: Search query to match against identifiers, filenames and paths
             technologies: List of technologies to determine file extensions
             max_results: Maximum results to return
 
         Returns:
-            List of ResearchExample objects sorted by relevance score
+            List of ResearchExample objects sorted by BM25 score
         """
         # Guard clause: validate query
         if not query:
@@ -74,58 +141,31 @@ class LocalExamplesResearchStrategy(ResearchStrategy):
         # Get file extensions for technologies
         extensions = self._get_extensions_for_technologies(tuple(technologies))
 
-        # Collect files from all search paths
-        files = self._collect_files_from_paths(extensions)
-
-        # Filter by query and create examples
-        examples = self._create_matching_examples(files, query)
-
-        # Sort by relevance and limit
-        examples.sort(key=lambda x: x.relevance_score, reverse=True)
-        return examples[:max_results]
-
-    def _collect_files_from_paths(self, extensions: List[str]) -> List[Path]:
-        """
-        Collect files from all search paths.
+        # Bring the index up to date (only changed files are re-read)
+        index = self._get_index(extensions)
+        index.refresh()
 
-        Args:
-            extensions: File extensions to search for
-
-        Returns:
-            List of file Path objects
-        """
-        # Filter to valid paths (guard clause via list comprehension)
-        valid_paths = [Path(path) for path in self.search_paths if Path(path).exists()]
-
-        # Guard clause: return empty if no valid paths
-        if not valid_paths:
-            return []
-
-        # Search each path (list comprehension - no nested loops)
-        all_files = [
-            self._find_files_in_path(path, extensions)
-            for path in valid_paths
+        # BM25 top-k over the whole tree, then load content for the winners only
+        hits = index.search(query, extensions=extensions, top_k=max_results)
+        return [
+            self._create_example_from_file(Path(path), query, coverage)
+            for path, _score, coverage in hits
         ]
 
-        # Flatten results (list comprehension)
-        return [f for file_list in all_files for f in file_list]
-
-    def _create_matching_examples(self, files: List[Path], query: str) -> List[ResearchExample]:
+    def _get_index(self, extensions: List[str]) -> LocalCodeIndex:
         """
-        Create examples from files that match query.
+        Get the shared code index for this strategy's valid search paths.
 
         Args:
-            files: List of file Path objects
-            query: Search query string
+            extensions: Extensions requested for this search
 
         Returns:
-            List of ResearchExample objects
+            LocalCodeIndex covering all existing search paths
         """
-        # Filter matching files (list comprehension)
-        matching_files = [f for f in files if self._file_matches_query(f, query)]
-
-        # Convert to examples (list comprehension)
-        return [self._create_example_from_file(f, query) for f in matching_files]
+        # Filter to valid paths (guard clause via list comprehension)
+        valid_paths = [path for path in self.search_paths if Path(path).is_dir()]
+        custom_extensions = [ext for ext in extensions if ext not in INDEXED_EXTENSIONS]
+        return get_code_index(valid_paths, custom_extensions, index_dir=self.index_dir)
 
     @lru_cache(maxsize=128)
     def _get_extensions_for_technologies(self, technologies_tuple: tuple) -> List[str]:
@@ -143,80 +183,32 @@ class LocalExamplesResearchStrategy(ResearchStrategy):
         """
         # Guard clause: default extensions if no technologies
         if not technologies_tuple:
-            return [".py", ".js", ".java"]
-
-        # Dispatch table: technology -> extensions mapping
-        extension_map = {
-            "python": [".py", ".ipynb"],
-            "javascript": [".js", ".jsx", ".ts", ".tsx"],
-            "java": [".java"],
-            "rust": [".rs"],
-            "go": [".go"],
-            "ruby": [".rb"],
-            "php": [".php"],
-            "c++": [".cpp", ".hpp", ".cc", ".h"],
-            "c": [".c", ".h"],
-        }
+            return list(DEFAULT_EXTENSIONS)
 
         # Collect extensions for all technologies
         all_extensions = []
         for tech in technologies_tuple:
             tech_lower = tech.lower()
             # Use dispatch table, fallback to custom extension
-            tech_extensions = extension_map.get(tech_lower, [f".{tech}"])
+            tech_extensions = EXTENSION_MAP.get(tech_lower, [f".{tech}"])
             all_extensions.extend(tech_extensions)
 
         # Return collected extensions or defaults
-        return all_extensions if all_extensions else [".py", ".js", ".java"]
-
-    def _find_files_in_path(self, path: Path, extensions: List[str]) -> List[Path]:
-        """
-        Find files with given extensions in path.
-
-        Args:
-            path: Directory Path object to search
-            extensions: File extensions to find
-
-        Returns:
-            List of matching file Path objects (limited to 20 for performance)
-        """
-        # Guard clause: skip non-directories
-        if not path.is_dir():
-            return []
-
-        # Use list comprehension with combined conditions (no nested loops)
-        matching_files = [
-            f for f in path.rglob("*")
-            if f.is_file() and f.suffix in extensions
-        ]
-
-        # Limit results for performance
-        return matching_files[:20]
-
-    def _file_matches_query(self, file_path: Path, query: str) -> bool:
-        """
-        Check if file matches query.
-
-        Args:
-            file_path: File Path object
-            query: Search query string
-
-        Returns:
-            True if filename or parent directory contains query (case-insensitive)
-        """
-        query_lower = query.lower()
-        filename_match = query_lower in file_path.name.lower()
-        path_match = query_lower in str(file_path.parent).lower()
-
-        return filename_match or path_match
-
-    def _create_example_from_file(self, file_path: Path, query: str) -> ResearchExample:
+        return all_extensions if all_extensions else list(DEFAULT_EXTENSIONS)
+
+    def _create_example_from_file(
+        self,
+        file_path: Path,
+        query: str,
+        coverage: Optional[float] = None
+    ) -> ResearchExample:
         """
         Create ResearchExample from file.
 
         Args:
             file_path: File Path object
             query: Search query for relevance calculation
+            coverage: Fraction of query terms the index matched (computed from content if None)
 
         Returns:
             ResearchExample object with file content and metadata
@@ -225,8 +217,8 @@ class LocalExamplesResearchStrategy(ResearchStrategy):
             # Read file content (limited to 5000 chars)
             content = file_path.read_text(encoding='utf-8', errors='ignore')[:5000]
 
-            # Calculate relevance score
-            relevance = self._calculate_relevance(content, query)
+            # Calculate relevance score (index coverage covers the whole file, not just 5000 chars)
+            relevance = coverage if coverage is not None else self._calculate_relevance(content, query)
 
             return ResearchExample(
                 title=file_path.name,
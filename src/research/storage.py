@@ -7,7 +7,7 @@ PATTERNS: Strategy (storage operations)
 Storage module provides RAG persistence for research examples.
 """
 
-from typing import List
+from typing import Any, Dict, List
 from rag_agent import RAGAgent
 from research.models import ResearchExample
 from research_exceptions import ExampleStorageError
@@ -56,24 +56,8 @@ class ExampleStorage:
             ExampleStorageError: If storage fails
         """
         try:
-            # Prepare metadata
-            metadata = {
-                "source": example.source,
-                "url": example.url or "",
-                "language": example.language,
-                "tags": example.tags,
-                "relevance_score": example.relevance_score,
-                "example_type": "research"
-            }
-
             # Store in RAG
-            artifact_id = self.rag.store_artifact(
-                artifact_type=self.ARTIFACT_TYPE,
-                card_id=card_id,
-                task_title=f"{task_title} - {example.title}",
-                content=example.content,
-                metadata=metadata
-            )
+            artifact_id = self.rag.store_artifact(**self._artifact_fields(example, card_id, task_title))
 
             return artifact_id
 
@@ -84,6 +68,30 @@ class ExampleStorage:
                 cause=e
             )
 
+    def _artifact_fields(
+        self,
+        example: ResearchExample,
+        card_id: str,
+        task_title: str
+    ) -> Dict[str, Any]:
+        """Build store_artifact() keyword arguments for an example"""
+        metadata = {
+            "source": example.source,
+            "url": example.url or "",
+            "language": example.language,
+            "tags": example.tags,
+            "relevance_score": example.relevance_score,
+            "example_type": "research"
+        }
+
+        return {
+            "artifact_type": self.ARTIFACT_TYPE,
+            "card_id": card_id,
+            "task_title": f"{task_title} - {example.title}",
+            "content": example.content,
+            "metadata": metadata
+        }
+
     def store_batch(
         self,
         examples: List[ResearchExample],
@@ -94,7 +102,8 @@ class ExampleStorage:
         """
         Store multiple examples in batch.
 
-        WHY: Batch operations with partial failure tolerance.
+        WHY: One chunked RAG write per collection instead of a round-trip
+             per example, with partial failure tolerance.
 
         Args:
             examples: List of research examples
@@ -108,15 +117,26 @@ class ExampleStorage:
         Raises:
             ExampleStorageError: If error rate exceeds threshold
         """
-        artifact_ids = []
-        errors = []
+        # Guard clause - nothing to store
+        if not examples:
+            return []
+
+        items = [self._artifact_fields(example, card_id, task_title) for example in examples]
+
+        try:
+            result = self.rag.store_artifacts_batch(items)
+        except Exception as e:
+            raise ExampleStorageError(
+                artifact_id="batch",
+                message=f"Failed to store batch of {len(examples)} examples",
+                cause=e
+            )
 
-        for example in examples:
-            try:
-                artifact_id = self.store_single(example, card_id, task_title)
-                artifact_ids.append(artifact_id)
-            except ExampleStorageError as e:
-                errors.append(str(e))
+        errors = [
+            example.title
+            for example, artifact_id in zip(examples, result.artifact_ids)
+            if artifact_id is None
+        ]
 
         # Guard clause - raise if too many errors
         if len(errors) > len(examples) * error_threshold:
@@ -126,4 +146,4 @@ class ExampleStorage:
                 cause=Exception("; ".join(errors))
             )
 
-        return artifact_ids
+        return [artifact_id for artifact_id in result.artifact_ids if artifact_id is not None]
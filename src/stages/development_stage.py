@@ -269,9 +269,7 @@ CRITICAL INSTRUCTIONS FOR DEVELOPERS:
                     "developers": [r.get('developer', 'unknown') for r in developer_results]
                 })
 
-            # Track LLM costs for each developer
-            self.update_progress({"step": "tracking_llm_costs", "progress_percent": 50})
-            self._track_developer_llm_costs(developer_results, stage_name)
+            # LLM costs are recorded per call by the orchestrator's cost tracker hook
 
             # Execute developer code in sandbox (if supervisor has sandboxing enabled)
             self.update_progress({"step": "sandboxing_code", "progress_percent": 65})
@@ -369,38 +367,6 @@ CRITICAL INSTRUCTIONS FOR DEVELOPERS:
     def get_stage_name(self) -> str:
         return "development"
 
-    def _track_developer_llm_costs(self, developer_results: list, stage_name: str):
-        """Track LLM costs for each developer's work"""
-        # Early return: no supervisor available
-        if not self.supervisor:
-            return
-
-        for result in developer_results:
-            # Early return: skip if not successful or no tokens
-            if not result.get('success', False) or not result.get('tokens_used'):
-                continue
-
-            try:
-                tokens_used = result['tokens_used']
-                self.supervisor.track_llm_call(
-                    model=result.get('llm_model', 'gpt-4o'),
-                    provider=result.get('llm_provider', 'openai'),
-                    tokens_input=getattr(tokens_used, 'prompt_tokens', 0),
-                    tokens_output=getattr(tokens_used, 'completion_tokens', 0),
-                    stage=stage_name,
-                    purpose=result.get('developer', 'unknown')
-                )
-                self.logger.log(
-                    f"Tracked LLM cost for {result.get('developer')}",
-                    "INFO"
-                )
-            except Exception as e:
-                # Budget exceeded or other cost tracking error
-                self.logger.log(f"Cost tracking error: {e}", "ERROR")
-                # Early return: re-raise budget errors immediately
-                if "Budget" in str(e):
-                    raise
-
     def _handle_stage_failure(self, exception: Exception, stage_name: str, card_id: str):
         """Handle stage failure with supervisor recovery if available"""
         # Early return: no supervisor available
@@ -1,7 +1,8 @@
 from artemis_logger import get_logger
 logger = get_logger('example_searcher')
-'\nWHY: Orchestrate searching across multiple research sources\nRESPONSIBILITY: Search all sources and handle errors gracefully\nPATTERNS: Strategy (multiple sources), Fault Tolerance (continue on errors)\n\nExample searcher coordinates searches across GitHub, HuggingFace, and local\nsources, collecting examples while handling individual source failures.\n'
-from typing import List
+'\nWHY: Orchestrate searching across multiple research sources\nRESPONSIBILITY: Search all sources concurrently and handle errors gracefully\nPATTERNS: Strategy (multiple sources), Fault Tolerance (continue on errors), Deadline\n\nExample searcher coordinates searches across GitHub, HuggingFace, and local\nsources, collecting examples while handling individual source failures.\nSources are queried in parallel under one overall deadline; a slow source\ncosts at most the deadline instead of adding its latency to every other one.\n'
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import List, Optional
 from research_strategy import ResearchStrategy, ResearchExample
 from research_exceptions import ResearchSourceError
 
@@ -12,17 +13,21 @@ class ExampleSearcher:
     WHY: Research should check multiple sources for comprehensive results.
          Individual source failures shouldn't fail the entire search.
 
-    PATTERNS: Fault tolerance (continue on errors), No nested loops.
+    PATTERNS: Fault tolerance (continue on errors), No nested loops,
+              Fan-out with deadline (sources run in parallel).
     """
 
-    def __init__(self, max_examples_per_source: int=5):
+    def __init__(self, max_examples_per_source: int=5, deadline_seconds: Optional[float]=None):
         """
         Initialize example searcher.
 
         Args:
             max_examples_per_source: Max examples to retrieve per source
+            deadline_seconds: Overall time budget for all sources (None = wait for all)
         """
         self.max_examples_per_source = max_examples_per_source
+        self.deadline_seconds = deadline_seconds
+        self.last_timed_out_sources: List[str] = []
 
     def search_all_sources(self, strategies: List[ResearchStrategy], query: str, technologies: List[str]) -> List[ResearchExample]:
         """
@@ -41,12 +46,43 @@ class ExampleSearcher:
 
         Note:
             Errors in individual sources are caught and logged but don't fail
-            the entire search operation.
+            the entire search operation. Sources still running when the
+            deadline expires are skipped (recorded in last_timed_out_sources).
+        """
+        self.last_timed_out_sources = []
+        if len(strategies) <= 1 and self.deadline_seconds is None:
+            return [example for strategy in strategies for example in self._search_single_source(strategy, query, technologies)]
+        executor = ThreadPoolExecutor(max_workers=len(strategies), thread_name_prefix='research-source')
+        try:
+            futures = [executor.submit(self._search_single_source, strategy, query, technologies) for strategy in strategies]
+            wait(futures, timeout=self.deadline_seconds)
+            return self._collect_results(strategies, futures)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _collect_results(self, strategies: List[ResearchStrategy], futures: List[Future]) -> List[ResearchExample]:
+        """
+        Gather finished source results in strategy order.
+
+        WHY: Keeping the original source order keeps downstream ranking and
+             deduplication deterministic regardless of completion order.
+
+        Args:
+            strategies: Strategies that were searched
+            futures: Matching futures
+
+        Returns:
+            Examples from every source that finished before the deadline
         """
         all_examples = []
-        for strategy in strategies:
-            examples = self._search_single_source(strategy, query, technologies)
-            all_examples.extend(examples)
+        for strategy, future in zip(strategies, futures):
+            if not future.done():
+                source_name = self._get_source_name(strategy)
+                self.last_timed_out_sources.append(source_name)
+                
+                logger.log(f'Warning: {source_name} did not finish within {self.deadline_seconds}s deadline - skipped', 'INFO')
+                continue
+            all_examples.extend(future.result())
         return all_examples
 
     def _search_single_source(self, strategy: ResearchStrategy, query: str, technologies: List[str]) -> List[ResearchExample]:
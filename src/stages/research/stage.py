@@ -11,7 +11,7 @@ Pattern via stage notifications.
 
 from typing import Dict, Any, List, Optional
 
-from artemis_stages import PipelineStage
+from artemis_stage_interface import PipelineStage
 from rag_agent import RAGAgent
 from research_strategy import ResearchStrategyFactory, ResearchStrategy, ResearchExample
 from research_repository import ExampleRepository
@@ -51,7 +51,8 @@ class ResearchStage(PipelineStage):
             rag_agent: RAG agent for storage
             sources: List of research sources to use (default: all)
             max_examples_per_source: Max examples per source
-            timeout_seconds: Timeout for research operations
+            timeout_seconds: Timeout for research operations (also the overall
+                             deadline for the concurrent source fan-out)
         """
         self.rag = rag_agent
         self.sources = sources or ResearchStrategyFactory.get_available_sources()
@@ -59,7 +60,7 @@ class ResearchStage(PipelineStage):
 
         # Initialize components (Composition pattern)
         self.repository = ExampleRepository(rag_agent)
-        self.searcher = ExampleSearcher(max_examples_per_source)
+        self.searcher = ExampleSearcher(max_examples_per_source, deadline_seconds=timeout_seconds)
         self.storage = ExampleStorage(self.repository)
         self.formatter = SummaryFormatter()
 
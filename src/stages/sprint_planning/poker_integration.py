@@ -30,7 +30,8 @@ class PokerIntegration:
         poker_agents: List[str],
         team_velocity: float,
         observable: Optional[PipelineObservable] = None,
-        ai_service: Optional[Any] = None
+        ai_service: Optional[Any] = None,
+        rag: Optional[Any] = None
     ):
         """
         WHY: Need LLM client and config to run Planning Poker
@@ -42,6 +43,7 @@ class PokerIntegration:
             team_velocity: Team velocity for capacity calculation
             observable: Observer for real-time progress events
             ai_service: AI Query Service for intelligent estimation
+            rag: RAG agent for reusing past sprint_plan estimates
         """
         self.llm_client = llm_client
         self.logger = logger
@@ -49,6 +51,7 @@ class PokerIntegration:
         self.team_velocity = team_velocity
         self.observable = observable
         self.ai_service = ai_service
+        self.rag = rag
 
     def estimate_features(self, features: List[Feature]) -> List[FeatureEstimate]:
         """
@@ -76,7 +79,8 @@ class PokerIntegration:
                 logger=self.logger,
                 team_velocity=self.team_velocity,
                 observable=self.observable,
-                ai_service=self.ai_service
+                ai_service=self.ai_service,
+                rag=self.rag
             )
 
             # Convert features to dicts (Planning Poker expects dicts)
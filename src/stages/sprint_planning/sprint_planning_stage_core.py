@@ -131,7 +131,8 @@ class SprintPlanningStage(PipelineStage, SupervisedStageMixin, DebugMixin):
             self.planning_poker_agents,
             self.team_velocity,
             self.observable,
-            self.ai_service
+            self.ai_service,
+            self.rag
         )
 
         self.feature_prioritizer = FeaturePrioritizer(
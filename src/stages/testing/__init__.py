@@ -10,6 +10,8 @@ a unified interface.
 
 Architecture:
 - models: Test result data structures
+- reports: Structured report parsing (JUnit XML, Jest JSON, gtest JSON)
+- sharding: Shard planning and per-test duration history
 - exceptions: Testing-specific exception hierarchy
 - base: Abstract framework runner interface (Template Method Pattern)
 - runners: Framework-specific runners (Strategy Pattern)
@@ -36,6 +38,8 @@ from stages.testing.exceptions import (
 from stages.testing.runner import TestRunner
 from stages.testing.factory import FrameworkRunnerFactory
 from stages.testing.detection import FrameworkDetector
+from stages.testing.reports import TestCaseResult
+from stages.testing.sharding import DurationHistory, ShardResult, plan_shards
 
 __all__ = [
     # Main interface
@@ -44,6 +48,12 @@ __all__ = [
     # Models
     'TestResult',
     'TestFramework',
+    'TestCaseResult',
+    'ShardResult',
+
+    # Sharding
+    'DurationHistory',
+    'plan_shards',
 
     # Factory and detection
     'FrameworkRunnerFactory',
@@ -11,14 +11,20 @@ framework-specific customization.
 
 import os
 import subprocess
+import tempfile
 import time
 import logging
+import xml.etree.ElementTree as ET
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional, Protocol
+from typing import Callable, Dict, Iterable, List, Optional, Protocol, Tuple
 
+from artemis_constants import TEST_CPU_BUDGET
 from artemis_exceptions import wrap_exception
 from stages.testing.models import TestResult
+from stages.testing.reports import TestCaseResult, count_outcomes
+from stages.testing.sharding import DurationHistory, ShardResult, get_duration_history, plan_shards
 from stages.testing.exceptions import (
     TestPathNotFoundError,
     TestFrameworkNotFoundError,
@@ -26,6 +32,56 @@ from stages.testing.exceptions import (
     TestTimeoutError
 )
 
+# Directories never searched for test units
+SKIPPED_UNIT_DIRS = {"node_modules", "__pycache__", "venv", "build", "dist", "target"}
+
+# (command, report path, units the command runs)
+ShardCommand = Tuple[List[str], Path, List[str]]
+
+
+def find_test_units(test_path: Path, patterns: Iterable[str]) -> List[str]:
+    """
+    WHY: Shardable runners split suites by test file
+    RESPONSIBILITY: Find test files matching glob patterns
+
+    Args:
+        test_path: Test directory or single test file
+        patterns: Glob patterns (e.g. "test_*.py")
+
+    Returns:
+        Sorted absolute paths, skipping hidden and dependency directories
+    """
+    if test_path.is_file():
+        return [str(test_path.resolve())]
+
+    units = set()
+    for pattern in patterns:
+        for path in test_path.rglob(pattern):
+            relative_parts = path.relative_to(test_path).parts[:-1]
+            if not path.is_file() or any(part.startswith(".") or part in SKIPPED_UNIT_DIRS for part in relative_parts):
+                continue
+            units.add(str(path.resolve()))
+    return sorted(units)
+
+
+def history_key(test_path: Path, unit: str) -> str:
+    """
+    WHY: Output directories differ between runs (temp dirs, developer folders)
+    RESPONSIBILITY: Key a unit's durations by its path below the test root
+
+    Args:
+        test_path: Test directory or single test file
+        unit: Absolute unit path from find_test_units
+
+    Returns:
+        POSIX path relative to the test root (unit unchanged if outside it)
+    """
+    root = (test_path.parent if test_path.is_file() else test_path).resolve()
+    try:
+        return Path(unit).relative_to(root).as_posix()
+    except ValueError:
+        return unit
+
 
 class FrameworkRunner(Protocol):
     """
@@ -56,18 +112,36 @@ class BaseFrameworkRunner(ABC):
     4. Parse framework-specific output
     5. Return structured result
 
+    Sharded flow (ShardedFrameworkRunner subclasses):
+    1. Split test units into shards balanced by recorded durations
+    2. Run shards in parallel within the CPU budget
+    3. Parse each shard's structured report as it finishes
+    4. Merge shard results and record per-test durations
+
     Guard Clauses: Max 1 level nesting throughout
     """
 
-    def __init__(self, logger: Optional[logging.Logger] = None):
+    def __init__(
+        self,
+        logger: Optional[logging.Logger] = None,
+        cpu_budget: Optional[int] = None,
+        duration_history: Optional[DurationHistory] = None,
+        on_shard_complete: Optional[Callable[[ShardResult], None]] = None
+    ):
         """
-        WHY: Dependency injection for logging
+        WHY: Dependency injection for logging and shard execution
         RESPONSIBILITY: Initialize runner with optional logger
 
         Args:
             logger: Optional logger instance (creates default if None)
+            cpu_budget: Maximum shards run at once (default TEST_CPU_BUDGET)
+            duration_history: Per-test durations used to balance shards
+            on_shard_complete: Called with each ShardResult as it finishes
         """
         self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.cpu_budget = max(1, cpu_budget or TEST_CPU_BUDGET)
+        self.duration_history = duration_history
+        self.on_shard_complete = on_shard_complete
 
     @wrap_exception(TestExecutionError, "Test execution failed")
     def run(self, test_path: Path, timeout: int) -> TestResult:
@@ -94,6 +168,10 @@ class BaseFrameworkRunner(ABC):
         start_time = time.time()
 
         try:
+            sharded = self._run_sharded_if_supported(test_path, timeout)
+            if sharded is not None:
+                return sharded
+
             cmd = self._prepare_command(test_path)
             raw_result = self._execute_command(cmd, test_path, timeout)
             duration = time.time() - start_time
@@ -131,6 +209,28 @@ class BaseFrameworkRunner(ABC):
                 {"path": str(test_path)}
             )
 
+    def _run_sharded_if_supported(self, test_path: Path, timeout: int) -> Optional[TestResult]:
+        """
+        WHY: Only runners with structured per-unit reports can shard
+        RESPONSIBILITY: Hook for ShardedFrameworkRunner
+
+        Returns:
+            Merged sharded result, or None to run the suite as one serial command
+        """
+        return None
+
+    def _read_report(self, report: Path, parse: Callable[[Path], List[TestCaseResult]]) -> Optional[List[TestCaseResult]]:
+        """Parsed report, or None when the framework wrote none"""
+        # Guard: process died before writing its report
+        if not report.exists():
+            return None
+
+        try:
+            return parse(report)
+        except (OSError, ValueError, ET.ParseError) as e:
+            self.logger.warning(f"Unreadable {self.framework_name} report {report}: {e}")
+            return None
+
     @abstractmethod
     def _prepare_command(self, test_path: Path) -> List[str]:
         """
@@ -269,3 +369,202 @@ class BaseFrameworkRunner(ABC):
             Framework name string
         """
         pass
+
+
+class ShardedFrameworkRunner(BaseFrameworkRunner):
+    """
+    WHY: Runners with structured per-unit reports can split suites across CPUs
+    RESPONSIBILITY: Discover units, run balanced shards, merge their reports
+    PATTERNS: Template Method Pattern
+
+    Subclasses provide unit discovery, shard commands and report parsing;
+    suites without discoverable units fall back to the serial flow.
+    """
+
+    def _run_sharded_if_supported(self, test_path: Path, timeout: int) -> Optional[TestResult]:
+        units = self._discover_units(test_path)
+        # Guard: nothing to split - run the suite serially
+        if not units:
+            return None
+        return self._run_sharded(test_path, units, timeout)
+
+    @abstractmethod
+    def _discover_units(self, test_path: Path) -> List[str]:
+        """
+        WHY: Runners with structured reports can split suites into shards
+        RESPONSIBILITY: List independently runnable test units
+
+        Args:
+            test_path: Path to test directory or file
+
+        Returns:
+            Test units; empty to run the suite as one serial command
+        """
+        pass
+
+    @abstractmethod
+    def _prepare_shard_commands(self, test_path: Path, units: List[str], report_prefix: Path) -> List[ShardCommand]:
+        """
+        WHY: Framework-specific shard command construction
+        RESPONSIBILITY: Build commands running units with a structured report
+
+        Args:
+            test_path: Path to test directory or file
+            units: Units assigned to the shard
+            report_prefix: Path prefix for report files (unique per shard)
+
+        Returns:
+            (command, report path, units run by the command) tuples
+        """
+        pass
+
+    @abstractmethod
+    def _parse_report(self, report: Path) -> List[TestCaseResult]:
+        """
+        WHY: Framework-specific structured report parsing
+        RESPONSIBILITY: Read test cases from a shard report
+
+        Args:
+            report: Report file written by the framework
+
+        Returns:
+            Test cases in the report
+        """
+        pass
+
+    def _run_sharded(self, test_path: Path, units: List[str], timeout: int) -> TestResult:
+        """
+        WHY: Large suites finish sooner split across CPUs
+        RESPONSIBILITY: Run balanced shards in parallel and merge their results
+
+        Each shard gets the full timeout; shards run concurrently.
+
+        Args:
+            test_path: Path to test directory or file
+            units: Test units to distribute
+            timeout: Maximum execution time per shard
+
+        Returns:
+            Merged TestResult (metadata lists shard count and durations)
+        """
+        start_time = time.time()
+        history = self.duration_history or get_duration_history()
+        keys = {unit: history_key(test_path, unit) for unit in units}
+        known = history.unit_durations(self.framework_name, keys.values())
+        durations = {unit: known[key] for unit, key in keys.items() if key in known}
+        shards = plan_shards(units, durations, self.cpu_budget)
+        self.logger.info(f"Running {len(units)} {self.framework_name} test units in {len(shards)} shards")
+
+        results = []
+        with tempfile.TemporaryDirectory(prefix="artemis_shards_") as report_dir:
+            with ThreadPoolExecutor(max_workers=len(shards)) as pool:
+                futures = [
+                    pool.submit(self._run_shard, test_path, index, shard, Path(report_dir) / f"shard-{index}", timeout)
+                    for index, shard in enumerate(shards)
+                ]
+                for future in as_completed(futures):
+                    shard_result = future.result()
+                    results.append(shard_result)
+                    self._stream_shard(shard_result, len(shards))
+
+        results.sort(key=lambda shard_result: shard_result.index)
+        self._record_durations(history, results, keys)
+        return self._merge_shards(results, time.time() - start_time)
+
+    def _run_shard(self, test_path: Path, index: int, units: List[str], report_prefix: Path, timeout: int) -> ShardResult:
+        """Run one shard's commands and parse their reports"""
+        started = time.time()
+        shard = ShardResult(index=index, units=units)
+        outputs = []
+        for cmd, report, command_units in self._prepare_shard_commands(test_path, units, report_prefix):
+            raw_result = self._execute_command(cmd, test_path, timeout)
+            outputs.append(raw_result.stdout + raw_result.stderr)
+            shard.exit_code = shard.exit_code or raw_result.returncode
+            cases = self._read_report(report, self._parse_report)
+            if cases is None:
+                shard.counts = self._add_counts(shard.counts, self._fallback_counts(raw_result))
+                continue
+            shard.cases.extend(TestCaseResult(case.name, case.outcome, case.duration, self._unit_for_case(case, command_units)) for case in cases)
+        shard.output = "\n".join(outputs)
+        shard.duration = time.time() - started
+        return shard
+
+    def _fallback_counts(self, raw_result: subprocess.CompletedProcess) -> Dict[str, int]:
+        """Counts parsed from output when no structured report exists"""
+        try:
+            parsed = self._parse_results(raw_result, 0.0)
+        except Exception:
+            return {"passed": 0, "failed": 0, "skipped": 0, "errors": 1, "total": 1}
+        return {"passed": parsed.passed, "failed": parsed.failed, "skipped": parsed.skipped, "errors": parsed.errors, "total": parsed.total}
+
+    @staticmethod
+    def _add_counts(first: Optional[Dict[str, int]], second: Dict[str, int]) -> Dict[str, int]:
+        return {key: (first or {}).get(key, 0) + value for key, value in second.items()}
+
+    def _unit_for_case(self, case: TestCaseResult, units: List[str]) -> str:
+        """
+        WHY: Durations are recorded per unit to balance later runs
+        RESPONSIBILITY: Attribute a test case to the unit that ran it
+
+        Returns:
+            Unit path ('' if the case cannot be attributed)
+        """
+        if len(units) == 1:
+            return units[0]
+        if case.file:
+            reported = Path(case.file).as_posix()
+            match = next((unit for unit in units if unit == reported or unit.endswith("/" + reported.lstrip("./"))), None)
+            if match:
+                return match
+        qualifiers = set(case.name.split("::")[0].split("."))
+        return next((unit for unit in units if Path(unit).stem in qualifiers), "")
+
+    def _stream_shard(self, shard: ShardResult, shard_count: int) -> None:
+        """Report a finished shard without waiting for the others"""
+        counts = self._add_counts(shard.counts, count_outcomes(shard.cases))
+        self.logger.info(
+            f"Shard {shard.index + 1}/{shard_count} finished in {shard.duration:.1f}s: "
+            f"{counts['passed']} passed, {counts['failed']} failed, {counts['errors']} errors"
+        )
+        if not self.on_shard_complete:
+            return
+
+        try:
+            self.on_shard_complete(shard)
+        except Exception as e:
+            self.logger.warning(f"Shard callback failed: {e}")
+
+    def _record_durations(self, history: DurationHistory, shards: List[ShardResult], keys: Dict[str, str]) -> None:
+        """Record per-unit durations under history keys, forgetting units no longer discovered"""
+        unit_cases: Dict[str, List[TestCaseResult]] = {}
+        for shard in shards:
+            for case in shard.cases:
+                if case.file in keys:
+                    unit_cases.setdefault(keys[case.file], []).append(case)
+        history.record(self.framework_name, unit_cases, current_units=keys.values())
+
+    def _merge_shards(self, shards: List[ShardResult], duration: float) -> TestResult:
+        counts = count_outcomes(case for shard in shards for case in shard.cases)
+        for shard in shards:
+            if shard.counts:
+                counts = self._add_counts(counts, shard.counts)
+        output = "\n".join(
+            f"===== shard {shard.index + 1}/{len(shards)} ({len(shard.units)} units) =====\n{shard.output}"
+            for shard in shards
+        )
+        return TestResult(
+            framework=self.framework_name,
+            passed=counts["passed"],
+            failed=counts["failed"],
+            skipped=counts["skipped"],
+            errors=counts["errors"],
+            total=counts["total"],
+            exit_code=next((shard.exit_code for shard in shards if shard.exit_code), 0),
+            duration=duration,
+            output=output,
+            metadata={
+                "shards": len(shards),
+                "cpu_budget": self.cpu_budget,
+                "shard_durations": [round(shard.duration, 3) for shard in shards]
+            }
+        )
@@ -82,7 +82,8 @@ class FrameworkRunnerFactory:
     def create_runner(
         cls,
         framework: TestFramework,
-        logger: Optional[logging.Logger] = None
+        logger: Optional[logging.Logger] = None,
+        **options
     ) -> BaseFrameworkRunner:
         """
         WHY: Create framework-specific runner instance
@@ -91,6 +92,7 @@ class FrameworkRunnerFactory:
         Args:
             framework: Framework enum
             logger: Optional logger for dependency injection
+            **options: Runner options (cpu_budget, duration_history, on_shard_complete)
 
         Returns:
             Framework runner instance
@@ -109,7 +111,7 @@ class FrameworkRunnerFactory:
                 }
             )
 
-        return runner_class(logger=logger)
+        return runner_class(logger=logger, **options)
 
     @classmethod
     def get_available_frameworks(cls) -> list[str]:
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+WHY: Structured test report parsing
+RESPONSIBILITY: Turn JUnit XML, Jest JSON and gtest JSON reports into per-test results
+PATTERNS: Adapter Pattern, Guard Clauses
+
+Runners previously counted results by matching PASSED/FAILED in captured
+output, which miscounts tests whose names contain those words. Reports
+written by the frameworks themselves carry one entry per test case with
+its outcome and duration.
+"""
+
+import json
+import xml.etree.ElementTree as ET
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+OUTCOME_PASSED = "passed"
+OUTCOME_FAILED = "failed"
+OUTCOME_SKIPPED = "skipped"
+OUTCOME_ERROR = "error"
+
+JEST_STATUS = {
+    "passed": OUTCOME_PASSED,
+    "failed": OUTCOME_FAILED,
+    "pending": OUTCOME_SKIPPED,
+    "skipped": OUTCOME_SKIPPED,
+    "todo": OUTCOME_SKIPPED,
+    "disabled": OUTCOME_SKIPPED,
+}
+
+
+@dataclass(frozen=True)
+class TestCaseResult:
+    """
+    WHY: One test case from a structured report
+    RESPONSIBILITY: Carry outcome and duration per test
+
+    Attributes:
+        name: Test identifier (class/suite qualified where available)
+        outcome: passed, failed, skipped or error
+        duration: Seconds spent in the test
+        file: Source file reported for the test ('' if unknown)
+    """
+    __test__ = False  # not a pytest test class
+
+    name: str
+    outcome: str
+    duration: float
+    file: str = ""
+
+
+def count_outcomes(cases: Iterable[TestCaseResult]) -> Dict[str, int]:
+    """
+    WHY: Derive TestResult counts from test cases
+    RESPONSIBILITY: Count cases per outcome
+
+    Returns:
+        Dict with passed, failed, skipped, errors and total
+    """
+    counts = Counter(case.outcome for case in cases)
+    return {
+        "passed": counts[OUTCOME_PASSED],
+        "failed": counts[OUTCOME_FAILED],
+        "skipped": counts[OUTCOME_SKIPPED],
+        "errors": counts[OUTCOME_ERROR],
+        "total": sum(counts.values()),
+    }
+
+
+def parse_junit_xml(report: Path) -> List[TestCaseResult]:
+    """
+    WHY: JUnit XML is written by pytest, Maven Surefire and Gradle
+    RESPONSIBILITY: Extract every <testcase> element
+
+    Args:
+        report: Path to a JUnit XML file
+
+    Returns:
+        Test cases in report order
+
+    Raises:
+        ET.ParseError: If the report is not valid XML
+    """
+    root = ET.parse(report).getroot()
+    return [_junit_case(element) for element in root.iter("testcase")]
+
+
+def _junit_case(element: ET.Element) -> TestCaseResult:
+    classname = element.get("classname", "")
+    name = element.get("name", "")
+    return TestCaseResult(
+        name=f"{classname}::{name}" if classname else name,
+        outcome=_junit_outcome(element),
+        duration=float(element.get("time") or 0),
+        file=element.get("file", "")
+    )
+
+
+def _junit_outcome(element: ET.Element) -> str:
+    # Guard: no child element means the test passed
+    if element.find("error") is not None:
+        return OUTCOME_ERROR
+    if element.find("failure") is not None:
+        return OUTCOME_FAILED
+    if element.find("skipped") is not None:
+        return OUTCOME_SKIPPED
+    return OUTCOME_PASSED
+
+
+def parse_jest_json(report: Path) -> List[TestCaseResult]:
+    """
+    WHY: Jest writes per-assertion results with --json --outputFile
+    RESPONSIBILITY: Extract assertion results per test file
+
+    Args:
+        report: Path to the Jest JSON report
+
+    Returns:
+        Test cases in report order (suites that failed to run count as errors)
+    """
+    data = json.loads(report.read_text())
+    cases = []
+    for suite in data.get("testResults", []):
+        file = suite.get("name", "")
+        assertions = suite.get("assertionResults", [])
+        if not assertions and suite.get("status") == "failed":
+            cases.append(TestCaseResult(file, OUTCOME_ERROR, 0.0, file))
+            continue
+        cases.extend(
+            TestCaseResult(
+                name=assertion.get("fullName") or assertion.get("title", ""),
+                outcome=JEST_STATUS.get(assertion.get("status"), OUTCOME_ERROR),
+                duration=(assertion.get("duration") or 0) / 1000,
+                file=file
+            )
+            for assertion in assertions
+        )
+    return cases
+
+
+def parse_gtest_json(report: Path) -> List[TestCaseResult]:
+    """
+    WHY: Google Test writes per-test results with --gtest_output=json
+    RESPONSIBILITY: Extract every test of every suite
+
+    Args:
+        report: Path to the gtest JSON report
+
+    Returns:
+        Test cases in report order
+    """
+    data = json.loads(report.read_text())
+    return [
+        TestCaseResult(
+            name=f"{suite.get('name', '')}.{test.get('name', '')}",
+            outcome=_gtest_outcome(test),
+            duration=float(str(test.get("time", "0")).rstrip("s") or 0),
+            file=test.get("file", "")
+        )
+        for suite in data.get("testsuites", [])
+        for test in suite.get("testsuite", [])
+    ]
+
+
+def _gtest_outcome(test: Dict) -> str:
+    if test.get("failures"):
+        return OUTCOME_FAILED
+    if test.get("result") == "SKIPPED" or test.get("status") == "NOTRUN":
+        return OUTCOME_SKIPPED
+    return OUTCOME_PASSED
+
+
+__all__ = [
+    "TestCaseResult",
+    "OUTCOME_PASSED",
+    "OUTCOME_FAILED",
+    "OUTCOME_SKIPPED",
+    "OUTCOME_ERROR",
+    "count_outcomes",
+    "parse_junit_xml",
+    "parse_jest_json",
+    "parse_gtest_json",
+]
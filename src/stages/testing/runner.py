@@ -11,13 +11,14 @@ across multiple frameworks.
 
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from artemis_exceptions import wrap_exception
 from stages.testing.models import TestResult, TestFramework
 from stages.testing.exceptions import TestRunnerError
 from stages.testing.factory import FrameworkRunnerFactory
 from stages.testing.detection import FrameworkDetector
+from stages.testing.sharding import ShardResult
 
 
 class TestRunner:
@@ -37,7 +38,9 @@ class TestRunner:
         framework: Optional[str] = None,
         verbose: bool = False,
         timeout: int = 120,
-        logger: Optional[logging.Logger] = None
+        logger: Optional[logging.Logger] = None,
+        cpu_budget: Optional[int] = None,
+        on_shard_complete: Optional[Callable[[ShardResult], None]] = None
     ):
         """
         WHY: Initialize test runner with configuration
@@ -48,10 +51,14 @@ class TestRunner:
             verbose: Enable verbose output
             timeout: Test execution timeout in seconds
             logger: Optional logger for dependency injection
+            cpu_budget: Maximum parallel test shards (default TEST_CPU_BUDGET)
+            on_shard_complete: Called with each ShardResult as it finishes
         """
         self.framework = framework
         self.verbose = verbose
         self.timeout = timeout
+        self.cpu_budget = cpu_budget
+        self.on_shard_complete = on_shard_complete
         self.logger = logger or self._create_default_logger(verbose)
         self._detector = FrameworkDetector(logger=self.logger)
 
@@ -111,7 +118,12 @@ class TestRunner:
             self.logger.info(f"Auto-detected framework: {self.framework}")
 
         framework_enum = self._get_framework_enum(self.framework)
-        runner = FrameworkRunnerFactory.create_runner(framework_enum, self.logger)
+        runner = FrameworkRunnerFactory.create_runner(
+            framework_enum,
+            self.logger,
+            cpu_budget=self.cpu_budget,
+            on_shard_complete=self.on_shard_complete
+        )
         result = runner.run(test_path_obj, self.timeout)
 
         self._log_results(result)
@@ -7,21 +7,28 @@ PATTERNS: Strategy Pattern, Template Method Pattern
 This module provides runners for compiled language testing frameworks:
 - Google Test (gtest): C++ testing framework
 - JUnit: Java testing framework
+
+gtest executables run as parallel shards with JSON reports. JUnit runs
+through Maven/Gradle, which own the JVMs: tests fork in parallel within
+the CPU budget and results are read from the build tool's JUnit XML reports.
 """
 
 import json
+import os
 import re
 import subprocess
+import time
 from pathlib import Path
 from typing import List
 
 from artemis_exceptions import wrap_exception
-from stages.testing.base import BaseFrameworkRunner
+from stages.testing.base import BaseFrameworkRunner, ShardCommand, ShardedFrameworkRunner
 from stages.testing.models import TestResult
+from stages.testing.reports import TestCaseResult, count_outcomes, parse_gtest_json, parse_junit_xml
 from stages.testing.exceptions import TestOutputParsingError, TestExecutionError
 
 
-class GtestRunner(BaseFrameworkRunner):
+class GtestRunner(ShardedFrameworkRunner):
     """
     WHY: Execute Google Test (C++) tests
     RESPONSIBILITY: Run and parse gtest test results
@@ -64,6 +71,27 @@ class GtestRunner(BaseFrameworkRunner):
         test_exe = test_executables[0]
         return [str(test_exe), "--gtest_output=json:test_results.json"]
 
+    def _discover_units(self, test_path: Path) -> List[str]:
+        """Test executables, one shard unit each"""
+        candidates = list(test_path.glob("**/*_test")) + list(test_path.glob("**/test_*"))
+        return sorted({
+            str(path.resolve()) for path in candidates
+            if path.is_file() and os.access(path, os.X_OK)
+        })
+
+    def _prepare_shard_commands(self, test_path: Path, units: List[str], report_prefix: Path) -> List[ShardCommand]:
+        """
+        WHY: Build gtest commands for one shard
+        RESPONSIBILITY: Run each executable with its own JSON report
+        """
+        return [
+            ([unit, f"--gtest_output=json:{report_prefix}-{position}.json"], Path(f"{report_prefix}-{position}.json"), [unit])
+            for position, unit in enumerate(units)
+        ]
+
+    def _parse_report(self, report: Path) -> List[TestCaseResult]:
+        return parse_gtest_json(report)
+
     @wrap_exception(TestOutputParsingError, "Failed to parse gtest output")
     def _parse_results(
         self,
@@ -179,6 +207,11 @@ class JunitRunner(BaseFrameworkRunner):
     - Integration with build tools
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Report directories of the build tool chosen by _prepare_command
+        self._report_dirs: List[Path] = []
+
     @property
     def framework_name(self) -> str:
         """Framework identifier"""
@@ -199,10 +232,12 @@ class JunitRunner(BaseFrameworkRunner):
             TestExecutionError: If no build file found
         """
         if (test_path / "pom.xml").exists():
-            return ["mvn", "test"]
+            self._report_dirs = [test_path / "target" / "surefire-reports"]
+            return ["mvn", "test", f"-DforkCount={self.cpu_budget}", "-DreuseForks=true"]
 
         if (test_path / "build.gradle").exists():
-            return ["gradle", "test"]
+            self._report_dirs = [test_path / "build" / "test-results" / "test"]
+            return ["gradle", "test", f"--max-workers={self.cpu_budget}"]
 
         raise TestExecutionError(
             "No Maven or Gradle build file found",
@@ -217,7 +252,7 @@ class JunitRunner(BaseFrameworkRunner):
     ) -> TestResult:
         """
         WHY: Extract junit test metrics
-        RESPONSIBILITY: Parse Maven/Gradle output
+        RESPONSIBILITY: Parse JUnit XML reports, falling back to Maven/Gradle output
 
         Output format: "Tests run: X, Failures: Y, Errors: Z, Skipped: W"
 
@@ -230,6 +265,17 @@ class JunitRunner(BaseFrameworkRunner):
         """
         output = result.stdout + result.stderr
 
+        cases = self._read_build_reports(time.time() - duration)
+        if cases:
+            return TestResult(
+                framework=self.framework_name,
+                exit_code=result.returncode,
+                duration=duration,
+                output=output,
+                metadata={"test_durations": {case.name: case.duration for case in cases}},
+                **count_outcomes(cases)
+            )
+
         match = re.search(r'Tests run: (\d+), Failures: (\d+), Errors: (\d+), Skipped: (\d+)', output)
 
         if match:
@@ -252,3 +298,23 @@ class JunitRunner(BaseFrameworkRunner):
             duration=duration,
             output=output
         )
+
+    def _read_build_reports(self, started: float) -> List[TestCaseResult]:
+        """
+        WHY: Surefire and Gradle write one JUnit XML report per test class
+        RESPONSIBILITY: Parse reports written by this run (older ones are stale)
+
+        Args:
+            started: Run start time; reports modified earlier are ignored
+
+        Returns:
+            Test cases from this run's reports
+        """
+        cases: List[TestCaseResult] = []
+        for report_dir in self._report_dirs:
+            for report in sorted(report_dir.glob("TEST-*.xml")):
+                if report.stat().st_mtime + 1 < started:
+                    continue
+                cases.extend(self._read_report(report, parse_junit_xml) or [])
+        return cases
+
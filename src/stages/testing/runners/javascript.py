@@ -6,6 +6,9 @@ PATTERNS: Strategy Pattern, Template Method Pattern
 
 This module provides runners for JavaScript testing frameworks:
 - Jest: Facebook's JavaScript testing framework
+
+Jest suites are split by test file into parallel shards (one jest worker
+each) and results are read from the --json --outputFile report.
 """
 
 import json
@@ -14,13 +17,20 @@ import subprocess
 from pathlib import Path
 from typing import List
 
+JEST_TEST_PATTERNS = (
+    "*.test.js", "*.test.jsx", "*.test.ts", "*.test.tsx",
+    "*.spec.js", "*.spec.jsx", "*.spec.ts", "*.spec.tsx",
+    "__tests__/*.js", "__tests__/*.ts",
+)
+
 from artemis_exceptions import wrap_exception
-from stages.testing.base import BaseFrameworkRunner
+from stages.testing.base import ShardCommand, ShardedFrameworkRunner, find_test_units
 from stages.testing.models import TestResult
+from stages.testing.reports import TestCaseResult, parse_jest_json
 from stages.testing.exceptions import TestOutputParsingError
 
 
-class JestRunner(BaseFrameworkRunner):
+class JestRunner(ShardedFrameworkRunner):
     """
     WHY: Execute Jest (JavaScript/TypeScript) tests
     RESPONSIBILITY: Run and parse jest test results
@@ -51,6 +61,28 @@ class JestRunner(BaseFrameworkRunner):
         """
         return ["npx", "jest", str(test_path), "--json", "--coverage=false"]
 
+    def _discover_units(self, test_path: Path) -> List[str]:
+        """Jest test files, one shard unit each"""
+        return find_test_units(test_path, JEST_TEST_PATTERNS)
+
+    def _prepare_shard_commands(self, test_path: Path, units: List[str], report_prefix: Path) -> List[ShardCommand]:
+        """
+        WHY: Build jest command for one shard
+        RESPONSIBILITY: Run the shard's files in one worker with a JSON report
+
+        Parallelism comes from shards, so each jest process uses one worker
+        to stay within the CPU budget.
+        """
+        report = report_prefix.with_suffix(".json")
+        cmd = [
+            "npx", "jest", "--runTestsByPath", *units, "--ci", "--maxWorkers=1",
+            "--coverage=false", "--json", f"--outputFile={report}"
+        ]
+        return [(cmd, report, units)]
+
+    def _parse_report(self, report: Path) -> List[TestCaseResult]:
+        return parse_jest_json(report)
+
     @wrap_exception(TestOutputParsingError, "Failed to parse jest output")
     def _parse_results(
         self,
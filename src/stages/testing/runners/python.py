@@ -7,6 +7,9 @@ PATTERNS: Strategy Pattern, Template Method Pattern
 This module provides runners for Python's two main testing frameworks:
 - pytest: Modern, feature-rich testing framework
 - unittest: Standard library testing framework
+
+Both split suites by test file into parallel shards and read results from
+JUnit XML reports (pytest --junitxml, unittest via unittest_report.py).
 """
 
 import re
@@ -16,12 +19,15 @@ from typing import List
 import subprocess
 
 from artemis_exceptions import wrap_exception
-from stages.testing.base import BaseFrameworkRunner
+from stages.testing.base import ShardCommand, ShardedFrameworkRunner, find_test_units
 from stages.testing.models import TestResult
+from stages.testing.reports import TestCaseResult, parse_junit_xml
 from stages.testing.exceptions import TestOutputParsingError
 
+UNITTEST_REPORTER = Path(__file__).with_name("unittest_report.py")
+
 
-class PytestRunner(BaseFrameworkRunner):
+class PytestRunner(ShardedFrameworkRunner):
     """
     WHY: Execute pytest tests
     RESPONSIBILITY: Run and parse pytest test results
@@ -52,6 +58,28 @@ class PytestRunner(BaseFrameworkRunner):
         """
         return ["pytest", str(test_path), "-v", "--tb=short", "--color=no"]
 
+    def _discover_units(self, test_path: Path) -> List[str]:
+        """Test files, one shard unit each"""
+        return find_test_units(test_path, ("test_*.py", "*_test.py"))
+
+    def _prepare_shard_commands(self, test_path: Path, units: List[str], report_prefix: Path) -> List[ShardCommand]:
+        """
+        WHY: Build pytest command for one shard
+        RESPONSIBILITY: Run the shard's files with a JUnit XML report
+
+        xunit1 reports include each test's file, used to attribute durations.
+        The cache plugin is disabled so concurrent shards do not race on it.
+        """
+        report = report_prefix.with_suffix(".xml")
+        cmd = [
+            "pytest", *units, "-v", "--tb=short", "--color=no",
+            "-p", "no:cacheprovider", f"--junitxml={report}", "-o", "junit_family=xunit1"
+        ]
+        return [(cmd, report, units)]
+
+    def _parse_report(self, report: Path) -> List[TestCaseResult]:
+        return parse_junit_xml(report)
+
     @wrap_exception(TestOutputParsingError, "Failed to parse pytest output")
     def _parse_results(
         self,
@@ -96,7 +124,7 @@ class PytestRunner(BaseFrameworkRunner):
         )
 
 
-class UnittestRunner(BaseFrameworkRunner):
+class UnittestRunner(ShardedFrameworkRunner):
     """
     WHY: Execute unittest tests
     RESPONSIBILITY: Run and parse unittest test results
@@ -128,6 +156,22 @@ class UnittestRunner(BaseFrameworkRunner):
         self._ensure_init_files(test_path)
         return ["python", "-m", "unittest", "discover", "-s", str(test_path), "-v"]
 
+    def _discover_units(self, test_path: Path) -> List[str]:
+        """Test modules matching unittest's default discovery pattern"""
+        return find_test_units(test_path, ("test*.py",))
+
+    def _prepare_shard_commands(self, test_path: Path, units: List[str], report_prefix: Path) -> List[ShardCommand]:
+        """
+        WHY: Build unittest command for one shard
+        RESPONSIBILITY: Run the shard's modules through the JUnit XML reporter
+        """
+        self._ensure_init_files(test_path)
+        report = report_prefix.with_suffix(".xml")
+        return [(["python", str(UNITTEST_REPORTER), "--junitxml", str(report), *units], report, units)]
+
+    def _parse_report(self, report: Path) -> List[TestCaseResult]:
+        return parse_junit_xml(report)
+
     def _ensure_init_files(self, test_path: Path) -> None:
         """
         WHY: Unittest requires __init__.py for package discovery
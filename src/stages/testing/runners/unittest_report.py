@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+WHY: unittest has no machine-readable report format
+RESPONSIBILITY: Run unittest modules and write a JUnit XML report with per-test durations
+PATTERNS: Decorator Pattern (timed TestResult)
+
+Usage (working directory is the test root):
+    python unittest_report.py --junitxml report.xml tests/test_a.py tests/test_b.py
+
+Standard library only: runs inside the project's interpreter.
+"""
+
+import argparse
+import sys
+import time
+import unittest
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+
+class TimedTestResult(unittest.TextTestResult):
+    """TextTestResult that records outcome and duration of every test"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cases = []
+        self._started = {}
+
+    def startTest(self, test):
+        self._started[test.id()] = time.perf_counter()
+        super().startTest(test)
+
+    def addSuccess(self, test):
+        super().addSuccess(test)
+        self._record(test, "passed")
+
+    def addFailure(self, test, err):
+        super().addFailure(test, err)
+        self._record(test, "failure", self._exc_info_to_string(err, test))
+
+    def addError(self, test, err):
+        super().addError(test, err)
+        self._record(test, "error", self._exc_info_to_string(err, test))
+
+    def addSkip(self, test, reason):
+        super().addSkip(test, reason)
+        self._record(test, "skipped", reason)
+
+    def addExpectedFailure(self, test, err):
+        super().addExpectedFailure(test, err)
+        self._record(test, "passed")
+
+    def addUnexpectedSuccess(self, test):
+        super().addUnexpectedSuccess(test)
+        self._record(test, "failure", "unexpected success")
+
+    def _record(self, test, outcome, message=""):
+        started = self._started.pop(test.id(), time.perf_counter())
+        self.cases.append((test, outcome, message, time.perf_counter() - started))
+
+
+def module_name(path: Path, root: Path) -> str:
+    """Dotted module name of a test file relative to the test root"""
+    return ".".join(path.resolve().relative_to(root).with_suffix("").parts)
+
+
+def write_report(result: TimedTestResult, files: dict, report: Path) -> None:
+    suite = ET.Element("testsuite", name="unittest", tests=str(len(result.cases)))
+    for test, outcome, message, duration in result.cases:
+        test_id = test.id()
+        classname, _, name = test_id.rpartition(".")
+        module = next((module for module in files if test_id.startswith(module + ".")), "")
+        case = ET.SubElement(suite, "testcase", classname=classname, name=name or test_id, time=f"{duration:.4f}", file=files.get(module, ""))
+        if outcome != "passed":
+            ET.SubElement(case, outcome, message=message.splitlines()[-1] if message else "").text = message
+    ET.ElementTree(suite).write(report, encoding="utf-8", xml_declaration=True)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--junitxml", required=True)
+    parser.add_argument("files", nargs="+")
+    args = parser.parse_args()
+
+    root = Path.cwd().resolve()
+    sys.path.insert(0, str(root))
+    files = {module_name(Path(file), root): str(Path(file).resolve()) for file in args.files}
+
+    suite = unittest.defaultTestLoader.loadTestsFromNames(list(files))
+    runner = unittest.TextTestRunner(verbosity=2, resultclass=TimedTestResult)
+    result = runner.run(suite)
+    write_report(result, files, Path(args.junitxml))
+    return 0 if result.wasSuccessful() else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
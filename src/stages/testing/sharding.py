@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+WHY: Parallel test execution across shards
+RESPONSIBILITY: Balance test units into shards and remember per-test durations
+PATTERNS: Greedy Scheduling (longest processing time first), Repository Pattern
+
+A test unit is what a framework can run on its own: a test file (pytest,
+unittest, jest) or a test executable (gtest). Shards are balanced using the
+durations recorded by earlier runs; units never seen before are weighted
+with the median known duration.
+"""
+
+import heapq
+import json
+import statistics
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from artemis_constants import TEST_DURATIONS_PATH
+from stages.testing.reports import TestCaseResult
+
+# Weight of a unit when no durations are known at all
+DEFAULT_UNIT_SECONDS = 1.0
+
+
+@dataclass
+class ShardResult:
+    """
+    WHY: Outcome of one shard, streamed as soon as it finishes
+    RESPONSIBILITY: Carry a shard's test cases and process output
+
+    Attributes:
+        index: Shard number (0-based)
+        units: Test units the shard ran
+        cases: Test cases parsed from the shard's structured reports
+        exit_code: Highest exit code of the shard's processes
+        output: Captured stdout/stderr
+        duration: Wall-clock seconds
+        counts: Fallback counts when no report was produced
+    """
+    index: int
+    units: List[str]
+    cases: List[TestCaseResult] = field(default_factory=list)
+    exit_code: int = 0
+    output: str = ""
+    duration: float = 0.0
+    counts: Optional[Dict[str, int]] = None
+
+
+class DurationHistory:
+    """
+    WHY: Balancing shards needs to know how long each unit takes
+    RESPONSIBILITY: Persist per-test durations grouped by framework and unit
+    PATTERNS: Repository Pattern
+
+    File layout: {framework: {unit: {test_name: seconds}}}, units keyed
+    relative to the test root (see history_key)
+    """
+
+    def __init__(self, path: Path = TEST_DURATIONS_PATH):
+        """
+        Args:
+            path: JSON file holding the durations
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._data: Optional[Dict[str, Dict[str, Dict[str, float]]]] = None
+
+    def unit_durations(self, framework: str, units: Iterable[str]) -> Dict[str, float]:
+        """
+        Known total duration per unit
+
+        Returns:
+            {unit: seconds} for units with recorded durations
+        """
+        with self._lock:
+            recorded = self._load().get(framework, {})
+            return {unit: sum(recorded[unit].values()) for unit in units if recorded.get(unit)}
+
+    def record(
+        self,
+        framework: str,
+        unit_cases: Dict[str, List[TestCaseResult]],
+        current_units: Optional[Iterable[str]] = None
+    ) -> None:
+        """
+        Replace the recorded durations of the given units and save
+
+        Args:
+            framework: Framework name
+            unit_cases: Test cases per unit from the latest run
+            current_units: Units found by the latest discovery; others are dropped
+        """
+        with self._lock:
+            recorded = self._load().setdefault(framework, {})
+            if current_units is not None:
+                keep = set(current_units)
+                for unit in [unit for unit in recorded if unit not in keep]:
+                    del recorded[unit]
+            for unit, cases in unit_cases.items():
+                recorded[unit] = {case.name: round(case.duration, 4) for case in cases}
+            self._save()
+
+    def _load(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        if self._data is not None:
+            return self._data
+        try:
+            self._data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            self._data = {}
+        return self._data
+
+    def _save(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_suffix(".tmp")
+            temp_path.write_text(json.dumps(self._data, indent=1, sort_keys=True))
+            temp_path.replace(self.path)
+        except OSError:
+            # Durations only improve balancing; never fail a test run over them
+            pass
+
+
+def plan_shards(units: Sequence[str], durations: Dict[str, float], shard_count: int) -> List[List[str]]:
+    """
+    WHY: Shards finish together when their expected durations are equal
+    RESPONSIBILITY: Assign units to shards, longest first onto the lightest shard
+
+    Args:
+        units: Test units to run
+        durations: Known seconds per unit
+        shard_count: Number of shards wanted
+
+    Returns:
+        Non-empty shards (at most shard_count)
+    """
+    # Guard: nothing to split
+    if not units:
+        return []
+
+    shard_count = max(1, min(shard_count, len(units)))
+    default = statistics.median(durations.values()) if durations else DEFAULT_UNIT_SECONDS
+    ordered = sorted(units, key=lambda unit: (-durations.get(unit, default), unit))
+
+    heap = [(0.0, index) for index in range(shard_count)]
+    shards: List[List[str]] = [[] for _ in range(shard_count)]
+    for unit in ordered:
+        load, index = heapq.heappop(heap)
+        shards[index].append(unit)
+        heapq.heappush(heap, (load + durations.get(unit, default), index))
+    return [sorted(shard) for shard in shards if shard]
+
+
+_HISTORY: Optional[DurationHistory] = None
+_HISTORY_LOCK = threading.Lock()
+
+
+def get_duration_history() -> DurationHistory:
+    """
+    Process-wide duration history
+
+    WHY: All runners share one file; one instance serialises its writes.
+    """
+    global _HISTORY
+    with _HISTORY_LOCK:
+        if _HISTORY is None:
+            _HISTORY = DurationHistory()
+        return _HISTORY
+
+
+__all__ = [
+    "ShardResult",
+    "DurationHistory",
+    "plan_shards",
+    "get_duration_history",
+]
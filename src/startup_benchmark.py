@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark - Import-time budget for common CLI commands
+
+WHY:
+Orchestrator startup regressed to several seconds because every stage and
+heavy subsystem (ChromaDB, supervisor, planners) was imported eagerly, even
+for ``--help`` or a status listing. This benchmark runs the common commands
+under ``python -X importtime`` and checks them against a tracked budget
+(startup_budget.json) so a new eager import is caught before it ships.
+
+RESPONSIBILITY:
+- Run each benchmarked command in a fresh interpreter with -X importtime
+- Parse the import-time report (total import time, slowest top-level imports)
+- Compare against per-command budgets: max import time and forbidden modules
+
+PATTERNS:
+- Data-Driven Configuration: Commands and budgets live in startup_budget.json
+- Guard Clause Pattern: Early returns when a command is within budget
+
+Usage:
+    python startup_benchmark.py            # check all commands, exit 1 if over budget
+    python startup_benchmark.py --verbose  # also list the slowest imports
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+SRC_DIR = Path(__file__).parent
+DEFAULT_BUDGET_PATH = SRC_DIR / "startup_budget.json"
+
+IMPORTTIME_PREFIX = "import time:"
+
+
+@dataclass
+class ImportRecord:
+    """One line of ``-X importtime`` output"""
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class StartupResult:
+    """Import-time measurement and budget verdict for one command"""
+    command: str
+    import_ms: float
+    modules: List[str]
+    slowest: List[Tuple[str, float]]
+    exit_code: int
+    violations: List[str] = field(default_factory=list)
+
+    @property
+    def within_budget(self) -> bool:
+        return not self.violations
+
+
+def parse_importtime(stderr: str) -> List[ImportRecord]:
+    """
+    Parse ``-X importtime`` lines from a process's stderr.
+
+    Lines look like ``import time:   425 |   1216 |   package.module``;
+    the indentation of the module name is its nesting depth.
+    """
+    records = []
+    for line in stderr.splitlines():
+        if not line.startswith(IMPORTTIME_PREFIX):
+            continue
+        parts = line[len(IMPORTTIME_PREFIX):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # header line
+        name = parts[2].rstrip()
+        stripped = name.lstrip()
+        records.append(ImportRecord(
+            module=stripped,
+            self_us=int(parts[0]),
+            cumulative_us=int(parts[1]),
+            depth=(len(name) - len(stripped) - 1) // 2,
+        ))
+    return records
+
+
+def total_import_us(records: List[ImportRecord]) -> int:
+    """Total import time: sum of cumulative times of top-level imports"""
+    return sum(record.cumulative_us for record in records if record.depth == 0)
+
+
+def run_command(argv: List[str], cwd: Path = SRC_DIR, timeout: float = 120) -> Tuple[int, List[ImportRecord]]:
+    """
+    Run ``python -X importtime <argv>`` in a fresh interpreter.
+
+    Returns:
+        (exit code, parsed import records)
+    """
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    env.pop("PYTHONPROFILEIMPORTTIME", None)
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", *argv],
+        cwd=str(cwd),
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        timeout=timeout,
+    )
+    return completed.returncode, parse_importtime(completed.stderr)
+
+
+def load_budget(path: Path = DEFAULT_BUDGET_PATH) -> Dict[str, Dict]:
+    """Load the tracked budget file (command name -> budget entry)"""
+    with open(path) as f:
+        return json.load(f)["commands"]
+
+
+def check_command(name: str, budget: Dict) -> StartupResult:
+    """
+    Measure one command and compare it against its budget entry.
+
+    Budget entry keys:
+        argv: Arguments passed to the interpreter
+        max_import_ms: Upper bound on total import time
+        forbidden_modules: Top-level packages that must not be imported
+    """
+    exit_code, records = run_command(budget["argv"])
+    modules = [record.module for record in records]
+    top_level = sorted(
+        (record for record in records if record.depth == 0),
+        key=lambda record: record.cumulative_us,
+        reverse=True,
+    )
+    result = StartupResult(
+        command=name,
+        import_ms=total_import_us(records) / 1000,
+        modules=modules,
+        slowest=[(record.module, record.cumulative_us / 1000) for record in top_level[:10]],
+        exit_code=exit_code,
+    )
+
+    if exit_code != 0:
+        result.violations.append(f"exited with status {exit_code}")
+
+    max_import_ms = budget.get("max_import_ms")
+    if max_import_ms is not None and result.import_ms > max_import_ms:
+        result.violations.append(f"imports took {result.import_ms:.0f}ms (budget {max_import_ms}ms)")
+
+    loaded = {module.split(".")[0] for module in modules}
+    for forbidden in budget.get("forbidden_modules", []):
+        if forbidden in loaded:
+            result.violations.append(f"imported {forbidden}")
+
+    return result
+
+
+def run_benchmark(budget_path: Path = DEFAULT_BUDGET_PATH, only: Optional[List[str]] = None) -> List[StartupResult]:
+    """Check every (or the selected) command in the budget file"""
+    budgets = load_budget(budget_path)
+    names = only or list(budgets)
+    return [check_command(name, budgets[name]) for name in names]
+
+
+def _print_result(result: StartupResult, verbose: bool) -> None:
+    status = "OK  " if result.within_budget else "FAIL"
+    print(f"{status} {result.command:<32} {result.import_ms:8.0f}ms  {len(result.modules)} modules")
+    for violation in result.violations:
+        print(f"       - {violation}")
+    if not verbose:
+        return
+    for module, cumulative_ms in result.slowest:
+        print(f"       {cumulative_ms:8.1f}ms  {module}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Check CLI startup import time against startup_budget.json")
+    parser.add_argument("commands", nargs="*", help="Budget entries to run (default: all)")
+    parser.add_argument("--budget", type=Path, default=DEFAULT_BUDGET_PATH, help="Budget file")
+    parser.add_argument("--verbose", "-v", action="store_true", help="List the slowest top-level imports")
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(args.budget, args.commands or None)
+    for result in results:
+        _print_result(result, args.verbose)
+    return 0 if all(result.within_budget for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -164,6 +164,14 @@ class ArtemisStateMachine:
         """Get current pipeline state snapshot"""
         return self._core.get_snapshot()
 
+    def get_full_history(self) -> List[Dict[str, Any]]:
+        """Get every transition recorded for this card (from disk)"""
+        return self._core.get_full_history()
+
+    def flush(self) -> None:
+        """Write any pending state snapshot to disk now"""
+        self._core.flush()
+
     # Pushdown automaton methods
     def push_state(self, state: PipelineState, context: Optional[Dict[str, Any]] = None) -> None:
         """Push state onto stack"""
@@ -220,7 +228,7 @@ class ArtemisStateMachine:
 
     def _save_state(self) -> None:
         """Persist state to disk (compatibility)"""
-        self._core._save_state()
+        self._core._save_state(immediate=True)
 
     def _register_default_workflows(self) -> None:
         """Register default recovery workflows (compatibility)"""
@@ -2,6 +2,7 @@ from artemis_logger import get_logger
 logger = get_logger('state_machine_core')
 '\nWHY: Orchestrate all state machine components into cohesive state management system\nRESPONSIBILITY: Facade coordinating transitions, workflows, persistence, and recovery\nPATTERNS: Facade pattern, dependency injection, composition over inheritance\n'
 import os
+import threading
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Set
@@ -17,6 +18,7 @@ from state_machine.pushdown_automaton import PushdownAutomaton
 from state_machine.checkpoint_integration import CheckpointIntegration
 from state_machine.state_persistence import StatePersistence
 from state_machine.stage_state_manager import StageStateManager
+TERMINAL_STATES = frozenset({PipelineState.COMPLETED, PipelineState.FAILED, PipelineState.ABORTED})
 
 class ArtemisStateMachineCore:
     """
@@ -33,7 +35,8 @@ class ArtemisStateMachineCore:
     Features:
     - Complete state tracking for pipeline and stages
     - Event-driven state transitions
-    - State history and audit trail
+    - State history (bounded in memory) and append-only audit log on disk
+    - Coalesced snapshot persistence, flushed immediately at terminal states
     - Workflow orchestration for issue recovery
     - Snapshot/restore for debugging
     """
@@ -54,11 +57,12 @@ class ArtemisStateMachineCore:
         state_dir = state_dir or os.getenv('ARTEMIS_STATE_DIR', '../../.artemis_data/state')
         self.state_dir = Path(state_dir)
         self.state_dir.mkdir(exist_ok=True, parents=True)
-        self.transition_engine = StateTransitionEngine(verbose=verbose)
+        self._state_lock = threading.RLock()
+        self.persistence = StatePersistence(state_dir=self.state_dir, card_id=card_id, verbose=verbose, snapshot_lock=self._state_lock)
+        self.transition_engine = StateTransitionEngine(verbose=verbose, on_transition=self.persistence.append_transition)
         self.stage_manager = StageStateManager(verbose=verbose)
         self.automaton = PushdownAutomaton(verbose=verbose)
         self.checkpoint = CheckpointIntegration(card_id=card_id, verbose=verbose)
-        self.persistence = StatePersistence(state_dir=self.state_dir, card_id=card_id, verbose=verbose)
         self.workflows = self._register_default_workflows()
         self.workflow_executor = WorkflowExecutor(workflows=self.workflows, verbose=verbose)
         self.llm_generator = LLMWorkflowGenerator(llm_client=llm_client, verbose=verbose)
@@ -96,9 +100,10 @@ class ArtemisStateMachineCore:
         Returns:
             True if transition was valid and executed
         """
-        success = self.transition_engine.transition(to_state, event, reason, **metadata)
+        with self._state_lock:
+            success = self.transition_engine.transition(to_state, event, reason, **metadata)
         if success:
-            self._save_state()
+            self._save_state(immediate=to_state in TERMINAL_STATES)
         return success
 
     @property
@@ -108,9 +113,13 @@ class ArtemisStateMachineCore:
 
     @property
     def state_history(self) -> List[Any]:
-        """Get state transition history"""
+        """Get recent state transition history (bounded ring)"""
         return self.transition_engine.get_history()
 
+    def get_full_history(self) -> List[Dict[str, Any]]:
+        """Get every transition recorded for this card, from the on-disk log"""
+        return self.persistence.load_transitions()
+
     def update_stage_state(self, stage_name: str, state: StageState, **metadata) -> None:
         """
         Update state of a specific stage
@@ -120,7 +129,8 @@ class ArtemisStateMachineCore:
             state: New stage state
             **metadata: Additional metadata
         """
-        self.stage_manager.update_stage_state(stage_name, state, **metadata)
+        with self._state_lock:
+            self.stage_manager.update_stage_state(stage_name, state, **metadata)
         self._save_state()
 
     @property
@@ -281,14 +291,24 @@ class ArtemisStateMachineCore:
         """Get current pipeline state snapshot"""
         return PipelineSnapshot(state=self.current_state, timestamp=datetime.now(), card_id=self.card_id, stages=self.stage_states, active_stage=self.active_stage, health_status=self.workflow_executor.compute_health_status(), circuit_breakers_open=self.stage_manager.get_circuit_breakers_open(), active_issues=list(self.active_issues))
 
-    def _save_state(self) -> None:
-        """Persist state to disk"""
-        snapshot = self.get_snapshot()
-        self.persistence.save_snapshot(snapshot)
+    def _save_state(self, immediate: bool=False) -> None:
+        """
+        Persist state to disk
+
+        Args:
+            immediate: Write now instead of coalescing with later changes
+        """
+        self.persistence.schedule_snapshot(self.get_snapshot)
+        if immediate:
+            self.persistence.flush()
+
+    def flush(self) -> None:
+        """Write any pending state snapshot to disk now"""
+        self.persistence.flush()
 
     @property
     def stats(self) -> Dict[str, int]:
         """Get combined statistics from all components"""
         transition_stats = self.transition_engine.get_stats()
         workflow_stats = self.workflow_executor.get_stats()
-        return {**transition_stats, **workflow_stats}
\ No newline at end of file
+        return {**transition_stats, **workflow_stats, **self.persistence.stats}
\ No newline at end of file
@@ -1,13 +1,26 @@
 from artemis_logger import get_logger
 logger = get_logger('state_persistence')
-'\nWHY: Persist state machine state to disk for recovery and debugging\nRESPONSIBILITY: Save and load pipeline state snapshots to/from filesystem\nPATTERNS: Repository pattern for persistence, serialization strategy\n'
+'\nWHY: Persist state machine state to disk for recovery and debugging\nRESPONSIBILITY: Save and load pipeline state snapshots to/from filesystem\nPATTERNS: Repository pattern for persistence, serialization strategy\n\nSnapshots are coalesced: schedule_snapshot() arms a background flush at most\nonce per flush interval, so a burst of stage updates costs one write instead\nof one full-state rewrite each. Transitions go to an append-only JSONL log.\n'
+import atexit
 import json
+import os
+import threading
+import weakref
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any
+from typing import Callable, Dict, Any, List, Optional
 from state_machine.pipeline_snapshot import PipelineSnapshot
 from state_machine.pipeline_state import PipelineState
 from state_machine.stage_state_info import StageStateInfo
+from state_machine.state_transition import StateTransition
+DEFAULT_FLUSH_INTERVAL_MS = 250
+_LIVE_PERSISTENCE: 'weakref.WeakSet[StatePersistence]' = weakref.WeakSet()
+
+def _flush_all_on_exit() -> None:
+    """Write pending snapshots of every live StatePersistence at interpreter exit"""
+    for persistence in list(_LIVE_PERSISTENCE):
+        persistence.flush()
+atexit.register(_flush_all_on_exit)
 
 class StatePersistence:
     """
@@ -16,11 +29,13 @@ class StatePersistence:
     Features:
     - JSON-based state serialization
     - Automatic directory creation
-    - State snapshot saving
+    - State snapshot saving (atomic replace, compact JSON)
+    - Coalesced background snapshot flushing
+    - Append-only per-card transition log
     - Conversion to JSON-serializable format
     """
 
-    def __init__(self, state_dir: Path, card_id: str, verbose: bool=True) -> None:
+    def __init__(self, state_dir: Path, card_id: str, verbose: bool=True, flush_interval_ms: Optional[int]=None, snapshot_lock: Optional[threading.RLock]=None) -> None:
         """
         Initialize state persistence
 
@@ -28,11 +43,26 @@ class StatePersistence:
             state_dir: Directory for state files
             card_id: Kanban card ID
             verbose: Enable verbose logging
+            flush_interval_ms: Min time between coalesced snapshot writes
+                               (default ARTEMIS_STATE_FLUSH_MS or 250; 0 writes synchronously)
+            snapshot_lock: Lock the owner holds while mutating state; held
+                           while the flusher builds a snapshot
         """
         self.state_dir = state_dir
         self.card_id = card_id
         self.verbose = verbose
+        if flush_interval_ms is None:
+            flush_interval_ms = int(os.getenv('ARTEMIS_STATE_FLUSH_MS', DEFAULT_FLUSH_INTERVAL_MS))
+        self.flush_interval_ms = max(0, flush_interval_ms)
+        self._snapshot_lock = snapshot_lock or threading.RLock()
+        self._write_lock = threading.Lock()
+        self._timer_lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._snapshot_provider: Optional[Callable[[], PipelineSnapshot]] = None
+        self._dirty = False
+        self.stats = {'snapshots_requested': 0, 'snapshots_written': 0, 'transitions_logged': 0}
         self._ensure_state_directory()
+        _LIVE_PERSISTENCE.add(self)
 
     def _ensure_state_directory(self) -> None:
         """Ensure state directory exists"""
@@ -45,15 +75,119 @@ class StatePersistence:
         Args:
             snapshot: Snapshot to save
         """
+        self._write_state_data(self._convert_snapshot_to_json(snapshot))
+
+    def schedule_snapshot(self, snapshot_provider: Callable[[], PipelineSnapshot]) -> None:
+        """
+        Request a snapshot write, coalescing requests within the flush interval
+
+        WHY: A stage-heavy pipeline changes state hundreds of times; only the
+             latest state matters, so the flusher builds the snapshot when it
+             fires rather than when the change happens.
+
+        Args:
+            snapshot_provider: Builds the current snapshot (called at flush time)
+        """
+        self.stats['snapshots_requested'] += 1
+        self._snapshot_provider = snapshot_provider
+        if self.flush_interval_ms == 0:
+            self._dirty = True
+            self.flush()
+            return
+        with self._timer_lock:
+            self._dirty = True
+            if self._timer is not None:
+                return
+            self._timer = threading.Timer(self.flush_interval_ms / 1000, self._flush_from_timer)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _flush_from_timer(self) -> None:
+        """Timer callback - write the coalesced snapshot"""
+        with self._timer_lock:
+            self._timer = None
+        self.flush()
+
+    def flush(self) -> bool:
+        """
+        Write any pending snapshot now
+
+        Returns:
+            True if a snapshot was written
+        """
+        with self._write_lock:
+            with self._timer_lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                if not self._dirty or self._snapshot_provider is None:
+                    return False
+                self._dirty = False
+            try:
+                with self._snapshot_lock:
+                    state_data = self._convert_snapshot_to_json(self._snapshot_provider())
+                self._write_state_data(state_data)
+                return True
+            except Exception as e:
+                if self.verbose:
+
+                    logger.log(f'[StatePersistence] ⚠️  Failed to flush state: {e}', 'INFO')
+                return False
+
+    def _write_state_data(self, state_data: Dict[str, Any]) -> None:
+        """Atomically replace the state file (readers never see a partial write)"""
         state_file = self._get_state_file_path()
-        state_data = self._convert_snapshot_to_json(snapshot)
-        with open(state_file, 'w') as f:
-            json.dump(state_data, f, indent=2)
+        tmp_file = state_file.with_name(state_file.name + '.tmp')
+        with open(tmp_file, 'w') as f:
+            json.dump(state_data, f, separators=(',', ':'))
+        os.replace(tmp_file, state_file)
+        self.stats['snapshots_written'] += 1
+
+    def append_transition(self, transition: StateTransition) -> None:
+        """
+        Append one transition to the card's transition log
+
+        Args:
+            transition: Transition to record
+        """
+        record = {'ts': transition.timestamp.isoformat(), 'from': transition.from_state.value, 'to': transition.to_state.value, 'event': transition.event.value, 'reason': transition.reason, 'metadata': transition.metadata}
+        try:
+            with open(self._get_transition_log_path(), 'a') as f:
+                f.write(json.dumps(record, separators=(',', ':'), default=str) + '\n')
+            self.stats['transitions_logged'] += 1
+        except Exception as e:
+            if self.verbose:
+
+                logger.log(f'[StatePersistence] ⚠️  Failed to log transition: {e}', 'INFO')
+
+    def load_transitions(self) -> List[Dict[str, Any]]:
+        """
+        Load the full transition log (oldest first)
+
+        Returns:
+            Transition records, or empty list if none were logged
+        """
+        log_file = self._get_transition_log_path()
+        if not log_file.exists():
+            return []
+        records = []
+        with open(log_file, 'r') as f:
+            for line in f:
+                # Guard clause: skip a torn last line from a crash mid-append
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        return records
 
     def _get_state_file_path(self) -> Path:
         """Get state file path"""
         return self.state_dir / f'{self.card_id}_state.json'
 
+    def _get_transition_log_path(self) -> Path:
+        """Get transition log path"""
+        return self.state_dir / f'{self.card_id}_transitions.jsonl'
+
     def _convert_snapshot_to_json(self, snapshot: PipelineSnapshot) -> Dict[str, Any]:
         """
         Convert snapshot to JSON-serializable format
@@ -77,10 +211,11 @@ class StatePersistence:
         Returns:
             Snapshot data dictionary, or empty dict if not found
         """
+        self.flush()
         state_file = self._get_state_file_path()
         if not state_file.exists():
             if self.verbose:
-                
+
                 logger.log(f'[StatePersistence] No state file found: {state_file}', 'INFO')
             return {}
         try:
@@ -88,21 +223,26 @@ class StatePersistence:
                 return json.load(f)
         except Exception as e:
             if self.verbose:
-                
+
                 logger.log(f'[StatePersistence] ⚠️  Failed to load state: {e}', 'INFO')
             return {}
 
     def delete_snapshot(self) -> None:
-        """Delete state snapshot from disk"""
-        state_file = self._get_state_file_path()
-        if not state_file.exists():
-            return
-        try:
-            state_file.unlink()
-            if self.verbose:
-                
-                logger.log(f'[StatePersistence] Deleted state file: {state_file}', 'INFO')
-        except Exception as e:
-            if self.verbose:
-                
-                logger.log(f'[StatePersistence] ⚠️  Failed to delete state: {e}', 'INFO')
\ No newline at end of file
+        """Delete state snapshot and transition log from disk"""
+        with self._timer_lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._dirty = False
+        for state_file in (self._get_state_file_path(), self._get_transition_log_path()):
+            if not state_file.exists():
+                continue
+            try:
+                state_file.unlink()
+                if self.verbose:
+
+                    logger.log(f'[StatePersistence] Deleted state file: {state_file}', 'INFO')
+            except Exception as e:
+                if self.verbose:
+
+                    logger.log(f'[StatePersistence] ⚠️  Failed to delete state: {e}', 'INFO')
@@ -1,12 +1,15 @@
 from artemis_logger import get_logger
 logger = get_logger('state_transition_engine')
-'\nWHY: Execute state transitions with validation, history tracking, and event logging\nRESPONSIBILITY: Manage state transitions with audit trail and statistics\nPATTERNS: Command pattern for transitions, observer pattern for history tracking\n'
+'\nWHY: Execute state transitions with validation, history tracking, and event logging\nRESPONSIBILITY: Manage state transitions with audit trail and statistics\nPATTERNS: Command pattern for transitions, observer pattern for history tracking\n\nIn-memory history is a bounded ring; pass on_transition (e.g.\nStatePersistence.append_transition) to keep the full history on disk.\n'
+import os
+from collections import deque
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import Callable, Deque, List, Dict, Any, Optional
 from state_machine.pipeline_state import PipelineState
 from state_machine.event_type import EventType
 from state_machine.state_transition import StateTransition
 from state_machine.state_validator import StateValidator
+DEFAULT_HISTORY_LIMIT = 200
 
 class StateTransitionEngine:
     """
@@ -14,22 +17,28 @@ class StateTransitionEngine:
 
     Features:
     - Validates all transitions before execution
-    - Maintains complete audit trail
+    - Maintains audit trail (bounded ring in memory, observer for the rest)
     - Tracks transition statistics
     - Thread-safe state updates
     """
 
-    def __init__(self, verbose: bool=True) -> None:
+    def __init__(self, verbose: bool=True, history_limit: Optional[int]=None, on_transition: Optional[Callable[[StateTransition], None]]=None) -> None:
         """
         Initialize transition engine
 
         Args:
             verbose: Enable verbose logging
+            history_limit: Transitions kept in memory (default
+                           ARTEMIS_STATE_HISTORY_LIMIT or 200)
+            on_transition: Called with every executed transition
         """
         self.verbose = verbose
         self.validator = StateValidator()
         self.current_state = PipelineState.IDLE
-        self.state_history: List[StateTransition] = []
+        if history_limit is None:
+            history_limit = int(os.getenv('ARTEMIS_STATE_HISTORY_LIMIT', DEFAULT_HISTORY_LIMIT))
+        self.state_history: Deque[StateTransition] = deque(maxlen=max(1, history_limit))
+        self.on_transition = on_transition
         self.stats = {'total_transitions': 0, 'successful_transitions': 0, 'rejected_transitions': 0}
 
     def transition(self, to_state: PipelineState, event: EventType, reason: Optional[str]=None, **metadata) -> bool:
@@ -58,6 +67,8 @@ class StateTransitionEngine:
         transition = StateTransition(from_state=from_state, to_state=to_state, event=event, timestamp=datetime.now(), metadata=metadata, reason=reason)
         self.state_history.append(transition)
         self.current_state = to_state
+        if self.on_transition:
+            self.on_transition(transition)
         self.stats['total_transitions'] += 1
         self.stats['successful_transitions'] += 1
         self._log_transition(from_state, to_state, event, reason)
@@ -84,8 +95,8 @@ class StateTransitionEngine:
         return self.current_state
 
     def get_history(self) -> List[StateTransition]:
-        """Get complete state transition history"""
-        return self.state_history.copy()
+        """Get recent state transition history (up to history_limit, oldest first)"""
+        return list(self.state_history)
 
     def get_stats(self) -> Dict[str, int]:
         """Get transition statistics"""
@@ -18,3 +18,4 @@ class WorkflowAction:
     retry_on_failure: bool = True
     max_retries: int = 3
     rollback_handler: Optional[Callable] = None
+    dependency: Optional[str] = None  # Retry budget key (defaults to action_name)
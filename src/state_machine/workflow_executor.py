@@ -1,38 +1,41 @@
 from artemis_logger import get_logger
 logger = get_logger('workflow_executor')
 '\nWHY: Execute recovery workflows with retry, rollback, and issue tracking\nRESPONSIBILITY: Orchestrate workflow execution, handle failures, track issues\nPATTERNS: Command pattern for actions, template method for execution flow\n'
-import time
 from datetime import datetime
 from typing import Dict, Any, Optional, Set, List
-from artemis_constants import RETRY_BACKOFF_FACTOR
+from utilities.retry_engine import DEADLINE_CONTEXT_KEY, STOP_BUDGET_EXHAUSTED, STOP_DEADLINE_EXCEEDED, BackoffPolicy, Deadline, RetryEngine, get_deadline, get_retry_engine
 from state_machine.issue_type import IssueType
 from state_machine.pipeline_state import PipelineState
 from state_machine.event_type import EventType
 from state_machine.workflow import Workflow
 from state_machine.workflow_action import WorkflowAction
 from state_machine.workflow_execution import WorkflowExecution
+ACTION_BACKOFF = BackoffPolicy(base_delay=1.0)
 
 class WorkflowExecutor:
     """
     Executes recovery workflows with retry and rollback support
 
     Features:
-    - Sequential action execution with retry
+    - Sequential action execution with retry (shared retry engine: jittered
+      backoff, per-dependency retry budgets, deadline from context)
     - Automatic rollback on failure
     - Issue tracking and resolution
     - Health status monitoring
     """
 
-    def __init__(self, workflows: Dict[IssueType, Workflow], verbose: bool=True) -> None:
+    def __init__(self, workflows: Dict[IssueType, Workflow], verbose: bool=True, retry_engine: Optional[RetryEngine]=None) -> None:
         """
         Initialize workflow executor
 
         Args:
             workflows: Registry of workflows by issue type
             verbose: Enable verbose logging
+            retry_engine: Retry engine (default: process-wide shared engine)
         """
         self.workflows = workflows
         self.verbose = verbose
+        self.retry_engine = retry_engine or get_retry_engine()
         self.workflow_history: List[WorkflowExecution] = []
         self.active_issues: Set[IssueType] = set()
         self.resolved_issues: List[IssueType] = []
@@ -67,13 +70,15 @@ class WorkflowExecutor:
             
             logger.log(f'[WorkflowExecutor] ✅ Issue resolved: {issue_type.value}', 'INFO')
 
-    def execute_workflow(self, issue_type: IssueType, context: Optional[Dict[str, Any]]=None) -> bool:
+    def execute_workflow(self, issue_type: IssueType, context: Optional[Dict[str, Any]]=None, deadline: Optional[Deadline]=None) -> bool:
         """
         Execute recovery workflow for an issue
 
         Args:
             issue_type: Type of issue to handle
             context: Context for workflow execution
+            deadline: Stop retrying actions at this deadline; handlers see it
+                      as context['deadline'] (an existing one is kept otherwise)
 
         Returns:
             True if workflow succeeded
@@ -82,6 +87,8 @@ class WorkflowExecutor:
         if not workflow:
             self._log_missing_workflow(issue_type)
             return False
+        if deadline is not None:
+            context = {**(context or {}), DEADLINE_CONTEXT_KEY: deadline}
         execution = self._create_execution_record(workflow, issue_type)
         self.stats['workflow_executions'] += 1
         if self.verbose:
@@ -116,33 +123,28 @@ class WorkflowExecutor:
             True if action succeeded
         """
         max_attempts = action.max_retries if action.retry_on_failure else 1
-        for attempt in range(max_attempts):
-            success = self._attempt_action(action, context, attempt, max_attempts)
-            if success:
-                return True
-            should_retry = action.retry_on_failure and attempt < max_attempts - 1
-            if not should_retry:
-                return False
-            time.sleep(RETRY_BACKOFF_FACTOR ** attempt)
-        return False
+        outcome = self.retry_engine.run(lambda attempt: self._attempt_action(action, context), dependency=action.dependency or action.action_name, max_attempts=max_attempts, backoff=ACTION_BACKOFF, is_success=bool, deadline=get_deadline(context), on_retry=lambda attempt, delay, error: self._log_retry(action, attempt, delay))
+        if outcome.stop_reason in (STOP_BUDGET_EXHAUSTED, STOP_DEADLINE_EXCEEDED) and self.verbose:
+
+            logger.log(f'[WorkflowExecutor]       Not retrying {action.action_name}: {outcome.stop_reason}', 'INFO')
+        return outcome.succeeded
 
-    def _attempt_action(self, action: WorkflowAction, context: Dict[str, Any], attempt: int, max_attempts: int) -> bool:
+    def _attempt_action(self, action: WorkflowAction, context: Dict[str, Any]) -> bool:
         """Attempt action execution"""
         try:
-            result = action.handler(context)
-            if result:
-                return True
-            should_retry = action.retry_on_failure and attempt < max_attempts - 1
-            if should_retry and self.verbose:
-                
-                logger.log(f'[WorkflowExecutor]       Retry {attempt + 1}/{action.max_retries}', 'INFO')
-            return False
+            return bool(action.handler(context))
         except Exception as e:
             if self.verbose:
                 
                 logger.log(f'[WorkflowExecutor]       Error: {e}', 'INFO')
             return False
 
+    def _log_retry(self, action: WorkflowAction, attempt: int, delay: float) -> None:
+        """Log an upcoming retry"""
+        if self.verbose:
+
+            logger.log(f'[WorkflowExecutor]       Retry {attempt + 1}/{action.max_retries} in {delay:.1f}s', 'INFO')
+
     def _handle_action_failure(self, execution: WorkflowExecution, workflow: Workflow, action: WorkflowAction) -> bool:
         """Handle failure of a workflow action"""
         if workflow.rollback_on_failure:
@@ -227,4 +229,8 @@ class WorkflowExecutor:
 
     def get_stats(self) -> Dict[str, int]:
         """Get workflow execution statistics"""
-        return self.stats.copy()
\ No newline at end of file
+        return self.stats.copy()
+
+    def get_retry_metrics(self) -> Dict[str, Dict[str, float]]:
+        """Retry counters per dependency from the shared retry engine"""
+        return self.retry_engine.get_metrics()
\ No newline at end of file
@@ -9,11 +9,32 @@ CircuitBreakerManager provides:
 - Automatic circuit opening on threshold breach
 - Automatic circuit closing after timeout
 - Health statistics and monitoring
+- Optional shared state store so parallel pipeline processes see each
+  other's stage failures and open circuits
 """
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Any
+from typing import Callable, Dict, Optional, Any, TypeVar
 from artemis_stage_interface import LoggerInterface
+from core.resilience.state_store import CircuitStateStore, Record
 from supervisor.circuit_breaker.models import StageHealth, RecoveryStrategy, CircuitState
+T = TypeVar('T')
+SHARED_HEALTH_FIELDS = ('failure_count', 'last_failure', 'circuit_open', 'circuit_open_until')
+
+def _health_to_record(health: StageHealth, record: Record) -> None:
+    """Copy the shared health fields into a store record (datetimes as epoch seconds)"""
+    for field in SHARED_HEALTH_FIELDS:
+        value = getattr(health, field)
+        record[field] = value.timestamp() if isinstance(value, datetime) else value
+
+def _health_from_record(health: StageHealth, record: Record) -> None:
+    """Apply a store record's shared health fields to local health"""
+    if not record:
+        return
+    health.failure_count = record.get('failure_count', 0)
+    health.circuit_open = record.get('circuit_open', False)
+    for field in ('last_failure', 'circuit_open_until'):
+        value = record.get(field)
+        setattr(health, field, datetime.fromtimestamp(value) if value is not None else None)
 
 class CircuitBreakerManager:
     """
@@ -26,18 +47,23 @@ class CircuitBreakerManager:
     - Provide health status for stages
 
     Thread-Safety: Not thread-safe (assumes single-threaded pipeline execution)
+    Process-Sharing: With a state_store, failure counts and open circuits are
+    read and updated atomically in the store (execution counts and durations
+    stay per process)
     """
 
-    def __init__(self, logger: Optional[LoggerInterface]=None, verbose: bool=True):
+    def __init__(self, logger: Optional[LoggerInterface]=None, verbose: bool=True, state_store: Optional[CircuitStateStore]=None):
         """
         Initialize Circuit Breaker Manager
 
         Args:
             logger: Logger for recording events
             verbose: Enable verbose logging
+            state_store: Shared state store (None keeps stage health in this process)
         """
         self.logger = logger
         self.verbose = verbose
+        self.state_store = state_store
         self.stage_health: Dict[str, StageHealth] = {}
         self.recovery_strategies: Dict[str, RecoveryStrategy] = {}
 
@@ -67,17 +93,19 @@ class CircuitBreakerManager:
         """
         if stage_name not in self.stage_health:
             return False
-        health = self.stage_health[stage_name]
+        return self._shared(stage_name, self._check_circuit)
+
+    def _check_circuit(self, health: StageHealth) -> bool:
         if not health.circuit_open:
             return False
         if health.circuit_open_until and datetime.now() > health.circuit_open_until:
             health.circuit_open = False
             health.circuit_open_until = None
-            self._log(f'Circuit breaker auto-closed for {stage_name}')
+            self._log(f'Circuit breaker auto-closed for {health.stage_name}')
             return False
         if health.circuit_open_until:
             time_remaining = (health.circuit_open_until - datetime.now()).seconds
-            self._log(f'⚠️  Circuit breaker OPEN for {stage_name} ({time_remaining}s remaining)')
+            self._log(f'⚠️  Circuit breaker OPEN for {health.stage_name} ({time_remaining}s remaining)')
         return True
 
     def open_circuit(self, stage_name: str) -> None:
@@ -90,11 +118,13 @@ class CircuitBreakerManager:
         if stage_name not in self.stage_health:
             self._log(f'Cannot open circuit for unregistered stage: {stage_name}', level='WARNING')
             return
-        health = self.stage_health[stage_name]
-        strategy = self.recovery_strategies.get(stage_name, RecoveryStrategy())
+        self._shared(stage_name, self._open_circuit)
+
+    def _open_circuit(self, health: StageHealth) -> None:
+        strategy = self.recovery_strategies.get(health.stage_name, RecoveryStrategy())
         health.circuit_open = True
         health.circuit_open_until = datetime.now() + timedelta(seconds=strategy.circuit_breaker_timeout_seconds)
-        self._log(f'🚨 Circuit breaker OPEN for {stage_name} (timeout: {strategy.circuit_breaker_timeout_seconds}s, failures: {health.failure_count})')
+        self._log(f'🚨 Circuit breaker OPEN for {health.stage_name} (timeout: {strategy.circuit_breaker_timeout_seconds}s, failures: {health.failure_count})')
 
     def close_circuit(self, stage_name: str) -> None:
         """
@@ -105,10 +135,12 @@ class CircuitBreakerManager:
         """
         if stage_name not in self.stage_health:
             return
-        health = self.stage_health[stage_name]
+        self._shared(stage_name, self._close_circuit)
+
+    def _close_circuit(self, health: StageHealth) -> None:
         health.circuit_open = False
         health.circuit_open_until = None
-        self._log(f'Circuit breaker manually closed for {stage_name}')
+        self._log(f'Circuit breaker manually closed for {health.stage_name}')
 
     def record_failure(self, stage_name: str) -> None:
         """
@@ -119,13 +151,15 @@ class CircuitBreakerManager:
         """
         if stage_name not in self.stage_health:
             self.register_stage(stage_name)
-        health = self.stage_health[stage_name]
-        strategy = self.recovery_strategies.get(stage_name, RecoveryStrategy())
+        self._shared(stage_name, self._record_failure)
+
+    def _record_failure(self, health: StageHealth) -> None:
+        strategy = self.recovery_strategies.get(health.stage_name, RecoveryStrategy())
         health.failure_count += 1
         health.last_failure = datetime.now()
-        self._log(f'Stage {stage_name} failed ({health.failure_count}/{strategy.circuit_breaker_threshold})')
+        self._log(f'Stage {health.stage_name} failed ({health.failure_count}/{strategy.circuit_breaker_threshold})')
         if health.failure_count >= strategy.circuit_breaker_threshold:
-            self.open_circuit(stage_name)
+            self._open_circuit(health)
 
     def record_success(self, stage_name: str, duration: float=0.0) -> None:
         """
@@ -138,12 +172,15 @@ class CircuitBreakerManager:
         if stage_name not in self.stage_health:
             self.register_stage(stage_name)
         health = self.stage_health[stage_name]
-        health.failure_count = 0
-        health.last_failure = None
         health.execution_count += 1
         health.total_duration += duration
+        self._shared(stage_name, self._record_success)
+
+    def _record_success(self, health: StageHealth) -> None:
+        health.failure_count = 0
+        health.last_failure = None
         if health.circuit_open:
-            self.close_circuit(stage_name)
+            self._close_circuit(health)
 
     def get_stage_health(self, stage_name: str) -> Optional[StageHealth]:
         """
@@ -155,6 +192,7 @@ class CircuitBreakerManager:
         Returns:
             StageHealth object or None if stage not registered
         """
+        self._refresh(stage_name)
         return self.stage_health.get(stage_name)
 
     def get_all_health(self) -> Dict[str, StageHealth]:
@@ -164,6 +202,8 @@ class CircuitBreakerManager:
         Returns:
             Dict mapping stage name to StageHealth
         """
+        for stage_name in self.stage_health:
+            self._refresh(stage_name)
         return self.stage_health.copy()
 
     def get_recovery_strategy(self, stage_name: str) -> Optional[RecoveryStrategy]:
@@ -185,6 +225,8 @@ class CircuitBreakerManager:
         Returns:
             List of stage names with open circuits
         """
+        for stage_name in self.stage_health:
+            self._refresh(stage_name)
         return [name for name, health in self.stage_health.items() if health.circuit_open]
 
     def reset_all(self) -> None:
@@ -192,10 +234,13 @@ class CircuitBreakerManager:
         Reset all circuit breakers (close all circuits)
         """
         for stage_name in self.stage_health:
-            self.close_circuit(stage_name)
-            self.stage_health[stage_name].failure_count = 0
+            self._shared(stage_name, self._reset_stage)
         self._log('Reset all circuit breakers')
 
+    def _reset_stage(self, health: StageHealth) -> None:
+        self._close_circuit(health)
+        health.failure_count = 0
+
     def get_statistics(self) -> Dict[str, Any]:
         """
         Get circuit breaker statistics
@@ -209,6 +254,43 @@ class CircuitBreakerManager:
         total_executions = sum((h.execution_count for h in self.stage_health.values()))
         return {'total_stages': total_stages, 'open_circuits': open_circuits, 'closed_circuits': total_stages - open_circuits, 'total_failures': total_failures, 'total_executions': total_executions, 'stages': {name: {'failure_count': health.failure_count, 'execution_count': health.execution_count, 'circuit_open': health.circuit_open, 'avg_duration': health.total_duration / max(health.execution_count, 1)} for name, health in self.stage_health.items()}}
 
+    def _shared(self, stage_name: str, operation: Callable[[StageHealth], T]) -> T:
+        """
+        Apply an operation to a stage's health, via the shared store if any.
+
+        WHY: Loads the latest shared failure count / circuit state first and
+             writes the result back in one store transaction, so concurrent
+             pipelines do not lose each other's failures. Falls back to local
+             health if the store is unreachable.
+        """
+        health = self.stage_health[stage_name]
+        if self.state_store is None:
+            return operation(health)
+        applied = []
+
+        def apply(record: Record) -> T:
+            _health_from_record(health, record)
+            result = operation(health)
+            _health_to_record(health, record)
+            applied.append(result)
+            return result
+        try:
+            return self.state_store.update(f'stage:{stage_name}', apply)
+        except Exception as e:
+            self._log(f'Circuit breaker state store unavailable: {e}', level='WARNING')
+            if applied:
+                return applied[-1]
+            return operation(health)
+
+    def _refresh(self, stage_name: str) -> None:
+        """Load a stage's shared health for read-only queries"""
+        if self.state_store is None or stage_name not in self.stage_health:
+            return
+        try:
+            _health_from_record(self.stage_health[stage_name], self.state_store.load(f'stage:{stage_name}'))
+        except Exception as e:
+            self._log(f'Circuit breaker state store unavailable: {e}', level='WARNING')
+
     def _log(self, message: str, level: str='INFO') -> None:
         """
         Log a message with fallback to console
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Tests for size- and age-budgeted artifact retention
+
+WHY: Validates that each artifact class is held to its own age and size
+     budget, that dry runs change nothing, that card histories are archived
+     rather than only deleted, and that artifacts of running cards (and
+     recently written ones) are never touched.
+"""
+
+import json
+import os
+import shutil
+import sys
+import tarfile
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from utilities.retention import (
+    ACTION_ARCHIVE,
+    REASON_ACTIVE_CARD,
+    REASON_AGE,
+    REASON_RECENT,
+    REASON_SIZE,
+    RetentionManager,
+    RetentionPolicy,
+    main,
+)
+from workflows.handlers import WorkflowHandlerFactory
+
+DAY = 86400
+
+
+class TestRetentionManager(unittest.TestCase):
+
+    def setUp(self):
+        self.base = Path(tempfile.mkdtemp(prefix="artemis_retention_test_"))
+        self.now = time.time()
+        self.status = self.base / "status"
+        self.status.mkdir()
+
+    def tearDown(self):
+        shutil.rmtree(self.base, ignore_errors=True)
+
+    def write(self, relative, size=10, age_days=0.0):
+        path = self.base / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"x" * size)
+        stamp = self.now - age_days * DAY
+        os.utime(path, (stamp, stamp))
+        return path
+
+    def manager(self, *policies, min_age_seconds=0):
+        return RetentionManager(
+            policies=list(policies),
+            archive_dir=self.base / "archive",
+            status_dir=self.status,
+            min_age_seconds=min_age_seconds,
+            clock=lambda: self.now,
+        )
+
+    def test_age_then_size_budget_oldest_first(self):
+        old = self.write("temp/old.txt", 100, age_days=10)
+        older_dir = self.write("temp/run-a/out.txt", 100, age_days=5).parent
+        mid = self.write("temp/mid.txt", 100, age_days=3)
+        new = self.write("temp/new.txt", 100, age_days=1)
+        policy = RetentionPolicy("temp", self.base / "temp", max_bytes=250, max_age_days=7)
+
+        report = self.manager(policy).run()
+
+        evicted = [(Path(item.path).name, item.reason) for item in report.classes[0].evicted]
+        self.assertEqual(evicted, [("old.txt", REASON_AGE), ("run-a", REASON_SIZE)])
+        self.assertFalse(old.exists() or older_dir.exists())
+        self.assertTrue(mid.exists() and new.exists())
+        self.assertEqual((report.freed_bytes, report.classes[0].kept_bytes), (200, 200))
+
+    def test_dry_run_reports_without_touching_files(self):
+        old = self.write("temp/old.txt", 100, age_days=10)
+        policy = RetentionPolicy("temp", self.base / "temp", max_age_days=7)
+
+        report = self.manager(policy).run(dry_run=True)
+
+        self.assertTrue(old.exists())
+        self.assertEqual(report.evicted_count, 1)
+        self.assertIn("would free", report.format())
+        self.assertTrue(report.to_dict()["dry_run"])
+
+    def test_card_histories_are_archived(self):
+        self.write("checkpoints/card-1.json", 50, age_days=40)
+        self.write("checkpoints/card-2.json", 50, age_days=1)
+        policy = RetentionPolicy("checkpoints", self.base / "checkpoints", max_age_days=30, action=ACTION_ARCHIVE)
+
+        report = self.manager(policy).run()
+
+        archive_path = Path(report.classes[0].archive_path)
+        with tarfile.open(archive_path) as bundle:
+            self.assertEqual(bundle.getnames(), ["card-1.json"])
+        self.assertEqual([path.name for path in (self.base / "checkpoints").iterdir()], ["card-2.json"])
+        self.assertEqual([path.name for path in archive_path.parent.iterdir()], [archive_path.name])
+
+    def test_running_and_recent_artifacts_are_protected(self):
+        (self.status / "card-7.json").write_text(json.dumps({"card_id": "card-7", "status": "running"}))
+        (self.status / "card-8.json").write_text(json.dumps({"card_id": "card-8", "status": "completed"}))
+        running = self.write("state/card-7_state.json", age_days=60)
+        explicit = self.write("state/card-9_state.json", age_days=60)
+        recent = self.write("state/card-10_state.json", age_days=0)
+        finished = self.write("state/card-8_state.json", age_days=60)
+        similar = self.write("state/card-70_state.json", age_days=60)
+        policy = RetentionPolicy("state", self.base / "state", max_bytes=0, max_age_days=30)
+
+        report = self.manager(policy, min_age_seconds=3600).run(active_card_ids=["card-9"])
+
+        protected = {Path(item.path).name: item.reason for item in report.classes[0].protected}
+        self.assertEqual(protected, {
+            "card-7_state.json": REASON_ACTIVE_CARD,
+            "card-9_state.json": REASON_ACTIVE_CARD,
+            "card-10_state.json": REASON_RECENT,
+        })
+        self.assertTrue(running.exists() and explicit.exists() and recent.exists())
+        self.assertFalse(finished.exists() or similar.exists())
+        self.assertEqual(report.active_card_ids, ["card-7", "card-9"])
+
+    def test_message_inboxes_use_nested_pattern(self):
+        stale = self.write("messages/developer-a/20240101_a_to_b_update.json", age_days=9)
+        fresh = self.write("messages/developer-a/20240301_a_to_b_update.json", age_days=2)
+        policy = RetentionPolicy("messages", self.base / "messages", pattern="*/*.json", max_age_days=7)
+
+        self.manager(policy).run()
+
+        self.assertFalse(stale.exists())
+        self.assertTrue(fresh.exists() and fresh.parent.is_dir())
+
+
+class TestRetentionEntryPoints(unittest.TestCase):
+
+    def setUp(self):
+        self.base = Path(tempfile.mkdtemp(prefix="artemis_retention_test_"))
+        self.env = dict(os.environ)
+        os.environ["ARTEMIS_TEMP_DIR"] = str(self.base / "temp")
+        os.environ["ARTEMIS_STATUS_DIR"] = str(self.base / "status")
+        old = self.base / "temp" / "old.txt"
+        old.parent.mkdir()
+        old.write_text("stale")
+        os.utime(old, (time.time() - 30 * DAY,) * 2)
+        self.old = old
+
+    def tearDown(self):
+        os.environ.clear()
+        os.environ.update(self.env)
+        shutil.rmtree(self.base, ignore_errors=True)
+
+    def test_cli_dry_run_json(self):
+        with patch("builtins.print") as printed:
+            exit_code = main(["--dry-run", "--class", "temp", "--json"])
+
+        report = json.loads(printed.call_args[0][0])
+        self.assertEqual(exit_code, 0)
+        self.assertEqual([entry["name"] for entry in report["classes"]], ["temp"])
+        self.assertEqual(report["classes"][0]["evicted"][0]["path"], str(self.old))
+        self.assertTrue(self.old.exists())
+
+    def test_workflow_handler_registered(self):
+        context = {"card_id": "card-1", "dry_run": True}
+
+        self.assertTrue(WorkflowHandlerFactory.create("enforce_retention").handle(context))
+        self.assertTrue(context["retention_report"]["dry_run"])
+        self.assertIn("card-1", context["retention_report"]["active_card_ids"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Tests for the queue-backed ArtemisLogger pipeline
+
+WHY: Validates that records are written by the background writer (not the
+     calling thread), that concurrent writers lose nothing, that DEBUG
+     bursts are rate-limited while errors always get through, that a full
+     queue drops only sub-ERROR records, that JSON output is available, and
+     that queued records reach disk when the process exits.
+"""
+
+import json
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from artemis_logger import ArtemisLogger, DebugRateLimiter, LogPipeline, flush_logs
+
+
+class LoggerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.log_dir = Path(tempfile.mkdtemp(prefix="artemis_log_test_"))
+
+    def tearDown(self):
+        flush_logs()
+        shutil.rmtree(self.log_dir, ignore_errors=True)
+
+    def make_logger(self, component, **env):
+        with patch.dict(os.environ, env):
+            return ArtemisLogger(component=component, log_dir=str(self.log_dir), log_level="DEBUG")
+
+    def lines(self, name):
+        return (self.log_dir / name).read_text().splitlines()
+
+
+class TestQueuedLogging(LoggerTestCase):
+
+    def test_records_are_written_off_thread_and_complete(self):
+        logger = self.make_logger("async_writer")
+        writer_threads = set()
+        original_emit = logging.handlers.RotatingFileHandler.emit
+
+        def tracking_emit(handler, record):
+            writer_threads.add(threading.current_thread().name)
+            original_emit(handler, record)
+
+        with patch.object(logging.handlers.RotatingFileHandler, "emit", tracking_emit):
+            workers = [
+                threading.Thread(target=lambda n=n: [logger.info(f"worker {n} line {i}") for i in range(50)])
+                for n in range(4)
+            ]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            logger.error("stage failed")
+            self.assertTrue(logger.flush())
+
+        lines = self.lines("artemis_async_writer.log")
+        self.assertEqual(len(lines), 201)
+        for n in range(4):
+            ordered = [line for line in lines if f"worker {n} " in line]
+            self.assertEqual(ordered, sorted(ordered, key=lambda line: int(line.rsplit(" ", 1)[1])))
+        self.assertEqual(writer_threads, {"artemis-log-writer"})
+        self.assertIn("stage failed", self.lines("artemis_errors.log")[-1])
+
+    def test_json_output(self):
+        logger = self.make_logger("json_output", ARTEMIS_LOG_FORMAT="json")
+
+        logger.warning("retrying stage")
+        logger.flush()
+
+        record = json.loads(self.lines("artemis_json_output.log")[-1])
+        self.assertEqual((record["level"], record["logger"], record["message"]), ("WARNING", "artemis.json_output", "retrying stage"))
+
+    def test_debug_burst_is_rate_limited_but_errors_are_kept(self):
+        limiter = DebugRateLimiter(rate_per_second=10, burst=5)
+        allowed = [limiter.allow("artemis.chatty", now=100.0) for _ in range(20)]
+        self.assertEqual(allowed.count(True), 5)
+        self.assertTrue(limiter.allow("artemis.chatty", now=100.2))
+        self.assertTrue(limiter.allow("artemis.quiet", now=100.0))
+
+        # Default budget: 100 DEBUG records/second per logger
+        logger = self.make_logger("chatty")
+        for i in range(500):
+            logger.debug(f"token {i}")
+        logger.error("real problem")
+        logger.flush()
+
+        lines = self.lines("artemis_chatty.log")
+        self.assertLess(sum("token" in line for line in lines), 500)
+        self.assertTrue(any("real problem" in line for line in lines))
+
+
+class TestLogPipeline(unittest.TestCase):
+
+    def record(self, level, message):
+        return logging.LogRecord("artemis.unit", level, __file__, 0, message, None, None)
+
+    def test_full_queue_drops_only_below_error(self):
+        pipeline = LogPipeline(maxsize=2, debug_rate=0)
+        written = []
+        handler = logging.Handler()
+        handler.emit = lambda record: written.append(record.getMessage())
+        pipeline.route("artemis.unit", [handler])
+
+        # Writer not started yet: the queue fills up
+        with patch.object(pipeline, "_ensure_worker"):
+            for i in range(4):
+                pipeline.submit(self.record(logging.INFO, f"info {i}"), "artemis.unit")
+        self.assertEqual(pipeline.stats()["dropped"], {"artemis.unit": 2})
+
+        pipeline.submit(self.record(logging.ERROR, "never dropped"), "artemis.unit")
+        pipeline.shutdown()
+
+        self.assertEqual(sorted(written), ["2 records dropped (log queue full)", "info 0", "info 1", "never dropped"])
+
+
+class TestShutdownFlush(LoggerTestCase):
+
+    def test_queued_records_written_at_exit(self):
+        script = (
+            "import sys; sys.path.insert(0, sys.argv[1])\n"
+            "from artemis_logger import ArtemisLogger\n"
+            "logger = ArtemisLogger(component='exit', log_dir=sys.argv[2])\n"
+            "for i in range(2000):\n"
+            "    logger.info(f'line {i}')\n"
+            "raise SystemExit(3)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script, str(Path(__file__).parent), str(self.log_dir)],
+            capture_output=True, text=True, timeout=60
+        )
+
+        self.assertEqual(result.returncode, 3)
+        self.assertEqual(len(self.lines("artemis_exit.log")), 2000)
+
+
+if __name__ == "__main__":
+    unittest.main()
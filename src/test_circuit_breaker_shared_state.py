@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Tests for shared circuit breaker state and adaptive concurrency limiting
+
+WHY: Validates that breakers of the same name in different processes share
+     one state through the store, that the supervisor's stage breakers do the
+     same, and that the AIMD limiter backs off on throttling and latency
+     spikes and grows back while calls are healthy.
+"""
+
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from core.resilience import (
+    AdaptiveConcurrencyLimiter,
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitBreakerOpenError,
+    CircuitState,
+    ConcurrencyLimitExceeded,
+    SQLiteStateStore,
+    is_throttle_error,
+)
+from supervisor.circuit_breaker import CircuitBreakerManager, RecoveryStrategy
+
+
+class ProviderThrottled(Exception):
+    status_code = 429
+
+
+def fail_once(db_path):
+    breaker = CircuitBreaker("llm", CircuitBreakerConfig(failure_threshold=3), state_store=SQLiteStateStore(db_path))
+    try:
+        breaker.call(lambda: 1 / 0)
+    except ZeroDivisionError:
+        pass
+
+
+class TestSharedCircuitBreaker(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "circuits.db")
+        self.config = CircuitBreakerConfig(failure_threshold=3, timeout_seconds=60)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _breaker(self, name="llm"):
+        return CircuitBreaker(name, self.config, state_store=SQLiteStateStore(self.db_path))
+
+    def test_breakers_share_open_state(self):
+        first, second = self._breaker(), self._breaker()
+        for breaker in (first, second, first):
+            with self.assertRaises(ZeroDivisionError):
+                breaker.call(lambda: 1 / 0)
+
+        # The third failure (across both breakers) opened the shared circuit
+        self.assertEqual(second.state, CircuitState.OPEN)
+        with self.assertRaises(CircuitBreakerOpenError):
+            second.call(lambda: "not called")
+
+        status = second.get_status()
+        self.assertTrue(status["shared"])
+        self.assertGreater(status["time_until_retry"], 0)
+
+        first.reset()
+        self.assertEqual(second.call(lambda: "ok"), "ok")
+
+    def test_failures_from_other_processes_open_circuit(self):
+        context = multiprocessing.get_context("fork")
+        workers = [context.Process(target=fail_once, args=(self.db_path,)) for _ in range(3)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(30)
+            self.assertEqual(worker.exitcode, 0)
+
+        breaker = self._breaker()
+        self.assertEqual(breaker.state, CircuitState.OPEN)
+        self.assertEqual(breaker.failure_count, 3)
+
+    def test_local_breaker_status_when_open(self):
+        breaker = CircuitBreaker("local", CircuitBreakerConfig(failure_threshold=1))
+        with self.assertRaises(ZeroDivisionError):
+            breaker.call(lambda: 1 / 0)
+        status = breaker.get_status()
+        self.assertEqual(status["state"], CircuitState.OPEN)
+        self.assertFalse(status["shared"])
+
+    def test_supervisor_manager_shares_stage_circuits(self):
+        store = SQLiteStateStore(self.db_path)
+        strategy = RecoveryStrategy(circuit_breaker_threshold=2, circuit_breaker_timeout_seconds=60)
+        first = CircuitBreakerManager(verbose=False, state_store=store)
+        second = CircuitBreakerManager(verbose=False, state_store=SQLiteStateStore(self.db_path))
+        for manager in (first, second):
+            manager.register_stage("development", strategy)
+
+        first.record_failure("development")
+        second.record_failure("development")
+
+        self.assertTrue(first.check_circuit("development"))
+        self.assertEqual(second.get_open_circuits(), ["development"])
+
+        second.record_success("development", duration=1.0)
+        self.assertFalse(first.check_circuit("development"))
+        self.assertEqual(first.get_stage_health("development").failure_count, 0)
+
+
+class TestAdaptiveConcurrencyLimiter(unittest.TestCase):
+
+    def test_throttling_halves_limit_once_per_cooldown(self):
+        limiter = AdaptiveConcurrencyLimiter("llm", initial_limit=8, cooldown_seconds=60)
+        for _ in range(3):
+            with self.assertRaises(ProviderThrottled):
+                limiter.call(self._raise_throttled)
+        self.assertEqual(limiter.limit, 4)
+        self.assertEqual(limiter.get_status()["throttled"], 3)
+
+    def test_healthy_calls_grow_limit_additively(self):
+        limiter = AdaptiveConcurrencyLimiter("llm", initial_limit=2, max_limit=4)
+        # +1/limit per healthy call: 2 -> 2.5 -> 2.9 -> 3.24
+        for _ in range(3):
+            limiter.call(lambda: None)
+        self.assertEqual(limiter.limit, 3)
+        for _ in range(20):
+            limiter.call(lambda: None)
+        self.assertEqual(limiter.limit, 4)
+
+    def test_latency_spike_decreases_limit(self):
+        limiter = AdaptiveConcurrencyLimiter("llm", initial_limit=8, latency_target_seconds=0.01, cooldown_seconds=0)
+        limiter.call(time.sleep, 0.03)
+        self.assertEqual(limiter.limit, 4)
+
+    def test_slots_block_at_limit(self):
+        limiter = AdaptiveConcurrencyLimiter("llm", initial_limit=1)
+        release = threading.Event()
+        holder = threading.Thread(target=limiter.call, args=(release.wait,))
+        holder.start()
+        while limiter.in_flight == 0:
+            time.sleep(0.01)
+
+        with self.assertRaises(ConcurrencyLimitExceeded):
+            limiter.acquire(timeout=0.05)
+
+        release.set()
+        holder.join()
+        with limiter.slot(timeout=1):
+            self.assertEqual(limiter.in_flight, 1)
+
+    def test_breaker_uses_limiter_for_calls_and_blocks(self):
+        limiter = AdaptiveConcurrencyLimiter("llm", initial_limit=4, cooldown_seconds=0)
+        breaker = CircuitBreaker("llm-limited", concurrency_limiter=limiter)
+        self.assertEqual(breaker.call(lambda: "ok"), "ok")
+        with self.assertRaises(ProviderThrottled):
+            with breaker:
+                self._raise_throttled()
+        self.assertEqual(limiter.limit, 2)
+        self.assertEqual(breaker.get_status()["concurrency"]["in_flight"], 0)
+
+    def test_is_throttle_error(self):
+        self.assertTrue(is_throttle_error(ProviderThrottled()))
+        self.assertTrue(is_throttle_error(RuntimeError("Error code: 429 - Too Many Requests")))
+        self.assertFalse(is_throttle_error(ValueError("bad input")))
+
+    @staticmethod
+    def _raise_throttled():
+        raise ProviderThrottled("rate limited")
+
+
+if __name__ == "__main__":
+    unittest.main()
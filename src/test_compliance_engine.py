@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Tests for the single-pass WCAG/GDPR compliance engine
+
+WHY: Validates that one markup parse feeds all accessibility rules, that the
+     WCAG and GDPR evaluators can share one ComplianceReport, that results
+     are reused for unchanged content and that the process pool returns the
+     same findings as in-process evaluation.
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import compliance_engine
+from compliance_engine import ComplianceEngine, scan_markup
+from gdpr_evaluator import GDPREvaluator
+from wcag_evaluator import WCAGEvaluator
+
+PAGE = """<html>
+<body>
+<h1>Sign up</h1><h3>Details</h3>
+<img src="logo.png">
+<label for="name">Name</label><input type="text" id="name">
+<input type="email" id="email" name="email">
+<input type="hidden" id="token">
+<button>  </button><button aria-label="Close"></button>
+<span id="hint">Hint</span><div aria-labelledby="hint missing"></div>
+<a href="/more">read more</a>
+</body>
+</html>
+"""
+
+COMPONENT = """export function Form() {
+  return (<form>
+    <label htmlFor="age">Age</label><input type="number" id="age" />
+    <a href="/terms">Terms of service</a>
+  </form>);
+}
+"""
+
+
+class TestComplianceEngine(unittest.TestCase):
+
+    def setUp(self):
+        compliance_engine.clear_cache()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        (self.root / "index.html").write_text(PAGE)
+        (self.root / "Form.jsx").write_text(COMPONENT)
+        (self.root / "server.py").write_text('password = "hunter2"\n')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_markup_index_built_in_one_pass(self):
+        index = scan_markup(PAGE)
+        self.assertEqual(index.headings, [1, 3])
+        self.assertEqual(index.label_targets, {"name"})
+        self.assertIn("hint", index.ids)
+        self.assertEqual(len(index.inputs), 3)
+        self.assertEqual(len(index.empty_buttons), 2)
+        self.assertEqual(index.text_links[0][0], "read more")
+        self.assertEqual(scan_markup(COMPONENT).label_targets, {"age"})
+
+    def test_shared_report_feeds_both_evaluators(self):
+        report = ComplianceEngine().evaluate_directory(str(self.root))
+        self.assertEqual((report.wcag_files, report.gdpr_files), (2, 3))
+
+        wcag = WCAGEvaluator().evaluate_directory(str(self.root), report=report)
+        descriptions = [issue["description"] for issue in wcag["issues"]]
+        self.assertIn("Image missing alt attribute", descriptions)
+        self.assertIn("Form input missing associated label", descriptions)  # email input
+        self.assertIn("Button has no accessible text", descriptions)
+        self.assertIn("aria-labelledby references non-existent id 'hint missing'", descriptions)
+        self.assertIn("Link has generic text: 'read more'", descriptions)
+        self.assertIn("HTML element missing lang attribute", descriptions)
+        self.assertEqual(descriptions.count("Form input missing associated label"), 1)
+
+        gdpr = GDPREvaluator().evaluate_directory(str(self.root), report=report)
+        gdpr_descriptions = [issue["description"] for issue in gdpr["issues"]]
+        self.assertIn("Personal data collection without privacy notice", gdpr_descriptions)
+        self.assertIn("Hardcoded Password detected - security risk", gdpr_descriptions)
+
+    def test_unchanged_files_served_from_cache(self):
+        engine = ComplianceEngine()
+        first = engine.evaluate_directory(str(self.root))
+        self.assertEqual((first.files_evaluated, first.cache_hits), (3, 0))
+
+        (self.root / "index.html").write_text(PAGE.replace("<html>", '<html lang="en">'))
+        second = engine.evaluate_directory(str(self.root))
+        self.assertEqual((second.files_evaluated, second.cache_hits), (1, 2))
+        self.assertEqual(len(second.wcag_issues), len(first.wcag_issues) - 1)
+
+    def test_process_pool_matches_in_process(self):
+        in_process = ComplianceEngine(max_workers=1).evaluate_directory(str(self.root))
+        compliance_engine.clear_cache()
+        pooled = ComplianceEngine(max_workers=2, parallel_threshold=1).evaluate_directory(str(self.root))
+        self.assertEqual(pooled.wcag_issues, in_process.wcag_issues)
+        self.assertEqual(pooled.gdpr_issues, in_process.gdpr_issues)
+
+    def test_standalone_evaluators_still_skip_without_files(self):
+        empty = self.root / "empty"
+        empty.mkdir()
+        self.assertTrue(WCAGEvaluator().evaluate_directory(str(empty))["skipped"])
+        self.assertTrue(GDPREvaluator().evaluate_directory(str(self.root / "nope"))["skipped"])
+
+
+if __name__ == "__main__":
+    unittest.main()
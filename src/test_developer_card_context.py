@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-card developer RAG context cache
+
+WHY: Validates that a card's developer RAG queries are fetched once (in
+     parallel) and shared by every developer and retry, that concurrent
+     misses share one query, that storing a new artifact for the card
+     refreshes it, and that hit/miss counts are reported.
+"""
+
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from agents.developer import CardContextCache, RAGIntegration, RAGQuery
+
+
+class FakeRAG:
+    """Counts query_similar calls; tracks a per-card generation like RAGAgent"""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+        self.generations = {}
+        self.lock = threading.Lock()
+
+    def query_similar(self, query_text, artifact_types=None, top_k=5, filters=None):
+        with self.lock:
+            self.calls.append((query_text, tuple(artifact_types or ())))
+        time.sleep(self.delay)
+        if artifact_types == ["code_review"]:
+            return [{"content": f"Fix the bug (v{self.generations.get('card-1', 0)})", "metadata": {"retry_count": 1}}]
+        if artifact_types == ["architecture_decision"]:
+            return [{"content": "Extract method", "metadata": {"language": "python", "refactoring_type": "extract"}}]
+        return [{"content": "def example(): pass", "metadata": {}}]
+
+    def card_generation(self, card_id):
+        return self.generations.get(card_id, 0)
+
+    def store_artifact(self, artifact_type, card_id, task_title, content, metadata=None):
+        self.generations[card_id] = self.generations.get(card_id, 0) + 1
+
+
+def developer(name, cache):
+    return RAGIntegration(developer_name=name, developer_type="conservative", context_cache=cache)
+
+
+def gather(integration, rag, card_id="card-1"):
+    integration.prefetch_card_context(rag, card_id, "Add login", "Build login in python", "python")
+    return (
+        integration.query_code_review_feedback(rag, card_id),
+        integration.query_refactoring_instructions(rag, "Add login", "python", card_id=card_id),
+        integration.query_rag_for_examples(rag, "Add login", "Build login in python", card_id=card_id),
+    )
+
+
+class TestCardContextCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = CardContextCache()
+        self.rag = FakeRAG()
+
+    def test_developers_and_retries_share_one_fetch(self):
+        first = gather(developer("developer-a", self.cache), self.rag)
+        second = gather(developer("developer-b", self.cache), self.rag)
+        gather(developer("developer-a", self.cache), self.rag)
+
+        self.assertEqual(len(self.rag.calls), 3)
+        self.assertEqual(first, second)
+        self.assertIn("Fix the bug", first[0])
+        self.assertIn("Extract method", first[1])
+        self.assertIn("def example", first[2])
+        stats = self.cache.get_stats()
+        self.assertEqual((stats["misses"], stats["hits"]), (3, 15))
+
+    def test_prefetch_runs_queries_in_parallel(self):
+        rag = FakeRAG(delay=0.2)
+        started = time.perf_counter()
+        developer("developer-a", self.cache).prefetch_card_context(rag, "card-1", "Add login", "Build login", "python")
+        self.assertLess(time.perf_counter() - started, 0.5)
+        self.assertEqual(len(rag.calls), 3)
+
+    def test_concurrent_misses_share_one_query(self):
+        rag = FakeRAG(delay=0.1)
+        query = RAGQuery("login", ("code_example",), 3)
+        threads = [threading.Thread(target=self.cache.query, args=(rag, "card-1", query)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(rag.calls), 1)
+
+    def test_new_card_artifact_refreshes_context(self):
+        integration = developer("developer-a", self.cache)
+        self.assertIn("v0", gather(integration, self.rag)[0])
+
+        self.rag.store_artifact("developer_solution", "card-2", "Other", "...")
+        gather(integration, self.rag)
+        self.assertEqual(len(self.rag.calls), 3)
+
+        self.rag.store_artifact("developer_solution", "card-1", "Add login", "...")
+        self.assertIn("v1", gather(integration, self.rag)[0])
+        self.assertEqual(len(self.rag.calls), 6)
+        self.assertEqual(self.cache.get_stats()["refreshes"], 1)
+
+    def test_failed_queries_are_not_cached(self):
+        class FlakyRAG(FakeRAG):
+            def query_similar(self, query_text, artifact_types=None, top_k=5, filters=None):
+                super().query_similar(query_text, artifact_types, top_k, filters)
+                if len(self.calls) == 1:
+                    raise ConnectionError("chromadb down")
+                return [{"content": "ok", "metadata": {}}]
+
+        rag = FlakyRAG()
+        integration = developer("developer-a", self.cache)
+        self.assertIsNone(integration.query_code_review_feedback(rag, "card-1"))
+        self.assertIn("ok", integration.query_code_review_feedback(rag, "card-1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Tests for streaming, page-parallel document parsing
+
+WHY: Validates that page ranges parsed in worker processes come back in
+     document order and produce the same text as a serial parse, that the
+     memory budget limits the worker count, and that extracted text is
+     reused for identical file contents, re-parsed when they change, and
+     aged out by retention once they stop being hit.
+"""
+
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from document_reading import ContentExtractor, ExtractionCache, PDFParser
+from document_reading.parallel_parsing import page_ranges, parse_ranges, workers_for
+from document_reading.parsers import pdf_parser
+from document_reading.parsers.office_parser import ExcelParser
+from utilities.retention import RetentionManager, default_policies
+
+try:
+    import openpyxl
+except ImportError:
+    openpyxl = None
+
+PAGE_BREAK = '\f'
+
+
+def fake_page_count(file_path):
+    return len(Path(file_path).read_text().split(PAGE_BREAK))
+
+
+def fake_pages(file_path, start, stop):
+    """Stand-in PDF library: pages are form-feed separated text"""
+    return Path(file_path).read_text().split(PAGE_BREAK)[start:stop]
+
+
+def pid_pages(file_path, start, stop):
+    return [(page, os.getpid()) for page in range(start, stop)]
+
+
+class StreamTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.base = Path(tempfile.mkdtemp(prefix="artemis_doc_test_"))
+
+    def tearDown(self):
+        shutil.rmtree(self.base, ignore_errors=True)
+
+    def write_pdf(self, name, pages):
+        path = self.base / name
+        path.write_text(PAGE_BREAK.join(pages))
+        return str(path)
+
+
+class TestParallelParsing(StreamTestCase):
+
+    def test_ranges_parsed_in_workers_keep_page_order(self):
+        path = self.write_pdf("doc.pdf", ["x"])
+
+        results = [item for chunk in parse_ranges(pid_pages, path, 40, workers=2, chunk_size=4) for item in chunk]
+
+        self.assertEqual([page for page, _ in results], list(range(40)))
+        self.assertNotIn(os.getpid(), {pid for _, pid in results})
+        self.assertEqual(page_ranges(10, 4), [(0, 4), (4, 8), (8, 10)])
+
+    def test_memory_cap_limits_workers(self):
+        path = self.base / "big.pdf"
+        path.write_bytes(b"\0" * (16 * 1024 * 1024))
+
+        # 64 MB base + 4 x 16 MB per worker = 128 MB
+        self.assertEqual(workers_for(str(path), chunks=10, max_workers=8, memory_cap_mb=512), 4)
+        self.assertEqual(workers_for(str(path), chunks=10, max_workers=8, memory_cap_mb=100), 1)
+        self.assertEqual(workers_for(str(path), chunks=2, max_workers=8, memory_cap_mb=4096), 2)
+
+
+class TestPDFParserStreaming(StreamTestCase):
+
+    def test_parallel_parse_matches_serial(self):
+        pages = [f"page {number} text" for number in range(50)]
+        path = self.write_pdf("report.pdf", pages)
+        parser = PDFParser()
+        parser.library = "fake"
+
+        with patch.dict(pdf_parser.PAGE_COUNTERS, {"fake": fake_page_count}), \
+                patch.dict(pdf_parser.PAGE_EXTRACTORS, {"fake": fake_pages}):
+            with patch.object(pdf_parser, "DOCUMENT_PARALLEL_MIN_PAGES", 10 ** 6):
+                serial = parser.parse(path)
+            with patch.object(pdf_parser, "DOCUMENT_PARALLEL_MIN_PAGES", 2), \
+                    patch.object(pdf_parser, "workers_for", return_value=3):
+                parallel = parser.parse(path)
+                streamed = list(parser.iter_pages(path))
+
+        self.assertEqual(serial, "\n".join(pages))
+        self.assertEqual(parallel, serial)
+        self.assertEqual(streamed, pages)
+
+
+class CountingParser:
+    library = "fake"
+
+    def __init__(self):
+        self.calls = 0
+
+    def is_available(self):
+        return True
+
+    def parse(self, file_path):
+        self.calls += 1
+        return Path(file_path).read_text().upper()
+
+
+class TestExtractionCache(StreamTestCase):
+
+    def test_unchanged_contents_skip_parsing(self):
+        parser = CountingParser()
+        extractor = ContentExtractor(cache=ExtractionCache(self.base / "cache"))
+        original = self.write_pdf("a.pdf", ["alpha", "beta"])
+        copy = self.write_pdf("copy.pdf", ["alpha", "beta"])
+
+        with patch.object(extractor.factory, "create_parser", return_value=parser):
+            first = extractor.extract(original)
+            again = extractor.extract(copy)
+            self.assertEqual(parser.calls, 1)
+            self.assertEqual((again.content, again.file_path), (first.content, str(Path(copy).absolute())))
+
+            Path(original).write_text("changed")
+            self.assertEqual(extractor.extract_text(original), "CHANGED")
+            self.assertEqual(parser.calls, 2)
+
+    def test_cache_disabled_and_text_formats_always_parse(self):
+        parser = CountingParser()
+        path = self.write_pdf("a.pdf", ["alpha"])
+        extractor = ContentExtractor(use_cache=False)
+
+        with patch.object(extractor.factory, "create_parser", return_value=parser):
+            extractor.extract(path)
+            extractor.extract(path)
+        self.assertEqual(parser.calls, 2)
+
+        cache = ExtractionCache(self.base / "cache")
+        notes = self.base / "notes.txt"
+        notes.write_text("plain")
+        ContentExtractor(cache=cache).extract(str(notes))
+        self.assertFalse((self.base / "cache").exists())
+
+    def test_retention_evicts_entries_not_recently_hit(self):
+        cache = ExtractionCache(self.base / "cache")
+        cache.put("aa-used", "used")
+        cache.put("bb-idle", "idle")
+        stale = time.time() - 60 * 86400
+        for key in ("aa-used", "bb-idle"):
+            os.utime(cache._path(key), (stale, stale))
+
+        self.assertEqual(cache.get("aa-used"), "used")
+        with patch.dict(os.environ, {"ARTEMIS_DOCUMENT_CACHE_DIR": str(cache.cache_dir)}):
+            policy = next(p for p in default_policies() if p.name == "document_cache")
+        RetentionManager(policies=[policy], archive_dir=self.base / "archive",
+                         status_dir=self.base / "status", min_age_seconds=0).run()
+
+        self.assertEqual(policy.path, cache.cache_dir)
+        self.assertEqual(cache.get("aa-used"), "used")
+        self.assertIsNone(cache.get("bb-idle"))
+
+
+@unittest.skipIf(openpyxl is None, "openpyxl not installed")
+class TestExcelParserStreaming(StreamTestCase):
+
+    def write_workbook(self, dimension):
+        source = self.base / "source.xlsx"
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.title = "Data"
+        for row in range(1, 31):
+            sheet.append([f"r{row}", row, None if row % 3 else row * 1.5])
+        sheet["F40"] = "far corner"
+        workbook.create_sheet("Empty")
+        workbook.save(source)
+
+        # Rewrite the stored <dimension> the way some writers get it wrong
+        target = self.base / "report.xlsx"
+        with zipfile.ZipFile(source) as src, zipfile.ZipFile(target, "w") as dst:
+            for item in src.infolist():
+                data = src.read(item.filename)
+                if item.filename == "xl/worksheets/sheet1.xml":
+                    data, replaced = re.subn(rb'<dimension ref="[^"]*"\s*/>', dimension, data)
+                    self.assertEqual(replaced, 1)
+                dst.writestr(item, data)
+        return str(target)
+
+    def full_load_lines(self, path):
+        workbook = openpyxl.load_workbook(path, data_only=True)
+        lines = []
+        for sheet in workbook.worksheets:
+            lines.append(f"\n=== Sheet: {sheet.title} ===\n")
+            for row in sheet.iter_rows(values_only=True):
+                values = [str(cell) for cell in row if cell is not None]
+                if values:
+                    lines.append(" | ".join(values))
+        return lines
+
+    def test_read_only_matches_full_load_despite_bad_dimension(self):
+        for dimension in (b'<dimension ref="A1"/>', b'<dimension ref="A1:B2"/>', b""):
+            with self.subTest(dimension=dimension):
+                path = self.write_workbook(dimension)
+
+                streamed = list(ExcelParser().iter_chunks(path))
+
+                self.assertEqual(streamed, self.full_load_lines(path))
+                self.assertIn("far corner", streamed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Tests for the historical execution-stats store
+
+WHY: Validates that stage runs are recorded with duration, tokens, cost,
+     retries and outcome, that percentile predictions back off from exact
+     task features to broader history and report cold starts, and that the
+     router and dynamic pipeline optimizer use measured history when it
+     exists and their heuristics when it does not.
+"""
+
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from persistence.execution_stats import (
+    LEVEL_COLD_START,
+    LEVEL_COMPLEXITY,
+    LEVEL_EXACT,
+    ExecutionStatsStore,
+    StageExecutionRecord,
+    percentile,
+    stage_key,
+)
+from observer import EventType, ExecutionStatsObserver, PipelineEvent
+from intelligent_router_pkg.enhanced_router import COLD_START_TASK_HISTORY, IntelligentRouterEnhanced
+from dynamic_pipeline.core.ai_optimizer import AIOptimizer
+from dynamic_pipeline.core.pipeline_context import PipelineContext
+
+
+class StatsTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.base = Path(tempfile.mkdtemp(prefix="artemis_stats_test_"))
+        self.store = ExecutionStatsStore(self.base / "stats.db", min_samples=3)
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.base, ignore_errors=True)
+
+    def record(self, stage, durations, task_type="feature", complexity="medium", cost=0.01):
+        for index, duration in enumerate(durations):
+            self.store.record(StageExecutionRecord(
+                card_id=f"{task_type}-{complexity}-{index}",
+                stage=stage,
+                task_type=task_type,
+                complexity=complexity,
+                duration_seconds=duration,
+                cost=cost,
+            ))
+
+
+class TestExecutionStatsStore(StatsTestCase):
+
+    def test_percentiles_interpolate(self):
+        self.assertEqual(percentile([10, 20, 30, 40, 50], 50), 30)
+        self.assertAlmostEqual(percentile([10, 20, 30, 40, 50], 90), 46)
+        self.assertIsNone(percentile([], 50))
+
+    def test_exact_features_predict_percentiles(self):
+        self.record("DevelopmentStage", [100, 200, 300, 400])
+
+        prediction = self.store.predict_stage("DevelopmentStage", "feature", "medium")
+
+        self.assertEqual((prediction.level, prediction.samples), (LEVEL_EXACT, 4))
+        self.assertEqual(prediction.duration_p50, 250)
+        self.assertAlmostEqual(prediction.duration_p90, 370)
+        self.assertEqual(prediction.success_rate, 1.0)
+
+    def test_backs_off_to_complexity_then_reports_cold_start(self):
+        self.record("DevelopmentStage", [100, 200], task_type="bugfix")
+        self.record("DevelopmentStage", [300], task_type="refactor", complexity="moderate")
+
+        backed_off = self.store.predict_stage("DevelopmentStage", "bugfix", "medium")
+        cold = self.store.predict_stage("CodeReviewStage", "bugfix", "medium")
+
+        self.assertEqual((backed_off.level, backed_off.samples), (LEVEL_COMPLEXITY, 3))
+        self.assertEqual(cold.level, LEVEL_COLD_START)
+        self.assertTrue(cold.cold_start)
+        self.assertIsNone(cold.duration_p50)
+
+    def test_card_counts_by_features(self):
+        self.record("DevelopmentStage", [1, 2], task_type="bugfix", complexity="simple")
+        self.record("CodeReviewStage", [1, 2], task_type="bugfix", complexity="simple")
+        self.record("DevelopmentStage", [1], task_type="feature", complexity="complex")
+
+        self.assertEqual(self.store.card_count(), 3)
+        self.assertEqual(self.store.card_count("bugfix", "simple"), 2)
+        self.assertEqual(stage_key("CodeReviewStage"), stage_key("code_review"))
+
+
+class TestExecutionStatsObserver(StatsTestCase):
+
+    def test_records_stage_runs_with_tokens_and_retries(self):
+        observer = ExecutionStatsObserver(store=self.store, register_llm_hook=False)
+        start = datetime(2025, 1, 1, 12, 0, 0)
+
+        def emit(event_type, stage=None, seconds=0, data=None):
+            observer.on_event(PipelineEvent(
+                event_type=event_type, card_id="card-1", stage_name=stage,
+                timestamp=start + timedelta(seconds=seconds), data=data or {}
+            ))
+
+        emit(EventType.PIPELINE_STARTED, data={"workflow_plan": {"task_type": "bugfix", "complexity": "simple"}})
+        emit(EventType.STAGE_STARTED, "DevelopmentStage")
+        observer.record_llm_call(SimpleNamespace(model="gpt-4o", prompt_tokens=1000, completion_tokens=500, total_tokens=1500))
+        emit(EventType.STAGE_RETRYING, "DevelopmentStage", 10)
+        emit(EventType.STAGE_COMPLETED, "DevelopmentStage", 90)
+        emit(EventType.STAGE_STARTED, "CodeReviewStage", 90)
+        emit(EventType.PIPELINE_FAILED, seconds=120)
+
+        rows = self.store.connection.execute(
+            "SELECT stage, task_type, complexity, duration_seconds, tokens, retries, outcome "
+            "FROM stage_executions ORDER BY id"
+        ).fetchall()
+        self.assertEqual(rows, [
+            ("DevelopmentStage", "bugfix", "simple", 90.0, 1500, 1, "success"),
+            ("CodeReviewStage", "bugfix", "simple", 30.0, 0, 0, "failure"),
+        ])
+        cost = self.store.connection.execute("SELECT cost FROM stage_executions WHERE stage = 'DevelopmentStage'").fetchone()[0]
+        self.assertAlmostEqual(cost, 0.0075)
+
+    def test_llm_hook_only_registered_while_pipeline_runs(self):
+        from llm import usage_metrics
+
+        observer = ExecutionStatsObserver(store=self.store)
+        start = datetime(2025, 1, 1, 12, 0, 0)
+        call = usage_metrics.LLMCallMetrics(
+            provider="openai", model="gpt-4o", prompt_tokens=100, completion_tokens=100,
+            usage_source="provider", streamed=False, duration_ms=10.0
+        )
+
+        def emit(event_type, stage=None, seconds=0):
+            observer.on_event(PipelineEvent(
+                event_type=event_type, card_id="card-2", stage_name=stage,
+                timestamp=start + timedelta(seconds=seconds), data={}
+            ))
+
+        def registered():
+            return any(hook == observer.record_llm_call for hook, _ in usage_metrics._HOOKS)
+
+        self.assertFalse(registered())
+        emit(EventType.PIPELINE_STARTED)
+        emit(EventType.STAGE_STARTED, "DevelopmentStage")
+        self.assertTrue(registered())
+        usage_metrics.emit_call_metrics(call)
+        emit(EventType.STAGE_COMPLETED, "DevelopmentStage", 5)
+        emit(EventType.PIPELINE_COMPLETED, seconds=5)
+        self.assertFalse(registered())
+
+        tokens = self.store.connection.execute("SELECT tokens FROM stage_executions").fetchone()[0]
+        self.assertEqual(tokens, 200)
+
+
+class TestHistoryDrivenDecisions(StatsTestCase):
+
+    def test_router_uses_measured_history_after_cold_start(self):
+        # Only the history methods are exercised; skip the full component setup
+        router = IntelligentRouterEnhanced.__new__(IntelligentRouterEnhanced)
+        router._stats_store, router.logger = self.store, None
+
+        self.assertEqual(router._estimate_similar_task_history("bugfix", "simple"), COLD_START_TASK_HISTORY[("bugfix", "simple")])
+
+        self.record("DevelopmentStage", [600, 600, 1200], task_type="bugfix", complexity="simple", cost=0.5)
+        self.assertEqual(router._estimate_similar_task_history("bugfix", "simple"), 3)
+
+        context = {"estimated_duration_hours": 99}
+        requirements = SimpleNamespace(task_type="bugfix", complexity="simple")
+        router._apply_execution_history(context, requirements, ["development"])
+        self.assertEqual(context["duration_source"], "history")
+        self.assertAlmostEqual(context["estimated_duration_hours"], 600 / 3600)
+        self.assertAlmostEqual(context["estimated_cost_usd"], 0.5)
+
+    def test_router_keeps_heuristic_unless_every_stage_is_warm(self):
+        router = IntelligentRouterEnhanced.__new__(IntelligentRouterEnhanced)
+        router._stats_store, router.logger = self.store, None
+        requirements = SimpleNamespace(task_type="feature", complexity="medium")
+        self.record("DevelopmentStage", [600, 600, 600])
+        self.record("DocumentationStage", [60, 60, 60])
+
+        partial = {"estimated_duration_hours": 4}
+        router._apply_execution_history(partial, requirements, ["development", "code_review"])
+        self.assertEqual((partial["duration_source"], partial["estimated_duration_hours"]), ("heuristic", 4))
+        self.assertEqual(list(partial["stage_predictions"]), ["DevelopmentStage"])
+
+        unrelated = {"estimated_duration_hours": 4}
+        router._apply_execution_history(unrelated, requirements, ["security_audit"])
+        self.assertEqual((unrelated["duration_source"], unrelated["stage_predictions"]), ("heuristic", {}))
+
+    def test_optimizer_workers_from_history_with_fallback(self):
+        stages = [SimpleNamespace(name=name) for name in ("development", "testing", "documentation")]
+        context = PipelineContext({"task_type": "feature", "complexity": "medium", "suggested_max_workers": 4})
+        optimizer = AIOptimizer(context, stats_store=self.store)
+
+        self.assertIsNone(optimizer._history_recommended_workers(stages))
+
+        self.record("DevelopmentStage", [100, 100, 100])
+        self.record("TestingStage", [100, 100, 100])
+        self.record("DocumentationStage", [50, 50, 50])
+        # ceil(250s of p50 work / 100s slowest p90) = 3
+        self.assertEqual(optimizer._history_recommended_workers(stages), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Tests for incremental output sync into the git repository
+
+WHY: Validates that save_output_to_repo copies only new or changed files,
+     leaves unchanged files untouched (no mtime churn), removes files deleted
+     from the output, keeps files edited in the repository, reports a
+     summary, and never leaves temp files behind.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from git_agent_pkg import OutputSync, RemoteOperations, RepositoryConfig
+from git_agent_pkg import output_sync
+
+
+class TestOutputSync(unittest.TestCase):
+
+    def setUp(self):
+        self.base = Path(tempfile.mkdtemp(prefix="artemis_sync_test_"))
+        self.output = self.base / "output"
+        self.repo = self.base / "repo"
+        (self.repo / ".git").mkdir(parents=True)
+        self.write(self.output / "src" / "app.py", "print('v1')\n")
+        self.write(self.output / "assets" / "logo.svg", "<svg/>")
+        self.write(self.output / ".git" / "HEAD", "ignored")
+        self.sync = OutputSync(self.repo)
+
+    def tearDown(self):
+        shutil.rmtree(self.base, ignore_errors=True)
+
+    def write(self, path, content):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+    def test_first_sync_adds_everything_but_git_metadata(self):
+        summary = self.sync.sync(self.output)
+
+        self.assertEqual(sorted(summary.added), ["assets/logo.svg", "src/app.py"])
+        self.assertEqual((self.repo / "src" / "app.py").read_text(), "print('v1')\n")
+        self.assertFalse((self.repo / ".git" / "HEAD").exists())
+        self.assertTrue((self.repo / ".git" / output_sync.MANIFEST_NAME).exists())
+
+    def test_unchanged_files_are_not_rewritten(self):
+        self.sync.sync(self.output)
+        logo = self.repo / "assets" / "logo.svg"
+        before = logo.stat().st_mtime_ns
+        # Touching the source without changing content must not copy it
+        os.utime(self.output / "assets" / "logo.svg", ns=(1, 1))
+
+        with patch.object(output_sync, "atomic_copy", wraps=output_sync.atomic_copy) as copy:
+            summary = self.sync.sync(self.output)
+
+        copy.assert_not_called()
+        self.assertFalse(summary.has_changes)
+        self.assertEqual(summary.unchanged, 2)
+        self.assertEqual(logo.stat().st_mtime_ns, before)
+
+    def test_changed_and_deleted_files(self):
+        self.sync.sync(self.output)
+        self.write(self.output / "src" / "app.py", "print('v2')\n")
+        shutil.rmtree(self.output / "assets")
+        self.write(self.output / "README.md", "# app")
+
+        summary = self.sync.sync(self.output)
+
+        self.assertEqual((summary.added, summary.changed, summary.removed), (["README.md"], ["src/app.py"], ["assets/logo.svg"]))
+        self.assertEqual((self.repo / "src" / "app.py").read_text(), "print('v2')\n")
+        self.assertFalse((self.repo / "assets").exists())
+
+    def test_files_edited_in_repo_are_kept_when_deleted_from_output(self):
+        self.sync.sync(self.output)
+        self.write(self.repo / "assets" / "logo.svg", "<svg>edited</svg>")
+        (self.output / "assets" / "logo.svg").unlink()
+
+        summary = self.sync.sync(self.output)
+
+        self.assertEqual((summary.removed, summary.kept_modified), ([], ["assets/logo.svg"]))
+        self.assertTrue((self.repo / "assets" / "logo.svg").exists())
+
+    def test_failed_copy_leaves_destination_intact(self):
+        self.sync.sync(self.output)
+        self.write(self.output / "src" / "app.py", "print('v2')\n")
+
+        with patch.object(output_sync.shutil, "copystat", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                self.sync.sync(self.output)
+
+        self.assertEqual((self.repo / "src" / "app.py").read_text(), "print('v1')\n")
+        self.assertEqual([path.name for path in (self.repo / "src").iterdir()], ["app.py"])
+
+
+class TestSaveOutputToRepo(unittest.TestCase):
+
+    def setUp(self):
+        self.base = Path(tempfile.mkdtemp(prefix="artemis_sync_test_"))
+        (self.base / "repo" / ".git").mkdir(parents=True)
+        (self.base / "output").mkdir()
+        (self.base / "output" / "main.py").write_text("x = 1\n")
+        self.operations = []
+        self.commits = []
+        self.remote_ops = RemoteOperations(
+            RepositoryConfig(name="demo", local_path=str(self.base / "repo")),
+            logger=QuietLogger(),
+            operation_logger=lambda *args: self.operations.append(args),
+            git_command_runner=lambda args: None
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.base, ignore_errors=True)
+
+    def test_commits_only_when_output_changed(self):
+        save = lambda: self.remote_ops.save_output_to_repo(str(self.base / "output"), "Add output", commit_callback=self.commits.append)
+
+        self.assertTrue(save())
+        self.assertEqual(self.remote_ops.last_sync_summary.added, ["main.py"])
+        self.assertTrue(save())
+
+        self.assertEqual(self.commits, ["Add output"])
+        self.assertEqual(self.operations[0][:2], ("sync_output", "success"))
+        self.assertEqual(self.operations[0][2]["added"], 1)
+
+
+class QuietLogger:
+    """Minimal ArtemisLogger stand-in recording nothing"""
+
+    def info(self, message):
+        pass
+
+    def warning(self, message):
+        pass
+
+    def error(self, message):
+        pass
+
+
+if __name__ == "__main__":
+    unittest.main()
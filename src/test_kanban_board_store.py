@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Tests for the indexed, concurrency-safe Kanban board store
+
+WHY: Validates that card lookups use the index, related changes are written
+     once per batch, metrics are maintained incrementally, and parallel
+     writers updating different cards do not clobber each other.
+"""
+
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from kanban.board import KanbanBoard
+from kanban.board.metrics_calculator import MetricsCalculator
+
+COLUMNS = ["backlog", "development", "testing", "blocked", "done"]
+
+
+def make_card(card_id, story_points=3):
+    return {
+        "card_id": card_id,
+        "task_id": f"task-{card_id}",
+        "title": f"Card {card_id}",
+        "priority": "medium",
+        "story_points": story_points,
+        "created_at": "2024-01-01T00:00:00Z",
+        "current_column": "backlog",
+        "test_status": {"unit_tests_passing": False},
+        "acceptance_criteria": [],
+        "history": [],
+    }
+
+
+def write_board(path, card_count):
+    board = {
+        "board_id": "test-board",
+        "last_updated": "",
+        "columns": [
+            {"column_id": column, "name": column.title(), "wip_limit": None, "cards": []}
+            for column in COLUMNS
+        ],
+    }
+    board["columns"][0]["cards"] = [make_card(f"card-{i}", story_points=i) for i in range(card_count)]
+    with open(path, "w") as f:
+        json.dump(board, f)
+
+
+def move_cards_in_process(board_path, card_ids):
+    board = KanbanBoard(board_path)
+    for card_id in card_ids:
+        board.move_card(card_id, "development", agent="worker")
+        board.update_test_status(card_id, {"unit_tests_passing": True})
+
+
+class TestBoardStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "kanban_board.json")
+        write_board(self.path, 6)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _read(self):
+        with open(self.path) as f:
+            return json.load(f)
+
+    def test_index_follows_moves_and_task_ids(self):
+        board = KanbanBoard(self.path)
+        self.assertTrue(board.move_card("task-card-2", "testing"))
+        card, column = board._find_card("card-2")
+        self.assertEqual(column, "testing")
+        self.assertIs(card, board._find_card("task-card-2")[0])
+        self.assertEqual(len(board.get_cards_in_column("backlog")), 5)
+
+    def test_batch_writes_once(self):
+        board = KanbanBoard(self.path)
+        with board.batch():
+            board.move_card("card-1", "development")
+            board.update_test_status("card-1", {"unit_tests_passing": True})
+            board.update_card("card-1", {"priority": "high"})
+            self.assertEqual(board.store.writes, 0)
+        self.assertEqual(board.store.writes, 1)
+
+        saved = self._read()
+        development = next(c for c in saved["columns"] if c["column_id"] == "development")
+        self.assertEqual(development["cards"][0]["priority"], "high")
+
+    def test_incremental_metrics_match_full_recalculation(self):
+        board = KanbanBoard(self.path)
+        for card_id in ("card-1", "card-3", "card-4"):
+            board.move_card(card_id, "done")
+        incremental = dict(board.board["metrics"])
+
+        MetricsCalculator.update_metrics(board.board)
+        self.assertEqual(incremental, board.board["metrics"])
+        self.assertEqual(incremental["velocity_current_sprint"], 8)
+
+        # Leaving done falls back to a full recalculation
+        board.move_card("card-4", "development")
+        self.assertEqual(board.board["metrics"]["cards_completed"], 2)
+
+    def test_two_writers_keep_each_others_changes(self):
+        first = KanbanBoard(self.path)
+        second = KanbanBoard(self.path)
+
+        first.move_card("card-0", "development")
+        second.move_card("card-5", "testing")
+        second.update_test_status("card-5", {"unit_tests_passing": True})
+
+        reloaded = KanbanBoard(self.path)
+        self.assertEqual(reloaded._find_card("card-0")[1], "development")
+        card, column = reloaded._find_card("card-5")
+        self.assertEqual(column, "testing")
+        self.assertTrue(card["test_status"]["unit_tests_passing"])
+        self.assertEqual(sum(len(c["cards"]) for c in self._read()["columns"]), 6)
+
+    def test_parallel_processes_do_not_clobber(self):
+        write_board(self.path, 40)
+        context = multiprocessing.get_context("fork")
+        workers = [
+            context.Process(target=move_cards_in_process, args=(self.path, [f"card-{i}" for i in range(w, 40, 4)]))
+            for w in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(60)
+            self.assertEqual(worker.exitcode, 0)
+
+        board = KanbanBoard(self.path)
+        development = board.get_cards_in_column("development")
+        self.assertEqual(len(development), 40)
+        self.assertTrue(all(c["test_status"]["unit_tests_passing"] for c in development))
+        self.assertEqual(board.get_cards_in_column("backlog"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
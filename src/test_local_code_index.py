@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Tests for the local research BM25 code index
+
+WHY: Validates that local research ranks the whole tree (not the first 20 files)
+     and that the persisted index is updated incrementally.
+"""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from research.code_index import LocalCodeIndex, tokenize
+from research.local_strategy import LocalExamplesResearchStrategy
+
+
+class TestTokenize(unittest.TestCase):
+
+    def test_splits_identifiers(self):
+        tokens = tokenize("def parseHttpRequest(user_id): pass")
+        for token in ("parse", "http", "request", "parsehttprequest", "user", "user_id", "def", "pass"):
+            self.assertIn(token, tokens)
+
+
+class TestLocalCodeIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name) / "code"
+        self.index_dir = os.path.join(self.tmp.name, "index")
+        self.root.mkdir()
+        for i in range(30):
+            (self.root / f"filler_{i}.py").write_text(f"def helper_{i}():\n    return {i}\n")
+        (self.root / "zz_auth.py").write_text("class JwtAuthenticator:\n    def verify_token(self, token): ...\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _index(self):
+        return LocalCodeIndex([str(self.root)], [".py"], index_dir=self.index_dir, refresh_interval_seconds=0)
+
+    def test_finds_best_match_beyond_first_twenty_files(self):
+        index = self._index()
+        index.refresh()
+        hits = index.search("verify jwt token", top_k=3)
+        self.assertEqual(Path(hits[0][0]).name, "zz_auth.py")
+        self.assertEqual(hits[0][2], 1.0)
+
+    def test_incremental_refresh_and_persistence(self):
+        index = self._index()
+        self.assertEqual(index.refresh()["added"], 31)
+
+        reloaded = self._index()
+        self.assertEqual(len(reloaded), 31)
+        self.assertEqual(reloaded.refresh(force=True), {"added": 0, "updated": 0, "removed": 0})
+
+        target = self.root / "filler_0.py"
+        target.write_text("def rate_limiter():\n    pass\n")
+        os.utime(target, (time.time() + 10, time.time() + 10))
+        (self.root / "filler_1.py").unlink()
+
+        self.assertEqual(reloaded.refresh(force=True), {"added": 0, "updated": 1, "removed": 1})
+        self.assertEqual(Path(reloaded.search("rate limiter")[0][0]).name, "filler_0.py")
+
+    def test_strategy_returns_examples(self):
+        strategy = LocalExamplesResearchStrategy(search_paths=[str(self.root)], index_dir=self.index_dir)
+        examples = strategy.search("jwt authenticator", ["python"], max_results=2)
+        self.assertEqual(examples[0].title, "zz_auth.py")
+        self.assertIn("JwtAuthenticator", examples[0].content)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Tests for the embedded local Knowledge Graph backend
+
+WHY: Validates that KG features work without Memgraph:
+     - Node/edge persistence in SQLite survives reopen
+     - Impact, dependency, lineage and coverage queries match the Cypher semantics
+     - ai_query KG strategies get context from the local backend
+     - Factory falls back to the local backend
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from ai_query import QueryType
+from ai_query.architecture_kg_strategy import ArchitectureKGStrategy
+from ai_query.code_review_kg_strategy import CodeReviewKGStrategy
+from ai_query.requirements_kg_strategy import RequirementsKGStrategy
+from ai_query.sprint_planning_kg_strategy import SprintPlanningKGStrategy
+from knowledge_graph_pkg import KnowledgeGraph, LocalGraphStore, resolve_backend
+
+
+class TestLocalKnowledgeGraph(unittest.TestCase):
+    """Query semantics of the local backend"""
+
+    def setUp(self):
+        self.graph = KnowledgeGraph(backend="local", db_path=":memory:")
+        for path, module in [("api.py", "api"), ("auth.py", "api"), ("db.py", "data"), ("models.py", "data")]:
+            self.graph.add_file(path, "python", lines=100, module=module)
+        self.graph.add_dependency("api.py", "auth.py")
+        self.graph.add_dependency("api.py", "db.py")
+        self.graph.add_dependency("auth.py", "db.py")
+        self.graph.add_dependency("db.py", "models.py")
+
+    def test_get_file(self):
+        file_data = self.graph.get_file("auth.py")
+        self.assertEqual(file_data["module"], "api")
+        self.assertIsNone(self.graph.get_file("missing.py"))
+
+    def test_impact_analysis_reports_shortest_distance(self):
+        impacts = self.graph.get_impact_analysis("models.py", depth=3)
+        distances = {i["dependent_path"]: i["distance"] for i in impacts}
+        self.assertEqual(distances, {"db.py": 1, "api.py": 2, "auth.py": 2})
+
+        shallow = self.graph.get_impact_analysis("models.py", depth=1)
+        self.assertEqual([i["dependent_path"] for i in shallow], ["db.py"])
+
+    def test_file_dependencies(self):
+        deps = self.graph.get_file_dependencies("db.py")
+        self.assertEqual(deps, {"imports": ["models.py"], "imported_by": ["api.py", "auth.py"]})
+
+    def test_circular_dependencies(self):
+        self.graph.add_dependency("models.py", "auth.py")
+        cycles = self.graph.get_circular_dependencies()
+        self.assertEqual(cycles, [{"cycle": ["auth.py", "db.py", "models.py", "auth.py"], "cycle_length": 3}])
+
+    def test_architectural_violations(self):
+        violations = self.graph.get_architectural_violations([("data", "api")])
+        self.assertEqual(violations, [])
+        violations = self.graph.get_architectural_violations([("api", "data")])
+        self.assertEqual(sorted(v["violator"] for v in violations), ["api.py", "auth.py"])
+
+    def test_untested_functions(self):
+        self.graph.add_function("login", "auth.py", complexity=5)
+        self.graph.add_function("connect", "db.py", complexity=9)
+        self.graph.add_function("_helper", "db.py", public=False)
+        self.graph.add_test_coverage("test_login", "login", "auth.py")
+
+        untested = self.graph.get_untested_functions()
+        self.assertEqual([u["function_name"] for u in untested], ["connect"])
+
+    def test_decision_lineage(self):
+        self.graph.add_adr("ADR-001", "Use SQLite", "accepted")
+        self.graph.add_adr("ADR-002", "Add cache", "accepted")
+        self.graph.add_adr("ADR-003", "Shard cache", "proposed")
+        self.graph.link_adr_influence("ADR-002", "ADR-001")
+        self.graph.link_adr_influence("ADR-003", "ADR-002")
+
+        lineage = self.graph.get_decision_lineage("ADR-001")
+        self.assertEqual([d["adr_id"] for d in lineage], ["ADR-001", "ADR-002", "ADR-003"])
+        self.assertEqual(self.graph.get_decision_lineage("ADR-003"), [])
+
+    def test_delete_file_detaches_edges(self):
+        before = self.graph.get_graph_stats()["relationships"]
+        self.graph.delete_file("db.py")
+        stats = self.graph.get_graph_stats()
+        self.assertEqual(stats["files"], 3)
+        self.assertEqual(stats["relationships"], before - 3)
+        self.assertEqual(self.graph.get_file_dependencies("api.py")["imports"], ["auth.py"])
+
+    def test_query_returns_empty_without_cypher_engine(self):
+        self.assertEqual(self.graph.query("MATCH (n) RETURN n"), [])
+
+
+class TestLocalKGStrategies(unittest.TestCase):
+    """ai_query strategies use typed lookups, so KG-first context works without Memgraph"""
+
+    def setUp(self):
+        self.graph = KnowledgeGraph(backend="local", db_path=":memory:")
+        self.graph.add_file("auth.py", "python")
+        self.graph.add_requirement("REQ-1", "User login", "functional", "high")
+        self.graph.add_requirement("REQ-2", "Audit export", "non_functional", "low", status="done")
+        self.graph.add_adr("ADR-001", "Use JWT sessions", "accepted")
+        self.graph.link_requirement_to_adr("REQ-1", "ADR-001")
+        self.graph.add_task("card-1", "Implement login", "high", "done")
+        self.graph.link_task_to_file("card-1", "auth.py")
+        self.graph.add_code_review("rev-1", "card-1", "FAIL", 40, critical_issues=2, high_issues=1)
+        self.graph.add_code_review("rev-2", "card-1", "PASS", 95)
+
+    def test_architecture_strategy_returns_context(self):
+        context = ArchitectureKGStrategy().query_kg(self.graph, {"keywords": ["login"], "req_type": "other"})
+
+        self.assertEqual(context.query_type, QueryType.ARCHITECTURE_DESIGN)
+        self.assertEqual(context.patterns_found, [{"adr_id": "ADR-001", "title": "Use JWT sessions"}])
+        self.assertEqual(context.estimated_token_savings, 200)
+
+    def test_review_and_requirement_strategies_return_context(self):
+        reviews = CodeReviewKGStrategy().query_kg(self.graph, {"file_types": ["python"]})
+        requirements = RequirementsKGStrategy().query_kg(self.graph, {})
+
+        self.assertEqual(reviews.patterns_found, [{"review_id": "rev-1", "critical_issues": 2, "high_issues": 1}])
+        self.assertEqual([p["req_id"] for p in requirements.patterns_found], ["REQ-1"])
+
+    def test_sprint_history_aggregates_completed_tasks(self):
+        store = self.graph.db
+        for number, velocity in [(1, 10), (2, 14), (5, 20)]:
+            store.upsert_node("Sprint", f"s{number}", {"team_name": "core", "sprint_number": number, "velocity": velocity})
+        for card, points in [("t1", 3), ("t2", 5), ("t3", 8)]:
+            store.upsert_node("Task", card, {"card_id": card, "story_points": points})
+        store.add_edge(("Sprint", "s1"), "COMPLETED", ("Task", "t1"))
+        store.add_edge(("Sprint", "s2"), "COMPLETED", ("Task", "t2"))
+        store.add_edge(("Sprint", "s2"), "COMPLETED", ("Task", "t3"))
+        store.add_edge(("Sprint", "s5"), "COMPLETED", ("Task", "t1"))
+
+        context = SprintPlanningKGStrategy().query_kg(self.graph, {"team_name": "core", "sprint_number": 5})
+
+        self.assertEqual(context.patterns_found, [
+            {"sprint_number": 2, "velocity": 14, "tasks_completed": 2, "avg_story_points": 6.5},
+            {"sprint_number": 1, "velocity": 10, "tasks_completed": 1, "avg_story_points": 3.0},
+        ])
+
+
+class TestLocalGraphStorePersistence(unittest.TestCase):
+    """SQLite durability of the local backend"""
+
+    def test_reopen_restores_adjacency(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "kg.db")
+            graph = KnowledgeGraph(backend="local", db_path=db_path)
+            graph.add_file("a.py", "python")
+            graph.add_file("b.py", "python")
+            graph.add_dependency("a.py", "b.py")
+            graph.db.close()
+
+            reopened = KnowledgeGraph(backend="local", db_path=db_path)
+            self.assertEqual(reopened.get_file_dependencies("b.py")["imported_by"], ["a.py"])
+            reopened.export_to_json(os.path.join(tmp, "export.json"))
+            reopened.db.close()
+
+    def test_batch_defers_commit(self):
+        store = LocalGraphStore(":memory:")
+        with store.batch():
+            store.upsert_node("File", "a.py", {"path": "a.py"})
+            store.upsert_node("File", "b.py", {"path": "b.py"})
+            self.assertTrue(store.connection.in_transaction)
+        self.assertFalse(store.connection.in_transaction)
+        self.assertTrue(store.add_edge(("File", "a.py"), "IMPORTS", ("File", "b.py")))
+        self.assertFalse(store.add_edge(("File", "a.py"), "IMPORTS", ("File", "missing.py")))
+
+
+class TestBackendResolution(unittest.TestCase):
+    """Backend selection and factory fallback"""
+
+    def test_resolve_backend(self):
+        self.assertEqual(resolve_backend("local"), "local")
+        with self.assertRaises(ValueError):
+            resolve_backend("neo4j")
+
+    def test_factory_falls_back_to_local(self):
+        from knowledge_graph_factory import KnowledgeGraphFactory
+
+        with tempfile.TemporaryDirectory() as tmp:
+            env = {"ARTEMIS_KG_BACKEND": "local", "ARTEMIS_KG_DB": os.path.join(tmp, "kg.db")}
+            with patch.dict(os.environ, env):
+                KnowledgeGraphFactory.reset()
+                try:
+                    kg = KnowledgeGraphFactory.get_instance()
+                    self.assertIsNotNone(kg)
+                    self.assertEqual(kg.backend, "local")
+                    self.assertTrue(KnowledgeGraphFactory.is_available())
+                    kg.db.close()
+                finally:
+                    KnowledgeGraphFactory.reset()
+
+    def test_factory_falls_back_to_local_when_memgraph_unreachable(self):
+        import knowledge_graph_factory
+        from knowledge_graph_factory import KnowledgeGraphFactory
+        from knowledge_graph_pkg import knowledge_graph as kg_module
+
+        class UnreachableStorage:
+            def __init__(self, db):
+                pass
+
+            def create_indexes(self):
+                raise ConnectionError("Connection refused")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            env = {"ARTEMIS_KG_BACKEND": "auto", "ARTEMIS_KG_DB": os.path.join(tmp, "kg.db")}
+            with patch.dict(os.environ, env), \
+                    patch.object(knowledge_graph_factory, "MEMGRAPH_AVAILABLE", True), \
+                    patch.object(kg_module, "MEMGRAPH_AVAILABLE", True), \
+                    patch.object(kg_module, "Memgraph", create=True), \
+                    patch.object(kg_module, "StorageOperations", UnreachableStorage):
+                KnowledgeGraphFactory.reset()
+                try:
+                    kg = KnowledgeGraphFactory.get_instance()
+                    self.assertEqual(kg.backend, "local")
+                    self.assertTrue(KnowledgeGraphFactory.is_available())
+                    kg.db.close()
+
+                    # Requiring Memgraph reports it unavailable instead of a dead graph
+                    KnowledgeGraphFactory.reset()
+                    with patch.dict(os.environ, {"ARTEMIS_KG_BACKEND": "memgraph"}):
+                        self.assertIsNone(KnowledgeGraphFactory.get_instance())
+                finally:
+                    KnowledgeGraphFactory.reset()
+
+
+if __name__ == "__main__":
+    unittest.main()
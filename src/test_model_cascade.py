@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Tests for the cost-aware LLM model cascade
+
+WHY: Validates that a cheap tier answers when its output passes the
+     acceptance check, that failures and low-confidence answers escalate to
+     the stronger tier, that streaming callers only see the returned answer,
+     and that escalation rates and savings are reported per call site.
+"""
+
+import json
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from llm import LLMClientFactory, LLMClientInterface, LLMMessage, LLMResponse
+from llm.model_cascade import (
+    CascadeLLMClient,
+    CascadePolicy,
+    CascadeStats,
+    CascadeTier,
+    accept_choice,
+    accept_json,
+    build_cascade_policy,
+)
+
+MESSAGES = [LLMMessage(role="user", content="Estimate this feature")]
+
+
+class FakeLLMClient(LLMClientInterface):
+    """Local client answering per model from a script (str or Exception)"""
+
+    def __init__(self, answers):
+        self.answers = answers
+        self.calls = []
+
+    def complete(self, messages, model=None, temperature=0.7, max_tokens=4000, response_format=None):
+        self.calls.append(("complete", model))
+        return self._answer(model)
+
+    def complete_stream(self, messages, on_token_callback=None, model=None, temperature=0.7,
+                        max_tokens=4000, response_format=None):
+        self.calls.append(("stream", model))
+        response = self._answer(model)
+        for token in response.content.split():
+            on_token_callback(token)
+        return response
+
+    def get_available_models(self):
+        return list(self.answers)
+
+    def _answer(self, model):
+        answer = self.answers[model]
+        if isinstance(answer, Exception):
+            raise answer
+        usage = {"prompt_tokens": 1000, "completion_tokens": 1000, "total_tokens": 2000}
+        return LLMResponse(content=answer, model=model, provider="fake", usage=usage, raw_response={})
+
+
+def vote(points, confidence):
+    return json.dumps({"story_points": points, "reasoning": "ok", "confidence": confidence})
+
+
+class TestCascadeLLMClient(unittest.TestCase):
+
+    def setUp(self):
+        self.stats = CascadeStats()
+
+    def cascade(self, answers, accept=accept_json(("story_points",), confidence_key="confidence")):
+        fake = FakeLLMClient(answers)
+        policy = CascadePolicy(
+            call_site="estimation_vote",
+            tiers=[CascadeTier(fake, model) for model in answers],
+            accept=accept,
+            min_confidence=0.6,
+        )
+        return fake, CascadeLLMClient(policy, stats=self.stats)
+
+    def test_cheap_answer_accepted_without_escalation(self):
+        fake, client = self.cascade({"gpt-4o-mini": vote(5, 0.9), "gpt-4o": vote(8, 0.9)})
+
+        response = client.complete(MESSAGES)
+
+        self.assertEqual(response.model, "gpt-4o-mini")
+        self.assertEqual(fake.calls, [("complete", "gpt-4o-mini")])
+        report = self.stats.report()["estimation_vote"]
+        self.assertEqual((report["calls"], report["escalation_rate"]), (1, 0.0))
+        # 1000 prompt + 1000 completion tokens: gpt-4o-mini $0.00075, gpt-4o $0.0125
+        self.assertAlmostEqual(report["savings_usd"], 0.0125 - 0.00075)
+
+    def test_low_confidence_and_errors_escalate(self):
+        fake, client = self.cascade({
+            "claude-3-haiku": RuntimeError("overloaded"),
+            "gpt-4o-mini": vote(5, 0.3),
+            "gpt-4o": vote(8, 0.8),
+        })
+
+        response = client.complete(MESSAGES)
+
+        self.assertEqual(response.model, "gpt-4o")
+        report = self.stats.report()["estimation_vote"]
+        self.assertEqual((report["escalations"], report["tier_errors"], report["answered_by"]), (1, 1, {"gpt-4o": 1}))
+        self.assertLess(report["savings_usd"], 0)
+
+    def test_last_tier_answer_returned_even_if_rejected_and_errors_raise(self):
+        _, client = self.cascade({"gpt-4o-mini": "not json", "gpt-4o": "still not json"})
+        self.assertEqual(client.complete(MESSAGES).content, "still not json")
+        self.assertEqual(self.stats.report()["estimation_vote"]["unaccepted"], 1)
+
+        _, failing = self.cascade({"gpt-4o-mini": "x", "gpt-4o": RuntimeError("down")})
+        with self.assertRaises(RuntimeError):
+            failing.complete(MESSAGES)
+
+    def test_streaming_only_emits_returned_answer(self):
+        tokens = []
+        fake, client = self.cascade({"small": "positive", "large": "negative answer"}, accept=accept_choice(["positive", "negative"]))
+
+        client.complete_stream(MESSAGES, on_token_callback=tokens.append)
+        self.assertEqual((tokens, fake.calls), (["positive"], [("complete", "small")]))
+
+        tokens.clear()
+        fake.answers["small"] = "maybe"
+        client.complete_stream(MESSAGES, on_token_callback=tokens.append)
+        self.assertEqual(tokens, ["negative", "answer"])
+        self.assertEqual(fake.calls[-1], ("stream", "large"))
+
+    def test_explicit_model_bypasses_cascade(self):
+        fake, client = self.cascade({"gpt-4o-mini": vote(5, 0.9), "gpt-4o": vote(8, 0.9)})
+        fake.answers["gpt-5"] = vote(8, 0.9)
+
+        client.complete(MESSAGES, model="gpt-5")
+
+        self.assertEqual(fake.calls, [("complete", "gpt-5")])
+        self.assertEqual(self.stats.report(), {})
+
+
+class TestCascadePolicies(unittest.TestCase):
+
+    def test_call_site_policy_and_env_override(self):
+        fake = FakeLLMClient({})
+        policy = build_cascade_policy("estimation_vote", "openai", fake)
+        self.assertEqual([tier.model for tier in policy.tiers], ["gpt-4o-mini", "gpt-4o"])
+        self.assertIsNone(build_cascade_policy("code_generation", "openai", fake))
+
+        with patch.dict(os.environ, {"ARTEMIS_CASCADE_CRITIQUE_MODELS": "a, b, c"}):
+            self.assertEqual([tier.model for tier in build_cascade_policy("critique", "openai", fake).tiers], ["a", "b", "c"])
+
+    def test_classification_policy_accepts_fenced_intent_json(self):
+        policy = build_cascade_policy("classification", "openai", FakeLLMClient({}))
+
+        def confidence(content):
+            return policy.accept(LLMResponse(content=content, model="m", provider="fake", usage={}, raw_response={}))
+
+        self.assertEqual(confidence('```json\n{"type": "greeting", "confidence": 0.9}\n```'), 0.9)
+        self.assertEqual(confidence('{"parameters": {}}'), False)
+        self.assertLess(confidence('{"type": "general", "confidence": 0.4}'), policy.min_confidence)
+
+    def test_factory_leaves_unknown_clients_untouched(self):
+        fake = FakeLLMClient({})
+
+        self.assertIs(LLMClientFactory.create_cascade("estimation_vote", client=fake), fake)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Tests for concurrent batch Planning Poker with estimate reuse
+
+WHY: Validates that batch estimation runs features concurrently without
+     exceeding the global LLM cap, keeps input order, reuses near-identical
+     confident past estimates from sprint_plan artifacts, anchors voting on
+     merely similar ones, and reports the LLM votes saved.
+"""
+
+import json
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from agile import EstimateHistory, PlanningPoker
+
+AGENTS = ["architect", "developer", "qa"]
+
+
+class RecordingLogger:
+    def log(self, message, level="INFO"):
+        pass
+
+
+class FakeLLM:
+    """Votes 5 points unanimously; records prompts and peak concurrency"""
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.prompts = []
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def complete(self, messages, response_format=None):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.prompts.append(messages[-1].content)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        return SimpleNamespace(content=json.dumps({"story_points": 5, "reasoning": "ok", "confidence": 0.9, "concerns": []}))
+
+
+class FakeRAG:
+    def __init__(self, past_features):
+        self.past_features = past_features
+        self.queries = 0
+
+    def query_similar(self, query_text, artifact_types=None, top_k=5, filters=None):
+        self.queries += 1
+        return [{"artifact_type": "sprint_plan", "metadata": {"card_id": "card-old", "sprints": [{"sprint_number": 1, "features": self.past_features}]}}]
+
+
+def feature(title, description="Build it"):
+    return {"title": title, "description": description, "acceptance_criteria": ["works"]}
+
+
+class TestBatchPlanningPoker(unittest.TestCase):
+
+    def test_features_estimated_concurrently_under_llm_cap(self):
+        llm = FakeLLM()
+        poker = PlanningPoker(AGENTS, llm, RecordingLogger(), max_parallel_features=4, max_concurrent_llm_calls=5)
+        features = [feature(f"Feature {i}", f"Distinct capability number {i}") for i in range(8)]
+
+        estimates = poker.estimate_features_batch(features)
+
+        self.assertEqual([e.feature_title for e in estimates], [f["title"] for f in features])
+        self.assertGreater(llm.peak, len(AGENTS))
+        self.assertLessEqual(llm.peak, 5)
+        self.assertEqual(poker.last_batch_stats["llm_votes"], 8 * len(AGENTS))
+        self.assertEqual(poker.last_batch_stats["llm_votes_saved"], 0)
+
+    def test_confident_near_identical_history_skips_voting(self):
+        rag = FakeRAG([{"title": "User login", "description": "Users log in with email and password", "story_points": 8, "confidence": 0.9}])
+        llm = FakeLLM(delay=0)
+        poker = PlanningPoker(AGENTS, llm, RecordingLogger(), rag=rag)
+
+        estimates = poker.estimate_features_batch([
+            feature("User login", "Users log in with email and password."),
+            feature("Billing dashboard", "Show invoices per month"),
+        ])
+
+        reused, voted = estimates
+        self.assertEqual((reused.source, reused.final_estimate, reused.rounds), ("history", 8, []))
+        self.assertEqual(voted.source, "poker")
+        self.assertEqual(len(llm.prompts), len(AGENTS))
+        self.assertEqual(poker.last_batch_stats["reused_from_history"], 1)
+        self.assertEqual(poker.last_batch_stats["llm_votes_saved"], len(AGENTS))
+
+    def test_similar_or_unconfident_history_seeds_voting(self):
+        rag = FakeRAG([{"title": "User login", "description": "Users log in with email and password", "story_points": 8, "confidence": 0.5}])
+        llm = FakeLLM(delay=0)
+        poker = PlanningPoker(AGENTS, llm, RecordingLogger(), rag=rag)
+
+        [estimate] = poker.estimate_features_batch([feature("User login", "Users log in with email and password")])
+
+        self.assertEqual(estimate.source, "seeded")
+        self.assertEqual(estimate.reference_title, "User login")
+        self.assertTrue(all("Historical reference" in prompt for prompt in llm.prompts))
+        self.assertEqual(poker.last_batch_stats["seeded_from_history"], 1)
+
+    def test_history_ignores_malformed_metadata_and_rag_errors(self):
+        broken = SimpleNamespace(query_similar=lambda **kwargs: (_ for _ in ()).throw(RuntimeError("down")))
+        self.assertIsNone(EstimateHistory(broken).find_match(feature("User login")))
+        self.assertIsNone(EstimateHistory(FakeRAG([{"title": "User login"}])).find_match(feature("User login")))
+        self.assertIsNone(EstimateHistory(None).find_match(feature("User login")))
+
+
+if __name__ == "__main__":
+    unittest.main()
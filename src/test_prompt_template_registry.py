@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Tests for the exact-key prompt template registry
+
+WHY: Validates that known templates resolve from the in-process registry
+     without a RAG query, that the registry warms from RAG and the file
+     cache, that store_prompt/update_performance write through, and that
+     compiled templates render like the old substitutor.
+"""
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from prompt_management import PromptManager, TemplateRegistry, VariableSubstitutor, template_registry
+from prompt_management.prompt_repository import PromptRepository
+from prompt_management.template_loader import TemplateLoader
+from prompt_management.variable_substitutor import compile_template
+
+
+class FakeRAG:
+    """Stores artifacts in memory; answers every query with all prompt templates"""
+
+    def __init__(self):
+        self.ARTIFACT_TYPES = ['prompt_template']
+        self.artifacts = []
+        self.queries = 0
+
+    def store_artifact(self, artifact_type, card_id, task_title, content, metadata=None):
+        self.artifacts.append({'metadata': dict(metadata or {}, task_title=task_title)})
+
+    def query_similar(self, query_text, artifact_types=None, top_k=5, filters=None):
+        self.queries += 1
+        matches = [a for a in self.artifacts if all(a['metadata'].get(k) == v for k, v in (filters or {}).items())]
+        return matches[:top_k]
+
+
+def store(target, name, version='1.0', user_template='Implement {task} in {language}'):
+    return target.save(name=name, category='developer_agent', perspectives=['Engineer'], success_metrics=['Works'], context_layers={}, task_breakdown=['Code'], self_critique='Check', system_message='You are a developer', user_template=user_template, version=version)
+
+
+class TestTemplateRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_path = str(Path(self.tmp.name) / 'templates.json')
+        self.rag = FakeRAG()
+        self.registry = TemplateRegistry(cache_path=self.cache_path)
+        self.saved_registry, template_registry._REGISTRY = template_registry._REGISTRY, self.registry
+
+    def tearDown(self):
+        template_registry._REGISTRY = self.saved_registry
+        self.tmp.cleanup()
+
+    def test_lookup_by_name_skips_rag(self):
+        repo = PromptRepository(self.rag, registry=self.registry)
+        store(repo, 'dev_prompt')
+        queries = self.rag.queries
+
+        self.assertEqual(repo.find_by_name('dev_prompt').name, 'dev_prompt')
+        self.assertEqual(TemplateLoader(self.rag, registry=self.registry).load_by_name('dev_prompt').version, '1.0')
+        self.assertEqual(self.rag.queries, queries)
+
+    def test_latest_version_wins(self):
+        repo = PromptRepository(self.rag, registry=self.registry)
+        store(repo, 'dev_prompt', version='1.9')
+        store(repo, 'dev_prompt', version='1.10')
+        store(repo, 'dev_prompt', version='1.2')
+
+        self.assertEqual(repo.find_by_name('dev_prompt').version, '1.10')
+        self.assertEqual(repo.find_by_name('dev_prompt', version='1.2').version, '1.2')
+
+    def test_warms_from_rag_and_file_cache(self):
+        store(PromptRepository(self.rag, registry=TemplateRegistry(cache_path='')), 'from_rag')
+
+        warmed = TemplateRegistry(cache_path=self.cache_path)
+        PromptRepository(self.rag, registry=warmed)
+        self.assertIsNotNone(warmed.get('from_rag'))
+        self.assertTrue(Path(self.cache_path).exists())
+
+        restarted = TemplateRegistry(cache_path=self.cache_path)
+        self.assertEqual(restarted.warm(), 1)
+        self.assertIsNotNone(restarted.get('from_rag'))
+
+    def test_registry_miss_reads_through_rag(self):
+        store(PromptRepository(self.rag, registry=TemplateRegistry(cache_path='')), 'late')
+        repo = PromptRepository(FakeRAG(), registry=self.registry)
+        repo.rag = self.rag
+
+        self.assertEqual(repo.find_by_name('late').name, 'late')
+        self.assertIsNotNone(self.registry.get('late'))
+
+    def test_update_performance_writes_through(self):
+        repo = PromptRepository(self.rag, registry=self.registry)
+        prompt_id = store(repo, 'dev_prompt')
+
+        repo.update_performance(prompt_id, True)
+        repo.update_performance(prompt_id, False)
+
+        template = self.registry.get('dev_prompt')
+        self.assertEqual((template.usage_count, template.success_rate), (2, 0.5))
+        cached = json.loads(Path(self.cache_path).read_text())['templates'][0]
+        self.assertEqual(cached['usage_count'], 2)
+
+    def test_prompt_manager_renders_registered_template(self):
+        manager = PromptManager(self.rag, verbose=False)
+        manager.store_prompt(name='dev_prompt', category='developer_agent', perspectives=['Engineer'], success_metrics=['Works'], context_layers={}, task_breakdown=['Code'], self_critique='Check', system_message='You are a developer', user_template='Implement {task} in {language}')
+
+        rendered = manager.render_prompt(manager.get_prompt('dev_prompt'), {'task': 'login', 'language': 'Python'})
+        self.assertIn('Implement login in Python', rendered['user'])
+
+
+class TestCompiledTemplates(unittest.TestCase):
+
+    def test_compiled_plan_is_cached_and_renders(self):
+        compiled = compile_template('Hi {name}, meet {other} and {name}')
+        self.assertIs(compiled, compile_template('Hi {name}, meet {other} and {name}'))
+        self.assertEqual(compiled.placeholders, ['name', 'other'])
+        self.assertEqual(compiled.render({'name': 'Ada'}), 'Hi Ada, meet {other} and Ada')
+
+    def test_substitutor_behaviour_preserved(self):
+        substitutor = VariableSubstitutor()
+        self.assertEqual(substitutor.substitute('{a} and {b}', {'a': 1, 'b': 'x'}), '1 and x')
+        self.assertEqual(substitutor.substitute('no vars', {}), 'no vars')
+        self.assertEqual(substitutor.validate_variables('{a} {b}', {'a': 1, 'c': 2}), {'valid': False, 'missing': ['b'], 'extra': ['c']})
+        with self.assertRaises(ValueError):
+            VariableSubstitutor(strict=True).substitute('{a} {b}', {'a': 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Tests for batched RAG artifact ingestion
+
+WHY: Validates that storing many artifacts groups them by collection and
+     writes them in a few chunked calls instead of one round-trip each.
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from rag import RAGEngine
+from research.models import ResearchExample
+from research.storage import ExampleStorage
+
+
+class RecordingCollection:
+    """Collection stand-in that records each write call"""
+
+    def __init__(self, fail=False):
+        self.calls = []
+        self.fail = fail
+
+    def upsert(self, ids, documents, metadatas):
+        if self.fail:
+            raise RuntimeError("write rejected")
+        self.calls.append(list(ids))
+
+    def count(self):
+        return sum(len(ids) for ids in self.calls)
+
+
+class TestRAGBatchIngestion(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.engine = RAGEngine(db_path=self.tmp.name, verbose=False)
+        self.engine.vector_store.chromadb_available = True
+        self.engine.vector_store.client = object()
+        self.collections = {
+            "code_example": RecordingCollection(),
+            "research_report": RecordingCollection(),
+        }
+        self.engine.vector_store.collections = self.collections
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _items(self, count, artifact_type="code_example"):
+        return [
+            {
+                "artifact_type": artifact_type,
+                "card_id": "card-1",
+                "task_title": f"Example {i}",
+                "content": f"def example_{i}(): pass",
+                "metadata": {"tags": ["python"]},
+            }
+            for i in range(count)
+        ]
+
+    def test_groups_by_collection_and_chunks_writes(self):
+        items = self._items(5) + self._items(2, "research_report") + self._items(1, "unknown")
+        result = self.engine.store_artifacts_batch(items, chunk_size=2)
+
+        self.assertEqual([len(ids) for ids in self.collections["code_example"].calls], [2, 2, 1])
+        self.assertEqual(len(self.collections["research_report"].calls), 1)
+        self.assertEqual(result.write_calls, 4)
+        self.assertEqual((result.stored, result.failed), (7, 1))
+        self.assertIsNone(result.artifact_ids[-1])
+        self.assertEqual(len(set(result.artifact_ids[:7])), 7)
+        self.assertGreater(result.artifacts_per_second, 0)
+
+    def test_failed_chunk_is_reported_not_raised(self):
+        self.collections["research_report"].fail = True
+        result = self.engine.store_artifacts_batch(self._items(3) + self._items(2, "research_report"))
+        self.assertEqual((result.stored, result.failed), (3, 2))
+        self.assertEqual(result.artifact_ids[3:], [None, None])
+
+    def test_mock_storage_batch(self):
+        self.engine.vector_store.chromadb_available = False
+        self.engine.vector_store.client = None
+        result = self.engine.store_artifacts_batch(self._items(4))
+        self.assertEqual(result.stored, 4)
+        self.assertEqual(self.engine.vector_store.get_collection_count("code_example"), 4)
+
+    def test_example_storage_uses_batch_path(self):
+        storage = ExampleStorage(self.engine)
+        examples = [
+            ResearchExample(title=f"ex{i}", content=f"print({i})", source="local", url=None, language="python",
+                            tags=["python"], relevance_score=0.5)
+            for i in range(10)
+        ]
+        artifact_ids = storage.store_batch(examples, "card-2", "Research")
+        self.assertEqual(len(artifact_ids), 10)
+        self.assertEqual(len(self.collections["code_example"].calls), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
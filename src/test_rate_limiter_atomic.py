@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Tests for atomic request/token rate limiting
+
+WHY: Validates that the Lua-backed limiter enforces request and token budgets
+     together, lets concurrent workers admit exactly the limit, corrects token
+     estimates on settle, and that acquire() waits instead of raising.
+
+Requires fakeredis with Lua support (pip install "fakeredis[lua]").
+"""
+
+import os
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+
+SRC_DIR = str(Path(__file__).parent)
+
+
+def _import_fakeredis():
+    """
+    Import redis-py and fakeredis with src/ hidden from sys.path.
+
+    WHY: src/redis (the pipeline tracker package) shadows the redis-py
+         library that redis_client and fakeredis need.
+    """
+    saved_path = sys.path[:]
+    sys.path[:] = [p for p in sys.path if os.path.abspath(p or os.curdir) != SRC_DIR]
+    try:
+        import redis
+        import fakeredis
+        import lupa  # noqa: F401 - fakeredis needs it to run Lua scripts
+    except ImportError:
+        return None
+    finally:
+        sys.path[:] = saved_path
+    return fakeredis if hasattr(redis, "Redis") else None
+
+
+fakeredis = _import_fakeredis()
+
+# Add src to path
+sys.path.insert(0, SRC_DIR)
+
+
+class FakeRedisClient:
+    """RedisClient-shaped wrapper around a fakeredis connection"""
+
+    def __init__(self, server):
+        self.client = fakeredis.FakeRedis(server=server)
+
+    def delete(self, *keys):
+        return self.client.delete(*keys)
+
+
+@unittest.skipIf(fakeredis is None, "fakeredis[lua] not installed")
+class TestAtomicRateLimiter(unittest.TestCase):
+
+    def setUp(self):
+        from rate_limiting import RedisRateLimiter
+        self.server = fakeredis.FakeServer()
+        self.limiter_class = RedisRateLimiter
+        self.limiter = self._limiter()
+
+    def _limiter(self):
+        return self.limiter_class(FakeRedisClient(self.server))
+
+    def test_request_limit_raises_with_retry_after(self):
+        from rate_limiting import RateLimitExceeded
+        for _ in range(3):
+            self.assertTrue(self.limiter.check_rate_limit("api", limit=3, window_seconds=60))
+        with self.assertRaises(RateLimitExceeded) as raised:
+            self.limiter.check_rate_limit("api", limit=3, window_seconds=60)
+        self.assertGreater(raised.exception.context["retry_after_seconds"], 59)
+        self.assertEqual(self.limiter.get_remaining_requests("api", 3, 60), 0)
+
+    def test_token_budget_and_settle(self):
+        first = self.limiter.reserve("llm", 0, 60, tokens=600, token_limit=1000)
+        self.assertTrue(first.allowed)
+
+        denied = self.limiter.reserve("llm", 0, 60, tokens=600, token_limit=1000)
+        self.assertFalse(denied.allowed)
+        self.assertIsNone(denied.reservation_id)
+
+        # The call used fewer tokens than estimated - the rest is returned
+        self.assertTrue(self.limiter.settle(first, 200))
+        second = self.limiter.reserve("llm", 0, 60, tokens=600, token_limit=1000)
+        self.assertTrue(second.allowed)
+        self.assertEqual(second.token_count, 800)
+
+    def test_concurrent_workers_never_overshoot(self):
+        admitted = []
+        lock = threading.Lock()
+
+        def worker(limiter):
+            for _ in range(10):
+                allowed = limiter.reserve("shared", 50, 60).allowed
+                with lock:
+                    admitted.append(allowed)
+
+        threads = [threading.Thread(target=worker, args=(self._limiter(),)) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sum(admitted), 50)
+
+    def test_acquire_waits_for_window_then_times_out(self):
+        from rate_limiting import RateLimitExceeded
+        self.limiter.reserve("slow", 1, 1)
+        started = time.monotonic()
+        reservation = self.limiter.acquire("slow", 1, 1, timeout=5)
+        self.assertTrue(reservation.allowed)
+        self.assertGreater(time.monotonic() - started, 0.5)
+
+        with self.assertRaises(RateLimitExceeded):
+            self.limiter.acquire("slow", 1, 1, timeout=0.1)
+
+    def test_provider_acquire_matches_dated_model_ids(self):
+        from rate_limiting import AnthropicRateLimiter
+        limiter = AnthropicRateLimiter(FakeRedisClient(self.server))
+        reservation = limiter.acquire_anthropic("claude-sonnet-4-5-20250929", estimated_tokens=4000)
+        self.assertTrue(reservation.allowed)
+
+        # claude-sonnet-4-5 allows 10000 tokens/minute
+        self.assertTrue(limiter.reserve(reservation.resource, 50, 60, tokens=6000, token_limit=10000).allowed)
+        self.assertFalse(limiter.reserve(reservation.resource, 50, 60, tokens=1, token_limit=10000).allowed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Tests for parallel, adaptive-stopping self-consistency sampling
+
+WHY: Validates that samples run concurrently up to sc_max_parallel, that
+     adaptive stopping skips samples once the vote is decided, and that the
+     confidence breakdown still reaches the result.
+"""
+
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from llm_client import LLMMessage, LLMResponse
+from reasoning.executors import ReasoningExecutor
+from reasoning.models import ReasoningConfig, ReasoningType
+from reasoning_strategies import SelfConsistencyStrategy
+
+
+class FakeLLMClient:
+    """Returns scripted answers after a fixed delay and tracks concurrency"""
+
+    def __init__(self, answers, delay=0.1):
+        self.answers = list(answers)
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def complete(self, messages, model=None, temperature=None, max_tokens=None):
+        with self._lock:
+            answer = self.answers[self.calls % len(self.answers)]
+            self.calls += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        return LLMResponse(
+            content=f"Reasoning...\nAnswer: {answer}",
+            model="fake",
+            provider="fake",
+            usage={"prompt_tokens": 5, "completion_tokens": 5, "total_tokens": 10},
+            raw_response={}
+        )
+
+
+class TestParallelSelfConsistency(unittest.TestCase):
+
+    def _run(self, client, **config_overrides):
+        config = ReasoningConfig(strategy=ReasoningType.SELF_CONSISTENCY, **config_overrides)
+        strategy = SelfConsistencyStrategy(num_samples=config.sc_num_samples)
+        executor = ReasoningExecutor(client)
+        messages = [LLMMessage(role="user", content="What is 6 * 7?")]
+        return executor.execute(messages, strategy, config)
+
+    def test_samples_run_concurrently(self):
+        client = FakeLLMClient(["42"], delay=0.2)
+        started = time.monotonic()
+        result = self._run(client, sc_num_samples=5, sc_max_parallel=5)
+        elapsed = time.monotonic() - started
+
+        self.assertLess(elapsed, 0.6)
+        self.assertEqual(client.max_in_flight, 5)
+        self.assertEqual(result["samples_completed"], 5)
+        self.assertEqual(result["samples_saved"], 0)
+        self.assertEqual(result["total_tokens"], 50)
+        self.assertFalse(result["stopped_early"])
+
+    def test_parallelism_is_capped(self):
+        client = FakeLLMClient(["42"], delay=0.05)
+        self._run(client, sc_num_samples=6, sc_max_parallel=2)
+        self.assertEqual(client.calls, 6)
+        self.assertLessEqual(client.max_in_flight, 2)
+
+    def test_adaptive_stopping_saves_samples(self):
+        client = FakeLLMClient(["42"], delay=0.05)
+        result = self._run(client, sc_num_samples=9, sc_max_parallel=9, sc_adaptive_stopping=True)
+
+        # 5 agreeing votes out of 9 cannot be overtaken
+        self.assertEqual(client.calls, 5)
+        self.assertEqual(result["samples_saved"], 4)
+        self.assertTrue(result["stopped_early"])
+        self.assertEqual(result["consistent_answer"]["answer"], "42")
+
+    def test_adaptive_stopping_keeps_sampling_on_disagreement(self):
+        client = FakeLLMClient(["42", "41"], delay=0.01)
+        result = self._run(client, sc_num_samples=5, sc_max_parallel=1, sc_adaptive_stopping=True)
+
+        # 42, 41, 42, 41 - only the fifth sample settles it
+        self.assertEqual(result["samples_completed"], 5)
+        self.assertFalse(result["stopped_early"])
+        self.assertEqual(result["consistent_answer"]["answer"], "42")
+
+    def test_confidence_breakdown_preserved(self):
+        client = FakeLLMClient(["42", "42", "41"], delay=0.01)
+        result = self._run(client, sc_num_samples=3, sc_max_parallel=1)
+        breakdown = result["confidence_breakdown"]
+        self.assertEqual(breakdown["total_samples"], 3)
+        self.assertEqual(breakdown["unique_answers"], 2)
+        self.assertEqual(breakdown["majority_count"], 2)
+
+    def test_votes_needed_to_decide(self):
+        strategy = SelfConsistencyStrategy(num_samples=5)
+        self.assertEqual(strategy.votes_needed_to_decide(5, 0), 3)
+        for answer in ("A", "A", "B"):
+            strategy.parse_response(f"Answer: {answer}")
+        self.assertEqual(strategy.votes_needed_to_decide(5, 3), 1)
+        strategy.parse_response("Answer: A")
+        self.assertEqual(strategy.votes_needed_to_decide(5, 4), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Tests for concurrent, chunk-aware requirements extraction
+
+WHY: Validates that long documents are split at section boundaries, that
+     extraction passes run concurrently with a byte-identical document
+     prefix, and that per-chunk results are deduplicated, renumbered and
+     have their cross-references remapped.
+"""
+
+import json
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from requirements_parser.document_chunker import chunk_document, split_sections
+from requirements_parser.extraction_engine import ExtractionEngine
+from requirements_parser.extraction_merger import ExtractionMerger
+
+SECTION_A = "# Authentication\n\n" + "Users log in with email and password.\n" * 20
+SECTION_B = "# Reporting\n\n" + "Admins export monthly reports as CSV.\n" * 20
+
+
+class FakeLLM:
+    """Answers each pass from the chunk it sees; records calls and concurrency"""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def generate_text(self, messages):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.calls.append(messages)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        return SimpleNamespace(content=json.dumps(self._answer(messages[0].content, messages[1].content)))
+
+    def _answer(self, document, instructions):
+        login = "Authentication" in document
+        if instructions.endswith("Keep it concise and factual."):
+            return {"executive_summary": "Login" if login else "Reports", "business_goals": ["Secure access" if login else "Insight"], "success_criteria": [], "glossary": {}}
+        if "Extract ALL functional requirements" in instructions:
+            reqs = [{"id": "REQ-F-001", "title": "Audit log", "description": "Record every user action", "priority": "high"}]
+            if login:
+                reqs.append({"id": "REQ-F-002", "title": "Login", "description": "Users log in with email", "priority": "high", "dependencies": ["REQ-F-001"]})
+            else:
+                reqs.append({"id": "REQ-F-002", "title": "CSV export", "description": "Admins export reports", "priority": "medium", "dependencies": ["REQ-F-001"]})
+            return reqs
+        if "Extract use cases" in instructions:
+            return [{"id": "UC-001", "title": "Sign in" if login else "Export", "actor": "User", "related_requirements": ["REQ-F-002"]}]
+        return []
+
+
+class TestDocumentChunker(unittest.TestCase):
+
+    def test_short_document_is_one_chunk(self):
+        chunks = chunk_document("# Title\n\nshort", max_chars=1000)
+        self.assertEqual(len(chunks), 1)
+        self.assertFalse(chunks[0].is_partial)
+
+    def test_long_document_splits_at_headings(self):
+        self.assertEqual(len(split_sections(SECTION_A + SECTION_B)), 2)
+        chunks = chunk_document(SECTION_A + SECTION_B, max_chars=len(SECTION_A) + 10)
+        self.assertEqual([chunk.heading for chunk in chunks], ["Authentication", "Reporting"])
+        self.assertEqual("".join(chunk.text for chunk in chunks), SECTION_A + SECTION_B)
+
+    def test_oversized_section_respects_budget(self):
+        text = "# Huge\n\n" + ("word " * 100 + "\n\n") * 10
+        chunks = chunk_document(text, max_chars=600)
+        self.assertTrue(all(len(chunk.text) <= 600 for chunk in chunks))
+        self.assertEqual("".join(chunk.text for chunk in chunks), text)
+
+
+class TestExtractionMerger(unittest.TestCase):
+
+    def test_near_duplicates_collapse(self):
+        merger = ExtractionMerger()
+        self.assertTrue(merger.is_near_duplicate("record every user action", "record every users action"))
+        self.assertFalse(merger.is_near_duplicate("record every user action", "export monthly reports"))
+
+
+class TestChunkedExtraction(unittest.TestCase):
+
+    def test_single_chunk_keeps_legacy_results(self):
+        engine = ExtractionEngine(FakeLLM(), max_chunk_chars=100000)
+        result = engine.extract_all(SECTION_A, "Demo")
+        self.assertEqual([req.id for req in result["functional"]], ["REQ-F-001", "REQ-F-002"])
+        self.assertEqual(result["overview"]["executive_summary"], "Login")
+        self.assertEqual(len(engine.llm.calls), 9)
+
+    def test_passes_run_concurrently(self):
+        llm = FakeLLM(delay=0.05)
+        ExtractionEngine(llm, max_workers=9, max_chunk_chars=100000).extract_all(SECTION_A, "Demo")
+        self.assertGreater(llm.peak, 1)
+
+    def test_document_prefix_is_shared_across_passes(self):
+        llm = FakeLLM()
+        ExtractionEngine(llm, max_chunk_chars=len(SECTION_A) + 10).extract_all(SECTION_A + SECTION_B, "Demo")
+        self.assertEqual(len(llm.calls), 18)
+        prefixes = {messages[0].content for messages in llm.calls}
+        self.assertEqual(len(prefixes), 2)  # one per chunk
+        self.assertTrue(all(messages[0].role == "system" for messages in llm.calls))
+        self.assertTrue(all(messages[1].content.startswith("This is part ") for messages in llm.calls))
+
+    def test_chunks_merged_renumbered_and_remapped(self):
+        engine = ExtractionEngine(FakeLLM(), max_chunk_chars=len(SECTION_A) + 10)
+        result = engine.extract_all(SECTION_A + SECTION_B, "Demo")
+
+        functional = result["functional"]
+        self.assertEqual([req.title for req in functional], ["Audit log", "Login", "CSV export"])
+        self.assertEqual([req.id for req in functional], ["REQ-F-001", "REQ-F-002", "REQ-F-003"])
+        self.assertEqual(functional[2].dependencies, ["REQ-F-001"])
+
+        use_cases = result["use_cases"]
+        self.assertEqual([uc.id for uc in use_cases], ["UC-001", "UC-002"])
+        self.assertEqual(use_cases[0].related_requirements, ["REQ-F-002"])
+        self.assertEqual(use_cases[1].related_requirements, ["REQ-F-003"])
+
+        self.assertEqual(result["overview"]["executive_summary"], "Login")
+        self.assertEqual(result["overview"]["business_goals"], ["Secure access", "Insight"])
+
+    def test_single_pass_api_unchanged(self):
+        engine = ExtractionEngine(FakeLLM())
+        self.assertEqual(len(engine.extract_functional_requirements(SECTION_A)), 2)
+        self.assertEqual(engine.extract_stakeholders(SECTION_A), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
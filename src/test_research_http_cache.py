@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Tests for concurrent research fan-out and the on-disk HTTP response cache
+
+WHY: Validates against a local stub HTTP server that:
+     - Fresh cache entries are served without touching the network
+     - Stale entries are revalidated with ETag (304 reuses the cached body)
+     - Keep-alive connections are reused across requests
+     - Sources are searched concurrently under an overall deadline
+"""
+
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import List
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from research.base_strategy import ResearchStrategy
+from research.http_client import HTTPRequestError, HTTPResponseCache, PooledHTTPClient
+from research.models import ResearchExample
+from stages.research.example_searcher import ExampleSearcher
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves /file with an ETag, /missing with 404, /redirect -> /file"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.hits += 1
+            server.client_ports.add(self.client_address[1])
+
+        if self.path == "/redirect":
+            self._reply(302, b"", {"Location": "/file"})
+            return
+        if self.path != "/file":
+            self._reply(404, b"missing")
+            return
+        if self.headers.get("If-None-Match") == '"v1"':
+            self._reply(304, b"", {"ETag": '"v1"'})
+            return
+        self._reply(200, b"print('hello')", {"ETag": '"v1"'})
+
+    def _reply(self, status, body, headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestPooledHTTPClient(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        cls.server.lock = threading.Lock()
+        cls.server.daemon_threads = True
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.hits = 0
+        self.server.client_ports = set()
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _client(self, ttl):
+        return PooledHTTPClient(timeout_seconds=5, cache=HTTPResponseCache(self.tmp.name, ttl_seconds=ttl))
+
+    def test_fresh_cache_skips_network(self):
+        client = self._client(ttl=60)
+        first = client.get(f"{self.base_url}/file")
+        second = self._client(ttl=60).get(f"{self.base_url}/file")
+
+        self.assertEqual(first.text(), "print('hello')")
+        self.assertFalse(first.from_cache)
+        self.assertTrue(second.from_cache)
+        self.assertEqual(self.server.hits, 1)
+
+    def test_stale_entry_revalidates_with_etag(self):
+        client = self._client(ttl=0)
+        client.get(f"{self.base_url}/file")
+        response = client.get(f"{self.base_url}/file")
+
+        self.assertTrue(response.from_cache)
+        self.assertEqual(response.text(), "print('hello')")
+        self.assertEqual(client.stats["revalidated"], 1)
+
+    def test_keep_alive_reuses_connection(self):
+        client = PooledHTTPClient(timeout_seconds=5)
+        for _ in range(5):
+            client.get(f"{self.base_url}/file")
+        client.close()
+
+        self.assertEqual(self.server.hits, 5)
+        self.assertEqual(len(self.server.client_ports), 1)
+        self.assertEqual(client.stats["connections_opened"], 1)
+
+    def test_redirect_and_error_status(self):
+        client = PooledHTTPClient(timeout_seconds=5)
+        self.assertEqual(client.get(f"{self.base_url}/redirect").text(), "print('hello')")
+        with self.assertRaises(HTTPRequestError):
+            client.get(f"{self.base_url}/missing")
+
+
+class SleepyStrategy(ResearchStrategy):
+    """Fake source that sleeps before returning one example"""
+
+    def __init__(self, name: str, delay: float):
+        super().__init__(timeout_seconds=5)
+        self.name = name
+        self.delay = delay
+
+    def get_source_name(self) -> str:
+        return self.name
+
+    def search(self, query: str, technologies: List[str], max_results: int = 5) -> List[ResearchExample]:
+        time.sleep(self.delay)
+        return [ResearchExample(self.name, "", self.name, None, "python", [], 1.0)]
+
+
+class TestExampleSearcherFanOut(unittest.TestCase):
+
+    def test_sources_run_concurrently(self):
+        strategies = [SleepyStrategy(f"s{i}", 0.3) for i in range(3)]
+        start = time.monotonic()
+        examples = ExampleSearcher().search_all_sources(strategies, "query", [])
+        elapsed = time.monotonic() - start
+
+        self.assertEqual([e.title for e in examples], ["s0", "s1", "s2"])
+        self.assertLess(elapsed, 0.8)
+
+    def test_deadline_skips_slow_sources(self):
+        searcher = ExampleSearcher(deadline_seconds=0.2)
+        strategies = [SleepyStrategy("fast", 0.0), SleepyStrategy("slow", 2.0)]
+        start = time.monotonic()
+        examples = searcher.search_all_sources(strategies, "query", [])
+
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertEqual([e.title for e in examples], ["fast"])
+        self.assertEqual(searcher.last_timed_out_sources, ["slow"])
+
+
+if __name__ == "__main__":
+    unittest.main()
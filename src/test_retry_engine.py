@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared retry engine
+
+WHY: Validates decorrelated-jitter backoff, per-dependency retry budgets,
+     deadline propagation and retry metrics, and that both the supervisor's
+     WorkflowExecutor and the dynamic pipeline's StageExecutor use them.
+"""
+
+import random
+import sys
+import unittest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from dynamic_pipeline import RetryPolicy
+from dynamic_pipeline.stage_executor import StageExecutor
+from pipeline_observer import PipelineObservable
+from state_machine.issue_type import IssueType
+from state_machine.pipeline_state import PipelineState
+from state_machine.workflow import Workflow
+from state_machine.workflow_action import WorkflowAction
+from state_machine.workflow_executor import WorkflowExecutor
+from test_advanced_features.mock_classes import MockStage
+from utilities.retry_engine import (
+    STOP_BUDGET_EXHAUSTED,
+    STOP_DEADLINE_EXCEEDED,
+    STOP_EXHAUSTED,
+    BackoffPolicy,
+    Deadline,
+    RetryEngine,
+)
+
+
+class FakeClock:
+    """Monotonic clock advanced by the engine's sleep"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_engine(clock, capacity=10, refill=0.5):
+    return RetryEngine(budget_capacity=capacity, budget_refill_per_second=refill, clock=clock, sleep=clock.sleep, rng=random.Random(7))
+
+
+def failing(attempt):
+    raise ConnectionError("provider unavailable")
+
+
+class TestRetryEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.engine = make_engine(self.clock)
+
+    def test_decorrelated_jitter_stays_within_bounds(self):
+        policy = BackoffPolicy(base_delay=1.0, max_delay=10.0)
+        rng = random.Random(1)
+        delay = 0.0
+        for _ in range(50):
+            previous, delay = delay, policy.next_delay(delay, rng)
+            self.assertGreaterEqual(delay, 1.0)
+            self.assertLessEqual(delay, min(10.0, max(1.0, previous * 3)))
+
+    def test_retries_until_success_and_records_metrics(self):
+        outcome = self.engine.run(lambda attempt: attempt == 2, dependency="llm", max_attempts=5, is_success=bool)
+
+        self.assertTrue(outcome.succeeded)
+        self.assertEqual((outcome.attempts, outcome.retries), (3, 2))
+        self.assertEqual(len(self.clock.sleeps), 2)
+        stats = self.engine.get_metrics()["llm"]
+        self.assertEqual((stats["attempts"], stats["retries"], stats["successes"]), (3, 2, 1))
+        self.assertAlmostEqual(stats["backoff_seconds"], sum(self.clock.sleeps))
+
+    def test_exhausted_attempts_return_last_error(self):
+        outcome = self.engine.run(failing, dependency="llm", max_attempts=3)
+
+        self.assertFalse(outcome.succeeded)
+        self.assertEqual(outcome.stop_reason, STOP_EXHAUSTED)
+        self.assertIsInstance(outcome.error, ConnectionError)
+
+    def test_budget_is_shared_per_dependency_and_refills(self):
+        engine = make_engine(self.clock, capacity=3, refill=0.0)
+
+        first = engine.run(failing, dependency="openai", max_attempts=10, backoff=BackoffPolicy(base_delay=0.01, max_delay=0.01))
+        second = engine.run(failing, dependency="openai", max_attempts=10)
+        other = engine.run(failing, dependency="anthropic", max_attempts=2, backoff=BackoffPolicy(base_delay=0.01, max_delay=0.01))
+
+        self.assertEqual((first.stop_reason, first.attempts), (STOP_BUDGET_EXHAUSTED, 4))
+        self.assertEqual((second.stop_reason, second.attempts), (STOP_BUDGET_EXHAUSTED, 1))
+        self.assertEqual(other.stop_reason, STOP_EXHAUSTED)
+        self.assertEqual(engine.get_metrics()["openai"]["budget_exhausted"], 2)
+
+        refilling = make_engine(self.clock, capacity=1, refill=1.0)
+        refilling.budget("git").try_acquire()
+        self.assertFalse(refilling.budget("git").try_acquire())
+        self.clock.now += 1.0
+        self.assertTrue(refilling.budget("git").try_acquire())
+
+    def test_never_sleeps_past_deadline(self):
+        deadline = Deadline.after(2.5, clock=self.clock)
+
+        outcome = self.engine.run(failing, dependency="llm", max_attempts=10, backoff=BackoffPolicy(base_delay=1.0, max_delay=1.0), deadline=deadline)
+
+        self.assertEqual(outcome.stop_reason, STOP_DEADLINE_EXCEEDED)
+        self.assertEqual(self.clock.sleeps, [1.0, 1.0])
+        self.assertEqual(self.engine.get_metrics()["llm"]["deadline_exceeded"], 1)
+
+
+class TestExecutorsUseEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.engine = make_engine(self.clock)
+
+    def test_workflow_actions_retry_with_backoff_and_deadline(self):
+        calls = []
+
+        def flaky(context):
+            calls.append(context.get("deadline"))
+            return len(calls) == 2
+
+        action = WorkflowAction(action_name="restart_llm", handler=flaky, max_retries=3, dependency="openai")
+        workflow = Workflow(name="recover", issue_type=IssueType.LLM_API_ERROR, actions=[action], success_state=PipelineState.RUNNING, failure_state=PipelineState.FAILED)
+        executor = WorkflowExecutor({IssueType.LLM_API_ERROR: workflow}, verbose=False, retry_engine=self.engine)
+        deadline = Deadline.after(60, clock=self.clock)
+
+        self.assertTrue(executor.execute_workflow(IssueType.LLM_API_ERROR, {}, deadline=deadline))
+        self.assertEqual(calls, [deadline, deadline])
+        self.assertEqual(len(self.clock.sleeps), 1)
+        self.assertGreaterEqual(self.clock.sleeps[0], 1.0)
+        self.assertEqual(executor.get_retry_metrics()["openai"]["retries"], 1)
+
+    def test_stage_executor_retries_through_shared_budget(self):
+        executor = StageExecutor(PipelineObservable(verbose=False), RetryPolicy(max_retries=5, initial_delay=0.01, dependency="openai"), retry_engine=make_engine(self.clock, capacity=2, refill=0.0))
+        stage = MockStage("codegen", should_fail=True)
+
+        result = executor.execute_stage(stage, {}, "CARD-1")
+
+        self.assertFalse(result.success)
+        self.assertEqual((stage.execution_count, result.retry_count), (3, 2))
+        self.assertEqual(executor.get_retry_metrics()["openai"]["budget_exhausted"], 1)
+
+        healthy = StageExecutor(PipelineObservable(verbose=False), RetryPolicy(initial_delay=0.01), retry_engine=self.engine)
+        self.assertTrue(healthy.execute_stage(MockStage("codegen"), {}, "CARD-1").success)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Tests for sharded test runs with structured reports
+
+WHY: Validates that suites are split into duration-balanced shards run in
+     parallel, that counts come from structured reports (not from words in
+     test names), that each shard is reported as it finishes, and that
+     per-test durations are recorded for later balancing.
+"""
+
+import json
+import shutil
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from stages.testing import DurationHistory, plan_shards
+from stages.testing.reports import parse_gtest_json, parse_jest_json
+from stages.testing.runners import PytestRunner, UnittestRunner
+
+
+class TestShardPlanning(unittest.TestCase):
+
+    def test_longest_units_spread_across_shards(self):
+        shards = plan_shards(["a", "b", "c", "d"], {"a": 10, "b": 5, "c": 4, "d": 1}, 2)
+        self.assertEqual(sorted(shards), [["a"], ["b", "c", "d"]])
+
+    def test_unknown_units_weighted_by_median(self):
+        shards = plan_shards(["slow", "x", "y", "z"], {"slow": 9, "x": 3}, 3)
+        self.assertEqual(len(shards), 3)
+        self.assertIn(["slow"], shards)
+
+    def test_never_more_shards_than_units(self):
+        self.assertEqual(plan_shards(["only"], {}, 8), [["only"]])
+        self.assertEqual(plan_shards([], {}, 4), [])
+
+
+class TestStructuredReports(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def test_jest_json_report(self):
+        report = self.dir / "jest.json"
+        report.write_text(json.dumps({"testResults": [
+            {"name": "/p/a.test.js", "assertionResults": [
+                {"fullName": "adds", "status": "passed", "duration": 12},
+                {"fullName": "PASSED label", "status": "failed", "duration": 3},
+                {"fullName": "later", "status": "pending", "duration": None},
+            ]},
+            {"name": "/p/broken.test.js", "status": "failed", "assertionResults": []},
+        ]}))
+
+        cases = parse_jest_json(report)
+
+        self.assertEqual([case.outcome for case in cases], ["passed", "failed", "skipped", "error"])
+        self.assertAlmostEqual(cases[0].duration, 0.012)
+        self.assertEqual(cases[0].file, "/p/a.test.js")
+
+    def test_gtest_json_report(self):
+        report = self.dir / "gtest.json"
+        report.write_text(json.dumps({"testsuites": [{"name": "Math", "testsuite": [
+            {"name": "Adds", "status": "RUN", "result": "COMPLETED", "time": "0.25s"},
+            {"name": "Divides", "status": "RUN", "result": "COMPLETED", "time": "0s", "failures": [{"failure": "x"}]},
+        ]}]}))
+
+        cases = parse_gtest_json(report)
+
+        self.assertEqual([(case.name, case.outcome) for case in cases], [("Math.Adds", "passed"), ("Math.Divides", "failed")])
+        self.assertEqual(cases[0].duration, 0.25)
+
+
+class TestShardedPythonRunners(unittest.TestCase):
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp(prefix="artemis_shards_test_"))
+        self.tests = self.root / "tests"
+        self.tests.mkdir()
+        self.history = DurationHistory(self.root / "durations.json")
+        self.finished = []
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def write_test(self, name, source):
+        (self.tests / name).write_text(textwrap.dedent(source))
+
+    def runner(self, runner_class):
+        return runner_class(cpu_budget=2, duration_history=self.history, on_shard_complete=self.finished.append)
+
+    def test_pytest_counts_come_from_junit_report(self):
+        self.write_test("test_words.py", """
+            def test_reports_FAILED_and_PASSED_words():
+                print("PASSED FAILED ERROR SKIPPED")
+
+            def test_really_fails():
+                assert False
+        """)
+        self.write_test("test_other.py", """
+            import pytest
+
+            def test_ok():
+                assert True
+
+            @pytest.mark.skip(reason="not yet")
+            def test_skipped():
+                pass
+        """)
+        self.write_test("test_third.py", "def test_ok():\n    assert 1 + 1 == 2\n")
+
+        result = self.runner(PytestRunner).run(self.tests, timeout=120)
+
+        self.assertEqual((result.passed, result.failed, result.skipped, result.errors), (3, 1, 1, 0))
+        self.assertEqual(result.metadata["shards"], 2)
+        self.assertEqual(len(self.finished), 2)
+        self.assertNotEqual(result.exit_code, 0)
+
+        durations = DurationHistory(self.history.path).unit_durations("pytest", ["test_words.py"])
+        self.assertEqual(len(durations), 1)
+
+    def test_unittest_shards_use_reporter(self):
+        self.write_test("test_alpha.py", """
+            import unittest
+
+            class Alpha(unittest.TestCase):
+                def test_pass(self):
+                    self.assertTrue(True)
+
+                def test_fail(self):
+                    self.assertEqual(1, 2)
+
+                @unittest.skip("later")
+                def test_skip(self):
+                    pass
+        """)
+        self.write_test("test_beta.py", """
+            import unittest
+
+            class Beta(unittest.TestCase):
+                def test_error(self):
+                    raise RuntimeError("boom")
+        """)
+
+        result = self.runner(UnittestRunner).run(self.tests, timeout=120)
+
+        self.assertEqual((result.passed, result.failed, result.skipped, result.errors, result.total), (1, 1, 1, 1, 4))
+        self.assertEqual(result.metadata["shards"], 2)
+        recorded = json.loads(self.history.path.read_text())["unittest"]
+        self.assertEqual(len(recorded["test_alpha.py"]), 3)
+
+    def test_history_survives_moved_output_dir_and_drops_removed_units(self):
+        self.write_test("test_one.py", "def test_ok():\n    assert True\n")
+        self.write_test("test_two.py", "def test_ok():\n    assert True\n")
+        self.runner(PytestRunner).run(self.tests, timeout=120)
+
+        # Same suite, next run's output directory, one file removed
+        moved = self.root / "next_run" / "tests"
+        shutil.copytree(self.tests, moved)
+        (moved / "test_two.py").unlink()
+        (moved / "test_three.py").write_text("def test_ok():\n    assert True\n")
+        runner = self.runner(PytestRunner)
+        with patch("stages.testing.base.plan_shards", wraps=plan_shards) as planner:
+            runner.run(moved, timeout=120)
+
+        self.assertEqual(set(planner.call_args.args[1]), {str((moved / "test_one.py").resolve())})
+        recorded = json.loads(self.history.path.read_text())["pytest"]
+        self.assertEqual(sorted(recorded), ["test_one.py", "test_three.py"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Tests for lazy orchestrator loading and the startup import-time budget
+
+WHY: Validates that the lazy registry defers imports until first use and that
+     common CLI commands stay within startup_budget.json (no eager ChromaDB,
+     stage or supervisor imports).
+"""
+
+import sys
+import types
+import unittest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from orchestrator.lazy_imports import LazyRegistry, STAGES, SUBSYSTEMS
+from startup_benchmark import load_budget, parse_importtime, run_benchmark, total_import_us
+
+SAMPLE_IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       200 |        200 |   _io
+import time:       425 |       1216 | _frozen_importlib_external
+import time:        81 |         81 |     json.scanner
+import time:       324 |        405 |   json
+import time:       100 |        505 | config_loader
+"""
+
+
+class TestLazyRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.module = types.ModuleType("lazy_fixture_module")
+        self.module.Thing = object()
+        sys.modules["lazy_fixture_module"] = self.module
+
+    def tearDown(self):
+        sys.modules.pop("lazy_fixture_module", None)
+
+    def test_resolves_on_first_use_and_caches(self):
+        registry = LazyRegistry({"Thing": "lazy_fixture_module:Thing", "Module": "lazy_fixture_module"})
+        self.assertFalse(registry.is_loaded("Thing"))
+        self.assertIs(registry.resolve("Thing"), self.module.Thing)
+        self.assertIs(registry.resolve("Module"), self.module)
+        self.assertEqual(registry.loaded_names(), ["Module", "Thing"])
+
+        # Cached: replacing the module attribute does not change the resolved value
+        original = self.module.Thing
+        self.module.Thing = object()
+        self.assertIs(registry.resolve("Thing"), original)
+
+    def test_module_getattr_limits_names(self):
+        registry = LazyRegistry({"Thing": "lazy_fixture_module:Thing", "Hidden": "lazy_fixture_module:Thing"})
+        module_getattr = registry.module_getattr("host", names=["Thing"])
+        self.assertIs(module_getattr("Thing"), self.module.Thing)
+        with self.assertRaises(AttributeError):
+            module_getattr("Hidden")
+        with self.assertRaises(AttributeError):
+            module_getattr("Missing")
+
+    def test_registered_targets_exist(self):
+        for registry in (SUBSYSTEMS, STAGES):
+            for name in registry.names():
+                module_name, _, attribute = registry._targets[name].partition(":")
+                source = Path(__file__).parent / f"{module_name.replace('.', '/')}.py"
+                self.assertTrue(source.exists(), f"{name}: {source} missing")
+                self.assertIn(f"{attribute}", source.read_text(encoding="utf-8"))
+
+
+class TestStartupBudget(unittest.TestCase):
+
+    def test_parse_importtime(self):
+        records = parse_importtime(SAMPLE_IMPORTTIME)
+        self.assertEqual([r.module for r in records],
+                         ["_io", "_frozen_importlib_external", "json.scanner", "json", "config_loader"])
+        self.assertEqual([r.depth for r in records], [1, 0, 2, 1, 0])
+        self.assertEqual(total_import_us(records), 1216 + 505)
+
+    def test_common_commands_within_budget(self):
+        self.assertTrue(load_budget())
+        for result in run_benchmark():
+            with self.subTest(command=result.command):
+                self.assertEqual(result.violations, [], f"{result.import_ms:.0f}ms, slowest: {result.slowest[:5]}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Tests for coalesced state-machine persistence
+
+WHY: Validates that bursts of stage updates collapse into a few snapshot
+     writes, that terminal states are written immediately, that every
+     transition lands in the append-only log and that in-memory history
+     stays bounded.
+"""
+
+import json
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from state_machine import (
+    ArtemisStateMachineCore,
+    EventType,
+    PipelineState,
+    StageState,
+    StatePersistence,
+    StateTransitionEngine,
+)
+
+
+class TestCoalescedPersistence(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.state_file = Path(self.tmp.name) / "card-1_state.json"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _machine(self):
+        machine = ArtemisStateMachineCore(card_id="card-1", state_dir=self.tmp.name, verbose=False)
+        machine.persistence.flush_interval_ms = 100
+        return machine
+
+    def test_stage_updates_are_coalesced(self):
+        machine = self._machine()
+        for i in range(200):
+            machine.update_stage_state(f"stage-{i % 10}", StageState.RUNNING, attempt=i)
+
+        self.assertEqual(machine.stats["snapshots_requested"], 200)
+        self.assertLessEqual(machine.stats["snapshots_written"], 2)
+
+        machine.flush()
+        saved = json.loads(self.state_file.read_text())
+        self.assertEqual(len(saved["stages"]), 10)
+
+    def test_pending_snapshot_written_by_background_flusher(self):
+        machine = self._machine()
+        machine.update_stage_state("development", StageState.RUNNING)
+        self.assertFalse(self.state_file.exists())
+
+        time.sleep(0.3)
+        self.assertTrue(self.state_file.exists())
+        self.assertIn("development", json.loads(self.state_file.read_text())["stages"])
+
+    def test_terminal_state_written_immediately(self):
+        machine = self._machine()
+        machine.persistence.flush_interval_ms = 60_000
+        machine.transition(PipelineState.INITIALIZING, EventType.START)
+        machine.transition(PipelineState.RUNNING, EventType.STAGE_START)
+        self.assertFalse(self.state_file.exists())
+
+        machine.transition(PipelineState.COMPLETED, EventType.COMPLETE)
+        self.assertEqual(json.loads(self.state_file.read_text())["state"], "completed")
+
+    def test_transitions_appended_to_log(self):
+        machine = self._machine()
+        machine.transition(PipelineState.INITIALIZING, EventType.START, reason="go")
+        machine.transition(PipelineState.RUNNING, EventType.STAGE_START)
+
+        history = machine.get_full_history()
+        self.assertEqual([record["to"] for record in history], ["initializing", "running"])
+        self.assertEqual(history[0]["reason"], "go")
+
+        machine.persistence.delete_snapshot()
+        self.assertEqual(machine.get_full_history(), [])
+
+    def test_history_ring_is_bounded_and_log_keeps_everything(self):
+        persistence = StatePersistence(Path(self.tmp.name), "ring", verbose=False)
+        engine = StateTransitionEngine(verbose=False, history_limit=3, on_transition=persistence.append_transition)
+        engine.transition(PipelineState.INITIALIZING, EventType.START)
+        engine.transition(PipelineState.RUNNING, EventType.STAGE_START)
+        for _ in range(5):
+            engine.transition(PipelineState.PAUSED, EventType.PAUSE)
+            engine.transition(PipelineState.RUNNING, EventType.RESUME)
+
+        self.assertEqual(len(engine.get_history()), 3)
+        self.assertEqual(engine.get_history()[-1].to_state, PipelineState.RUNNING)
+        self.assertEqual(len(persistence.load_transitions()), 12)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Tests for streamed token accounting and per-call metrics hooks
+
+WHY: Validates that complete_stream() on both clients reports provider
+     usage from the stream, falls back to local estimates when the stream is
+     stopped before usage arrives, records time-to-first-token and
+     throughput, and delivers one metrics record per call to registered hooks.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from llm import AnthropicClient, LLMMessage, OpenAIClient
+from llm import usage_metrics
+from llm.usage_metrics import (
+    StreamUsageMeter,
+    cost_tracker_hook,
+    estimate_tokens,
+    register_metrics_hook,
+    unregister_metrics_hook,
+)
+
+MESSAGES = [LLMMessage(role="system", content="You write code"), LLMMessage(role="user", content="Write a function")]
+
+
+def anthropic_events(texts, input_tokens=120, output_tokens=42):
+    yield SimpleNamespace(type="message_start", message=SimpleNamespace(usage=SimpleNamespace(input_tokens=input_tokens, output_tokens=1)))
+    for text in texts:
+        yield SimpleNamespace(type="content_block_delta", delta=SimpleNamespace(type="text_delta", text=text))
+        yield SimpleNamespace(type="text", text=text)  # SDK convenience event, must not double count
+    yield SimpleNamespace(type="message_delta", usage=SimpleNamespace(output_tokens=output_tokens))
+    yield SimpleNamespace(type="message_stop")
+
+
+class FakeAnthropicStream:
+    def __init__(self, events):
+        self.events = events
+
+    def __enter__(self):
+        return self.events
+
+    def __exit__(self, *exc):
+        return False
+
+
+def openai_chunks(texts, prompt_tokens=80, completion_tokens=30):
+    for text in texts:
+        yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))], usage=None)
+    yield SimpleNamespace(choices=[], usage=SimpleNamespace(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens))
+
+
+def anthropic_client(events):
+    client = object.__new__(AnthropicClient)
+    client.client = SimpleNamespace(messages=SimpleNamespace(stream=lambda **kwargs: FakeAnthropicStream(events)))
+    return client
+
+
+def openai_client(chunks, calls):
+    def create(**kwargs):
+        calls.append(kwargs)
+        return chunks
+    client = object.__new__(OpenAIClient)
+    client.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    return client
+
+
+class MetricsHookTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.emitted = []
+        self.hook = register_metrics_hook(self.emitted.append)
+
+    def tearDown(self):
+        unregister_metrics_hook(self.hook)
+
+
+class TestAnthropicStreamingUsage(MetricsHookTestCase):
+
+    def test_provider_usage_from_stream_events(self):
+        response = anthropic_client(anthropic_events(["def ", "f():", " pass"])).complete_stream(MESSAGES, model="claude-sonnet-4-5-20250929")
+
+        self.assertEqual(response.content, "def f(): pass")
+        self.assertEqual(response.usage, {"prompt_tokens": 120, "completion_tokens": 42, "total_tokens": 162})
+        [metrics] = self.emitted
+        self.assertEqual((metrics.provider, metrics.usage_source, metrics.streamed), ("anthropic", "provider", True))
+        self.assertIsNotNone(metrics.time_to_first_token_ms)
+        self.assertIsNotNone(metrics.tokens_per_second)
+        self.assertEqual(response.raw_response["stream_metrics"]["total_tokens"], 162)
+
+    def test_stopped_stream_estimates_completion_tokens(self):
+        texts = ["a" * 40, "STOP", "never"]
+        response = anthropic_client(anthropic_events(texts)).complete_stream(MESSAGES, on_token_callback=lambda token: token != "STOP")
+
+        self.assertTrue(response.raw_response["stopped_early"])
+        self.assertEqual(response.usage["prompt_tokens"], 120)
+        self.assertEqual(response.usage["completion_tokens"], estimate_tokens(response.content))
+        self.assertEqual(self.emitted[0].usage_source, "mixed")
+
+
+class TestOpenAIStreamingUsage(MetricsHookTestCase):
+
+    def test_usage_chunk_is_recorded(self):
+        calls = []
+        response = openai_client(openai_chunks(["Hello", " world"]), calls).complete_stream(MESSAGES, model="gpt-4o")
+
+        self.assertEqual(calls[0]["stream_options"], {"include_usage": True})
+        self.assertEqual(response.content, "Hello world")
+        self.assertEqual(response.usage, {"prompt_tokens": 80, "completion_tokens": 30, "total_tokens": 110})
+        self.assertEqual(self.emitted[0].usage_source, "provider")
+
+    def test_missing_usage_falls_back_to_estimates(self):
+        chunks = [SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content="x" * 20))])]
+        response = openai_client(chunks, []).complete_stream(MESSAGES, model="gpt-4o")
+
+        self.assertEqual(response.usage["completion_tokens"], estimate_tokens("x" * 20, "gpt-4o"))
+        self.assertGreater(response.usage["prompt_tokens"], 0)
+        self.assertEqual(self.emitted[0].usage_source, "estimated")
+
+
+class TestMetricsHooks(unittest.TestCase):
+
+    def tearDown(self):
+        usage_metrics._HOOKS.clear()
+
+    def metrics(self):
+        meter = StreamUsageMeter("openai", "gpt-4o", MESSAGES)
+        meter.on_text("hi")
+        meter.set_usage(prompt_tokens=10, completion_tokens=5)
+        return meter.finish("hi")
+
+    def test_hook_errors_swallowed_unless_requested(self):
+        def failing(metrics):
+            raise RuntimeError("budget exceeded")
+
+        register_metrics_hook(failing)
+        usage_metrics.emit_call_metrics(self.metrics())
+
+        register_metrics_hook(failing, raise_errors=True)
+        with self.assertRaises(RuntimeError):
+            usage_metrics.emit_call_metrics(self.metrics())
+
+    def test_cost_tracker_hook_tracks_call(self):
+        calls = []
+        tracker = SimpleNamespace(track_call=lambda **kwargs: calls.append(kwargs))
+        register_metrics_hook(cost_tracker_hook(tracker, stage="development", card_id="card-1"))
+
+        usage_metrics.emit_call_metrics(self.metrics())
+
+        self.assertEqual(calls, [{"model": "gpt-4o", "provider": "openai", "tokens_input": 10, "tokens_output": 5, "stage": "development", "card_id": "card-1", "purpose": "general"}])
+
+    def test_orchestrator_routes_usage_only_while_pipeline_runs(self):
+        from orchestrator.orchestrator_core import ArtemisOrchestrator
+        from pipeline_observer import EventBuilder, PipelineObservable, StateTrackingObserver
+
+        tracked, requests = [], []
+        redis_metrics = SimpleNamespace(
+            enabled=True,
+            track_llm_request=lambda **kwargs: requests.append(kwargs),
+            track_llm_stream=lambda **kwargs: None,
+        )
+        subsystems = {"get_redis_metrics": lambda: redis_metrics, "StateTrackingObserver": StateTrackingObserver}
+        # Only the hook lifecycle is exercised; skip the full orchestrator setup
+        orchestrator = ArtemisOrchestrator.__new__(ArtemisOrchestrator)
+        orchestrator.card_id, orchestrator._llm_usage_hooks, orchestrator._llm_stage_observer = "card-7", [], None
+        orchestrator.observable = PipelineObservable(verbose=False)
+        orchestrator.supervisor = SimpleNamespace(cost_tracker=SimpleNamespace(track_call=lambda **kwargs: tracked.append(kwargs)))
+
+        with patch("orchestrator.orchestrator_core.SUBSYSTEMS.resolve", side_effect=subsystems.__getitem__):
+            orchestrator.attach_llm_usage_hooks()
+        orchestrator.observable.notify(EventBuilder.stage_started("card-7", "DevelopmentStage"))
+        usage_metrics.emit_call_metrics(self.metrics())
+        orchestrator.observable.notify(EventBuilder.stage_completed("card-7", "DevelopmentStage"))
+        usage_metrics.emit_call_metrics(self.metrics())
+        orchestrator.release_llm_usage_hooks()
+        usage_metrics.emit_call_metrics(self.metrics())
+
+        self.assertEqual([(call["card_id"], call["stage"]) for call in tracked],
+                         [("card-7", "DevelopmentStage"), ("card-7", "llm")])
+        self.assertEqual(len(requests), 2)
+        self.assertEqual(usage_metrics._HOOKS, [])
+        self.assertEqual(orchestrator.observable._observers, [])
+
+if __name__ == "__main__":
+    unittest.main()
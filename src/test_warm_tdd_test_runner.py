@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Tests for incremental TDD test runs on a warm pytest worker
+
+WHY: Validates that repeated runs only execute tests affected by changed
+     source or test files, that previously failing tests run first, that
+     skipped tests keep their last results, and that worker failures fall
+     back to a full cold run.
+"""
+
+import shutil
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from agents.developer import DeveloperTestRunner, WarmTestSession
+from stages.testing import DurationHistory
+
+
+def write(path: Path, source: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(textwrap.dedent(source))
+
+
+class TestWarmTestSession(unittest.TestCase):
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp(prefix="artemis_warm_test_"))
+        write(self.root / "calculator.py", "def add(a, b):\n    return a - b\n")
+        write(self.root / "greeting.py", "def greet(name):\n    return f'hello {name}'\n")
+        write(self.root / "tests" / "test_calculator.py", """
+            from calculator import add
+
+            def test_add():
+                assert add(2, 3) == 5
+
+            def test_add_zero():
+                assert add(0, 0) == 0
+        """)
+        write(self.root / "tests" / "test_greeting.py", """
+            from greeting import greet
+
+            def test_greet():
+                assert greet('bob') == 'hello bob'
+        """)
+        self.session = WarmTestSession(self.root)
+
+    def tearDown(self):
+        self.session.close()
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_reruns_failing_and_changed_tests_only(self):
+        first = self.session.run()
+        self.assertEqual((first["passed"], first["failed"], first["total"]), (2, 1, 3))
+        self.assertEqual(first["files_run"], ["tests/test_calculator.py", "tests/test_greeting.py"])
+
+        write(self.root / "calculator.py", "def add(a, b):\n    return a + b\n")
+        second = self.session.run()
+        self.assertEqual(second["files_run"], ["tests/test_calculator.py"])
+        self.assertEqual(second["files_skipped"], ["tests/test_greeting.py"])
+        self.assertEqual((second["passed"], second["failed"], second["exit_code"]), (3, 0, 0))
+
+        unchanged = self.session.run()
+        self.assertEqual((unchanged["files_run"], unchanged["passed"]), ([], 3))
+
+    def test_edited_module_is_reimported_by_warm_worker(self):
+        self.session.run()
+        write(self.root / "greeting.py", "def greet(name):\n    return 'bye'\n")
+
+        result = self.session.run()
+
+        self.assertEqual(result["files_run"], ["tests/test_calculator.py", "tests/test_greeting.py"])
+        self.assertEqual((result["failed"], result["mode"]), (2, "warm"))
+
+    def test_previously_failing_files_run_first(self):
+        write(self.root / "tests" / "test_a_first.py", "def test_ok():\n    assert True\n")
+        self.session.run()
+        write(self.root / "conftest.py", "")
+
+        result = self.session.run()
+
+        self.assertEqual(result["files_run"][0], "tests/test_calculator.py")
+        self.assertEqual(len(result["files_run"]), 3)
+
+
+class TestDeveloperTestRunnerIncremental(unittest.TestCase):
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp(prefix="artemis_warm_test_"))
+        write(self.root / "tests" / "test_simple.py", "def test_ok():\n    assert True\n")
+        # Cold runs record shard durations; keep them out of the real data directory
+        history = patch("stages.testing.sharding._HISTORY", DurationHistory(self.root / "durations.json"))
+        history.start()
+        self.addCleanup(history.stop)
+        self.runner = DeveloperTestRunner()
+
+    def tearDown(self):
+        self.runner.close()
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_warm_runs_reuse_session_per_output_dir(self):
+        first = self.runner.run_tests_incremental(self.root, framework="pytest")
+        second = self.runner.run_tests_incremental(self.root, framework="pytest")
+
+        self.assertEqual((first["mode"], first["passed"]), ("warm", 1))
+        self.assertEqual((second["files_run"], second["passed"]), ([], 1))
+
+    def test_worker_failure_falls_back_to_cold_run(self):
+        self.runner._sessions[self.root] = WarmTestSession(self.root, python="/nonexistent/python")
+
+        result = self.runner.run_tests_incremental(self.root, framework="pytest")
+
+        self.assertEqual(result["mode"], "cold")
+        self.assertNotIn(self.root, self.runner._sessions)
+
+
+if __name__ == "__main__":
+    unittest.main()
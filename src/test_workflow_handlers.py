@@ -415,9 +415,9 @@ def test_factory_pattern():
 
     # Test 3: Get all actions
     actions = WorkflowHandlerFactory.get_all_actions()
-    assert len(actions) == 30  # All 30 handlers
+    assert len(actions) == 31  # All 31 handlers
     tests_passed += 1
-    print(f"  ✅ Get all actions (30 handlers)")
+    print(f"  ✅ Get all actions (31 handlers)")
 
     # Test 4: Register new handler
     class CustomHandler(WorkflowHandler):
@@ -498,7 +498,7 @@ def test_handler_categories():
     print("=" * 70)
 
     # Count handlers by category
-    infrastructure = 6
+    infrastructure = 7
     code = 4
     dependencies = 3
     llm = 4
@@ -519,9 +519,9 @@ def test_handler_categories():
     print(f"  System handlers: {system}")
     print(f"  Total handlers: {total}")
 
-    assert total == 30, f"Expected 30 handlers, got {total}"
+    assert total == 31, f"Expected 31 handlers, got {total}"
 
-    print(f"\n✅ Handler categories: All 30 handlers accounted for")
+    print(f"\n✅ Handler categories: All 31 handlers accounted for")
     return True
 
 
@@ -9,6 +9,7 @@ and integrating with the Knowledge Graph for pattern retrieval.
 """
 
 from typing import Dict, Optional, Any
+from compliance_engine import ComplianceReport
 from wcag_evaluator import WCAGEvaluator
 from artemis_exceptions import WCAGEvaluationError, wrap_exception
 
@@ -96,7 +97,8 @@ class AccessibilityEvaluator:
     def evaluate_accessibility(
         self,
         developer_name: str,
-        implementation_dir: str
+        implementation_dir: str,
+        report: Optional[ComplianceReport] = None
     ) -> Dict:
         """
         WHY: Run WCAG 2.1 AA accessibility evaluation
@@ -106,6 +108,7 @@ class AccessibilityEvaluator:
         Args:
             developer_name: Name of the developer
             implementation_dir: Directory containing implementation
+            report: Shared single-pass ComplianceReport, if already computed
 
         Returns:
             Dict with WCAG evaluation results
@@ -117,7 +120,7 @@ class AccessibilityEvaluator:
 
         try:
             wcag_evaluator = WCAGEvaluator()
-            wcag_results = wcag_evaluator.evaluate_directory(implementation_dir)
+            wcag_results = wcag_evaluator.evaluate_directory(implementation_dir, report=report)
             return wcag_results
 
         except Exception as e:
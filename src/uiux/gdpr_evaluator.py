@@ -7,7 +7,8 @@ PATTERNS: Facade pattern for GDPR evaluation, Guard clauses
 This module handles GDPR compliance evaluation by delegating to the GDPREvaluator.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+from compliance_engine import ComplianceReport
 from gdpr_evaluator import GDPREvaluator
 from artemis_exceptions import GDPREvaluationError, wrap_exception
 
@@ -37,7 +38,8 @@ class GDPRComplianceEvaluator:
     def evaluate_gdpr_compliance(
         self,
         developer_name: str,
-        implementation_dir: str
+        implementation_dir: str,
+        report: Optional[ComplianceReport] = None
     ) -> Dict:
         """
         WHY: Run GDPR compliance evaluation
@@ -47,6 +49,7 @@ class GDPRComplianceEvaluator:
         Args:
             developer_name: Name of the developer
             implementation_dir: Directory containing implementation
+            report: Shared single-pass ComplianceReport, if already computed
 
         Returns:
             Dict with GDPR evaluation results
@@ -58,7 +61,7 @@ class GDPRComplianceEvaluator:
 
         try:
             gdpr_evaluator = GDPREvaluator()
-            gdpr_results = gdpr_evaluator.evaluate_directory(implementation_dir)
+            gdpr_results = gdpr_evaluator.evaluate_directory(implementation_dir, report=report)
             return gdpr_results
 
         except Exception as e:
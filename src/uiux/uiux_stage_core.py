@@ -19,6 +19,7 @@ from supervised_agent_mixin import SupervisedStageMixin
 from debug_mixin import DebugMixin
 from stage_notifications import StageNotificationHelper
 from artemis_exceptions import UIUXEvaluationError, wrap_exception
+from compliance_engine import ComplianceEngine, ComplianceReport
 
 from .models import DeveloperEvaluation
 from .score_calculator import ScoreCalculator
@@ -153,6 +154,7 @@ class UIUXStage(PipelineStage, SupervisedStageMixin, DebugMixin):
         self.score_calculator = ScoreCalculator(config)
         self.accessibility_evaluator = AccessibilityEvaluator(self.logger, self.ai_service)
         self.gdpr_evaluator = GDPRComplianceEvaluator(self.logger)
+        self.compliance_engine = ComplianceEngine()
         self.feedback_manager = FeedbackManager(self.messenger, self.logger)
         self.evaluation_storage = EvaluationStorage(self.rag, self.logger)
 
@@ -403,14 +405,17 @@ class UIUXStage(PipelineStage, SupervisedStageMixin, DebugMixin):
                 "INFO"
             )
 
+        # Read and tokenize every file once for both rule sets
+        compliance_report = self._scan_compliance(implementation_dir)
+
         # Run WCAG 2.1 AA accessibility evaluation
         wcag_results = self.accessibility_evaluator.evaluate_accessibility(
-            developer_name, implementation_dir
+            developer_name, implementation_dir, report=compliance_report
         )
 
         # Run GDPR compliance evaluation
         gdpr_results = self.gdpr_evaluator.evaluate_gdpr_compliance(
-            developer_name, implementation_dir
+            developer_name, implementation_dir, report=compliance_report
         )
 
         # Calculate overall scores
@@ -454,6 +459,31 @@ class UIUXStage(PipelineStage, SupervisedStageMixin, DebugMixin):
 
         return evaluation
 
+    def _scan_compliance(self, implementation_dir: str) -> Optional[ComplianceReport]:
+        """
+        WHY: WCAG and GDPR rules share one read/parse of each file
+        RESPONSIBILITY: Run the single-pass compliance engine
+        PATTERNS: Guard clause - on failure each evaluator scans on its own
+
+        Args:
+            implementation_dir: Directory containing implementation
+
+        Returns:
+            ComplianceReport, or None if the shared scan failed
+        """
+        try:
+            report = self.compliance_engine.evaluate_directory(implementation_dir)
+        except Exception as e:
+            self.logger.log(f"⚠️  Shared compliance scan failed, evaluating separately: {e}", "WARNING")
+            return None
+
+        self.logger.log(
+            f"Compliance scan: {report.files_evaluated} file(s) evaluated, "
+            f"{report.cache_hits} unchanged (cached)",
+            "INFO"
+        )
+        return report
+
     def _log_developer_evaluation(
         self,
         evaluation_result: DeveloperEvaluation,
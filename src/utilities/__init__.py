@@ -35,6 +35,24 @@ from utilities.retry_utilities import (
     retry_operation
 )
 
+# Shared retry engine (backoff with jitter, retry budgets, deadlines)
+from utilities.retry_engine import (
+    BackoffPolicy,
+    Deadline,
+    RetryBudget,
+    RetryEngine,
+    RetryOutcome,
+    get_retry_engine
+)
+
+# Artifact retention (size and age budgets per artifact class)
+from utilities.retention import (
+    RetentionManager,
+    RetentionPolicy,
+    RetentionReport,
+    enforce_retention
+)
+
 # Validation utilities
 from utilities.validation_utilities import (
     Validator,
@@ -60,6 +78,16 @@ __all__ = [
     'RetryStrategy',
     'retry_with_backoff',
     'retry_operation',
+    'BackoffPolicy',
+    'Deadline',
+    'RetryBudget',
+    'RetryEngine',
+    'RetryOutcome',
+    'get_retry_engine',
+    'RetentionManager',
+    'RetentionPolicy',
+    'RetentionReport',
+    'enforce_retention',
 
     # Validation utilities
     'Validator',
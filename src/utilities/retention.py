@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""
+Module: utilities/retention.py
+
+WHY: Checkpoints, state snapshots, status files, cost logs, message inboxes,
+     temp output and rotated logs all grew without limit. The only guard was
+     an ad-hoc disk_usage check in the disk-full recovery workflow, which
+     fires after the disk is already full.
+
+RESPONSIBILITY:
+- Give every artifact class its own size and age budget (RetentionPolicy)
+- Plan evictions (expired first, then oldest until under the size budget)
+- Archive card histories into tar.gz bundles instead of only deleting them
+- Never touch artifacts of a card that is still running
+- Report what was (or, in dry-run mode, would be) removed or archived
+
+PATTERNS:
+- Strategy Pattern: eviction action per policy via dispatch table
+- Guard Clauses: protected and missing artifacts are skipped early
+- Value Objects: RetentionPolicy, RetentionItem, ClassReport, RetentionReport
+
+Integration: orchestrator.batch_processing runs enforce_retention() between
+             cards; workflows.handlers.EnforceRetentionHandler runs it during
+             disk-space recovery; artemis_retention.py runs it as a standalone
+             maintenance command.
+
+An artifact belongs to a card when the card ID appears as a whole token in
+its file or directory name (checkpoints/card-1.json, state/card-1_state.json, ...).
+Running cards are read from the workflow status directory and can also be
+passed explicitly.
+"""
+
+import argparse
+import json
+import os
+import re
+import shutil
+import tarfile
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from artemis_constants import (
+    DOCUMENT_CACHE_DIR,
+    RETENTION_ARCHIVE_DIR,
+    RETENTION_MIN_AGE_SECONDS,
+)
+from services.path_config.resolver import resolve_env_path
+
+ACTION_DELETE = 'delete'
+ACTION_ARCHIVE = 'archive'
+
+REASON_AGE = 'age'
+REASON_SIZE = 'size'
+REASON_ACTIVE_CARD = 'active_card'
+REASON_RECENT = 'recent'
+
+MB = 1024 * 1024
+DAY_SECONDS = 86400
+
+SCRIPT_DIR = Path(__file__).parent.parent.resolve()
+
+# Artifact class -> (directory env var, default directory, unit glob, max MB, max days, action)
+# Budgets are overridable with ARTEMIS_RETENTION_<CLASS>_MAX_MB / _MAX_DAYS.
+DEFAULT_BUDGETS = {
+    'temp': ('ARTEMIS_TEMP_DIR', '../../.artemis_data/temp', '*', 2048, 7, ACTION_DELETE),
+    'checkpoints': ('ARTEMIS_CHECKPOINT_DIR', '../../.artemis_data/checkpoints', '*', 500, 30, ACTION_ARCHIVE),
+    'state': ('ARTEMIS_STATE_DIR', '../../.artemis_data/state', '*', 200, 30, ACTION_ARCHIVE),
+    'status': ('ARTEMIS_STATUS_DIR', '../../.artemis_data/status', '*.json', 50, 30, ACTION_ARCHIVE),
+    'cost_logs': ('ARTEMIS_COST_DIR', '../../.artemis_data/cost_tracking', '*', 100, 90, ACTION_ARCHIVE),
+    'messages': ('ARTEMIS_MESSAGE_DIR', '../../.artemis_data/agent_messages', '*/*.json', 100, 7, ACTION_DELETE),
+    'document_cache': ('ARTEMIS_DOCUMENT_CACHE_DIR', str(DOCUMENT_CACHE_DIR), '*/*.txt', 500, 30, ACTION_DELETE),
+    'rotated_logs': ('ARTEMIS_LOG_DIR', '/var/log/artemis', '*.log.*', 500, 14, ACTION_DELETE),
+    'archive': ('ARTEMIS_RETENTION_ARCHIVE_DIR', str(RETENTION_ARCHIVE_DIR), '*.tar.gz', 1024, 180, ACTION_DELETE),
+}
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """
+    Size and age budget for one artifact class
+
+    Each path matching `pattern` under `path` is one retention unit (a file
+    or a whole directory). None disables the corresponding budget.
+    """
+    name: str
+    path: Path
+    pattern: str = '*'
+    max_bytes: Optional[int] = None
+    max_age_days: Optional[float] = None
+    action: str = ACTION_DELETE
+
+
+@dataclass
+class RetentionItem:
+    """One artifact considered by a retention run"""
+    path: str
+    size: int
+    age_days: float
+    reason: str
+
+
+@dataclass
+class ClassReport:
+    """Outcome of applying one policy"""
+    name: str
+    path: str
+    action: str
+    total_bytes: int = 0
+    freed_bytes: int = 0
+    evicted: List[RetentionItem] = field(default_factory=list)
+    protected: List[RetentionItem] = field(default_factory=list)
+    archive_path: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def kept_bytes(self) -> int:
+        return self.total_bytes - self.freed_bytes
+
+
+@dataclass
+class RetentionReport:
+    """Outcome of a retention run across all artifact classes"""
+    dry_run: bool
+    active_card_ids: List[str]
+    classes: List[ClassReport] = field(default_factory=list)
+
+    @property
+    def freed_bytes(self) -> int:
+        return sum(report.freed_bytes for report in self.classes)
+
+    @property
+    def evicted_count(self) -> int:
+        return sum(len(report.evicted) for report in self.classes)
+
+    def to_dict(self) -> Dict:
+        return {
+            'dry_run': self.dry_run,
+            'active_card_ids': self.active_card_ids,
+            'freed_bytes': self.freed_bytes,
+            'classes': [dict(asdict(report), kept_bytes=report.kept_bytes) for report in self.classes],
+        }
+
+    def format(self) -> str:
+        """Human-readable summary, one line per artifact class"""
+        verb = 'would free' if self.dry_run else 'freed'
+        lines = [f"Retention {'dry run' if self.dry_run else 'run'}: {verb} {_mb(self.freed_bytes)} "
+                 f"({self.evicted_count} artifacts)"]
+        for report in self.classes:
+            line = (f"  {report.name:<13} {_mb(report.total_bytes):>10} -> {_mb(report.kept_bytes):>10}  "
+                    f"{report.action} {len(report.evicted)}, protected {len(report.protected)}")
+            lines.append(line + (f"  ERROR: {report.error}" if report.error else ''))
+        return '\n'.join(lines)
+
+
+def _mb(size: int) -> str:
+    return f'{size / MB:.1f} MB'
+
+
+def _env_number(name: str, default: Optional[float]) -> Optional[float]:
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return float(value) if value.strip() else None
+
+
+def default_policies() -> List[RetentionPolicy]:
+    """
+    Build the policy for every known artifact class
+
+    Directories honour the same environment variables the pipeline writes
+    with, so retention always looks where artifacts actually are.
+    """
+    policies = []
+    for name, (env_var, default_dir, pattern, max_mb, max_days, action) in DEFAULT_BUDGETS.items():
+        prefix = f'ARTEMIS_RETENTION_{name.upper()}'
+        max_mb = _env_number(f'{prefix}_MAX_MB', max_mb)
+        policies.append(RetentionPolicy(
+            name=name,
+            path=resolve_env_path(env_var, SCRIPT_DIR, default_dir),
+            pattern=pattern,
+            max_bytes=int(max_mb * MB) if max_mb is not None else None,
+            max_age_days=_env_number(f'{prefix}_MAX_DAYS', max_days),
+            action=action,
+        ))
+    return policies
+
+
+def running_card_ids(status_dir: Optional[Path] = None) -> Set[str]:
+    """
+    Card IDs whose workflow status file says they are still running
+
+    WHY: Retention may run from a separate maintenance process, so the
+         status directory (written by WorkflowStatusTracker) is the shared
+         source of truth for what is in flight.
+    """
+    status_dir = Path(status_dir) if status_dir else resolve_env_path('ARTEMIS_STATUS_DIR', SCRIPT_DIR)
+    if not status_dir.is_dir():
+        return set()
+
+    running = set()
+    for status_file in status_dir.glob('*.json'):
+        try:
+            status = json.loads(status_file.read_text())
+        except (OSError, ValueError):
+            continue
+        if isinstance(status, dict) and status.get('status') == 'running':
+            running.add(status.get('card_id') or status_file.stem)
+    return running
+
+
+class RetentionManager:
+    """
+    Applies retention policies to artifact directories
+
+    WHY: One place that knows every artifact class and its budget, instead
+         of each component cleaning (or not cleaning) up after itself.
+    RESPONSIBILITY: Measure, plan, and evict or archive artifacts
+    PATTERNS: Strategy Pattern (action dispatch), Guard Clauses
+
+    Example:
+        >>> report = RetentionManager().run(dry_run=True)
+        >>> print(report.format())
+    """
+
+    def __init__(
+        self,
+        policies: Optional[List[RetentionPolicy]] = None,
+        archive_dir: Optional[Path] = None,
+        status_dir: Optional[Path] = None,
+        min_age_seconds: float = RETENTION_MIN_AGE_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            policies: Policies to apply (default: default_policies())
+            archive_dir: Where archive bundles are written
+            status_dir: Workflow status directory used to find running cards
+            min_age_seconds: Artifacts modified more recently are never touched
+            clock: Time source (injectable for tests)
+        """
+        self.policies = policies if policies is not None else default_policies()
+        self.archive_dir = Path(archive_dir) if archive_dir else RETENTION_ARCHIVE_DIR
+        self.status_dir = status_dir
+        self.min_age_seconds = min_age_seconds
+        self.clock = clock
+        self._actions: Dict[str, Callable[[RetentionPolicy, ClassReport, List[Path]], None]] = {
+            ACTION_DELETE: self._delete,
+            ACTION_ARCHIVE: self._archive,
+        }
+
+    def run(
+        self,
+        dry_run: bool = False,
+        active_card_ids: Optional[Iterable[str]] = None,
+        only: Optional[Iterable[str]] = None,
+    ) -> RetentionReport:
+        """
+        Enforce every policy
+
+        Args:
+            dry_run: Only report what would be evicted
+            active_card_ids: Cards whose artifacts must not be touched, in
+                addition to those the status directory reports as running
+            only: Restrict the run to these artifact class names
+
+        Returns:
+            RetentionReport
+        """
+        active = set(active_card_ids or ()) | running_card_ids(self.status_dir)
+        selected = set(only) if only else None
+        report = RetentionReport(dry_run=dry_run, active_card_ids=sorted(active))
+
+        for policy in self.policies:
+            if selected is not None and policy.name not in selected:
+                continue
+            report.classes.append(self._apply(policy, active, dry_run))
+        return report
+
+    def _apply(self, policy: RetentionPolicy, active: Set[str], dry_run: bool) -> ClassReport:
+        report = ClassReport(name=policy.name, path=str(policy.path), action=policy.action)
+
+        # Guard: nothing stored for this class yet
+        if not policy.path.is_dir():
+            return report
+
+        now = self.clock()
+        units = []
+        for path in policy.path.glob(policy.pattern):
+            size, mtime = _measure(path)
+            units.append((path, size, (now - mtime) / DAY_SECONDS, now - mtime))
+        report.total_bytes = sum(size for _, size, _, _ in units)
+
+        candidates = []
+        for path, size, age_days, age_seconds in sorted(units, key=lambda unit: -unit[2]):
+            protected_reason = self._protected_reason(path, age_seconds, active)
+            if protected_reason:
+                report.protected.append(RetentionItem(str(path), size, round(age_days, 2), protected_reason))
+                continue
+            candidates.append((path, size, age_days))
+
+        remaining = report.total_bytes
+        evicted = []
+        for path, size, age_days in candidates:
+            if policy.max_age_days is not None and age_days > policy.max_age_days:
+                reason = REASON_AGE
+            elif policy.max_bytes is not None and remaining > policy.max_bytes:
+                reason = REASON_SIZE
+            else:
+                continue
+            report.evicted.append(RetentionItem(str(path), size, round(age_days, 2), reason))
+            evicted.append(path)
+            remaining -= size
+
+        report.freed_bytes = report.total_bytes - remaining
+
+        # Guard: nothing to do, or only reporting
+        if not evicted or dry_run:
+            return report
+
+        try:
+            self._actions[policy.action](policy, report, evicted)
+        except (OSError, tarfile.TarError) as e:
+            report.error = str(e)
+            report.freed_bytes = 0
+        return report
+
+    def _protected_reason(self, path: Path, age_seconds: float, active: Set[str]) -> Optional[str]:
+        if any(_names_card(path.name, card_id) for card_id in active):
+            return REASON_ACTIVE_CARD
+        if age_seconds < self.min_age_seconds:
+            return REASON_RECENT
+        return None
+
+    def _delete(self, policy: RetentionPolicy, report: ClassReport, paths: List[Path]) -> None:
+        for path in paths:
+            _remove(path)
+
+    def _archive(self, policy: RetentionPolicy, report: ClassReport, paths: List[Path]) -> None:
+        """Bundle evicted artifacts into one tar.gz, then remove them"""
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.fromtimestamp(self.clock()).strftime('%Y%m%dT%H%M%S')
+        archive_path = self.archive_dir / f'{policy.name}-{stamp}.tar.gz'
+
+        fd, temp_name = tempfile.mkstemp(prefix=f'.{policy.name}.', suffix='.tmp', dir=self.archive_dir)
+        os.close(fd)
+        try:
+            with tarfile.open(temp_name, 'w:gz') as bundle:
+                for path in paths:
+                    bundle.add(path, arcname=path.relative_to(policy.path).as_posix())
+            os.replace(temp_name, archive_path)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+
+        report.archive_path = str(archive_path)
+        for path in paths:
+            _remove(path)
+
+
+def _names_card(name: str, card_id: str) -> bool:
+    """Whether a file name contains the card ID as a whole token (card-1 is not card-10)"""
+    return re.search(rf'(?<![A-Za-z0-9]){re.escape(card_id)}(?![A-Za-z0-9])', name) is not None
+
+
+def _measure(path: Path):
+    """(total size in bytes, newest mtime) of a file or directory tree"""
+    if not path.is_dir() or path.is_symlink():
+        stat_result = path.lstat()
+        return stat_result.st_size, stat_result.st_mtime
+
+    size, newest = 0, None
+    for directory, _, files in os.walk(path):
+        for name in files:
+            try:
+                stat_result = os.lstat(os.path.join(directory, name))
+            except OSError:
+                continue
+            size += stat_result.st_size
+            newest = stat_result.st_mtime if newest is None else max(newest, stat_result.st_mtime)
+    # Empty trees age by the directory's own mtime
+    return size, newest if newest is not None else path.lstat().st_mtime
+
+
+def _remove(path: Path) -> None:
+    if path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path)
+    else:
+        path.unlink(missing_ok=True)
+
+
+def enforce_retention(
+    dry_run: bool = False,
+    active_card_ids: Optional[Iterable[str]] = None,
+    manager: Optional[RetentionManager] = None,
+) -> RetentionReport:
+    """
+    Run retention with the default policies
+
+    WHY: Single entry point for inline use (between cards, recovery workflows)
+    """
+    return (manager or RetentionManager()).run(dry_run=dry_run, active_card_ids=active_card_ids)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Standalone maintenance command (artemis_retention.py)"""
+    parser = argparse.ArgumentParser(description='Enforce size and age budgets on Artemis artifacts')
+    parser.add_argument('--dry-run', action='store_true', help='Report what would be removed or archived')
+    parser.add_argument('--class', dest='classes', action='append', choices=sorted(DEFAULT_BUDGETS),
+                        help='Only process this artifact class (repeatable)')
+    parser.add_argument('--active-card', dest='active_cards', action='append', default=[],
+                        help='Card ID whose artifacts must not be touched (repeatable)')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    args = parser.parse_args(argv)
+
+    report = RetentionManager().run(dry_run=args.dry_run, active_card_ids=args.active_cards, only=args.classes)
+    print(json.dumps(report.to_dict(), indent=2) if args.json else report.format())
+    return 1 if any(item.error for item in report.classes) else 0
+
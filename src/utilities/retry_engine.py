@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Module: utilities/retry_engine.py
+
+WHY: The supervisor's recovery workflows and the dynamic pipeline each had
+     their own retry loop and delay schedule. During a provider brownout both
+     retried the same failing dependency in lockstep, with no cap on how many
+     retries a dependency absorbs and no notion of how much time is left.
+
+RESPONSIBILITY:
+- Run an operation with bounded attempts and decorrelated-jitter backoff
+- Enforce per-dependency retry budgets (token bucket of retries)
+- Honour a propagated deadline (never sleep past it)
+- Record retry metrics per dependency
+
+PATTERNS:
+- Strategy Pattern: BackoffPolicy and retry predicates are supplied by callers
+- Token Bucket: RetryBudget caps retries per dependency, refilled over time
+- Singleton: get_retry_engine() shares budgets and metrics process-wide
+
+Integration: state_machine.workflow_executor.WorkflowExecutor and
+             dynamic_pipeline.stage_executor.StageExecutor.
+"""
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Generic, Optional, TypeVar
+
+from artemis_constants import (
+    RETRY_BUDGET_CAPACITY,
+    RETRY_BUDGET_REFILL_PER_SECOND,
+    RETRY_MAX_DELAY_SECONDS,
+)
+
+T = TypeVar('T')
+
+DEADLINE_CONTEXT_KEY = 'deadline'
+
+STOP_SUCCESS = 'success'
+STOP_EXHAUSTED = 'exhausted'
+STOP_NOT_RETRYABLE = 'not_retryable'
+STOP_BUDGET_EXHAUSTED = 'budget_exhausted'
+STOP_DEADLINE_EXCEEDED = 'deadline_exceeded'
+
+
+@dataclass(frozen=True)
+class BackoffPolicy:
+    """
+    Decorrelated-jitter backoff schedule
+
+    WHY: Pure exponential backoff keeps concurrent callers synchronised;
+         decorrelated jitter spreads them out while still growing the delay.
+
+    Each delay is drawn uniformly from [base_delay, previous_delay * multiplier]
+    and capped at max_delay.
+    """
+    base_delay: float = 1.0
+    max_delay: float = RETRY_MAX_DELAY_SECONDS
+    multiplier: float = 3.0
+
+    def next_delay(self, previous_delay: float, rng: random.Random) -> float:
+        """
+        Delay before the next retry
+
+        Args:
+            previous_delay: Delay used before the previous retry (0 for the first)
+            rng: Random source
+
+        Returns:
+            Delay in seconds
+        """
+        upper = max(self.base_delay, previous_delay * self.multiplier)
+        return min(self.max_delay, rng.uniform(self.base_delay, upper))
+
+
+class Deadline:
+    """
+    Absolute point in time by which work must finish
+
+    WHY: Passed down through execution context so nested retries stop when
+         the caller's time is up instead of each applying its own timeout.
+    """
+
+    def __init__(self, expires_at: float, clock: Callable[[], float] = time.monotonic):
+        self.expires_at = expires_at
+        self.clock = clock
+
+    @classmethod
+    def after(cls, seconds: float, clock: Callable[[], float] = time.monotonic) -> 'Deadline':
+        """Deadline `seconds` from now"""
+        return cls(clock() + seconds, clock)
+
+    def remaining(self) -> float:
+        """Seconds left (0 when expired)"""
+        return max(0.0, self.expires_at - self.clock())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+
+class RetryBudget:
+    """
+    Token bucket of retries for one dependency
+
+    WHY: Retries amplify load on a failing dependency. Each retry takes a
+         token; tokens refill at a fixed rate, so a brownout drains the bucket
+         and callers fail fast until the dependency had time to recover.
+    """
+
+    def __init__(self, capacity: int, refill_per_second: float, clock: Callable[[], float] = time.monotonic):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.clock = clock
+        self._tokens = float(capacity)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        """Take one retry token; False when the budget is exhausted"""
+        with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    @property
+    def tokens(self) -> float:
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_per_second)
+        self._updated = now
+
+
+@dataclass
+class RetryOutcome(Generic[T]):
+    """
+    Result of RetryEngine.run()
+
+    Attributes:
+        value: Last value returned by the operation (None if it raised)
+        error: Last exception raised (None if the last attempt returned)
+        attempts: Number of attempts made
+        stop_reason: STOP_* constant describing why retrying ended
+    """
+    succeeded: bool
+    value: Optional[T]
+    error: Optional[Exception]
+    attempts: int
+    stop_reason: str
+
+    @property
+    def retries(self) -> int:
+        return max(0, self.attempts - 1)
+
+
+class RetryMetrics:
+    """
+    Per-dependency retry counters
+
+    WHY: Retry volume and budget exhaustion are the signals that a dependency
+         is browning out; they were previously invisible.
+    """
+
+    COUNTERS = ('attempts', 'retries', 'successes', 'failures', 'budget_exhausted', 'deadline_exceeded')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_dependency: Dict[str, Dict[str, float]] = {}
+
+    def increment(self, dependency: str, counter: str, amount: float = 1) -> None:
+        with self._lock:
+            stats = self._by_dependency.setdefault(dependency, self._empty())
+            stats[counter] += amount
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Copy of all counters by dependency"""
+        with self._lock:
+            return {dependency: dict(stats) for dependency, stats in self._by_dependency.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._by_dependency.clear()
+
+    def _empty(self) -> Dict[str, float]:
+        stats: Dict[str, float] = {counter: 0 for counter in self.COUNTERS}
+        stats['backoff_seconds'] = 0.0
+        return stats
+
+
+class RetryEngine:
+    """
+    Shared retry loop with backoff, budgets, deadlines and metrics
+
+    Usage:
+        engine = get_retry_engine()
+        outcome = engine.run(
+            lambda attempt: call_provider(),
+            dependency='openai',
+            max_attempts=4,
+            backoff=BackoffPolicy(base_delay=1.0),
+            deadline=context.get(DEADLINE_CONTEXT_KEY)
+        )
+    """
+
+    def __init__(
+        self,
+        budget_capacity: int = RETRY_BUDGET_CAPACITY,
+        budget_refill_per_second: float = RETRY_BUDGET_REFILL_PER_SECOND,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: Optional[random.Random] = None
+    ):
+        """
+        Args:
+            budget_capacity: Retry tokens per dependency (burst)
+            budget_refill_per_second: Tokens regained per second
+            clock: Monotonic clock (injectable for tests)
+            sleep: Sleep function (injectable for tests)
+            rng: Random source for jitter
+        """
+        self.budget_capacity = budget_capacity
+        self.budget_refill_per_second = budget_refill_per_second
+        self.clock = clock
+        self.sleep = sleep
+        self.rng = rng or random.Random()
+        self.metrics = RetryMetrics()
+        self._budgets: Dict[str, RetryBudget] = {}
+        self._budgets_lock = threading.Lock()
+
+    def budget(self, dependency: str) -> RetryBudget:
+        """Retry budget for a dependency (created on first use)"""
+        with self._budgets_lock:
+            if dependency not in self._budgets:
+                self._budgets[dependency] = RetryBudget(self.budget_capacity, self.budget_refill_per_second, self.clock)
+            return self._budgets[dependency]
+
+    def run(
+        self,
+        operation: Callable[[int], T],
+        dependency: str,
+        max_attempts: int,
+        backoff: Optional[BackoffPolicy] = None,
+        is_success: Callable[[T], bool] = lambda value: True,
+        retry_on: Callable[[Optional[Exception], int], bool] = lambda error, attempt: True,
+        deadline: Optional[Deadline] = None,
+        on_retry: Optional[Callable[[int, float, Optional[Exception]], None]] = None
+    ) -> RetryOutcome[T]:
+        """
+        Run operation until it succeeds or retrying must stop
+
+        Args:
+            operation: Called with the 0-based attempt number
+            dependency: Name of the dependency the operation exercises
+                        (budgets and metrics are kept per dependency)
+            max_attempts: Attempts including the first
+            backoff: Delay schedule (default BackoffPolicy())
+            is_success: Whether a returned value counts as success
+            retry_on: Whether a failure may be retried; receives the exception
+                      (None for an unsuccessful return value) and attempt number
+            deadline: Stop retrying rather than sleep past this deadline
+            on_retry: Called with (attempt, delay, error) before each backoff
+
+        Returns:
+            RetryOutcome (never raises the operation's exceptions)
+        """
+        backoff = backoff or BackoffPolicy()
+        delay = 0.0
+        value: Optional[T] = None
+        error: Optional[Exception] = None
+
+        for attempt in range(max_attempts):
+            self.metrics.increment(dependency, 'attempts')
+            value, error = self._attempt(operation, attempt)
+            if error is None and is_success(value):
+                self.metrics.increment(dependency, 'successes')
+                return RetryOutcome(True, value, None, attempt + 1, STOP_SUCCESS)
+
+            if not retry_on(error, attempt):
+                return self._fail(dependency, value, error, attempt + 1, STOP_NOT_RETRYABLE)
+            if attempt == max_attempts - 1:
+                break
+
+            delay = backoff.next_delay(delay, self.rng)
+            blocked = self._check_retry_allowed(dependency, delay, deadline)
+            if blocked:
+                return self._fail(dependency, value, error, attempt + 1, blocked)
+
+            if on_retry:
+                on_retry(attempt, delay, error)
+            self.metrics.increment(dependency, 'retries')
+            self.metrics.increment(dependency, 'backoff_seconds', delay)
+            self.sleep(delay)
+
+        return self._fail(dependency, value, error, max_attempts, STOP_EXHAUSTED)
+
+    def get_metrics(self) -> Dict[str, Dict[str, float]]:
+        """Retry counters per dependency, with remaining budget tokens"""
+        snapshot = self.metrics.snapshot()
+        for dependency, stats in snapshot.items():
+            stats['budget_tokens'] = round(self.budget(dependency).tokens, 2)
+        return snapshot
+
+    def _attempt(self, operation: Callable[[int], T], attempt: int):
+        try:
+            return operation(attempt), None
+        except Exception as e:
+            return None, e
+
+    def _check_retry_allowed(self, dependency: str, delay: float, deadline: Optional[Deadline]) -> Optional[str]:
+        """Return a stop reason if the deadline or budget forbids another retry"""
+        if deadline is not None and deadline.remaining() <= delay:
+            self.metrics.increment(dependency, 'deadline_exceeded')
+            return STOP_DEADLINE_EXCEEDED
+        if not self.budget(dependency).try_acquire():
+            self.metrics.increment(dependency, 'budget_exhausted')
+            return STOP_BUDGET_EXHAUSTED
+        return None
+
+    def _fail(self, dependency: str, value: Any, error: Optional[Exception], attempts: int, reason: str) -> RetryOutcome:
+        self.metrics.increment(dependency, 'failures')
+        return RetryOutcome(False, value, error, attempts, reason)
+
+
+_ENGINE: Optional[RetryEngine] = None
+_ENGINE_LOCK = threading.Lock()
+
+
+def get_retry_engine() -> RetryEngine:
+    """
+    Process-wide retry engine
+
+    WHY: Budgets only protect a dependency if every caller draws from the
+         same bucket.
+    """
+    global _ENGINE
+    with _ENGINE_LOCK:
+        if _ENGINE is None:
+            _ENGINE = RetryEngine()
+        return _ENGINE
+
+
+def get_deadline(context: Optional[Dict[str, Any]]) -> Optional[Deadline]:
+    """Deadline propagated through an execution context, if any"""
+    deadline = (context or {}).get(DEADLINE_CONTEXT_KEY)
+    return deadline if isinstance(deadline, Deadline) else None
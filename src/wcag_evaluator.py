@@ -4,6 +4,8 @@ WCAG 2.1 AA Accessibility Evaluator
 
 Evaluates web implementations for WCAG 2.1 Level AA compliance.
 Uses static analysis and pattern matching to detect common accessibility issues.
+Markup rules read the single-pass MarkupIndex built by compliance_engine;
+directory scans go through ComplianceEngine (shared with GDPR evaluation).
 
 For production use, integrate with:
 - axe-core (Deque Systems)
@@ -17,6 +19,8 @@ from typing import Dict, List, Optional
 from pathlib import Path
 from dataclasses import dataclass, asdict
 
+from compliance_engine import ComplianceEngine, ComplianceReport, ParsedFile
+
 
 @dataclass
 class AccessibilityIssue:
@@ -40,12 +44,14 @@ class WCAGEvaluator:
     def __init__(self):
         self.issues: List[AccessibilityIssue] = []
 
-    def evaluate_directory(self, implementation_dir: str) -> Dict:
+    def evaluate_directory(self, implementation_dir: str, report: Optional[ComplianceReport] = None) -> Dict:
         """
         Evaluate all HTML/JSX/TSX files in directory for WCAG compliance
 
         Args:
             implementation_dir: Path to implementation directory
+            report: Precomputed ComplianceReport (e.g. shared with the GDPR
+                    evaluator); computed here if not given
 
         Returns:
             Dict with evaluation results
@@ -56,54 +62,46 @@ class WCAGEvaluator:
         if not impl_path.exists():
             return self._create_result(skipped=True, reason="Directory not found")
 
-        # Find all relevant files
-        html_files = list(impl_path.rglob("*.html"))
-        jsx_files = list(impl_path.rglob("*.jsx"))
-        tsx_files = list(impl_path.rglob("*.tsx"))
-        vue_files = list(impl_path.rglob("*.vue"))
-
-        all_files = html_files + jsx_files + tsx_files + vue_files
+        report = report or ComplianceEngine().evaluate_directory(implementation_dir, rule_sets=("wcag",))
 
-        if not all_files:
+        if not report.wcag_files:
             return self._create_result(skipped=True, reason="No UI files found")
 
-        # Evaluate each file
-        for file_path in all_files:
-            self._evaluate_file(file_path)
-
+        self.issues = list(report.wcag_issues)
         return self._create_result()
 
-    def _evaluate_file(self, file_path: Path):
-        """Evaluate a single file for accessibility issues"""
-        try:
-            content = file_path.read_text(encoding='utf-8')
-        except Exception:
-            return  # Skip files that can't be read
-
-        # Run all WCAG checks
-        self._check_images_alt_text(content, str(file_path))
-        self._check_form_labels(content, str(file_path))
-        self._check_button_text(content, str(file_path))
-        self._check_heading_hierarchy(content, str(file_path))
-        self._check_color_contrast(content, str(file_path))
-        self._check_keyboard_navigation(content, str(file_path))
-        self._check_aria_labels(content, str(file_path))
-        self._check_lang_attribute(content, str(file_path))
-        self._check_focus_indicators(content, str(file_path))
-        self._check_link_text(content, str(file_path))
-
-    def _check_images_alt_text(self, content: str, file_path: str):
+    def check_file(self, parsed: ParsedFile) -> List[AccessibilityIssue]:
+        """
+        Run all WCAG checks on one parsed file
+
+        Args:
+            parsed: File content with its markup index
+
+        Returns:
+            Issues found in this file (also appended to self.issues)
+        """
+        first_new = len(self.issues)
+
+        self._check_images_alt_text(parsed)
+        self._check_form_labels(parsed)
+        self._check_button_text(parsed)
+        self._check_heading_hierarchy(parsed)
+        self._check_color_contrast(parsed)
+        self._check_keyboard_navigation(parsed)
+        self._check_aria_labels(parsed)
+        self._check_lang_attribute(parsed)
+        self._check_focus_indicators(parsed)
+        self._check_link_text(parsed)
+
+        return self.issues[first_new:]
+
+    def _check_images_alt_text(self, parsed: ParsedFile):
         """
         WCAG 1.1.1 (Level A) - Non-text Content
         Images must have alt text
         """
-        # Find img tags without alt attribute
-        img_pattern = r'<img[^>]*(?<!alt=)[^>]*>'
-        matches = re.finditer(img_pattern, content, re.IGNORECASE)
-
-        for match in matches:
-            img_tag = match.group(0)
-            if 'alt=' not in img_tag.lower():
+        for attrs, img_tag in parsed.markup.images:
+            if 'alt' not in attrs:
                 self.issues.append(AccessibilityIssue(
                     rule="1.1.1",
                     severity="serious",
@@ -113,36 +111,30 @@ class WCAGEvaluator:
                     wcag_criterion="Non-text Content (Level A)"
                 ))
 
-    def _check_form_labels(self, content: str, file_path: str):
+    def _check_form_labels(self, parsed: ParsedFile):
         """
         WCAG 1.3.1 (Level A) - Info and Relationships
         WCAG 3.3.2 (Level A) - Labels or Instructions
         Form inputs must have labels
         """
-        # Find input elements
-        input_pattern = r'<input[^>]*type=["\'](?!hidden)[^"\']*["\'][^>]*>'
-        matches = re.finditer(input_pattern, content, re.IGNORECASE)
-
-        for match in matches:
-            input_tag = match.group(0)
-            self._check_single_input_label(input_tag, content)
+        for attrs, input_tag in parsed.markup.inputs:
+            input_type = attrs.get('type')
+            if input_type is None or input_type.lower().startswith('hidden'):
+                continue
+            self._check_single_input_label(attrs, input_tag, parsed.markup.label_targets)
 
-    def _check_single_input_label(self, input_tag: str, content: str):
+    def _check_single_input_label(self, attrs: Dict, input_tag: str, label_targets: set):
         """Check if a single input has proper label"""
-        # Check if input has id
-        id_match = re.search(r'id=["\']([^"\']+)["\']', input_tag)
-        if not id_match:
+        input_id = attrs.get('id')
+        if not input_id:
             return
 
-        input_id = id_match.group(1)
-        label_pattern = f'<label[^>]*for=["\']{ input_id}["\']'
-
         # Early return if label exists
-        if re.search(label_pattern, content, re.IGNORECASE):
+        if input_id in label_targets:
             return
 
         # Early return if aria attributes exist
-        if 'aria-label' in input_tag.lower() or 'aria-labelledby' in input_tag.lower():
+        if 'aria-label' in attrs or 'aria-labelledby' in attrs:
             return
 
         # Report issue
@@ -155,18 +147,13 @@ class WCAGEvaluator:
             wcag_criterion="Labels or Instructions (Level A)"
         ))
 
-    def _check_button_text(self, content: str, file_path: str):
+    def _check_button_text(self, parsed: ParsedFile):
         """
         WCAG 4.1.2 (Level A) - Name, Role, Value
         Buttons must have accessible text
         """
-        # Find buttons without text content or aria-label
-        button_pattern = r'<button[^>]*>(?:\s*)</button>'
-        matches = re.finditer(button_pattern, content, re.IGNORECASE)
-
-        for match in matches:
-            button_tag = match.group(0)
-            if 'aria-label' not in button_tag.lower() and 'aria-labelledby' not in button_tag.lower():
+        for attrs, button_tag in parsed.markup.empty_buttons:
+            if 'aria-label' not in attrs and 'aria-labelledby' not in attrs:
                 self.issues.append(AccessibilityIssue(
                     rule="4.1.2",
                     severity="serious",
@@ -176,15 +163,12 @@ class WCAGEvaluator:
                     wcag_criterion="Name, Role, Value (Level A)"
                 ))
 
-    def _check_heading_hierarchy(self, content: str, file_path: str):
+    def _check_heading_hierarchy(self, parsed: ParsedFile):
         """
         WCAG 1.3.1 (Level A) - Info and Relationships
         Heading levels should not skip
         """
-        heading_pattern = r'<h([1-6])[^>]*>'
-        matches = re.finditer(heading_pattern, content, re.IGNORECASE)
-
-        heading_levels = [int(m.group(1)) for m in matches]
+        heading_levels = parsed.markup.headings
 
         # Early return if no headings
         if not heading_levels:
@@ -223,7 +207,7 @@ class WCAGEvaluator:
                 wcag_criterion="Info and Relationships (Level A)"
             ))
 
-    def _check_color_contrast(self, content: str, file_path: str):
+    def _check_color_contrast(self, parsed: ParsedFile):
         """
         WCAG 1.4.3 (Level AA) - Contrast (Minimum)
         Check for potential low contrast patterns
@@ -236,7 +220,7 @@ class WCAGEvaluator:
         ]
 
         for pattern, description in low_contrast_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
+            if re.search(pattern, parsed.content, re.IGNORECASE):
                 self.issues.append(AccessibilityIssue(
                     rule="1.4.3",
                     severity="serious",
@@ -247,7 +231,7 @@ class WCAGEvaluator:
                 ))
                 break  # Only report once per file
 
-    def _check_keyboard_navigation(self, content: str, file_path: str):
+    def _check_keyboard_navigation(self, parsed: ParsedFile):
         """
         WCAG 2.1.1 (Level A) - Keyboard
         Interactive elements must be keyboard accessible
@@ -256,11 +240,11 @@ class WCAGEvaluator:
         onclick_pattern = r'onClick(?!=).*(?!onKeyDown|onKeyPress|onKeyUp)'
 
         # Early return if no onClick found
-        if not re.search(onclick_pattern, content):
+        if not re.search(onclick_pattern, parsed.content):
             return
 
         # Early return if keyboard handlers exist
-        if 'onKeyDown' in content or 'onKeyPress' in content:
+        if 'onKeyDown' in parsed.content or 'onKeyPress' in parsed.content:
             return
 
         self.issues.append(AccessibilityIssue(
@@ -272,25 +256,19 @@ class WCAGEvaluator:
             wcag_criterion="Keyboard (Level A)"
         ))
 
-    def _check_aria_labels(self, content: str, file_path: str):
+    def _check_aria_labels(self, parsed: ParsedFile):
         """
         WCAG 4.1.2 (Level A) - Name, Role, Value
         Check for proper ARIA usage
         """
         # Check for aria-labelledby pointing to non-existent IDs
-        aria_labelledby_pattern = r'aria-labelledby=["\']([^"\']+)["\']'
-        matches = re.finditer(aria_labelledby_pattern, content, re.IGNORECASE)
-
-        for match in matches:
-            label_id = match.group(1)
-            self._check_aria_labelledby_target(label_id, content)
+        for label_id in parsed.markup.labelledby_refs:
+            self._check_aria_labelledby_target(label_id, parsed.markup.ids)
 
-    def _check_aria_labelledby_target(self, label_id: str, content: str):
+    def _check_aria_labelledby_target(self, label_id: str, ids: set):
         """Check if aria-labelledby target ID exists"""
-        id_pattern = f'id=["\']{ label_id}["\']'
-
-        # Early return if target ID exists
-        if re.search(id_pattern, content):
+        # Early return if every referenced ID exists (the value is a space-separated list)
+        if all(ref in ids for ref in label_id.split()):
             return
 
         self.issues.append(AccessibilityIssue(
@@ -302,22 +280,19 @@ class WCAGEvaluator:
             wcag_criterion="Name, Role, Value (Level A)"
         ))
 
-    def _check_lang_attribute(self, content: str, file_path: str):
+    def _check_lang_attribute(self, parsed: ParsedFile):
         """
         WCAG 3.1.1 (Level A) - Language of Page
         HTML must have lang attribute
         """
-        html_pattern = r'<html[^>]*>'
-        match = re.search(html_pattern, content, re.IGNORECASE)
-
         # Early return if no html tag found
-        if not match:
+        if not parsed.markup.html_tags:
             return
 
-        html_tag = match.group(0)
+        attrs, _ = parsed.markup.html_tags[0]
 
         # Early return if lang attribute exists
-        if 'lang=' in html_tag.lower():
+        if 'lang' in attrs:
             return
 
         self.issues.append(AccessibilityIssue(
@@ -329,7 +304,7 @@ class WCAGEvaluator:
             wcag_criterion="Language of Page (Level A)"
         ))
 
-    def _check_focus_indicators(self, content: str, file_path: str):
+    def _check_focus_indicators(self, parsed: ParsedFile):
         """
         WCAG 2.4.7 (Level AA) - Focus Visible
         Check for removal of focus outlines
@@ -338,12 +313,12 @@ class WCAGEvaluator:
         outline_none_pattern = r'(outline\s*:\s*(none|0))|(:focus.*outline\s*:\s*(none|0))'
 
         # Early return if no outline removal found
-        if not re.search(outline_none_pattern, content, re.IGNORECASE):
+        if not re.search(outline_none_pattern, parsed.content, re.IGNORECASE):
             return
 
         # Early return if custom focus style exists
         custom_focus_pattern = r':focus.*{[^}]*(border|box-shadow|background)[^}]*}'
-        if re.search(custom_focus_pattern, content, re.IGNORECASE):
+        if re.search(custom_focus_pattern, parsed.content, re.IGNORECASE):
             return
 
         self.issues.append(AccessibilityIssue(
@@ -355,23 +330,21 @@ class WCAGEvaluator:
             wcag_criterion="Focus Visible (Level AA)"
         ))
 
-    def _check_link_text(self, content: str, file_path: str):
+    def _check_link_text(self, parsed: ParsedFile):
         """
         WCAG 2.4.4 (Level A) - Link Purpose (In Context)
         Links should have descriptive text
         """
         # Find links with generic text
         generic_link_texts = ['click here', 'read more', 'more', 'here', 'link']
-        link_pattern = r'<a[^>]*>([^<]+)</a>'
-        matches = re.finditer(link_pattern, content, re.IGNORECASE)
 
-        for match in matches:
-            link_text = match.group(1).strip().lower()
+        for text, link_tag in parsed.markup.text_links:
+            link_text = text.strip().lower()
             if link_text in generic_link_texts:
                 self.issues.append(AccessibilityIssue(
                     rule="2.4.4",
                     severity="moderate",
-                    element=match.group(0)[:50] + "...",
+                    element=link_tag[:50] + "...",
                     description=f"Link has generic text: '{link_text}'",
                     suggestion="Use descriptive link text that explains destination",
                     wcag_criterion="Link Purpose (In Context) (Level A)"
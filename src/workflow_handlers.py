@@ -102,6 +102,10 @@ class WorkflowHandlers:
     def check_disk_space(context: Dict[str, Any]) -> bool:
         return _get_factory().create("check_disk_space").handle(context)
 
+    @staticmethod
+    def enforce_retention(context: Dict[str, Any]) -> bool:
+        return _get_factory().create("enforce_retention").handle(context)
+
     @staticmethod
     def retry_network_request(context: Dict[str, Any]) -> bool:
         return _get_factory().create("retry_network_request").handle(context)
@@ -170,7 +170,8 @@ def build_disk_full_workflow() -> Workflow:
 
     STRATEGY:
     1. Cleanup temp files (free disk space)
-    2. Check disk space (verify recovery)
+    2. Enforce artifact retention (evict/archive over-budget artifacts)
+    3. Check disk space (verify recovery)
 
     RETURNS:
         Workflow: Configured disk space recovery workflow
@@ -183,6 +184,10 @@ def build_disk_full_workflow() -> Workflow:
                 action_name="Cleanup temp files",
                 handler=WorkflowHandlers.cleanup_temp_files
             ),
+            WorkflowAction(
+                action_name="Enforce artifact retention",
+                handler=WorkflowHandlers.enforce_retention
+            ),
             WorkflowAction(
                 action_name="Check disk space",
                 handler=WorkflowHandlers.check_disk_space
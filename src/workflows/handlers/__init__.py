@@ -23,7 +23,7 @@ Used by: Workflow execution engine, backward compatibility wrapper
 
 MODULES:
 - base_handler: Abstract WorkflowHandler base class
-- infrastructure_handlers: System resource management (6 handlers)
+- infrastructure_handlers: System resource management (7 handlers)
 - code_handlers: Code quality operations (4 handlers)
 - dependency_handlers: Package management (3 handlers)
 - llm_handlers: LLM API operations (4 handlers)
@@ -42,6 +42,7 @@ from workflows.handlers.infrastructure_handlers import (
     FreeMemoryHandler,
     CleanupTempFilesHandler,
     CheckDiskSpaceHandler,
+    EnforceRetentionHandler,
     RetryNetworkRequestHandler,
 )
 
@@ -103,6 +104,7 @@ __all__ = [
     'FreeMemoryHandler',
     'CleanupTempFilesHandler',
     'CheckDiskSpaceHandler',
+    'EnforceRetentionHandler',
     'RetryNetworkRequestHandler',
     # Code handlers
     'RunLinterFixHandler',
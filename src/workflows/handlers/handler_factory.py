@@ -36,6 +36,7 @@ from workflows.handlers.infrastructure_handlers import (
     FreeMemoryHandler,
     CleanupTempFilesHandler,
     CheckDiskSpaceHandler,
+    EnforceRetentionHandler,
     RetryNetworkRequestHandler,
 )
 from workflows.handlers.code_handlers import (
@@ -128,6 +129,7 @@ class WorkflowHandlerFactory:
         "free_memory": FreeMemoryHandler,
         "cleanup_temp_files": CleanupTempFilesHandler,
         "check_disk_space": CheckDiskSpaceHandler,
+        "enforce_retention": EnforceRetentionHandler,
         "retry_network_request": RetryNetworkRequestHandler,
 
         # Code
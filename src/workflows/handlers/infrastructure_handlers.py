@@ -10,6 +10,7 @@ RESPONSIBILITY:
 - Manage memory and disk space
 - Handle network retries
 - Clean up temporary files
+- Enforce artifact retention budgets
 - Monitor system resources
 
 PATTERNS:
@@ -161,6 +162,29 @@ class CheckDiskSpaceHandler(WorkflowHandler):
             logger.log(f'[Workflow] Failed to check disk space: {e}', 'INFO')
             return False
 
+class EnforceRetentionHandler(WorkflowHandler):
+    """
+    Enforce artifact retention budgets
+
+    WHY: Reclaim disk space from expired or over-budget pipeline artifacts
+         instead of only wiping developer temp directories
+    RESPONSIBILITY: Run the retention subsystem, sparing the context's card
+    """
+
+    def handle(self, context: Dict[str, Any]) -> bool:
+        try:
+            from utilities.retention import enforce_retention
+            card_id = context.get('card_id')
+            report = enforce_retention(dry_run=context.get('dry_run', False), active_card_ids=[card_id] if card_id else None)
+            context['retention_report'] = report.to_dict()
+            
+            logger.log(f'[Workflow] Retention freed {report.freed_bytes / 1024 ** 2:.1f} MB ({report.evicted_count} artifacts)', 'INFO')
+            return True
+        except Exception as e:
+            
+            logger.log(f'[Workflow] Failed to enforce retention: {e}', 'INFO')
+            return False
+
 class RetryNetworkRequestHandler(WorkflowHandler):
     """
     Retry network request with exponential backoff
@@ -134,7 +134,8 @@ class InfrastructureWorkflowBuilder:
 
         ACTIONS:
         1. Cleanup temporary files
-        2. Check disk space
+        2. Enforce artifact retention
+        3. Check disk space
 
         Returns workflow that reclaims disk space and verifies availability.
         """
@@ -146,6 +147,10 @@ class InfrastructureWorkflowBuilder:
                     action_name="Cleanup temp files",
                     handler=WorkflowHandlers.cleanup_temp_files
                 ),
+                WorkflowAction(
+                    action_name="Enforce artifact retention",
+                    handler=WorkflowHandlers.enforce_retention
+                ),
                 WorkflowAction(
                     action_name="Check disk space",
                     handler=WorkflowHandlers.check_disk_space